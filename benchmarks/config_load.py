@@ -0,0 +1,76 @@
+#!/usr/bin/python3
+
+# -*- coding: utf-8 -*-
+
+"""Compare config load times for the old and new YAML load paths.
+
+Usage: python3 benchmarks/config_load.py [count ...]
+"""
+
+import os
+import sys
+import tempfile
+import time
+
+import yaml
+
+sys.path.insert(0, os.path.join(os.path.dirname(__file__), ".."))
+
+from core import configio
+from vars import KEYS
+
+COUNTS = [10, 1000, 10000]
+ROUNDS = 5
+
+
+def make_config(count):
+    return {
+        f"tunnel_{i}": {
+            KEYS.NAME: f"Tunnel {i}",
+            KEYS.REMOTE_ADDRESS: f"10.{i // 65536 % 256}.{i // 256 % 256}.{i % 256}:443",
+            KEYS.LOCAL_PORT: 10000 + i % 50000,
+            KEYS.PROXY_HOST: f"bastion-{i % 16}",
+            KEYS.BROWSER_OPEN: "https://127.0.0.1" if i % 3 == 0 else "",
+            KEYS.ALL_INTERFACES: False,
+        }
+        for i in range(count)
+    }
+
+
+def best_of(fn):
+    best = float("inf")
+    for _ in range(ROUNDS):
+        start = time.perf_counter()
+        fn()
+        best = min(best, time.perf_counter() - start)
+    return best * 1000
+
+
+def full_loader(path):
+    with open(path) as fp:
+        yaml.load(fp, Loader=yaml.FullLoader)
+
+
+def c_loader(path):
+    with open(path, "rb") as fp:
+        configio.parse(fp.read())
+
+
+def main():
+    counts = [int(arg) for arg in sys.argv[1:]] or COUNTS
+    print(f"libyaml: {yaml.__with_libyaml__}")
+    print(f"{'tunnels':>8} {'FullLoader':>12} {'CSafeLoader':>12} {'snapshot':>12}")
+    with tempfile.TemporaryDirectory() as tmp:
+        for count in counts:
+            path = os.path.join(tmp, f"config-{count}.yml")
+            configio.save_config(path, make_config(count))
+            timings = [
+                best_of(lambda: full_loader(path)),
+                best_of(lambda: c_loader(path)),
+                best_of(lambda: configio.load_config(path)),
+            ]
+            print(f"{count:>8}" + "".join(f"{t:>10.2f}ms" for t in timings))
+
+
+if __name__ == '__main__':
+    main()
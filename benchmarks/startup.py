@@ -0,0 +1,105 @@
+#!/usr/bin/python3
+
+# -*- coding: utf-8 -*-
+
+"""Measure time-to-first-window and per-module import cost of app.py.
+
+Runs the app under `python -X importtime` with a throwaway HOME seeded with
+`--tunnels` entries, waits for the first window, and exits non-zero if the
+startup or any single top-level import goes over its budget.
+
+Usage: python3 benchmarks/startup.py [--tunnels N] [--budget-ms MS] [--module-budget-ms MS]
+"""
+
+import argparse
+import os
+import subprocess
+import sys
+import tempfile
+import time
+
+ROOT = os.path.abspath(os.path.join(os.path.dirname(__file__), ".."))
+sys.path.insert(0, ROOT)
+
+from core import configio
+from vars import STARTUP_PROBE_ENV, STARTUP_PROBE_MARKER
+from config_load import make_config
+
+STARTUP_BUDGET_MS = 1500
+MODULE_BUDGET_MS = 150
+ROUNDS = 3
+
+
+def parse_importtime(stderr):
+    """Return {module: cumulative ms} for imports made directly by app.py."""
+    modules = {}
+    for line in stderr.splitlines():
+        if not line.startswith("import time:") or "imported package" in line:
+            continue
+        _, cumulative, name = line[len("import time:"):].split("|")
+        # Nested imports are indented by two spaces per level
+        if name.startswith(" ") and not name.startswith("  "):
+            modules[name.strip()] = int(cumulative) / 1000
+    return modules
+
+
+def run_once(home, probe_timeout):
+    env = dict(os.environ, HOME=home, **{STARTUP_PROBE_ENV: "1"})
+    env.setdefault("QT_QPA_PLATFORM", "offscreen")
+    start = time.perf_counter()
+    process = subprocess.Popen(
+        [sys.executable, "-X", "importtime", os.path.join(ROOT, "app.py")],
+        cwd=ROOT, env=env, stdout=subprocess.PIPE, stderr=subprocess.PIPE, text=True,
+    )
+    elapsed = None
+    for line in process.stdout:
+        if line.strip() == STARTUP_PROBE_MARKER:
+            elapsed = (time.perf_counter() - start) * 1000
+            break
+    try:
+        _, stderr = process.communicate(timeout=probe_timeout)
+    except subprocess.TimeoutExpired:
+        process.kill()
+        _, stderr = process.communicate()
+    if elapsed is None:
+        sys.exit(f"app did not report its first window:\n{stderr[-2000:]}")
+    return elapsed, parse_importtime(stderr)
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+    parser.add_argument("--tunnels", type=int, default=100)
+    parser.add_argument("--budget-ms", type=float, default=STARTUP_BUDGET_MS)
+    parser.add_argument("--module-budget-ms", type=float, default=MODULE_BUDGET_MS)
+    parser.add_argument("--rounds", type=int, default=ROUNDS)
+    parser.add_argument("--timeout", type=float, default=30)
+    args = parser.parse_args()
+
+    with tempfile.TemporaryDirectory() as home:
+        config_dir = os.path.join(home, ".ssh-tunnel-manager")
+        os.makedirs(config_dir)
+        configio.save_config(os.path.join(config_dir, "config.yml"), make_config(args.tunnels))
+
+        runs = [run_once(home, args.timeout) for _ in range(args.rounds)]
+
+    elapsed, modules = min(runs, key=lambda run: run[0])
+    print(f"time to first window: {elapsed:.0f}ms (best of {args.rounds}, {args.tunnels} tunnels)")
+    print("top-level imports by cumulative cost:")
+    for name, cost in sorted(modules.items(), key=lambda item: -item[1])[:15]:
+        print(f"  {cost:8.1f}ms  {name}")
+
+    failures = []
+    if elapsed > args.budget_ms:
+        failures.append(f"startup took {elapsed:.0f}ms, budget is {args.budget_ms:.0f}ms")
+    failures += [
+        f"importing {name} took {cost:.0f}ms, budget is {args.module_budget_ms:.0f}ms"
+        for name, cost in modules.items() if cost > args.module_budget_ms
+    ]
+    if failures:
+        print("\n".join(["FAILED:"] + failures))
+        sys.exit(1)
+    print("OK")
+
+
+if __name__ == '__main__':
+    main()
@@ -0,0 +1,134 @@
+#!/usr/bin/python3
+
+# -*- coding: utf-8 -*-
+
+"""Build icons.rcc, the binary Qt resource bundle listed in icons.qrc.
+
+Each icon is downscaled to the largest size it is drawn at (times two for
+HiDPI screens) before it is packed, and the bundle is written in the rcc
+binary format so the app can map it with QResource.registerResource instead
+of importing a generated Python module. icons/manifest.json is refreshed
+too, so a changed icon set is synced into ~/.ssh-tunnel-manager/icons on the
+next launch.
+
+Usage: python3 build_icons.py [--no-scale]
+"""
+
+import argparse
+import os
+import struct
+import sys
+import xml.etree.ElementTree as ElementTree
+
+from PyQt6.QtCore import QBuffer, QByteArray, QIODevice, Qt
+from PyQt6.QtGui import QImage
+
+from core import iconsync
+
+ROOT = os.path.dirname(os.path.abspath(__file__))
+QRC_FILE = os.path.join(ROOT, "icons.qrc")
+RCC_FILE = os.path.join(ROOT, "icons.rcc")
+ICONS_SOURCE = os.path.join(ROOT, "icons")
+
+RCC_VERSION = 2
+DIRECTORY = 0x02
+LANGUAGE_C = 1
+
+# Buttons are drawn at 20px and the row icon at 24px; the app icon also
+# shows up in the tray and window decorations.
+ICON_SIZES = {"tunnel.png": 128}
+DEFAULT_ICON_SIZE = 48
+
+
+def qt_hash(name):
+    h = 0
+    for char in name:
+        h = (h << 4) + ord(char)
+        h ^= (h & 0xf0000000) >> 23
+        h &= 0x0fffffff
+    return h
+
+
+def scaled_png(path, size):
+    image = QImage(path)
+    if image.isNull():
+        sys.exit(f"cannot read {path}")
+    if max(image.width(), image.height()) > size:
+        image = image.scaled(size, size, Qt.AspectRatioMode.KeepAspectRatio,
+                             Qt.TransformationMode.SmoothTransformation)
+    data = QByteArray()
+    buffer = QBuffer(data)
+    buffer.open(QIODevice.OpenModeFlag.WriteOnly)
+    image.save(buffer, "PNG")
+    return bytes(data)
+
+
+def read_qrc(path):
+    """Return {prefix: [(alias, file path)]} from a .qrc file."""
+    tree = ElementTree.parse(path)
+    base = os.path.dirname(path)
+    resources = {}
+    for qresource in tree.getroot().iter("qresource"):
+        prefix = qresource.get("prefix", "/").strip("/")
+        for node in qresource.iter("file"):
+            alias = node.get("alias") or node.text
+            resources.setdefault(prefix, []).append((alias, os.path.join(base, node.text)))
+    return resources
+
+
+def build_rcc(files):
+    """Pack {prefix: [(alias, bytes)]} with single-level prefixes into rcc binary format."""
+    names, name_offsets = bytearray(), {}
+
+    def name_offset(name):
+        if name not in name_offsets:
+            name_offsets[name] = len(names)
+            encoded = name.encode("utf-16-be")
+            names.extend(struct.pack(">HI", len(name), qt_hash(name)) + encoded)
+        return name_offsets[name]
+
+    data = bytearray()
+    dirs = sorted(files, key=qt_hash)
+    tree = [struct.pack(">IHIIQ", 0, DIRECTORY, len(dirs), 1, 0)]
+    first_child = 1 + len(dirs)
+    for prefix in dirs:
+        tree.append(struct.pack(">IHIIQ", name_offset(prefix), DIRECTORY, len(files[prefix]), first_child, 0))
+        first_child += len(files[prefix])
+    for prefix in dirs:
+        for alias, blob in sorted(files[prefix], key=lambda item: qt_hash(item[0])):
+            tree.append(struct.pack(">IHHHIQ", name_offset(alias), 0, 0, LANGUAGE_C, len(data), 0))
+            data.extend(struct.pack(">I", len(blob)) + blob)
+
+    header_size = 20
+    data_offset = header_size
+    names_offset = data_offset + len(data)
+    tree_offset = names_offset + len(names)
+    header = b"qres" + struct.pack(">IIII", RCC_VERSION, tree_offset, data_offset, names_offset)
+    return header + bytes(data) + bytes(names) + b"".join(tree)
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+    parser.add_argument("--no-scale", action="store_true", help="pack the source images unchanged")
+    parser.add_argument("-o", "--output", default=RCC_FILE)
+    args = parser.parse_args()
+
+    files = {}
+    for prefix, entries in read_qrc(QRC_FILE).items():
+        for alias, path in entries:
+            if args.no_scale:
+                with open(path, "rb") as fp:
+                    blob = fp.read()
+            else:
+                blob = scaled_png(path, ICON_SIZES.get(alias, DEFAULT_ICON_SIZE))
+            files.setdefault(prefix, []).append((alias, blob))
+
+    with open(args.output, "wb") as fp:
+        fp.write(build_rcc(files))
+
+    iconsync.write_manifest(os.path.join(ICONS_SOURCE, iconsync.MANIFEST_NAME),
+                            iconsync.build_manifest(ICONS_SOURCE))
+
+
+if __name__ == '__main__':
+    main()
@@ -0,0 +1,23 @@
+"""Everything the tunnel manager does that doesn't need Qt.
+
+The config model, the ssh command line, the ssh processes and how configs
+are persisted live here, so scripts and the command line can use them
+without importing PyQt6. app.py is the GUI on top.
+"""
+
+import importlib
+
+# Resolved on first use, so `from core import control` stays as cheap as
+# that one module; the command-line client depends on it.
+_EXPORTS = {
+    "TunnelStore": "store",
+    "Supervisor": "supervisor",
+    "TunnelSpec": "tunnelspec",
+    "key_for_name": "tunnelspec",
+}
+
+
+def __getattr__(name):
+    if name not in _EXPORTS:
+        raise AttributeError(f"module {__name__!r} has no attribute {name!r}")
+    return getattr(importlib.import_module(f".{_EXPORTS[name]}", __name__), name)
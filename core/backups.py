@@ -0,0 +1,105 @@
+import collections
+import hashlib
+import os
+import time
+import zlib
+
+from . import configio
+
+INDEX_FILE = "index"
+
+
+class BackupStore:
+    """Content-addressed store of compressed config snapshots.
+
+    Each snapshot is stored once as `<sha256>.yml.z` no matter how many
+    backups refer to it. `index` is an append-only list of
+    `<timestamp> <sha256> <file name>` lines, oldest first, mirrored in memory. Adding a
+    backup appends one line and expiring the oldest only drops it from memory;
+    the file is rewritten once the expired lines outnumber the live ones, so
+    both stay O(1) amortized and the directory is never listed or sorted.
+    """
+
+    def __init__(self, directory, retention=1000):
+        self.directory = directory
+        self.retention = retention
+        os.makedirs(directory, exist_ok=True)
+        self.entries = collections.deque()
+        self.refs = collections.Counter()
+        self._expired = 0
+        self._load_index()
+
+    def _index_path(self):
+        return os.path.join(self.directory, INDEX_FILE)
+
+    def _blob_path(self, digest):
+        return os.path.join(self.directory, f"{digest}.yml.z")
+
+    def _load_index(self):
+        try:
+            with open(self._index_path(), "rb") as fp:
+                lines = fp.readlines()
+        except OSError:
+            lines = []
+        for line in lines:
+            try:
+                timestamp, digest, name = line.decode("utf-8").rstrip("\n").split(None, 2)
+                self.entries.append((float(timestamp), digest, name))
+            except ValueError:
+                # A torn or corrupt line only loses itself; it counts as
+                # expired so the next rewrite drops it from the file
+                self._expired += 1
+                continue
+            self.refs[digest] += 1
+        self._expire()
+
+    def _rewrite_index(self):
+        raw = "".join(f"{timestamp} {digest} {name}\n" for timestamp, digest, name in self.entries)
+        configio.write_atomic(self._index_path(), raw.encode("utf-8"))
+        self._expired = 0
+
+    def _expire(self):
+        while len(self.entries) > self.retention:
+            _, digest, _ = self.entries.popleft()
+            self._expired += 1
+            self.refs[digest] -= 1
+            if not self.refs[digest]:
+                del self.refs[digest]
+                try:
+                    os.remove(self._blob_path(digest))
+                except OSError:
+                    pass
+        if self._expired > len(self.entries):
+            self._rewrite_index()
+
+    def add(self, raw, name, timestamp=None):
+        digest = hashlib.sha256(raw).hexdigest()
+        if self.entries and self.entries[-1][1:] == (digest, name):
+            return digest
+
+        if not self.refs[digest]:
+            blob = self._blob_path(digest)
+            if not os.path.exists(blob):
+                with open(blob + ".tmp", "wb") as fp:
+                    fp.write(zlib.compress(raw, 6))
+                os.replace(blob + ".tmp", blob)
+
+        timestamp = time.time() if timestamp is None else timestamp
+        self.entries.append((timestamp, digest, name))
+        self.refs[digest] += 1
+        with open(self._index_path(), "a") as fp:
+            fp.write(f"{timestamp} {digest} {name}\n")
+
+        self._expire()
+        return digest
+
+    def add_file(self, path):
+        with open(path, "rb") as fp:
+            return self.add(fp.read(), os.path.basename(path))
+
+    def list(self):
+        return list(reversed(self.entries))
+
+    def read(self, digest):
+        with open(self._blob_path(digest), "rb") as fp:
+            return zlib.decompress(fp.read())
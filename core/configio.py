@@ -0,0 +1,445 @@
+import hashlib
+import marshal
+import os
+import threading
+import time
+
+from . import tracing
+
+CONFIG_SUFFIXES = (".yml", ".yaml")
+SNAPSHOT_SUFFIX = ".cache"
+SNAPSHOT_VERSION = 1
+
+
+def snapshot_path(path):
+    return path + SNAPSHOT_SUFFIX
+
+
+def fingerprint(path):
+    try:
+        st = os.stat(path)
+    except OSError:
+        return None
+    return (st.st_mtime_ns, st.st_size, st.st_ino)
+
+
+def content_hash(raw):
+    return hashlib.blake2b(raw, digest_size=16).digest()
+
+
+_yaml = None
+
+
+def _load_yaml():
+    # PyYAML is only needed when a snapshot misses or a file is written, so
+    # it stays out of the startup path when the config is unchanged.
+    global _yaml
+    if _yaml is None:
+        import yaml
+        try:
+            loader, dumper = yaml.CSafeLoader, yaml.CSafeDumper
+        except AttributeError:
+            loader, dumper = yaml.SafeLoader, yaml.SafeDumper
+        _yaml = (yaml, loader, dumper)
+    return _yaml
+
+
+def parse(raw):
+    yaml, loader, _ = _load_yaml()
+    return yaml.load(raw, Loader=loader) or {}
+
+
+def dumps(data):
+    yaml, _, dumper = _load_yaml()
+    return yaml.dump(data, Dumper=dumper, default_flow_style=False)
+
+
+def _read_snapshot(path):
+    try:
+        with open(snapshot_path(path), "rb") as fp:
+            snapshot = marshal.load(fp)
+    except (OSError, EOFError, ValueError, TypeError):
+        return None
+    if not isinstance(snapshot, dict) or snapshot.get("version") != SNAPSHOT_VERSION:
+        return None
+    return snapshot
+
+
+def write_snapshot(path, data, raw):
+    st = os.stat(path)
+    snapshot = {
+        "version": SNAPSHOT_VERSION,
+        "mtime": st.st_mtime_ns,
+        "size": st.st_size,
+        "hash": content_hash(raw),
+        "data": data,
+    }
+    try:
+        blob = marshal.dumps(snapshot)
+    except ValueError:
+        # Values like YAML timestamps can't be marshalled; just skip the cache.
+        return
+    tmp = snapshot_path(path) + ".tmp"
+    try:
+        with open(tmp, "wb") as fp:
+            fp.write(blob)
+        os.replace(tmp, snapshot_path(path))
+    except OSError:
+        pass
+
+
+def load_config(path):
+    """Load a YAML config, reusing the parsed snapshot when the file is unchanged.
+
+    The snapshot is keyed by mtime, size and a hash of the file contents, so a
+    touched-but-identical file still hits the cache and a same-size edit
+    within one mtime tick still misses it.
+    """
+    with open(path, "rb") as fp:
+        raw = fp.read()
+
+    snapshot = _read_snapshot(path)
+    digest = content_hash(raw)
+    if snapshot and snapshot["size"] == len(raw) and snapshot["hash"] == digest:
+        if snapshot["mtime"] != os.stat(path).st_mtime_ns:
+            write_snapshot(path, snapshot["data"], raw)
+        return snapshot["data"]
+
+    with tracing.span("parse yaml", path=path, size=len(raw)):
+        data = parse(raw)
+    write_snapshot(path, data, raw)
+    return data
+
+
+def save_config(path, data):
+    raw = dumps(data).encode("utf-8")
+    write_atomic(path, raw)
+    write_snapshot(path, data, raw)
+
+
+def write_atomic(path, raw):
+    """Write raw bytes to path so readers see either the old or the new file."""
+    directory = os.path.dirname(path) or "."
+    tmp = os.path.join(directory, f".{os.path.basename(path)}.{os.getpid()}.tmp")
+    try:
+        with open(tmp, "wb") as fp:
+            fp.write(raw)
+            fp.flush()
+            os.fsync(fp.fileno())
+        os.replace(tmp, path)
+    except BaseException:
+        try:
+            os.remove(tmp)
+        except OSError:
+            pass
+        raise
+    if os.name != 'nt':
+        fd = os.open(directory, os.O_RDONLY)
+        try:
+            os.fsync(fd)
+        finally:
+            os.close(fd)
+
+
+class ConfigWriter:
+    """Writes configs from a background thread, coalescing bursts of saves.
+
+    submit() only records the latest data for a path; the file is written once
+    no new submit has arrived for `delay` seconds, or at the latest `max_delay`
+    seconds after the first pending submit. Callers must not mutate the
+    per-tunnel dicts inside a submitted mapping, only replace them. Journal
+    records passed to append() are written right away, ahead of any file. A
+    file that fails to write stays pending and is retried `delay` seconds
+    later; the writer isn't idle until it has been written.
+    """
+
+    def __init__(self, delay=0.3, max_delay=2.0, backup=None, on_saved=None, on_error=None, on_idle=None):
+        self.delay = delay
+        self.max_delay = max_delay
+        self.backup = backup
+        self.on_saved = on_saved
+        self.on_error = on_error
+        self.on_idle = on_idle
+        self._pending = {}
+        self._failed = set()
+        self._appends = []
+        self._first_submit = None
+        self._last_submit = None
+        self._writing = False
+        self._stopped = False
+        self._cond = threading.Condition()
+        self._thread = threading.Thread(target=self._run, name="config-writer", daemon=True)
+        self._thread.start()
+
+    def submit(self, path, data):
+        with self._cond:
+            now = time.monotonic()
+            if not self._pending:
+                self._first_submit = now
+            self._pending[path] = dict(data)
+            self._failed.discard(path)
+            self._last_submit = now
+            self._cond.notify_all()
+
+    def pending(self):
+        """Paths submitted but not written yet."""
+        with self._cond:
+            return list(self._pending)
+
+    def refresh(self, path, data):
+        """Replace the data of a pending submit without delaying its write."""
+        with self._cond:
+            if path in self._pending:
+                self._pending[path] = dict(data)
+
+    def append(self, journal, records):
+        """Append records to journal on the writer thread."""
+        with self._cond:
+            self._appends.append((journal, records))
+            self._cond.notify_all()
+
+    def queued(self):
+        """Records handed to append() that aren't in their journal yet."""
+        with self._cond:
+            return [record for _, records in self._appends for record in records]
+
+    def write_now(self):
+        """Stop waiting for the burst to settle and write anything pending."""
+        with self._cond:
+            self._first_submit = self._last_submit = float("-inf")
+            self._failed.clear()
+            self._cond.notify_all()
+
+    def _busy(self):
+        return self._pending or self._appends or self._writing
+
+    def _settled(self):
+        # Nothing left to try before the next retry of a failed write
+        return not self._appends and not self._writing and self._failed.issuperset(self._pending)
+
+    def idle(self):
+        with self._cond:
+            return not self._busy()
+
+    def flush(self, timeout=None):
+        """Write anything pending right away and wait until it is on disk.
+
+        Returns False if a write failed or the timeout expired.
+        """
+        self.write_now()
+        with self._cond:
+            return self._cond.wait_for(self._settled, timeout) and not self._busy()
+
+    def stop(self, timeout=None):
+        self.flush(timeout)
+        with self._cond:
+            self._stopped = True
+            self._cond.notify_all()
+        self._thread.join(timeout)
+
+    def _due(self):
+        return min(self._last_submit + self.delay, self._first_submit + self.max_delay)
+
+    def _run(self):
+        while True:
+            with self._cond:
+                while not self._stopped and not self._appends:
+                    if self._pending:
+                        remaining = self._due() - time.monotonic()
+                        if remaining <= 0:
+                            break
+                        self._cond.wait(remaining)
+                    else:
+                        self._cond.wait()
+                if self._stopped and self._settled():
+                    return
+                appends = list(self._appends)
+                batch = {}
+                if self._pending and (self._stopped or self._due() <= time.monotonic()):
+                    batch, self._pending = self._pending, {}
+                    self._failed.clear()
+                self._writing = True
+
+            # Appends stay queued until written, so queued() never misses one
+            for journal, records in appends:
+                self._append(journal, records)
+            with self._cond:
+                del self._appends[:len(appends)]
+            failed = {path: data for path, data in batch.items() if not self._write(path, data)}
+
+            with self._cond:
+                if failed:
+                    now = time.monotonic()
+                    if not self._pending:
+                        self._first_submit = now
+                    self._last_submit = now
+                    for path, data in failed.items():
+                        # A submit made during the write has newer data
+                        if path not in self._pending:
+                            self._pending[path] = data
+                            self._failed.add(path)
+                self._writing = False
+                idle = not self._pending and not self._appends
+                self._cond.notify_all()
+            if idle and self.on_idle:
+                self.on_idle()
+
+    def _append(self, journal, records):
+        try:
+            journal.append(records)
+        except OSError as e:
+            if self.on_error:
+                self.on_error(journal.path, str(e))
+            return
+        if self.on_saved:
+            self.on_saved(journal.path)
+
+    def _write(self, path, data):
+        try:
+            raw = dumps(data).encode("utf-8")
+            if self.backup and os.path.exists(path):
+                self.backup(path)
+            write_atomic(path, raw)
+            write_snapshot(path, data, raw)
+        except Exception as e:
+            if self.on_error:
+                self.on_error(path, str(e))
+            return False
+        if self.on_saved:
+            self.on_saved(path)
+        return True
+
+
+def diff_config(old, new):
+    """Return (added, removed, changed) tunnel keys between two configs."""
+    added = [key for key in new if key not in old]
+    removed = [key for key in old if key not in new]
+    changed = [key for key in new if key in old and old[key] != new[key]]
+    return added, removed, changed
+
+
+class ConfigSources:
+    """The main config file merged with the YAML fragments in a conf.d directory.
+
+    Files are merged by key in order: any read-only sources (such as a cached
+    remote config), then the main config, then fragments sorted by name,
+    later definitions winning. Every file is cached along
+    with its stat fingerprint, so a reload parses only the files that changed
+    (in a thread pool when there are several). owners maps each tunnel key to
+    the file that defines it, which is the only file rewritten when that
+    tunnel is edited; tunnels owned by a read-only source are saved to the
+    main config instead, overriding the read-only definition. A key set to
+    null (a tombstone) hides the definitions from the files before it; that
+    is how a renamed read-only tunnel stays gone.
+    """
+
+    def __init__(self, conf_file, conf_dir=None, readonly=(), workers=4):
+        self.conf_file = conf_file
+        self.conf_dir = conf_dir
+        self.readonly = list(readonly)
+        self.workers = workers
+        self.files = {}
+        self.owners = {}
+        self._lock = threading.Lock()
+
+    def copy(self):
+        """A copy with its own file dicts, to load() on another thread."""
+        sources = ConfigSources(self.conf_file, self.conf_dir, self.readonly, self.workers)
+        with self._lock:
+            sources.files = {path: (stamp, dict(data)) for path, (stamp, data) in self.files.items()}
+            sources.owners = dict(self.owners)
+        return sources
+
+    def paths(self):
+        paths = self.readonly + [self.conf_file]
+        if self.conf_dir and os.path.isdir(self.conf_dir):
+            paths += [
+                os.path.join(self.conf_dir, name)
+                for name in sorted(os.listdir(self.conf_dir))
+                if name.endswith(CONFIG_SUFFIXES) and not name.startswith(".")
+            ]
+        return paths
+
+    def load(self):
+        with self._lock:
+            paths, files, stale = [], {}, []
+            for path in self.paths():
+                stamp = fingerprint(path)
+                if stamp is None:
+                    continue
+                paths.append(path)
+                cached = self.files.get(path)
+                if cached and cached[0] == stamp:
+                    files[path] = cached
+                else:
+                    stale.append((path, stamp))
+
+            if len(stale) > 1:
+                from concurrent.futures import ThreadPoolExecutor
+                with ThreadPoolExecutor(min(self.workers, len(stale))) as pool:
+                    results = list(pool.map(load_config, [path for path, _ in stale]))
+            else:
+                results = [load_config(path) for path, _ in stale]
+            for (path, stamp), data in zip(stale, results):
+                files[path] = (stamp, data)
+
+            merged, owners = {}, {}
+            for path in paths:
+                for key, value in files[path][1].items():
+                    if value is None:
+                        merged.pop(key, None)
+                        owners.pop(key, None)
+                        continue
+                    merged[key] = value
+                    owners[key] = path
+            self.files = files
+            self.owners = owners
+            return merged
+
+    def data(self, path):
+        with self._lock:
+            return self.files[path][1]
+
+    def get(self, path, key, default=None):
+        """The value `path` holds for `key`, before merging."""
+        with self._lock:
+            return self.files[path][1].get(key, default) if path in self.files else default
+
+    def put(self, key, value, path=None):
+        """Store a tunnel in its owning file (or `path`) and return that file.
+
+        A value of None stores a tombstone.
+        """
+        with self._lock:
+            path = path or self.owners.get(key, self.conf_file)
+            if path in self.readonly:
+                path = self.conf_file
+            if value is None:
+                self.owners.pop(key, None)
+            else:
+                self.owners[key] = path
+            self.files.setdefault(path, (None, {}))[1][key] = value
+            return path
+
+    def delete(self, key):
+        """Remove a tunnel; returns the (file, tombstone) pairs it changed, owner first.
+
+        The key is removed from every writable file that defines it, so a
+        definition the owner was overriding doesn't come back. A key also
+        defined by a read-only source can't be removed there, so it is masked
+        with a tombstone in the main config instead.
+        """
+        with self._lock:
+            path = self.owners.pop(key, None)
+            if path is None:
+                return []
+            changed = []
+            for source in [path] + [source for source in self.files if source != path]:
+                if source not in self.readonly and key in self.files[source][1]:
+                    del self.files[source][1][key]
+                    changed.append((source, False))
+            if any(key in self.files[source][1] for source in self.readonly if source in self.files):
+                self.files.setdefault(self.conf_file, (None, {}))[1][key] = None
+                changed = [change for change in changed if change[0] != self.conf_file]
+                changed.append((self.conf_file, True))
+            return changed
@@ -0,0 +1,222 @@
+import getpass
+import hashlib
+import json
+import os
+import socket
+import tempfile
+import threading
+import time
+
+from .tunnelspec import TunnelSpec
+from vars import ACTIONS, CONFIG_DIR, LANG, KEYS
+
+CONNECT_TIMEOUT = 0.2
+REPLY_TIMEOUT = 5.0
+# `sshtm start @prod` starts every tunnel in group prod
+GROUP_PREFIX = "@"
+# sockaddr_un.sun_path is 108 bytes on Linux and 104 on macOS
+MAX_SOCKET_PATH = 100
+
+
+def socket_name():
+    """The local socket of the running instance: one per user and config directory.
+
+    On Windows this is a pipe name; elsewhere it is a socket path, which
+    QLocalServer accepts as is.
+    """
+    try:
+        user = getpass.getuser()
+    except Exception:
+        user = "default"
+    config = hashlib.blake2b(CONFIG_DIR.encode("utf-8"), digest_size=4).hexdigest()
+    name = f"ssh-tunnel-manager-{user}-{config}"
+    if os.name == 'nt':
+        return name
+    path = os.path.join(CONFIG_DIR, "instance.sock")
+    return path if len(path) <= MAX_SOCKET_PATH else os.path.join(tempfile.gettempdir(), name)
+
+
+def encode(message):
+    return json.dumps(message).encode("utf-8") + b"\n"
+
+
+def _exchange_unix(path, request, timeout):
+    client = socket.socket(socket.AF_UNIX, socket.SOCK_STREAM)
+    try:
+        client.settimeout(CONNECT_TIMEOUT)
+        try:
+            client.connect(path)
+        except OSError:
+            return None
+        client.settimeout(timeout)
+        client.sendall(request)
+        raw = b""
+        while not raw.endswith(b"\n"):
+            chunk = client.recv(65536)
+            if not chunk:
+                break
+            raw += chunk
+        return raw
+    finally:
+        client.close()
+
+
+def _exchange_pipe(name, request, timeout):
+    try:
+        pipe = open(rf"\\.\pipe\{name}", "r+b", buffering=0)
+    except OSError:
+        return None
+    # A pipe read can't time out, so it runs on a thread that is abandoned
+    # (and the pipe left open) if the instance doesn't answer in time.
+    result = []
+
+    def exchange():
+        try:
+            pipe.write(request)
+            result.append(pipe.readline())
+        except OSError as e:
+            result.append(e)
+
+    thread = threading.Thread(target=exchange, name="control-pipe", daemon=True)
+    thread.start()
+    thread.join(timeout)
+    if not result:
+        raise TimeoutError(LANG.NO_REPLY)
+    pipe.close()
+    if isinstance(result[0], OSError):
+        raise result[0]
+    return result[0]
+
+
+def send(argv, name=None, timeout=REPLY_TIMEOUT):
+    """Hand argv to the running instance and return its reply dict.
+
+    Returns None when no instance is listening, including when only a stale
+    socket from a crashed instance is left behind. This is plain sockets
+    with no Qt, so a launch that only forwards a command stays cheap.
+    """
+    name = name or socket_name()
+    request = encode({"argv": list(argv)})
+    try:
+        if os.name == 'nt':
+            raw = _exchange_pipe(name, request, timeout)
+        else:
+            raw = _exchange_unix(name, request, timeout)
+    except OSError as e:
+        return {"ok": False, "error": str(e)}
+    if raw is None:
+        return None
+    try:
+        return json.loads(raw)
+    except ValueError:
+        return {"ok": False, "error": LANG.NO_REPLY}
+
+
+def wait_ready(bind, port, timeout):
+    """Wait until something accepts connections on bind:port; False on timeout."""
+    host = "127.0.0.1" if bind in ("0.0.0.0", "") else bind
+    deadline = time.monotonic() + timeout
+    while True:
+        try:
+            with socket.create_connection((host, port), timeout=CONNECT_TIMEOUT):
+                return True
+        except OSError:
+            if time.monotonic() >= deadline:
+                return False
+            time.sleep(0.05)
+
+
+class Controller:
+    """Runs start/stop/list/status commands against a TunnelStore and Supervisor.
+
+    Shared by the GUI and the headless server behind the command-line
+    client. handle() returns the reply dict sent back over the socket.
+    An argument of `@name` stands for every tunnel in group `name`. With
+    `submit`, starts run through `submit(fn, *args)` instead of on the
+    calling thread, and handle() returns the future of their reply.
+    """
+
+    def __init__(self, store, supervisor, submit=None):
+        self.store = store
+        self.supervisor = supervisor
+        self.submit = submit
+
+    def handle(self, argv):
+        action, keys = (argv[0], argv[1:]) if argv else (ACTIONS.SHOW, [])
+        if action == ACTIONS.LIST:
+            return {"ok": True, "tunnels": [self.describe(key) for key in sorted(self.store.data)]}
+        if action == ACTIONS.STATUS:
+            keys = keys or self.supervisor.keys()
+        elif action not in (ACTIONS.START, ACTIONS.STOP):
+            return {"ok": False, "error": LANG.UNKNOWN_ACTION.format(action)}
+
+        groups = [key[len(GROUP_PREFIX):] for key in keys if key.startswith(GROUP_PREFIX)]
+        if groups:
+            members = self.group_members(groups)
+            missing = [group for group in groups if group not in members]
+            if missing:
+                return {"ok": False, "error": LANG.UNKNOWN_GROUP.format(", ".join(missing))}
+            keys = [key for key in keys if not key.startswith(GROUP_PREFIX)]
+            keys = list(dict.fromkeys(keys + [key for group in groups for key in members[group]]))
+        # A tunnel removed from the config can still be running; status
+        # reports it from the supervisor, and stop still stops it
+        missing = [key for key in keys if key not in self.store.data
+                   and not (action != ACTIONS.START and self.supervisor.running(key))]
+        if missing:
+            return {"ok": False, "error": LANG.UNKNOWN_TUNNEL.format(", ".join(missing))}
+        if action == ACTIONS.START:
+            if self.submit:
+                return self.submit(self.start, keys)
+            return self.start(keys)
+        if action == ACTIONS.STOP:
+            for key in keys:
+                self.supervisor.stop(key)
+        return {"ok": True, "tunnels": [self.describe(key) for key in sorted(keys)]}
+
+    def start(self, keys):
+        started = self.start_many(keys)
+        failed = [key for key in keys if not started[key]]
+        if failed:
+            return {"ok": False, "error": LANG.START_FAILED.format(", ".join(failed))}
+        return {"ok": True, "tunnels": [self.describe(key) for key in sorted(keys)]}
+
+    def spec(self, key):
+        return TunnelSpec.from_dict(key, self.store.data[key])
+
+    def group_members(self, groups):
+        members = {}
+        for key, value in self.store.data.items():
+            group = value.get(KEYS.GROUP)
+            if group is not None and str(group) in groups:
+                members.setdefault(str(group), []).append(key)
+        return members
+
+    def start_many(self, keys):
+        """Start the tunnels in keys that aren't running, concurrently; returns {key: running}."""
+        commands = {key: self.spec(key).ssh_argv() for key in keys if not self.supervisor.running(key)}
+        started = self.supervisor.start_many(commands)
+        return {key: started.get(key, True) for key in keys}
+
+    def describe(self, key):
+        if key not in self.store.data:
+            return {
+                "key": key,
+                KEYS.NAME: key,
+                "running": self.supervisor.running(key),
+                "pid": self.supervisor.pid(key),
+                "bind": None,
+                KEYS.LOCAL_PORT: None,
+                KEYS.REMOTE_ADDRESS: None,
+                KEYS.GROUP: None,
+            }
+        spec = self.spec(key)
+        return {
+            "key": key,
+            KEYS.NAME: spec.display_name,
+            "running": self.supervisor.running(key),
+            "pid": self.supervisor.pid(key),
+            "bind": spec.bind_address,
+            KEYS.LOCAL_PORT: spec.local_port,
+            KEYS.REMOTE_ADDRESS: spec.remote_address,
+            KEYS.GROUP: spec.group,
+        }
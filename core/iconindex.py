@@ -0,0 +1,47 @@
+import os
+
+
+class IconIndex:
+    """Resolves icon names against a list of directories without stat'ing files.
+
+    Each directory is listed once and re-listed only when its mtime changes,
+    which refresh() checks with a single stat per directory. Lookups are then
+    set membership tests: the exact name first, then name + ".png", directory
+    by directory in order.
+    """
+
+    def __init__(self, directories):
+        self.directories = list(directories)
+        self._listings = {}
+
+    def _scan(self, directory):
+        try:
+            mtime = os.stat(directory).st_mtime_ns
+        except OSError:
+            self._listings[directory] = (None, frozenset())
+            return
+        cached = self._listings.get(directory)
+        if cached and cached[0] == mtime:
+            return
+        try:
+            names = frozenset(os.listdir(directory))
+        except OSError:
+            names = frozenset()
+        self._listings[directory] = (mtime, names)
+
+    def refresh(self):
+        for directory in self.directories:
+            self._scan(directory)
+
+    def resolve(self, icon_name):
+        """Return the path of icon_name, or None if no directory has it."""
+        if not icon_name:
+            return None
+        for directory in self.directories:
+            if directory not in self._listings:
+                self._scan(directory)
+            names = self._listings[directory][1]
+            for candidate in (icon_name, f"{icon_name}.png"):
+                if candidate in names:
+                    return os.path.join(directory, candidate)
+        return None
@@ -0,0 +1,76 @@
+import hashlib
+import json
+import os
+import shutil
+
+from . import configio
+
+MANIFEST_NAME = "manifest.json"
+ICON_SUFFIXES = ('.png', '.jpg', '.jpeg', '.svg')
+
+
+def file_hash(path):
+    with open(path, "rb") as fp:
+        return hashlib.sha256(fp.read()).hexdigest()
+
+
+def build_manifest(source_dir):
+    """Describe the icons in source_dir as {version, icons: {name: [size, sha256]}}.
+
+    The version is a hash over every entry, so it changes whenever an icon is
+    added, removed or replaced.
+    """
+    icons = {}
+    for name in sorted(os.listdir(source_dir)):
+        if name.endswith(ICON_SUFFIXES):
+            path = os.path.join(source_dir, name)
+            icons[name] = [os.path.getsize(path), file_hash(path)]
+    version = hashlib.sha256(json.dumps(icons, sort_keys=True).encode("utf-8")).hexdigest()
+    return {"version": version, "icons": icons}
+
+
+def write_manifest(path, manifest):
+    configio.write_atomic(path, json.dumps(manifest, indent=1, sort_keys=True).encode("utf-8"))
+
+
+def read_manifest(path):
+    try:
+        with open(path, encoding="utf-8") as fp:
+            manifest = json.load(fp)
+    except (OSError, ValueError):
+        return None
+    return manifest if isinstance(manifest, dict) and "version" in manifest else None
+
+
+def sync_icons(source_dir, dest_dir, manifest_path):
+    """Copy bundled icons into dest_dir when the bundled set has changed.
+
+    The bundled set is described by source_dir/manifest.json (written by
+    build_icons.py, and rebuilt from the files if missing). What was last
+    synced is recorded at manifest_path; when both versions match this costs
+    two small reads and nothing is listed or stat'ed in dest_dir. Otherwise
+    icons missing from dest_dir are copied, and icons that still match what
+    was synced last time are updated; icons the user replaced are kept.
+    Returns the names that were copied.
+    """
+    bundled = read_manifest(os.path.join(source_dir, MANIFEST_NAME)) or build_manifest(source_dir)
+    synced = read_manifest(manifest_path) or {"version": None, "icons": {}}
+    if synced["version"] == bundled["version"]:
+        return []
+
+    present = set(os.listdir(dest_dir))
+    copied = []
+    for name, (size, digest) in bundled["icons"].items():
+        dest_path = os.path.join(dest_dir, name)
+        if name in present:
+            previous = synced["icons"].get(name)
+            if previous is None or previous[1] == digest:
+                continue
+            # Only overwrite an icon we put there and the user hasn't touched
+            if os.path.getsize(dest_path) != previous[0] or file_hash(dest_path) != previous[1]:
+                continue
+        shutil.copy2(os.path.join(source_dir, name), dest_path)
+        copied.append(name)
+
+    write_manifest(manifest_path, bundled)
+    return copied
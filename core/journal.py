@@ -0,0 +1,104 @@
+import json
+import os
+
+PUT = "put"
+DELETE = "del"
+
+
+# The base of a record whose key wasn't in its file yet
+ABSENT = object()
+
+
+def _record(op, path, key, base):
+    record = {"op": op, "file": path, "key": key}
+    if base is not ABSENT:
+        record["base"] = base
+    return record
+
+
+def put_record(path, key, value, base=ABSENT):
+    record = _record(PUT, path, key, base)
+    record["value"] = value
+    return record
+
+
+def delete_record(path, key, base=ABSENT):
+    return _record(DELETE, path, key, base)
+
+
+class Journal:
+    """Append-only log of tunnel edits not yet folded into their config files.
+
+    Every record is one JSON line naming the file that owns the tunnel, so an
+    edit costs a single small fsynced append regardless of config size. On
+    startup the records are replayed over the loaded config; once the files
+    have been rewritten the journal is truncated. A torn trailing line from a
+    crash mid-append is ignored. Each record also carries the tunnel's value
+    in its file before the edit, so a record whose tunnel has been changed
+    in that file since (by hand, or by a compaction that already folded it
+    in) is skipped instead of undoing the newer value.
+    """
+
+    def __init__(self, path):
+        self.path = path
+        records, valid_size = self._read()
+        self.count = len(records)
+        if os.path.exists(path) and os.path.getsize(path) != valid_size:
+            # Cut the torn tail so later appends aren't hidden behind it
+            with open(path, "r+b") as fp:
+                fp.truncate(valid_size)
+
+    def _read(self):
+        records, valid_size = [], 0
+        try:
+            with open(self.path, "rb") as fp:
+                for line in fp:
+                    if not line.endswith(b"\n"):
+                        break
+                    try:
+                        records.append(json.loads(line))
+                    except ValueError:
+                        break
+                    valid_size += len(line)
+        except OSError:
+            pass
+        return records, valid_size
+
+    def records(self):
+        return self._read()[0]
+
+    def append(self, records):
+        if not records:
+            return
+        raw = "".join(json.dumps(record, separators=(",", ":")) + "\n" for record in records)
+        with open(self.path, "ab") as fp:
+            fp.write(raw.encode("utf-8"))
+            fp.flush()
+            os.fsync(fp.fileno())
+        self.count += len(records)
+
+    def replay(self, sources, data, queued=()):
+        """Apply the logged edits, then `queued` ones, to `sources` and the merged `data`; return touched files."""
+        paths = set()
+        for record in self.records() + list(queued):
+            if sources.get(record["file"], record["key"], ABSENT) != record.get("base", ABSENT):
+                continue
+            if record["op"] == PUT:
+                sources.put(record["key"], record["value"], record["file"])
+                if record["value"] is None:
+                    # A tombstone masking a read-only definition
+                    data.pop(record["key"], None)
+                else:
+                    data[record["key"]] = record["value"]
+            elif record["op"] == DELETE:
+                paths.update(path for path, _ in sources.delete(record["key"]))
+                data.pop(record["key"], None)
+            paths.add(record["file"])
+        return paths
+
+    def truncate(self):
+        try:
+            os.remove(self.path)
+        except FileNotFoundError:
+            pass
+        self.count = 0
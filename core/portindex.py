@@ -0,0 +1,70 @@
+from .tunnelspec import ANY_ADDRESS, LOOPBACK_ADDRESS
+from vars import KEYS
+
+
+def bind_address(data):
+    return ANY_ADDRESS if data.get(KEYS.ALL_INTERFACES) else LOOPBACK_ADDRESS
+
+
+class PortIndex:
+    """Hash index of tunnels by (bind address, local_port).
+
+    Binding 0.0.0.0 collides with every address on the same port, so lookups
+    check the exact address plus the wildcard. Each port holds at most a
+    couple of addresses, which keeps a lookup O(1) regardless of config size.
+    """
+
+    def __init__(self, data=None):
+        self.ports = {}
+        for key, value in (data or {}).items():
+            self.add(key, value)
+
+    def add(self, key, data):
+        port = data.get(KEYS.LOCAL_PORT)
+        if port is None:
+            return
+        self.ports.setdefault(port, {}).setdefault(bind_address(data), set()).add(key)
+
+    def remove(self, key, data):
+        port = data.get(KEYS.LOCAL_PORT)
+        binds = self.ports.get(port)
+        if not binds:
+            return
+        keys = binds.get(bind_address(data))
+        if keys:
+            keys.discard(key)
+            if not keys:
+                del binds[bind_address(data)]
+        if not binds:
+            del self.ports[port]
+
+    def update(self, old_key, old_data, new_key, new_data):
+        if old_data is not None:
+            self.remove(old_key, old_data)
+        self.add(new_key, new_data)
+
+    def conflicts(self, port, bind, exclude=None):
+        binds = self.ports.get(port)
+        if not binds:
+            return []
+        if bind == ANY_ADDRESS:
+            keys = set().union(*binds.values())
+        else:
+            keys = binds.get(bind, set()) | binds.get(ANY_ADDRESS, set())
+        keys.discard(exclude)
+        return sorted(keys)
+
+    def batch_conflicts(self, entries):
+        """Map each key in `entries` to the tunnels it would collide with.
+
+        Collisions are checked against the index and within the batch itself.
+        """
+        pending = PortIndex()
+        found = {}
+        for key, data in entries.items():
+            port, bind = data.get(KEYS.LOCAL_PORT), bind_address(data)
+            clashes = self.conflicts(port, bind, exclude=key) + pending.conflicts(port, bind, exclude=key)
+            if clashes:
+                found[key] = clashes
+            pending.add(key, data)
+        return found
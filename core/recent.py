@@ -0,0 +1,57 @@
+import json
+
+from . import configio
+
+
+class RecentList:
+    """The tunnel keys used most recently, newest first, kept in a small JSON file.
+
+    Keys of tunnels that have since been removed are left in the file; callers
+    skip the ones they don't know. Changes stay in memory until flush(), so
+    callers can write them when it suits them; `on_change()` is called after
+    each one.
+    """
+
+    def __init__(self, path, size, on_change=None):
+        self.path = path
+        self.size = size
+        self.on_change = on_change
+        self._keys = self._read()
+        self._dirty = False
+
+    def _read(self):
+        try:
+            with open(self.path, encoding="utf-8") as fp:
+                keys = json.load(fp)
+        except (OSError, ValueError):
+            return []
+        if not isinstance(keys, list):
+            return []
+        return [key for key in keys if isinstance(key, str)][:self.size]
+
+    def _set(self, keys):
+        self._keys = keys
+        self._dirty = True
+        if self.on_change:
+            self.on_change()
+
+    def flush(self):
+        """Write the keys if they changed since the last flush()."""
+        if not self._dirty:
+            return
+        self._dirty = False
+        try:
+            configio.write_atomic(self.path, json.dumps(self._keys).encode("utf-8"))
+        except OSError as e:
+            print(f"Error saving {self.path}: {e}")
+
+    def keys(self):
+        return list(self._keys)
+
+    def touch(self, key):
+        if self._keys[:1] != [key]:
+            self._set(([key] + [other for other in self._keys if other != key])[:self.size])
+
+    def rename(self, old_key, new_key):
+        if old_key in self._keys:
+            self._set([new_key if key == old_key else key for key in self._keys])
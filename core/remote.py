@@ -0,0 +1,79 @@
+import json
+import os
+import threading
+
+from . import configio
+
+
+class RemoteConfig:
+    """Tunnel definitions pulled from a shared HTTP endpoint.
+
+    The last good response body is kept in `cache_dir/config.yml`, with its
+    ETag and Last-Modified in `meta.json`. Readers only ever look at the
+    cached file, so startup never waits on the network; fetch() refreshes it
+    with a conditional GET, which costs a single 304 when nothing changed.
+    """
+
+    def __init__(self, url, cache_dir, interval=900, timeout=10):
+        self.url = url
+        self.cache_dir = cache_dir
+        self.interval = interval
+        self.timeout = timeout
+        self.cache_file = os.path.join(cache_dir, "config.yml")
+        self.meta_file = os.path.join(cache_dir, "meta.json")
+        self._stopped = threading.Event()
+        os.makedirs(cache_dir, exist_ok=True)
+
+    def _read_meta(self):
+        try:
+            with open(self.meta_file) as fp:
+                meta = json.load(fp)
+        except (OSError, ValueError):
+            return {}
+        # A cache filled from another URL must not answer for this one
+        if meta.get("url") != self.url:
+            return {}
+        return meta
+
+    def fetch(self, session=None):
+        """Refresh the cache; return True if a new body was stored."""
+        import requests
+
+        meta = self._read_meta()
+        headers = {}
+        if meta.get("etag") and os.path.exists(self.cache_file):
+            headers["If-None-Match"] = meta["etag"]
+        if meta.get("last_modified") and os.path.exists(self.cache_file):
+            headers["If-Modified-Since"] = meta["last_modified"]
+
+        response = (session or requests).get(self.url, headers=headers, timeout=self.timeout)
+        if response.status_code == 304:
+            return False
+        response.raise_for_status()
+
+        raw = response.content
+        if not isinstance(configio.parse(raw), dict):
+            raise ValueError(f"{self.url} did not return a mapping of tunnels")
+        configio.write_atomic(self.cache_file, raw)
+        meta = {
+            "url": self.url,
+            "etag": response.headers.get("ETag"),
+            "last_modified": response.headers.get("Last-Modified"),
+        }
+        configio.write_atomic(self.meta_file, json.dumps(meta).encode("utf-8"))
+        return True
+
+    def start(self):
+        threading.Thread(target=self._run, name="remote-config", daemon=True).start()
+
+    def stop(self):
+        self._stopped.set()
+
+    def _run(self):
+        while True:
+            try:
+                self.fetch()
+            except Exception as e:
+                print(f"Error fetching remote config: {e}")
+            if self._stopped.wait(self.interval):
+                return
@@ -0,0 +1,115 @@
+import re
+
+GRAM = 3
+PREFIX = "\0"
+_WORD = re.compile(r"[0-9a-z]+")
+
+
+def search_text(spec):
+    """The lowercased text a tunnel is found by: name, key, group, proxy host, remote address and port."""
+    fields = (spec.display_name, spec.key, spec.group or "", spec.proxy_host, spec.remote_address, str(spec.local_port))
+    return "\n".join(fields).lower()
+
+
+def _grams(text):
+    grams = {text[i:i + GRAM] for i in range(len(text) - GRAM + 1)}
+    for word in _WORD.findall(text):
+        grams.add(PREFIX + word[:1])
+        grams.add(PREFIX + word[:2])
+    return grams
+
+
+class SearchIndex:
+    """Trigram index over tunnel specs, updated one tunnel at a time.
+
+    A search term of three or more characters matches anywhere in the text:
+    the postings of its trigrams are intersected, smallest first, and the few
+    candidates left are checked with a substring test. Shorter terms would
+    match nearly everything that way, so they match the start of a word
+    instead, through postings of each word's first one and two characters.
+    Every term of a query has to match.
+    """
+
+    def __init__(self):
+        self._texts = {}
+        self._postings = {}
+        self._last = None
+
+    def __contains__(self, key):
+        return key in self._texts
+
+    def add(self, spec):
+        text = search_text(spec)
+        self._texts[spec.key] = text
+        self._last = None
+        for gram in _grams(text):
+            self._postings.setdefault(gram, set()).add(spec.key)
+
+    def remove(self, key):
+        text = self._texts.pop(key, None)
+        if text is None:
+            return
+        self._last = None
+        for gram in _grams(text):
+            keys = self._postings[gram]
+            keys.discard(key)
+            if not keys:
+                del self._postings[gram]
+
+    def update(self, old_key, spec):
+        """Re-index old_key's tunnel as spec, which may carry a new key."""
+        if old_key in self._texts and self._texts[old_key] == search_text(spec) and old_key == spec.key:
+            return
+        self.remove(old_key)
+        self.add(spec)
+
+    def _lookup(self, term, keys):
+        if len(term) < GRAM and _WORD.fullmatch(term):
+            # Word prefix postings are exact, nothing left to check
+            matched = self._postings.get(PREFIX + term, set())
+            return matched if keys is None else keys & matched
+        if len(term) < GRAM:
+            candidates = set(self._texts) if keys is None else keys
+        else:
+            # The substring test below is exact, so the rarest trigram is
+            # enough to pick candidates; intersecting every posting costs
+            # more than it saves
+            candidates = min((self._postings.get(term[i:i + GRAM], set())
+                              for i in range(len(term) - GRAM + 1)), key=len)
+            if keys is not None:
+                candidates = keys & candidates
+            if len(term) == GRAM:
+                # A single trigram's postings are exact too
+                return candidates
+        return {key for key in candidates if term in self._texts[key]}
+
+    def _matches(self, term, text):
+        if len(term) < GRAM and _WORD.fullmatch(term):
+            return any(word.startswith(term) for word in _WORD.findall(text))
+        return term in text
+
+    def search(self, query):
+        """Keys matching every term of query; None when the query is blank."""
+        terms = sorted(set(query.lower().split()), key=len, reverse=True)
+        if not terms:
+            return None
+        keys = None
+        if self._last and query.lower().startswith(self._last[0]):
+            # Typing on can only narrow a substring match, so the search
+            # starts from the previous keystroke's result
+            keys = self._last[1]
+        for term in terms:
+            keys = self._lookup(term, keys)
+            if not keys:
+                break
+        keys = set(keys)
+        # Word prefix terms can't narrow: "tun" matches "xtun", "tu" doesn't
+        if all(len(term) >= GRAM for term in terms):
+            self._last = (query.lower(), keys)
+        return keys
+
+    def matches(self, key, query):
+        text = self._texts.get(key)
+        if text is None:
+            return False
+        return all(self._matches(term, text) for term in query.lower().split())
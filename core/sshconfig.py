@@ -0,0 +1,281 @@
+import fnmatch
+import functools
+import glob
+import marshal
+import os
+import re
+import shlex
+
+from . import configio
+from .tunnelspec import ANY_ADDRESS, key_for_name
+from vars import KEYS
+
+SSH_DIR = os.path.expanduser("~/.ssh")
+SSH_CONFIG = os.path.join(SSH_DIR, "config")
+CACHE_VERSION = 3
+MAX_INCLUDE_DEPTH = 16
+# Options ssh collects from every matching block instead of keeping the first
+MULTI_OPTIONS = {"identityfile", "certificatefile", "sendenv", "setenv"}
+# Options not carried over as -o: the destination is built from the first
+# four, and the rest would add a host's forwards to each of its tunnels
+SKIPPED_OPTIONS = {"hostname", "user", "port", "proxyjump", "localforward", "remoteforward", "dynamicforward"}
+# Prefix of the destination used when the real one would match a Host block
+# declaring forwards; the real name is passed as -o HostName
+UNMATCHED_PREFIX = "sshtm-"
+
+_TOKEN = re.compile(r'"([^"]*)"|([^\s"]+)')
+_KEYWORD = re.compile(r'\s*([A-Za-z]+)\s*(?:=\s*|\s+|$)(.*)')
+
+
+def tokenize(lines):
+    """Yield (keyword, args) for every option line, keyword lowercased."""
+    for line in lines:
+        line = line.strip()
+        if not line or line.startswith("#"):
+            continue
+        match = _KEYWORD.match(line)
+        if not match:
+            continue
+        args = [quoted or bare for quoted, bare in _TOKEN.findall(match.group(2))]
+        yield match.group(1).lower(), args
+
+
+def tunnel_key(alias, port):
+    return key_for_name(f"{alias}_{port}")
+
+
+@functools.lru_cache(maxsize=None)
+def _compile_pattern(pattern):
+    return re.compile(fnmatch.translate(pattern))
+
+
+def _compile_patterns(patterns):
+    return [(pattern.startswith("!"), _compile_pattern(pattern.lstrip("!"))) for pattern in patterns]
+
+
+def _is_literal(name):
+    return not name.startswith("!") and not any(c in name for c in "*?[")
+
+
+def _parse_forward(args):
+    """Parse `LocalForward [bind:]port host:hostport` into (bind, port, remote)."""
+    if len(args) != 2:
+        return None
+    listen, remote = args
+    bind = ""
+    if listen.startswith("["):
+        bind, _, listen = listen[1:].partition("]")
+        listen = listen.lstrip(":")
+    elif ":" in listen:
+        bind, _, listen = listen.rpartition(":")
+    if not listen.isdigit() or "/" in remote:
+        return None
+    return bind, int(listen), remote
+
+
+class Block:
+    __slots__ = ("names", "patterns", "options")
+
+    def __init__(self, patterns):
+        self.names = patterns or []
+        self.patterns = _compile_patterns(patterns) if patterns is not None else None
+        self.options = []
+
+    def matches(self, alias):
+        if self.patterns is None:
+            return False
+        matched = False
+        for negated, pattern in self.patterns:
+            if pattern.match(alias):
+                if negated:
+                    return False
+                matched = True
+        return matched
+
+
+class SSHConfigImporter:
+    """Turns LocalForward entries of an ssh config tree into tunnel entries.
+
+    Each file's tokens are cached by stat fingerprint, in memory and in
+    `cache_file`, so re-importing a large config with many Include files only
+    re-reads the files that changed. The last result is cached too, along
+    with every file and Include glob it depended on; when none of them
+    changed, a re-import costs one stat per file and one glob per Include.
+    """
+
+    def __init__(self, cache_file=None, ssh_dir=SSH_DIR):
+        self.cache_file = cache_file
+        self.ssh_dir = ssh_dir
+        self._files = None
+        self._files_blob = None
+        self.results = {}
+        self._load_cache()
+        self._dirty = False
+
+    @property
+    def files(self):
+        # Per-file tokens are only needed when something changed, so they stay
+        # a marshalled blob until then.
+        if self._files is None:
+            self._files = marshal.loads(self._files_blob) if self._files_blob else {}
+            self._files_blob = None
+        return self._files
+
+    def _load_cache(self):
+        if not self.cache_file:
+            return
+        try:
+            with open(self.cache_file, "rb") as fp:
+                cache = marshal.load(fp)
+        except (OSError, EOFError, ValueError, TypeError):
+            return
+        if isinstance(cache, dict) and cache.get("version") == CACHE_VERSION:
+            self._files_blob = cache["files"]
+            self.results = cache["results"]
+
+    def _save_cache(self):
+        if not self.cache_file or not self._dirty:
+            return
+        files = self._files_blob if self._files is None else marshal.dumps(self._files)
+        raw = marshal.dumps({"version": CACHE_VERSION, "files": files, "results": self.results})
+        try:
+            configio.write_atomic(self.cache_file, raw)
+        except OSError:
+            pass
+        self._dirty = False
+
+    def tokens(self, path, visited=None):
+        stamp = configio.fingerprint(path)
+        if visited is not None:
+            visited.append((path, stamp))
+        if stamp is None:
+            return []
+        cached = self.files.get(path)
+        if cached and tuple(cached[0]) == stamp:
+            return cached[1]
+        with open(path, encoding="utf-8", errors="replace") as fp:
+            tokens = [(keyword, args) for keyword, args in tokenize(fp)]
+        self.files[path] = (stamp, tokens)
+        self._dirty = True
+        return tokens
+
+    def _include(self, pattern):
+        pattern = os.path.expanduser(pattern)
+        if not os.path.isabs(pattern):
+            pattern = os.path.join(self.ssh_dir, pattern)
+        return sorted(glob.glob(pattern))
+
+    def _walk(self, path, block, blocks, deps, depth=0):
+        if depth > MAX_INCLUDE_DEPTH:
+            return
+        for keyword, args in self.tokens(path, deps["files"]):
+            if keyword == "host":
+                block = Block(args)
+                blocks.append(block)
+            elif keyword == "match":
+                # Match conditions are not evaluated; their options never apply
+                block = Block(None)
+                blocks.append(block)
+            elif keyword == "include":
+                for pattern in args:
+                    included = self._include(pattern)
+                    deps["globs"].append((pattern, included))
+                    for include_path in included:
+                        self._walk(include_path, block, blocks, deps, depth + 1)
+            else:
+                block.options.append((keyword, args))
+
+    def blocks(self, path, deps=None):
+        blocks = [Block(["*"])]
+        self._walk(path, blocks[0], blocks, deps or {"files": [], "globs": []})
+        return blocks
+
+    def _unchanged(self, deps):
+        return (all(configio.fingerprint(path) == tuple(stamp or ()) or (stamp is None and not os.path.exists(path))
+                    for path, stamp in deps["files"])
+                and all(self._include(pattern) == list(included) for pattern, included in deps["globs"]))
+
+    def effective_options(self, alias, literal, wildcard):
+        """Return ({keyword: [values]}, [LocalForward args]) that apply to alias."""
+        options, forwards = {}, []
+        candidates = literal.get(alias, []) + [(index, block) for index, block in wildcard if block.matches(alias)]
+        for _, block in sorted(candidates, key=lambda item: item[0]):
+            if not block.matches(alias):
+                continue
+            for keyword, args in block.options:
+                if keyword == "localforward":
+                    forwards.append(args)
+                elif args and (keyword in MULTI_OPTIONS or keyword not in options):
+                    options.setdefault(keyword, []).append(" ".join(args))
+        return options, forwards
+
+    def proxy_host(self, alias, options, forwarders):
+        """The proxy_host for alias: its other options as -o, then [ProxyJump,]destination.
+
+        The destination is the resolved [User@]HostName, as ssh:// when Port
+        isn't 22, so ssh doesn't match the alias's Host block again and add
+        all of its forwards to the tunnel.
+        """
+        hostname = options.get("hostname", [alias])[0].replace("%h", alias)
+        args = [f"{keyword}={value}" for keyword, values in options.items() if keyword not in SKIPPED_OPTIONS
+                for value in values]
+        host = hostname
+        if any(block.matches(hostname.lower()) for block in forwarders):
+            # The host name is a Host block too, e.g. one without HostName
+            args.append(f"hostname={hostname}")
+            host = UNMATCHED_PREFIX + hostname
+        destination = f"{options['user'][0]}@{host}" if "user" in options else host
+        port = options.get("port", ["22"])[0]
+        if port != "22":
+            destination = f"ssh://{destination}:{port}"
+        jump = options.get("proxyjump", ["none"])[0]
+        if jump.lower() != "none":
+            destination = f"{jump},{destination}"
+        return " ".join([arg for option in args for arg in ("-o", shlex.quote(option))] + [destination])
+
+    def load(self, path=SSH_CONFIG):
+        """Return {key: tunnel data} for every LocalForward reachable from path."""
+        cached = self.results.get(path)
+        if cached and self._unchanged(cached["deps"]):
+            return {key: dict(value) for key, value in cached["tunnels"].items()}
+
+        deps = {"files": [], "globs": []}
+        blocks = self.blocks(path, deps)
+
+        # Blocks naming hosts literally are looked up by name; only the
+        # wildcard ones need a pattern match per alias.
+        literal, wildcard, aliases, forwarders = {}, [], [], []
+        for index, block in enumerate(blocks):
+            if block.patterns is None:
+                continue
+            if all(_is_literal(name) for name in block.names):
+                for name in block.names:
+                    literal.setdefault(name, []).append((index, block))
+            else:
+                wildcard.append((index, block))
+            if any(keyword == "localforward" for keyword, _ in block.options):
+                aliases += [name for name in block.names if _is_literal(name)]
+                forwarders.append(block)
+
+        tunnels = {}
+        for alias in dict.fromkeys(aliases):
+            options, forwards = self.effective_options(alias, literal, wildcard)
+            proxy_host = self.proxy_host(alias, options, forwarders)
+            for args in forwards:
+                forward = _parse_forward(args)
+                if forward is None:
+                    continue
+                bind, port, remote = forward
+                tunnels[tunnel_key(alias, port)] = {
+                    KEYS.NAME: f"{alias} ({port})",
+                    KEYS.REMOTE_ADDRESS: remote,
+                    KEYS.LOCAL_PORT: port,
+                    KEYS.PROXY_HOST: proxy_host,
+                    KEYS.BROWSER_OPEN: "",
+                    KEYS.ALL_INTERFACES: bind in ("*", ANY_ADDRESS),
+                }
+
+        self.results[path] = {"deps": deps, "tunnels": tunnels}
+        self._dirty = True
+        self._save_cache()
+        return {key: dict(value) for key, value in tunnels.items()}
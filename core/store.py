@@ -0,0 +1,150 @@
+from . import configio, tracing
+from .backups import BackupStore
+from .journal import ABSENT, Journal, put_record, delete_record
+from .portindex import PortIndex
+from vars import (CONF_FILE, CONF_D_DIR, JOURNAL_FILE, BACKUP_DIR, COMPACT_DELAY, COMPACT_MAX_DELAY,
+                  COMPACT_THRESHOLD, RESTART_KEYS)
+
+
+class TunnelStore:
+    """The merged tunnel config and everything that keeps it on disk.
+
+    A background ConfigWriter appends edits to the journal right away and
+    later folds them into the files that own them, backing up every file it
+    replaces; the calling thread never waits on the disk. `data` maps tunnel
+    keys to their dicts and `port_index` tracks their local ports. Apart from
+    read(), methods must be called from one thread; the callbacks run on the
+    writer thread.
+    """
+
+    def __init__(self, readonly=(), conf_file=CONF_FILE, conf_dir=CONF_D_DIR, journal_file=JOURNAL_FILE,
+                 backup_dir=BACKUP_DIR, on_saved=None, on_error=None, on_idle=None):
+        self.sources = configio.ConfigSources(conf_file, conf_dir, readonly)
+        self.journal = Journal(journal_file)
+        self.backups = BackupStore(backup_dir)
+        self.data = {}
+        self.port_index = PortIndex()
+        self.writer = configio.ConfigWriter(
+            delay=COMPACT_DELAY,
+            max_delay=COMPACT_MAX_DELAY,
+            backup=self.backups.add_file,
+            on_saved=on_saved,
+            on_error=on_error,
+            on_idle=on_idle,
+        )
+
+    def load(self):
+        """Load every source plus the edits still in the journal."""
+        with tracing.span("load config"):
+            self.data = self.sources.load()
+        with tracing.span("replay journal"):
+            unfolded = self.journal.replay(self.sources, self.data)
+        self.port_index = PortIndex(self.data)
+        if unfolded:
+            self.compact(unfolded)
+        elif self.journal.count:
+            # Every record was already in its file or overridden since
+            self.journal.truncate()
+        return self.data
+
+    def read(self):
+        """Parse the config files as they are on disk now, without applying them.
+
+        Safe from any thread: the files are parsed into a copy of the
+        sources, which apply() then swaps in.
+        """
+        sources = self.sources.copy()
+        sources.load()
+        return sources
+
+    def apply(self, sources):
+        """Switch to sources returned by read(); returns (added, removed, changed, restart) keys.
+
+        restart holds the changed tunnels whose ssh command line changed.
+        """
+        # Catch up on files the writer replaced since read(), which hit the
+        # parse snapshots, and on edits not compacted yet. Records still
+        # queued for the journal are taken first: one appended meanwhile is
+        # then replayed twice, which is harmless, rather than not at all.
+        # Records for tunnels changed on disk since are skipped, so the
+        # reloaded value wins over an older edit made in the app.
+        queued = self.writer.queued()
+        data = sources.load()
+        self.journal.replay(sources, data, queued)
+        self.sources = sources
+        # A pending compaction would otherwise write back the data from
+        # before the reload and undo the change that triggered it.
+        for path in self.writer.pending():
+            if path in sources.files:
+                self.writer.refresh(path, sources.data(path))
+        added, removed, changed = configio.diff_config(self.data, data)
+        restart = set()
+        for key in removed:
+            self.port_index.remove(key, self.data.pop(key))
+        for key in changed:
+            if any(self.data[key].get(field) != data[key].get(field) for field in RESTART_KEYS):
+                restart.add(key)
+            self.port_index.update(key, self.data[key], key, data[key])
+            self.data[key] = data[key]
+        for key in added:
+            self.data[key] = data[key]
+            self.port_index.add(key, data[key])
+        return added, removed, changed, restart
+
+    def put(self, key, value, original_key=None):
+        """Store a tunnel, renaming it from original_key; returns the journal records.
+
+        Nothing is written until the records are passed to commit(). No
+        records are returned when the tunnel is unchanged.
+        """
+        original_key = original_key or key
+        old_value = self.data.get(original_key)
+        records, path = [], None
+        if key != original_key:
+            self.data.pop(original_key, None)
+            bases = self._bases(original_key)
+            for path, tombstone in self.sources.delete(original_key):
+                records.append(put_record(path, original_key, None, bases[path]) if tombstone
+                               else delete_record(path, original_key, bases[path]))
+            # The renamed tunnel stays in the file that defined it
+            path = records[0]["file"] if records else None
+        elif old_value == value:
+            return records
+
+        self.data[key] = value
+        self.port_index.update(original_key, old_value, key, value)
+        bases = self._bases(key)
+        path = self.sources.put(key, value, path)
+        records.append(put_record(path, key, value, bases.get(path, ABSENT)))
+        return records
+
+    def _bases(self, key):
+        # What every file holds for key before an edit, for its records
+        return {path: self.sources.get(path, key, ABSENT) for path in list(self.sources.files)}
+
+    def commit(self, records):
+        # Edits are durable once journaled, which the writer thread does
+        # first thing; rewriting the owning files is compaction and waits
+        # for a quiet moment unless the journal grows.
+        if not records:
+            return
+        self.writer.append(self.journal, records)
+        self.compact({record["file"] for record in records})
+
+    def compact(self, paths):
+        for path in paths:
+            self.writer.submit(path, self.sources.data(path))
+        if self.journal.count + len(self.writer.queued()) >= COMPACT_THRESHOLD:
+            self.writer.write_now()
+
+    def compacted(self):
+        """Drop the journal once the writer has folded every edit into its file."""
+        # Appends and submits are both queued from the calling thread, so an
+        # idle writer means every journaled edit is in its file. A failed
+        # write stays pending, which keeps the journal until it is retried.
+        if self.journal.count and self.writer.idle():
+            self.journal.truncate()
+
+    def flush(self):
+        self.writer.stop()
+        self.compacted()
@@ -0,0 +1,118 @@
+import subprocess
+import threading
+from concurrent.futures import ThreadPoolExecutor
+
+# Keeps ssh.exe from opening a console window on Windows
+CREATE_NO_WINDOW = getattr(subprocess, "CREATE_NO_WINDOW", 0)
+# How many ssh processes start_many() creates at once
+START_WORKERS = 8
+
+
+class _Starting:
+    """Holds a key's place while its ssh process is being created."""
+
+    pid = None
+
+    def kill(self):
+        pass
+
+
+class Supervisor:
+    """Runs one ssh process per tunnel key and reports when it exits.
+
+    Each process gets a daemon thread that waits on it and calls
+    `on_exit(key, returncode)` from that thread, unless the tunnel was
+    stopped or restarted first. stdin is a pipe that is never written to:
+    with `-L` and no remote command ssh opens a shell, and an EOF on stdin
+    would end the session along with the tunnel.
+    """
+
+    def __init__(self, on_exit=None):
+        self.on_exit = on_exit
+        self._processes = {}
+        self._lock = threading.Lock()
+
+    def start(self, key, argv):
+        """Start argv for key; False if it is already running or can't be started."""
+        # The lock isn't held across Popen, so several tunnels can start at
+        # once; a placeholder keeps the key taken meanwhile
+        starting = _Starting()
+        with self._lock:
+            if key in self._processes:
+                return False
+            self._processes[key] = starting
+        try:
+            process = subprocess.Popen(argv, stdin=subprocess.PIPE, stdout=subprocess.DEVNULL,
+                                       stderr=subprocess.DEVNULL, creationflags=CREATE_NO_WINDOW)
+        except OSError as e:
+            print(f"Error starting {argv[0]}: {e}")
+            process = None
+        with self._lock:
+            # Looked up by identity, since the tunnel may have been renamed
+            key = self._key_of(starting)
+            if key is not None:
+                if process is None:
+                    del self._processes[key]
+                else:
+                    self._processes[key] = process
+        if process is None:
+            return False
+        if key is None:
+            # Stopped before it was up
+            process.kill()
+        threading.Thread(target=self._wait, args=(process,), name=f"ssh-{process.pid}", daemon=True).start()
+        return key is not None
+
+    def start_many(self, commands):
+        """Start {key: argv} on a few threads at once; returns {key: started}."""
+        if len(commands) < 2:
+            return {key: self.start(key, argv) for key, argv in commands.items()}
+        with ThreadPoolExecutor(max_workers=START_WORKERS, thread_name_prefix="ssh-start") as pool:
+            started = pool.map(lambda item: self.start(*item), commands.items())
+            return dict(zip(commands, started))
+
+    def _key_of(self, process):
+        return next((key for key, running in self._processes.items() if running is process), None)
+
+    def _wait(self, process):
+        returncode = process.wait()
+        process.stdin.close()
+        with self._lock:
+            key = self._key_of(process)
+            if key is not None:
+                del self._processes[key]
+        if key is not None and self.on_exit:
+            self.on_exit(key, returncode)
+
+    def stop(self, key):
+        with self._lock:
+            process = self._processes.pop(key, None)
+        if process is None:
+            return False
+        try:
+            process.kill()
+        except OSError:
+            pass
+        return True
+
+    def stop_all(self):
+        for key in self.keys():
+            self.stop(key)
+
+    def rename(self, old_key, new_key):
+        with self._lock:
+            if old_key in self._processes:
+                self._processes[new_key] = self._processes.pop(old_key)
+
+    def running(self, key):
+        with self._lock:
+            return key in self._processes
+
+    def keys(self):
+        with self._lock:
+            return list(self._processes)
+
+    def pid(self, key):
+        with self._lock:
+            process = self._processes.get(key)
+            return process.pid if process else None
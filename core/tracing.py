@@ -0,0 +1,99 @@
+import json
+import os
+import threading
+import time
+
+from vars import TRACE_ENV
+
+_events = None
+_lock = threading.Lock()
+_pid = os.getpid()
+
+
+class _NullSpan:
+    __slots__ = ()
+
+    def __enter__(self):
+        return self
+
+    def __exit__(self, *exc):
+        return False
+
+
+_NULL_SPAN = _NullSpan()
+
+
+def _now():
+    return time.perf_counter_ns() // 1000
+
+
+class _Span:
+    __slots__ = ("name", "args", "start")
+
+    def __init__(self, name, args):
+        self.name = name
+        self.args = args
+
+    def __enter__(self):
+        self.start = _now()
+        return self
+
+    def __exit__(self, *exc):
+        _record({"name": self.name, "ph": "X", "ts": self.start, "dur": _now() - self.start,
+                 "pid": _pid, "tid": threading.get_ident(), "args": self.args})
+        return False
+
+
+def _record(event):
+    with _lock:
+        if _events is not None:
+            _events.append(event)
+
+
+def enable():
+    global _events
+    if _events is None:
+        _events = []
+
+
+def enabled():
+    return _events is not None
+
+
+def span(name, **args):
+    """Context manager recording `name` as one complete event; free when disabled."""
+    if _events is None:
+        return _NULL_SPAN
+    return _Span(name, args)
+
+
+def begin(name):
+    """Open a span that can't be wrapped in a with block (e.g. module imports)."""
+    if _events is not None:
+        _record({"name": name, "ph": "B", "ts": _now(), "pid": _pid, "tid": threading.get_ident()})
+
+
+def end(name):
+    if _events is not None:
+        _record({"name": name, "ph": "E", "ts": _now(), "pid": _pid, "tid": threading.get_ident()})
+
+
+def write(path=None):
+    """Write the events so far as Chrome trace-event JSON (loads in Perfetto)."""
+    path = path or os.environ.get(TRACE_ENV)
+    if _events is None or not path:
+        return
+    with _lock:
+        events = list(_events)
+    names = {thread.ident: thread.name for thread in threading.enumerate()}
+    events += [{"name": "thread_name", "ph": "M", "pid": _pid, "tid": tid, "args": {"name": names[tid]}}
+               for tid in {event["tid"] for event in events} if tid in names]
+    try:
+        with open(path, "w", encoding="utf-8") as fp:
+            json.dump({"traceEvents": events, "displayTimeUnit": "ms"}, fp)
+    except OSError as e:
+        print(f"Error writing trace to {path}: {e}")
+
+
+if os.environ.get(TRACE_ENV):
+    enable()
@@ -0,0 +1,127 @@
+import re
+import shlex
+from urllib.parse import urlparse
+
+from vars import KEYS, CMDS
+
+ANY_ADDRESS = "0.0.0.0"
+LOOPBACK_ADDRESS = "127.0.0.1"
+DEFAULT_LOCAL_PORT = 8080
+
+_FIELDS = {
+    KEYS.REMOTE_ADDRESS, KEYS.PROXY_HOST, KEYS.BROWSER_OPEN, KEYS.LOCAL_PORT,
+    KEYS.ALL_INTERFACES, KEYS.NAME, KEYS.ICON, KEYS.AUTOSTART, KEYS.GROUP,
+}
+
+
+# Spaces around the commas of `bastion, destination` are allowed
+_JUMP_SEPARATOR = re.compile(r"\s*,\s*")
+
+
+def _split(command):
+    try:
+        return shlex.split(command)
+    except ValueError:
+        # An unbalanced quote; split like the original space-separated command
+        return command.split()
+
+
+def key_for_name(name):
+    return re.sub(r'[^\w\-.]', '_', name)
+
+
+class TunnelSpec:
+    """Plain data for one tunnel: what the config stores and what ssh runs.
+
+    Keys this class doesn't know about are kept in `extra` and written back
+    untouched.
+    """
+
+    __slots__ = ("key", "name", "remote_address", "local_port", "proxy_host",
+                 "browser_open", "all_interfaces", "icon", "autostart", "group", "extra")
+
+    def __init__(self, key, remote_address="", local_port=DEFAULT_LOCAL_PORT, proxy_host="",
+                 browser_open="", all_interfaces=False, name=None, icon=None, autostart=False, group=None,
+                 extra=None):
+        self.key = key
+        self.name = name
+        self.remote_address = remote_address
+        self.local_port = local_port
+        self.proxy_host = proxy_host
+        self.browser_open = browser_open
+        self.all_interfaces = all_interfaces
+        self.icon = icon
+        self.autostart = autostart
+        self.group = group
+        self.extra = extra or {}
+
+    @classmethod
+    def from_dict(cls, key, data):
+        return cls(
+            key,
+            remote_address=data.get(KEYS.REMOTE_ADDRESS) or "",
+            local_port=data.get(KEYS.LOCAL_PORT, DEFAULT_LOCAL_PORT),
+            proxy_host=data.get(KEYS.PROXY_HOST) or "",
+            browser_open=data.get(KEYS.BROWSER_OPEN) or "",
+            all_interfaces=bool(data.get(KEYS.ALL_INTERFACES)),
+            name=data.get(KEYS.NAME),
+            icon=data.get(KEYS.ICON),
+            autostart=bool(data.get(KEYS.AUTOSTART)),
+            group=str(data[KEYS.GROUP]) if data.get(KEYS.GROUP) else None,
+            extra={k: v for k, v in data.items() if k not in _FIELDS},
+        )
+
+    def as_dict(self):
+        result = {
+            KEYS.REMOTE_ADDRESS: self.remote_address,
+            KEYS.PROXY_HOST: self.proxy_host,
+            KEYS.BROWSER_OPEN: self.browser_open,
+            KEYS.LOCAL_PORT: self.local_port,
+            KEYS.ALL_INTERFACES: bool(self.all_interfaces),
+        }
+        if self.name:
+            result[KEYS.NAME] = self.name
+        if self.icon:
+            result[KEYS.ICON] = self.icon
+        if self.autostart:
+            result[KEYS.AUTOSTART] = True
+        if self.group:
+            result[KEYS.GROUP] = self.group
+        result.update(self.extra)
+        return result
+
+    @property
+    def display_name(self):
+        return self.name or self.key.replace('_', ' ')
+
+    @property
+    def bind_address(self):
+        return ANY_ADDRESS if self.all_interfaces else LOOPBACK_ADDRESS
+
+    def ssh_argv(self):
+        """The ssh command line; proxy_host may carry ssh options before `[jump,...,]destination`."""
+        forward = f"{self.bind_address}:{self.local_port}:{self.remote_address.strip()}"
+        args = _split(_JUMP_SEPARATOR.sub(",", self.proxy_host.strip()))
+        destination = args.pop() if args else ""
+        if ',' in destination:
+            proxy_jumps, destination = destination.rsplit(',', 1)
+            args += ["-J", proxy_jumps]
+        return [CMDS.SSH] + args + ["-L", forward, destination]
+
+    def ssh_command(self):
+        return shlex.join(self.ssh_argv())
+
+    def browser_url(self):
+        """The browser_open URL pointed at the local port, or None if unset."""
+        browser_open = self.browser_open.strip()
+        if not browser_open:
+            return None
+        try:
+            urlobj = urlparse(browser_open)
+            # Si la URL tiene hostname, reemplazar el puerto
+            if urlobj.hostname:
+                return urlobj._replace(netloc=f"{urlobj.hostname}:{self.local_port}").geturl()
+        except ValueError as e:
+            print(f"Error parsing browser URL: {e}")
+        # Si no tiene hostname (ej: solo "localhost"), construir URL completa
+        return f"http://127.0.0.1:{self.local_port}"
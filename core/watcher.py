@@ -0,0 +1,163 @@
+import ctypes
+import ctypes.util
+import os
+import select
+import struct
+import sys
+import threading
+import time
+
+from .configio import CONFIG_SUFFIXES
+
+IN_MODIFY = 0x00000002
+IN_CLOSE_WRITE = 0x00000008
+IN_MOVED_FROM = 0x00000040
+IN_MOVED_TO = 0x00000080
+IN_CREATE = 0x00000100
+IN_DELETE = 0x00000200
+IN_NONBLOCK = 0o4000
+IN_CLOEXEC = 0o2000000
+WATCH_MASK = IN_MODIFY | IN_CLOSE_WRITE | IN_MOVED_FROM | IN_MOVED_TO | IN_CREATE | IN_DELETE
+EVENT_HEADER = struct.Struct("iIII")
+
+
+def _load_inotify():
+    if not sys.platform.startswith("linux"):
+        return None
+    try:
+        libc = ctypes.CDLL(ctypes.util.find_library("c") or None, use_errno=True)
+        libc.inotify_init1
+        libc.inotify_add_watch
+    except (OSError, AttributeError):
+        return None
+    return libc
+
+
+class FileWatcher:
+    """Calls `callback(paths)` from a background thread when watched files change.
+
+    Each watched path is either a file or a directory; for directories any
+    child ending in one of `suffixes` counts. Paths in `dirs` are always
+    directories, even ones that don't exist yet: their creation counts as a
+    change, and their children are watched from then on. Events are debounced: the
+    callback fires once nothing has changed for `delay` seconds, with the set
+    of paths touched in the meantime. Uses inotify on Linux and falls back to
+    polling stat() every `interval` seconds elsewhere.
+    """
+
+    def __init__(self, paths, callback, delay=0.3, interval=1.0, suffixes=CONFIG_SUFFIXES, dirs=()):
+        self.callback = callback
+        self.delay = delay
+        self.interval = interval
+        self.suffixes = suffixes
+        self.files = {}
+        self.dirs = set()
+        for path in paths:
+            path = os.path.abspath(path)
+            if os.path.isdir(path):
+                self.dirs.add(path)
+            else:
+                self.files.setdefault(os.path.dirname(path), set()).add(os.path.basename(path))
+        for path in dirs:
+            path = os.path.abspath(path)
+            self.dirs.add(path)
+            self.files.setdefault(os.path.dirname(path), set()).add(os.path.basename(path))
+        self._stopped = threading.Event()
+        self._thread = threading.Thread(target=self._run, name="config-watcher", daemon=True)
+
+    def start(self):
+        self._thread.start()
+
+    def stop(self):
+        self._stopped.set()
+
+    def _matches(self, directory, name):
+        if directory in self.dirs and name.endswith(self.suffixes) and not name.startswith("."):
+            return True
+        return name in self.files.get(directory, ())
+
+    def _run(self):
+        libc = _load_inotify()
+        fd = libc.inotify_init1(IN_NONBLOCK | IN_CLOEXEC) if libc else -1
+        if fd < 0:
+            self._run_polling()
+            return
+        try:
+            self._run_inotify(libc, fd)
+        finally:
+            os.close(fd)
+
+    def _run_inotify(self, libc, fd):
+        watches = {}
+
+        def watch(directory):
+            wd = libc.inotify_add_watch(fd, os.fsencode(directory), WATCH_MASK)
+            if wd >= 0:
+                watches[wd] = directory
+
+        for directory in set(self.files) | self.dirs:
+            watch(directory)
+
+        pending = set()
+        deadline = None
+        while not self._stopped.is_set():
+            timeout = self.interval if deadline is None else max(0, deadline - time.monotonic())
+            readable, _, _ = select.select([fd], [], [], timeout)
+            if readable:
+                try:
+                    buf = os.read(fd, 65536)
+                except BlockingIOError:
+                    continue
+                offset = 0
+                while offset < len(buf):
+                    wd, _, _, length = EVENT_HEADER.unpack_from(buf, offset)
+                    offset += EVENT_HEADER.size
+                    name = os.fsdecode(buf[offset:offset + length].rstrip(b"\0"))
+                    offset += length
+                    directory = watches.get(wd)
+                    if directory and self._matches(directory, name):
+                        path = os.path.join(directory, name)
+                        pending.add(path)
+                        if path in self.dirs and path not in watches.values():
+                            # A watched directory that didn't exist until now
+                            watch(path)
+                if pending:
+                    deadline = time.monotonic() + self.delay
+            elif deadline is not None:
+                changed, pending, deadline = pending, set(), None
+                self.callback(changed)
+
+    def _stat_all(self):
+        stats = {}
+        for directory in set(self.files) | self.dirs:
+            if directory in self.dirs:
+                try:
+                    names = os.listdir(directory)
+                except OSError:
+                    names = []
+            else:
+                names = self.files[directory]
+            for name in names:
+                if not self._matches(directory, name):
+                    continue
+                path = os.path.join(directory, name)
+                try:
+                    st = os.stat(path)
+                    stats[path] = (st.st_mtime_ns, st.st_size, st.st_ino)
+                except OSError:
+                    pass
+        return stats
+
+    def _run_polling(self):
+        previous = self._stat_all()
+        pending = set()
+        while not self._stopped.wait(self.interval if not pending else self.delay):
+            current = self._stat_all()
+            changed = {path for path in previous.keys() | current.keys()
+                       if previous.get(path) != current.get(path)}
+            previous = current
+            if changed:
+                pending |= changed
+            elif pending:
+                changed, pending = pending, set()
+                self.callback(changed)
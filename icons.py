@@ -1,7957 +0,0 @@
-# -*- coding: utf-8 -*-
-
-# Resource object code
-#
-# Created by: The Resource Compiler for PyQt5 (Qt v5.15.2)
-#
-# WARNING! All changes made in this file will be lost!
-
-from PyQt6 import QtCore
-
-qt_resource_data = b"\
-\x00\x00\x3b\x04\
-\x89\
-\x50\x4e\x47\x0d\x0a\x1a\x0a\x00\x00\x00\x0d\x49\x48\x44\x52\x00\
-\x00\x02\x00\x00\x00\x02\x00\x08\x06\x00\x00\x00\xf4\x78\xd4\xfa\
-\x00\x00\x00\x09\x70\x48\x59\x73\x00\x00\x0e\xc3\x00\x00\x0e\xc3\
-\x01\xc7\x6f\xa8\x64\x00\x00\x00\x19\x74\x45\x58\x74\x53\x6f\x66\
-\x74\x77\x61\x72\x65\x00\x77\x77\x77\x2e\x69\x6e\x6b\x73\x63\x61\
-\x70\x65\x2e\x6f\x72\x67\x9b\xee\x3c\x1a\x00\x00\x20\x00\x49\x44\
-\x41\x54\x78\x9c\xed\xdd\x79\xb8\x65\x65\x79\xe7\xfd\xef\xb3\x86\
-\x7d\x6a\x90\x92\x19\x41\x40\x83\x38\x41\xe2\x84\x09\x83\x38\x06\
-\x04\x14\x62\x8c\x53\x8c\x51\x63\x34\xa6\x93\xee\xbc\xb1\xd3\x9d\
-\xc4\x24\x1d\xa3\x9d\xa4\x3b\xbe\x9d\x49\x93\x37\x53\x47\xa3\xa8\
-\x31\xd1\x18\x5f\x05\x05\x05\x6d\x27\xc0\x79\x40\x51\x44\x70\xc0\
-\x01\x05\x14\x2c\xa0\xaa\xce\x5e\x6b\xed\xa7\xff\x38\xe7\x40\x55\
-\x71\x4e\xd5\x19\xf6\xde\xcf\x5a\x6b\x7f\x3f\xd7\xe5\x75\xd5\xa9\
-\xb3\xf7\x5a\x3f\x81\x73\xee\x7b\xdf\xcf\xb3\xd6\x0a\x48\x6a\xb5\
-\x08\x05\x70\xd8\x90\xc1\x61\x19\xa3\x23\x02\xd9\x81\x81\x78\x10\
-\xc4\x03\x47\x0b\x7f\x3e\x10\x38\x10\xe2\x56\x08\x5b\x80\xad\x01\
-\x06\x11\xee\x09\xe4\x0b\xdf\xdb\xc3\x3d\x80\x72\xb7\xaf\x6b\xe0\
-\xb6\xbd\x5e\x53\x03\xb7\x45\xd8\x95\xc1\xce\x08\xb7\x03\x15\xc4\
-\x5b\x21\xec\x02\x6e\x8d\x84\x5b\x33\x46\xb7\x46\xc2\xad\x10\x6e\
-\x8d\x8c\x7e\x30\x22\xbb\x69\xc0\xf0\x26\xe0\xc6\x00\x71\x12\xff\
-\x3c\x24\x8d\x47\x48\x1d\x40\x9a\x65\x11\x0e\x1e\x32\x38\x3a\xa7\
-\x39\x36\x90\x1d\x33\x22\x1c\x13\x88\x47\x03\xf7\x0e\x70\x78\x84\
-\xc3\x81\xc3\xe8\xde\xcf\x6a\x03\xe1\xc6\x40\xbc\x29\x12\x6e\x80\
-\xf8\xdd\x48\xb8\x3e\x10\xbf\x09\xa3\x6f\x35\xe4\xd7\x0f\x18\x7e\
-\x33\xc0\xf6\xd4\x41\xa5\x59\xd5\xb5\x5f\x2a\x52\xa7\x44\x08\xb0\
-\xf9\xe8\x9a\xea\xf8\x40\x38\x3e\x12\x8e\x0f\x8c\xee\xb7\xf0\x67\
-\x8e\x07\xb6\xa6\xce\x98\xd8\x0f\x03\x5c\x17\xe1\xda\x48\xb8\x36\
-\x10\xaf\x8d\xc4\x6b\x0b\xea\x6b\x03\xdc\x90\x3a\x9c\xd4\x67\x36\
-\x00\xd2\x98\x44\xb6\x1c\x55\x33\x3c\x21\x23\x9c\x18\xe1\x04\xe0\
-\x44\xe0\x21\xc0\x01\x89\xa3\x75\xd5\xf6\x00\x5f\x89\xf0\xc5\x40\
-\xbc\x2a\x92\x7f\x31\x27\x5c\x05\xbb\xbe\x1e\x60\x94\x3a\x9c\xd4\
-\x75\x36\x00\xd2\x1a\x45\x28\x86\x0c\x1e\x98\x13\x4f\x8a\x70\x52\
-\x58\x28\xf6\x8f\x00\x0e\x4e\x9d\x6d\x46\x6c\x07\x3e\x1f\xe1\x53\
-\x19\x5c\x35\x22\x7e\xb1\xa0\xfe\x44\x80\xf9\xd4\xc1\xa4\x2e\xb1\
-\x01\x90\xf6\x23\x32\xf7\x80\x86\xd1\xc9\xc0\xd2\xff\x7e\x0c\x98\
-\x4b\x9b\x4a\x7b\xd9\x09\x7c\x2e\xc2\xc7\x03\xe1\x63\x39\xd9\x47\
-\x03\xbb\xbe\x9a\x3a\x94\xd4\x66\x36\x00\xd2\x6e\x22\x6c\xa9\x29\
-\x4e\xc9\xe0\xf4\x48\x76\x0a\xc4\x93\xf1\x93\x7d\x57\xdd\x08\xf1\
-\x63\x01\x3e\x36\x82\x0f\x15\xd4\x1f\x77\x4a\x20\xdd\xc5\x06\x40\
-\x33\x2d\xc2\xd6\x9a\xe2\x54\xc8\x4e\x0f\xc4\x47\x01\xa7\x03\x9b\
-\x52\xe7\xd2\x44\xd4\x01\x3e\x37\x22\x5c\x1a\x08\x97\xe5\xcc\x7f\
-\x28\xc0\x0f\x53\x87\x92\x52\xb1\x01\xd0\x4c\x89\x50\xd4\x14\x27\
-\x43\x76\x66\x20\x9e\x09\xfc\x04\x0b\xd7\xd9\x6b\xf6\x54\xc0\x15\
-\x81\x78\x49\x43\xb8\xa4\xa4\xfa\x64\x80\x26\x75\x28\x69\x5a\x6c\
-\x00\xd4\x7b\x91\x4d\xc7\x8d\x68\xce\x89\xc4\x33\x21\x3c\x1e\xd8\
-\x96\x3a\x93\x5a\xe9\x16\x88\xef\x0b\x84\x4b\x32\x8a\x8b\x03\x3b\
-\xaf\x4f\x1d\x48\x9a\x24\x1b\x00\xf5\x4e\x84\xbc\xa2\x7c\x58\x20\
-\x9c\x97\x11\xcf\x8d\x70\x52\xea\x4c\xea\xa4\xaf\x46\xb8\x10\xe2\
-\x05\x05\xf5\x07\xc2\xc2\xdd\x11\xa5\xde\xb0\x01\x50\x2f\x44\xd8\
-\xda\x30\x38\x07\xe2\x53\x80\x73\x80\x43\x52\x67\x52\xaf\xdc\x08\
-\xbc\x0b\xc2\x3b\x72\x86\xef\x0d\x0b\x57\x1d\x48\x9d\x66\x03\xa0\
-\xce\x8a\xb0\xa5\x61\xee\x27\x61\xf4\x0c\xe0\xa9\x2c\xdc\xe3\x5e\
-\x9a\xb4\x9d\x10\xde\x07\xf1\xad\x39\xd5\xff\xef\xed\x8c\xd5\x55\
-\x36\x00\xea\x94\x08\x07\x34\x94\x4f\x85\xf0\x4c\x88\x67\xe0\xf5\
-\xf8\x4a\x6b\x27\xc4\xf7\x40\xf6\x96\x9c\xe1\x3b\x02\xec\x48\x1d\
-\x48\x5a\x2d\x1b\x00\xb5\x5e\x84\xbc\xa6\x78\x7c\x20\x3c\x0f\x3f\
-\xe9\xab\xbd\x76\x02\x17\x42\xf6\x86\x9c\xf9\x8b\xc3\xc2\x55\x06\
-\x52\x6b\xd9\x00\xa8\xb5\x2a\x8a\xd3\x17\x8b\xfe\xd3\x81\x83\x52\
-\xe7\x91\xd6\xe0\x26\xe0\xad\x23\x38\x7f\x40\xf5\xb1\xd4\x61\xa4\
-\xe5\xd8\x00\xa8\x55\x22\x1c\x39\xa2\x7c\x26\xf0\xc2\xb8\x70\xcb\
-\x5d\xa9\xd3\x22\x5c\x9d\x11\x5f\x97\x51\xbf\x2e\xc0\xf7\x52\xe7\
-\x91\x96\xd8\x00\x28\xb9\x08\x65\xc3\xe0\x29\xc0\x0b\x20\x9e\x05\
-\xe4\xa9\x33\x49\x13\x50\x41\xbc\x08\xb2\xd7\xe6\x0c\xdf\xe5\x65\
-\x85\x4a\xcd\x06\x40\xc9\x44\xb6\x1c\x35\x62\xf8\xdc\x48\xf8\x8f\
-\xc0\x31\xa9\xf3\x48\xd3\x13\x6e\x88\x70\x7e\x41\xf6\xb7\x81\x5d\
-\xdf\x48\x9d\x46\xb3\xc9\x06\x40\x53\x15\x21\xab\x29\x9e\x10\x08\
-\x2f\x66\x61\x43\x9f\xb7\xe1\xd5\x2c\x1b\x01\xef\x87\xec\xd5\x39\
-\xf3\x17\x06\x88\xa9\x03\x69\x76\xd8\x00\x68\x2a\x22\x6c\x1b\x51\
-\xbe\x20\xc2\xaf\x01\xf7\x4b\x9d\x47\x6a\x9b\x08\xd7\x64\xf0\x17\
-\x19\xd5\xeb\xbd\xd1\x90\xa6\xc1\x06\x40\x13\x15\xd9\x74\x5c\xcd\
-\xe8\xc5\x81\xf8\x62\xdc\xc9\x2f\xad\xc6\xcd\x91\xf0\x9a\x82\xe2\
-\xd5\x81\x1d\xdf\x49\x1d\x46\xfd\x65\x03\xa0\x89\xa8\x28\x1e\x1d\
-\xe0\x37\x20\xfc\x14\x90\xa5\xce\x23\x75\xd0\x2e\xe0\xfc\x9c\xec\
-\xcf\x03\xf3\x5f\x4e\x1d\x46\xfd\x63\x03\xa0\xb1\x89\x10\x1a\xe6\
-\xce\x85\xd1\x4b\x81\xd3\x52\xe7\x91\x7a\xe2\xce\x7d\x02\x05\xf3\
-\x17\xa4\x0e\xa3\xfe\xb0\x01\xd0\x86\x2d\x5c\xc6\x57\x3e\x3b\xc0\
-\x6f\x45\x38\x31\x75\x1e\xa9\xaf\x02\x7c\x26\xc2\x5f\xe6\x54\xff\
-\xec\x65\x84\xda\x28\x1b\x00\xad\x5b\x84\xc1\x88\xf2\x85\x11\x5e\
-\x0a\x1c\x9b\x3a\x8f\x34\x43\xbe\x06\xfc\x8f\x7c\x61\xc3\xa0\xb7\
-\x1c\xd6\xba\xd8\x00\x68\xcd\x22\x64\x0d\x83\xa7\x41\xfc\x9f\xb8\
-\xa3\x5f\x4a\xe9\x1b\x01\xfe\x47\x46\xf5\x5a\x27\x02\x5a\x2b\x1b\
-\x00\xad\xda\x52\xe1\x8f\xc4\x3f\x0a\xf0\x80\xd4\x79\x24\x2d\x88\
-\x70\x75\x80\xff\x99\x53\xbd\x29\x40\x93\x3a\x8f\xba\xc1\x06\x40\
-\xfb\xb5\xb4\xb9\x2f\x30\xfa\xc3\x08\x0f\x4d\x9d\x47\xd2\xf2\x02\
-\x5c\x15\x09\xaf\xc8\x19\xfe\x9b\x37\x15\xd2\xfe\xd8\x00\x68\x9f\
-\x2a\x8a\x33\x32\xc2\x2b\x23\x3c\x22\x75\x16\x49\xab\x13\xe0\xf3\
-\x91\xf0\x87\x36\x02\xda\x17\x1b\x00\x2d\xab\xa2\x38\x3b\x10\xfe\
-\x3b\xf0\xe3\xa9\xb3\x48\x5a\xb7\x2b\x22\xf1\xf7\x4b\xea\xf7\xa5\
-\x0e\xa2\xf6\xb1\x01\xd0\x1e\x22\x83\x13\x1a\xf8\x53\x88\xe7\xa4\
-\xce\x22\x69\x6c\x2e\x6d\x08\xff\x79\x8e\xe1\x17\x52\x07\x51\x7b\
-\xd8\x00\x08\x80\xc8\xe6\x7b\x37\xd4\x2f\x03\x5e\x88\x8f\xe3\x95\
-\xfa\xa8\x06\x5e\x9b\x53\xfd\x5e\x80\x9b\x53\x87\x51\x7a\x36\x00\
-\x33\x2e\xc2\x3d\x6a\x06\xbf\x15\x88\xff\x05\xd8\x92\x3a\x8f\xa4\
-\x89\xbb\x39\xc0\xcb\x32\xaa\x7f\xf0\x8a\x81\xd9\x66\x03\x30\xc3\
-\x6a\xe6\xce\x83\xd1\x5f\xe3\x4d\x7c\xa4\x99\xb3\x70\xe9\xe0\xe8\
-\x37\x0a\x9a\x8b\x52\x67\x51\x1a\x36\x00\x33\x28\x32\x78\x50\x43\
-\x7c\x35\x70\x66\xea\x2c\x92\x52\x0b\x17\xe6\x84\x97\x04\xe6\xaf\
-\x4b\x9d\x44\xd3\xe5\x53\xda\x66\x48\x84\x03\x2b\xca\x57\x35\xc4\
-\xcf\x63\xf1\x97\x04\x40\x3c\xb7\x61\xf4\xa5\x8a\xf2\x55\x11\xb6\
-\xa5\x4e\xa3\xe9\x71\x02\x30\x23\x6a\x06\x3f\x0f\xf1\xcf\x80\xc3\
-\x53\x67\x91\xd4\x56\xe1\x06\xe0\x3f\x15\x0c\xff\x3d\x75\x12\x4d\
-\x9e\x0d\x40\xcf\x45\xe6\xee\xd7\x10\xff\x06\xe2\x13\x53\x67\x91\
-\xd4\x15\xe1\xc2\x9c\xfc\x57\x03\x3b\xbf\x99\x3a\x89\x26\xc7\x25\
-\x80\x9e\x5a\x78\x44\x6f\xf1\xdb\x0d\xa3\x2f\x58\xfc\x25\xad\x4d\
-\x3c\xb7\xa1\xfe\x7c\x43\xf9\xeb\xd1\x3a\xd1\x5b\x4e\x00\x7a\xa8\
-\xa2\x38\x0d\xc2\x3f\x06\x78\x70\xea\x2c\x92\x3a\xef\x83\x39\xd9\
-\x8b\x03\xf3\xd7\xa4\x0e\xa2\xf1\xb2\xb3\xeb\x91\x08\x9b\x2b\x06\
-\x7f\x12\x08\x1f\xb2\xf8\x4b\x1a\x93\xc7\x36\x8c\x3e\x57\x31\x78\
-\x79\x84\x41\xea\x30\x1a\x1f\x27\x00\x3d\x51\x51\x3c\x0a\xc2\x6b\
-\x02\x3c\x30\x75\x16\x49\xfd\x14\xe0\xca\x06\x7e\x69\x40\xf5\xf1\
-\xd4\x59\xb4\x71\x4e\x00\x3a\x2e\xc2\xd6\x9a\xf2\xaf\x16\x3f\xf5\
-\x5b\xfc\x25\x4d\x4c\x84\x87\x64\x70\x79\x45\xf9\xa7\x11\x36\xa7\
-\xce\xa3\x8d\x71\x02\xd0\x61\x43\xca\x47\x06\x78\xa3\x85\x5f\xd2\
-\xb4\x45\xb8\x3a\xc2\xcf\x0d\xa8\x3e\x93\x3a\x8b\xd6\xc7\x09\x40\
-\x07\x45\x08\x0d\xe5\xaf\x67\x70\x99\xc5\x5f\x52\x0a\x01\x1e\x94\
-\xc1\xc7\x16\xf7\x06\x58\x4b\x3a\xc8\x09\x40\xc7\x44\x36\x1f\xd3\
-\x50\x9f\x0f\x3c\x2e\x75\x16\x49\x5a\xf4\xfe\x9c\xe2\x79\x81\x9d\
-\xdf\x4e\x1d\x44\xab\x67\xd7\xd6\x21\x35\x83\xa7\x35\xd4\x9f\xc5\
-\xe2\x2f\xa9\x5d\x9e\xd0\x50\x7f\xa1\x66\xf0\xb3\xa9\x83\x68\xf5\
-\x6c\x00\x3a\x20\xc2\x01\x35\xe5\xdf\x43\xfc\x37\xe0\xe0\xd4\x79\
-\x24\x69\x19\x07\x42\x7c\x73\x4d\x79\x7e\x84\x7b\xa4\x0e\xa3\xfd\
-\x73\x09\xa0\xe5\x86\x94\x3f\xb1\xb8\xd1\xef\xfe\xa9\xb3\x48\xd2\
-\x2a\x7d\x2d\x12\x7f\xbe\xa4\xbe\x3c\x75\x10\xad\xcc\x09\x40\x4b\
-\x45\xc8\x1b\x8a\x97\x2d\x6e\xf4\xb3\xf8\x4b\xea\x92\x1f\x09\x84\
-\x0f\x34\x14\x2f\x75\x83\x60\x7b\x39\x01\x68\xa1\x08\x87\x34\x94\
-\x6f\xc6\x47\xf6\x4a\xea\xbc\x70\x71\xce\xf0\x39\x01\x7e\x90\x3a\
-\x89\xf6\x64\x03\xd0\x32\x43\xca\x87\x67\xf0\xef\xc0\x7d\x53\x67\
-\x91\xa4\x31\xf9\xe6\x08\x9e\x36\xa0\xfa\x44\xea\x20\xba\x8b\xa3\
-\x99\x16\xa9\x29\x9f\x97\xc1\x65\x58\xfc\x25\xf5\xcb\x31\x19\x7c\
-\xa8\xa6\xfc\xc5\xd4\x41\x74\x17\x1b\x80\x16\x88\x30\x57\x51\xbe\
-\x0a\x78\x3d\xde\x5e\x53\x52\x3f\x6d\x02\x5e\x53\x53\xfe\xbd\x0f\
-\x15\x6a\x07\x97\x00\x12\x8b\x6c\x3e\xba\xa1\x7e\x2b\x70\x4a\xea\
-\x2c\x92\x34\x25\x9f\xcc\x29\x9e\x16\xd8\x79\x7d\xea\x20\xb3\xcc\
-\x06\x20\xa1\x8a\xe2\x31\x81\xf0\x16\xe0\x88\xd4\x59\x24\x69\xca\
-\x6e\x8a\xc4\x9f\x2d\xa9\xdf\x9f\x3a\xc8\xac\x72\x09\x20\x91\x86\
-\xf2\xc5\x81\x70\x29\x16\x7f\x49\xb3\xe9\xb0\x40\x78\x4f\x43\xf1\
-\xdb\xa9\x83\xcc\x2a\x27\x00\x53\x16\x61\x4b\x43\xf9\x4f\xc0\x33\
-\x53\x67\x91\xa4\x96\x78\x53\x4e\xf5\xa2\x00\xbb\x52\x07\x99\x25\
-\x36\x00\x53\xb4\x78\x7d\xff\x3b\x80\x47\xa5\xce\x22\x49\x2d\xf3\
-\xd1\x9c\xea\x29\x01\x6e\x4c\x1d\x64\x56\xd8\x00\x4c\x49\x64\xee\
-\xf8\x9a\xd1\xbb\xbd\xab\x9f\x24\xad\xe8\xab\x39\xd9\x93\x02\xf3\
-\x5f\x4e\x1d\x64\x16\xb8\x07\x60\x0a\x2a\x8a\xd3\x1a\x46\x57\x58\
-\xfc\x25\x69\x9f\x8e\x6b\x18\x5d\x5e\x51\x3c\x26\x75\x90\x59\x60\
-\x03\x30\x61\x35\x83\x67\x06\xc2\xfb\x80\x43\x53\x67\x91\xa4\x0e\
-\x38\x38\x10\xde\x5b\x33\xf8\xb9\xd4\x41\xfa\xce\x06\x60\x82\x1a\
-\xca\x5f\x87\xf8\x2f\x2c\xdc\x00\x43\x92\xb4\x3a\x73\x10\xdf\x58\
-\x31\x78\x79\xea\x20\x7d\xe6\x1e\x80\x09\x88\x50\x34\x94\x7f\x0d\
-\xfc\x72\xea\x2c\x92\xd4\x71\xaf\xcd\xa9\xfe\x43\x80\x2a\x75\x90\
-\xbe\xb1\x01\x18\xb3\x08\x07\x34\x0c\xde\x02\xf1\xec\xd4\x59\x24\
-\xa9\x27\x2e\xc9\xa9\x9e\x11\xe0\x87\xa9\x83\xf4\x89\x0d\xc0\x18\
-\x45\x36\x1f\x33\xa2\xbe\x28\xc2\x89\xa9\xb3\x48\x52\x9f\x04\xf8\
-\x5c\x46\x75\x4e\x80\x1b\x52\x67\xe9\x0b\x1b\x80\x31\x89\x6c\xba\
-\x6f\x43\x73\x29\x70\xbf\xd4\x59\x24\xa9\xa7\xbe\x9e\x93\x9d\x11\
-\x98\xbf\x2e\x75\x90\x3e\xb0\x01\x18\x83\xc8\xe0\x41\x0d\xa3\x4b\
-\x20\x1c\x9d\x3a\x8b\x24\xf5\xdc\x37\x17\x9b\x80\x6b\x52\x07\xe9\
-\x3a\x1b\x80\x0d\x1a\x52\x3e\x2c\x83\xf7\x02\x87\xa5\xce\x22\x49\
-\x33\xe2\x7b\x0d\xe1\x89\x73\x0c\xaf\x4c\x1d\xa4\xcb\xbc\x0c\x70\
-\x03\x86\x94\x8f\xcc\xe0\x52\x2c\xfe\x92\x34\x4d\x47\xe4\xc4\x0f\
-\x0c\x29\x4f\x4e\x1d\xa4\xcb\x6c\x00\xd6\xa9\xa2\x78\x4c\x06\xef\
-\x03\x0e\x49\x9d\x45\x92\x66\xd0\x41\x19\x5c\x5a\x51\x3c\x21\x75\
-\x90\xae\xb2\x01\x58\x87\x8a\xe2\xec\x40\xb8\x18\xd8\x96\x3a\x8b\
-\x24\xcd\xb0\x7b\x04\xc2\x05\x15\xc5\x13\x53\x07\xe9\x22\x1b\x80\
-\x35\xaa\x99\x3b\x2f\x10\xde\x0e\x6c\x4e\x9d\x45\x92\xc4\x96\x40\
-\xb8\xa0\x66\xf0\x33\xa9\x83\x74\x8d\x0d\xc0\x1a\xd4\x0c\x7e\x16\
-\x46\x6f\xc3\x5b\xfb\x4a\x52\x9b\x0c\x20\xbe\xa5\xa6\x7c\x5e\xea\
-\x20\x5d\xe2\x55\x00\xab\x54\x33\x78\x0e\xc4\xf3\xb1\x69\x92\xa4\
-\xb6\x6a\x20\x3c\xa7\x60\xf8\xaf\xa9\x83\x74\x81\x0d\xc0\x2a\xd4\
-\x0c\x7e\x1a\xe2\x5b\x81\x22\x75\x16\x49\xd2\x3e\x55\x90\x3d\xbd\
-\x60\xfe\x9d\xa9\x83\xb4\x9d\x0d\xc0\x7e\x54\x14\x67\x06\xc2\x05\
-\xc0\x5c\xea\x2c\x92\xa4\x55\x19\xc2\xe8\xa7\x0b\x9a\x8b\x52\x07\
-\x69\x33\x1b\x80\x7d\xa8\x28\x1e\x15\x08\xef\x01\xb6\xa6\xce\x22\
-\x49\x5a\x93\x1d\x91\x78\x4e\x49\xfd\xa1\xd4\x41\xda\xca\x06\x60\
-\x05\x43\xca\x93\x33\xb8\x04\x38\x20\x75\x16\x49\xd2\xba\x6c\x1f\
-\xc1\x19\x03\xaa\x4f\xa4\x0e\xd2\x46\x36\x00\xcb\x98\x67\xf0\x90\
-\x9c\xf8\x7f\x80\x83\x53\x67\x91\x24\x6d\xc8\xad\x23\x78\xc2\x80\
-\xea\x33\xa9\x83\xb4\x8d\x0d\xc0\x5e\x22\x73\x0f\x68\x88\x1f\x84\
-\x78\xaf\xd4\x59\x24\x49\x63\x71\x63\x4e\x78\x6c\x60\x78\x75\xea\
-\x20\x6d\xe2\x25\x6d\xbb\x89\x6c\x3e\x76\xe1\xa9\x7e\x16\x7f\x49\
-\xea\x91\xc3\x1b\x46\x97\x44\x36\xfd\x48\xea\x20\x6d\x62\x03\xb0\
-\x28\xb2\xf9\x98\x86\xfa\x83\xc0\xb1\xa9\xb3\x48\x92\xc6\x2d\x1c\
-\xdd\xd0\xbc\x37\xc2\x91\xa9\x93\xb4\x85\x4b\x00\x40\x84\x6d\x23\
-\xca\x0f\x47\x78\x48\xea\x2c\x92\xa4\xc9\x09\xf0\x85\x8c\xea\xf4\
-\x00\x3f\x4c\x9d\x25\xb5\x99\x9f\x00\x44\x28\x1b\xca\x7f\xb3\xf8\
-\x4b\x52\xff\x45\xf8\xd1\x86\xc1\xbf\x44\x6f\xec\x66\x03\xd0\x50\
-\xfe\x15\x70\x66\xea\x1c\x92\xa4\x69\x89\x67\x37\x94\x7f\x97\x3a\
-\x45\x6a\x33\xdd\x00\x34\x14\x2f\x03\x7e\x39\x75\x0e\x49\xd2\xd4\
-\xbd\xb0\xa1\xf8\xad\xd4\x21\x52\x9a\xd9\x3d\x00\x35\x83\x67\x41\
-\x7c\x33\x33\xfc\xcf\x40\x92\x66\x5c\x84\xf0\xdc\x82\xe1\x9b\x52\
-\x07\x49\x61\x26\x8b\x5f\x45\xf1\xe8\x40\xb8\x04\xef\xef\x2f\x49\
-\xb3\x6e\x57\x24\x9e\x51\x52\x5f\x96\x3a\xc8\xb4\xcd\x5c\x03\x10\
-\x19\x3c\xa8\x21\x5e\x86\x77\xf9\x93\x24\x2d\xf8\x7e\x4e\x76\x5a\
-\x60\xfe\x9a\xd4\x41\xa6\x69\xa6\xf6\x00\x44\x38\xb4\x21\x5e\x80\
-\xc5\x5f\x92\x74\x97\x43\x1a\x46\x17\x45\x38\x3c\x75\x90\x69\x9a\
-\x99\x06\x20\xc2\xe6\x86\xf2\x9d\xc0\xf1\xa9\xb3\x48\x92\x5a\xe7\
-\xb8\x86\xf2\x6d\x11\x36\xa5\x0e\x32\x2d\x33\xd1\x00\x44\x08\x0d\
-\xe5\xeb\x80\x53\xd3\x26\x91\x24\xb5\xd8\xe9\x0d\xe5\xff\x4e\x1d\
-\x62\x5a\x66\xa2\x01\x18\x51\xfc\x17\xe0\x99\xa9\x73\x48\x92\x5a\
-\xef\xe7\x1b\xca\xff\x27\x75\x88\x69\xe8\xfd\x26\xc0\x8a\xe2\xf1\
-\x81\xf0\x5e\xbc\xeb\x93\x24\x69\x75\xea\x48\xfc\xc9\x92\xfa\x43\
-\xa9\x83\x4c\x52\xaf\x1b\x80\xc5\x07\xfc\x7c\x92\x19\xdb\xd8\x21\
-\x49\xda\xb0\xef\xe5\x14\x27\x05\x76\x7e\x3b\x75\x90\x49\xe9\xed\
-\x12\xc0\xc2\x3d\xfe\xeb\x37\x63\xf1\x97\x24\xad\xdd\x11\x0d\xf5\
-\x5b\x23\x0c\x52\x07\x99\x94\xde\x36\x00\x0d\xe5\x5f\x03\x8f\x4a\
-\x9d\x43\x92\xd4\x59\xa7\x36\x94\x7f\x96\x3a\xc4\xa4\xf4\x72\x09\
-\xa0\xa6\x7c\x2e\x70\x7e\xea\x1c\x92\xa4\x5e\x78\x41\x41\xf5\xba\
-\xd4\x21\xc6\xad\x77\x0d\xc0\x90\xf2\x61\x19\x5c\x0e\x6c\x4e\x9d\
-\x45\x92\xd4\x0b\xbb\x46\x70\xfa\x80\xea\x53\xa9\x83\x8c\x53\xaf\
-\x1a\x80\x08\x07\x37\x94\x9f\x04\x7e\x24\x75\x16\x49\x52\xaf\x7c\
-\x23\xa7\x7a\x64\x80\x9b\x53\x07\x19\x97\xde\xec\x01\x88\x90\x37\
-\x94\xff\x8a\xc5\x5f\x92\x34\x7e\xf7\x69\x18\x9c\x1f\x7b\x54\x37\
-\x7b\xf3\x7f\x64\x44\xf1\xbb\xc0\x19\xa9\x73\x48\x92\xfa\x2a\x9e\
-\x33\xa2\xf8\xaf\xa9\x53\x8c\x4b\x2f\x96\x00\x86\x94\x8f\x5c\x5c\
-\xf7\x2f\x53\x67\x91\x24\xf5\x5a\xb5\xb8\x1f\xe0\xe3\xa9\x83\x6c\
-\x54\xe7\x1b\x80\x08\x5b\x6b\xca\x4f\x07\x78\x40\xea\x2c\x92\xa4\
-\x99\x70\x6d\x4e\xf5\xf0\x00\xb7\xa7\x0e\xb2\x11\x9d\x5f\x02\x68\
-\x28\xff\xca\xe2\x2f\x49\x9a\xa2\xe3\x1b\xca\x3f\x4d\x1d\x62\xa3\
-\x3a\x3d\x01\xa8\x19\xfc\x0c\xc4\xb7\xa5\xce\x21\x49\x9a\x45\xe1\
-\x99\x05\xc3\xb7\xa6\x4e\xb1\x5e\x9d\x6d\x00\x22\x9b\xef\xdd\x50\
-\x7f\x0e\x38\x24\x75\x16\x49\xd2\x4c\xba\x39\xa7\x7c\x68\x60\xc7\
-\x77\x52\x07\x59\x8f\x4e\x2e\x01\x44\xc8\x1a\xea\xf3\xb1\xf8\x4b\
-\x92\xd2\x39\xb4\xa1\x7a\x5d\x57\x2f\x0d\xec\x64\xe8\x11\xc5\x6f\
-\x02\x4f\x48\x9d\x43\x92\x34\xf3\xce\x1c\x51\xbc\x24\x75\x88\xf5\
-\xe8\xdc\x12\xc0\x90\xf2\x11\x19\x5c\x41\x8f\x9f\xd0\x24\x49\xea\
-\x94\xf9\x11\x9c\x32\xa0\xfa\x6c\xea\x20\x6b\xd1\xa9\x09\x40\x84\
-\x2d\x01\xde\x84\xc5\x5f\x92\xd4\x1e\x73\x01\xde\x14\x3b\xf6\x0c\
-\x9a\x4e\x35\x00\x0d\xe5\x9f\x04\x78\x50\xea\x1c\x92\x24\xed\x2e\
-\xc0\x09\x35\x83\x57\xa4\xce\xb1\x16\x9d\x59\x02\xa8\x28\x4e\x0b\
-\x84\x0f\xd3\xb1\xa6\x45\x92\x34\x33\x9a\xc5\xa5\x80\x4f\xa6\x0e\
-\xb2\x1a\x9d\x68\x00\x22\x6c\xa9\x29\x3f\x1b\xe0\xfe\xa9\xb3\x48\
-\x92\xb4\x92\x00\x57\x66\x0b\x4f\x0d\xac\x52\x67\xd9\x9f\x4e\x7c\
-\x9a\xae\x29\xff\xc8\xe2\x2f\x49\x6a\xbb\x08\x0f\x19\x51\xfc\x97\
-\xd4\x39\x56\xa3\xf5\x13\x80\x21\xe5\x29\x19\x7c\x04\xc8\x53\x67\
-\x91\x24\x69\x15\xe6\x73\xc2\xc3\x03\xc3\x2f\xa5\x0e\xb2\x2f\xad\
-\x9e\x00\x44\x18\x04\x78\x0d\x16\x7f\x49\x52\x77\xcc\x35\xc4\xbf\
-\x89\x2d\xff\x90\xdd\xea\x06\x60\x44\xf1\x5b\x01\x4e\x48\x9d\x43\
-\x92\xa4\x35\x7a\x5c\x43\xf9\xa2\xd4\x21\xf6\xa5\xb5\xdd\x49\x64\
-\xee\xf8\x86\xd1\x95\x74\xec\xba\x4a\x49\x92\x16\xfd\x30\xa7\x38\
-\x31\xb0\xf3\xdb\xa9\x83\x2c\xa7\xb5\x13\x80\x86\xd1\xdf\x60\xf1\
-\x97\x24\x75\xd7\x3d\x1b\xaa\xbf\x4d\x1d\x62\x25\xad\x6c\x00\x6a\
-\x06\xcf\x01\xce\x4c\x9d\x43\x92\xa4\x8d\x09\xe7\x2d\x3c\xba\xbe\
-\x7d\x5a\xb7\x04\x10\xe1\xc0\x86\xf2\x6a\xe0\x88\xd4\x59\x24\x49\
-\xda\xb8\x70\x43\xce\xf0\x41\x01\xb6\xa7\x4e\xb2\xbb\xd6\x4d\x00\
-\x6a\xca\x57\x60\xf1\x97\x24\xf5\x46\x3c\xb2\x66\xf0\xfb\xa9\x53\
-\xec\xad\x55\x13\x80\x79\x06\x27\xe6\xc4\xcf\x00\x65\xea\x2c\x92\
-\x24\x8d\x51\xdd\x10\x1e\x3e\xc7\xf0\x0b\xa9\x83\x2c\x69\xd5\x04\
-\x20\x27\xfe\x35\x16\x7f\x49\x52\xff\x14\x39\xf1\x2f\x53\x87\xd8\
-\x5d\x6b\x1a\x80\x9a\xc1\xb3\x81\xc7\xa5\xce\x21\x49\xd2\x84\xfc\
-\x64\x9b\x36\x04\xb6\x62\x09\x20\xc2\x3d\x1a\x8a\xab\x21\xdc\x3b\
-\x75\x16\x49\x92\x26\xe8\x1b\x39\xd5\x83\x03\xec\x4c\x1d\xa4\x15\
-\x13\x80\x9a\xc1\x6f\x5a\xfc\x25\x49\x33\xe0\x3e\x23\x8a\xff\x9c\
-\x3a\x04\xb4\x60\x02\x10\xd9\x72\x54\x43\x75\x0d\xb0\x35\x75\x16\
-\x49\x92\xa6\xe0\xf6\x9c\xea\x01\x01\x6e\x48\x19\x22\xf9\x04\xa0\
-\xa1\xfa\x63\x2c\xfe\x92\xa4\xd9\x71\x8f\x86\xf2\xe5\xa9\x43\x24\
-\x9d\x00\x0c\x29\x1f\x9a\xc1\xa7\x69\x41\x23\x22\x49\xd2\x14\x35\
-\x8b\x97\x05\x7e\x3e\x55\x80\xa4\x85\x37\x83\xff\x95\x3a\x83\x24\
-\x49\x09\xe4\x39\xf1\x2f\x52\x06\x48\x56\x7c\x2b\x8a\xb3\xf0\x7e\
-\xff\x92\xa4\xd9\xf5\x93\x15\xc5\x19\xa9\x4e\x9e\x6c\x09\xa0\xa6\
-\xfc\x28\x70\x72\xaa\xf3\x4b\x92\xd4\x02\x9f\xcc\xa9\x7e\x22\x40\
-\x9c\xf6\x89\x93\x4c\x00\x6a\xe6\x7e\x0a\x8b\xbf\x24\x49\x8f\x6c\
-\x18\x3c\x35\xc5\x89\xa7\x3e\x01\x88\x10\x46\x94\x9f\x8e\xf0\xb0\
-\x69\x9f\x5b\x92\xa4\xb6\x89\xf0\xe5\x82\xea\x47\x03\xd4\xd3\x3c\
-\xef\xd4\x27\x00\x0d\x83\xa7\x59\xfc\x25\x49\x5a\x10\xe0\x81\x0d\
-\xe5\xcf\x27\x38\xef\xf4\x44\xc8\x46\x94\x57\x46\x38\x71\x9a\xe7\
-\x95\x24\xa9\xe5\xbe\x9e\x53\x3d\x30\xc0\x70\x5a\x27\x9c\xea\x04\
-\xa0\x61\xf0\x6c\x8b\xbf\x24\x49\x77\x73\xdf\x11\xe5\x2f\x4c\xf3\
-\x84\x53\x9b\x00\x44\xc8\x6b\xca\xab\x02\x3c\x70\x5a\xe7\x94\x24\
-\xa9\x43\xae\xcf\xa9\xee\x3f\xad\x29\xc0\xd4\x26\x00\x0d\xe5\xf3\
-\x2c\xfe\x92\x24\xad\xe8\xd8\x86\xf2\xf9\xd3\x3a\xd9\x54\x26\x00\
-\x11\xca\x86\xf2\x6a\xe0\xb8\x69\x9c\x4f\x92\xa4\x8e\x9a\xda\x14\
-\x60\x2a\x13\x80\x11\xe5\x0b\xb1\xf8\x4b\x92\xb4\x3f\xc7\x36\x94\
-\xcf\x9b\xc6\x89\x26\x3e\x01\x58\xfc\xf4\xff\x15\xe0\x3e\x93\x3e\
-\x97\x24\x49\x3d\xf0\xd5\xc5\xc7\x05\x37\x93\x3c\xc9\xc4\x27\x00\
-\x0d\xe5\xcf\x61\xf1\x97\x24\x69\xb5\x8e\x6b\x18\x3c\x63\xd2\x27\
-\x99\xe8\x04\x60\xf1\xae\x7f\x57\x46\xf8\xd1\x49\x9e\x47\x92\xa4\
-\x3e\x09\xf0\xb9\x8c\xea\xe1\x93\x7c\x46\xc0\x44\x27\x00\x0d\x73\
-\xe7\x59\xfc\x25\x49\x5a\x9b\x08\x0f\xad\x17\x9e\x9a\x3b\x31\x13\
-\x5e\x02\x18\xfd\xd6\x64\x8f\x2f\x49\x52\x3f\x05\xc2\x6f\x4f\xf6\
-\xf8\x13\x52\x51\x9c\x1e\x08\x1f\x9e\xd4\xf1\xd5\x7d\x11\xae\x01\
-\x2e\xcc\xe0\xab\x91\xf0\x6d\x68\xe6\x21\x3b\x3c\x10\xef\x1d\x09\
-\x8f\x03\x1e\x0b\x0c\xd2\xa6\x94\x36\x64\x1e\xc2\x07\x03\xa3\x0f\
-\x44\xc2\xb7\x23\xf1\xc6\x40\x36\x17\x88\x47\x8d\xe0\x78\xe0\xc9\
-\xde\x1f\x45\xfb\x32\x82\x53\x06\x54\x1f\x9b\xc4\xb1\x27\xd6\x00\
-\xd4\x14\xff\x0e\x21\xc9\x23\x0e\xd5\x6a\x0d\xf0\xc6\x9c\xf0\xca\
-\xc0\xf0\x4b\xfb\x7a\x61\x84\x7b\x8e\x28\x7f\x3e\x12\xfe\x1b\xc4\
-\x7b\x4d\x29\x9f\x34\x06\xe1\x86\x40\xfc\xa3\x8c\xea\xfc\x00\xb7\
-\xef\xeb\x95\x91\xc1\x83\x1a\xe2\xef\x00\xcf\x01\xf2\xe9\xe4\x53\
-\x87\xbc\xa5\xa0\x7a\xd6\x24\x0e\x3c\x91\x06\x20\xb2\xe9\x47\x1a\
-\x9a\xaf\xe0\x7f\xcc\xda\x4d\x80\x4f\xd7\x84\xe7\xcd\x31\xbc\x6a\
-\x2d\xef\x8b\xb0\xb5\x66\xf0\xb2\x40\xfc\x4d\x12\x3c\xc2\x5a\x5a\
-\x83\x18\x09\xaf\x2c\x18\xfe\x61\x80\x1d\x6b\x7a\x23\x83\x13\x46\
-\xc4\x37\x46\x78\xf8\xa4\xc2\xa9\x93\xea\x9c\xe2\x7e\x81\x9d\xd7\
-\x8f\xfb\xc0\x13\xd9\x03\x50\xd3\xfc\x1a\x16\x7f\xed\xe9\xad\x19\
-\xd5\xa3\xd7\x5a\xfc\x01\x02\xdc\x51\x32\xfc\x6d\x08\xcf\x62\x8d\
-\xbf\x54\xa5\x29\xda\x05\xe1\x79\x25\xc3\xdf\x59\x6b\xf1\x07\x08\
-\x0c\xbf\x98\x51\x9d\x06\xbc\x61\x02\xd9\xd4\x5d\x45\x4d\xf3\x9f\
-\x26\x71\xe0\xb1\x7f\x9a\x8a\x70\x40\x43\xf9\x4d\xe0\x9e\xe3\x3e\
-\xb6\x3a\xeb\x5f\x73\xaa\x67\x8f\xe3\x72\x96\x8a\xe2\x51\x81\x70\
-\x11\x70\xc0\x18\x72\x49\xe3\x72\x5b\x24\x9e\x53\x52\x5f\xb6\xd1\
-\x03\x45\x08\x0d\xe5\x9b\x81\x89\x8c\x7d\xd5\x49\xb7\xe4\x54\xc7\
-\x04\xb8\x63\x9c\x07\x1d\xfb\x04\x60\x44\xf9\x8b\x58\xfc\xb5\x28\
-\xc0\x67\x72\xaa\x17\x8e\xeb\x5a\xd6\x92\xfa\xb2\x48\x3c\x1b\xd8\
-\x3e\x8e\xe3\x49\x63\x70\x47\x24\x9e\x37\x8e\xe2\x0f\x10\x20\xe6\
-\x54\x2f\x00\x3e\x39\x8e\xe3\xa9\x17\x0e\x9a\xc4\xa3\x82\xc7\x3a\
-\x01\x88\x90\x35\x94\x5f\x66\x61\x77\xab\xd4\x34\x84\x87\xae\x67\
-\xec\xbf\x3f\x4e\x02\xd4\x12\x63\xfb\xe4\xbf\xb7\x79\x06\x27\xe6\
-\xc4\xcf\xe1\x72\xaa\x80\x08\x5f\x2e\xa8\x1e\x3c\xce\x1b\x03\x8d\
-\x75\x02\x50\x53\x9c\x89\xc5\x5f\x77\x39\x7f\x12\xc5\x1f\x9c\x04\
-\xa8\x15\xc6\xfa\xc9\x7f\x6f\x8b\x3f\x3b\x6f\x9c\xc4\xb1\xd5\x3d\
-\x01\x1e\x58\x53\x3c\x61\x9c\xc7\x1c\x6b\x03\x10\xe0\x3f\x8c\xf3\
-\x78\xea\xb6\x9c\xf0\xff\x4e\xf2\xf8\x25\xf5\xe5\x91\xf8\x24\xe0\
-\xb6\x49\x9e\x47\x5a\xc6\x6d\x91\x78\x56\x49\xfd\xc1\x49\x9e\x24\
-\x27\xfb\x9f\x93\x3c\xbe\xba\x25\xc0\xaf\x8c\xf9\x78\xe3\x11\xd9\
-\x7c\x4c\x43\xfd\x35\x1c\x57\x09\x88\xf0\xa5\x92\xea\x84\x69\x9c\
-\xab\xa2\x38\x6d\x71\x39\x60\xdb\x34\xce\xa7\x99\x77\x47\x24\x3e\
-\x79\xd2\xc5\x7f\x49\x45\x79\xb5\x37\x0b\xd2\xa2\x3a\xa7\xb8\x6f\
-\x60\xe7\xb7\xc7\x71\xb0\xb1\x4d\x00\x6a\x9a\x17\x61\xf1\xd7\x5d\
-\x2e\x9a\xd6\x89\x9c\x04\x68\x8a\xa6\xf2\xc9\x7f\x2f\xef\x9e\xe2\
-\xb9\xd4\x6e\xc5\x88\xea\x85\xe3\x3a\xd8\x58\x1a\x80\x08\x45\x60\
-\xf4\xa2\x71\x1c\x4b\xfd\x90\x2d\xdc\xe6\x77\x6a\xdc\x13\xa0\x29\
-\x98\xe8\x9a\xff\x4a\xa6\xfd\xb3\xa4\x76\x8b\xf0\x4b\x11\x8a\x71\
-\x1c\x6b\x2c\x0d\x40\xc3\xe0\xa7\x20\x1c\x35\x8e\x63\xa9\x1f\x22\
-\xe1\xbb\xd3\x3e\xa7\x93\x00\x4d\x50\x8a\x4f\xfe\x00\x44\xc2\x0d\
-\xd3\x3e\xa7\xda\x2c\x1c\xdd\x30\x77\xce\x38\x8e\x34\xae\x25\x80\
-\x17\x8c\xe9\x38\xea\x89\xc8\x68\x67\x8a\xf3\x2e\x4e\x02\xce\xc1\
-\x26\x40\xe3\x33\xb1\x4b\xfd\x56\x23\xd5\xcf\x92\xda\xac\xf9\xc5\
-\x71\x1c\x65\xc3\x0d\x40\x84\x23\x58\x18\xbd\x4a\x77\x0a\x84\x64\
-\x0f\xef\x71\x39\x40\x63\x94\x64\xec\xbf\xbb\x40\x38\x32\xd5\xb9\
-\xd5\x56\xe1\xdc\x08\x1b\xfe\x1d\xbb\xe1\x06\x60\x44\xf1\x7c\xc6\
-\xb4\x1e\xa1\xfe\x08\xc4\xa4\x4b\x42\x2e\x07\x68\x0c\x92\x8d\xfd\
-\x77\x17\x88\xf7\x4e\x79\x7e\xb5\x52\x31\xa2\xf8\xb9\x8d\x1e\x64\
-\x0c\x0d\x40\xf8\x85\x8d\x1e\x43\xfd\x13\xc9\x1e\x9b\x3a\x83\x93\
-\x00\x6d\x40\xf2\x4f\xfe\x4b\x22\xe1\x71\xa9\x33\xa8\x8d\xc2\x86\
-\x97\xde\x37\x74\x1f\x80\xc5\xeb\xaf\x93\xff\x80\xa8\x95\xe6\x73\
-\xaa\xc3\x42\x0b\x3e\x81\x7b\x9f\x00\xad\xd1\x54\xaf\xf3\xdf\x97\
-\x08\xf7\x68\x28\x6f\x06\xe6\x52\x67\x51\xfb\x8c\xe0\xc7\x07\x54\
-\xeb\x7e\x66\xc4\x86\x26\x00\x81\xf0\xdc\x8d\xbc\x5f\xbd\x36\x37\
-\xa2\x7c\x4e\xea\x10\xe0\x72\x80\xd6\xa4\x15\x63\xff\x25\x23\xca\
-\xe7\x61\xf1\xd7\x0a\x32\x78\xfe\x46\xde\xbf\xee\x09\x40\x84\xb2\
-\xa1\xbc\x01\x38\x64\x23\x01\xd4\x67\xe1\x86\x9c\xe1\xfd\xc7\xfd\
-\x08\xcb\xf5\x72\x12\xa0\xfd\x68\xcd\x27\x7f\x80\x08\x9b\x1b\x8a\
-\xaf\x40\x70\x0f\x80\x56\x72\x53\x4e\x75\x54\x80\x7a\x3d\x6f\x5e\
-\xf7\x04\xa0\x61\xee\x6c\x2c\xfe\xda\xa7\x78\x64\xcd\xe0\xf7\x52\
-\xa7\x58\xe2\x24\x40\xfb\xd0\xaa\x4f\xfe\x00\x35\x83\x97\x5b\xfc\
-\xb5\x1f\x87\xd5\x14\x67\xac\xf7\xcd\x1b\x58\x02\x18\x6d\x78\x07\
-\xa2\xfa\x2f\x10\x5f\x5a\x33\x78\x56\xea\x1c\x4b\xdc\x18\xa8\x65\
-\xb4\x66\xc3\xdf\x92\x9a\xc1\xcf\x04\xe2\x6f\xa6\xce\xa1\xf6\x0b\
-\x84\x67\xaf\xff\xbd\xeb\xb0\xb8\x31\xe5\xbb\xc0\xd6\xf5\x9e\x58\
-\x33\xe5\x8e\x11\x9c\x31\xa0\xfa\x68\xea\x20\x4b\x2a\x8a\x47\x2d\
-\x2e\x07\x1c\x90\x3a\x8b\x92\x4a\x7a\x93\x9f\xe5\x54\x14\xa7\x06\
-\xc2\x25\xf8\xfb\x55\xab\x73\x5b\x4e\x75\xaf\x00\x3b\xd6\xfa\xc6\
-\x75\x4d\x00\x1a\x06\x3f\x8d\xff\x71\x6a\xf5\xb6\x66\xf0\x9e\x21\
-\xe5\x29\xa9\x83\x2c\x71\x12\x20\x5a\xf8\xc9\x7f\xb1\xf8\x5f\x8c\
-\xbf\x5f\xb5\x7a\x07\x34\x0c\xce\x5b\xcf\x1b\xd7\xbb\x04\xd0\x9a\
-\x91\xae\x3a\x63\x5b\x0b\x9b\x80\xcb\x17\x6f\x1b\x6c\x13\x30\x7b\
-\x5a\xb5\xe1\x0f\xf6\x28\xfe\x6e\x52\xd5\x1a\x8d\xd6\x55\x93\xd7\
-\xbc\x04\x10\xe1\x80\x86\xf2\x46\x60\xd3\x7a\x4e\xa8\x99\xb7\x7d\
-\x04\x67\xb5\x6c\x39\xc0\x5f\xbc\xb3\xc5\xe2\xaf\xbe\xd9\xb9\x78\
-\xdf\x95\x35\x5d\x71\xb5\xe6\x09\x40\xc3\xe0\x5c\x2c\xfe\x5a\xbf\
-\x36\x4e\x02\xae\x70\x39\x60\x66\x58\xfc\xd5\x47\x9b\x1b\x06\x6b\
-\x7e\x42\xe0\x3a\x96\x00\x46\x4f\x5b\xfb\x7b\xa4\x3d\x6c\xcb\xe0\
-\xd2\x8a\xe2\x31\xa9\x83\x2c\xb1\x09\x98\x09\x16\x7f\xf5\x58\x5c\
-\x73\x6d\x5e\xd3\x12\x40\x84\x2d\x8b\xe3\x7f\x37\xa8\x68\x1c\xee\
-\x88\xc4\x27\x95\xd4\x1f\x4a\x1d\x64\x89\xbf\x90\x7b\xcb\xe2\xaf\
-\xbe\xbb\x3d\xa7\x3a\x3c\xc0\xaa\x1f\x1f\xbd\xa6\x09\x40\xc3\xe0\
-\x2c\x2c\xfe\x1a\x9f\xad\x81\x70\x41\x0b\x97\x03\xbc\x59\x50\xbf\
-\xb4\xee\x26\x3f\x16\x7f\x4d\xc0\x3d\x1a\xe6\xce\x5c\xcb\x1b\xd6\
-\xb8\x04\x10\x9f\xba\xb6\xd7\x4b\xfb\xd5\xc6\xe5\x80\xcb\x22\xf1\
-\x2c\x5c\x0e\xe8\x83\x36\x5f\xea\x67\xf1\xd7\x98\x8d\x9e\xb2\x96\
-\x57\xaf\x7a\x09\x20\x42\xbe\x78\xf3\x9f\x43\xd7\x9c\x49\xda\x3f\
-\x97\x03\x34\x6e\x8e\xfd\x35\x6b\x6e\xcc\xa9\x8e\x0c\x30\x5a\xcd\
-\x8b\x57\x3d\x01\xa8\x29\x4e\xc1\xe2\xaf\xc9\xd9\x1a\x08\xef\x6e\
-\xd9\x24\xc0\x8d\x81\xdd\x65\xf1\xd7\x2c\x3a\xbc\xa2\x7c\xe4\x6a\
-\x5f\xbc\x86\x25\x80\xec\xdc\xf5\xa4\x91\xd6\xc0\x26\x40\xe3\x60\
-\xf1\xd7\xcc\x0a\x84\x55\xd7\xea\x55\x37\x00\x19\x71\x5d\xb7\x1a\
-\x94\xd6\xc8\x26\x40\x1b\x61\xf1\xd7\x4c\xcb\x88\xab\x6e\x00\x56\
-\xb5\x07\x20\xb2\xe9\x3e\x0d\xcd\xd7\xd7\x9d\x48\x5a\x3b\xf7\x04\
-\x68\xad\x2c\xfe\x12\xc4\x9c\xe2\xd8\xc0\xce\x6f\xed\xef\x85\xab\
-\x9a\x00\x8c\x68\x9e\xb4\xf1\x4c\xd2\x9a\x38\x09\xd0\x5a\x58\xfc\
-\xa5\x05\xa1\xa1\x3e\x6b\x35\x2f\x5c\x55\x03\x10\x89\x6b\xba\xb6\
-\x50\x1a\x13\x9b\x00\xad\x86\xc5\x5f\xda\xd3\xaa\x6a\xf6\x7e\x97\
-\x00\x16\x2f\xff\xbb\x09\x38\x68\xc3\x91\xa4\xf5\x71\x39\x40\x2b\
-\xb1\xf8\x4b\x77\xf7\xfd\xc5\xbb\x02\xee\xf3\x72\xc0\xfd\x4e\x00\
-\x6a\x8a\x9f\xc0\xe2\xaf\xb4\x9c\x04\x68\x39\x16\x7f\x69\x79\x87\
-\x54\x94\x8f\xd8\xdf\x8b\xf6\xdb\x00\x64\xab\x1c\x25\x48\x13\x66\
-\x13\xa0\xdd\x59\xfc\xa5\x7d\xc8\x57\xb1\x74\xbf\xdf\x06\x20\x12\
-\x6c\x00\xd4\x16\x36\x01\x02\x8b\xbf\xb4\x5f\xab\xa9\xdd\xfb\xdc\
-\x03\x10\x61\x6b\x43\x79\x0b\x50\x8e\x2d\x95\xb4\x71\xdb\x23\xf1\
-\xec\x92\xfa\x8a\xd4\x41\x96\x54\x14\xa7\x2d\x16\x80\x03\x52\x67\
-\xe9\xb9\xdb\x16\xff\xdd\x5f\x9e\x3a\xc8\x12\x8b\xbf\x5a\x6a\x3e\
-\xa7\x3a\x68\x5f\x4f\x07\xdc\xe7\x04\xa0\xa6\x38\x0d\x8b\xbf\xda\
-\x67\x5b\x20\x5c\xd2\xb2\x49\xc0\xe5\x3e\x40\x68\xe2\x96\x1e\xec\
-\x63\xf1\x97\xf6\x6f\xae\xa6\x38\x79\x5f\x2f\xd8\xcf\x12\x40\xd6\
-\x9a\x5f\xb0\xd2\x5e\x5c\x0e\x98\x2d\x8e\xfd\xa5\x35\xca\x60\x9f\
-\xbf\x1f\xf7\xd9\x00\x04\xe2\x63\xc7\x1b\x47\x1a\x2b\x9b\x80\xd9\
-\x60\xf1\x97\xd6\x21\x12\xf6\xf9\xbb\x71\xc5\x3d\x00\x11\x36\x2d\
-\xae\xff\x6f\x1a\x7b\x2a\x69\xbc\xbc\x4f\x40\x7f\x59\xfc\xa5\xf5\
-\xdb\xb1\xb8\x0f\x60\xb8\xdc\x37\x57\x9c\x00\x2c\x3e\xfe\xd7\xe2\
-\xaf\x2e\x70\x12\xd0\x4f\x16\x7f\x69\x63\xb6\xd4\x14\x2b\x3e\x1e\
-\x78\xc5\x06\x20\x83\xd3\x27\x93\x47\x9a\x88\xad\x81\x70\x41\x45\
-\x71\x6a\xea\x20\x4b\x16\x9b\x80\x73\x80\xdb\x52\x67\xe9\xa0\xdb\
-\x22\xf1\x89\x16\x7f\x69\x63\x32\x78\xf4\x3e\xbe\xb7\xbc\x48\x76\
-\xca\x64\xe2\x48\x13\xe3\xd5\x01\xfd\xe0\x6e\x7f\x69\x4c\x22\xac\
-\x58\xcb\x97\xdd\x03\x10\x21\x34\x94\x37\x02\x87\x4e\x2c\x95\x34\
-\x39\xee\x09\xe8\x2e\xc7\xfe\xd2\x78\xdd\x58\x50\x1d\xb1\xdc\x37\
-\x56\x98\x00\xcc\xdd\x0f\x8b\xbf\xba\xcb\x3d\x01\xdd\x64\xf1\x97\
-\xc6\xef\xf0\xc8\xa6\xfb\x2e\xf7\x8d\x65\x1b\x80\x86\xe8\xf8\x5f\
-\x5d\x67\x13\xd0\x2d\x16\x7f\x69\x42\x1a\x46\xcb\xd6\xf4\x15\x26\
-\x00\x71\x9f\x77\x0f\x92\x3a\xc2\x26\xa0\x1b\x2c\xfe\xd2\x04\xc5\
-\x15\x6a\xfa\x4a\x9b\x00\x7f\x62\x82\x59\xa4\x69\xf2\xea\x80\x76\
-\x73\xb7\xbf\x34\x61\x61\x85\x8d\x80\x77\xdb\x04\x18\xa1\x68\x28\
-\x6f\xc3\x7b\x00\xa8\x5f\xdc\x18\xd8\x3e\x7e\xf2\x97\xa6\x63\x67\
-\x4e\xb5\x2d\x40\xbd\xfb\x5f\xde\x6d\x02\x30\x64\x70\x02\x16\x7f\
-\xf5\x8f\xcb\x01\xed\x62\xf1\x97\xa6\x67\x33\x0c\x1e\xb0\xf7\x5f\
-\xde\xad\x01\xc8\x89\x0f\x9f\x4e\x1e\x69\xea\x6c\x02\xda\xc1\xe2\
-\x2f\x4d\x59\x03\x77\xab\xed\x77\x6b\x00\xe2\x32\x2f\x92\x7a\xc4\
-\x26\x20\x2d\x8b\xbf\x94\x40\x5c\xe6\xc3\xfd\xdd\x1a\x80\x00\x8f\
-\x98\x4e\x1c\x29\x19\x9b\x80\x34\x2c\xfe\x52\x22\x61\x99\x0f\xf7\
-\x7b\x6c\x02\x5c\xbc\x03\xe0\xad\xf8\xc3\xa0\xd9\xb0\x3d\x12\xcf\
-\x2e\xa9\xaf\x48\x1d\x64\x49\x45\x71\x5a\x20\x5c\x44\xff\x7e\x06\
-\xb7\x47\xe2\x39\xde\xde\x57\x4a\xe6\x07\x05\xd5\x21\xbb\xff\xc5\
-\x5e\x13\x80\x4d\xc7\xe2\x0f\x83\x66\x47\x5b\x9f\x1d\xd0\xb7\x49\
-\xc0\x1d\x91\xf8\x53\x16\x7f\x29\xa9\x83\x23\x5b\x8e\xda\xfd\x2f\
-\xf6\x68\x00\x1a\xaa\x13\xa7\x9b\x47\x4a\xce\xe5\x80\xc9\x72\xec\
-\x2f\xb5\x44\xcd\xf0\x84\xdd\xbf\xde\xa3\x01\x08\x84\x13\x90\x66\
-\x8f\x4d\xc0\x64\x58\xfc\xa5\x16\xc9\x08\x27\xee\xf9\xf5\x6e\xa2\
-\x0d\x80\x66\xd7\x52\x13\xf0\xd8\xd4\x41\x96\x74\xbc\x09\xb0\xf8\
-\x4b\x2d\x13\x61\xe5\x09\x00\x7b\x7d\x53\x9a\x31\x5b\x03\xe1\x5d\
-\x36\x01\x1b\x66\xf1\x97\xda\x69\x8f\x09\xc0\x9d\x57\x01\x2c\x5e\
-\x01\x70\x0b\x70\xcf\xa9\x47\x92\xda\xc5\x02\xb6\x7e\xfe\xb3\x93\
-\xda\xeb\xd6\x82\xea\xa0\xa5\x2f\x76\x9b\x00\x6c\x39\x12\x8b\xbf\
-\x04\x0b\x93\x80\x77\xb6\xf4\x01\x42\x6d\x9e\x04\x6c\xf7\xc1\x3e\
-\x52\xab\x1d\x18\xe1\x5e\x4b\x5f\xdc\xd9\x00\xd4\x0c\xef\x9f\x26\
-\x8f\xd4\x4a\x4b\x97\x08\xb6\x69\x39\xa0\xcd\x97\x08\xde\x11\x89\
-\xe7\x79\xa9\x9f\xd4\x6e\x35\xc5\xfd\x96\xfe\x7c\x67\x03\x10\x08\
-\xc7\xa7\x89\x23\xb5\x96\x7b\x02\x56\xc7\x27\x2d\x4a\x1d\xb1\x7b\
-\xad\xbf\xb3\x01\x88\x84\xfb\x2d\xff\x72\x69\xa6\xd9\x04\xec\x9b\
-\xc5\x5f\xea\x90\xdd\x6b\xfd\x6e\x13\x80\xe8\x04\x40\x5a\x9e\x4d\
-\xc0\xf2\x2c\xfe\x52\xc7\xec\x5e\xeb\x77\x6b\x00\x70\x0f\x80\xb4\
-\x32\x9b\x80\x3d\x59\xfc\xa5\x6e\x5a\x6e\x09\x80\xe3\xd2\x64\x91\
-\x3a\xc3\xab\x03\x16\x2c\xed\xf6\xb7\xf8\x4b\xdd\xb3\xe7\x12\x40\
-\x84\x03\xf1\x07\x47\x5a\x8d\x59\xbf\x3a\xc0\xdd\xfe\x52\xb7\x1d\
-\x1c\xe1\x00\x58\x6c\x00\x86\x0c\x8e\x49\x9b\x47\xea\x94\x59\x5d\
-\x0e\x70\xec\x2f\xf5\xc2\xe0\x68\x58\x6c\x00\x72\x9a\x63\xd3\x86\
-\x91\x3a\x67\xd6\x9a\x00\x8b\xbf\xd4\x13\x35\xa3\x63\x61\xb1\x01\
-\x08\x64\x4e\x00\xa4\xb5\x9b\x95\x26\xc0\xe2\x2f\xf5\x48\x20\x1c\
-\x03\x8b\x0d\xc0\x68\xf1\x0b\x49\x6b\xd6\xf7\x26\xc0\xe2\x2f\xf5\
-\x4c\xdc\xbd\x01\x08\xc4\xa3\xd3\xc6\x91\x3a\x6d\xe9\xea\x80\xd3\
-\x52\x07\x59\x32\xa6\xab\x03\xdc\xed\x2f\xf5\x50\x20\xde\xd5\x00\
-\x00\x47\x25\xcc\x22\xf5\xc1\xb6\x40\x78\x6f\xcb\x26\x01\x1b\xb9\
-\x3a\xc0\xdd\xfe\x52\x6f\x85\xa3\xe0\xce\x09\x00\x47\xa4\x0d\x23\
-\xf5\x42\x5f\x96\x03\x1c\xfb\x4b\x3d\x16\x88\x87\xc3\x5d\xf7\x01\
-\xb0\x01\x90\xc6\xa3\xeb\x4d\x80\xc5\x5f\xea\xb9\x48\x3c\x02\x20\
-\x44\xc8\x1b\xca\x79\x20\x4f\x9c\x49\xea\x93\x3b\x22\xf1\xc9\x25\
-\xf5\x07\x53\x07\x59\xb2\x8a\x42\x6a\xf1\x97\x66\x43\x9d\x53\xcd\
-\x65\xc0\xa1\x58\xfc\xa5\x71\xeb\xda\x24\xc0\xe2\x2f\xcd\x8e\x02\
-\x38\x28\x1b\x32\x70\xfc\x2f\x4d\x46\x57\x9a\x00\x8b\xbf\x34\x73\
-\x06\x47\x64\x19\xa3\xc3\x52\xc7\x90\x7a\xac\xed\x97\x08\x7a\xa9\
-\x9f\x34\x83\x6a\x46\x87\x65\x81\xec\xc0\xd4\x41\xa4\x9e\xdb\x16\
-\x08\x17\xb5\xac\x09\xb8\x3c\x12\xcf\x8e\xc4\xb3\xbd\xd4\x4f\x9a\
-\x3d\x81\xec\xa0\x0c\xe2\xc1\xa9\x83\x48\x33\xa0\x8d\xf7\x09\xb8\
-\xa2\xa4\xbe\x22\x75\x8e\x25\x16\x7f\x69\x9a\xe2\x81\x59\x20\x3a\
-\x01\x90\xa6\xa3\x75\x7b\x02\xda\xc2\xe2\x2f\x4d\x57\x80\x83\xb2\
-\x11\xd9\x3d\x53\x07\x91\x66\x88\x4d\xc0\x5e\x2c\xfe\xd2\xf4\x8d\
-\x08\x4e\x00\xa4\x04\x6c\x02\x16\x59\xfc\xa5\x54\xe2\x81\x19\x60\
-\x03\x20\x4d\x5f\xeb\xae\x0e\x98\x36\x8b\xbf\x94\x4e\x80\x83\x32\
-\x88\xf7\x48\x1d\x44\x9a\x51\xad\xdb\x18\x38\x2d\x16\x7f\x29\xb5\
-\xb8\x35\x83\xb0\x25\x75\x0c\x69\x86\xcd\xdc\x72\x80\xc5\x5f\x6a\
-\x83\x6c\x4b\x06\x6c\x4e\x1d\x43\x9a\x71\x33\xd3\x04\x58\xfc\xa5\
-\xb6\x88\x9b\xb3\x00\x4e\x00\xa4\xf4\x7a\xdf\x04\x58\xfc\xa5\x56\
-\xd9\x92\x8d\x9c\x00\x48\x6d\xd1\xdb\x26\xc0\xe2\x2f\xb5\x4b\x00\
-\x27\x00\x52\xcb\xf4\xae\x09\xb0\xf8\x4b\xed\x13\x61\x4b\x06\x6c\
-\x4a\x1d\x44\xd2\x1e\x7a\x73\x89\xa0\xc5\x5f\x6a\xab\xb0\x39\x63\
-\xe1\xb9\xc0\x92\xda\xa5\xf3\x97\x08\x5a\xfc\xa5\x36\x8b\x85\x0d\
-\x80\xd4\x5e\x9d\x5d\x0e\xb0\xf8\x4b\xad\x97\x67\x40\x9e\x3a\x85\
-\xa4\x15\x75\xae\x09\xb0\xf8\x4b\x9d\x50\xd8\x00\x48\xed\xd7\x99\
-\x26\xc0\xe2\x2f\x75\x86\x13\x00\xa9\x23\x5a\xdf\x04\x58\xfc\xa5\
-\x4e\x71\x02\x20\x75\x48\x6b\x9b\x00\x8b\xbf\xd4\x39\x79\x96\x3a\
-\x81\x24\x49\x9a\xbe\x0c\x68\x52\x87\x90\xb4\x2a\x77\x44\xe2\x93\
-\x4b\xea\x0f\xa6\x0e\xb2\xb7\x92\xfa\x8a\x48\x3c\x1b\xd8\x9e\x3a\
-\x8b\xa4\x55\x69\x6c\x00\xa4\x6e\x68\x6d\xf1\x5f\x62\x13\x20\x75\
-\x4a\x6d\x03\x20\xb5\x5f\xeb\x8b\xff\x12\x9b\x00\xa9\x33\x9c\x00\
-\x48\x2d\xd7\x99\xe2\xbf\xc4\x26\x40\xea\x84\x3a\x03\xea\xd4\x29\
-\x24\x2d\xab\x73\xc5\x7f\x89\x4d\x80\xd4\x7a\x8d\x0d\x80\xd4\x4e\
-\xb7\x45\xe2\x13\xbb\x58\xfc\x97\xd8\x04\x48\x6d\x16\xea\x0c\xd8\
-\x95\x3a\x86\xa4\x3d\xdc\x11\x89\xe7\x95\xd4\x97\xa7\x0e\xb2\x51\
-\x36\x01\x52\x5b\xc5\x9d\x59\x84\x1d\xa9\x63\x48\xba\x53\x67\xc7\
-\xfe\x2b\xb1\x09\x90\xda\x27\xc0\x8e\x2c\x83\x9d\xa9\x83\x48\x02\
-\x7a\x58\xfc\x97\xd8\x04\x48\xed\x12\xc1\x09\x80\xd4\x12\xbd\x2d\
-\xfe\x4b\x6c\x02\xa4\x56\xd9\x91\xe1\x04\x40\x4a\xad\xf7\xc5\x7f\
-\x89\x4d\x80\xd4\x16\x61\x67\x06\xd1\x09\x80\x94\xce\xcc\x14\xff\
-\x25\x36\x01\x52\x1b\x8c\x76\x64\x10\x6e\x4f\x1d\x43\x9a\x51\x9d\
-\xbf\xd4\x6f\xbd\x6c\x02\xa4\xd4\xc2\x1d\x19\x70\x4b\xea\x18\xd2\
-\x0c\xea\xcd\xa5\x7e\xeb\x65\x13\x20\xa5\x13\xe1\x07\x59\x24\xdc\
-\x9a\x3a\x88\x34\x63\x66\x6e\xec\xbf\x12\x9b\x00\x29\x95\x70\x6b\
-\x96\x31\xfa\x61\xea\x18\xd2\x0c\xb1\xf8\xef\xc5\x26\x40\x9a\xbe\
-\x8c\x78\xab\x13\x00\x69\x7a\x2c\xfe\x2b\xb0\x09\x90\xa6\x2b\xc2\
-\x2d\x19\x36\x00\xd2\x34\xb4\x6e\xc3\x5f\x45\x71\x6a\x45\x71\x6a\
-\xea\x1c\x4b\x6c\x02\xa4\x69\x0a\x3f\xcc\x22\x23\x37\x01\x4a\x93\
-\x75\x5b\x24\x9e\xdd\xa6\x0d\x7f\x15\xc5\xa9\x81\x70\x71\x20\x5c\
-\x6c\x13\x20\xcd\x9e\xc8\xe8\x96\x6c\x44\x76\x63\xea\x20\x52\x8f\
-\xb5\x6e\xb7\xff\x52\xf1\x07\xb6\x01\xdb\x02\xe1\x92\x8a\xe2\xb1\
-\xa9\x73\x2d\xb1\x09\x90\x26\xaf\x20\xbb\x31\x1b\x30\xfc\x5e\xea\
-\x20\x52\x4f\xb5\x6e\xcd\x7f\xaf\xe2\xbf\x64\x6b\x20\xbc\xcb\x26\
-\x40\x9a\x25\xc3\xef\x85\x08\x79\x43\x39\x0f\xe4\xa9\xe3\x48\x3d\
-\xd2\x95\xe2\xbf\xbb\x2e\x66\x96\xb4\x76\x55\x4e\x35\x97\x05\x68\
-\x80\x9b\x53\xa7\x91\x7a\xa4\xab\x85\xd4\x49\x80\x34\x13\xe2\x8d\
-\x01\x62\x06\x10\xc0\x65\x00\x69\x3c\xba\x5a\xfc\x97\xd8\x04\x48\
-\x3d\x17\x08\x37\x02\x64\x00\xd1\x06\x40\x1a\x87\xae\x17\xff\x25\
-\x36\x01\x52\x8f\x45\xc2\xf7\x60\xb1\x01\x00\x6e\x48\x98\x45\xea\
-\x83\x56\x5e\xe7\xbf\x81\xf5\xf3\xad\x81\xf0\x4e\x2f\x11\x94\xfa\
-\x28\xde\x00\x77\x4e\x00\xc2\x37\xd3\x86\x91\x3a\xad\xed\x97\xfa\
-\xad\x97\x97\x08\x4a\x3d\x14\x09\xd7\xc3\x62\x03\x90\x11\x6d\x00\
-\xa4\xf5\xe9\xcb\xd8\x7f\x25\x2e\x07\x48\x3d\x13\x16\x6b\xfe\xe2\
-\x04\x60\x64\x03\x20\xad\x5d\xdf\x8b\xff\x12\x9b\x00\xa9\x47\xe2\
-\xee\x0d\x40\x43\x6e\x03\x20\xad\xcd\xac\x14\xff\x25\x36\x01\x52\
-\x4f\x14\x64\xd7\x03\x04\x80\x08\xf7\x6c\x28\x7d\x28\x90\xb4\x3a\
-\xb3\x56\xfc\x77\x37\xcb\xff\xdf\xa5\x5e\xc8\xa9\x0e\x08\x70\xfb\
-\xd2\x7d\x00\x7e\x88\x5d\xb4\xb4\x1a\xb7\x45\xe2\x59\x33\x5c\x00\
-\xbd\x3a\x54\xcb\xe9\x15\x00\x00\x1a\x85\x49\x44\x41\x54\x40\xea\
-\xb6\x1f\x04\xb8\x1d\xee\xba\x0c\x90\x00\x5f\x4d\x97\x47\xea\x84\
-\xa5\xdd\xfe\x97\xa5\x0e\xb2\x24\xd1\xa7\x5f\xaf\x0e\x90\xba\xeb\
-\xba\xa5\x3f\xdc\xd9\x00\x44\xf8\x4a\x9a\x2c\x52\x27\x38\xfa\xde\
-\x93\x7b\x02\xa4\x6e\xba\x76\xe9\x0f\xbb\x35\x00\xe1\xda\xe5\x5f\
-\x2b\xcd\x3c\x8b\xff\xf2\x6c\x02\xa4\x8e\xd9\xbd\xd6\xef\xb6\x04\
-\x10\xaf\x5b\xfe\xe5\xd2\x4c\xb3\xf8\xef\x9b\x4d\x80\xd4\x21\xbb\
-\xd7\xfa\xdd\x26\x00\xd1\x09\x80\xb4\x27\x8b\xff\xea\xd8\x04\x48\
-\x1d\xb1\x7b\xad\xbf\xb3\x01\x28\x18\xb8\x07\x40\xba\xcb\xac\xef\
-\xf6\x5f\x2b\xaf\x0e\x90\x3a\xa0\xa0\xbe\xb3\x01\x08\x4b\x7f\x88\
-\x10\x1a\xca\x5b\x80\x7b\x26\x49\x25\xb5\x87\x9f\xfc\xd7\xef\x8e\
-\x48\x7c\x52\x49\xfd\xa1\xd4\x41\x96\x74\xe8\x9f\x9d\x34\x69\xb7\
-\x16\x54\x07\x2d\x7d\xb1\xfb\x65\x80\x11\xb8\x3a\x49\x24\xa9\x3d\
-\x2c\xfe\x1b\xb3\x35\x10\xde\x5d\x51\x3c\x26\x75\x90\x25\x4e\x02\
-\xa4\x3b\x5d\xb5\xfb\x17\xd9\x5e\xdf\xfc\xe2\x14\x83\x48\x6d\x63\
-\xf1\x1f\x0f\x9b\x00\xa9\x9d\x56\x6e\x00\x02\xd1\x06\x40\xb3\xca\
-\xe2\x3f\x5e\x36\x01\x52\xcb\x84\xbd\x3e\xe4\xef\xd1\x00\x44\x1b\
-\x00\xcd\x26\x8b\xff\x64\xd8\x04\x48\x2d\x32\x22\xae\x3c\x01\xc8\
-\x29\xaf\x42\x9a\x2d\x16\xff\xc9\xb2\x09\x90\x5a\xa2\xa0\xde\xa3\
-\xc6\x87\xdd\xbf\x58\xbc\x12\xe0\x56\xfa\xf1\x8b\x47\xda\x9f\xdb\
-\x22\xf1\x1c\xef\xed\x3f\x15\xdb\x23\xf1\xec\x92\xfa\x8a\xd4\x41\
-\x96\xf4\xf8\x9f\xb5\xb4\x9c\xef\x17\x54\x87\xee\xfe\x17\x7b\xed\
-\x01\x20\x02\x9f\x9d\x6a\x24\x29\x0d\x1f\xec\x33\x5d\x4b\x0f\x10\
-\x72\x12\x20\xa5\xf1\x99\xbd\xff\x62\xef\xab\x00\x88\xf0\xe9\xe9\
-\x64\x91\x92\x71\xec\x9f\x86\xcb\x01\x52\x22\x91\xb0\xff\x06\x20\
-\x2c\xd3\x25\x48\x3d\x62\xf1\x4f\xcb\x26\x40\x4a\x20\x2c\x33\xdd\
-\xbf\x5b\x03\xd0\x2c\xd3\x25\x48\x3d\x61\xf1\x6f\x07\x9b\x00\x69\
-\xca\xf2\x65\x3e\xdc\x87\xbd\xff\x22\x42\xd1\x50\x6e\x07\x36\x4f\
-\x25\x95\x34\x1d\x16\xff\xf6\xf1\xb6\xc1\xd2\x74\xec\xc8\xa9\xb6\
-\x05\x68\x76\xff\xcb\xe5\x96\x00\x6a\xe0\xf3\x53\x8b\x25\x4d\x9e\
-\x0f\xf6\x69\xa7\xad\x81\x70\x81\x0f\x10\x92\x26\xee\xca\xbd\x8b\
-\x3f\x2c\xd3\x00\x2c\xfa\xd8\x84\xc3\x48\xd3\xe2\x6e\xff\x76\xf3\
-\xea\x00\x69\xc2\x22\x2c\x7b\xf9\xed\x0a\x0d\x40\xb0\x01\x50\x1f\
-\x38\xf6\xef\x06\xf7\x04\x48\x13\x14\x56\xa8\xe9\xcb\x36\x00\x39\
-\xe1\xa3\x93\x8d\x23\x4d\x9c\xc5\xbf\x5b\x6c\x02\xa4\x09\xc9\xc9\
-\x96\xad\xe9\x77\xdb\x04\xb8\xa4\xa6\xfc\x1e\x70\xf8\xc4\x12\x49\
-\x93\x63\xf1\xef\x2e\x37\x06\x4a\x63\x15\x6e\x28\x18\x1e\xb5\xdc\
-\x77\x56\xda\x03\x00\x84\x8f\x4f\x2a\x8e\x34\x41\x16\xff\x6e\x73\
-\x12\x20\x8d\xd5\x68\xc5\x89\xfe\x8a\x0d\x40\x60\xe4\x3e\x00\x75\
-\x8d\xbb\xfd\xfb\xc1\xab\x03\xa4\x31\x09\xfb\xd8\xd4\xbf\x62\x03\
-\x30\x82\x8f\x4c\x26\x8e\x34\x11\xee\xf6\xef\x17\xaf\x0e\x90\xc6\
-\x60\x04\x1f\x5e\xe9\x7b\x2b\xee\x01\x88\xb0\xa9\xa1\xbc\x05\xd8\
-\x34\x91\x54\xd2\xf8\x38\xf6\xef\x2f\xf7\x04\x48\xeb\xb7\x23\xa7\
-\x3a\x28\xc0\x70\xb9\x6f\xee\x63\x09\x80\x5d\xc0\x27\x26\x16\x4b\
-\x1a\x0f\x8b\x7f\xbf\xb9\x27\x40\x5a\xbf\x2b\x56\x2a\xfe\xb0\xcf\
-\x4d\x80\x10\x09\xad\xf9\xa5\x2a\x2d\xc3\xe2\x3f\x1b\x6c\x02\xa4\
-\x75\x08\xc4\x7d\x4e\xce\xf6\xd9\x00\xc0\xa8\x35\x63\x37\x69\x2f\
-\x16\xff\xd9\x62\x13\x20\xad\xd1\x08\xf6\x59\xc3\x57\xdc\x03\x00\
-\x10\x61\xeb\xe2\x3e\x80\x72\xac\xa9\xa4\x8d\xb9\x2d\x12\xcf\x71\
-\xc3\xdf\x4c\xda\x1e\x89\x67\x97\xd4\xcb\xde\xda\x34\x05\xff\xdd\
-\xab\xa5\xe6\x17\xd7\xff\x77\xae\xf4\x82\x7d\x4e\x00\x02\xdc\x81\
-\xcf\x05\x50\xbb\xb8\xdb\x7f\xb6\x79\x75\x80\xb4\x3a\x97\xef\xab\
-\xf8\xc3\x7e\x97\x00\x20\x10\x2f\x19\x5f\x1e\x69\x43\x1c\xfb\x0b\
-\x5c\x0e\x90\xf6\x6b\x35\xb5\x7b\xbf\x0d\xc0\x08\x6c\x00\xd4\x06\
-\x16\x7f\xed\xce\x26\x40\xda\x87\x86\xf0\xde\xfd\xbd\x66\x9f\x7b\
-\x00\x00\x22\xe4\x0d\xe5\x4d\xc0\x41\x63\x49\x25\xad\x9d\xc5\x5f\
-\x2b\xf1\x3e\x01\xd2\xdd\x7d\x3f\xa7\x3a\x3c\xc0\x68\x5f\x2f\x5a\
-\xc5\x12\x00\x0d\xc4\x0f\x8c\x2d\x96\xb4\x36\x16\x7f\xed\x8b\x93\
-\x00\xe9\xee\x2e\xdd\x5f\xf1\x87\x55\x34\x00\x00\x81\xe0\x32\x80\
-\x52\xb0\xf8\x6b\x35\x6c\x02\xa4\x3d\xad\xaa\x66\xef\x77\x09\x00\
-\x20\xb2\xf9\xd8\x86\xfa\x1b\x1b\xcb\x23\xad\x49\xeb\x8a\xff\x90\
-\xf2\xa4\x6c\xe1\x07\xcb\xe5\xb0\x76\x6a\xdd\x72\x80\xff\xcd\x28\
-\x81\x98\x53\x1c\x1b\xd8\xf9\xad\xfd\xbd\x70\x95\x13\x80\x9d\xd7\
-\x07\xf8\xfc\xc6\x73\x49\xab\x62\xf1\xd7\x7a\xb4\x6e\x12\x30\xa0\
-\xfa\xd4\x08\xce\x04\x6e\x49\x9d\x45\xb3\x21\xc0\x67\x56\x53\xfc\
-\x61\x95\x0d\x00\xc0\x88\x70\xe1\xfa\x23\x49\xab\x66\xf1\xd7\x46\
-\xd8\x04\x68\xa6\x8d\x08\x17\xac\xf6\xb5\xab\x6e\x00\x60\x64\x03\
-\xa0\x49\xb3\xf8\x6b\x1c\x6c\x02\x34\xb3\x22\xf1\x5d\xab\x7d\xed\
-\xaa\xf6\x00\x2c\x1c\x94\xac\xa1\xfc\x0e\x70\xc4\xba\x52\x49\xfb\
-\x66\xf1\xd7\xb8\xb9\x27\x40\xb3\xe6\xc6\x9c\xea\xc8\xd5\x5c\x01\
-\x00\x6b\x98\x00\x2c\x1e\xf0\xe2\x75\xc7\x92\x56\x66\xf1\xd7\x24\
-\x38\x09\xd0\xac\xb9\x60\xb5\xc5\x1f\xd6\xb4\x04\x00\x10\xde\xb1\
-\xd6\x34\xd2\x7e\xdc\x16\x89\x67\xb5\xac\xf8\x9f\x92\xc1\xfb\xb1\
-\xf8\xf7\xc1\xd6\x40\xb8\xa0\xa2\x38\x35\x75\x90\x25\x03\xaa\x4f\
-\x45\xe2\x93\xf1\x12\x41\x8d\x5d\xf6\xce\xb5\xbc\x7a\xd5\x4b\x00\
-\x00\x11\x36\x2f\xde\x15\x70\xeb\x9a\x32\x49\xcb\xf3\x93\xbf\xa6\
-\xc5\xe5\x00\xf5\xdd\x6d\x8b\x77\xff\xdb\xb5\xda\x37\xac\x69\x02\
-\xb0\xf0\x64\xa1\x78\xd1\xda\x73\x49\x77\x63\xf1\xd7\x34\xb9\x1c\
-\xa0\xbe\xbb\x70\x2d\xc5\x1f\xd6\xbc\x04\x00\x90\xbd\x6d\xed\xef\
-\x91\xf6\x60\xf1\x57\x0a\x36\x01\xea\xb1\xb0\xe6\xda\xbc\xa6\x25\
-\x00\x80\x08\xf7\x68\x28\x6f\x04\x36\xaf\xf5\xbd\x12\x16\x7f\xa5\
-\xe7\x72\x80\xfa\x66\xc7\xe2\xf8\xff\x8e\xb5\xbc\x69\xcd\x13\x80\
-\x00\xb7\xb3\x8a\xe7\x0c\x4b\xcb\xb0\xf8\xab\x0d\x9c\x04\xa8\x67\
-\xe2\x45\x6b\x2d\xfe\xb0\xae\x25\x00\x80\xec\x2d\xeb\x7b\x9f\x66\
-\x98\xc5\x5f\x6d\x62\x13\xa0\x1e\x59\x5f\x4d\x5e\xf3\x12\x00\xdc\
-\xb9\x0c\xf0\x5d\xbc\x1a\x40\xab\xb3\x23\x12\x9f\x58\x52\x5f\x96\
-\x3a\xc8\x92\xc5\x4b\xfd\x2e\x06\xee\x99\x3a\x8b\x92\xda\x1e\x89\
-\x67\x97\xd4\x57\xa4\x0e\xb2\x64\xf1\x89\x93\x97\xe0\xef\x57\xad\
-\xce\x6d\x39\xd5\x11\x0b\x9b\xf4\xd7\x66\x5d\x13\x80\x85\x65\x00\
-\xd6\x74\xbd\xa1\x66\x59\x78\x51\xcb\x8a\xff\x49\x19\xbc\x1b\x8b\
-\xbf\x60\x5b\x20\x5c\xd2\xa6\x49\xc0\x42\x33\x12\x9e\x0b\xc4\xd4\
-\x59\xd4\x09\x6f\x5f\x4f\xf1\x87\x75\x2f\x01\x00\x8c\xfe\x79\xfd\
-\xef\xd5\xac\x88\xf0\x97\x05\xc3\x37\xa7\xce\xb1\x64\xf1\x93\xff\
-\xfb\x70\xec\xaf\xbb\xb4\xee\x66\x41\x05\xc3\xb7\x47\xc2\x2b\x53\
-\xe7\x50\xfb\x45\xe2\xba\x7f\xbf\xae\x6b\x09\x60\xe1\xa4\x94\x8b\
-\xcf\x06\x38\x74\xbd\xc7\x50\xef\x7d\x3f\xa7\x3a\x2e\xb4\xe4\x8e\
-\x67\xae\xf9\x6b\x3f\x5a\x75\x75\x40\x84\x4d\x0d\xc5\x57\x20\x1c\
-\x9d\x3a\x8b\x5a\xeb\xa6\x9c\xea\xa8\x00\xf5\x7a\xde\xbc\xee\x09\
-\x40\x80\x0a\xf8\xb7\xf5\xbe\x5f\xfd\x17\x88\xff\xab\x45\xc5\xdf\
-\x4f\xfe\xda\x9f\xad\x81\x70\xc1\x90\xf2\x94\xd4\x41\x00\x02\xec\
-\x0a\x84\x3f\x4e\x9d\x43\xad\xf6\x2f\xeb\x2d\xfe\xb0\x81\x09\x00\
-\xdc\xb9\x59\xe5\xf2\x8d\x1c\x43\xbd\x35\x5a\xec\x4c\xbf\x97\x3a\
-\x88\x9f\xfc\xb5\x46\xad\x99\x04\x44\xd8\xda\x50\xde\x0c\x6c\x4a\
-\x9d\x45\xed\x33\x82\x1f\x1f\x50\x7d\x72\xbd\xef\xdf\xc0\x1e\x80\
-\x85\xcd\x2a\x11\xbe\xb4\x91\x63\xa8\xb7\x3e\x69\xf1\x57\x47\xb5\
-\xe6\x12\xc1\x85\x6b\xbb\x43\x6b\x2e\x9d\x55\x7b\x04\xf8\xc2\x46\
-\x8a\x3f\x6c\xb0\x01\x58\x38\x40\x7c\xdd\x46\x8f\xa1\xfe\x89\xf0\
-\x91\xd4\x19\x1c\xfb\x6b\x03\x5a\xb3\x1c\x10\x18\xd9\x00\x68\x39\
-\xaf\xdd\xe8\x01\xc6\xd0\x00\xd4\xaf\x67\x61\x3f\x80\x74\xa7\x8c\
-\xf8\x9d\x94\xe7\xf7\x52\x3f\x8d\xc1\xb6\x0c\x2e\x4d\x3d\x09\x88\
-\x84\x6f\xa7\x3c\xbf\x5a\xa9\xca\xa8\xde\xb8\xd1\x83\x6c\xb8\x01\
-\x58\x18\xf3\x86\xf7\x6c\xf4\x38\xea\x97\x48\xb8\x29\xd5\xb9\xfd\
-\xe4\xaf\x31\x4a\x3e\x09\x88\xc4\xef\xa6\x3a\xb7\xda\x2a\x5e\x18\
-\x60\xc3\xbf\x63\x37\xdc\x00\x2c\xda\xf0\x28\x42\xfd\x12\x12\xdd\
-\xc5\xcc\x3b\xfc\x69\x02\xb6\x65\xf0\x9e\x54\x4d\x40\x20\xf3\xc1\
-\x6b\xda\x4b\xfe\x4f\xe3\x38\xca\x58\x1a\x80\x9c\xe1\x05\x10\x1d\
-\x53\xe9\x4e\x23\xc2\x51\xd3\x3e\xa7\x63\x7f\x4d\x50\xb2\xe5\x80\
-\x40\x9c\xfa\xcf\x92\xda\x2c\x7e\x2b\x67\xfe\xdd\xe3\x38\xd2\x58\
-\x1a\x80\x00\x75\x24\x7b\xcd\x38\x8e\xa5\x7e\x08\x8c\x1e\x3c\xcd\
-\xf3\x39\xf6\xd7\x14\x24\x59\x0e\x18\xc1\x03\xa6\x79\x3e\xb5\x5b\
-\x80\xff\x1d\xa0\x19\xd3\xb1\xc6\x23\xb2\xf9\xe8\x86\xfa\x6b\x40\
-\x31\xae\x63\xaa\xd3\x6e\xcf\xa9\x0e\x0d\x30\x3f\xe9\x13\x79\xa9\
-\x9f\xa6\x6c\xfb\x08\xce\x1a\x50\x7d\x74\x1a\x27\xab\x28\xaf\x09\
-\x70\xff\x69\x9c\x4b\xad\x57\xe7\x14\xf7\x0d\xec\x1c\xcb\xc4\x7d\
-\x5c\x7b\x00\x08\xec\xfc\x16\xc4\x0b\xc7\x75\x3c\x75\xde\x3d\x1a\
-\xf2\x27\x4c\xfa\x24\x7e\xf2\x57\x02\x53\xdb\x13\x10\x99\x7b\xa0\
-\xc5\x5f\x77\x89\xef\x18\x57\xf1\x87\x31\x36\x00\x00\x11\xfe\x6e\
-\x9c\xc7\x53\xd7\x65\x2f\x8f\x63\x9c\x32\xed\xcd\x35\x7f\x25\x34\
-\x95\x26\xa0\x61\xf4\xbb\x93\x3c\xbe\xba\x65\xdc\x35\x76\xac\xbf\
-\x9c\x23\x64\x0d\xe5\x97\x81\xe3\xc7\x79\x5c\x75\x59\xf6\x94\x82\
-\xf9\xb1\x3f\x3a\xda\xdd\xfe\x6a\x89\x89\x2d\x07\x44\x06\x27\x34\
-\xc4\x2b\x81\x7c\xdc\xc7\x56\xf7\x44\xb8\xa6\xa0\x7a\x50\x18\xe3\
-\x63\xa2\xc7\x3a\x01\x08\x30\x0a\xf0\x97\xe3\x3c\xa6\xba\x6e\xf4\
-\x0f\x91\xcd\xc7\x8c\xf3\x88\x7e\xf2\x57\x8b\x4c\x64\x12\x10\x61\
-\x73\x43\x7c\x3d\x16\x7f\x2d\xca\xe0\xcf\xc7\x59\xfc\x61\x02\xe3\
-\xd9\x08\x5b\x1a\xca\xeb\x81\x43\xc6\x7d\x6c\x75\x53\x80\x4f\x65\
-\x54\x8f\x09\xb0\x63\xa3\xc7\x1a\x52\x9e\x9c\xc1\x7b\xb0\xf8\xab\
-\x5d\xc6\x36\x09\x88\x10\x1a\xca\x37\x01\xcf\x1e\x43\x2e\xf5\xc3\
-\x4d\x39\xd5\x7d\x02\xec\x1c\xe7\x41\xc7\x3a\x01\x00\x08\xb0\x23\
-\x12\xfe\x66\xdc\xc7\x55\x77\x45\x38\x69\x44\x79\x59\x64\xd3\x7d\
-\x36\x72\x9c\x9a\xc1\xb3\x16\x37\xfc\x59\xfc\xd5\x36\xdb\x32\xb8\
-\xb4\x66\xf0\xf4\x8d\x1c\x24\xc2\xa6\x86\xf2\x75\x58\xfc\xb5\x9b\
-\x40\xfc\xff\xc6\x5d\xfc\x17\x8e\x3b\x01\x11\x8e\x68\x28\xbf\x8e\
-\x8f\xb0\xd4\x1e\xc2\x77\x21\xbc\xb8\x60\xfe\x82\xb5\xbc\x2b\xc2\
-\xb6\x9a\xf2\x15\x01\x7e\x9d\x09\x6e\x2a\x94\xc6\x20\x46\xc2\x2b\
-\x0b\x86\x7f\xb8\xd6\x89\x57\x64\x70\xc2\x88\xf8\x86\x08\x8f\x98\
-\x54\x38\x75\xd2\xce\xc5\x4f\xff\x63\xbf\xbd\xfa\xd8\x27\x00\xb0\
-\xf4\x7c\x00\x36\xfc\xa0\x02\xf5\x4d\xbc\x17\x8c\xde\x59\x53\x7e\
-\xa4\xa2\x38\x3b\xc2\x60\x9f\xaf\x86\x23\x1a\x8a\x97\x36\x94\x5f\
-\x0d\xf0\x12\x2c\xfe\x6a\xbf\x10\x88\x2f\x6d\x28\xbe\xd2\x50\xfe\
-\x4a\x5c\xc5\x2d\xb1\x23\x73\x0f\xa8\x29\xff\xa9\x21\x5e\x69\xf1\
-\xd7\x32\x5e\x3f\x89\xe2\x0f\x13\xfc\x85\x1a\x19\x3c\xb8\x21\x5e\
-\x35\xc9\x73\xa8\xf3\xb6\x43\xbc\x24\x92\x5d\x95\x11\xbf\x1b\x09\
-\xb7\x05\x46\x87\x8f\x08\xf7\x0e\xf0\x18\x16\x7e\x19\x4e\xa4\x49\
-\x95\xa6\x64\x1e\xc2\x07\x02\xa3\x0f\x44\xc2\xb7\x23\xf1\xc6\x40\
-\x3e\x17\x18\x1d\x35\x5a\xb8\xbe\xff\x49\x01\x1e\x94\x3a\xa4\x5a\
-\x6b\x94\x93\x3d\x38\x30\x7f\xcd\x24\x0e\x3e\xd1\xe2\x5c\x33\xb8\
-\x00\xe2\xb9\x93\x3c\x87\x24\x49\xfd\x14\xdf\x5e\x50\xff\xcc\xa4\
-\x8e\x3e\xd1\x4f\x57\x91\xd1\x9f\x4d\xf2\xf8\x92\x24\xf5\x55\x84\
-\x3f\x9d\xe4\xf1\x27\x3e\x9e\xaf\x29\x3f\x0a\x9c\x3c\xe9\xf3\x48\
-\x92\xd4\x23\x1f\x2f\xa8\x26\x5a\x3b\xa7\xb0\xbe\x1a\xbc\x31\x90\
-\x24\x49\x6b\x12\x5e\x39\xf1\x33\x4c\xfa\x04\x11\x8a\x86\xf2\x2b\
-\xc0\x7d\x27\x7d\x2e\x49\x92\x7a\xe0\xda\x7c\xe1\xb6\xbf\x63\x79\
-\xec\xef\x4a\x26\x3e\x01\x08\x50\x07\xf8\x93\x49\x9f\x47\x92\xa4\
-\x9e\xf8\x93\x49\x17\x7f\x98\xd2\x25\x7a\x11\xca\x86\xf2\x6a\xe0\
-\xb8\x69\x9c\x4f\x92\xa4\x8e\xfa\x46\x4e\xf5\x80\x00\xc3\x49\x9f\
-\x68\x2a\xd7\x58\x07\xa8\x80\x3f\x9a\xc6\xb9\x24\x49\xea\xb0\x3f\
-\x9a\x46\xf1\x87\x29\xde\xa4\x27\x42\x5e\x53\x7e\xc1\x9b\x5e\x48\
-\x92\xb4\xac\xeb\x73\xaa\xfb\x4f\xab\x01\x98\xda\x5d\xd6\x02\x34\
-\x81\xf0\x87\xd3\x3a\x9f\x24\x49\x1d\x33\xb5\x4f\xff\x30\xe5\xdb\
-\xf4\x46\xc8\x46\x94\x57\x46\x38\x71\x9a\xe7\x95\x24\xa9\xe5\xbe\
-\x9e\x53\x3d\x70\x9a\x0d\xc0\x54\xef\xb3\x1e\x60\x14\x09\x2f\x9f\
-\xe6\x39\x25\x49\xea\x80\x3f\x98\x66\xf1\x87\x04\x0f\xea\x89\x10\
-\x46\x94\x9f\x8a\xf0\xf0\x69\x9f\x5b\x92\xa4\xb6\x89\xf0\xe5\x82\
-\xea\x47\x03\xd4\xd3\x3c\xef\xd4\x9f\xb4\x16\x20\x46\xb2\x3f\x98\
-\xf6\x79\x25\x49\x6a\xa3\x40\x78\xe9\xb4\x8b\xff\xc2\x79\x13\xf1\
-\x19\x01\x92\x24\xf1\x89\x9c\xea\xe4\x00\x71\xda\x27\x4e\xf6\xac\
-\xf5\x48\x7c\x59\xaa\x73\x4b\x92\xd4\x06\x91\xf8\x3b\x29\x8a\x3f\
-\x24\x6c\x00\x4a\xea\xf7\x42\xb8\x38\xd5\xf9\x25\x49\x4a\x2b\xbc\
-\xab\xa4\x7e\x5f\xb2\xb3\xa7\x3a\x31\x40\x64\xf0\xe0\x86\xf8\x39\
-\xa0\x4c\x99\x43\x92\xa4\x29\xab\x72\xb2\x1f\x0b\xcc\x7f\x39\x55\
-\x80\x64\x13\x00\x80\xc0\xf0\x4b\xc0\xdf\xa5\xcc\x20\x49\xd2\xb4\
-\x45\xf8\xab\x94\xc5\x1f\x12\x4f\x00\x00\x22\x1c\xd4\x50\x5e\x03\
-\x1c\x9a\x3a\x8b\x24\x49\x53\x70\xd3\xe2\x03\x7f\x6e\x4d\x19\x22\
-\xe9\x04\x00\x20\xc0\x2d\x01\x5e\x91\x3a\x87\x24\x49\xd3\x10\xe0\
-\xbf\xa5\x2e\xfe\x8b\x39\xd2\x8b\x90\x8f\x28\x3f\x13\xe1\xc7\x52\
-\x67\x91\x24\x69\x52\x02\x7c\x2e\xa3\x3a\x29\x40\x93\x3a\x4b\xf2\
-\x09\x00\x2c\x3c\x28\x68\x44\x7c\x49\xea\x1c\x92\x24\x4d\xd2\x88\
-\xf8\x5f\xdb\x50\xfc\xa1\x25\x0d\x00\x40\x49\xfd\x7e\x88\xef\x4c\
-\x9d\x43\x92\xa4\xc9\x88\x6f\x2b\xa9\x2f\x4d\x9d\x62\x49\x2b\x96\
-\x00\x96\x44\xe6\xee\xd7\x30\xba\x0a\x98\x4b\x9d\x45\x92\xa4\x31\
-\x9a\xcf\xc9\x7e\x34\x30\x7f\x6d\xea\x20\x4b\x5a\x33\x01\x00\x08\
-\xcc\x5f\x17\x09\xaf\x4e\x9d\x43\x92\xa4\x71\x8a\x84\x3f\x6b\x53\
-\xf1\x87\x96\x4d\x00\x00\x22\x6c\x6b\x18\x7c\x19\xe2\xbd\x52\x67\
-\x91\x24\x69\xe3\xe2\x77\x72\xea\x07\x06\xb8\x3d\x75\x92\xdd\xb5\
-\x6a\x02\x00\x10\x60\x3b\xf0\xeb\xa9\x73\x48\x92\x34\x1e\xd9\x7f\
-\x6a\x5b\xf1\x87\x16\x4e\x00\x96\xd4\x14\x6f\x87\xf0\xd3\xa9\x73\
-\x48\x92\xb4\x7e\xf1\x6d\x05\xf5\xd3\x53\xa7\x58\x4e\x6b\x1b\x80\
-\xc8\x96\xa3\x1a\xaa\xab\x80\x03\x53\x67\x91\x24\x69\x1d\x7e\x98\
-\x53\x9c\x18\xd8\xf9\xed\xd4\x41\x96\xd3\xba\x25\x80\x25\x81\x1d\
-\xdf\x09\xf0\xbb\xa9\x73\x48\x92\xb4\x4e\xff\xb5\xad\xc5\x1f\x5a\
-\x3c\x01\x00\x88\x90\x35\x94\x1f\x00\x1e\x9d\x3a\x8b\x24\x49\x6b\
-\xf0\xc1\x9c\xea\xf1\x01\x62\xea\x20\x2b\x69\x75\x03\x00\x10\x99\
-\x7b\x40\xc3\xe8\x73\xc0\xa6\xd4\x59\x24\x49\x5a\x85\xf9\x9c\xf0\
-\xb0\xc0\xf0\xea\xd4\x41\xf6\xa5\xb5\x4b\x00\x4b\x02\xf3\xd7\x04\
-\xe2\x1f\xa7\xce\x21\x49\xd2\x6a\x04\xe2\xcb\xdb\x5e\xfc\xa1\x03\
-\x13\x00\x80\x08\xc5\x88\xf2\xe3\x11\x1e\x9e\x3a\x8b\x24\x49\x2b\
-\x09\x70\x65\x46\xf5\xc8\x00\x55\xea\x2c\xfb\xd3\xfa\x09\x00\x40\
-\x80\xba\x81\x5f\xa6\x25\x0f\x50\x90\x24\x69\x19\x4d\x03\xbf\xd8\
-\x85\xe2\x0f\x1d\x69\x00\x00\x06\x54\x9f\x88\xf0\x57\xa9\x73\x48\
-\x92\xb4\x9c\x48\xf8\xf3\x01\xd5\xa7\x52\xe7\x58\xad\x4e\x2c\x01\
-\x2c\x89\xb0\xa5\xa6\xfc\x54\x80\x07\xa5\xce\x22\x49\xd2\x92\x08\
-\x5f\x2c\x16\x46\xff\x3b\x53\x67\x59\xad\xce\x4c\x00\x00\x02\xec\
-\x88\xf0\x1c\x60\x98\x3a\x8b\x24\x49\x8b\xe6\x23\x3c\xa7\x4b\xc5\
-\x1f\x3a\xd6\x00\x00\x0c\xa8\x3e\x1d\x88\x2f\x4b\x9d\x43\x92\x24\
-\x80\x00\xbf\x33\xa0\xfa\x6c\xea\x1c\x6b\xd5\xa9\x25\x80\x25\x8b\
-\x37\x08\xba\x04\x78\x42\xea\x2c\x92\xa4\x99\x76\x49\x4e\x75\x56\
-\x9b\x6f\xf8\xb3\x92\x4e\x36\x00\x00\x91\xcd\xf7\x6e\xa8\x3f\x07\
-\x1c\x92\x3a\x8b\x24\x69\x26\xdd\x9c\x53\x3e\x34\xb0\xe3\x3b\xa9\
-\x83\xac\x47\xe7\x96\x00\x96\x2c\xdc\x5f\x39\xfc\x52\xea\x1c\x92\
-\xa4\x59\x15\x5e\xd4\xd5\xe2\x0f\x1d\x6e\x00\x00\x0a\x86\x6f\x07\
-\x5e\x9b\x3a\x87\x24\x69\xe6\xfc\x5d\xc1\xf0\x1d\xa9\x43\x6c\x44\
-\x67\x97\x00\x96\x44\xd8\x5a\x53\x7e\x3a\xc0\x03\x52\x67\x91\x24\
-\xcd\x84\x6b\x73\xaa\x87\x07\xb8\x3d\x75\x90\x8d\xe8\xf4\x04\x00\
-\x20\xc0\x1d\x11\x7e\x8e\x8e\xdc\x79\x49\x92\xd4\x69\xd5\x68\xe1\
-\x92\xbf\x4e\x17\x7f\xe8\x41\x03\x00\x30\xa0\xfa\x54\x20\xfe\xf7\
-\xd4\x39\x24\x49\xfd\x16\x88\xbf\x37\xa0\xfa\x78\xea\x1c\xe3\xd0\
-\xf9\x25\x80\x25\x11\xf2\x86\xc1\xbb\x21\x3e\x31\x75\x16\x49\x52\
-\x1f\x85\x77\xe5\x0c\x7f\x2a\xc0\x28\x75\x92\x71\xe8\x4d\x03\x00\
-\x10\xe1\xe0\x86\xf2\x13\xc0\x71\xa9\xb3\x48\x92\x7a\xe5\xeb\xf9\
-\xc2\xad\x7e\xbf\x9f\x3a\xc8\xb8\xf4\x62\x09\x60\x49\x80\x1f\x8c\
-\xe0\x67\x80\x1d\xa9\xb3\x48\x92\x7a\x63\xe7\x08\x9e\xd6\xa7\xe2\
-\x0f\x3d\x6b\x00\x00\x06\x54\x9f\x83\xf0\xcb\xa9\x73\x48\x92\x7a\
-\xe3\x57\x06\x54\x9f\x4e\x1d\x62\xdc\x7a\xd7\x00\x00\x14\x0c\xdf\
-\x08\xfc\x5d\xea\x1c\x92\xa4\x6e\x8b\xf0\xaa\x82\xea\xf5\xa9\x73\
-\x4c\x42\xaf\xf6\x00\xec\x2e\x42\xd9\x50\xbe\x1f\x38\x3d\x75\x16\
-\x49\x52\x27\x5d\x91\x53\x3d\x2e\xf4\xf4\x09\xb4\xbd\x6d\x00\x00\
-\x22\x1c\xd9\x30\xf8\x14\xc4\x23\x53\x67\x91\x24\x75\x49\xf8\x6e\
-\x4e\x71\x52\x97\x6f\xf5\xbb\x3f\xbd\x5c\x02\x58\x12\xe0\x86\xc8\
-\xe8\x19\x78\x93\x20\x49\xd2\xea\x55\x91\xd1\x33\xfb\x5c\xfc\xa1\
-\xe7\x0d\x00\x40\x49\x7d\x59\x20\xfe\x4e\xea\x1c\x92\xa4\x6e\x08\
-\xf0\x1b\x25\xf5\x87\x53\xe7\x98\xb4\x5e\x2f\x01\x2c\x89\x10\x1a\
-\xca\x37\x03\xcf\x4a\x9d\x45\x92\xd4\x6a\x6f\x28\xa8\x9e\x97\x3a\
-\xc4\x34\xcc\x44\x03\x00\x10\x61\x73\x43\x79\x29\x70\x5a\xea\x2c\
-\x92\xa4\x56\xfa\x48\x4e\x75\x66\x80\x5d\xa9\x83\x4c\xc3\xcc\x34\
-\x00\x00\x11\x0e\xad\x29\x2f\x0f\x70\xff\xd4\x59\x24\x49\xad\x72\
-\x5d\x4e\x75\x6a\x80\x9b\x52\x07\x99\x96\xde\xef\x01\xd8\x5d\x80\
-\x9b\x0b\xb2\x73\x98\xa1\x7f\xc1\x92\xa4\xfd\xfa\x7e\x4e\xf6\xa4\
-\x59\x2a\xfe\x30\x63\x0d\x00\x40\x60\xfe\xba\x48\x7c\x1a\x30\x9f\
-\x3a\x8b\x24\x29\xb9\x5d\x91\xf8\x53\x81\xf9\x6b\x52\x07\x99\xb6\
-\x99\x6b\x00\x00\x16\x76\x77\x86\xe7\x03\x31\x75\x16\x49\x52\x32\
-\x11\xc2\x0b\x4b\xea\xcb\x53\x07\x49\x61\x26\x1b\x00\x80\x82\xe1\
-\xbf\x06\xe2\xcb\x52\xe7\x90\x24\xa5\x11\x88\x2f\x2d\x18\xfe\x73\
-\xea\x1c\xa9\xcc\xd4\x26\xc0\xe5\xd4\x94\x7f\x0b\xfc\x87\xd4\x39\
-\x24\x49\x53\xf5\x8f\x05\xd5\x2f\xa5\x0e\x91\xd2\xcc\x37\x00\x0b\
-\xcf\x0c\x18\x5c\x08\xf1\x89\xa9\xb3\x48\x92\xa6\x21\x5c\x9c\x33\
-\x3c\x2f\x40\x9d\x3a\x49\x4a\x33\xdf\x00\x00\x44\x38\x60\x44\xf9\
-\xe1\x08\x0f\x4d\x9d\x45\x92\x34\x39\x01\xbe\x90\x51\x9d\x1e\xe0\
-\x87\xa9\xb3\xa4\x36\xb3\x7b\x00\x76\x17\xe0\xb6\x8c\xe2\xc9\xc0\
-\x57\x53\x67\x91\x24\x4d\xcc\xb5\x19\xe5\x59\x16\xff\x05\x4e\x00\
-\x76\x13\xd9\x7c\x6c\x43\xfd\x21\xe0\x3e\xa9\xb3\x48\x92\xc6\x29\
-\x7e\x2b\xa7\x78\x74\x60\xd7\xd7\x53\x27\x69\x0b\x1b\x80\xbd\x44\
-\xe6\xee\xdf\x10\x3f\x04\xf1\x5e\xa9\xb3\x48\x92\xc6\xe2\xc6\x9c\
-\xf0\xd8\xc0\xf0\xea\xd4\x41\xda\xc4\x25\x80\xbd\x04\xe6\xbf\xd2\
-\xc0\x13\x81\x1f\xa4\xce\x22\x49\xda\xb0\x5b\x47\x70\xb6\xc5\xff\
-\xee\x6c\x00\x96\x31\xc7\xf0\xf3\x23\x38\x07\xb8\x2d\x75\x16\x49\
-\xd2\xba\x6d\x1f\xc1\x13\x07\x54\x9f\x49\x1d\xa4\x8d\x6c\x00\x56\
-\x30\xa0\xfa\x78\x24\x9e\x0d\xdc\x91\x3a\x8b\x24\x69\xcd\x76\x44\
-\xe2\x79\x03\xaa\x4f\xa4\x0e\xd2\x56\x36\x00\xfb\x50\x52\x5f\x1e\
-\x89\x4f\x65\x46\x1e\x0d\x29\x49\x3d\x31\x84\xd1\xd3\xcb\x85\x4d\
-\xdd\x5a\x81\x0d\xc0\x7e\x94\xd4\x97\x40\xf8\x59\x66\xfc\x86\x11\
-\x92\xd4\x11\x0d\x84\x9f\x2f\x68\x2e\x4a\x1d\xa4\xed\x6c\x00\x56\
-\xa1\x60\xf8\x0e\x08\xbf\x00\x8c\x52\x67\x91\x24\xad\xa8\x81\xf0\
-\xdc\x82\xe1\x5b\x53\x07\xe9\x02\x1b\x80\x55\x2a\x18\xbe\x09\xc2\
-\x73\x80\x2a\x75\x16\x49\xd2\xdd\x34\xc0\x2f\x16\x0c\xdf\x9c\x3a\
-\x48\x57\x78\x1f\x80\x35\xaa\xc9\xcf\x85\xec\xad\xc0\xa6\xd4\x59\
-\x24\x49\x00\x0c\x21\x3c\xbb\x60\xf8\xef\xa9\x83\x74\x89\x0d\xc0\
-\x3a\x54\x14\x8f\x0f\x84\x77\x02\xf7\x48\x9d\x45\x92\x66\xdc\x8e\
-\x48\x7c\x6a\x49\xfd\xde\xd4\x41\xba\xc6\x06\x60\x9d\x2a\x8a\x47\
-\x07\xc2\x85\xc0\xb6\xd4\x59\x24\x69\x46\xdd\x1e\x89\x4f\x29\xa9\
-\xdf\x9f\x3a\x48\x17\xd9\x00\x6c\xc0\x90\xf2\xa4\x0c\xde\x03\x1c\
-\x92\x3a\x8b\x24\xcd\x98\x5b\x46\x70\xce\x80\xea\x63\xa9\x83\x74\
-\x95\x0d\xc0\x06\x45\x06\x27\x34\x8c\x2e\x81\x70\x54\xea\x2c\x92\
-\x34\x23\xbe\xd7\x10\x9e\x38\xc7\xf0\xca\xd4\x41\xba\xcc\x06\x60\
-\x0c\x22\x73\x0f\x6c\x68\x2e\x85\x70\x74\xea\x2c\x92\xd4\x73\xd7\
-\xe7\x64\x67\x04\xe6\xbf\x92\x3a\x48\xd7\x79\x19\xe0\x18\x04\xe6\
-\xbf\x9c\x53\x9c\x0e\x5c\x9b\x3a\x8b\x24\xf5\xd8\xd7\x72\xf2\xc7\
-\x5b\xfc\xc7\xc3\x06\x60\x4c\x02\xbb\xbe\x91\x53\x3c\x2e\xc0\xe7\
-\x53\x67\x91\xa4\xbe\x09\xf0\xd9\x9c\xea\x51\x81\x5d\x5f\x4d\x9d\
-\xa5\x2f\x6c\x00\xc6\x28\xb0\xf3\xdb\x19\xd5\x69\x10\xde\x9d\x3a\
-\x8b\x24\xf5\xc8\x25\x19\xd5\x63\x03\xdc\x90\x3a\x48\x9f\xd8\x00\
-\x8c\x59\x80\xdb\x73\x86\x4f\x01\xfe\x2e\x75\x16\x49\xea\x81\xd7\
-\xe4\x54\x4f\x0e\xb0\x3d\x75\x90\xbe\xb1\x01\x98\x80\x00\x75\x41\
-\xf5\x2b\x01\x5e\x82\xcf\x0f\x90\xa4\xf5\x88\x91\xf0\x8a\x82\xea\
-\x45\xc1\x5b\xb0\x4f\x84\x57\x01\x4c\x58\xcd\xe0\xe9\x10\xcf\x07\
-\x36\xa7\xce\x22\x49\x1d\x31\x0f\xe1\x05\xde\xd7\x7f\xb2\x6c\x00\
-\xa6\xa0\xa2\x38\x35\x10\xde\x01\x1c\x96\x3a\x8b\x24\xb5\xdc\x0f\
-\x22\xf1\xa7\x4b\xea\x0f\xa7\x0e\xd2\x77\x36\x00\x53\x12\x99\xbb\
-\x5f\xcd\xe8\xdd\x01\x1e\x90\x3a\x8b\x24\xb5\xd4\x75\x39\xd9\x93\
-\x03\xf3\x5f\x4e\x1d\x64\x16\xd8\x00\x4c\x51\x84\x43\x1a\xca\xb7\
-\x03\x8f\x4e\x9d\x45\x92\x5a\xe6\x8a\x9c\xea\x29\x01\x6e\x4a\x1d\
-\x64\x56\xb8\x09\x70\x8a\x02\x7c\x3f\xa7\x3a\x0b\xf8\x97\xd4\x59\
-\x24\xa9\x45\xde\x98\x53\x3d\xc1\xe2\x3f\x5d\x36\x00\x53\x16\x60\
-\x67\x41\xf5\xec\x00\xbf\x8c\x3b\x5b\x25\xcd\xb6\x3a\x10\x5f\x5a\
-\x50\x3d\x37\xc0\xae\xd4\x61\x66\x8d\x4b\x00\x09\x2d\x3c\x52\x38\
-\xfb\x57\x88\x47\xa6\xce\x22\x49\x53\x76\x53\x24\x3e\xab\xa4\xfe\
-\x3f\xa9\x83\xcc\x2a\x1b\x80\xc4\x22\x5b\x8e\x6a\xa8\xfe\x0d\x38\
-\x35\x75\x16\x49\x9a\x92\xcb\x72\xaa\x67\x78\x67\xbf\xb4\x5c\x02\
-\x48\x2c\xb0\xe3\x3b\x39\xd5\x63\x22\xe1\x95\xa9\xb3\x48\xd2\x14\
-\xfc\xc3\xe2\x7a\xbf\xc5\x3f\x31\x27\x00\x2d\x52\x33\x78\x0e\xc4\
-\x7f\x00\xb6\xa4\xce\x22\x49\x63\xb6\x0b\xf8\xd5\x82\xea\x9f\x52\
-\x07\xd1\x02\x1b\x80\x96\x19\x52\x3e\x2c\x83\xb7\x01\xc7\xa5\xce\
-\x22\x49\x63\x72\xfd\x08\x9e\x36\xa0\xfa\x64\xea\x20\xba\x8b\x0d\
-\x40\x0b\x45\x38\xb8\x61\xf0\xcf\x10\xcf\x4a\x9d\x45\x92\x36\x26\
-\x5c\x94\x33\x7c\x4e\x80\x5b\x52\x27\xd1\x9e\xdc\x03\xd0\x42\x01\
-\x7e\x90\x33\x7c\x72\x20\xfe\x1e\x5e\x2a\x28\xa9\x9b\x86\x81\xf8\
-\xdb\x39\xc3\x73\x2d\xfe\xed\xe4\x04\xa0\xe5\x86\x94\x8f\x0c\xf0\
-\x26\x6f\x21\x2c\xa9\x2b\x22\x5c\x1d\xe1\x39\x03\xaa\x4f\xa7\xce\
-\xa2\x95\x39\x01\x68\xb9\x01\xd5\x27\x0b\xaa\x87\x45\x78\x75\xea\
-\x2c\x92\xb4\x0a\x6f\x28\xa8\x1e\x69\xf1\x6f\x3f\x27\x00\x1d\x52\
-\x33\x78\x2a\xc4\xff\x0d\x1c\x92\x3a\x8b\x24\xed\xe5\x66\x08\x2f\
-\x2a\x18\xbe\x23\x75\x10\xad\x8e\x0d\x40\xc7\x44\x38\xa2\x61\xf0\
-\x3a\x88\x67\xa7\xce\x22\x49\x8b\xde\x97\x53\x3c\x3f\xb0\xf3\xdb\
-\xa9\x83\x68\xf5\x5c\x02\xe8\x98\x00\xdf\xcb\x19\x3e\x29\xc0\x4b\
-\x80\xf9\xd4\x79\x24\xcd\xb4\x2a\x12\x5e\x91\x53\x3d\xd1\xe2\xdf\
-\x3d\x4e\x00\x3a\x6c\x9e\xc1\x8f\x16\xc4\x7f\x8e\xf0\x63\xa9\xb3\
-\x48\x9a\x2d\x11\xbe\xb4\xb8\xd1\xef\x33\xa9\xb3\x68\x7d\x9c\x00\
-\x74\xd8\x1c\xc3\x2f\x64\x54\xa7\x44\xf8\x0b\xa0\x49\x9d\x47\xd2\
-\x4c\x68\x22\xfc\x59\x41\x75\x92\xc5\xbf\xdb\x9c\x00\xf4\xc4\x90\
-\xf2\x61\x39\xfc\x63\x84\x93\x52\x67\x91\xd4\x4f\x01\xae\x6c\xe0\
-\x97\x06\x54\x1f\x4f\x9d\x45\x1b\xe7\x04\xa0\x27\x06\x54\x9f\xcd\
-\xa8\x4e\x09\xc4\x97\xe2\x73\xb5\x25\x8d\xd7\xae\x48\x78\x45\x46\
-\xf5\xe3\x16\xff\xfe\x70\x02\xd0\x43\x91\xb9\xe3\x1b\x46\x7f\x0f\
-\x3c\x21\x75\x16\x49\x9d\xf7\x91\x9c\xf0\x4b\x81\xe1\xd5\xa9\x83\
-\x68\xbc\x9c\x00\xf4\x50\x60\xfe\xda\x9c\xea\x0c\xe0\xf9\xc0\x0f\
-\x52\xe7\x91\xd4\x49\x3f\x0c\xf0\x92\x9c\xea\xb1\x16\xff\x7e\x72\
-\x02\xd0\x73\x11\x8e\x6c\x28\xfe\x0a\xc2\xd3\x52\x67\x91\xd4\x15\
-\xe1\xc2\x9c\xfc\x57\x02\x3b\xbf\x95\x3a\x89\x26\xc7\x06\x60\x46\
-\xd4\x0c\x9e\x01\xbc\x1a\xe2\xbd\x52\x67\x91\xd4\x56\xf1\x3b\x90\
-\xfd\x5a\xc1\xf0\xdf\x53\x27\xd1\xe4\xd9\x00\xcc\x90\x08\x5b\x6b\
-\x06\xbf\x19\x88\xbf\x03\x0c\x52\xe7\x91\xd4\x1a\x55\x84\xbf\x2d\
-\xa8\x7e\x3f\xc0\xf6\xd4\x61\x34\x1d\x36\x00\x33\x28\x32\xf7\xc0\
-\x86\xf8\x2a\x88\x67\xa5\xce\x22\x29\xb5\x70\x61\x4e\x78\x49\x60\
-\xfe\xba\xd4\x49\x34\x5d\x36\x00\x33\xac\x66\xee\x3c\x18\xbd\x1a\
-\xb8\x6f\xea\x2c\x92\xa6\x2b\xc2\x97\x20\xfe\x46\x49\x7d\x71\xea\
-\x2c\x4a\xc3\x06\x60\xc6\x45\xd8\x32\xa2\xf8\xb5\x48\xf8\x5d\x60\
-\x5b\xea\x3c\x92\x26\xee\x07\x01\xfe\x7b\x46\xf5\xd7\xc1\x3b\x88\
-\xce\x34\x1b\x00\x01\x10\xe1\xd0\x9a\xf2\xf7\x03\xfc\x47\x20\x4f\
-\x9d\x47\xd2\xd8\x55\xc0\x3f\xe5\x54\xbf\x17\xe0\xe6\xd4\x61\x94\
-\x9e\x0d\x80\xf6\x10\x19\x3c\xb8\x81\xff\x05\xf1\xc9\xa9\xb3\x48\
-\x1a\x9b\x4b\x1b\xc2\x4b\xe6\x18\x5e\x95\x3a\x88\xda\xc3\x06\x40\
-\xcb\xaa\x28\xce\xca\x08\x7f\xec\xb3\x05\xa4\x4e\xfb\x44\x24\xfe\
-\x6e\x49\x7d\x69\xea\x20\x6a\x1f\x1b\x00\xad\x28\x42\x68\x98\x3b\
-\x37\x30\xfa\xa3\x08\x0f\x49\x9d\x47\xd2\xea\x44\xb8\x3a\x10\x5e\
-\x96\x33\xfc\xb7\x00\x31\x75\x1e\xb5\x93\x0d\x80\xf6\x2b\x42\xd1\
-\x50\x3e\x1f\xf8\x03\xe0\x98\xd4\x79\x24\xad\xe8\x1b\xc0\xcb\x73\
-\xaa\x37\xb8\xc1\x4f\xfb\x63\x03\xa0\x55\x8b\x30\x68\x28\x7f\x96\
-\x85\x46\xe0\xb8\xd4\x79\x24\xdd\xe9\xfa\x00\x7f\x9e\x51\xfd\x7d\
-\xf0\x69\xa0\x5a\x25\x1b\x00\xad\xd9\x6e\x8d\xc0\xcb\x80\xfb\xa5\
-\xce\x23\xcd\x30\x0b\xbf\xd6\xcd\x06\x40\xeb\x16\x61\x30\xa2\x7c\
-\x41\x84\x97\xe2\xcd\x84\xa4\x69\xba\x0e\xf8\x93\x9c\xea\xf5\x61\
-\xe1\xf2\x3e\x69\xcd\x6c\x00\xb4\x61\x11\xb2\x86\xb9\x27\xc3\xe8\
-\x65\xc0\x23\x53\xe7\x91\xfa\x2a\xc0\xa7\x23\xbc\x2a\xa7\xfa\xe7\
-\x00\x75\xea\x3c\xea\x36\x1b\x00\x8d\x55\x45\x71\x7a\x20\xfb\x6d\
-\x88\xe7\xa6\xce\x22\xf5\xc4\x08\xc2\xbb\x23\xa3\x57\x79\x39\x9f\
-\xc6\xc9\x06\x40\x13\x51\x51\x9c\x16\xe0\x3f\x43\x78\x2a\xde\x59\
-\x50\x5a\x8f\x9d\xc0\xf9\x39\xd9\x9f\x07\xe6\xaf\x49\x1d\x46\xfd\
-\x63\x03\xa0\x89\x8a\x6c\x39\xaa\xa6\x7e\x71\x20\xfe\x1a\x70\x70\
-\xea\x3c\x52\x07\xdc\x1c\x09\xaf\x29\x28\x5e\x1d\xd8\xf1\x9d\xd4\
-\x61\xd4\x5f\x36\x00\x9a\x8a\x08\x07\x2c\x6e\x18\xfc\x35\xe0\xf8\
-\xd4\x79\xa4\xb6\x89\xf0\x95\x0c\xfe\x22\x5b\xd8\xd8\xb7\x23\x75\
-\x1e\xf5\x9f\x0d\x80\xa6\x2a\x42\x56\x53\x3c\x21\x10\x5e\x0c\xfc\
-\x34\x50\xa6\xce\x24\x25\x34\x02\xde\x0f\xe1\x1f\x72\x86\xff\xee\
-\xcd\x7b\x34\x4d\x36\x00\x4a\x26\xc2\x91\x23\x8a\xe7\x45\xc2\xaf\
-\x02\xc7\xa6\xce\x23\x4d\x4f\xb8\x21\xc2\xf9\x05\xf9\xdf\x04\x76\
-\x5e\x9f\x3a\x8d\x66\x93\x0d\x80\x92\x5b\xb8\xd5\xf0\xe0\x5c\x18\
-\xbd\x00\xc2\x93\x80\x22\x75\x26\x69\x02\x2a\x88\xef\x86\xfc\xb5\
-\x39\xf3\xef\xf6\x32\x3e\xa5\x66\x03\xa0\x56\x89\x70\xf0\x88\xf2\
-\xe9\xc0\xaf\x46\x78\x68\xea\x3c\xd2\x46\x45\xb8\x3a\x23\xbe\x2e\
-\xa3\x7e\x5d\x80\xef\xa5\xce\x23\x2d\xb1\x01\x50\x6b\x0d\x29\x4f\
-\xc9\xe0\xb9\xc0\x33\x81\x43\x53\xe7\x91\xd6\xe0\x26\xe0\x2d\x23\
-\x38\x7f\x40\xf5\xf1\xd4\x61\xa4\xe5\xd8\x00\xa8\xf5\x22\xe4\x35\
-\xc5\xe3\x03\xe1\x79\x2c\x6c\x1c\x3c\x20\x75\x26\x69\x19\x3b\x81\
-\x0b\x21\x7b\x43\xce\xfc\xc5\xde\xa2\x57\x6d\x67\x03\xa0\x4e\x89\
-\xb0\xb5\x61\xf0\x14\x18\x3d\x13\xc2\x59\xc0\xa6\xd4\x99\x34\xd3\
-\x76\x42\xbc\x18\xb2\xb7\xe4\x0c\xdf\xe9\xe5\x7b\xea\x12\x1b\x00\
-\x75\x56\x84\xcd\x0d\x73\x67\xc0\xe8\x19\x38\x19\xd0\xf4\xec\x84\
-\xf0\x3e\x88\x6f\xcd\xa9\xde\x1e\xe0\xb6\xd4\x81\xa4\xf5\xb0\x01\
-\x50\x2f\x2c\x34\x03\x83\xb3\x21\x3e\x05\x78\x12\x70\x58\xea\x4c\
-\xea\x95\x1b\x81\x77\x41\x78\x47\xce\xf0\xbd\x61\x61\xdc\x2f\x75\
-\x9a\x0d\x80\x7a\x27\x42\x56\x51\x3e\x3c\x10\xce\xcb\x88\xe7\x46\
-\x78\x04\xfe\xb7\xae\x35\x8a\xf0\x45\x08\x17\xc0\xe8\xd2\x82\xfa\
-\x03\x5e\xb6\xa7\xbe\xf1\x97\xa2\x7a\x2f\xb2\xf9\xd8\x11\xf5\xd9\
-\x91\x78\x26\x84\x9f\x04\x0e\x4a\x9d\x49\xad\xf4\x03\xe0\x7d\xc0\
-\x25\x39\xc5\x45\x81\x9d\xdf\x4a\x1d\x48\x9a\x24\x1b\x00\xcd\x94\
-\x08\x79\x45\xf9\xc8\x9c\x78\x66\x24\x9c\x09\x9c\x8a\xb7\x23\x9e\
-\x55\x43\xe0\x8a\x40\xbc\xa4\x21\xbc\xb7\xa4\xfa\xb4\xb7\xe2\xd5\
-\x2c\xb1\x01\xd0\x4c\x8b\xb0\xa5\xa6\x78\x44\x06\x8f\x8a\x84\x33\
-\x80\x47\x01\x9b\x53\xe7\xd2\x44\x54\x01\xae\x1c\x11\x2e\x0d\x84\
-\xcb\x72\xe6\x3f\x18\x60\x7b\xea\x50\x52\x2a\x36\x00\xd2\x6e\x22\
-\xcc\xd5\x14\x3f\x91\xc1\xa3\x23\x9c\x02\xe1\x64\xe0\xf0\xd4\xb9\
-\xb4\x2e\xdf\x83\xf8\xb1\x00\x57\x8c\xe0\x23\x05\xf5\xc7\xc3\xc2\
-\xa7\x7e\x49\xd8\x00\x48\xfb\x15\xd9\x74\x5c\xc3\xe8\x54\x88\x27\
-\x03\x27\x03\x0f\xc1\xfb\x0f\xb4\xcd\x4e\xe0\xca\x08\x1f\x0b\x84\
-\x8f\xe5\x64\x57\x04\x76\x7d\x2d\x75\x28\xa9\xcd\x6c\x00\xa4\x35\
-\x8a\x90\x0f\x19\x3c\x28\x87\x13\x22\x9c\x18\xe0\xa4\xc5\xe6\xc0\
-\x4b\x0f\xa7\x63\x3b\xf0\xf9\x08\x9f\x0a\xf0\xa9\x11\x5c\x55\x52\
-\x7d\x21\xc0\x7c\xea\x60\x52\x97\xd8\x00\x48\x63\x12\xe1\xa0\x9a\
-\xe2\xc4\x8c\x70\xc2\x68\xa1\x31\x38\x81\x85\x07\x1a\xd9\x18\xac\
-\xcf\xf6\x00\x5f\x89\xf0\xc5\x40\xbc\x2a\x92\x7f\x31\x27\x5c\x05\
-\xbb\xbe\x16\x20\xa6\x0e\x27\x75\x9d\x0d\x80\x34\x61\x91\x2d\x47\
-\xd5\x0c\x8f\x0f\x84\xe3\x23\xe1\x7e\x81\x78\x7c\x80\xe3\x23\x1c\
-\x07\x1c\x98\x3a\x5f\x62\xb7\x06\xb8\x2e\xc2\xb5\x91\x70\x5d\x20\
-\x5e\x1b\x89\xd7\x16\xd4\xd7\x06\xb8\x21\x75\x38\xa9\xcf\x6c\x00\
-\xa4\x84\x22\x6c\x1b\x32\x38\x26\xa7\xb9\x4f\x20\x3b\x7a\x44\x38\
-\x26\x10\x8f\x85\x70\xaf\x40\x3c\x32\x12\x0e\x83\x78\x18\x90\xa7\
-\xce\xba\x46\x0d\x84\x1b\x03\xf1\xa6\x48\xf8\x2e\xc4\xef\x46\xc2\
-\x37\x32\xe2\xb7\x22\xa3\x6f\x36\xe4\xd7\x0f\x18\x5e\xef\x6d\x74\
-\xa5\x74\x6c\x00\xa4\x96\x8b\x0b\x3f\xa7\x87\x0d\x19\x1c\x9e\x31\
-\x3a\x2c\x90\x1d\x04\xf1\xa0\x40\x3c\x70\x44\x76\x60\x20\x1e\x04\
-\x1c\x08\x71\x33\x84\x6d\xc0\x5c\x80\x2d\x23\xd8\x1a\x60\x00\xdc\
-\x13\xc8\x76\x3b\xe4\x26\xee\x7e\xa9\xe3\x4e\x60\xd7\x6e\x5f\x8f\
-\x80\x1f\x46\x18\x66\x70\x47\x5c\x78\xc8\xcd\x3c\xc4\xed\x10\x76\
-\x02\xb7\x44\xc2\xad\x19\xa3\x5b\x23\xe1\x16\x08\xb7\x46\x46\xb7\
-\x8c\xc8\x6e\x1c\x30\xbc\x09\xb8\xc9\x31\xbd\xd4\x6e\xff\x17\xca\
-\xe1\x82\xef\xaa\x6e\xbd\xc9\x00\x00\x00\x00\x49\x45\x4e\x44\xae\
-\x42\x60\x82\
-\x00\x00\x72\x67\
-\x89\
-\x50\x4e\x47\x0d\x0a\x1a\x0a\x00\x00\x00\x0d\x49\x48\x44\x52\x00\
-\x00\x02\x00\x00\x00\x02\x00\x08\x06\x00\x00\x00\xf4\x78\xd4\xfa\
-\x00\x00\x00\x04\x73\x42\x49\x54\x08\x08\x08\x08\x7c\x08\x64\x88\
-\x00\x00\x00\x09\x70\x48\x59\x73\x00\x00\x0b\x13\x00\x00\x0b\x13\
-\x01\x00\x9a\x9c\x18\x00\x00\x00\x19\x74\x45\x58\x74\x53\x6f\x66\
-\x74\x77\x61\x72\x65\x00\x77\x77\x77\x2e\x69\x6e\x6b\x73\x63\x61\
-\x70\x65\x2e\x6f\x72\x67\x9b\xee\x3c\x1a\x00\x00\x20\x00\x49\x44\
-\x41\x54\x78\x9c\xec\xdd\x77\x9c\x5c\xd5\x95\x2f\xfa\xdf\x3a\xa9\
-\x72\x75\x52\xb7\x24\x24\x04\x32\x98\x20\x72\x96\x44\x36\xc1\x18\
-\x13\x1d\x30\x0c\x36\x36\x38\x8d\x3d\x9e\x19\x4f\xbc\x9f\xb9\x73\
-\xdf\x9b\xb9\x93\xee\xdc\xf1\xbc\x49\x77\xc6\xd7\xcc\x38\x8c\xc3\
-\x38\x00\xb6\x71\xc4\x36\x32\x22\x28\x92\x8c\x40\x22\x28\x0b\xe5\
-\x0e\xea\xdc\x55\x75\xea\x9c\xbd\xde\x1f\xd5\x2d\x23\x90\x3a\xd5\
-\xae\x3a\xfb\x54\xad\xef\xe7\xa3\x8f\x40\xdd\xb5\xcf\x92\xba\xea\
-\xec\x75\x76\x58\x1b\x10\x42\x08\x21\x84\x10\x42\x08\x21\x84\x10\
-\x42\x08\x21\x84\x10\x42\x08\x21\x84\x10\x42\x08\x21\x84\x10\x42\
-\x08\x21\x84\x10\x42\x08\x21\x84\x10\x42\x08\x21\x84\x10\x42\x08\
-\x21\x84\x10\x42\x08\x21\x84\x10\x42\x08\x21\x84\x10\x42\x08\x21\
-\x84\x10\x42\x08\x21\x84\x10\x42\x08\x21\x84\x10\x42\x08\x21\x84\
-\x10\x42\x08\x21\x84\x10\x42\x08\x21\x84\x10\x42\x08\x21\x84\x10\
-\x42\x08\x21\x84\x10\x42\x08\x21\x84\x10\x42\x08\x21\x84\x10\x42\
-\x08\x21\x84\x10\x42\x08\x21\x84\x10\x42\x08\x21\x84\x10\x42\x08\
-\x21\x84\x10\x42\x08\x21\x84\x10\x42\x08\x21\x84\x10\x42\x08\x21\
-\x84\x10\x42\x08\x21\x84\x10\x42\x08\x21\x84\x10\x42\x08\x21\x84\
-\x10\x42\x08\x21\x84\x10\x42\x08\x21\x8e\x82\xa2\x0e\x40\x08\x31\
-\x39\xe6\x67\xdd\xb1\xde\x62\xa7\xcb\xd4\xa5\xd8\xee\x22\xe2\x56\
-\x22\x6a\x65\xe6\x36\x80\x5b\x99\xa8\x95\x14\xb5\x00\x9c\x21\x0b\
-\x69\x66\xca\x00\xec\x21\x2c\x77\x05\x63\x23\x73\x41\x64\x33\x2b\
-\x1a\x6f\x8c\xc0\x20\x22\x80\x99\x01\x00\x44\x04\x66\x00\x95\xaf\
-\x70\xe5\xcf\x2c\x06\x10\x38\xa9\x4c\x37\x6c\xb7\x1b\x20\x9f\x88\
-\x47\x59\x61\x0c\xa0\x51\xb6\x78\x80\x98\x06\xc0\x3c\x40\x16\x0d\
-\x30\xab\x7e\x66\x6b\xc0\x02\x75\x97\xad\x72\x4f\x7a\x4e\xb9\x9b\
-\xe8\xea\x20\xaa\x7f\x33\x21\xc4\xd4\x24\x01\x10\x22\x42\xbc\xff\
-\xc9\xce\xb2\xed\x2c\x54\x44\xc7\x83\x79\x11\x81\x16\x82\xb1\x90\
-\x08\x0b\x98\xd1\xc5\x84\x4e\x02\x3a\x67\xd5\x76\xe0\x23\x18\x1d\
-\xaa\x2a\x3e\x27\x93\x07\x39\xde\xac\x5e\xcb\x40\x0f\x11\x77\x13\
-\x53\x0f\x13\xf6\x80\xb1\x97\xc1\x7b\x40\xb4\xcb\x62\xb5\xdb\x0d\
-\x12\x7b\xe8\xb8\x0b\x7b\xab\x0a\x50\x08\x31\x6b\x92\x00\x08\x51\
-\x43\xcc\x0f\xd8\xc5\x83\x27\x2c\x22\xe2\x93\x2d\xf0\x49\x00\x4e\
-\x66\x8b\x4e\x02\xf3\xc9\x00\x4e\x02\x90\xaa\xd9\xb5\x23\x4e\x00\
-\xa6\xa9\x00\x60\x2b\x88\xb6\x01\x6a\x2b\x01\x5b\x95\xa2\x6d\xac\
-\xb0\x35\x39\x6f\xe9\xeb\x44\xa4\x6a\x79\x71\x21\x9a\x99\x24\x00\
-\x42\x68\x32\xda\xb3\xea\x38\x5b\xd9\x4b\x40\x74\x06\x58\x2d\x01\
-\xd1\x19\x04\x9c\x0b\x20\x13\x45\x3c\x31\x49\x00\x8e\x8d\xe1\xa3\
-\x92\x1c\x6c\x02\xf3\xcb\x20\xde\x84\xd0\x79\xd9\x9b\xb7\xf3\x55\
-\xa2\x3b\xc2\x68\x82\x12\xa2\x71\x48\x02\x20\xc4\x0c\x31\x3f\xeb\
-\xfa\x07\xd4\x29\x64\x05\x17\x80\xe8\x02\x05\x5c\x40\xc0\x79\x00\
-\xd2\x51\xc7\xf6\x46\xb1\x4f\x00\x8e\xad\x0c\xc6\x16\x58\xfc\x1c\
-\xb3\xf5\x9c\x0d\x3c\xe7\x04\xce\xf3\x74\xdc\x85\x63\x51\x07\x26\
-\x44\x9c\x48\x02\x20\xc4\x24\x98\x1f\xb0\xfd\x83\x0b\x97\x90\x4d\
-\x97\x28\xc6\x52\x02\x2e\x06\x70\x3a\x00\x27\xea\xd8\xa6\xd2\xc0\
-\x09\xc0\xd1\x04\x00\x5e\x66\xe0\x69\x0b\xbc\x8e\x15\xaf\xf7\xe6\
-\x2e\x7f\x59\xa6\x10\x84\x38\x36\x49\x00\x84\x78\x03\xee\x5b\x97\
-\x2f\x85\xb8\x8c\xc0\x97\x12\xb0\x8c\x81\x0b\x01\xe4\xa2\x8e\x6b\
-\x36\x9a\x2c\x01\x38\x9a\x21\x22\x3c\xc3\x8c\x75\x0c\xac\x4e\x50\
-\xb8\x8a\x3a\x2f\x1b\x8e\x3a\x28\x21\x4c\x21\x09\x80\x68\x6a\xdc\
-\xb3\x2a\x57\x52\xf6\x25\x44\xb8\x96\x81\xcb\xc6\x9f\xf0\xdd\xa8\
-\xe3\xd2\x41\x12\x80\xb7\x08\xc1\x78\x8d\xc1\xab\x88\xb0\xc2\x0b\
-\xbc\x95\xb2\x0b\x41\x34\x33\x49\x00\x44\x53\xe1\xdd\x6b\x52\x25\
-\xcf\xba\x8c\x2c\x5c\x07\xc6\x75\x00\x9f\x83\x06\xfd\x1c\x48\x02\
-\x30\x25\x05\x60\x03\x08\x8f\xb2\xc2\xa3\x89\xb1\xe2\x2a\x5a\x7c\
-\x75\x31\xea\xa0\x84\xa8\x97\x86\xbc\xf1\x09\xf1\x46\xfe\xc1\xf5\
-\xe7\x30\xd4\x3b\xc9\xc2\x75\xcc\xb8\x0c\x40\x32\xea\x98\xea\x41\
-\x12\x80\x19\x2b\x00\xfc\x14\xb3\xf5\x28\xb1\xfa\x79\x62\xde\xf2\
-\x97\xa2\x0e\x48\x88\x5a\x92\x04\x40\x34\x1c\xde\xb1\x32\x59\x4a\
-\x27\x2f\xb3\x08\x37\x33\xe3\x36\x10\x16\x45\x1d\x53\x14\x24\x01\
-\xa8\x12\x61\x17\x2b\xfe\x39\x2c\xfa\x71\x62\xa4\xf8\xa8\x8c\x0e\
-\x88\x46\x23\x09\x80\x68\x08\xbc\x67\x7d\x47\xd9\x0b\x6f\x65\xc2\
-\x2d\x60\xba\x16\x11\xed\xbd\x37\x89\x24\x00\x5a\x8d\x02\xf8\x05\
-\x01\x3f\x74\x13\xfc\x43\x6a\x59\x7e\x28\xea\x80\x84\xa8\x96\x24\
-\x00\x22\xb6\x78\xdf\xb3\x73\xca\xb6\x7f\x23\x13\xbd\x1f\xc0\x3b\
-\xd1\x20\x8b\xf7\x74\x91\x04\xa0\x66\x42\x06\xd6\x01\xf4\x60\x48\
-\xce\x03\x99\xce\x0b\xf7\x47\x1d\x90\x10\xb3\x21\x09\x80\x88\x95\
-\x91\x83\xeb\xe6\x3a\xc4\x77\x00\xb8\x83\x80\xe5\x00\xac\xa8\x63\
-\x32\x95\x24\x00\x75\x11\x32\x68\x35\xa0\x1e\x48\x84\xc1\x03\x34\
-\xff\x8a\x9e\xa8\x03\x12\x62\xba\x24\x01\x10\xc6\xe3\xdd\x6b\x52\
-\x7e\x02\x37\x01\x74\x0f\xe4\x49\x7f\xda\x24\x01\xa8\xbb\x90\x81\
-\x75\x16\xd1\xd7\x5c\x04\xdf\x92\x9a\x03\xc2\x74\x92\x00\x08\x23\
-\x31\xaf\x74\x4a\xbd\x89\x1b\x88\xe9\x43\x00\x6e\x46\x0d\x0f\xcd\
-\x69\x54\x92\x00\x44\x6a\x0c\xc0\x0f\x99\xac\x6f\x24\xe6\xec\xfa\
-\x99\x9c\x5d\x20\x4c\x24\x09\x80\x30\x4a\xb1\x67\xd5\xa9\xa4\xec\
-\xbb\x00\xdc\xdb\xac\xab\xf7\x67\x8b\x99\x01\x66\x80\x15\xc0\x0a\
-\xec\xfb\xf0\x47\x87\x00\xf0\x1b\xbe\x3e\xf1\xbd\x47\x56\xc8\x25\
-\x1a\x9f\x49\x21\x80\x68\xe2\xb6\x40\xf0\x32\x79\x90\xe7\x01\x64\
-\x8d\xff\xa2\x37\x7c\x5d\x4c\x0f\xef\x27\xd0\x83\xcc\xf4\xa5\xc4\
-\xdc\xa5\x2f\x46\x1d\x8d\x10\x13\xe4\x93\x2c\x22\xc7\x3d\xab\x72\
-\x65\xd8\x77\x32\xd3\xbd\x00\x2f\x8b\x3a\x1e\x13\x54\x3a\xeb\x10\
-\x50\xaa\xf2\xdf\x61\x08\x66\x05\x56\x0c\x40\x01\xcc\x60\x66\x10\
-\x8f\x7f\xfd\x28\x54\xb9\x8c\xe2\xd0\x60\x55\x71\x24\xf3\x2d\xb0\
-\xdc\xa3\xcf\xb8\x10\x11\x40\x74\x38\x31\x00\x2c\x90\x45\x20\xcb\
-\x02\x2c\xbb\xf2\x75\xcb\x02\xc8\x96\xa4\x61\x1c\x03\xab\x2d\xf0\
-\x57\x5c\x94\xbe\x43\x5d\x57\x8f\x44\x1d\x8f\x68\x6e\xf2\xa9\x14\
-\x91\x29\xf5\xae\x39\x0d\x8a\x3e\x02\xe0\x13\x00\xda\x22\x0e\xa7\
-\xbe\x94\x02\xab\xf0\xf0\x2f\xb0\x1a\xff\xb3\xca\xaf\xc3\x8f\xea\
-\xd5\x5c\xa2\xc6\x09\xc0\xcc\x54\x12\x83\x4a\x72\x50\x19\x4d\x20\
-\xcb\x06\x2c\x1b\x96\x6d\x57\x92\x88\xe6\x32\xcc\xcc\xdf\xb2\x60\
-\x7f\xde\x9b\x7b\xc9\x86\xa8\x83\x11\xcd\x49\x12\x00\x51\x57\xcc\
-\x9b\x3c\xbf\x67\xf0\x56\x22\xfa\x04\x33\xae\x8d\x3a\x9e\x5a\x63\
-\x15\x80\x43\x05\x4c\x74\xf4\x61\x58\xf9\xb3\x63\x3c\xb5\xeb\x64\
-\x56\x02\x30\x35\xb2\x9d\x5f\x8f\x1e\x58\x36\x60\xdb\x20\xcb\x69\
-\x86\xd1\x83\xe7\x88\xe8\xdf\xdd\xa2\xfa\x3a\x1d\xbf\xbc\x10\x75\
-\x30\xa2\x79\x34\xfc\x27\x4b\x98\x61\xb4\x67\xd5\x71\x0e\xdb\x9f\
-\x66\xe0\x13\x04\x74\x46\x1d\x8f\x76\x4a\x81\xc3\x00\x1c\x06\x50\
-\x2a\x00\x87\x21\xa0\xa2\x5d\xf7\x15\xb7\x04\xe0\x98\x2c\x0b\x64\
-\xb9\xb0\x6c\xbb\x92\x24\xd8\x4e\x65\x14\xa1\xc1\x10\xd0\xcd\xc0\
-\xbf\x07\xe4\x7e\x5e\x6a\x0b\x88\x7a\x90\x04\x40\xd4\x94\xdf\xb3\
-\xf6\x7c\xa5\xf8\x93\x44\x74\x0f\x1a\xa5\x06\xff\x78\x67\x5f\xe9\
-\xe8\xcd\xe8\xec\x8f\xa6\x61\x12\x80\xa3\xb1\x2a\x53\x08\x13\x09\
-\x01\x8d\x8f\x16\x34\x04\x86\x0f\xa2\x1f\x58\x1c\xfe\xa3\x3b\xf7\
-\xd2\xb5\x51\x87\x23\x1a\x97\x24\x00\x42\x3b\x66\xb6\xfc\x9e\xf5\
-\xef\x01\xf8\xf7\x50\x29\xd6\x13\x6b\x1c\x06\xe0\xa0\x0c\x15\x96\
-\xc1\x41\x50\x99\xaf\x8f\x81\x86\x4e\x00\x8e\x86\x2c\x90\xed\xc2\
-\x72\x1c\x90\xe3\x56\x46\x0a\x62\x8e\x81\x55\xc4\xf8\x47\xaf\x6b\
-\xe9\xc3\x44\x14\x8f\x37\x9e\x88\x0d\x49\x00\x84\x36\xcc\x9b\xbc\
-\x72\xf7\xe0\x9d\x4c\xf4\x27\x00\x4e\x8b\x3a\x9e\xd9\x9a\xe8\xf0\
-\x39\x2c\x57\x7e\xaf\xc3\x7c\x7d\x2d\x34\x5d\x02\xf0\x26\x44\x04\
-\xd8\x95\x64\xc0\xb2\x5d\x90\x13\xcf\xbf\x47\x05\x6f\x67\x58\xff\
-\x92\x18\x2d\xdc\x2f\x87\x12\x09\x5d\x24\x01\x10\x55\xe3\x9e\x55\
-\xb9\x12\x3b\xf7\x11\xf8\x8f\x00\x2c\x88\x3a\x9e\x19\x61\x40\x85\
-\x65\x60\xe2\x09\x3f\x0c\x2a\x7b\xe9\x1b\x40\xb3\x27\x00\x6f\x41\
-\x54\x19\x21\xb0\x1d\xc0\xad\x24\x05\x71\x43\xc0\x41\x66\x7c\xc1\
-\xf3\x8a\xff\x44\x6d\x57\x0f\x44\x1d\x8f\x88\x37\x49\x00\xc4\xac\
-\xf1\xe0\x9a\x76\xbf\x44\xbf\x07\xe0\xb7\x01\xb4\x44\x1d\xcf\x74\
-\x31\x2b\x70\x10\x80\xcb\x3e\x38\x28\xc5\xf6\x09\x7f\x2a\x92\x00\
-\x4c\x8e\x88\x2a\x53\x05\x8e\x07\xcb\xf5\x62\xb6\x15\x91\x06\xc0\
-\xf8\x17\x2f\x51\xfe\x27\x6a\xbd\xbc\x3f\xea\x68\x44\x3c\x49\x02\
-\x20\x66\x8c\xf7\xac\xef\xf0\x5d\xf5\xdb\x20\xfa\x5d\x80\x5b\xa3\
-\x8e\x67\x5a\x54\x08\x55\xf6\xa1\x02\x1f\x1c\x96\x75\x6c\xb3\x37\
-\x9e\x24\x00\x33\x41\x95\x85\x84\xae\x07\xcb\xf1\xe2\xb4\x7e\x60\
-\x04\xc0\xbf\x79\x09\xfe\x3b\x39\xa2\x58\xcc\x94\x24\x00\x62\xda\
-\x78\xdf\xb3\x73\x7c\xbb\xfc\x19\x10\x3e\x8b\x18\x3c\xf1\xf3\x78\
-\x87\xaf\x82\xb2\x91\xab\xf4\x6b\x4d\x12\x80\x2a\x58\x16\x6c\xc7\
-\x03\xb9\x5e\x5c\xce\x42\x18\x21\xe0\xcb\x3e\xd3\xdf\x64\xe7\x2e\
-\x3d\x18\x75\x30\x22\x1e\x24\x01\x10\x53\xe2\xee\x95\x59\x1f\xc9\
-\xdf\x02\xf0\x27\x30\xbc\xe3\x57\x61\x19\xec\x97\xc0\xe5\xc6\x1d\
-\xda\x9f\x2e\x49\x00\xf4\xa8\x4c\x15\x24\x60\x4d\x24\x03\x66\xdf\
-\x35\x2b\x23\x02\x8e\xfb\xbf\xa8\xfd\xc2\xea\x7e\xf8\xa2\xe1\x99\
-\xfd\x56\x16\x91\x62\xde\xe4\x95\x7b\x87\x3f\x02\xe6\xbf\x60\x60\
-\x6e\xd4\xf1\x1c\x1d\x43\x85\x95\xf9\x7c\xe5\x97\x62\xb3\x45\xaf\
-\x1e\x24\x01\xd0\x8f\x2c\x02\xd9\xb1\x48\x06\xfa\x00\x7c\xce\x1b\
-\x2d\xfe\xb3\xec\x1a\x10\xc7\x62\xee\xdb\x57\x44\x86\x79\xa5\x53\
-\xee\x4d\xde\xcb\x8c\xff\x17\xc0\xc2\xa8\xe3\x39\x1a\x56\x01\x94\
-\x5f\x82\x2a\x97\x00\x25\x9d\xfe\xd1\x48\x02\x50\x63\x96\x05\xcb\
-\x4d\x54\xd6\x0d\x98\xba\xa3\x80\xf1\x3a\x11\xff\x4f\xb7\x73\xcf\
-\x57\xe5\x48\x62\xf1\x66\x92\x00\x88\x23\x14\x0f\xae\xbd\x96\x08\
-\xff\x00\xe0\xac\xa8\x63\x79\x0b\x56\x08\xfd\x62\xe5\x49\xbf\x09\
-\xe7\xf4\x67\x4a\x12\x80\x3a\xb2\x6c\x58\x5e\x02\xb6\x9b\x00\x2c\
-\x3b\xea\x68\x8e\xe6\x55\x06\x7e\x3f\xd9\xb5\xec\x91\xa8\x03\x11\
-\xe6\x90\x04\x40\x00\x00\x4a\x7d\xeb\x96\x20\xe4\xcf\x01\xb8\x31\
-\xea\x58\xde\x8c\x83\x32\x94\x5f\x80\x0a\xfc\xa6\x58\xbd\xaf\x8b\
-\x24\x00\x51\x20\x90\xe3\xc0\xf2\x52\xb0\xcc\x9c\x22\xf8\x31\xb3\
-\xfa\x6c\x72\xee\xa5\xdb\xa2\x0e\x44\x44\xcf\xbc\xb7\xa7\xa8\xab\
-\xb1\xde\x35\x0b\x6c\x45\x7f\x05\xe0\x1e\x00\xe6\x6c\x84\x56\x0a\
-\xaa\x5c\x42\xe8\x17\xe5\x69\x7f\x96\x24\x01\x88\x18\x59\xb0\xbc\
-\x04\x2c\x2f\x55\x39\xe5\xd0\x1c\x25\x10\xfe\xd9\xb3\xe8\xaf\xa9\
-\x63\xe9\x50\xd4\xc1\x88\xe8\x48\x02\xd0\xa4\x98\x9f\x75\x4b\x3d\
-\xc1\xa7\x09\xfc\x97\x00\x72\x51\xc7\x03\x00\x60\x86\x0a\xca\x50\
-\xe5\x22\xb8\xec\x47\x1d\x4d\xec\x49\x02\x60\x0a\x82\x65\x3b\x20\
-\x2f\x01\xcb\x4b\xc0\xa0\xdb\x6e\x1f\x83\xfe\x32\xd1\xf9\xfa\xbf\
-\xca\xfa\x80\xe6\x64\xcc\x3b\x51\xd4\x4f\xe1\xc0\x9a\x6b\x2c\xa2\
-\x7f\x01\x61\x49\xd4\xb1\x00\xa8\xcc\xed\x97\x8a\x60\xbf\xd0\xf4\
-\x5b\xf7\x74\x92\x04\xc0\x3c\x44\x04\xf2\x52\xb0\x13\x49\x93\x2a\
-\x0f\xfe\xca\x82\xfa\xac\xdb\x75\xe9\x93\x51\x07\x22\xea\x4b\x12\
-\x80\x26\x52\x3c\xb8\xfa\x24\x22\xfb\x7f\x01\xfc\xfe\xa8\x63\x01\
-\x00\x56\x21\x94\x5f\x84\x2a\x15\x21\x93\xfb\xfa\x49\x02\x60\x30\
-\x22\x58\x4e\x02\x56\x32\x05\x32\x67\xd1\xe0\x8f\x95\xb2\x7e\x27\
-\x35\xef\x92\x1d\x51\x07\x22\xea\x43\x12\x80\x26\xc0\xfc\xac\xeb\
-\xf7\x94\xff\x08\xc0\xff\x03\x20\x19\x75\x3c\x2a\x2c\x43\x95\x0a\
-\x32\xcc\x5f\x63\x92\x00\xc4\x83\x65\xbb\xb0\x12\x29\x90\x6b\x44\
-\xc5\xc1\x02\x18\x7f\xee\x75\x15\xff\x81\xe8\xea\x20\xea\x60\x44\
-\x6d\x49\x02\xd0\xe0\xfc\xee\xd5\xe7\x32\xac\x2f\x02\xb8\x20\xd2\
-\x40\x98\x2b\x65\x79\x8b\x63\x60\x59\xd4\x57\x17\x92\x00\xc4\x0b\
-\x59\x36\x2c\x2f\x09\x2b\x91\x84\x01\xb7\xe6\x17\xc9\x52\x1f\xf3\
-\xe6\x5c\xfa\x4c\xd4\x81\x88\xda\x89\xfc\x5d\x26\x6a\x83\x77\xaf\
-\x49\xf9\x09\xfa\x33\x00\x7f\x08\x20\xb2\x31\x46\x66\x06\x97\x0a\
-\x95\xd5\xfc\x52\xa5\xaf\xae\x24\x01\x88\x29\xb2\x60\x27\x92\x20\
-\x2f\x05\xa2\x48\x6f\xd1\x01\x01\x9f\x77\x55\xfa\xbf\xd3\xbc\x73\
-\x46\xa3\x0c\x44\xd4\x86\x24\x00\x0d\xa8\xdc\xbd\xfa\x0a\x05\xeb\
-\x3f\x00\x9c\x12\x55\x0c\xcc\x0c\xf6\x8b\x50\xa5\x31\x59\xd8\x17\
-\x11\x49\x00\xe2\xad\xb2\x60\x30\x09\x2b\x91\x8e\x38\x11\xe0\xed\
-\xcc\xf4\xc9\xe4\xdc\x65\x2b\x22\x0c\x42\xd4\x80\x24\x00\x0d\x84\
-\xfb\x57\xb6\x96\xfc\xc4\xff\x26\xa2\x8f\x23\xa2\x9f\xed\xe1\x8e\
-\xdf\x1f\x03\x2b\xe9\xf8\xa3\x24\x09\x40\x63\x20\xab\xb2\x73\xc0\
-\x8a\x7c\x44\x80\x1e\xf4\x7c\xfa\x14\x2d\xbc\xa4\x2f\xc2\x20\x84\
-\x46\x92\x00\x34\x88\x62\xcf\xda\x9b\x89\xf1\x7f\x01\x2c\x88\xe2\
-\xfa\xd2\xf1\x9b\x47\x12\x80\xc6\x42\x64\x81\x12\xc9\x48\x13\x01\
-\x02\x0e\x82\xf9\x8f\xbd\xb9\xcb\xbf\x16\x49\x00\x42\x2b\x49\x00\
-\x62\x6e\xbc\x92\xdf\x17\x00\xdc\x14\x49\x00\xcc\x50\x7e\x11\x61\
-\xa9\x20\x73\xfc\x86\x91\x04\xa0\x31\x99\x90\x08\x80\xf8\x07\x01\
-\xbc\x4f\x65\x3a\x2f\xdc\x1f\x4d\x00\x42\x07\x63\x2a\x51\x88\x99\
-\x2b\x1d\x5c\x73\xbb\xad\x68\x03\xa2\xe8\xfc\x99\xa1\x4a\x05\x04\
-\xc3\xfd\x08\x8b\xa3\xd2\xf9\x0b\x51\x27\xcc\x0a\xaa\x38\x86\x70\
-\xf8\x50\xa5\x86\x46\x14\x6b\x6c\x98\x6e\x75\x38\x78\xb9\xd4\xb3\
-\xee\xce\xfa\x5f\x5c\xe8\x22\x23\x00\x31\xc4\xbb\xd7\xa4\xca\x09\
-\xfa\x5b\x06\x7e\x27\x92\xeb\x97\x7d\x84\xc5\x51\xd9\xce\x67\x38\
-\x19\x01\x68\x12\x96\x05\x3b\x99\x81\xe5\x26\xa2\xb9\x3e\xf1\xd7\
-\x3d\x2e\x7d\x9a\xba\xae\x1e\x89\x26\x00\x31\x5b\x92\x00\xc4\x8c\
-\xdf\xb3\xfe\x42\x66\xf5\x5f\x88\x60\x85\x3f\x87\x65\xa8\xe2\x28\
-\x54\x20\xf5\x41\xe2\x40\x12\x80\xe6\x42\xb6\x03\x2b\x95\x85\x65\
-\x3b\x51\x5c\x7e\x87\xc5\xea\x6e\x77\xee\xa5\x6b\xa3\xb8\xb8\x98\
-\x1d\x99\x02\x88\x09\x66\xa6\x62\xf7\xba\xdf\x65\xa5\x56\xa3\xde\
-\x9d\xbf\x52\x08\x0b\x23\x08\x46\x86\xa4\xf3\x17\xc2\x50\x1c\x06\
-\x08\x47\x06\x10\x8e\x0d\x45\x71\x82\xe6\x62\x45\xd6\x93\xa5\x83\
-\x6b\xff\x9c\xf9\x01\x63\x6a\x1b\x8b\xc9\xc9\x08\x40\x0c\x14\x0e\
-\xad\x5a\x44\x81\xfd\x35\x02\xae\xac\xe7\x75\x99\x19\xca\x2f\x40\
-\x15\x0b\x90\x5a\xfd\xf1\x23\x23\x00\x4d\x8c\x68\xbc\xaa\x60\x14\
-\x35\x04\x68\xad\x52\x74\xb7\x9c\x29\x60\x3e\x49\x00\x0c\x57\xea\
-\x5e\xf7\x3e\x30\xdf\x0f\x42\x7b\xfd\xae\xca\x50\x7e\x09\xaa\x38\
-\x2a\x45\x7c\x62\xc4\xf7\x43\x8c\x8e\xf9\x18\x2d\x94\xa0\x14\xa3\
-\x38\x56\x42\x61\xb8\x32\x2d\x3b\x56\x2c\x03\x00\xc2\x90\x51\x2a\
-\x57\x46\x71\xfc\x72\xe5\x67\xeb\xb9\x95\xdb\x40\xc2\x75\x60\xdb\
-\x04\x02\x21\x95\xac\x0c\x23\xa7\x72\x59\x24\xd3\x09\x58\x16\x21\
-\x93\x4a\x20\x93\xf6\xe0\x79\xf2\x80\x17\x1b\x64\xc1\x4e\xa6\x61\
-\x79\x75\x3f\x02\x64\x10\x84\xdf\x4a\x74\x2e\xfb\xaf\x7a\x5f\x58\
-\x4c\x9f\x24\x00\x86\xe2\xbe\x75\x79\x5f\xa9\x7f\x05\xd3\x87\xea\
-\x7a\x5d\x15\x20\x1c\x1b\x01\x87\x32\xd4\x6f\x82\xe1\x91\x12\xfa\
-\x06\x46\xd1\x77\x68\x0c\x83\xc3\x45\x8c\x8e\xfa\x18\x19\x2b\x61\
-\xb4\xe0\x63\x64\xb4\x84\xd1\x51\xbf\xd2\xe9\x8f\xf9\xf0\xcb\xf5\
-\x19\xf6\xf5\x5c\x1b\x99\xb4\x87\x4c\xda\x43\x36\x93\x40\x26\xe3\
-\x21\x9b\x4e\x20\x9b\xf6\x90\xc9\x78\xc8\x67\x93\xe8\x68\x4f\x63\
-\x4e\x5b\x06\xd9\x4c\x44\x0b\xd3\xc4\x11\xc8\x76\x60\xa7\xb2\xa0\
-\xfa\xaf\x0f\xf8\x4f\x0f\xc5\xdf\x96\x05\x82\x66\x92\x04\xc0\x40\
-\xc5\x9e\x55\xa7\x92\xb2\xbf\x07\xc2\x92\xfa\x5d\x95\x11\x96\x0a\
-\x50\xa5\x42\x34\xdb\x8a\x9a\xd4\x58\xc1\x47\xef\xa1\x51\xf4\xf5\
-\x8f\xa1\xef\xd0\x28\xfa\x06\x2a\xbf\xf7\xf6\x8f\xa1\xaf\x7f\x14\
-\xbe\x1f\xef\x9d\x16\x09\xd7\x41\x7b\x7b\x1a\x73\xda\xd2\xe8\x68\
-\xcf\x60\x4e\x5b\x06\x1d\xed\x69\xb4\xb7\x66\xd0\xd9\x9e\x41\x2a\
-\x25\xd3\x0b\x75\x43\x80\xe5\xa5\xa2\x98\x16\xd8\x8c\xd0\x7e\x4f\
-\x62\xfe\xc5\x9b\xea\x79\x51\x31\x35\x49\x00\x0c\x53\xec\x59\x7b\
-\x0b\x31\xbe\x06\xa0\xa5\x5e\xd7\xe4\xb2\x8f\xa0\x30\x22\x7b\xf9\
-\x6b\x28\x54\x8c\x43\x03\x63\xd8\x7f\x70\x08\xbb\xf7\xf6\x63\xd7\
-\x9e\x7e\x1c\xe8\x1e\x46\x6f\x7f\x73\x9f\x95\xd0\x92\x4b\x61\xfe\
-\xdc\x1c\xe6\x77\xe5\xb1\x68\x61\x2b\x8e\x9b\x9b\xc7\xfc\xb9\x79\
-\xb8\x8e\x4c\x33\xd4\x4c\x34\xdb\x06\x87\x01\xba\x2f\xd1\xb5\xf4\
-\xa1\x7a\x5e\x54\x4c\x4e\x12\x00\x43\x30\x3f\x60\xfb\x3d\xc7\xff\
-\x35\x80\x3f\x46\xbd\x7e\x2e\x4a\x21\x2c\x8e\x41\x95\x8b\x75\xb9\
-\x5c\xb3\x28\x14\xcb\xd8\xb9\xfb\x10\xf6\xec\x1f\xc4\xde\x03\x83\
-\xd8\xbb\x7f\x08\x07\xba\x87\x10\x84\x92\x60\x4d\x87\x63\x5b\x98\
-\xd7\x95\xc7\x82\xf9\x79\x2c\x98\xd7\x82\x85\xf3\x5b\x71\xe2\xf1\
-\x6d\x48\x25\x65\xb4\x40\x27\x72\x3d\x38\xc9\x2c\x60\xd5\x6d\x33\
-\x18\x13\xf0\x7f\xdc\xce\xe2\x1f\x10\x5d\x2d\x73\x8c\x06\x90\x04\
-\xc0\x00\xbc\xef\xd9\x39\x65\xa7\xfc\x4d\x06\xae\xab\xcf\x05\x51\
-\x59\xdd\x2f\x27\xf5\x69\x31\x30\x54\xc4\xf6\x5d\xbd\xd8\xba\xa3\
-\x0f\xdb\x76\xf5\x61\xf7\xbe\x7e\x99\x45\xa9\x81\xce\xf6\x0c\xde\
-\x76\x62\x07\x4e\x3a\xa1\x03\x27\x9f\x38\x07\xf3\xe7\xe6\xa3\x0e\
-\xa9\x01\x10\xac\x64\x0a\xb6\x97\xae\x5b\x6f\xc0\xc0\x13\x01\xd3\
-\x07\xb2\x73\x97\x1e\xac\xcf\x15\xc5\xb1\x48\x02\x10\x31\xbf\x67\
-\xed\xf9\xcc\xf8\x2e\x80\x13\xeb\x71\x3d\x0e\x03\x84\x05\x59\xe4\
-\x37\x5b\xa1\x62\x74\xf7\x0c\x63\xeb\xce\x5e\x6c\xdb\xd5\x87\xad\
-\x3b\x7a\xd1\xd7\x3f\x16\x75\x58\x4d\x29\x9f\x4b\xe2\x84\x05\xad\
-\x38\x69\xf1\x1c\x9c\x7c\xc2\x1c\x9c\xb0\xb0\x0d\x8e\x23\xa5\x4d\
-\x66\xa3\xb2\x48\x30\x07\xb2\xeb\x36\xf5\xb2\x87\x14\xde\xe7\xcd\
-\x5b\xb6\xbe\x5e\x17\x14\x6f\x25\x09\x40\x84\xfc\x83\x6b\xee\x61\
-\xa2\x2f\x00\x48\xd5\xe3\x7a\xca\x2f\x22\x2c\x8c\x42\xf6\xf4\xcf\
-\x4c\xcf\xa1\x51\xbc\xfc\xda\x01\x6c\x7a\xed\x00\x36\x6f\xeb\x3d\
-\xbc\x8d\x4e\x98\x25\xe1\x3a\x38\xf5\xe4\x4e\x9c\x71\xea\x3c\x2c\
-\x39\x75\x2e\xe6\xb4\x65\xa2\x0e\x29\x76\xec\x64\x06\x56\xa2\x2e\
-\xb7\x23\x00\x28\x11\xe1\xb7\xbd\xce\x65\xff\x51\xaf\x0b\x8a\x23\
-\x49\x02\x10\x01\xde\xf2\xd3\x44\x29\xdf\xf6\x7f\x88\xf0\xf1\xba\
-\x5c\x50\x85\x08\x0b\x23\x50\x41\xb9\x2e\x97\x8b\x3b\xbf\x1c\x62\
-\xfb\xae\x3e\xbc\xba\xa5\x1b\xaf\x6c\xed\xc6\xeb\x7b\xfb\xa3\x0e\
-\x49\xcc\x42\x67\x7b\x06\xa7\xbd\x7d\x2e\x4e\x3b\xb9\x13\x67\x9c\
-\x3a\x1f\x09\xa9\x5f\x30\x2d\x64\x3b\xb0\xd3\x39\x90\x55\xa7\x7f\
-\x2f\xe2\xaf\x7b\x45\x7c\x92\x8e\x5f\x5e\xa8\xcf\x05\xc5\x04\x49\
-\x00\xea\x6c\xb4\x67\xd5\x71\x0e\xdb\x0f\x03\xb8\xa8\x1e\xd7\x53\
-\x7e\x51\x0a\xfa\x4c\x43\x6f\xdf\x08\x5e\x7a\xed\x00\x36\xbd\x76\
-\x10\x5b\xb6\xf7\xd4\x6d\x4f\xbd\xa8\x0f\xcf\xb3\x71\xca\xdb\x3a\
-\x71\xc6\xdb\xe7\xe2\x8c\xd3\xe7\xa3\xb3\x5d\x46\x07\x26\x47\x95\
-\x02\x42\xf5\x1a\x0d\x20\xac\x2f\xb3\x7d\x5b\xb6\xeb\xe2\x03\xf5\
-\xb9\xa0\x00\x24\x01\xa8\xab\xd2\x81\xd5\x67\x82\xac\x9f\x80\xb0\
-\xa8\xe6\x17\x53\x0a\x41\x71\x04\x5c\xf6\x6b\x7e\xa9\xb8\x3a\x34\
-\x30\x86\x17\x36\xed\xc3\x73\x2f\xed\xc1\x8e\x5d\x87\x24\x49\x6a\
-\x22\xf3\xbb\x72\xb8\xe0\xec\x85\xb8\xe8\xdc\x45\xe8\x9a\x93\x8d\
-\x3a\x1c\x63\x91\xe3\xc1\x49\xd5\x6d\xa7\xc0\x5e\x82\xba\xc9\xeb\
-\xba\xf4\x85\x7a\x5c\x4c\x48\x02\x50\x37\xc5\x83\x6b\xaf\x25\xc2\
-\x43\xa8\xc3\xfe\x7e\x55\xf6\xa1\x8a\xc3\x60\x25\x1d\xda\x9b\xf5\
-\x0f\x14\xf0\xab\x4d\x7b\xa5\xd3\x17\x87\x4d\x24\x03\x97\x9c\xb7\
-\x08\x73\x3a\x24\x19\x78\x33\x22\x82\x95\xcc\xd4\xab\x9c\xf0\x30\
-\x03\x1f\x48\x76\x2d\x7b\xa4\x1e\x17\x6b\x76\x92\x00\xd4\x81\xdf\
-\xbd\xee\x5e\x06\xdf\x0f\xa0\xa6\x1b\x99\x99\x19\xaa\x38\x02\xe5\
-\x97\x6a\x79\x99\xd8\x19\x18\x2a\xe0\xf9\x97\xa4\xd3\x17\x53\x9b\
-\xdf\x95\xc3\x25\x17\x9c\x80\x4b\xce\x3b\x01\xad\xf9\xba\xd7\xcf\
-\x37\x9a\xe5\x26\x60\xa5\xb2\xf5\xa8\x22\x18\x10\xf1\x67\xbc\xce\
-\xe5\xf7\xd7\xfa\x42\xcd\x4e\x12\x80\x1a\x62\x66\xf2\xbb\xd7\xfd\
-\x19\x08\x7f\x56\xf3\x6b\x85\x01\xc2\xb1\x61\x70\xfd\x8f\x01\x35\
-\x52\x10\x2a\x6c\xd8\xb8\x0f\xab\x9e\xd9\x81\xd7\xb6\x75\xcb\xbe\
-\x7c\x31\x23\x44\xc0\x69\x27\xcf\xc5\xe5\x17\x2f\xc6\x59\x4b\xe6\
-\xc3\xb1\x65\x7b\x21\x00\x90\x65\xc3\x4e\xe7\xeb\xb2\x5d\x90\x80\
-\x7f\x71\x3b\x97\x7e\x96\x88\xe4\xd3\x5b\x23\x92\x00\xd4\x08\x6f\
-\xf9\x69\xc2\xcf\xb7\x7d\x09\x84\xbb\x6b\x7d\x2d\x55\x2e\x21\x1c\
-\x1b\x81\x6c\xef\x03\xba\x7b\x86\xb1\xe6\xd9\x5d\x58\xf3\xdc\x4e\
-\x0c\x8f\xc8\x48\x88\xa8\x5e\x3a\xe5\xe1\x82\xb3\x17\xe2\xaa\x65\
-\x27\xe1\xb8\x79\x52\x7c\x08\xa8\xe7\x76\x41\x7a\xd0\x1b\x2d\xdc\
-\x43\x8b\xaf\x96\x72\xa5\x35\x20\x09\x40\x0d\xf0\xe0\x9a\xf6\x52\
-\x89\xbe\x47\xc0\x95\x35\xbd\x0e\x33\x54\x61\x04\xaa\xdc\xdc\x1d\
-\x5d\x10\x28\xbc\xf8\xca\x3e\x3c\xb5\x7e\x07\x5e\xdb\xd6\x23\x43\
-\xfc\xa2\x66\x16\x2d\x68\xc3\x65\x17\x9f\x88\x4b\xce\x3b\xa1\xe9\
-\x8f\x45\xb6\x5c\x0f\x56\x2a\x57\x8f\x29\x81\x35\x5e\xe0\xde\x4a\
-\xc7\x5d\xd8\x5b\xeb\x0b\x35\x1b\x49\x00\x34\x2b\x1e\x7c\xe6\x6d\
-\x44\xc1\x4f\x00\x9c\x56\xcb\xeb\xc8\x90\x3f\xb0\xff\xe0\x10\x9e\
-\x7c\x7a\x07\x9e\x7e\xfe\x75\x8c\x15\x64\xb7\x83\xa8\x9f\x74\xca\
-\xc3\x25\xe7\x2d\xc2\xe5\x4b\xdf\x86\xf9\x5d\xb9\xa8\xc3\x89\x8e\
-\x65\xc3\x49\xe7\xea\x71\xcc\xf0\x56\x06\xdd\x98\xec\x5a\xba\xa5\
-\xd6\x17\x6a\x26\x92\x00\x68\xe4\xf7\xae\xb9\x58\x29\xfa\x31\x01\
-\x9d\xb5\xbc\x4e\xb3\x0f\xf9\x6f\xdb\xd9\x87\x9f\x3f\xfe\x2a\x36\
-\xbe\x76\x50\x9e\xf6\x45\xe4\xde\x76\x62\x07\xde\x79\xe5\xa9\x38\
-\xeb\xb4\x79\xf5\x3e\x66\xd7\x18\xf5\x98\x12\x20\xe0\x20\x88\xde\
-\xed\x75\x2e\x7d\xae\xa6\x17\x6a\x22\xcd\xf9\x6e\xad\x81\x42\xcf\
-\xda\xab\x2c\xc6\x0f\x00\xd4\x6e\x92\x90\xb9\x52\xd1\xaf\x09\x87\
-\xfc\x43\xa5\xb0\x61\xd3\x3e\x3c\xfa\xc4\x16\xec\xdc\x73\x28\xea\
-\x70\x84\x78\x8b\x85\xf3\x5b\x70\xc5\xd2\xb7\x61\xd9\x05\x27\x36\
-\xe5\x99\x04\x96\x9b\x80\x9d\xce\xa2\xc6\xdd\xca\x88\x22\xba\x25\
-\xd5\xb9\x74\x65\x2d\x2f\xd2\x2c\x24\x01\xd0\xa0\xd8\xb3\xf6\x66\
-\x62\x3c\x00\xa0\x76\xfb\x86\x94\x42\x30\x36\xd4\x74\x87\xf8\x94\
-\x4a\x01\x56\x3f\xbb\x13\x2b\x9e\xda\x8c\xfe\x01\xa9\x14\x2a\xcc\
-\x97\xcf\x25\x71\xc5\x25\x8b\x71\xf5\xa5\x27\x23\x9d\xf2\xa2\x0e\
-\xa7\xae\xc8\x76\xe0\x64\xf2\x00\xd5\x34\x01\x1a\x63\xa6\xdb\x93\
-\x73\x97\xfe\xa2\x96\x17\x69\x06\x92\x00\x54\xa9\xb8\xf3\x97\x7f\
-\xcf\x09\xf7\xb3\x96\xed\xd6\x6c\x45\x90\x0a\xca\x08\xc7\x86\x01\
-\x6e\x9e\xf3\xe4\xfb\xfa\xc7\xf0\xd8\xea\xad\x58\xfd\xcc\x0e\x94\
-\x4a\xcd\x95\xf4\x88\xc6\x90\x4c\xb8\xb8\xf4\xe2\x13\xf1\x8e\x4b\
-\x4f\x46\x7b\x6b\x3a\xea\x70\xea\x87\x2c\xd8\x99\x1c\x2c\xbb\x76\
-\x65\x4f\x38\x0c\xca\x61\xa9\xf0\xb9\xcc\x89\xd7\xff\x69\xcd\x2e\
-\xd2\x04\x24\x01\xa8\x42\x61\xf7\x8a\x2f\x86\xc5\xc2\x47\x41\x04\
-\x27\x9d\x07\x39\xfa\xdf\xf0\xca\x2f\x22\x2c\x8e\xa2\x59\x36\xb2\
-\xf7\x0f\x16\xf0\xe8\x13\x9b\xf1\xd4\xd3\xdb\x11\x04\xcd\x93\xf0\
-\x88\xc6\x65\x5b\x16\x96\x5f\x74\x22\x6e\xbc\xe6\x34\xb4\xe6\xeb\
-\x76\xd2\x5e\xb4\x88\x2a\xeb\x02\x6a\x50\x3d\x50\x85\x01\xd4\xe8\
-\x60\x65\xfd\x8f\x9b\xfc\xc7\xec\x89\xd7\xfd\xbe\xf6\x8b\x34\x09\
-\x49\x00\x66\x69\x6c\xd7\x8a\x6f\xa8\x72\xe1\xee\xc3\xeb\xf0\x74\
-\x27\x01\x0c\x84\xa5\x51\xa8\x52\x73\x0c\x7b\x8f\x8c\x96\xb0\xe2\
-\xc9\x2d\x78\x6c\xf5\x56\x94\x83\xe6\xdd\xd9\x20\x1a\x97\x63\x5b\
-\x58\x76\xe1\x89\x78\xf7\xb5\xa7\xa1\x25\xd7\x1c\x89\x80\xe5\x25\
-\x61\x27\xb3\xda\x7a\x9a\x23\x3a\xff\x71\xe4\x26\xbf\x9c\x39\xf1\
-\xba\x8f\xea\xb9\x42\x73\x91\x04\x60\x16\xc6\x5e\x5f\xf1\x2d\xe5\
-\x17\xee\x7c\xcb\x22\x7c\x4d\x49\x00\x2b\x46\x38\x36\x04\x0e\x1b\
-\xff\xf8\xde\xd1\x31\x1f\x8f\x3e\xb1\x19\x2b\xd7\x6e\x85\xef\x4b\
-\xc7\x2f\x1a\x9f\xe7\xd9\xb8\xf4\xc2\xc5\xb8\xe1\xea\xd3\x90\xcf\
-\x25\xa2\x0e\xa7\xe6\x2c\xc7\x81\x95\x6e\xa9\x7a\x87\xc4\xd1\x3a\
-\xff\xc3\xd7\x70\x53\xdf\x4e\x9f\x78\xed\x5d\x55\x5d\xa0\x09\x49\
-\x02\x30\x43\x85\x9d\x8f\xfe\x38\x2c\x97\xde\x7d\xac\x2d\x78\x44\
-\x04\x2b\x93\x9f\xf5\xfc\x17\xab\x10\xc1\xe8\x10\xd0\xe0\xfb\xfb\
-\xc7\x0a\x3e\x56\xae\xde\x8a\x5f\xae\xda\x8a\x42\xb1\xf1\x13\x1d\
-\x21\xde\x2c\xe1\xd9\xb8\x6a\xd9\xc9\xb8\xfe\xaa\x53\x1a\x7e\xb1\
-\x20\x59\x16\xec\x4c\x1e\x64\xcd\xae\x5e\xc0\x64\x9d\xff\xf8\x15\
-\x60\x79\xc9\x1f\xa7\x4f\xb8\xf6\xe6\xd9\x47\xd9\x7c\x24\x01\x98\
-\x81\xd1\x9d\x8f\x3e\xc2\xe5\xe2\x0d\x53\x7e\xe3\x2c\x47\x02\x38\
-\x28\x57\x9e\xfc\x1b\x78\xbe\xdf\x2f\x87\x58\xf1\xd4\x16\xac\x78\
-\x72\xb3\x74\xfc\x42\x00\x48\xa5\x5c\x5c\x7f\xc5\xa9\xb8\xe6\xf2\
-\x93\xe1\x3a\x8d\x5b\x5d\x90\x88\x60\xa7\x73\x20\x67\x66\xc9\xce\
-\xd4\x9d\xff\xaf\x59\x5e\xe2\xb1\xf4\x09\xd7\x5f\x33\xdb\x18\x9b\
-\x8d\x24\x00\xd3\x34\xba\xe3\x17\xbf\xe0\xa0\x74\xdd\xb4\x5f\x40\
-\x04\x3b\x9d\x87\x35\xcd\x24\xa0\x52\xdc\x67\x78\xb6\xe1\xc5\xc2\
-\x8b\xaf\xec\xc7\x83\x3f\xdc\x80\xde\xfe\xd1\xa8\x43\x11\xc2\x38\
-\x6d\x2d\x29\xdc\xf2\xce\x33\x70\xc9\x79\x8b\x1a\xb7\xa0\x10\x11\
-\xec\x64\x16\x96\x37\xbd\xa9\x8f\x99\x74\xfe\x13\x6c\x37\xb9\x22\
-\x75\xe2\x75\xd3\xbf\x57\x37\xb1\x06\x7d\x97\xe9\x35\xb6\x6b\xc5\
-\x8f\x94\x5f\xb8\x69\xc6\x2f\x9c\x66\x12\xa0\x4a\x05\x84\xc5\x31\
-\x34\x6a\x65\xbf\xd7\xf7\x0e\xe0\xc1\x1f\x6d\xc0\xd6\x9d\x52\xca\
-\x5b\x88\xa9\x2c\x3e\xbe\x1d\xef\xbb\xf9\x1c\xbc\x6d\x51\x7b\xd4\
-\xa1\xd4\xcc\x74\x2a\x07\xce\xa6\xf3\x9f\x40\x5e\xf2\x07\x99\x13\
-\xae\xbb\x6d\xb6\xf1\x35\x0b\x49\x00\xa6\x30\xb6\x7b\xc5\xf7\x54\
-\xb1\x78\xfb\xac\x3b\xe7\x29\x92\x80\xb0\x34\x06\x55\x1c\xab\x22\
-\x42\x73\x8d\x8c\xf9\xf8\xe9\x8a\x57\xf0\xc4\xba\x6d\x50\xaa\x31\
-\x93\x1b\x21\x6a\x81\x08\xb8\xf8\xbc\x45\x78\xcf\xbb\xce\x42\x3e\
-\x57\xbb\xfa\x62\x51\xb2\x12\x29\xd8\xc9\x34\x8e\xd6\x0d\x55\xd3\
-\xf9\x1f\x6e\xdf\x4b\x3d\x98\x3e\xe1\xda\x3b\xaa\x08\xb1\xe1\x49\
-\x02\x30\x89\xd1\xd7\x57\x7c\x95\xfd\xc2\x3d\x55\x3f\x98\x1f\x2d\
-\x09\x60\x46\x58\x1c\x81\xf2\x1b\xaf\xac\x6f\xa8\x14\x9e\x58\xbb\
-\x1d\x3f\xfa\xc5\xcb\x28\x96\x64\x9e\x5f\x88\xd9\x4a\xb8\x0e\xae\
-\xbb\xf2\xed\xb8\xfe\xaa\x53\x1b\x72\x7d\x40\xa5\x7c\xf0\x91\x87\
-\x29\xe9\xe8\xfc\x27\xd8\x89\xd4\x97\x52\x8b\xae\xfd\x58\xd5\x0d\
-\x35\x28\x49\x00\x8e\xa1\xb0\x7b\xc5\x97\xc2\x52\xe1\x3e\x6d\xa3\
-\xf2\x6f\x48\x02\x98\xc7\xb7\xf9\x05\x8d\xd7\x39\x6e\x7c\xf5\x00\
-\x1e\xf8\xe1\x0b\xe8\x39\x24\xf3\xfc\x42\xe8\xd2\xd9\x91\xc1\x9d\
-\xb7\x9e\x87\x25\xa7\xcc\x8d\x3a\x14\xed\xc8\xf1\x2a\x8b\x03\x89\
-\xb4\x76\xfe\x13\xac\x64\xea\x9f\xd3\xc7\x5f\xfb\x59\x6d\x0d\x36\
-\x10\x49\x00\x8e\x62\x6c\xe7\x63\xff\x9f\x2a\x8f\xfd\xbe\xee\x39\
-\xf9\x89\x55\xb0\x61\x71\x14\x1c\x36\xd6\x36\xbf\xb1\x82\x8f\x87\
-\x7f\xb6\x09\x4f\xad\xdf\x1e\x75\x28\x42\x34\xac\xf3\xcf\x5a\x88\
-\xbb\x6e\x3b\x17\xd9\x4c\x63\xd5\x0f\x20\xdb\x81\x9d\x4c\x57\x8e\
-\x38\xd7\xbe\x0b\x8a\x60\x7b\xc9\xbf\x48\x9d\x70\xed\x9f\x69\x6e\
-\x38\xf6\x24\x01\x78\x93\xd2\x81\x75\xb7\x2a\xf6\xbf\xab\x46\x87\
-\x6c\xdd\x6f\x44\x56\x0a\xfe\xf0\x10\xdc\x74\x06\x96\x5b\xbb\x3a\
-\xd9\xf5\xf6\xfc\x4b\x7b\xf0\xad\x87\x5f\xc0\xc8\x68\xe3\x4d\x67\
-\x08\x61\x9a\x74\xca\xc3\x6d\x37\x9c\x81\xcb\x2f\x79\x5b\xd4\xa1\
-\x68\x13\x96\xcb\x28\x8f\x8d\x22\x91\xcb\x83\x2c\xcd\x07\x09\x11\
-\xc1\xc9\xe4\xcb\xb0\xdd\x5b\x93\x5d\xcb\x1e\xd1\xdb\x78\xbc\x49\
-\x02\xf0\x06\x85\xde\xf5\xef\xb0\x94\xfa\x09\x80\xa4\xee\xa1\x28\
-\x66\x85\xe2\xe0\x20\x38\x0c\x41\x20\x24\xf2\xf9\xd8\x27\x01\x7d\
-\xfd\x63\xf8\xe6\xf7\x9f\xc7\xcb\x9b\x0f\x46\x1d\x8a\x10\x4d\xe7\
-\x8c\x53\xe7\xe1\xae\xdb\xce\x43\x47\x5b\xbc\x0f\x1a\x0a\xcb\x65\
-\x94\x86\x87\x00\x66\x90\x6d\x23\x99\xcf\x83\x2c\x4d\xeb\x1d\x8e\
-\x5c\x7f\x35\x66\x41\xbd\xcb\xed\xba\xf4\x49\x3d\x8d\xc7\x9f\x24\
-\x00\xe3\xfc\xde\x35\x17\xb3\xa2\x5f\x02\xc8\x4e\xfc\x99\xae\x24\
-\x40\x85\x21\x4a\xc3\x43\x47\x0c\xfb\xc7\x39\x09\x60\x06\x56\x3d\
-\xbd\x1d\xdf\xfd\xe9\x4b\x72\x52\x9f\x10\x11\xf2\x3c\x1b\x37\x5e\
-\x73\x3a\xae\xbb\xfc\x14\x58\x56\xfc\x6e\xe7\x6f\xec\xfc\x27\x58\
-\xb6\x5d\x19\x09\xb0\xab\x4c\x02\x8e\xbe\x03\x6b\x90\x88\xae\xf1\
-\x3a\x97\x3e\x57\x5d\xe3\x8d\x21\x7e\xef\x98\x1a\x28\x1c\x58\xbf\
-\xd8\xb6\xd4\x3a\x06\xba\xde\xfc\xb5\x6a\x93\x00\xa5\x14\xfc\xc1\
-\x01\x28\xf5\xd6\x93\xed\xe2\x98\x04\xec\x3b\x30\x84\x6f\x7c\xf7\
-\x39\xec\xd8\x7d\x28\xea\x50\x84\x10\xe3\xde\xb6\xa8\x03\x1f\x7c\
-\xdf\x05\x98\xdf\x95\x9b\xfa\x9b\x0d\x71\xb4\xce\x7f\x02\x59\x16\
-\x92\xf9\x96\xd9\x27\x01\x93\x6c\xbf\x66\xa0\x17\xe0\x65\xc9\xae\
-\xe5\x5b\x67\xd7\x78\xe3\x68\xfa\x04\x80\x07\xd7\xb4\xfb\x25\x6b\
-\x0d\xc0\xa7\x1e\xeb\x7b\x66\x9b\x04\x70\x18\xa2\x38\x34\x08\x3e\
-\x4a\xe7\x3f\x21\x2e\x49\x00\x33\x63\xd5\xd3\x3b\xf0\xd0\x4f\x5e\
-\x94\x43\x7b\x84\x30\x90\xeb\xd8\x78\xf7\x75\xa7\xe3\xfa\x2b\x4e\
-\x85\xe9\x85\x04\x27\xeb\xfc\x27\x90\x65\x21\x91\xcb\xc3\x72\x66\
-\x78\x7e\xc0\xf4\x0a\xb0\xbd\xea\x79\xc1\x72\x6a\xbd\xbc\x7f\x66\
-\x8d\x37\x16\xc3\xdf\x26\xb5\xc5\xbc\xc9\x2b\x77\x0f\x3e\xc2\x44\
-\xef\x98\xea\x7b\x67\x9a\x04\xa8\x30\x40\x69\x68\x68\xd2\xce\xff\
-\x30\x22\x24\x72\x79\xd8\x86\x26\x01\xc3\x23\x25\x7c\xfd\xa1\xe7\
-\xf0\xd2\xab\xfb\xa3\x0e\x45\x08\x31\x85\xd3\xdf\xde\x85\x7b\xde\
-\x7f\x11\x5a\xf3\x66\x16\x10\x9a\x4e\xe7\x3f\x81\x2c\x42\x22\xd7\
-\x0a\x6b\xba\x35\x10\x66\x50\x82\x9d\x41\x4f\x26\x06\x0f\x5d\x4f\
-\x6f\xbf\xb1\x69\x57\x2f\x37\x6d\x02\xc0\xcc\xe4\xf7\xae\xfd\x2a\
-\x98\x3e\x34\xed\xd7\x84\x01\xc2\x69\x24\x01\xac\xc2\xca\x82\xbf\
-\xe9\x74\xfe\xe3\x4c\x1d\x09\xd8\xf4\xda\x01\x7c\xed\xa1\xe7\x30\
-\x34\x5c\x8c\x3a\x14\x21\xc4\x34\x65\x33\x09\x7c\xf0\xbd\xe7\xe3\
-\x9c\x25\xc7\x45\x1d\xca\x11\x66\xd2\xf9\x4f\x20\xcb\x42\x22\xdf\
-\x02\x6b\xaa\xe9\x80\x19\x9e\xbf\x32\xee\xdb\x5e\xe7\xd2\xdf\x20\
-\xa2\xa6\x2c\x55\xda\xb4\x09\x40\xa9\x7b\xed\x5f\x03\xf8\xef\x33\
-\x7d\xdd\x54\x49\xc0\x74\x86\xfd\x8f\xc5\xa4\x24\xc0\x2f\x87\x78\
-\xf8\x91\x8d\x78\x7c\xed\xb6\x86\x3e\x9d\x50\x88\x46\x76\xc9\xf9\
-\x8b\x70\xd7\xed\xe7\x21\xe1\xce\xee\x18\x5e\x9d\x66\xd3\xf9\x4f\
-\x98\x72\x4d\xc0\xec\x3a\xff\x0a\xc6\xff\x4c\xcc\x5d\xf6\xe7\x33\
-\x7f\x61\xfc\x35\x65\x02\xe0\x77\xaf\xb9\x8f\x41\x5f\x9a\xed\xeb\
-\x8f\x95\x04\xb0\x52\x28\x1d\x63\xc1\xdf\x74\x99\x90\x04\xec\x3d\
-\x30\x88\xaf\x7c\xfb\x19\xec\x3d\x30\x18\x59\x0c\x42\x08\x3d\xe6\
-\x76\xe6\xf0\xd1\xbb\x2e\xc6\xf1\xc7\xb5\x46\x16\x43\x35\x9d\xff\
-\x04\xb2\x6c\x24\x5a\x5a\x60\xbd\xb9\x4e\x40\x35\x9d\x7f\x05\x13\
-\x70\xaf\xd7\xb5\xec\xab\xb3\x0e\x2e\xa6\x9a\x2e\x01\x28\xf4\xac\
-\xbd\xca\x52\xf8\x39\x08\x33\x3b\x94\xfa\x4d\xde\x9c\x04\x54\x3a\
-\xff\x41\x28\x55\xfd\x02\xb9\xa8\x92\x00\x66\xc6\x8a\xa7\xb6\xe0\
-\x87\x3f\xdf\x84\x20\x9c\x7d\x12\x23\x84\x30\x8b\xe3\x58\xb8\xed\
-\x86\xb3\xf0\x8e\x4b\x4f\xaa\xfb\x51\xc3\x3a\x3a\xff\x09\x6f\x99\
-\x0e\xa8\xbe\xf3\x9f\x50\x66\xc6\x8d\xc9\xb9\xcb\x56\x54\xdb\x50\
-\x9c\x34\x55\x02\x50\xea\x5b\xb7\x04\x21\x56\x03\xac\x25\x15\x9e\
-\x48\x02\x54\xa8\x50\x1c\x1a\xd0\x5a\xde\xb7\xde\x49\x40\xa9\x14\
-\xe0\xab\x0f\x3d\x8b\x5f\xbd\xb4\xb7\x2e\xd7\x13\x42\xd4\xdf\x39\
-\x4b\x8e\xc3\x87\xef\xb8\x10\xa9\x64\x7d\xee\x2b\x3a\x3b\xff\x09\
-\x64\xdb\x48\xb6\xb4\x80\x2c\x5b\x57\xe7\x3f\x61\x08\x8a\x2f\x4b\
-\xcc\x5b\xfe\x92\xae\x06\x4d\xd7\x34\x09\xc0\x68\xcf\xb3\xf3\x1d\
-\x55\x5e\x07\xc2\x22\x9d\xed\xaa\xb2\x8f\xb1\xfd\xaf\x23\x0c\x6a\
-\x50\x10\xa7\x4e\xbb\x03\xba\x7b\x86\xf1\x85\x6f\xac\xc3\xfe\x83\
-\x43\x35\xbd\x8e\x10\x22\x7a\x73\xe7\x64\xf1\xc9\x7b\x96\xd7\xbc\
-\x66\x40\x2d\x3a\xff\x09\xb6\xe3\x20\x3d\x7f\x11\x2c\xb7\xaa\x81\
-\xdc\xa3\xd9\x59\x86\xbd\x2c\xdb\x75\xf1\x01\xdd\x0d\x9b\xa8\x29\
-\x12\x00\xde\xb1\x32\xe9\x67\x92\x4f\x02\xb8\x48\x6b\xbb\xcc\x08\
-\x47\x07\x11\x94\x8a\x28\x0d\x0d\xd6\xe4\x8d\x5e\xeb\x91\x80\x0d\
-\x2f\xef\xc3\x57\x1f\x78\x16\x85\x62\xe3\x9d\x4c\x28\x84\x38\xba\
-\x44\xc2\xc1\x87\xdf\x77\x21\xce\x3b\x6b\x41\x4d\xda\xaf\x65\xe7\
-\x3f\x71\x4f\xb4\x13\x49\xd8\xd9\xd6\x5a\x4c\x69\xac\xf3\x06\xfb\
-\xaf\x6a\x86\xed\x81\x4d\x91\x00\x14\xbb\xd7\x7e\x91\x80\x8f\x6a\
-\x6d\x94\x81\x60\x6c\x08\x1c\xf8\x00\x80\x30\x08\x62\x95\x04\x28\
-\xc5\x78\xe4\xb1\x57\xf0\x93\x5f\xbe\x2a\xab\xfc\x85\x68\x42\x44\
-\x84\xab\x96\x9d\x84\xf7\xde\x74\x36\x6c\x8d\x65\x84\xeb\xd1\xf9\
-\x4f\xdc\x0b\xc9\x71\xe1\x64\x5a\xb4\x5f\x87\x99\xee\x4f\xce\x5d\
-\xfa\x9b\xda\x1b\x36\x4c\xc3\x27\x00\x7e\xcf\xba\x4f\x30\xf3\xfd\
-\xba\xdb\x0d\xc7\x86\xa1\xca\x47\x26\x88\x71\x49\x02\x46\xc6\x7c\
-\x7c\xf9\x5b\xeb\xf1\xca\x96\x6e\x0d\x91\x09\x21\xe2\xec\x94\xb7\
-\x75\xe2\xa3\x77\x5d\x82\x7c\xae\xfa\x23\x86\xeb\xd9\xf9\x4f\xb0\
-\xdc\x04\xec\x74\x16\xba\xbb\x33\x02\x7f\xcc\xeb\x5a\x3e\xeb\xdd\
-\x62\x71\xd0\xd0\x09\xc0\xf8\x01\x3f\x4f\x02\xd0\x7a\x78\x76\x58\
-\x18\x83\xf2\xc7\x8e\xfe\x35\xc3\x93\x80\x5d\x7b\xfa\x71\xff\x37\
-\xd6\xa2\x7f\xa0\xa0\x31\x32\x21\x44\x9c\x75\xb4\xa5\xf1\xc9\x0f\
-\x2d\xab\x6a\xab\x60\x14\x9d\xff\x04\x2b\x91\x82\x9d\xcc\xe8\xbe\
-\x6c\x91\xc8\xba\xdc\xeb\xbc\xe4\x59\xdd\x0d\x9b\xa2\x61\x13\x00\
-\xde\xb3\xbe\xc3\xf7\xd4\xb3\x00\x4e\xd4\xd9\x6e\xe8\x17\xa0\x0a\
-\xa3\x93\x7f\x8f\xa1\x49\xc0\x0b\x9b\xf6\xe1\x2b\xdf\x79\x5a\x6a\
-\xf9\x0b\x21\xde\x22\xe1\x3a\xb8\xf7\xae\x8b\x66\x55\x3d\x30\xca\
-\xce\x7f\x82\x9d\xcc\xc2\x4a\x68\x2e\x7f\xcc\x78\xdd\x0b\xdd\x0b\
-\xe8\xb8\x0b\x7b\xf5\x36\x6c\x06\x6b\xea\x6f\x89\x1f\xe6\x07\x6c\
-\xdf\x0b\xbf\x09\xcd\x9d\xbf\x2a\x97\xa0\x0a\x47\x7f\xf2\x7f\x23\
-\xdb\x71\x90\xc8\xb7\xa0\x16\x27\x72\x30\x18\xa5\xa1\x21\xa8\xf2\
-\xcc\x16\xed\x3d\xb6\x7a\x2b\xfe\xe3\xbf\xd6\x49\xe7\x2f\x84\x38\
-\xaa\x52\x39\xc0\xbf\x7f\x63\x1d\x1e\x5f\x3d\xb3\x43\xf2\x4c\xe8\
-\xfc\x01\x20\x2c\x8e\x42\x95\x7d\xdd\x01\x2c\x2a\xbb\xe5\x6f\x33\
-\x3f\x50\xe5\xd9\xc4\x66\x6a\xc8\x04\xc0\xef\x5d\xf8\xb7\x00\x5d\
-\xaf\xb3\x4d\x15\x94\x11\x8e\x0d\x03\x98\xde\x9b\xdc\x94\x24\x40\
-\x29\xc6\x03\x3f\xdc\x80\x07\x7f\xb4\x01\x4a\xc9\x62\x3f\x21\xc4\
-\xb1\x29\xc5\xf8\xce\x8f\x36\xe0\x81\x1f\x6e\x98\x56\x7f\x6e\x4a\
-\xe7\x5f\xc1\x08\x0b\xc3\xe0\x50\xef\x8e\x26\x66\x5c\xe3\xf7\x1c\
-\xff\x17\x5a\x1b\x35\x44\xc3\x4d\x01\x94\x0e\xae\xb9\x0d\x44\xdf\
-\x83\xc6\xbf\x1b\xab\x10\xe1\xc8\xc0\xac\x56\xcb\x47\x39\x1d\x50\
-\x2a\x07\xf8\xca\xb7\x9e\xc6\x86\x97\xe5\x14\x3f\x21\xc4\xcc\x9c\
-\x7b\xc6\x71\xb8\xf7\x03\x17\xc3\xf3\x8e\xfe\xf0\x6b\x56\xe7\xff\
-\x86\xd7\x12\xc1\xce\xb6\x80\x2c\xad\xe7\x1f\x30\x40\x77\x24\xba\
-\x96\x3e\xa4\xb3\xd1\xa8\x35\x54\x02\x50\xec\x59\x75\x2a\xb1\xfd\
-\x34\x80\xbc\xae\x36\x59\x31\xc2\xd1\xfe\x59\x1d\xee\x33\x21\x8a\
-\x24\x60\x68\xb8\x88\xcf\x7f\x75\x35\x76\xed\x19\xd0\x7e\x4d\x21\
-\x44\x73\x38\x71\x61\x3b\x3e\xf5\xe1\xe5\x6f\xd9\x21\x60\x6a\xe7\
-\x7f\x98\x65\xc3\xd1\x5f\x23\x60\x18\x36\x2d\x4d\x74\x2c\x7d\x59\
-\x67\xa3\x51\x6a\x98\x04\x80\xfb\xd6\xe5\xfd\x10\x4f\x03\x7c\xaa\
-\xbe\x46\x81\x60\x6c\x10\x1c\x54\x3f\xa4\x54\xcf\x24\x60\xff\xc1\
-\x21\xfc\xdb\x7f\xae\x46\x5f\xff\xd4\xeb\x15\x84\x10\x62\x32\x73\
-\xda\x32\xf8\xad\x7b\x97\x63\x5e\x57\xe5\xb9\xca\xf8\xce\x7f\xa2\
-\x2d\x7b\xbc\x46\x80\xce\x5e\x8e\xf1\xb2\x47\xc5\x4b\xa8\xeb\xea\
-\x11\x8d\xad\x46\xa6\x61\xd6\x00\xf8\x4a\xfd\xab\xd6\xce\x1f\x40\
-\x58\x1c\xd1\xd2\xf9\x03\xf5\x5b\x13\xb0\x6d\x57\x1f\x3e\xf7\x85\
-\xc7\xa5\xf3\x17\x42\x68\xd1\xdb\x3f\x8a\xcf\xfd\xdf\x27\xb0\x73\
-\xcf\xa1\xd8\x74\xfe\x00\xc0\x61\x19\x61\x69\xf2\x1d\x5b\x33\x46\
-\x58\x52\x42\xf2\x9f\xf4\x36\x1a\x9d\x86\x18\x01\x28\x75\xaf\x7b\
-\x1f\xc0\x0f\xea\x6c\x53\x95\x4b\xe3\x8b\xfe\xf4\xaa\xe5\x48\xc0\
-\xf6\x3d\x83\xf8\xe2\xf7\x36\xa2\x54\xaa\xc1\xb9\x04\x42\x88\xa6\
-\xe6\xb9\x0e\xee\x7b\xcf\x19\x78\xfb\x22\xfd\xc7\x0a\xd7\xb2\xe4\
-\xb9\x9d\xca\xc2\xf2\x34\x6f\x0f\x04\xee\x4c\x74\x2d\xfb\x8e\xee\
-\x46\xeb\x2d\xf6\x09\xc0\x58\xdf\xba\x85\x76\xc0\x1b\x40\x68\xd7\
-\xd5\x26\x87\x01\x82\x91\xda\xcd\x9d\xd7\x22\x09\x78\x75\x47\x1f\
-\xfe\xf3\xe1\x57\x50\x0e\x64\x9b\x9f\x10\xa2\x36\x6c\x9b\x70\xcf\
-\x2d\x4b\x70\xe6\xc9\x73\xb4\xb5\x59\xf3\x93\x4f\x09\xb0\xd3\x2d\
-\x3a\x4f\x0d\x04\x40\x03\xca\x09\xce\x49\xb5\x5f\xf6\xba\xc6\x46\
-\xeb\x2e\xd6\x53\x00\xcc\x6c\x39\x21\x7f\x4d\x67\xe7\x0f\xa5\x10\
-\x8c\xd5\xf6\x54\x3c\xdd\xd3\x01\x1b\xb7\xf6\xe2\xcb\xdf\xdf\x24\
-\x9d\xbf\x10\xa2\xa6\xc2\x90\xf1\xf5\x1f\xbe\x82\x17\x37\xf7\x68\
-\x69\xaf\x2e\xc7\x9e\x73\xa5\x74\x3b\xaa\x58\xc8\x7d\x94\x46\x5b\
-\x29\x70\xbe\x1e\xf7\xfa\x00\xb1\x1e\x01\x28\x75\xaf\xfd\x53\x00\
-\x7f\xa5\xe3\x04\x28\x34\x00\x00\x20\x00\x49\x44\x41\x54\xb3\xcd\
-\x60\x74\x00\x5c\x8b\xa3\x7d\x8f\x42\xc7\x48\xc0\xf3\x2f\x77\xe3\
-\xdb\x8f\xbc\x82\x50\xe7\x7b\x5b\xc4\x13\x01\x16\x59\x20\xb2\x40\
-\x16\xc1\x26\x80\x2c\x0b\x04\xaa\x24\x9b\x54\xb9\xe1\x1e\xce\x3b\
-\x27\x7e\x1f\x7f\xfb\x31\x57\xd6\x93\x00\x00\x14\x83\xc1\x60\xa5\
-\x10\x72\x65\x37\x0c\xb3\x82\x62\x35\xdd\x52\x18\xa2\x81\x59\x44\
-\xb8\xe3\x86\x53\x70\xd1\x99\xf3\x66\xdd\x46\x5d\x3a\xff\x37\x5e\
-\xcf\x76\xe0\x64\x5b\xa0\xb5\xdb\x63\xfc\xb7\xc4\xdc\x65\x7f\xa7\
-\xaf\xc1\xfa\x8a\x6d\x02\xe0\xf7\xac\xbb\x80\x15\xaf\x01\x41\xdb\
-\x81\xd0\x61\x61\x04\xca\x2f\xea\x6a\x6e\x7a\xd7\xac\x22\x09\x58\
-\xbb\x61\x3f\xbe\xfb\xe8\xe6\x5a\x2c\x27\x10\x06\x22\x22\xd8\xb6\
-\x05\xcb\xb2\x61\x59\x16\x2c\xcb\x1a\xff\xff\xca\xaf\x1a\x1c\x8b\
-\x7a\x54\xcc\x0c\xa5\x54\xe5\x57\xa8\x10\x4e\xfc\xb7\x0a\x11\x86\
-\x4a\x4e\x97\x6c\x12\x44\x84\xdb\xde\x71\x12\x2e\x3b\x7f\xe6\x47\
-\x0a\xd7\xbb\xf3\x9f\x50\x39\x38\x28\xa7\xb3\xc9\x32\x59\x7c\x99\
-\x37\x67\xf9\xd3\x3a\x1b\xad\x97\x58\x26\x00\x7c\x60\x43\xc6\xb7\
-\x0a\xcf\xe9\x5c\xf5\xaf\x4a\x45\x84\xc5\x68\x76\x76\xcc\x26\x09\
-\x58\xf5\xfc\x3e\x3c\xfc\xd8\x56\xb9\xd9\x36\x20\x1a\x7f\x92\xb7\
-\x6d\x1b\xb6\xe3\xc0\xb6\xc7\xff\xdb\x8e\xc7\x68\xa3\x52\x0a\x61\
-\xa8\x10\x86\x01\xc2\x40\x21\x08\x43\x84\x2a\x90\x91\x83\x06\x44\
-\x44\xb8\xe9\xca\xc5\xb8\xea\xa2\xe3\xa7\xff\x9a\x88\x3a\xff\x09\
-\x76\x32\x03\x2b\x91\xd2\xd9\xe4\x56\x0f\xc5\xf3\xe2\xb8\x35\x50\
-\x6b\xa9\xa4\x7a\x29\x59\x63\xff\x4c\x80\xb6\xce\xbf\x26\xdb\x45\
-\x66\x60\x62\x4d\xc0\x74\x93\x80\x27\x9f\xdb\x8b\x1f\x3c\x36\xb3\
-\x7a\xdd\xc2\x5c\x16\x11\x1c\xd7\x85\x63\xdb\x70\x5c\x07\x8e\x63\
-\x23\xa6\xb9\x39\x00\x1c\x1e\x91\x70\xdd\x37\xde\x5e\x18\x41\x10\
-\xa2\x1c\x04\x08\xcb\x01\xca\x61\x00\x96\xd2\xd4\xb1\xc7\xcc\xf8\
-\xd1\xe3\xdb\x01\x06\xae\xba\x78\xea\x24\x20\xea\xce\x1f\x00\xc2\
-\xd2\x28\xc8\x71\x41\xb6\xb6\xee\xef\xe4\x12\x25\x3f\x07\xe0\x53\
-\xba\x1a\xac\x97\xd8\xdd\x65\x4a\x07\xd7\xdc\x3e\x5e\xea\x57\x0b\
-\x66\xae\x94\xf9\x55\xd1\x2f\xa0\x9b\xce\x48\xc0\xd3\x2f\x1d\xc0\
-\x03\x3f\xdf\x2c\x4f\xfe\x31\x46\x44\xf0\x5c\x17\x8e\xeb\xc2\x75\
-\x6c\x58\x31\x79\xb2\xd7\x2d\x0c\x43\x04\x41\x80\x72\x10\x20\xf0\
-\xcb\x50\xf2\x9e\x8e\x2d\x22\xc2\x7b\xaf\x3d\x19\xcb\xce\x3d\xf6\
-\x49\x82\x26\x74\xfe\x87\x63\xb1\x2c\xd8\xd9\x36\xbd\xd3\x66\x8a\
-\x6e\x4b\xcc\x5b\xfa\x03\x7d\x0d\xd6\x5e\xac\x12\x80\xb1\xde\x35\
-\x0b\x6c\x45\x1b\x00\x74\xe8\x6a\x33\x2c\x0c\x43\xf9\x25\x5d\xcd\
-\x55\x6d\xb2\x24\xe0\xb9\x4d\x07\xf1\xad\x47\x5e\x95\x39\xff\x18\
-\xb2\x6d\x07\x9e\xeb\x54\x9e\xf4\x1d\xa7\x16\xf5\xa0\x62\x2f\x0c\
-\x03\xf8\xe5\x00\x41\xb9\x8c\x72\x59\x6a\x59\xc4\x0d\x11\x70\xd7\
-\xbb\x4f\xc3\x05\xa7\xcf\x7d\xeb\xd7\x0c\xea\xfc\x27\xe8\x5e\x0f\
-\xc0\x40\x6f\x48\xee\xd9\x99\xce\x0b\x63\x73\xf8\x4a\xac\xa6\x00\
-\x6c\xc6\xbf\x41\x63\xe7\xaf\xfc\xa2\x51\x9d\x3f\x30\x3e\x1d\x90\
-\xcb\xbf\xa5\xda\xd6\xc6\xcd\x3d\xf8\xce\xcf\xa4\xf3\x8f\x0d\x02\
-\x3c\xc7\x85\x97\xf0\xe0\x3a\x2e\xc8\x92\x1e\x7f\x2a\xb6\xed\x20\
-\x65\x3b\x40\x32\x09\x56\x8c\x72\xb9\x8c\x92\xef\x23\x28\x07\xbf\
-\xde\x9d\x20\x8c\xc5\x0c\x7c\xfb\x27\xaf\xc1\xb6\x08\xe7\x9e\xda\
-\x75\xf8\xcf\x4d\xec\xfc\x81\x4a\xb1\x37\xf2\x5d\x6d\x45\x82\x08\
-\x98\xe3\xb0\xff\x1f\x00\x6e\xd2\xd2\x60\x1d\xc4\xe6\xae\x54\xea\
-\x59\x77\x27\x98\xbf\xa5\xab\x3d\x56\x21\x82\xe1\x01\x98\xba\x32\
-\xe9\x8d\x23\x01\x9b\x77\x1e\xc2\x17\xbf\xb7\x11\x61\x68\x66\xac\
-\xe2\xd7\x1c\xc7\x81\xe7\xb9\xf0\x12\x09\x58\xf2\x98\xaf\x05\x33\
-\xa3\xec\x97\xe1\xfb\x3e\xca\x92\x0c\x18\xcf\xb1\x2d\x7c\xf8\xd6\
-\x25\x58\x72\x52\x87\xb1\x9d\xff\x1b\x39\xd9\x56\x9d\xeb\x01\x00\
-\xe2\xbb\x13\x9d\xcb\xbf\xa9\xaf\xc1\xda\x89\xc5\x1d\x8a\x07\xd7\
-\xb4\x97\x4b\xf4\x32\x03\x6f\x1d\x5b\x9a\x55\x83\x5c\xd9\xef\x1f\
-\x46\x3f\xef\x3f\x99\x30\x08\xb0\xf1\xa5\x5d\xf8\xe2\x43\x2f\x22\
-\x90\x8d\xfe\xc6\x72\x1c\x1b\x89\x44\x02\x9e\xe7\xd5\x6d\x2b\x5e\
-\xb3\x62\xc5\xf0\xcb\x3e\x4a\xa5\x12\x02\x29\x7c\x65\x2c\xd7\xb1\
-\xf1\xf1\xf7\x9d\x85\x33\xce\x58\x64\x74\xe7\x0f\xd4\xa4\x3e\x40\
-\x5f\x99\xe9\x8c\xec\xdc\xa5\x07\x75\x35\x58\x2b\xb1\xa8\x04\xe8\
-\x97\xe8\x1f\xb4\x75\xfe\xa8\xec\xf7\x37\xbd\xf3\x07\x80\x5d\xfb\
-\x86\xf0\x95\x87\x37\x4a\xe7\x6f\x20\x8b\x08\x89\x44\x02\x2d\x2d\
-\x39\xe4\xf3\x79\x24\x12\x09\xe9\xfc\xeb\x80\xac\xca\xbf\x7b\x3e\
-\x9f\x47\x4b\x4b\x1e\xa9\x64\x52\xa6\x57\x0c\x54\x0e\x42\x7c\xf1\
-\xbb\x1b\xb1\x63\x6f\x6d\xab\xaa\xea\xc0\x61\x80\xb0\xa0\x75\x17\
-\x58\x87\x6b\xa9\xfb\x75\x36\x58\x2b\xc6\x7f\x72\x0a\x3d\xeb\xae\
-\xb6\x98\x7f\x09\x4d\xb1\xd6\xea\x90\x1f\xdd\xf6\x1f\x1c\xc2\xe7\
-\xbe\xf0\x38\x0a\x05\x3d\xa7\x11\x0a\x3d\x1c\xc7\x41\x32\x91\x80\
-\xeb\xb9\xd2\xe1\x1b\x82\x79\x7c\x54\xa0\xe8\x23\xa8\x53\x15\x4f\
-\x31\x3d\xe9\x94\x87\x3f\xfe\xf4\x55\x98\xdb\xa9\xb5\xf8\x4e\x4d\
-\xd8\xe9\x1c\x2c\x37\xa1\xb1\x45\x7a\x7f\xa2\x6b\xe9\x43\x1a\x1b\
-\xd4\xce\xe8\x3b\x18\xef\x7b\x36\xed\x3b\xe5\x17\x01\x9c\xa4\xa5\
-\x41\x15\x22\x18\x19\x30\x7e\x0b\xdd\xd0\x70\x11\x7f\xf7\xf9\x95\
-\x72\xa4\xaf\x41\x3c\xd7\x45\x32\x95\x84\xe3\xc4\x6a\xdd\x6c\xd3\
-\x09\x82\x10\xa5\x62\x09\x7e\xb9\x24\x0b\x66\x0d\x31\xa7\x2d\x83\
-\x3f\xfa\xf4\xd5\xc8\xe7\x74\x76\xae\xfa\x11\x11\x9c\x5c\x1b\x40\
-\x7a\x06\xc6\x09\x38\xe8\x7a\xc1\xe9\xd4\x7a\x79\xbf\x96\x06\x6b\
-\xc0\xe8\x29\x80\xb2\x5d\xfe\x4b\xe8\xea\xfc\xc1\x95\xa1\x7f\xc3\
-\xef\x0a\x7e\x39\xc4\xfd\x5f\x5f\x2b\x9d\xbf\x01\x88\x30\x3e\xcc\
-\x9f\x47\x36\x97\x95\xce\x3f\x06\x1c\xc7\x46\x26\x9b\x3e\x3c\x3d\
-\x20\x0b\x31\xa3\xd7\xdb\x3f\x8a\xcf\x7f\x75\x15\x4a\x86\x6f\xed\
-\x64\x66\x04\x63\xfa\x8a\xf9\x31\x30\xb7\x54\x76\xfe\x46\x5b\x83\
-\x35\x60\xec\xa7\xc3\xef\x5d\x7d\x11\x2b\x6b\x2d\x00\x2d\x55\x52\
-\x54\xa9\x80\xb0\x18\x5d\xb5\xbf\xe9\x60\x06\xfe\xfd\x1b\x6b\xf1\
-\xc2\xa6\x7d\x51\x87\xd2\xd4\x88\x2c\x24\x93\x09\x24\x93\x32\xaf\
-\x1f\x77\xcc\x8c\x62\xb1\x88\x62\xb1\x64\x7c\xf2\xdf\xe8\xce\x3a\
-\x6d\x1e\x7e\xf3\x9e\xe5\xb0\x0c\x5f\xb3\x61\xa5\x32\xb0\x3d\x6d\
-\xa5\x82\x95\xc5\x7c\xb9\x3b\x77\xf9\x1a\x5d\x0d\xea\x64\xe4\x08\
-\x00\xf3\x4a\x87\x95\x75\x3f\x34\x75\xfe\x50\x21\x54\xc9\xfc\x27\
-\xea\x07\x7f\xb4\x41\x3a\xff\x08\x11\x01\xa9\x64\x12\xad\xad\x79\
-\xa4\x52\x49\xe9\xfc\x1b\x00\x11\x21\x95\x4a\xa1\xb5\xb5\x05\xa9\
-\x74\x4a\x46\x04\x22\xf4\xd2\xab\x07\xf0\xfd\x9f\x6d\x8c\x3a\x8c\
-\x29\xa9\xe2\x98\xce\xca\xb0\x96\x22\xba\x9f\xf9\x59\x23\xb7\x42\
-\x18\x99\x00\xf8\x3d\xc9\x3f\x06\x70\x9e\x9e\xd6\x18\x61\x61\xd8\
-\xf8\xec\xff\xb1\x55\x5b\xb0\x72\x8d\xd4\xf7\x8f\x02\x81\x90\x4c\
-\x26\xd0\xd2\xd2\x8a\x54\x3a\x25\x1d\x7f\x03\x22\x22\xa4\x92\x49\
-\xb4\xb4\xb4\x20\x95\x92\x9f\x71\x54\x56\x3c\xb9\x19\x8f\xaf\x36\
-\xfc\x3e\xc7\x0c\x35\x36\x02\x8d\x35\x62\xce\xf4\x7b\xca\xbf\xaf\
-\xab\x31\x9d\x8c\xfb\x14\x14\x0f\xae\x3e\x89\xc8\xda\x08\x40\x4b\
-\x79\xa6\x38\x0c\xfd\xbf\xf4\xea\x7e\x7c\xe1\x6b\x6b\xa1\xe4\x70\
-\x94\xba\x9a\x98\xe3\x4f\x26\x93\xb0\x2c\x23\x73\x61\x51\x23\xac\
-\x14\xc6\x0a\x45\x94\x4a\x66\x55\x02\x6d\x06\x96\x45\xf8\xc4\x07\
-\x97\xe1\x9c\x25\xf3\xa3\x0e\x65\x52\x9a\x4f\x0d\x1c\x53\x81\x5a\
-\x92\x3a\xee\xd2\x5d\xba\x1a\xd4\xc1\xb8\xbb\x1e\x91\xf5\x8f\xd0\
-\xd4\xf9\xb3\x0a\x11\x16\xcd\x1e\xfa\xdf\xb5\xa7\x1f\x5f\xfc\xe6\
-\x7a\xe9\xfc\xeb\xcc\x75\x1d\xe4\xf3\x79\xa4\xd3\x69\xe9\xfc\x9b\
-\x10\x59\x16\x32\x99\xca\x62\x41\xd7\x33\x72\x74\xb6\x61\x29\xc5\
-\xf8\xca\xb7\xd7\x63\xf7\xbe\x81\xa8\x43\x99\x54\xa8\x77\x2a\x20\
-\x6d\x39\xf4\xf7\xba\x1a\xd3\xc5\xa8\x3b\x5f\xf1\xe0\xba\xeb\x01\
-\xdc\xac\xa7\x35\x86\x2a\x68\x1d\xc6\xd1\x6e\x74\xcc\xc7\x7f\xfc\
-\xd7\x3a\xf8\xbe\xf9\x45\x89\x1a\x85\x6d\x59\xc8\x66\x33\xc8\xe5\
-\x72\xb0\x9b\xf4\x14\x3e\xf1\x6b\xb6\x6d\x23\x97\xcd\x22\x97\xcb\
-\x36\xed\xa9\x8c\x51\x28\xf9\x21\xbe\xf0\xb5\xb5\x18\x19\xf3\xa3\
-\x0e\x65\x12\xac\xb9\x66\x0c\xbd\xaf\x78\x70\xcd\x3b\x35\x36\x58\
-\x35\x63\x12\x00\xe6\x4d\x1e\x11\xfe\x45\x57\x7b\xaa\x54\x84\x0a\
-\xcc\x2d\xa2\xa3\x14\xe3\x4b\xdf\x7a\x5a\xb6\xfb\xd5\x0b\x01\xa9\
-\x74\x0a\xf9\xd6\x3c\x3c\xcf\x8b\x3a\x1a\x61\x18\xd7\x75\xd1\xda\
-\x92\x93\xc5\x9f\x75\x74\x68\x60\x0c\x5f\x32\x7c\xf4\x93\xc3\x00\
-\xaa\x54\xd0\xd6\x1e\x11\xfd\xa3\x49\x0b\x02\x8d\x49\x00\xfc\x9e\
-\xc1\x3f\x00\xf8\x54\x1d\x6d\xc5\x61\xe8\xff\xe1\x9f\x6d\xc4\x2b\
-\x5b\x8c\x2f\x15\xdd\x10\x5c\xc7\xa9\x2c\xfe\x4a\x26\x41\xe6\x2d\
-\x7b\x11\xc6\xa8\xec\x18\x68\xc9\xe7\xe0\x1a\x5e\xbf\xbe\x51\xbc\
-\xba\xb5\x1b\x3f\x7e\xf4\xe5\xa8\xc3\x98\x54\x65\x2a\x40\x5b\x39\
-\xf6\xd3\x4b\xbd\xe5\xdf\xd6\xd5\x58\xb5\x8c\xb8\x1b\x8e\xf5\xae\
-\x59\x60\x2b\x7a\x15\x40\x56\x47\x7b\xc1\xe8\x10\x38\x30\x77\x68\
-\xe9\x85\x4d\xfb\xf0\xef\xdf\x58\x67\xfc\xce\x84\xb8\x23\x22\xa4\
-\xd3\x29\x24\x12\x66\x57\x20\x13\x66\xf2\x4b\x3e\x46\x0b\x63\x60\
-\x83\x9f\x50\x1b\x01\x11\xe1\xe3\x77\x5f\x82\xf3\xce\x5c\x10\x75\
-\x28\xc7\x44\x8e\x0b\x27\xd3\xa2\xab\xb9\xa1\x32\xd3\x29\x26\x1c\
-\x16\x64\xc4\x08\x80\xad\xe8\xaf\xa1\xa9\xf3\x57\xe5\x92\xd1\x9d\
-\xff\xc1\xde\x11\x7c\xf5\x81\x67\xa5\xf3\xaf\x31\xcf\x73\xd1\xda\
-\x92\x97\xce\x5f\xcc\x9a\x97\xf0\xd0\x92\xcf\xc3\x93\xd1\x80\x9a\
-\x62\x66\x7c\xf5\xc1\x67\xb1\xbf\xdb\xdc\x33\x5a\x38\x28\xeb\xec\
-\x57\xf2\x0e\xd4\x5f\xe8\x6a\xac\x1a\x91\x27\x00\xfe\xc1\xf5\xe7\
-\x00\xf8\x90\x9e\xd6\xd8\xe8\xa1\xff\x92\x1f\xe2\xfe\xaf\xad\x41\
-\xb1\x64\xee\xda\x84\xb8\x23\x22\x64\x32\x69\x64\xb3\x59\x90\xac\
-\xee\x17\x55\xb2\x2c\x0b\xd9\x5c\x16\xd9\x6c\x06\xa4\xa9\x46\xbc\
-\x78\xab\x52\x29\x30\xfe\xde\x18\x14\x46\xa1\xeb\x80\x09\x22\xfa\
-\x68\xe9\xc0\x9a\xb3\xb4\x34\x56\x85\xe8\xdf\xd1\x96\xfa\x7b\x5d\
-\x71\x84\xc5\x31\x40\xdf\xb6\x0d\xad\x2a\x59\xee\x33\x46\x67\xb9\
-\x71\xe7\x38\x0e\x5a\xf2\x39\x79\xea\x17\xda\x79\x9e\x87\x96\x96\
-\x1c\x5c\x39\x0f\xa2\x66\x8c\x1f\x1d\x55\x21\x42\x7d\x15\x65\x6d\
-\x22\xfc\x93\xae\xc6\x66\x2b\xd2\x04\xa0\xd8\xb3\xe6\x26\x66\x5c\
-\xab\xa3\x2d\x0e\x03\x28\x5f\xdf\x6a\x4d\xdd\x56\x3c\xb5\x05\xbf\
-\x7a\x69\x6f\xd4\x61\x34\x24\x22\x20\x95\x4a\x21\x9f\xcf\xc9\x56\
-\x2e\x51\x33\x96\x65\x21\x97\xcf\x21\x95\xd6\x56\x1c\x46\xbc\xc9\
-\x0b\x9b\xf6\x61\xa5\xc1\x95\x02\x95\x5f\x04\x87\x7a\x1e\x32\x99\
-\xe8\x1d\x51\x6f\x0b\x8c\x2c\x01\x60\x5e\xe9\x10\xd3\xdf\xe9\x6a\
-\x2f\x2c\x8e\x1a\xbb\xe5\xff\xf5\xbd\x03\xf8\xe1\xcf\x37\x45\x1d\
-\x46\x43\xb2\x27\x6e\xca\x29\x2d\xb5\xa3\x84\x98\x52\x2a\x99\x1c\
-\x4f\x36\xa3\x1f\x40\x6d\x44\xdf\xff\xd9\x46\xec\xd9\x6f\x68\x91\
-\x20\x66\xa8\xa2\xbe\x13\x03\x89\xe8\xef\x99\x1f\x88\xec\xa9\x25\
-\xb2\x77\x70\xb9\x37\x75\x1f\x80\xd3\x75\xb4\x55\x59\xf8\x67\xe6\
-\xdc\x91\xef\x87\xf8\xf2\xb7\x9f\x46\x10\x6a\xdb\x46\x22\xc6\xb9\
-\x9e\x8b\x7c\x4b\x1e\x8e\x2d\xc3\xb2\xa2\xbe\x1c\xc7\x41\x4b\x2e\
-\x0f\xd7\x95\xf7\x9e\x6e\x41\xa0\xf0\xe5\x6f\x3d\x6d\x6c\x81\x34\
-\x15\x94\xa1\xca\xda\x4a\x48\x9f\x59\xee\x39\x5e\xd3\x1a\xb8\x99\
-\x8b\x24\x01\xe0\x1d\x2b\x93\xcc\xfc\x3f\xb4\xb4\xc5\x6c\x74\xad\
-\xff\x87\x7e\xf2\x22\x0e\xf6\xc8\xbc\xbf\x6e\xa9\x64\x12\xb9\x6c\
-\x56\x8a\xb6\x88\xc8\x90\x45\xc8\xe5\x64\x4a\xa0\x16\xf6\x77\x0f\
-\xe3\x7b\x8f\xbc\x14\x75\x18\xc7\x14\x16\x46\xb5\xad\x55\x60\xc2\
-\x9f\xf3\x96\x9f\x46\xb2\x70\x29\x92\x04\xa0\x94\x4e\x7d\x06\xc0\
-\xf1\x3a\xda\x52\xc5\x51\x40\x5f\x91\x06\xad\x36\xbc\xbc\x1f\x4f\
-\xad\xdf\x1e\x75\x18\x0d\x85\x88\x90\xcd\x65\xe5\xa6\x2b\x8c\x91\
-\x4a\x26\x91\xcb\x49\x32\xaa\xdb\x93\xeb\xb6\xe3\xc5\x57\xf6\x47\
-\x1d\xc6\xd1\xb1\xd2\x77\xc4\x3c\xe3\x84\x52\x4b\xdb\x27\xf5\x34\
-\x36\x33\x75\x4f\x00\xb8\x67\x55\xce\x22\xfe\x23\x2d\x6d\xa9\x10\
-\xaa\x5c\xd4\xd1\x94\x76\x43\xc3\x25\x7c\xf3\xfb\xcf\x45\x1d\x46\
-\x43\xb1\x6d\x1b\x79\xd9\x97\x2d\x0c\xe4\xba\x95\xe9\x28\x5b\xb6\
-\x9e\x6a\xc3\xcc\xf8\xfa\x43\xcf\x61\x68\xd8\xcc\x7b\xbc\xf2\x0b\
-\x3a\x0f\x0b\xfa\x1f\xdc\xb3\x2a\xa7\xab\xb1\xe9\xaa\xfb\xbb\xd5\
-\x67\xfb\x8f\x19\xe8\xd2\xd1\x56\x58\x30\x73\xe1\x1f\x33\xe3\xeb\
-\xdf\x7d\x16\x43\xc3\x72\xd4\xa8\x2e\x8e\xe3\x20\x97\xcf\xc1\x96\
-\x85\x57\xc2\x50\xb6\x65\x21\xdf\x92\x83\x23\x5b\x05\xb5\x19\x19\
-\x2d\xe1\xab\x0f\x1a\xba\x35\x90\x01\xa5\xa9\xee\x0c\x01\x9d\x3e\
-\xdb\xbf\xab\xa5\xb1\x19\xa8\xeb\xdd\x94\xf7\x3d\x3b\x07\x80\x96\
-\xbf\x24\x87\x81\xb1\x15\xff\x1e\x5b\xbd\x0d\x1b\x5f\x3d\x10\x75\
-\x18\x0d\xc3\xf3\x3c\xe4\xf3\x59\x58\x32\xc4\x2a\x0c\x47\x64\x21\
-\x97\xcf\xca\x81\x53\x1a\xbd\xbc\xf9\x20\x9e\x58\xb3\x2d\xea\x30\
-\x8e\x4a\x95\x4b\xe0\x30\xd0\xd5\xdc\x1f\xf2\xc0\x53\x6d\xba\x1a\
-\x9b\x8e\xba\x26\x00\xbe\x53\xfe\x43\x00\x5a\x86\x39\x54\xc1\xcc\
-\x85\x7f\x7b\x0f\x0c\xe2\xe1\x9f\x99\xbb\x78\x25\x6e\x92\xc9\x04\
-\xb2\xd9\x0c\x0c\x39\xb6\x42\x88\x29\x11\x08\xd9\x6c\x06\xa9\x94\
-\xac\x53\xd1\xe5\x7b\x8f\x6c\x34\xb6\x88\x9a\xc6\x6d\x81\x2d\x7e\
-\xc9\xfd\xac\xae\xc6\xa6\xa3\x6e\x09\x00\xef\x59\xdf\x01\xe0\xd3\
-\x5a\xda\x0a\x7c\xa8\xd0\xbc\x6d\x7f\xcc\xc0\x37\xbf\xf7\x2b\x04\
-\x81\x99\x8b\x12\xe3\x84\x08\xc8\x66\x32\x48\xa7\xd3\x51\x87\x22\
-\xc4\xac\xa4\x52\x49\x64\x32\x19\xc8\xc0\x55\xf5\xca\x41\x88\xaf\
-\x3f\xf8\xac\x91\x47\x07\xab\x20\x00\x97\x35\x8d\x46\x13\x7f\xb6\
-\x9e\xa3\x00\x75\x4b\x00\x7c\x8f\xff\x00\x9a\x9e\xfe\x4d\xad\xf7\
-\xff\xd8\xea\xad\xd8\xfe\x7a\x5f\xd4\x61\xc4\x1e\x81\x90\xc9\x66\
-\xe1\x25\x64\x18\x55\xc4\x5b\x22\xe1\x21\x93\xc9\x42\x46\xb0\xaa\
-\xb7\x63\xf7\x21\x3c\xb9\xd6\xcc\xa9\x80\xb0\xa4\x6d\x3d\x5a\xde\
-\x2f\x39\x75\x5b\x0b\x50\x97\x04\x80\x07\xd7\xb4\x03\xfc\x19\x1d\
-\x6d\x55\x4a\x31\x6a\x9b\x73\xd1\xa6\xaf\x7f\x0c\x3f\xfa\xc5\xc6\
-\xa8\xc3\x88\x3f\x02\xb2\xb9\xac\xac\xf4\x17\x0d\xc3\xf3\x5c\xe4\
-\x72\x19\xd9\x26\xa8\xc1\xc3\x3f\xdb\x84\xde\x7e\xf3\xa6\x7f\x39\
-\xd4\xb8\x23\x8d\x50\xb7\x51\x80\xba\x24\x00\x7e\x89\x7e\x1f\x1a\
-\x9e\xfe\x99\x59\xe7\x61\x0c\x5a\x7d\xf3\xfb\xcf\xa3\x64\x68\xe5\
-\xaa\xb8\x20\x10\x72\xd9\xac\x54\x57\x13\x0d\xc7\x75\x5d\x29\x5c\
-\xa5\x41\xa9\x1c\xe0\xdb\x0f\xbf\x10\x75\x18\x47\x15\x96\xc6\x74\
-\x9d\x16\xd8\xe2\x97\x9d\xdf\xd1\xd1\xd0\x54\x6a\x9e\x00\x70\xdf\
-\xba\x3c\x40\xbf\xa5\xa5\xad\x52\xc1\xc8\xa2\x3f\xeb\x9e\xdf\x85\
-\x97\x37\x1f\x8c\x3a\x8c\x58\x23\x22\xe4\xf2\x59\xb8\xf2\xe4\x2f\
-\x1a\x94\xe3\x3a\xc8\xe5\x72\x20\x4b\x92\x80\x6a\x6c\x7a\xed\x00\
-\x9e\xd9\xb0\x27\xea\x30\xde\x4a\x29\x7d\x07\xd2\x31\x7e\x97\xbb\
-\x57\x66\xf5\x34\x76\x6c\x35\x4f\x00\xfc\x10\x9f\x06\xb8\xb5\xda\
-\x76\x98\x35\xfe\xe3\x6a\x34\x32\xe6\xe3\xbb\x3f\x91\x55\xff\xd5\
-\xb0\xa8\x52\x52\x55\xf6\x4f\x8b\x46\xe7\x38\x36\x72\xd9\x9c\x8c\
-\x04\x54\xe9\x81\x1f\xfc\x0a\x23\xa3\xe6\xd5\x59\x51\xa5\x02\x98\
-\xb5\x3c\xa4\xb6\x95\x90\xbc\x57\x47\x43\x93\xa9\x69\x02\x50\xa9\
-\x6f\xac\xb4\x0c\x65\x54\xfe\x61\xcd\x5b\x01\x6a\xea\x1b\x31\x36\
-\x08\xc8\x66\xb3\x70\x1c\x39\xc6\x57\x34\x07\xc7\xb1\xc7\x4b\x07\
-\x47\x1d\x49\x7c\x8d\x8c\xf9\xf8\xee\x4f\xcd\x7b\xf0\x62\x66\x28\
-\x5f\xcf\x5a\x00\x02\x7e\x8f\x79\x65\x4d\x9f\x8a\x6a\x9a\x00\x94\
-\x5b\x5b\x3f\x02\xd0\xfc\x6a\xdb\x61\x66\xb0\xa6\x7f\x54\x9d\x36\
-\xbe\x6a\xe8\x50\x54\x4c\x10\x08\xb9\x4c\x16\x8e\xcc\xf9\x8b\x26\
-\xe3\x38\x0e\xb2\x59\xd9\x1d\x50\x8d\x75\xcf\xed\xc2\x2b\x5b\xcc\
-\x9b\x7a\x65\x7d\x0f\xab\x8b\xfd\x9e\xc4\xed\x3a\x1a\x3a\x96\x9a\
-\x25\x00\xcc\x0f\xd8\xcc\xf4\x07\x5a\xda\x32\xf0\xe9\x3f\x08\x15\
-\x1e\xf8\x91\x99\x8b\x51\xe2\x22\x9b\xcb\xc0\xf5\x64\xce\x5f\x34\
-\x27\xd7\x75\x91\xcd\x4a\x9d\x8b\x6a\x7c\xf3\xe1\x17\x8c\xab\xbb\
-\x52\x79\x60\xd5\x35\x5d\x4d\x5a\xce\xcd\x39\x96\x9a\x25\x00\x7e\
-\xcf\xa2\xdb\x01\xbc\xbd\xda\x76\x74\x0e\xa9\xe8\xb4\xe2\xc9\x2d\
-\xe8\xe9\x33\x6f\x3b\x4a\x5c\x64\xb3\x19\x59\xf0\x27\x9a\x9e\xe7\
-\x79\xe3\x95\x2e\xc5\x6c\xf4\xf6\x8d\xe0\xf1\x35\x5b\xa3\x0e\xe3\
-\x2d\x54\xa9\xa8\xeb\xa1\xf5\xa2\x72\xf7\xba\xcb\x74\x34\x74\x34\
-\xb5\x9c\x02\xf8\x7d\x1d\x8d\xb0\xaf\x6d\x51\x85\x36\x43\xc3\x25\
-\xfc\xfc\xf1\xd7\xa2\x0e\x23\xb6\xd2\xe9\x94\xd4\x4a\x17\x62\x9c\
-\xe7\x79\x48\xcb\xf1\xd6\xb3\xf6\xe3\x5f\xbe\x62\xdc\x89\x81\xcc\
-\x0a\x5c\xd6\x33\x0a\xa0\x08\x5a\x46\xd2\x8f\xa6\x26\x09\x80\xdf\
-\xb3\xee\x02\x80\x97\x55\xdf\x12\x23\x2c\x99\xf5\x83\x05\x80\x87\
-\x7f\xf6\x12\x8a\x25\xf3\x4a\x11\xc7\x41\x22\x91\x40\x32\x99\x8c\
-\x3a\x0c\x21\x8c\x92\x4c\x26\x91\x4c\x24\xa2\x0e\x23\x96\x4a\xa5\
-\x00\x3f\x5e\xf1\x4a\xd4\x61\xbc\x45\x58\x2c\x42\x4b\x79\x40\xe6\
-\x5b\x4b\xbd\x6b\x4f\xaf\xbe\xa1\xb7\xaa\x49\x02\xc0\x8a\xb5\x3c\
-\xfd\xab\x52\x11\x30\xec\xe9\x7f\xf7\xbe\x01\xac\x7b\x7e\x57\xd4\
-\x61\xc4\x92\xeb\xba\x52\xdb\x5f\x88\x63\x48\x67\xd2\x32\x32\x36\
-\x4b\xab\x9e\xde\x8e\xd7\xf7\xf6\x47\x1d\xc6\x91\x58\x41\xf9\x5a\
-\x76\x88\x11\x33\x6a\x52\x18\x48\x7b\x02\x30\xda\xb3\xea\x38\x00\
-\xef\xd3\xd1\x56\x68\xe0\xbe\xff\x07\x7e\xb8\x41\x53\xb1\xa7\xe6\
-\xe2\x38\x36\xb2\x59\xd9\xfa\x24\xc4\x64\x32\x99\x0c\x6c\x5b\xb6\
-\xc4\xce\x14\x33\xf0\x9d\x1f\x6d\x30\x6e\xb1\xb8\xae\xca\xb5\xc4\
-\xf8\xc8\xc8\xc1\x75\x73\xb5\x34\xf6\x06\xda\x13\x00\x87\xed\xdf\
-\x02\xa1\xea\x34\x56\xf9\xe6\x55\xfd\x7b\x66\xc3\x1e\x6c\xdd\xd9\
-\x1b\x75\x18\xb1\x63\x59\x96\x74\xfe\x42\x4c\x03\x11\x90\xcb\x65\
-\x61\x59\x75\x3d\xa9\xbd\x21\x6c\xdf\xd9\x87\x17\x36\xed\x8b\x3a\
-\x8c\x23\x29\xa5\x6b\x11\x7b\xd2\xb5\xf8\x37\x75\x34\xf4\x46\x5a\
-\xdf\x65\xbc\xe5\xa7\x09\x06\x3e\x5e\x7d\x43\x40\x58\x34\xeb\xe9\
-\xdf\x2f\x87\xf8\xc1\xcf\xcc\x2b\x3c\x11\x07\xd9\x6c\x46\x6e\x68\
-\x06\x21\x22\x58\x6f\xfa\x25\x95\xe9\xcc\x51\x49\x98\x33\x20\xa9\
-\x11\x30\x63\x0f\xfd\xf8\x45\xf8\x86\x9d\xc9\x12\x96\xf4\xf4\x65\
-\xc4\xf8\x74\xa5\xb8\x9e\x3e\x5a\x2b\xb0\xf8\xf9\xf6\xf7\x13\xb8\
-\xb3\xda\x76\x54\xe0\x1b\x37\xf7\xbf\xe2\xa9\x2d\xe8\xeb\x37\xf3\
-\x20\x22\x93\x65\x32\x69\x29\xf1\x5b\x07\x96\x65\xc1\x76\x6c\x58\
-\xb6\x0d\xdb\xb6\xe0\x38\x36\x88\x6c\x58\x16\x81\x2c\x0b\x96\x45\
-\xd3\x4e\xc2\x94\x52\x50\x8a\xc1\xe3\xbf\x2b\xa5\xa0\xc2\x10\x61\
-\x10\x22\x54\x95\xdf\x95\x61\xa3\x73\x8d\xc6\x71\x1c\xa4\xd3\x29\
-\x8c\x8e\xc9\x3d\x67\x26\x0e\x0d\x8c\x61\xe5\x9a\xad\x78\xe7\x55\
-\xa7\x46\x1d\xca\xaf\xa9\x10\x1c\xf8\x20\xa7\xba\x81\x71\x06\xba\
-\xfc\xd6\xd6\xf7\x00\xf8\x96\x9e\xc0\x34\x27\x00\x20\xfe\x94\x8e\
-\x66\xf4\x15\x51\xd0\xa3\x50\x28\x63\xc5\x53\x9b\xa3\x0e\x23\x76\
-\xbc\x84\x87\x84\xac\x6c\xd6\x8a\x40\x70\x5c\xe7\xd7\xbf\x9c\xca\
-\x2f\x9d\x07\xcc\x58\x96\x85\x4a\xae\x70\xec\xb9\x68\x56\x8c\x20\
-\x28\x23\x28\x07\x08\x82\x10\xe5\x20\x40\xe8\x07\x60\x4d\x87\xa2\
-\x0b\x20\x91\x4c\x20\x08\x43\x94\x4a\x52\x6a\x7c\x26\x7e\xfe\xc4\
-\x6b\xb8\xfc\x92\xc5\x48\xa7\xcc\x59\x50\x19\x96\x8a\x70\xaa\x4c\
-\x00\x00\x80\xd9\xfa\x4d\x98\x98\x00\x94\x0e\xae\x3b\x1b\xe0\xe5\
-\xd5\xb6\xc3\x61\x08\x15\x98\xb5\xc5\xee\x17\x4f\xbe\x86\x42\xc1\
-\xac\x98\x4c\x67\xdb\x36\x32\xb2\xe2\xbf\x6a\x44\x04\x2f\xe1\xc2\
-\x75\x3d\xb8\x9e\x03\xc7\x73\x8d\x18\x1a\x26\x8b\xe0\x7a\x1e\xdc\
-\x37\xac\x5a\x67\x66\x94\xcb\x01\xca\xbe\x8f\xb2\x5f\xf9\xdd\xb4\
-\x45\x59\x71\x93\xc9\xa4\x10\x86\x95\x24\x4b\x4c\x4f\xa1\x50\xc6\
-\x63\xab\xb6\xe2\xa6\xeb\x96\x44\x1d\xca\x61\x1c\xf8\x60\x15\x80\
-\xac\xea\xba\x5c\x02\x5f\x51\x3a\xb0\xfa\xcc\xc4\xbc\x4b\x37\xea\
-\x88\x4b\x5b\x02\xc0\x16\x7f\x8a\x34\x7c\xd6\x4d\x3b\xf1\x6f\x64\
-\xcc\xc7\xca\x35\xdb\xa2\x0e\x23\x56\x88\x48\xce\x3e\xaf\x82\xed\
-\xd8\xf0\x3c\x0f\x5e\x22\x01\x2f\x69\x46\x87\x3f\x1d\x44\x04\xcf\
-\x73\xe1\xbd\xa1\xbc\x73\xd9\x2f\xa3\x54\x2a\xa1\x5c\xf2\x11\x94\
-\x43\x19\x21\x98\x31\x42\x36\x93\xc1\xe0\xd0\xb0\x24\x53\x33\xb0\
-\xe2\xa9\xcd\xb8\x6a\xf9\x49\xc8\x66\xcc\x19\x81\x54\xa5\x22\xec\
-\x54\xf5\x27\xfc\x92\x65\x7d\x1c\xc0\xef\x56\x1f\x91\xa6\x45\x80\
-\xdc\xbd\x32\x4b\x8c\xdf\xa8\xba\x1d\xd6\xb6\x62\x52\x9b\x9f\x3f\
-\xfe\x1a\x4a\xa5\x20\xea\x30\x62\x25\x9d\xc9\xc0\xb2\x65\xd1\xdf\
-\x4c\xd8\x8e\x83\x4c\x36\x83\x8e\xce\x76\x74\x74\x76\x20\xd7\x92\
-\x43\x22\xe9\xc5\xa6\xf3\x3f\x16\xd7\x73\x91\xcd\x65\xd1\x36\xa7\
-\x1d\xed\x5d\xed\xc8\xb5\xe4\xe4\xfc\x87\x19\xb2\x64\x34\x6d\xc6\
-\x4a\x7e\x88\x15\x4f\x6d\x89\x3a\x8c\x23\x28\xbf\xa4\xa5\xaa\x2d\
-\x03\x1f\xe6\x03\x1b\xb4\xd4\x8f\xd6\x72\x97\x2e\x53\xf2\x2e\x00\
-\xf9\x6a\xdb\x31\xed\xc4\xbf\xc1\xe1\x02\x9e\x5c\x27\x4f\xff\x33\
-\x91\xf0\x12\x48\xc8\x0d\x7e\x5a\x2c\xcb\x42\x26\x9b\x41\x7b\x67\
-\x07\x3a\x3a\xdb\x91\xc9\x65\x60\x37\xf0\x82\x49\xdb\xb6\x91\x4a\
-\xa7\xd0\xd6\xd1\x86\x8e\xce\x76\xa4\xb3\x69\xd8\x92\x28\x4e\x8b\
-\x97\xf0\xe0\x25\xcc\x99\xd3\x8e\x83\xc7\x57\x6f\xc3\xd0\xb0\x49\
-\xeb\x27\x18\xac\xa7\x30\x50\x4b\xd9\x1a\x7b\xbf\x8e\x86\xf4\x8c\
-\x00\x30\xee\xab\xbe\x11\x20\x34\x2c\x01\xf8\xd9\xca\xd7\x8c\xdb\
-\x52\x62\x32\xcb\xb2\x91\xce\x48\x4d\xf3\xa9\xb8\x09\x0f\x2d\x6d\
-\x2d\x98\x33\x77\x0e\x32\xb9\x0c\x1c\xa7\xf9\x0a\xbf\xd8\x8e\x83\
-\x6c\x2e\x8b\x8e\xae\x39\x68\x6b\x6f\x45\x22\x69\xce\x50\xad\xa9\
-\xd2\xe9\xb4\x8c\xac\xcd\x40\xa9\x1c\xe0\x17\x4f\x9a\x75\x66\x4b\
-\xe8\x17\xb4\x54\x07\x56\xa0\x7b\xab\x6f\x45\x43\x02\x50\xec\x59\
-\x75\x2a\x80\x4b\xaa\x6d\x47\x05\x25\xa3\x0a\xff\xf4\x0f\x14\xb0\
-\xea\xe9\x1d\x51\x87\x11\x2b\xd9\x6c\x5a\xe6\xfd\x8f\x81\x88\x90\
-\xca\xa4\xd0\xd1\xd5\x21\x1d\xde\x9b\x4c\x24\x44\x1d\x5d\x73\x90\
-\xce\xc8\x7b\xe8\x58\x2c\xaa\xac\x07\x10\xd3\xf7\xe4\xda\xed\x18\
-\x18\x32\x68\x5d\x99\x52\x95\xbe\xae\x4a\x04\xbe\xbc\xd8\xbd\xe6\
-\xe4\x6a\xdb\xa9\x3a\x01\x20\x38\x1f\x05\xaa\x9f\xa8\x64\xc3\x0e\
-\xfd\x79\x64\xe5\xab\xc6\x9d\x33\x6d\xb2\x64\x2a\x29\xfb\xfd\x8f\
-\xc2\xb6\x6d\x64\xf2\x59\xcc\x99\x3b\x07\xb9\x7c\x4e\xca\xbc\x4e\
-\xc2\xb6\x2d\x64\xc7\xff\xad\x32\x79\xa9\x86\x77\x34\x8e\xe3\x20\
-\x25\x87\x69\x4d\x5b\x39\x08\x8d\x3b\xb9\x55\xd3\x54\x37\x11\xe8\
-\x23\xd5\x36\x52\xd5\x27\x8c\x79\xa5\x03\x56\x1f\xac\x36\x08\x0e\
-\x43\xa8\xd0\x9c\x6d\x76\x7d\xfd\x63\x58\xf3\xcc\xce\xa8\xc3\x88\
-\x0d\xcb\xb6\x91\x4e\xca\xd0\xff\x1b\x59\x96\x85\x6c\x2e\x8b\xf6\
-\xce\x0e\x64\xe4\xa9\x76\x46\x88\x08\x99\x4c\x1a\x73\xba\xe6\x20\
-\xd7\x92\x93\x75\x02\x6f\x92\x4a\xa5\x24\x91\x9c\x81\x55\x4f\xef\
-\x40\xff\xa0\x39\xa3\x00\x2a\x28\x83\x43\x2d\x0b\xcb\x3f\xc2\xfc\
-\x40\x55\x6f\x84\xaa\x3e\x59\xa5\xde\xe4\xbb\x00\x9a\x5f\x4d\x1b\
-\x80\x79\x5b\xff\x1e\x5b\xb5\x05\xa1\x41\xd3\x11\xa6\xcb\x66\xd2\
-\x1a\xc6\x80\x1a\x83\x65\x55\x9e\x62\x3b\xe6\x76\x20\x9d\x4d\xcb\
-\xf9\x07\xd5\x20\x20\x95\x4e\x55\x92\xa8\x7c\x16\x24\x23\x02\x15\
-\x54\xa9\xb0\x29\xa6\x27\x08\x14\x56\xae\xde\x1a\x75\x18\x47\x50\
-\x65\x2d\x8b\x01\x17\x94\xba\x17\x5e\x5b\x4d\x03\x55\x7d\xa2\x88\
-\xe9\x43\xd5\xbc\x1e\x00\xc0\x0c\x2e\xfb\x55\x37\xa3\x4b\xa1\x50\
-\xc6\xea\x67\x64\xee\x7f\xba\x92\x49\x19\xfa\x07\x2a\x15\xfa\xd2\
-\x99\x34\x3a\xba\x3a\x2a\xf3\xd8\x92\x11\x69\x73\x78\x44\xa0\x73\
-\x3c\xa9\x92\x7f\x5b\x38\x8e\x23\x55\x36\x67\xe0\xa9\xf5\x3b\x50\
-\x28\x9a\x33\xca\xac\x69\x37\x00\x08\xd5\xf5\xc1\xb3\x4e\x00\xb8\
-\x67\x55\x0e\xe0\x9b\xaa\xb9\x38\x30\x3e\x1c\x62\x50\xdd\xff\x27\
-\xd7\x6f\x47\x49\x56\xfe\x4f\x8b\x65\x59\x48\xa5\x64\x3e\xd2\x4d\
-\x78\x68\xeb\x6c\x47\x36\x2f\xc5\x8f\x6a\x89\x2c\xaa\x4c\xab\x74\
-\xb5\xc9\x22\x4a\x00\xe9\x74\x4a\xd6\x49\x4c\x53\xb1\x54\xc6\x6a\
-\x83\x16\x75\x33\x2b\x70\xa0\xe1\xc1\x97\x70\x1b\x77\xaf\x9c\x75\
-\x75\xa1\x59\xbf\x7b\xca\x6c\xbf\x07\x40\xd5\x13\xbf\xaa\x6c\xce\
-\xe2\xbf\x50\x29\x3c\xb1\x56\xf6\xfd\x4f\x57\xb3\xcf\x6d\x5b\xb6\
-\x85\x96\xb6\x56\xb4\xb5\xb7\x36\xe5\x56\xbe\xa8\xd8\xb6\x83\x96\
-\xb6\x16\xb4\xb4\xb5\x36\x75\x07\x48\x44\x48\x4b\x81\xa0\x69\x7b\
-\x6c\xf5\x56\xa3\xa6\x76\x43\x3d\x67\x3c\x64\x7c\x4a\xdc\x3c\xdb\
-\x17\xcf\x7e\x04\x00\x5c\x75\xe5\x3f\xe8\xca\x82\x34\x79\xe6\x57\
-\xbb\x8d\x5a\x2c\x62\x32\xcf\xf3\xe0\xba\xcd\x59\xf0\x87\x40\x48\
-\xa5\x53\xe8\xe8\xec\x40\x22\x29\xc5\x59\xa2\x92\x48\x7a\x87\xa7\
-\x5c\x9a\x95\xe7\xb9\xf0\x9a\xf4\x73\x38\x53\xfd\x83\x05\x3c\xf7\
-\xe2\x9e\xa8\xc3\x38\x8c\xc3\x92\x9e\x53\x6f\x99\xee\x9a\xed\x4b\
-\x67\x95\x00\x0c\x1f\x58\xdd\x05\xd0\x3b\x66\x7b\xd1\x09\xca\x2f\
-\x69\x29\x8a\xa0\xcb\x2f\x57\x99\xb5\x50\xc4\x54\x13\x1d\x60\x33\
-\xb2\x1d\x1b\xad\x1d\xad\xc8\xb5\xe4\x9a\x7a\xf4\xc3\x14\x44\x84\
-\x6c\x3e\x8b\xb6\x8e\xb6\xa6\xdd\x2d\x90\x4e\xa7\x64\x11\xee\x34\
-\xfd\xe2\x89\xcd\xe6\x9c\xa9\xc0\xe3\x7d\x60\xf5\x6e\xe0\x3d\xeb\
-\x3b\x66\xf3\xc2\x59\x7d\x62\x5c\xcb\xba\x13\x1a\x0e\x12\x32\xa9\
-\xee\xff\x2b\x5b\x0e\x62\xcf\xfe\x81\xa8\xc3\x88\x85\x64\x2a\x01\
-\xbb\x09\x87\x5e\x13\xc9\x04\xda\x3b\xda\xa5\x96\xbd\x81\x5c\xcf\
-\x45\x7b\x67\x47\x53\x26\xa6\x96\x6d\x23\x29\xb5\x01\xa6\x65\xef\
-\xfe\x41\x6c\xde\xd6\x1b\x75\x18\x87\x69\xea\x03\xdd\xb2\xab\x66\
-\x55\x1a\x78\xb6\x77\xf1\x3b\x66\xf9\xba\xc3\x38\x08\xc0\xca\x9c\
-\xc5\x76\x8f\x3e\x69\xd6\xc1\x11\xa6\xb2\x2c\x6a\xba\x9b\x8d\x45\
-\x84\x7c\x5b\x1e\x2d\x6d\x2d\x20\x4b\x1e\xb5\x4c\x45\x44\xc8\xb5\
-\xe4\x90\x6f\xcb\x37\xdd\xcf\x29\x95\x4c\xca\x36\xc9\x69\x5a\xb1\
-\x6a\x73\xd4\x21\x1c\xc6\x2a\xd4\x54\x13\x80\xeb\x93\x00\x8c\x74\
-\x3f\x3d\x8f\x80\x65\xb3\xb9\xd8\x1b\xb1\x9e\x7d\x90\x5a\xec\x3b\
-\x30\x84\x57\xb7\x76\x47\x1d\x46\x2c\xa4\x52\xa9\xa6\x1a\xfa\x76\
-\x5c\x07\x6d\x73\xda\x9b\x2e\xe9\x89\xb3\x64\x32\x89\xf6\x39\xed\
-\x70\x9a\x68\x6e\x9c\x88\x90\x96\x1d\x39\xd3\xb2\xe9\xb5\x83\xd8\
-\xdf\x3d\x1c\x75\x18\x87\xe9\xa8\x09\xc0\x44\x57\x56\xa6\xe6\x67\
-\x66\xc6\x09\x80\xc7\xea\x3d\xb3\x79\xdd\x11\x98\x75\x15\x42\xd0\
-\xe2\xa9\xa7\xb7\x9b\x33\x2f\x64\x30\xdb\x6e\xae\xbd\xc7\x89\x54\
-\xb2\x32\xb7\x2c\x2b\xfc\x63\xc7\xb6\x6d\xb4\x75\xb4\x21\x95\x6e\
-\x9e\x4e\x31\x91\x48\x48\x85\xc0\x69\x60\x66\xac\x5a\xbf\x3d\xea\
-\x30\x0e\xd3\x54\x13\xc0\x4e\xd8\xd6\x2d\x33\x7d\xd1\x2c\x3a\x72\
-\xf5\xde\x99\xbf\xe6\x48\x1c\x9a\xb3\xf7\xdf\x2f\x87\x78\xfa\x57\
-\xbb\xa3\x0e\x23\x16\xd2\x4d\x74\x33\xcd\xb5\xe4\xd0\xd2\x9a\x6f\
-\xaa\xd1\x8e\x46\x43\x04\xe4\x5a\xf2\xc8\xb5\xe4\xa2\x0e\xa5\x6e\
-\xd2\x4d\xb8\x06\x62\x36\xd6\x3d\xff\x3a\xca\x81\x19\x53\xd0\xcc\
-\x4a\x4b\x31\x3c\x66\xcc\xb8\x6f\x9e\x51\x02\xc0\x7b\xd6\x77\x30\
-\xd1\x15\x33\xbd\xc8\x9b\x99\xf4\xf4\xff\xfc\x4b\x7b\x30\x56\x30\
-\x67\x2b\xa2\xa9\x1c\xc7\x6e\x8a\x6d\x7f\x44\x84\xd6\xf6\x96\xa6\
-\x5c\x4c\xd6\xa8\x52\xe9\x14\x5a\xdb\x5b\x9b\x22\x99\x73\x5d\x17\
-\x8e\x2d\x95\x39\xa7\x32\x56\xf0\xf1\xc2\xc6\x7d\x51\x87\x71\x98\
-\xd2\xb3\x1d\xfe\x1a\x1e\x78\xaa\x6d\x26\x2f\x98\x51\x02\x50\xf6\
-\xf8\x16\x54\xbb\xfa\x9f\x61\x54\xe9\x5f\x39\xf2\x77\x7a\x52\xa9\
-\xc6\xdf\x6b\x6d\xdb\x16\x5a\x3b\xda\xe0\x35\xd1\x34\x47\xb3\xf0\
-\x12\x1e\xda\xe7\xb4\x35\xc5\x10\x79\x33\x4d\x7b\x54\xc3\xa4\x7b\
-\x3f\x97\xb5\x6c\x89\x77\xcb\x25\x77\x46\xd5\x79\x67\x36\x02\xc0\
-\x7c\xdb\xcc\xe2\x39\x4a\x1b\xa1\x6f\xcc\x7c\xfb\xc1\xde\x11\x6c\
-\xdf\x75\x28\xea\x30\x8c\xe7\x38\x0e\x5c\xb7\xb1\x9f\x2a\x6c\xa7\
-\xb2\xd8\xaf\xd1\xff\x9e\xcd\xcc\x76\x1c\xb4\x76\xb4\xc2\x6e\xf0\
-\xb3\x2b\x5c\xd7\x85\xdb\xe0\x7f\x47\x1d\xb6\xec\xe8\x45\x77\xef\
-\x48\xd4\x61\x00\xa8\xac\x4b\x60\x0d\x27\xe2\x32\xa9\x19\xad\x03\
-\x98\xf6\xbb\x84\xb7\xfc\x34\xe1\x13\xaa\x2f\xfe\x63\xd0\xd3\xff\
-\x53\xeb\x65\xf1\xdf\x74\x34\xfa\x70\xb8\xeb\x3a\x95\x21\xe2\x06\
-\xdd\x46\x45\x54\x29\xdc\x94\x4a\xa5\x90\x4a\xa7\x0e\x77\x0e\x13\
-\x23\x1d\xfe\x78\x49\xd2\x72\x10\xa0\x30\x56\x40\xa1\x50\x40\x61\
-\xac\xd0\x90\x9f\x0d\xdb\xb6\xd1\x36\xa7\x0d\x83\x7d\x03\x28\x97\
-\xcd\x39\x1c\x46\xb7\x64\x2a\x89\xf2\xb0\x19\x9d\x9b\xa9\x98\x19\
-\x6b\x9e\xd9\x89\xdb\xde\x75\x66\xd4\xa1\x00\xa8\x8c\x02\x90\x53\
-\xed\x34\x2b\xdd\xc0\x5b\x7e\x9a\xa0\xb7\xdf\x38\xad\x79\xf6\x69\
-\x27\x00\xa5\x96\xf6\x6b\x08\x3c\xeb\x43\x07\x26\x98\x92\x00\x04\
-\xa1\xc2\xfa\xe7\x5f\x8f\x3a\x0c\xe3\x39\x8e\xd3\xd0\x4f\x13\xae\
-\xe7\x36\xcc\xfc\x70\x6b\x5b\x2b\xba\xe6\x76\xa2\x73\x6e\x27\x3a\
-\x3a\xda\xd1\xd2\xd6\x8a\xd6\xd6\x16\x64\x73\x33\x3f\xa4\x88\x99\
-\x31\x32\x3c\x82\x81\x81\x41\x0c\xf6\x0f\xa0\xaf\xef\x10\xba\x0f\
-\xf4\xa0\xa7\xbb\x07\x03\xfd\xf1\x2e\x98\x65\x11\xa1\xb5\xa3\x15\
-\x83\x87\x06\xe0\xfb\x8d\x99\x04\xb8\xae\x0b\xc7\x71\x10\x04\x5a\
-\xce\x9d\x6f\x58\x6b\x9f\xdf\x89\x9b\xdf\xb9\xc4\x88\xc2\x66\x61\
-\xd9\x87\x55\xfd\xb3\x56\xb6\x94\x6f\xbb\x1c\xc0\x8a\xe9\x7c\xf3\
-\xf4\xef\xec\xc4\x37\x55\x3b\x47\xc1\x41\x59\x4f\xed\x63\x0d\x5e\
-\xd8\xb8\x17\x23\xa3\xe6\x2c\x46\x34\x55\x23\x9f\xf6\xe7\x26\x3c\
-\xb4\xb6\xb5\xc4\xb2\xf3\xb7\x6d\x1b\x0b\x8e\x5f\x80\xe3\x4f\x58\
-\x88\x85\xc7\x2f\xc0\x82\x85\x0b\x90\xd4\xf8\xb3\x22\x22\xe4\xf2\
-\x39\xe4\xf2\x39\x1c\xbf\x68\xe1\x11\x5f\x2b\x16\x8a\xd8\xb3\x7b\
-\x2f\xf6\xee\xde\x8b\xdd\xbb\x76\x63\xcf\x9e\xbd\x50\xa1\x19\x9f\
-\xeb\xe9\x22\x22\xb4\xb4\x37\x76\x12\x90\x4c\x26\x31\x32\x22\xa3\
-\x00\x93\x19\x1a\x2e\xe1\xa5\x57\xf6\xe3\xdc\x33\x16\x44\x1d\x0a\
-\xc0\x0a\x2a\x2c\xc3\xb2\xab\x1b\x05\xb0\x88\xde\x0d\xdd\x09\x00\
-\x01\x37\xce\x3a\xa2\x71\x26\xad\xfe\x5f\xf5\x8c\x39\x0b\x40\x4c\
-\x65\x5b\x56\xc3\xae\xfc\x77\x3d\x37\x76\x9d\x7f\x3a\x93\xc6\x29\
-\xa7\x9d\x82\x93\x4f\x79\x1b\x4e\x5c\x7c\x22\xbc\x44\x34\x07\x11\
-\x25\x53\x49\x9c\x7c\xca\x49\x38\xf9\x94\x93\x00\x00\xa5\x52\x09\
-\x3b\xb7\xef\xc4\xb6\x2d\xdb\xb1\xf9\x95\xcd\x18\x1b\x8b\xc7\x81\
-\x5a\x13\x49\xc0\xc0\xa1\x01\x94\x1b\x30\x09\xf0\x3c\x17\x96\x6d\
-\x43\x85\x66\x6c\x77\x33\xd5\xaa\xa7\x77\x9a\x91\x00\x60\x7c\x81\
-\x7c\x95\x09\x00\x43\xdd\x02\xe0\xf7\xa6\xf3\xbd\xd3\xba\xfb\x95\
-\x0e\xae\x3b\x1b\xc4\x1b\xaa\x8a\x0a\x40\x79\xb8\x1f\x30\xa0\xfc\
-\x6f\xff\x60\x01\x7f\xfa\xb7\x3f\x45\x03\x4e\x71\x6a\x95\xc9\xa4\
-\x1b\xb2\xf0\x8f\xeb\x38\x68\x99\xd3\x06\x2b\x06\x9d\x7f\x22\x91\
-\xc0\x69\x67\x9c\x86\x25\x67\x9e\x8e\x13\x17\x9f\x60\x7c\x89\x5b\
-\xa5\x14\x76\xed\xd8\x85\x97\x37\xbe\x82\x57\x36\xbd\x0a\xbf\x64\
-\xc6\x94\xdf\x64\x98\x19\x03\x7d\xfd\x28\x97\x1b\x6f\xb8\xbc\x58\
-\x2c\x61\x6c\x6c\x2c\xea\x30\x8c\x46\x04\xfc\xcd\x9f\xbc\x1b\xad\
-\x79\x03\x46\x3b\x2d\x1b\x6e\x6e\x46\x3b\xf9\x8e\xd1\x0e\x9f\x9e\
-\x98\xb3\xfc\xd5\xa9\xbe\x6d\x9a\x23\x00\x7c\x43\xb5\xf1\x70\x18\
-\x18\xd1\xf9\x03\xc0\xf3\x2f\xee\x91\xce\x7f\x0a\x96\x65\xc1\xf3\
-\x1a\xef\xa8\x5b\x67\xfc\x34\x3f\xd3\x9f\xfc\x17\x2c\x3c\x0e\xe7\
-\x5e\x70\x2e\x96\x9c\x79\x7a\xac\x0e\x1f\xb2\x2c\x0b\x8b\x4f\x5a\
-\x8c\xc5\x27\x2d\xc6\x75\xef\xba\x16\xaf\x6c\x7c\x05\xbf\x7a\xf6\
-\x05\xec\xdb\xbb\x3f\xea\xd0\x8e\xe9\xf0\x48\x40\x5f\x3f\x02\x43\
-\x8a\xc3\xe8\x92\x48\x78\x28\x16\x0a\x50\x72\xc3\x3b\x26\xe6\xca\
-\x94\xf0\x55\xcb\x4f\x8a\x3a\x14\x40\x85\xe0\xb0\x0c\xaa\x76\x14\
-\x80\x71\x03\x00\x3d\x09\x00\x59\xb8\xae\xda\xf7\x8f\x49\xc3\xff\
-\x26\x9d\x09\x6d\xaa\x44\xc2\x33\xbe\x93\x9c\x29\xdb\xb2\xd0\xd2\
-\xde\x66\xec\x6a\x7f\x22\xc2\xc9\xa7\x9c\x84\x65\x97\x2f\xc3\xc2\
-\xe3\xcd\x18\x92\xac\x86\xe7\x79\x38\xe7\xfc\x73\x70\xce\xf9\xe7\
-\xe0\xc0\xbe\x03\x78\x66\xfd\xb3\xd8\xf4\xe2\xcb\x50\xca\xbc\xf5\
-\x02\x96\x65\xa1\xa5\xbd\x15\xfd\xbd\xfd\x46\xc6\x37\x5b\x44\x84\
-\x44\x32\x89\x42\x21\x1e\xd3\x32\x51\x79\xee\xc5\x3d\x66\x24\x00\
-\xa8\x2c\x94\xb7\xab\x4c\x00\x88\xe9\x3a\x00\xff\x34\xe5\xf7\x4d\
-\xf5\x0d\xbc\x63\x65\xd2\xcf\x24\x0f\x01\xa8\x6a\x7d\x62\x30\x3c\
-\x00\x56\xd1\x0f\xb1\xf5\x0f\x14\xf0\xa7\xff\xfb\x91\x86\xdc\xe2\
-\xa4\x53\x5b\x6b\x8b\xb1\x1d\xe5\x6c\x10\x2a\x2b\xbf\x4d\x7c\x9a\
-\xb6\x2c\x0b\x67\x9e\x73\x26\x2e\xbb\x72\x39\x5a\xdb\x5a\xa3\x0e\
-\xa7\xa6\xfa\x0f\x0d\x60\xd5\x13\xab\xb1\xf1\xc5\x8d\x60\x65\xde\
-\x67\xb0\x5c\x0e\x30\xd0\xd7\xdf\x50\xf7\x07\xa5\x14\x06\x07\x07\
-\x65\xd4\x73\x12\x44\x84\xbf\xfa\x6f\x37\xa0\xbd\x35\xfa\x82\x67\
-\x64\xdb\x70\xb2\x55\x4f\x03\x8c\x7a\x83\xfd\x1d\x53\x6d\x07\x9c\
-\x72\x04\xa0\x94\x4e\x5d\x41\xe0\xea\x36\x27\x28\x65\x44\xe7\x0f\
-\x00\xcf\xbe\xb8\xbb\xa1\x3e\xdc\xb5\xe0\xb9\x6e\xc3\x75\xfe\xf9\
-\xb6\x16\xf3\x3a\x7f\x02\xce\x38\x73\x09\x2e\xbf\xfa\x72\xb4\x77\
-\x68\x98\xf7\x8b\x81\xb6\xf6\x56\xdc\x7c\xfb\xbb\xb1\xfc\xf2\x65\
-\x78\x72\xe5\x93\x78\x65\xd3\xab\x3a\x2a\xa0\x69\xe3\xba\x0e\xf2\
-\xad\x79\x0c\xf6\x0f\x46\x1d\x8a\x36\x96\x65\xc1\x71\xdc\x86\xae\
-\x7b\x50\x2d\x66\xc6\x0b\x1b\xf7\xe2\x1d\x97\xbd\x3d\xea\x50\xc0\
-\x61\x58\xd9\x2d\x47\x55\xdd\x83\x33\xc5\xd6\xb6\x65\x00\x1e\x9f\
-\xec\x9b\xa6\xbc\x02\x59\xea\xba\x6a\xa2\x00\x00\xa5\xa1\xc2\x91\
-\x2e\xcf\xbd\x28\x07\xff\x4c\xa5\xd1\x16\xfe\xa5\xf3\x69\x24\x92\
-\x66\xad\x67\x98\x77\xdc\x3c\xdc\x73\xdf\x07\x71\xeb\xfb\x6e\x69\
-\x9a\xce\xff\x8d\x3a\xe6\xb4\xe3\xf6\xf7\xdf\x86\x7b\x3f\xfe\x61\
-\x2c\x30\x6c\xba\x23\x91\x4c\x20\x9b\xab\xba\xe4\x89\x51\x1a\xed\
-\x33\x5d\x0b\xcf\xbd\xb8\x37\xea\x10\x0e\x53\x1a\x92\x35\x8b\x31\
-\x65\xdf\x3d\x75\x8a\x51\x99\x4b\xa8\x0a\xeb\x39\xe8\xa0\x6a\x3d\
-\x87\x46\xf1\xfa\xde\xc6\xc9\xec\x6b\xc1\xb2\x2c\xf3\x9e\x94\xab\
-\x90\x48\x26\x90\xce\x44\x3f\xac\x37\x21\x99\x4a\xe2\xdd\xb7\xde\
-\x88\xfb\x3e\xf1\x11\x2c\x7c\xd3\xfe\xfa\x66\x34\x7f\xc1\x7c\xdc\
-\xf3\xd1\x0f\xe2\xc6\x5b\x6e\x40\x32\x69\xc0\x2a\xec\x71\xa9\x6c\
-\x0a\x89\x64\xe3\x74\x9a\x9e\xe7\xc2\x6a\xa0\x51\xbd\x5a\xd8\xb1\
-\xfb\x10\xfa\xfa\xcd\xd8\x31\xa1\xa3\x2c\x30\x50\x65\x02\xc0\x83\
-\x6b\xda\x01\x9c\x55\x6d\x14\x3a\xb2\x19\x1d\x9e\xdb\xb0\x47\x86\
-\xff\xa7\x90\x6c\xa0\x27\x05\xdb\xb1\x91\x6f\xcd\x83\xa6\xb7\xdb\
-\xb5\xe6\x4e\x5b\x72\x1a\x3e\xf9\x99\x8f\xe3\x9c\xf3\xcf\x9e\xe6\
-\x06\xdc\xe6\x40\x44\x38\xf7\x82\x73\xf1\x89\xcf\x7c\x0c\xa7\x9e\
-\x7e\x6a\xd4\xe1\x00\x18\x9f\x36\x6a\xcd\x37\xd4\xb9\x01\x32\x0a\
-\x30\x39\x66\xc6\xf3\x2f\x99\x31\x0a\xa0\xe9\x74\xc0\x0b\xb8\x7f\
-\xe5\xa4\x8b\x8a\x26\x4d\x00\xfc\x22\xae\x98\xea\x7b\xa6\xc2\x61\
-\x60\x4c\xf5\x3f\x59\xfd\x3f\xb5\xa8\x8a\xcb\xe8\x46\x44\x68\x69\
-\x33\x63\xbb\x5f\x22\x91\xc0\x2d\xef\xb9\x09\xef\xf9\xc0\x6d\xc8\
-\x64\x33\x51\x87\x63\xac\x6c\x2e\x8b\xf7\xde\x79\x3b\x6e\xbf\xe3\
-\x36\xad\x55\x0d\x67\x8b\x88\xd0\x62\x50\x02\x59\xad\x44\x83\x7c\
-\xb6\x6b\xe9\xf9\x97\x0c\x99\x22\x56\xaa\xd2\x77\x56\xc7\x2a\x05\
-\xe9\x4b\x27\xfd\x86\xc9\xbe\x48\xa0\x2b\xaa\x8d\x80\x03\x33\x9e\
-\xfe\x7b\xfa\x46\xb1\x67\x7f\xbc\x6b\x98\xd7\x9a\xeb\x36\xce\x30\
-\x61\x36\x9f\x85\xe3\x44\x7f\xf4\xeb\xf1\x8b\x16\xe2\x63\x9f\xbe\
-\x0f\x67\x9e\x63\xc6\x81\x23\x71\x70\xfa\x19\xa7\xe1\xbe\x4f\x7e\
-\xc4\x88\xad\x90\x8e\xeb\x20\xdb\xd2\x18\xeb\x01\x2c\xcb\x92\xd3\
-\x2e\xa7\xb0\x6b\xcf\x00\x7a\xfb\x47\xa3\x0e\x03\x80\x9e\xbe\x93\
-\xa0\x26\xed\xc3\x27\x9f\x02\x20\x5c\x59\x6d\x00\xca\x90\x04\xe0\
-\xa5\x57\xcd\x2d\x44\x62\x0a\xaf\x41\xe6\xfe\xbd\x44\x02\x49\x03\
-\xce\x44\x3f\xef\xc2\x73\x71\xf7\x47\x7e\x03\x2d\xad\x2d\x51\x87\
-\x12\x3b\xad\x6d\xad\xf8\xe0\x7d\x77\x63\xd9\x65\x4b\xa3\x0e\x05\
-\xc9\x74\xf2\xf0\xc9\x89\x71\xd7\x88\xc5\xbd\x74\x62\x66\xbc\xfc\
-\xea\xc1\xa8\xc3\x00\xa0\x6d\xf1\xfc\xa4\x7d\xf8\x31\x13\x00\xee\
-\x5b\x97\x07\x70\x4e\xb5\x57\x37\x65\x04\x60\xd3\x6b\x07\xa2\x0e\
-\xc1\x78\x9e\x1b\xff\x9b\x83\x6d\x59\xc8\xb7\xe6\x22\x1d\xb6\x75\
-\x3d\x17\xb7\xbd\xff\x56\xbc\xeb\xe6\x1b\x60\xd9\x8d\x31\xa2\x12\
-\x05\xcb\xb2\x70\xf5\x75\x57\xe1\xd6\xf7\xde\x12\xe9\x99\x14\x04\
-\x42\x4b\x6b\xae\x21\x46\xc7\x5c\xcf\x83\x01\xb3\x62\x46\xdb\xf8\
-\x9a\x19\x0f\x8b\x5a\xfa\x4e\xc6\x05\xdc\xb3\x2a\x77\xac\x2f\x1f\
-\xf3\x1d\x5d\x0a\x71\x19\x80\xaa\xc6\x50\x2b\xab\xff\xa3\x5f\x74\
-\xe7\x97\x43\x6c\xdd\xd1\x1b\x75\x18\x46\x73\x5d\xd7\xf8\x3a\xf3\
-\xd3\x91\x6d\x89\xf6\x46\x9d\xc9\x66\xf0\xc1\x7b\xef\xc6\x92\x33\
-\x4f\x8f\x2c\x86\x46\x73\xc6\xd9\x4b\x70\xf7\xbd\xbf\x11\xe9\xfa\
-\x09\xb2\x2c\xe4\xf2\xc7\xbc\x8f\xc6\x86\x45\x04\xbb\xea\x33\xe7\
-\x1b\xdb\xe6\x6d\xbd\x28\x9b\x50\x12\x9a\x59\xc7\x08\xba\x53\x52\
-\xce\x31\x87\xd1\x8e\x79\xa7\x24\xe0\xb2\x6a\xaf\x6c\xca\xf0\xff\
-\xe6\x6d\x3d\xf0\xcb\x06\xfc\x40\x0d\x96\x68\x80\xa1\xc1\x83\x44\
-\xe7\x8b\x00\x00\x20\x00\x49\x44\x41\x54\x44\x2a\x11\xe9\xd6\xad\
-\xce\xae\x39\xf8\xc8\xc7\xef\xc1\xfc\xe3\xe6\x45\x16\x43\xa3\x3a\
-\x6e\xc1\x7c\x7c\xf8\x63\x1f\x42\xc7\x9c\x8e\xc8\x62\x88\xfa\xfd\
-\xa5\x4b\xa2\x41\xa6\xfa\x6a\xa5\x54\x0e\xb0\x75\x47\x5f\xd4\x61\
-\x00\xd0\xb6\x0e\xe0\xf2\x63\x7d\x6d\x92\x04\x80\xab\x9e\x7c\x33\
-\x66\xf8\x7f\x8b\x19\x73\x3a\xa6\x22\x10\x5c\x2f\xde\x8b\x83\x26\
-\xce\xaf\x8f\xca\xbc\xf9\xf3\x70\xf7\xbd\x77\xcb\x7c\x7f\x0d\xb5\
-\xb6\xb5\xe2\x9e\x8f\x7d\x08\xc7\x2d\x98\x1f\x59\x0c\xb9\x96\x5c\
-\xec\x47\xca\x3c\xcf\x6d\x98\x9d\x0d\xb5\xb2\x69\xb3\x21\x53\xc6\
-\x3a\xd6\x01\x10\x2e\x39\xd6\x97\x8e\x9a\x00\x30\xb3\xc5\xc0\x05\
-\x55\x5d\x94\x59\xc7\x36\x06\x2d\x36\xc9\x02\xc0\x49\x39\x9e\x03\
-\xaa\xae\xec\x64\xe4\x72\x2d\xd9\xc8\x86\xfe\xe7\x2f\x98\x8f\xbb\
-\x3e\x7c\x27\xd2\xe9\xea\x2a\x66\x8b\xa9\xa5\x52\x49\xdc\x79\xcf\
-\x07\x22\xdb\x21\x60\x59\x56\xec\xab\x04\x12\x59\x70\x64\x37\xc0\
-\xa4\x36\xbd\x66\xc6\x43\xa3\x0a\x02\x0d\xb3\xe8\x74\x09\x33\x1f\
-\xf5\xe6\x78\xd4\x3f\xf4\xbb\xd7\x9f\x09\x20\x5f\xcd\x25\xd9\x90\
-\xa3\x7f\x7b\xfb\x47\xd1\xd3\x67\xc6\xb6\x0e\x53\xb9\x31\x2f\x76\
-\xe2\xba\x0e\x92\xa9\x68\x3a\xdf\xe3\x16\x1e\x87\xbb\x3f\x7c\x17\
-\x52\x06\xec\x5b\x6f\x16\xc9\x64\x12\x77\xdd\x73\x27\x8e\x8f\xa8\
-\x92\x62\x2a\x9d\x82\x13\xe1\xa2\x44\x1d\x64\x3b\xe0\xe4\x0e\x74\
-\x0f\x19\xb2\x1d\x90\x75\x9c\xa3\xd3\xe2\x1f\x5a\x7f\xda\xd1\xbe\
-\x70\xd4\x04\x80\x2c\x3e\xe6\x90\xc1\x74\x99\x32\xfc\xbf\xf1\x15\
-\x43\x86\x72\x0c\xe6\xc6\x7c\xf5\x7f\x36\xa2\xa1\xff\xae\x79\x5d\
-\xf8\xc0\x07\xef\x68\x98\xe2\x49\x71\xe2\x7a\x2e\xee\xb8\xfb\xfd\
-\x98\x37\x3f\x9a\xf5\x16\xb9\x7c\x36\xd6\xc3\xe8\x51\xee\xaa\x88\
-\x8b\x57\xb6\x74\x47\x1d\x02\x00\x3d\xdb\x01\x29\x54\x47\x9d\xd2\
-\x3f\x6a\x02\xa0\xf8\xd8\x73\x06\xd3\x65\xcc\xf0\xbf\x29\x73\x39\
-\x86\xb2\x2c\x1b\x76\x8c\xb7\xaa\x25\x93\xc9\x48\xce\x2e\x68\xef\
-\x68\xc7\x6f\xc8\x93\x7f\xa4\x12\xc9\x04\x3e\xf0\xa1\x3b\xd0\xd6\
-\x5e\xff\x23\x94\x5d\xcf\x85\x67\xd8\x01\x53\x33\x61\xdb\x36\x2c\
-\x2b\xfa\x42\x59\x26\x33\x66\xea\x58\xc3\x8e\x84\x63\xf5\xe9\x47\
-\x1f\x01\x00\x2e\xae\xfa\x82\x06\x24\x00\x41\xa8\xb0\x79\x7b\x4f\
-\xd4\x61\x18\xcd\x8b\xf1\xe2\x3f\x02\x21\x93\xaf\xff\x7c\x6c\x2a\
-\x9d\xc2\x1d\x77\xbf\x4f\xe6\xfc\x0d\x90\xc9\xa4\x71\xe7\x87\xee\
-\x8c\xe4\xc0\xa7\x6c\x3e\x17\xeb\x33\x1d\x64\x1a\x60\x72\xaf\x6e\
-\xeb\x41\xa8\xa2\xdf\xc6\xae\xe3\x60\x20\x22\x9a\x5e\x02\xc0\x3b\
-\x56\x26\x01\x54\xb7\x89\x99\x15\x60\xc0\x1a\x80\xd7\xf7\x0e\xc0\
-\xf7\xa3\x8f\xc3\x64\x71\x1e\x0a\x4c\x65\x52\x75\x1f\xbd\xb0\x1d\
-\x1b\xef\xbf\xeb\xbd\x68\xef\x68\xaf\xeb\x75\xc5\xb1\xb5\xb5\xb7\
-\xe2\x3d\x1f\xb8\x1d\xb6\x5d\xdf\x27\x5a\xdb\xb6\x90\x8a\x68\xed\
-\x89\x0e\x8d\x52\xf9\xb3\x56\x4a\xa5\x00\x7b\x0d\x28\x1f\xcf\x2a\
-\xd4\x71\x88\xdd\x92\xf1\xbe\xfd\x08\x6f\xb9\x7b\x96\x73\x89\xb3\
-\x01\x54\x95\x1a\x9a\x32\xfc\xbf\x7d\xa7\x14\xff\x99\x0c\x81\xe0\
-\xc6\xb4\x28\x08\x11\x90\xce\xd6\xff\xa9\xef\x9d\x37\x5e\x2f\xc7\
-\xf8\x1a\x68\xd1\x09\xc7\xe3\xda\x1b\xae\xa9\xfb\x75\x33\xb9\x4c\
-\x6c\xd7\x02\x38\x8e\x23\x55\x01\xa7\xb0\x6d\x97\x19\xf5\x00\x50\
-\xfd\x9a\x3a\xb7\x9c\x4d\x2e\x79\xf3\x1f\xbe\xf5\xf1\x89\x71\x5e\
-\xb5\x57\x32\xa5\x00\xd0\xb6\xd7\x0f\x45\x1d\x82\xd1\x6c\xc7\x8e\
-\xed\x10\x66\x2a\x9d\xae\xfb\xb6\xbf\xb3\xce\x3d\x13\xe7\x5e\x50\
-\x75\x75\x6c\x51\x23\x17\x5c\x7c\x3e\xce\x3e\xef\xec\xba\x5e\xd3\
-\xb2\x2c\xa4\x32\xf1\x1c\x05\x20\xa2\xba\x8f\x9a\xc4\xcd\xb6\x9d\
-\x66\x24\x00\x5a\xa6\xd4\x99\xdf\xd2\xb7\xbf\xe5\x0e\xaa\x94\x55\
-\x75\x02\x00\x53\x46\x00\x4c\xc9\xde\x0c\x15\xd7\xbd\xc0\x04\x42\
-\xa6\xce\x4f\xff\x5d\xf3\xba\xf0\xae\x9b\x6f\xa8\xeb\x35\xc5\xcc\
-\xdd\xf0\xee\xeb\xd1\xd9\x35\xa7\xae\xd7\x4c\x65\xd3\xb1\x7d\x92\
-\x76\x62\xbe\x05\xb8\xd6\xb6\x19\x32\x8a\xac\x69\x54\x7d\xea\x04\
-\x80\x88\xcf\xaf\xf6\x2a\x26\x2c\x00\xec\xed\x1b\xc1\xd0\x70\x31\
-\xea\x30\x8c\xe6\xc6\x34\xfb\x4f\xa6\x93\xa0\x3a\x3e\xfd\x3b\x8e\
-\x83\x5b\xde\x73\x93\xdc\x2c\x63\xc0\x71\x1d\xdc\xf6\xfe\xdb\xea\
-\xfa\xb3\xb2\x2d\x0b\xc9\x98\xee\x06\x91\xf7\xf4\xe4\x06\x86\x8a\
-\xe8\xeb\x1f\x8b\x3a\x0c\x2d\x15\x01\x19\x34\x79\x02\xc0\xfc\x80\
-\x0d\xa0\xaa\x83\xcb\x39\x0c\x81\xea\x17\x2c\x54\x6d\xab\x3c\xfd\
-\x4f\x29\x8e\x1f\x7e\x02\x21\x5d\xe7\x21\xd7\x77\x5c\x7f\x35\xba\
-\xe6\x76\xd5\xf5\x9a\x62\xf6\x3a\xbb\xe6\xe0\xaa\x6b\xab\x3e\xc9\
-\x7c\x46\xa2\xd8\x85\xa0\x43\x1c\xef\x01\xf5\xb6\x6d\x57\xf4\xa3\
-\x00\xcc\xac\xa3\xb8\xde\xd9\x6f\xae\x08\x78\xc4\xff\x94\x7a\x4f\
-\x38\x09\x40\x55\x77\x57\x0d\x55\x8b\xb4\xd8\xbe\x4b\xe6\xff\x27\
-\x63\x5b\x56\x5d\x9f\xa2\x75\xf1\x92\x1e\xec\x3a\xde\xb4\x16\x9d\
-\x70\x3c\x2e\xbc\xb8\xba\xaa\xd8\xa2\xfe\x2e\x5a\x7a\x61\x5d\x2b\
-\x05\xda\x8e\x03\x2f\x11\xbf\x83\x82\x2c\xcb\x92\x7a\x00\x53\x30\
-\x65\x1d\x80\x86\x9d\x75\xd9\xe2\xc1\xa7\x4f\x78\xe3\x1f\x1c\xd1\
-\x03\x90\x0a\xcf\xa8\xf6\x0a\xa6\x94\x00\xde\x6a\xc8\xdc\x8d\xa9\
-\x9c\x98\xae\xfe\xaf\xe7\xde\x7b\xdb\xb1\x71\xc3\xcd\x37\xc4\x76\
-\xa1\x64\x33\x23\x22\xdc\x78\xeb\x8d\x75\x7d\xc2\xcd\xc4\x74\x31\
-\xa0\xe3\x48\x02\x30\x19\x53\x76\x02\x70\x50\xfd\xc3\x35\xd9\x47\
-\xf6\xf1\x47\x3e\x02\x12\xbd\x65\x9b\xc0\x8c\x85\xd1\x27\x00\x85\
-\x42\x19\x07\xba\x87\xa2\x0e\xc3\x68\xb6\x13\xbf\xa7\x7f\xdb\xb1\
-\xe1\x24\xea\x97\xb8\x5c\x76\xe5\xa5\x98\xd3\x19\xdd\xf1\xb3\xa2\
-\x3a\x1d\x73\xda\xb1\xf4\xb2\xaa\x8b\x9a\x4e\x9b\x93\x70\x61\xdb\
-\xf1\x1b\x52\x97\x69\x80\xc9\xed\x3b\x30\x88\x42\x31\xfa\x9d\x6d\
-\x3a\x1e\xae\x49\x1d\xd9\xc7\x1f\xd9\x0b\x30\xaa\x4e\x00\x4c\x98\
-\x02\xd8\xb1\xfb\x90\x09\xcb\x10\x8c\x56\xcf\x61\x74\x5d\x92\xe9\
-\x54\xdd\xf6\x5c\xb7\xb6\xb5\xe2\x92\xe5\x55\x17\xc4\x14\x11\x5b\
-\x7e\xd9\xb2\xba\x1d\xd1\x4c\x20\x24\x33\xf1\x9b\x06\x90\xad\x80\
-\x93\x63\x06\x76\xee\xee\x8f\x3a\x0c\x3d\x3b\x01\x08\x93\x24\x00\
-\x1a\x46\x00\x4c\x98\x02\xd8\x6d\x40\xf5\x26\xd3\xc5\xee\x43\x4f\
-\x40\xba\x8e\x2b\xad\xaf\x79\xe7\xd5\xf2\x64\xd4\x00\x1c\xd7\xa9\
-\xeb\x82\xc0\x54\xaa\x7e\x49\xaa\x2e\x32\x05\x30\xb5\x3d\xfb\x07\
-\xa3\x0e\x01\xcc\x5a\x16\xd8\x1f\x3d\x01\xa8\xac\x0e\xe4\x53\xab\
-\x69\x99\x43\x1d\x67\x17\x57\x6f\xdf\x7e\x19\xfe\x9f\x8c\x65\x59\
-\xb0\x62\xb6\x71\x39\x91\x4c\xd4\x6d\xd1\xe2\xc2\x45\x0b\x71\xea\
-\xe9\x55\x7d\x14\x84\x41\xce\x38\x73\x09\x8e\x5b\x30\xbf\x2e\xd7\
-\xb2\x2c\x2b\x76\x87\x04\x11\x11\x2c\x2b\x5e\xf7\x83\x7a\xdb\x77\
-\x20\xfa\x04\x00\x3c\x9e\x04\x54\xe7\x74\x66\x3e\xfc\xc3\x3e\x7c\
-\x47\x1d\x5f\x1d\x58\xdd\x0e\x00\x03\xe6\xff\x01\x60\xaf\x09\x3f\
-\x2c\x83\xc5\xee\xe9\x1f\x40\x32\x51\xbf\xa7\xff\x2b\xdf\x71\x79\
-\xdd\xae\x25\xea\x80\x80\x2b\xaf\xb9\xa2\x6e\x97\x4b\x26\xe3\x57\
-\x13\x20\x8e\xf7\x84\x7a\x32\xa5\x4f\xd1\xd0\xc7\x66\x0b\x87\xd6\
-\x2f\x98\xf8\x9f\xc3\x09\x00\x11\x9f\x5c\x6d\xcb\x26\xcc\xff\x07\
-\xa1\xc2\xc1\x9e\xe1\xa8\xc3\x30\x9a\x13\xb3\x0f\x3b\x11\xc1\x4b\
-\xd5\xe7\xa9\xea\xc4\xc5\x27\xe0\x84\xc5\x27\x4c\xfd\x8d\x22\x56\
-\x16\x9f\xb4\x18\x8b\x4e\x5c\x54\x97\x6b\x79\x49\x0f\x14\xb3\x11\
-\xb6\x38\x2e\x5e\xac\xa7\xfd\xdd\x43\x08\x95\x8a\x3a\x0c\x4d\x0b\
-\x01\x7f\xdd\xd7\x5b\xbf\xfe\x0f\x1d\x09\x40\xf4\x23\x00\x07\xbb\
-\x87\x11\x84\xd1\xff\xa0\x4c\x16\xb7\x6c\xdf\x4b\x26\xea\x36\xaf\
-\x7a\xe9\x95\xcb\xeb\x72\x1d\x51\x7f\x97\x5e\xb1\xac\x2e\xd7\x21\
-\x22\x24\x62\x56\x13\xa0\xde\xa7\x6a\xc6\x4d\x10\x28\x74\xf7\x8e\
-\x46\x1d\x86\x96\x32\xfb\x36\xf0\xd6\x04\x00\xc0\x49\xd5\x36\x6c\
-\xc2\x14\x80\x29\x43\x35\x26\xa3\x98\x7d\xd8\x93\xc9\xfa\xdc\x4c\
-\xe7\xcd\x9f\x27\x4f\xff\x0d\x6c\xf1\x49\x8b\x31\x77\xde\xdc\xba\
-\x5c\x2b\x51\xa7\xf7\xac\x2e\x52\x0c\x68\x6a\xa6\x1c\x0d\x5c\x75\
-\x1b\xcc\x87\xfb\xfa\x5f\x2f\x02\xb4\xaa\x1f\x01\x80\x01\x43\x24\
-\x7b\x0f\xc8\x02\xc0\xa9\xd8\x31\xaa\x00\x48\x20\x78\x89\xfa\x0c\
-\xff\xcb\xb6\xbf\xc6\x77\xf1\xb2\x8b\xea\x72\x1d\x2f\xe9\xc5\xaa\
-\x80\x94\x6d\xc7\x28\xd8\x88\xec\x33\xa0\x6f\x61\x15\xea\x58\x68\
-\x7f\xd4\x11\x80\xaa\x12\x80\x4a\x66\x12\xfd\x16\x00\x19\x01\x98\
-\x5a\xbd\x8f\xd1\xad\x86\x97\x70\xeb\x32\x9f\x9a\xc9\x66\x70\xfa\
-\x19\xa7\xd5\xfc\x3a\x22\x5a\x4b\xce\x3a\xbd\x2e\x75\xfb\x89\x08\
-\xae\x17\x9f\xdd\x00\x44\x76\x6c\x4f\x34\xac\x97\x3d\x06\x8c\x00\
-\x54\xba\xd8\x6a\x1f\xb4\xad\x23\x13\x00\x66\x26\x30\x2d\xae\xaa\
-\x4d\x8e\xfe\xe9\x1f\x30\x63\x98\xc6\x64\x56\xcc\xe6\xff\xdd\x3a\
-\x3d\xfd\x9f\x75\xee\x59\xb0\x62\x36\x35\x22\x66\xce\xb6\x6d\x9c\
-\x75\x4e\x55\xe7\x9d\x4d\x5b\xbd\x46\xae\x74\x20\x42\x2c\xcf\x06\
-\xa9\xa7\x7d\x07\xa3\x1f\x01\x00\x00\x55\xf5\x1a\xb7\x37\x4f\x01\
-\x1c\x78\x6a\x0e\x80\xaa\xd2\x62\x13\xe6\xff\xc7\x0a\x3e\x06\x86\
-\xe4\x08\xe0\xc9\xd8\x31\xdb\xef\x5b\x97\x03\x56\x08\x38\xf7\xfc\
-\xb3\x6b\x7f\x1d\x61\x84\x73\x2f\x38\xb7\x2e\xc3\xf3\x89\x18\x8d\
-\x00\x00\x80\x4d\x92\x00\x4c\xe6\xd0\x40\x01\xc5\x52\xf4\x25\x81\
-\xc1\x55\x2f\x04\xcc\xf1\xc0\x53\x6d\xc0\x78\x02\x50\x76\xdc\xe3\
-\xab\x8e\xc9\x80\x11\x80\x9e\x3e\x03\x56\x69\x1a\x2e\x4e\xf3\xff\
-\xb6\x6d\xd5\xa5\x4a\xd9\xc2\x85\x0b\xd0\xde\xd1\x5e\xf3\xeb\x08\
-\x33\x74\xcc\x69\xc7\xfc\xe3\x6a\x5f\x18\xc8\x76\xed\x58\x3d\x55\
-\xc7\x69\x6a\x30\x0a\xcc\x8c\xde\x43\x63\x51\x87\x01\x68\xd8\xe5\
-\xe6\x97\x2a\x7d\x7e\x65\x0a\x20\xa4\xaa\x13\x00\x13\x16\x00\x1e\
-\xfa\xff\xdb\xbb\xb7\x9e\x3a\xb2\x6d\x3f\xe0\xff\x39\x6b\xd6\x7d\
-\xad\x05\x18\x30\x18\xf0\x0d\xdb\xf8\x02\xc6\x60\xd3\x36\x6d\x1b\
-\x1b\xb6\x6f\x6d\x1a\x70\x77\xbb\x5f\xf3\x12\x29\x9f\x20\x8a\xa2\
-\x7c\x87\x28\xaf\x91\x92\x3c\xe6\x23\xec\xf7\xa3\xbc\x46\x27\xca\
-\x89\x94\x93\x1c\xe5\xf2\x92\xc7\xa3\xdd\x6d\xbb\x6d\xee\xb0\x2a\
-\x0f\xab\xe9\xed\x76\xdb\x5c\x56\x5d\xe6\xa5\xfe\x3f\xe9\x48\x47\
-\xbb\x4d\xd5\x80\x55\xab\x6a\xd4\x98\x73\x8e\xf9\xc6\x80\x0f\xc7\
-\x70\xc2\xa2\xd9\xbe\xca\xaf\x66\xe3\x9f\xeb\x53\xd7\x2b\x39\x0f\
-\x99\xe3\x46\x05\x9f\xb9\x80\x40\x10\xd8\xb3\xeb\xa6\x6d\xc3\x83\
-\x3a\xfc\xe5\x67\xfd\x2f\x99\x45\xbc\x6c\x67\x52\x7c\x94\x00\xc8\
-\x76\xfe\x0a\x80\x01\x3d\x00\xfe\xf2\x46\xff\x87\x63\x3a\x9b\x26\
-\xfa\x04\x15\x94\x50\x85\x10\xb8\x76\x83\x6d\x7f\xeb\xe6\xfa\xe4\
-\xb5\x4a\x86\x01\x94\x45\x09\x80\x6d\xcd\x8b\x74\xf8\xd9\x80\x67\
-\x4c\x56\xc0\xcb\xb6\x6c\xb7\xcf\x01\xbf\x26\x00\x42\xe4\xaf\x00\
-\x14\x11\x54\x5e\x26\x64\x67\xa6\x93\x16\x8d\xf3\xa9\xa0\xfc\xee\
-\x64\x23\xa3\x67\xd0\x6c\x35\x4b\x3f\x0f\x99\xa5\xd5\xd3\xc2\x99\
-\x33\xc3\xa5\x9f\xc7\xaa\x0a\x00\x13\x80\x23\x19\x31\x04\x50\x44\
-\x2f\x00\xf1\x51\x05\x00\x6d\x8c\xe5\x3c\x9c\x11\xab\x00\x7e\x7e\
-\x6b\xc0\x87\x63\x38\x5b\xc6\x24\x05\x04\x94\x5f\x7e\x02\x70\xe9\
-\x4a\xee\xfe\x57\x64\xa9\xf1\xcb\xe3\xa5\x9f\x43\xf9\xca\x9a\x7e\
-\x00\xc2\xb2\x09\xc2\x3a\x98\xf0\x8c\x29\xa4\xda\x2e\xb2\xbf\x26\
-\x00\x42\x60\x24\xd7\xc1\xda\x59\x11\xdb\x14\xe6\x66\x44\x76\x66\
-\x38\x4b\x9e\xff\x9d\x09\x54\x15\xdc\x39\x2f\x5d\x29\xff\x21\x40\
-\x66\x1a\xaf\xe0\xb3\x17\x10\xf0\x2d\xe9\xb3\xcf\x04\xe0\x68\xc6\
-\x54\x99\x73\xbe\x70\x0b\xe0\x0c\x70\x30\x07\x00\xc8\xd5\x1f\xb3\
-\x6d\xc0\xdb\x3f\x00\xbc\xe1\x24\xc0\x23\x09\xd8\x91\x01\x28\x55\
-\xfe\x4d\x33\x8a\x23\x0c\x8f\x94\x5f\x06\x26\x33\x8d\x8e\x8d\x54\
-\xb2\x56\xdf\xab\xa0\x92\x55\x04\x69\x4b\xa9\x42\x23\x53\xe6\x99\
-\xe5\x1d\x72\xcf\xb2\xce\x33\xbf\xf3\x34\xc8\xf2\x25\x00\x45\x8c\
-\x49\xe4\xf5\xcb\xfb\x6d\x6c\xef\xea\xdf\x8d\xd0\x74\xb6\x64\xf9\
-\x7e\x05\x2b\x00\x46\xc7\x46\x39\xf1\xa9\xc6\xa4\x94\x18\x1d\xcd\
-\x57\xfc\x3c\x0e\x5b\x12\x00\x5b\x86\x07\x75\xda\xde\xde\xc3\xfa\
-\xc6\x8e\xee\x30\x72\x0f\x03\x08\xe0\x34\x00\xc8\x2c\xfb\x5b\x1f\
-\x02\x7d\xb9\x8e\x66\xc0\x04\xc0\x9f\xde\x9a\x91\x99\x99\xcf\x8e\
-\x07\x9e\x57\xc5\xfa\xff\x73\xa3\x47\xff\x23\x72\xda\xd8\xf9\x9c\
-\xd3\x9f\x8e\xa1\x8a\x6a\x56\x11\xaa\xda\x71\xd3\x76\x46\x0c\x03\
-\xe4\xac\xba\x67\xc0\x40\x96\xfd\x8d\x92\x9b\x3f\xed\x9c\x46\xce\
-\xa7\x42\x66\xc0\x1e\x00\x3f\x73\xfc\xff\x58\x6c\x79\xe1\xf5\x2a\
-\xb8\x69\x8e\x8e\x95\xff\xf6\x47\x66\x1b\x3b\x5b\x7e\x12\x58\x45\
-\x33\xab\x42\x58\x72\x6f\xd0\xed\x27\x13\x86\x01\xda\xb9\x9f\xb9\
-\x72\xfd\x1f\xe3\x7e\xa9\xda\x9d\x52\x40\xbe\x60\xf4\x57\x00\xde\
-\xbe\x67\x0b\xe0\xa3\xd9\xf3\x0d\xaf\x62\x7f\xf2\xd3\x15\x6d\x0d\
-\x4b\xe6\x3a\x3d\x94\xff\xf6\x77\x14\xe9\x49\x6b\xde\xae\x6d\x89\
-\x53\xa7\x77\x06\x3c\x6b\xb2\xdc\x1b\x02\x01\x3e\x30\x24\xdb\x99\
-\x1c\x2c\x22\x1c\xdd\xd6\x37\xb6\x75\x87\x60\x3c\x6b\xde\xfe\x2b\
-\x78\xf8\x37\x5b\x4d\x24\x49\x5c\xfa\x79\xc8\x6c\x69\x23\x45\x5a\
-\xf2\xee\x80\x02\xc2\x9e\x8d\xa6\x84\xfe\x7b\xb9\xe9\xd6\xd7\xf5\
-\xcf\x01\x28\xe0\xf9\x8f\x76\xd6\x1e\x94\x42\x64\xf9\xc6\xff\x61\
-\x46\x13\x20\x23\x3e\x14\x2a\x84\xac\xa0\xfc\x3f\x78\x7a\xa0\xf4\
-\x73\x90\x1d\x06\x2b\xa9\x02\xd8\x32\x0c\x60\xc9\x5b\x82\x46\x1f\
-\x4c\x98\x04\x58\x40\x06\x20\x85\xec\x95\x42\x64\xbd\xf9\xa3\xd1\
-\x9f\x35\xbe\x67\x05\xe0\x48\xb6\xcc\x78\x57\x15\xcc\x46\xee\x3b\
-\x95\x3b\xef\x25\x47\xf4\x9d\xca\x7f\x0b\x3c\x8a\xb2\xa4\x02\xc0\
-\x21\x80\xa3\x7d\x30\xe1\x59\x93\x7f\x0e\x00\x84\xcc\xfa\x64\x96\
-\xc9\xfc\x15\x00\x03\x12\x80\xf5\x0d\x03\xb6\x69\x34\x9d\x25\xdf\
-\x6d\x51\xc1\xcd\xb2\xa7\xb7\xa7\xf4\x73\x90\x1d\x2a\xb9\x16\x2c\
-\x59\x7e\x6b\xcb\x3d\x42\x27\x23\xaa\xcd\x05\xf4\xde\x69\xb7\x45\
-\xaf\x04\xda\xb9\xaf\x7e\x61\x40\x23\x20\xce\x01\x38\x86\xcc\x8e\
-\x6f\x77\x15\xfb\x15\xf4\xf6\x31\x01\xa0\x8e\xde\xde\xf2\x2b\x00\
-\xd6\x6c\xb5\x6b\xc9\x3d\x42\x27\x13\xfa\x00\x14\x51\x75\x17\x22\
-\xeb\x91\x99\x10\xf9\xae\xfe\xcc\x90\x0a\xc0\x3a\x13\x00\x57\x54\
-\xd1\x90\xa4\xd1\xe4\x06\x40\xd4\xd1\x68\x35\x4a\x3f\x87\x35\x09\
-\x00\x1d\xc9\x84\x21\x80\xce\x33\x37\xdf\x73\x57\x20\xeb\x93\xa2\
-\x2d\x72\xbd\x0a\x99\xd0\x03\x00\xe0\x10\x80\x4b\x64\x05\xe5\x52\
-\xae\x00\xa0\x03\x55\x5c\x0b\x4c\x00\xdc\x61\xc4\x10\x00\xb2\xdc\
-\xa3\x00\x59\x26\x7a\x25\x44\x96\x2f\xfd\x35\x60\x05\xc0\xf6\xce\
-\x3e\x76\xf7\xf4\xb7\x23\xa6\x62\x54\x51\x01\x88\x63\x26\x00\xd4\
-\x51\xc5\xb5\x60\xcb\x04\x5c\x3a\xda\xce\xee\x3e\x76\x76\x4d\x78\
-\xde\xe4\x7c\xf6\x4a\x91\x4a\x21\x90\x73\x11\xac\xfe\x0a\xc0\x07\
-\x96\xff\x9d\x52\xc5\xad\x32\x8c\xc2\x0a\xce\x42\x36\x88\xa2\xa8\
-\xfc\x93\x30\x01\x70\x8a\x11\x55\x80\xbc\x43\xef\x59\x3b\x91\x59\
-\x86\x5c\xe9\xaf\x09\x43\x00\x9b\x5b\x06\x7c\x18\x54\x98\xb2\x6f\
-\x95\x52\x4a\x96\x64\xe9\x37\x9e\xf2\x4a\xbf\xe8\xf8\xf8\x77\xcb\
-\xc6\xa6\xfd\xcf\x9c\x0c\x88\x25\x20\x72\x55\x00\x84\x01\x13\x00\
-\x77\x76\xf5\x0f\x43\x50\x81\x4a\x7e\x5b\xf2\x6c\x69\xca\x42\x95\
-\x29\xfd\x9a\x60\x05\xc0\x29\xbb\x7b\x06\x3c\x73\x72\x3e\x7b\x05\
-\x44\x22\x81\x2c\xe7\x10\x80\xfe\x0b\xbb\xbd\x6f\xc2\x78\x0c\x15\
-\xa5\xec\x7b\xa5\x35\x6d\x59\xa9\x32\xca\x2b\xb7\xfb\xa4\x2d\x6d\
-\x00\xe8\x78\xda\xfb\x06\x24\x00\xf9\xab\xef\x89\x04\xf2\x0d\x01\
-\x14\xd2\x94\x38\xa7\xbd\x7d\xfd\x55\x08\xb2\x07\x27\x64\xd1\xa7\
-\x78\x4d\xd0\x49\x98\x51\x01\xc8\x7d\x84\x58\x66\x40\xae\x19\x30\
-\x99\x01\x8d\x23\xb8\x02\x80\x88\x88\xaa\xb2\x67\x40\xd5\x39\xef\
-\xfc\x3b\x01\xc4\x52\x00\xf9\x6a\x5f\x06\xcc\x01\xd8\x37\x21\x1b\
-\x23\x22\xa2\x5a\x30\xa2\xea\x9c\x77\x11\x00\xa0\x24\xf2\x26\x00\
-\x06\xac\x02\xd8\x33\x62\x3c\x86\x88\x88\xea\x60\xcf\x84\xaa\x73\
-\xee\xe2\x7b\x67\xd7\x95\x7c\xd3\x5f\xf5\x3f\xff\x99\x00\x10\x11\
-\x51\x65\xf6\x4d\x78\xe6\xe4\xae\xbe\x67\x2a\x7f\x02\xa0\x7f\x0a\
-\x80\x19\xe5\x18\x22\x22\xaa\x05\x23\x26\x01\xe6\x57\x44\x05\x40\
-\xff\xc3\x77\xdf\x84\x72\x0c\x11\x11\xd5\x82\x1b\x15\x00\x14\x50\
-\x01\x30\x00\x2b\x00\x44\x44\x54\x15\x23\xe6\x00\xe4\x1f\x7f\xf7\
-\xd4\xee\xbb\xbf\xe4\x2a\xe2\xef\x6e\x6e\x60\x77\x63\x23\x6f\x20\
-\xb9\xec\x6e\x73\x2f\x00\x22\x22\xaa\xc6\xce\xf6\x0e\x36\x7e\xfa\
-\x8b\xd6\x18\xfc\x24\x81\x1f\xe7\xea\xe3\xc7\x86\xe8\x44\x44\x44\
-\x75\xc4\x04\x80\x88\x88\xa8\x86\x98\x00\x10\x11\x11\xd5\x10\x13\
-\x00\x22\x22\xa2\x1a\x62\x02\x40\x44\x44\x54\x43\x4c\x00\x88\x88\
-\x88\x6a\x88\x09\x00\x11\x11\x51\x0d\x31\x01\x20\x22\x22\xaa\x21\
-\x26\x00\x44\x44\x44\x35\xc4\x04\x80\x88\x88\xa8\x86\x98\x00\x10\
-\x11\x11\xd5\x10\x13\x00\x22\x22\xa2\x1a\x62\x02\x40\x44\x44\x54\
-\x43\x4c\x00\x88\x88\x88\x6a\x88\x09\x00\x11\x11\x51\x0d\x29\x19\
-\xc6\xf9\x0e\xd0\xce\x00\x64\xc5\x44\xd3\x25\xc1\x5d\x8d\x89\x88\
-\xa8\x22\x42\x4a\xf8\x49\xbe\x67\x67\x5e\x2a\x8c\x91\xfb\xf9\xed\
-\x45\x69\xae\x03\x08\x08\x08\x29\x72\x1d\x23\x2f\xe9\x29\xad\xe7\
-\x27\x22\xa2\xfa\x90\x9e\x82\x1f\xe7\x7b\x76\xe6\xe5\x85\x09\x64\
-\x94\xe4\x3a\x06\x5f\x9d\x89\x88\x88\x6a\x88\x09\x00\x11\x11\x51\
-\x0d\x31\x01\x20\x22\x22\xaa\x21\x26\x00\x44\x44\x44\x35\xc4\x04\
-\x80\x88\x88\xa8\x86\x98\x00\x10\x11\x11\xd5\x10\x13\x00\x22\x22\
-\xa2\x1a\x62\x02\x40\x44\x44\x54\x43\x4c\x00\x88\x88\x88\x6a\x88\
-\x09\x00\x11\x11\x51\x0d\x31\x01\x20\x22\x22\xaa\x21\x26\x00\x44\
-\x44\x44\x35\xc4\x04\x80\x88\x88\xa8\x86\x98\x00\x10\x11\x11\xd5\
-\x10\x13\x00\x22\x22\xa2\x1a\x62\x02\x40\x44\x44\x54\x43\x4c\x00\
-\x88\x88\x88\x6a\x88\x09\x00\x11\x11\x51\x0d\x31\x01\x20\x22\x22\
-\xaa\x21\x26\x00\x44\x44\x44\x35\xc4\x04\x80\x88\x88\xa8\x86\x98\
-\x00\x10\x11\x11\xd5\x10\x13\x00\x22\x22\xa2\x1a\x52\xba\x03\x20\
-\xaa\x5a\xb3\xd9\xc4\x7f\xfd\xdb\xbf\x43\x14\x45\x10\x22\xdf\xb1\
-\xa2\x38\x82\xe7\x79\x90\xd2\x2b\x26\xb8\x4f\xc4\x49\x04\xa5\xec\
-\xfc\x9a\xee\xed\xed\x61\x73\x63\xab\x94\x63\xb7\xdb\xfb\xd8\xdf\
-\xdf\xc7\xd6\x66\xbe\xe3\x67\x19\xb0\xb5\xb5\x85\x66\xab\x89\xad\
-\xad\x72\x62\x25\x32\x95\x9d\x77\x16\xa2\x2e\xf5\xf4\xf6\x60\xf2\
-\xe6\x0d\xec\xec\xec\x60\x67\x67\x27\xd7\xb1\xc2\x28\x84\xa7\x14\
-\x76\x77\xf7\x0a\x8a\xee\xf7\x3c\xe5\x21\x8a\x42\xec\xee\xec\x96\
-\x72\xfc\x2a\x6c\x6f\x6f\x63\x7f\x7f\xbf\xb4\xe3\x6f\x6d\x6f\x63\
-\x7b\x6b\x3b\xf7\x71\xa6\xa6\x27\xf1\x77\xff\xe5\xef\xf0\xe6\xcd\
-\xdb\x02\xa2\x22\xb2\x03\x87\x00\xa8\x36\x9a\xcd\x26\x6e\xdd\x99\
-\x86\xa7\xf2\xbf\xad\x4b\x29\x91\x24\x49\x01\x51\x7d\x59\x18\x04\
-\xa5\x1e\xbf\x0a\x61\x58\xee\xef\x90\x26\x29\x3c\x2f\xff\x6d\x4c\
-\x7a\x12\xd3\xb7\xa7\xd1\xea\x69\x15\x10\x15\x91\x1d\x98\x00\x50\
-\x2d\x34\x1a\x0d\xcc\xce\xcd\xc0\x57\x7e\x21\xc7\x4b\x1b\x29\x44\
-\xde\xf1\x83\x23\x04\x0e\x24\x00\x7e\x50\xcc\xdf\xfb\x8b\x04\x90\
-\xa6\x69\x21\x87\x52\x4a\x61\x66\xee\x16\x9a\xcd\x66\x21\xc7\x23\
-\x32\x1d\x13\x00\x72\x5e\x9c\xc4\x98\x99\xbb\x55\xd8\xc3\x28\x8a\
-\x22\xf8\x7e\xb9\x0f\x36\xe5\x29\x48\x69\xff\xd7\xd3\x93\x5e\xe9\
-\x73\x18\x94\xef\x23\x8a\xc2\x42\x8e\xe5\x2b\x1f\x33\x73\x33\x48\
-\xd3\x72\xab\x3b\x44\x26\xb0\xff\x0e\x43\x74\x88\x30\x0a\x31\x3b\
-\x37\x83\x30\x2c\xe6\x01\xe1\x79\x12\x71\x12\x17\x72\xac\xc3\x04\
-\x61\xc9\x6f\xce\x15\x2a\xbd\x0a\x00\x20\x4e\x13\x48\xaf\x98\x89\
-\x98\x41\xd0\x49\x02\xa2\x38\x2a\xe4\x78\x44\xa6\x62\x02\x40\xce\
-\xf2\x83\x00\xb3\x77\x66\x11\xc7\xc5\x3d\xb0\xd3\xb4\xfc\xd2\x3f\
-\x00\x04\xbe\xfd\xe5\xff\x03\x55\xcc\x65\x10\x10\x68\x14\x38\x2c\
-\x13\x45\x11\x66\xef\xcc\x22\x28\x79\x0e\x03\x91\x4e\x4c\x00\xc8\
-\x49\xca\x57\x98\xbd\x73\x0b\x69\xa3\xb8\x52\x6e\x14\xc7\x50\x25\
-\x97\xfe\x01\xc0\x57\x0a\xb2\x80\x89\x6d\xa6\x90\x52\xc2\xaf\x60\
-\x29\xa3\x52\xaa\xb0\xa1\x00\x00\x48\xd2\x18\xb3\x77\x66\xe0\xfb\
-\x5c\x2c\x45\x6e\x72\xe7\x2e\x43\xf4\x2b\xcf\xf3\x70\x6b\x76\x1a\
-\xcd\x56\x71\x93\xb9\x3c\xe5\x21\xae\xa8\x24\xec\x3b\x30\xf9\xef\
-\x53\x55\xfd\x4e\x51\x9c\xc0\xf3\x8a\x7b\x60\x37\x9a\x0d\xcc\xdc\
-\x99\x81\x57\xd0\xf0\x02\x91\x49\x98\x00\x90\x53\xa4\x94\x98\x9e\
-\x99\x42\x6f\x5f\x6f\xa1\xc7\x6d\x54\x54\xfa\x07\x3a\x63\xd0\xae\
-\xa9\x6a\x49\xa3\x10\x40\xa3\x51\xcc\xaa\x80\x03\xad\x9e\x16\xa6\
-\x6f\x4f\x3b\x31\x29\x93\xe8\x63\xbc\xa2\xc9\x1d\x02\x98\x9c\xbe\
-\x81\x53\x03\xfd\x85\x1e\x36\x4e\x12\x78\x15\x75\xe3\x53\xbe\x1b\
-\xb3\xff\x3f\x25\xa4\x80\xaa\xa8\x94\xee\x29\x0f\x71\xc1\x3d\x1a\
-\x4e\x9d\xea\xc3\xcd\x99\x29\x08\x59\x4d\x12\x48\x54\x05\xf7\xee\
-\x34\x54\x4b\x42\x08\x4c\x4e\x4d\xe2\xf4\xd0\xe9\x42\x8f\xab\x3c\
-\x55\x59\xe9\x1f\x00\x42\x87\x26\xff\x7d\xaa\xca\xc6\x46\x71\x1c\
-\x41\x15\xd0\xf0\xe9\x63\x03\x83\x03\x98\x9a\x9e\x04\x98\x03\x90\
-\x23\x98\x00\x90\xfd\x04\x30\x71\x7d\x02\xc3\x23\x43\xc5\x1e\x56\
-\x00\x69\xb3\xd8\x72\xf2\xe1\xe7\x13\x4e\xcf\x3a\xf7\x03\xbf\xb2\
-\x61\x14\x00\x48\x1b\xcd\xc2\xcf\x77\x7a\xe8\x34\x6e\x4c\x5e\x67\
-\x12\x40\x4e\x60\x02\x40\xd6\xbb\x7c\xe5\x12\xc6\xce\x8e\x16\x7e\
-\xdc\x38\x4e\x2a\x9d\xfc\xa5\x94\xaa\xf4\x01\x59\x35\x29\x64\xa5\
-\x1b\x1b\x95\xd5\xb3\xe1\xcc\xe8\x19\x4c\x5c\x9d\x28\xfc\xb8\x44\
-\x55\x63\x02\x40\x56\xbb\x78\xe9\x22\xce\x5f\x3c\x5f\xf8\x71\x95\
-\x52\x08\x0b\x5c\x52\x76\x1c\x2e\x4e\xfe\xfb\x54\xd5\xbf\x63\x14\
-\x45\xa5\x2c\x41\x3c\x7b\x7e\x0c\x17\x2e\x5d\x28\xfc\xb8\x44\x55\
-\x62\x02\x40\xd6\x3a\x7b\x6e\x0c\xe3\x97\x2f\x96\x72\xec\xb4\x59\
-\xdd\xac\x7f\xa0\x53\xfe\x2f\xbb\xbd\xb0\x09\x82\x20\xa8\xbc\xca\
-\x91\x36\x1a\xa5\x9c\xf3\xd2\xe5\x71\x9c\xbb\x70\xae\xf0\xe3\x12\
-\x55\x85\x09\x00\x59\xe9\xcc\xe8\x30\xae\x5c\xbb\x52\xca\xb1\xd3\
-\x34\x85\x27\xab\x5d\xf7\xed\xea\xec\xff\x4f\x09\x21\x2a\x1d\x06\
-\x00\x3a\x3b\xfd\x15\xbd\x2a\xe0\xc0\x95\x89\xcb\x18\x19\x2b\x7e\
-\xf8\x89\xa8\x0a\xee\xdf\x71\xc8\x39\xa7\x87\x06\x71\x7d\xf2\x7a\
-\x29\x6f\x75\xbe\x5f\x7d\xe9\x1f\x70\x63\xeb\xdf\xe3\x2a\x7b\x8b\
-\xe0\xcf\x89\xa2\xb0\x9c\x3d\x09\x04\x70\xfd\xc6\x55\x0c\x9d\x29\
-\x76\xf5\x09\x51\x15\x98\x00\x90\x55\x4e\xf5\xf7\x61\x6a\x7a\xb2\
-\x94\x87\xbf\x10\x02\x69\xa3\x51\xf8\x71\x8f\xa3\x0e\xe5\xff\x03\
-\xba\x7e\xd7\x34\x4d\x21\x45\x09\xb7\x3c\x01\x4c\x4e\x4d\x62\x60\
-\xb0\xd8\xfe\x13\x44\x65\x63\x02\x40\xd6\xe8\xe9\xed\xc1\xf4\xcc\
-\x34\x44\x49\xa5\xf2\x34\x4d\xb4\x94\xe1\x03\xbf\xda\xe5\x71\xba\
-\x09\x21\x10\x68\x48\x02\xa4\x94\x48\xd2\x72\x76\x72\x14\x52\xe0\
-\xe6\xad\x9b\xe8\x2b\xb8\x03\x25\x51\x99\x98\x00\x90\x15\x9a\xcd\
-\x26\x6e\xdd\x99\x86\x57\x70\x73\x97\x03\x41\x10\x20\x28\x68\xcb\
-\xe0\x93\xf2\x1d\x5e\xfb\xff\x25\xba\xfe\xd6\x41\x18\x22\x28\x69\
-\xb8\x45\x7a\x12\xd3\xb7\xa7\xd1\xea\x69\x95\x72\x7c\xa2\xa2\x31\
-\x01\x20\xe3\x35\x1a\x0d\xcc\xce\xcd\xc0\x57\xe5\xbc\x35\x0a\x29\
-\x90\x14\xb8\x6b\xe0\xc9\x4e\x8e\x4a\xdf\x86\xe5\xaf\x6b\xe3\x5b\
-\x3d\x2d\xf4\x9e\xea\x45\xef\xa9\x5e\xb4\x7a\x5a\x88\x93\xb8\xd2\
-\x1d\x08\x75\x56\x3d\x92\x34\x2d\xad\xd2\xa3\x94\xc2\xcc\xdc\x2d\
-\x34\x9b\xc5\x6d\x44\x45\x54\x16\x26\x00\x64\xb4\x38\x89\x31\x33\
-\x77\xab\x9c\x09\x5c\xbf\x2a\x6d\x6c\xf8\x18\x02\xbf\xba\x65\x71\
-\x49\x9a\xa0\xb7\xaf\x17\x49\x9a\xc0\x0f\x7c\x78\x9e\x07\xcf\xf3\
-\xe0\x07\xfe\xef\xfe\x5b\x25\x84\xbe\xb9\x00\x52\x0a\xa4\x25\xfe\
-\x9e\xbe\xf2\x31\x33\x37\x53\xea\x39\x88\x8a\xc0\x04\x80\x8c\x15\
-\x46\x21\x66\xe7\x66\x10\x96\x58\x2e\x0e\x82\xa0\xb4\x92\xf0\xf1\
-\xce\x5f\xfe\x43\x50\x08\x81\x56\x6f\xe7\x2d\xff\xb0\x64\x43\x08\
-\xd1\xa9\x0e\xf4\xb6\x2a\x49\x4a\x74\x36\x3e\xf2\x4b\xfe\xdc\x83\
-\xa0\x93\x04\x44\x15\xee\x23\x41\x74\x52\x4c\x00\xc8\x48\x7e\x10\
-\x60\xf6\xce\x2c\xe2\xb8\x9c\x49\x5b\x40\x67\x52\x58\x5a\xf0\xd6\
-\xb1\x27\x21\x84\xa8\x24\xf9\x48\x9b\xe9\x89\xde\xb6\x7d\xdf\x47\
-\xa3\x59\xfe\x6a\x08\x1d\x4d\x81\x3e\x96\x96\x38\x14\x00\x74\xba\
-\x10\xce\xde\x99\x75\x7a\x7f\x07\xb2\x1b\x13\x00\x32\x8e\xf2\x15\
-\x66\xef\xdc\x42\x5a\xf2\xb8\x7c\x9a\x26\x5a\x1f\x40\x65\x0e\x6b\
-\xfc\x76\x0e\xdf\xef\xaa\x82\x12\x84\xd5\x54\x46\xaa\xf8\x1b\x7c\
-\x89\x90\xa2\xf4\x04\x30\x49\x63\xcc\xde\x99\xa9\xd5\x32\x4f\xb2\
-\x07\x13\x00\x32\x8a\x52\x0a\xb3\x73\xb3\x68\xb6\xca\x9d\x44\x15\
-\x46\x21\x7c\xcd\xcd\x77\xaa\xd8\xfa\x37\xcf\x66\x38\x51\x52\x7e\
-\xf9\x5a\xf7\xf6\xc7\xbe\xef\x97\xde\xf8\xa9\xd1\x6c\xe0\xf6\xdd\
-\xdb\x95\x77\x40\x24\x3a\x0a\x13\x00\x32\x86\xf4\x24\x1e\x2e\x3d\
-\x40\xdf\xa9\xbe\x72\xcf\x23\x25\x92\x92\x5a\xc3\x1e\x97\x10\xa2\
-\xf4\xb7\xdf\xbc\xe7\xf0\x2b\x98\xa9\xaf\x7c\x05\x21\xf5\xf6\x40\
-\x48\x93\x14\x5e\xc9\x2b\x20\x7a\x7a\x7b\xf0\xe8\xc9\x42\xe9\xe7\
-\x21\x3a\x09\x5e\x8d\x64\x04\x21\x04\xee\x2f\x7c\x8d\x33\xa3\x67\
-\x4a\x3f\x57\xda\xa8\x76\xa3\x9f\xcf\xa9\xa2\xbc\x5e\xc4\xb2\xbe\
-\xb2\xb7\x43\xd6\xd5\x14\xe8\xf7\x41\x74\xe6\x03\x94\x6d\xe8\xcc\
-\x10\x1e\x2c\x3e\xac\xc5\x9e\x0f\x64\x07\x5e\x89\xa4\x9d\x10\x02\
-\xf3\x0b\xf3\x38\x7b\xe1\x6c\xe9\xe7\x8a\xa2\xc8\x88\xf1\xd8\xaa\
-\x66\xff\xe7\x3e\x46\x05\x6f\xe7\xba\x87\x62\x00\x40\xf9\x3e\xa2\
-\x0a\xf6\x80\x18\x3d\x3b\x82\xfb\x8f\xbe\xd6\x9e\x80\x12\x01\x4c\
-\x00\x48\x33\x21\x04\xee\xcc\xdf\xc1\x85\xf1\xf3\xa5\x9f\xcb\xfb\
-\xb5\x09\x8e\x6e\x42\x56\xb3\x23\x5e\xd6\xce\x72\x1f\xa3\xdd\x6e\
-\x17\x10\xc9\xe1\x7c\xa5\xb4\xf5\x61\xf8\x58\x9c\x26\x90\x25\x57\
-\x3c\x00\xe0\xec\x85\xb3\xb8\x7b\xff\x2e\x93\x00\xd2\x4e\xff\xb7\
-\x8e\x6a\x6d\xfa\xce\x34\xae\x5c\xbd\x5c\xc9\xb9\xd2\x54\x7f\xe9\
-\x1f\xa8\xae\x0b\xde\xfe\xfe\x7e\xae\x24\x20\xcb\x32\xb4\xf7\xcb\
-\x4f\x00\x3a\xcb\x21\xf5\x57\x65\x04\x04\x1a\x15\x0d\x0f\x8d\x5f\
-\xb9\x88\xd9\xaf\x66\x4b\x3f\x0f\xd1\x61\x98\x00\x90\x36\x53\xb7\
-\xa6\x70\x63\xea\x7a\x25\xe7\x8a\xe2\x18\xca\x80\xd2\x3f\x50\x6d\
-\x1f\xfc\x9d\x9d\x9d\x5c\x3f\x9b\x65\xf9\xab\x08\xc7\xe1\x87\x66\
-\x7c\x36\x4a\xa9\x4a\x86\x02\x00\xe0\xea\x8d\x09\x4c\xde\x9a\xac\
-\xe4\x5c\x44\x9f\xc3\x04\x80\xb4\x98\xb8\x76\x05\x37\x67\xa7\x2a\
-\x39\x97\xa7\x3c\xc4\x86\x74\x64\x13\x42\x40\x55\x50\x66\x3e\xb0\
-\xb1\xb1\xd1\xf5\x43\x7c\x73\x63\xb3\xe0\x68\xbe\xcc\x57\xbe\xf6\
-\xd5\x00\x07\xa2\x38\x81\xe7\x55\xb3\x64\x6f\x7a\xf6\x26\xae\x4d\
-\x5e\xab\xe4\x5c\x44\x9f\x62\x02\x40\x95\xbb\x78\xf9\x02\x6e\xdf\
-\xbb\x5d\xd9\xf9\x1a\x86\x94\xfe\x81\xea\xbb\xdf\xb5\xf7\xdb\xd8\
-\x58\xdf\x38\xf1\xcf\x6d\xac\x6f\x60\x7f\x6f\xbf\x84\x88\xbe\x2c\
-\xd0\xdc\x13\xe0\x80\x10\x40\xa3\xc2\x0e\x91\x33\x73\xb7\x70\x69\
-\xe2\x52\x65\xe7\x23\x3a\xc0\x04\x80\x2a\x75\xf6\xfc\x18\xee\x3d\
-\xb8\x57\xd9\x43\x30\x4e\x12\x78\x06\x35\x60\x09\x35\xb4\x85\xdd\
-\xda\xdc\x3a\x51\x12\xb0\xb9\xb1\x59\xe9\xdb\xff\x81\xd0\x80\xd5\
-\x00\x07\x3a\x55\xa3\x6a\x26\x8c\x0a\x21\xf0\xd5\xd7\x73\x38\x77\
-\xf1\x5c\x25\xe7\x23\x3a\xc0\x04\x80\x2a\x33\x3c\x32\x84\xfb\x8f\
-\xab\x5b\x02\xa5\x3c\x65\x4c\xe9\x1f\xe8\x34\x20\xd2\xd5\x0d\x6e\
-\x73\x63\x13\xbf\xbc\xfd\x05\x7b\x7b\x7b\x5f\xfc\x37\xfb\xfb\xfb\
-\x78\xff\xee\x7d\x57\x15\x83\x22\x28\x5f\x19\xb5\x46\x3e\x4e\x62\
-\x28\x55\xcd\x70\x8d\x10\x02\x5f\x2f\xcc\x63\x64\x6c\xa4\x92\xf3\
-\x11\x01\x4c\x00\xa8\x22\x03\xa7\x07\xb0\xb0\xb4\x00\x29\xab\xba\
-\xa1\x76\x36\xc1\x31\x89\xce\x5d\x07\x01\x60\x77\x77\x17\xef\xde\
-\xbc\xc3\xbb\x37\xef\xb0\xb1\xbe\x81\xad\xcd\xad\xdf\xaa\x03\xef\
-\xde\xbc\xc3\xdb\x9f\xdf\xe6\x9a\x34\x58\x04\xdd\x7f\xa3\x4f\xa5\
-\x8d\x66\x65\x09\xab\x94\x9d\x4e\x98\xa7\x87\x4f\x57\x72\x3e\x22\
-\x26\x00\x54\xba\xbe\x53\x7d\x78\xfc\xf4\x11\x94\x5f\xdd\xdb\x6f\
-\x1c\x27\xa5\x77\xb1\x3b\x29\x13\x96\xba\x01\xc0\xde\xde\x1e\x36\
-\x37\x36\xb1\xfe\x61\x1d\xeb\x1f\xd6\xb1\xb9\xb1\x79\x68\x65\xa0\
-\x4a\xa6\xfc\x8d\x0e\x54\xdd\x3b\xc2\xf3\x3c\x3c\x7a\xb2\x80\xfe\
-\x81\xfe\xca\xce\x49\xf5\xc5\x04\x80\x4a\xd5\xdb\xd7\x83\xa5\x17\
-\x8b\x95\xbe\xd9\x29\xa5\x4a\xdf\xe0\xe5\xa4\x74\x96\xff\x6d\xa2\
-\x94\x82\x57\x51\x95\xe8\xb8\xa2\x28\x82\x5f\xe1\x67\xe7\xfb\x3e\
-\x16\x9f\x3f\x2e\x7d\x4f\x0c\x22\x26\x00\x54\x9a\x46\xb3\x81\xc5\
-\x67\x4b\x5d\x6d\x47\x9b\x47\xda\x34\x67\xd6\xff\x01\xd3\x4a\xdb\
-\x26\xf3\x03\xf3\x12\xa5\xb4\xd1\xa8\xf4\x9a\x0a\x82\x00\x4b\xcf\
-\x17\xd1\xea\x69\x55\x76\x4e\xaa\x1f\x26\x00\x54\x8a\x38\x89\xb1\
-\xf4\x62\x09\x71\x05\x5b\xca\x7e\x2c\x4d\x53\xe3\xde\x20\x01\xb3\
-\x66\xb8\x9b\x2e\x08\xcc\xaa\xde\x00\x9d\x8d\x95\xe2\x8a\x77\x90\
-\x0c\xa3\x10\x4b\xcf\x17\x91\x36\xf4\xee\x5c\x49\xee\x62\x02\x40\
-\x85\x0b\xa3\x08\x7f\x7a\xbe\x54\xe9\x5a\x6a\x00\xf0\x7d\xf3\x4a\
-\xff\x40\xa7\xfc\xef\x55\x34\x9b\xdc\x05\x4a\x79\x85\xec\x64\x58\
-\xb4\x28\x0a\x4b\xdf\xc2\xf9\x53\x49\x9a\x60\xe9\xf9\x92\x51\xab\
-\x59\xc8\x1d\xe6\x7d\xcb\xc8\x6a\x7e\xe0\x63\xe9\xd9\x63\xb4\x7a\
-\xab\x2d\x5d\x0a\x21\x90\x36\x1a\x95\x9e\xf3\xb8\x74\xac\xfd\xb7\
-\x9d\xa9\x15\x93\x34\x4d\x2b\xdf\xb8\xa8\xd9\x6a\x62\xf1\xd9\x22\
-\x02\x5e\x47\x54\x30\x26\x00\x54\x18\xa5\x14\x1e\x3f\x79\x84\xbe\
-\xfe\xea\x27\x2f\xa5\x69\x62\xd4\x1a\xf2\x8f\x99\xb0\xdd\xad\x6d\
-\xaa\x7e\xd3\x3e\x2e\x29\x25\x92\xb4\xfa\x1d\x25\x7b\x4f\xf5\x62\
-\xf1\xd9\x63\x4e\x24\xa5\x42\x99\x79\xc7\x24\xeb\x48\xaf\xb3\x86\
-\x79\x70\x68\xb0\xf2\x73\x07\x41\x50\xe9\x06\x3b\x27\xe1\x79\x5e\
-\xa5\xbd\xff\x5d\xa1\x3c\x65\xdc\x32\xce\x03\x41\x18\x6a\x99\xd4\
-\xd9\x3f\xd0\x8f\x47\x4f\x16\xe0\x19\x38\x3c\x42\x76\xe2\x95\x44\
-\xb9\x09\x21\x70\x7f\xe1\x6b\x9c\x19\x3d\x53\xfd\xb9\xa5\x40\x62\
-\xf0\x24\x29\xce\xfe\xef\x9e\xc9\x7f\xbb\x24\x4d\xb5\x54\x9c\x86\
-\xce\x0c\xe1\xc1\xe2\x43\x63\xab\x5d\x64\x17\x5e\x45\x94\x8b\x10\
-\x02\x77\xef\xdf\xc5\xd9\x0b\x67\xb5\x9c\x5f\xc7\x98\xec\x49\x98\
-\xd6\xd8\xc6\x26\x26\xff\xed\xa4\x14\x48\x53\x3d\x89\xe7\xe8\xd9\
-\x11\xcc\x3f\xbc\x6b\xdc\x52\x57\xb2\x8f\xb9\x77\x4e\x32\x9e\x10\
-\x02\x77\xe6\xef\x60\xfc\xca\x45\x2d\xe7\x0f\x82\xc0\xe8\xb7\x44\
-\xe5\x79\xc6\x96\xb1\x6d\xe0\x19\xfe\xf7\xf3\x35\x5e\x7f\xe7\xc7\
-\x2f\xe0\xee\x7d\x26\x01\x94\x0f\x13\x00\xea\xda\xad\xdb\xd3\xb8\
-\x72\xf5\xb2\x96\x73\x0b\x29\x90\x56\xbc\xcc\xf0\xa4\x4c\x9f\xfc\
-\x27\xa5\x34\xbe\x94\x6c\x72\x15\x00\xf8\xb5\x02\xa5\xe9\x6f\x38\
-\x7e\xe5\x22\x66\xbf\x9a\xd5\x72\x6e\x72\x03\xa7\x94\x52\x57\xa6\
-\x6e\x4d\xe1\xfa\xcd\xeb\xda\xce\xdf\x48\xab\xed\xcc\xd6\x0d\x13\
-\x97\xb2\x85\x51\x88\x30\xfc\xe3\x7a\xf6\xdd\x9d\x5d\x6c\x6f\x6d\
-\x63\x7b\x7b\x5b\x53\x64\x9f\x17\x86\x21\x36\x37\xb7\x74\x87\xf1\
-\x45\x07\x89\xe8\xfb\x5f\xde\x6b\x39\xff\xd5\x1b\x13\xd8\xde\xde\
-\xc6\xdf\xff\xb7\xbf\xd7\x72\x7e\xb2\x1b\x13\x00\x3a\xb1\x89\x6b\
-\x57\x70\x73\x76\x4a\xdb\xf9\x43\x0d\x0d\x59\x4e\xca\x33\xac\x99\
-\x8d\xf4\x24\x9a\xad\xe6\x17\x97\x91\xf9\x81\x0f\x3f\xf0\x11\xed\
-\x45\x78\xff\xee\x3d\xda\xed\x76\xc5\x11\x7e\x9e\x94\x12\x9e\xe7\
-\x61\x7f\x7f\x5f\x77\x28\x5f\xe4\xfb\x3e\xc2\x28\xc4\xf6\x96\x9e\
-\xe4\x69\x7a\xf6\x26\xf6\xf7\xf6\xf1\x0f\x7f\xff\x0f\x5a\xce\x4f\
-\xf6\x32\xe7\x0e\x45\x56\xb8\x78\xf9\x02\x6e\xdf\xbb\xad\xed\xfc\
-\x52\x4a\x24\x15\xb7\x64\xed\x86\x49\x6f\xff\xd2\x93\xe8\xe9\xed\
-\x39\xd6\x1a\x72\xa5\x14\x7a\xfa\x7a\x8c\x4a\x5e\x6c\x68\xa4\x94\
-\x26\xa9\xd6\xe5\x79\x33\x73\xb7\x70\x69\xe2\x92\xb6\xf3\x93\x9d\
-\xcc\xf9\x96\x93\xf1\xce\x9e\x1f\xc3\xbd\x07\xf7\xb4\x96\xde\xd3\
-\x86\x79\x1b\xfd\x7c\x8e\x49\x15\x8a\x56\xab\x75\xa2\x71\x6a\x29\
-\x3b\xd5\x02\x53\x04\xbe\xf9\x09\x00\x44\x67\x3e\x80\xb6\xd3\x0b\
-\x81\xaf\xbe\x9e\xc3\xb9\x8b\xe7\xb4\xc5\x40\xf6\x61\x02\x40\xc7\
-\x32\x3c\x32\x84\xfb\x8f\xbf\xd6\xfa\xf0\x8d\xa2\x08\xbe\x6f\xce\
-\x83\xf5\x4b\x94\x67\xce\x96\xb6\x51\x1c\x75\xb5\x0f\x81\x52\x0a\
-\x51\x64\x46\xff\x79\xe9\xd9\xb1\x95\xb2\xf2\x7d\x44\x1a\xf7\xa2\
-\x10\x42\xe0\xeb\x85\x79\x8c\x8c\x8d\x68\x8b\x81\xec\xc2\x04\x80\
-\x8e\x34\x70\x7a\x00\x0b\x4b\x0b\x90\x1a\x1f\x6a\x9e\x27\x11\x27\
-\xd5\xb7\x60\xed\x46\x10\x9a\x93\xa4\xe4\xd9\x1c\x29\x8c\xcd\xe9\
-\xae\x68\x52\x45\xe5\x30\x71\x9a\x40\x6a\x5c\xba\x28\x65\xa7\x23\
-\xe7\xe9\xe1\xd3\xda\x62\x20\x7b\x30\x01\xa0\x43\xf5\x9d\xea\xc3\
-\xe3\xa7\x8f\xa0\x7c\xbd\x6f\x60\x69\x6a\x47\xe9\x1f\x30\xa7\x64\
-\x2d\x65\xbe\x37\x67\xa5\x14\x84\x34\xe3\x6f\x6e\xd2\x9c\x8a\xc3\
-\x08\x08\x34\x34\x0f\x53\x79\x9e\x87\x47\x4f\x16\xd0\x3f\xd0\xaf\
-\x2d\x06\xb2\x03\x13\x00\xfa\xa2\xde\xbe\x1e\x2c\xbd\x58\xd4\xde\
-\x6c\x27\x8a\x63\x28\x0b\x4a\xff\x00\xe0\x2b\x65\xcc\x04\xba\x22\
-\xd6\xa7\x9b\x32\x94\x21\xa5\x84\x6f\xc1\x30\x00\x70\x30\x7c\xa2\
-\xb7\x7a\xe2\xfb\x3e\x16\x9f\x3f\x46\xdf\xa9\xea\x37\xe6\x22\x7b\
-\x98\x71\xa7\x22\xe3\x34\x9a\x0d\x2c\x3e\x5b\x42\xa8\x79\x93\x1d\
-\x4f\x79\x56\xed\x85\x6e\x52\xf3\x9f\x22\xde\x42\x4d\xaa\xba\x98\
-\xf4\xb7\x3d\x4a\x14\x27\xf0\x3c\xbd\x09\x4b\x10\x04\x58\x7a\xbe\
-\x88\x56\x4f\xb5\x5b\x73\x93\x3d\x98\x00\xd0\x1f\xc4\x49\x8c\xa5\
-\x17\x4b\x88\x13\xfd\x0f\xde\x86\x45\xa5\x7f\xc0\xfc\xce\x75\x36\
-\xb3\x65\x18\x00\x00\x84\x00\x1a\x06\x74\xaa\x0c\xa3\x10\x4b\xcf\
-\x17\x91\x1a\xbc\x61\x16\xe9\xc3\x04\x80\x7e\x27\x8c\x22\xfc\xe9\
-\xf9\x92\x11\x37\xaf\x38\x49\xe0\x59\x52\xf6\x05\x00\xdf\x57\xc6\
-\xb7\xd6\xb5\x99\x90\x42\xfb\x5c\x94\x93\xe8\x54\xaf\xf4\x4f\x5c\
-\x4d\xd2\x04\x4b\xcf\x97\xac\xaa\xa4\x51\x35\x78\xb7\xa2\xdf\xf8\
-\x81\x8f\xa5\x67\x8f\xd1\xea\xd5\x5f\x32\x54\x9e\xb2\xee\x86\x15\
-\xf8\xe6\xcc\x9a\x77\x55\x68\xc8\x04\xcb\xe3\x8a\x93\x18\xaa\x8b\
-\x65\x98\x45\x6b\xb6\x9a\x58\x7c\xb6\x88\xc0\x82\xa6\x4a\x54\x1d\
-\x26\x00\x04\xa0\x33\x71\xe9\xf1\x93\x47\xe8\xeb\xd7\x3f\x69\x48\
-\x08\x20\x6d\xea\xaf\x40\x9c\x84\x10\xc2\xa8\xe5\x7f\xae\xf2\x43\
-\xdf\xaa\x21\x21\x00\x48\x1b\x4d\x23\x62\xee\x3d\xd5\x8b\xc7\x4f\
-\x1f\x5b\xd1\x53\x81\xaa\xc1\x04\x80\x20\xbd\xce\xda\xe1\xc1\xa1\
-\x41\xdd\xa1\x00\xf8\xb5\xf4\x6f\xf0\x36\xb0\x9f\xa3\x94\x32\xe2\
-\x26\xef\x3a\x29\xec\x68\x0a\xf4\xb1\x4e\x0f\x0b\x33\xaa\x59\x03\
-\x83\xfd\x78\xf4\x64\x41\x6b\xdb\x62\x32\x07\xaf\x82\x9a\x13\x42\
-\xe0\xfe\xc2\xd7\x38\x33\x7a\x46\x77\x28\x00\x3a\x0f\x52\xdd\x2b\
-\x0f\xba\xc1\xc9\x7f\xd5\xb1\xf1\x6f\x1d\x45\xb1\x31\xcb\x18\x87\
-\xce\x0c\xe1\xc1\xe2\x43\xce\x57\x21\x26\x00\x75\x26\x84\xc0\xdd\
-\xfb\x77\x71\xf6\xc2\x59\xdd\xa1\xfc\x26\x6d\xda\x35\xeb\x1f\xe8\
-\xfc\x1d\x6d\x68\x51\xec\x8a\x20\x08\xac\xbb\x46\x00\x20\x6d\x98\
-\xb3\x85\xf5\xe8\xd9\x11\xcc\x3f\xbc\x6b\x4c\x3c\xa4\x07\x13\x80\
-\x9a\x12\x42\xe0\xce\xfc\x1d\x8c\x5f\xb9\xa8\x3b\x94\xdf\xa4\x69\
-\x6a\x4c\xe3\x99\x93\x50\x0e\xcf\xfe\xcf\x90\xe9\x0e\xe1\x0f\x84\
-\x10\xd6\x0d\x03\x00\x9d\xa1\xb6\xd8\xa0\x9d\x2c\xcf\x8f\x5f\xc0\
-\xdd\xfb\x4c\x02\xea\xcc\xcd\xbb\x16\x1d\xe9\xd6\xed\x69\x5c\xb9\
-\x7a\x59\x77\x18\xbf\xf1\x7d\x95\xab\x6f\xbd\x4e\xa6\xae\x4f\x6f\
-\xb7\xdb\xb9\x8f\x91\xb5\xcd\x4b\x00\x00\x3b\xb6\x08\xfe\x9c\x28\
-\x0a\x8d\xda\xd7\x60\xfc\xca\x45\xcc\x7e\x35\xab\x3b\x0c\xd2\x84\
-\x09\x40\x0d\x4d\xdd\x9a\xc2\xf5\x9b\xd7\x75\x87\xf1\x1b\x21\x04\
-\xd2\x46\x43\x77\x18\x5d\x33\xb5\xfc\xbf\xbf\xbf\x9f\xeb\x01\x9e\
-\xb5\x33\xec\xef\xef\x17\x18\x51\x71\x4c\xfd\x9b\x1f\x47\x9a\xa6\
-\x90\xc2\x9c\x5b\xef\xd5\x1b\x13\x98\xbc\x35\xa9\x3b\x0c\xd2\xc0\
-\x9c\xab\x90\x2a\x31\x71\xed\x0a\x6e\xce\x4e\xe9\x0e\xe3\x77\xd2\
-\x34\xb1\xb6\x84\x1e\xf8\x66\x2f\x4b\xdb\xd9\xd9\xe9\xfa\x67\xb7\
-\x77\xb6\x0b\x8c\xa4\x58\x42\x08\x04\x96\x26\x01\x52\x4a\x24\xa9\
-\xfe\x06\x41\x1f\x9b\x9e\xbd\x89\x6b\x93\xd7\x74\x87\x41\x15\xb3\
-\xf3\xae\x4b\x5d\xb9\x7a\x63\x02\xb7\xef\xdd\xd6\x1d\xc6\xef\x04\
-\x41\x80\xc0\xc2\x59\xff\x07\x7c\xc3\x4b\xd1\x9b\x1b\x9b\x5d\xfd\
-\x5c\x96\x65\x5d\xff\x6c\x55\x6c\xbe\x6e\x82\x30\xd4\xbe\xc9\xd6\
-\xa7\x66\xe6\x6e\xe1\xfa\x14\x93\x80\x3a\x61\x02\x50\x13\xe3\x57\
-\xc6\xb1\xf8\xf4\xb1\x51\x6f\xab\x42\x0a\x24\x36\xf7\x28\x17\x30\
-\xfe\x2d\x74\x7f\x7f\x1f\xeb\x1f\xd6\x4f\xfc\x73\x1b\x1f\x36\xd0\
-\xde\xcf\x3f\x87\xa0\x4c\xa6\x57\x5f\x8e\x92\xa4\xa9\x51\x95\x2f\
-\x21\x04\x1e\x3f\x59\xc0\x65\x83\xe6\x06\x51\xb9\xcc\xb9\xfa\xa8\
-\x34\x67\xcf\x8f\xe1\xc5\xf2\x53\x48\x43\xf6\x76\x3f\x60\xda\x58\
-\xe8\x49\x05\xbe\x1d\xcb\xd1\xb6\x36\xb7\xb0\xb1\xbe\x71\xec\x7f\
-\xbf\xb1\xbe\x81\xad\xad\xad\x12\x23\x2a\x88\xb0\x7b\x2e\x80\x94\
-\x02\x69\x6a\x56\x02\x2c\x84\xc0\xb3\x97\x4f\x70\x61\xfc\xbc\xee\
-\x50\xa8\x02\xf6\xde\x7d\xe9\x58\x86\x47\x86\xf1\x72\xed\x1b\x48\
-\xc3\x3a\xeb\x05\x41\x60\x5c\x09\xf4\xa4\x6c\x6a\x48\xb3\xb9\xb1\
-\x89\x5f\xde\xfe\x82\xbd\xbd\xbd\x2f\xfe\x9b\xbd\xbd\x3d\xfc\xf2\
-\xf6\x17\xe3\x4b\xff\x1f\xb3\xe9\x33\xf8\x83\xe8\x6c\xe2\x00\x00\
-\x11\xc0\x49\x44\x41\x54\x1c\xdf\xc0\xef\x81\x94\x12\x2f\x56\x9e\
-\x63\x74\x6c\x44\x77\x28\x54\x32\x26\x00\x0e\x1b\x18\x1c\xc0\xca\
-\xf7\xcb\xc6\xbd\x25\x09\x29\x90\x1a\xb0\xdb\x60\x1e\x42\x08\xe3\
-\x6e\xdc\x47\xd9\xdd\xdd\xc5\xbb\x37\xef\xf0\xf6\xcd\x5b\xac\x7f\
-\x58\xc7\xd6\xe6\x16\xb6\x36\xb7\xb0\xfe\x61\x1d\x6f\xdf\xbc\xc5\
-\xbb\x37\xef\xb0\xbb\xbb\xab\x3b\xcc\x13\xb1\xb5\x29\xd0\xc7\x52\
-\xc3\x86\x02\x80\x4e\x47\xce\xe5\xef\x5e\x62\x68\xf8\xb4\xee\x50\
-\xa8\x44\x66\x5d\x75\x54\x98\xfe\x81\x53\x78\xf5\xe3\xaa\x91\x6d\
-\x75\x1b\xa9\x39\x1d\xd1\xba\x65\xd2\x5a\xee\x93\xda\xdf\xdb\xff\
-\xed\xc1\x7f\x90\x08\xec\xef\x99\xb9\xdc\xef\x38\x6c\xfe\x2c\x00\
-\x73\x13\xe2\x20\x08\xb0\xfa\x7a\x05\x03\x83\x03\xba\x43\xa1\x92\
-\x30\x01\x70\x50\xab\xb7\x07\xab\x3f\xac\x22\x32\x70\x3b\xdd\xd0\
-\xb0\x46\x28\xdd\xb2\x6d\x5b\x5a\x97\xb9\xf0\x59\xf8\xbe\x6f\x64\
-\x23\xac\x30\x0c\xb1\xf6\x7a\x05\x7d\x7d\xbd\xba\x43\xa1\x12\x30\
-\x01\x70\x4c\xda\x48\xf1\xea\xc7\x15\xa4\x06\xce\xae\x97\x52\x22\
-\x31\xa8\x15\x6a\xb7\x84\x10\x4e\x24\x31\xae\x50\xbe\x82\x30\x6c\
-\x82\x6b\x37\x92\x24\x31\x72\x97\xbe\x38\x89\xb1\xf6\xe3\x2a\x9a\
-\x2d\x7b\x9b\x75\xd1\xe7\x99\x77\xb5\x51\xd7\xa2\x38\xc6\xab\xd7\
-\xab\x68\xb5\x5a\xba\x43\xf9\xac\xb4\x61\xdf\x46\x3f\x9f\x63\xdb\
-\xd8\xbf\xeb\x6c\x6e\x0a\xf4\x31\x21\x04\x92\xd4\xbc\xa1\x00\x00\
-\x68\x34\x1b\x58\x7b\xbd\x86\xc4\xb0\x55\x0b\x94\x0f\x13\x00\x47\
-\x84\x61\x80\xb5\x1f\x56\xd0\xd7\xdf\xa7\x3b\x94\xcf\x8a\xa2\xc8\
-\xb8\xc9\x88\xdd\xb2\x7d\xe6\xb9\x8b\x7c\x47\x92\x32\xdf\xf7\x11\
-\x19\x38\x14\x00\x00\xbd\x7d\x3d\x58\xfb\x61\xc5\xc8\xa1\x0a\xea\
-\x0e\x13\x00\x07\x28\x5f\x61\xf9\xbb\x65\x0c\x0e\x99\x39\x59\xc7\
-\xf3\x24\xe2\xc4\xac\xd6\xa7\xdd\x12\xd2\xce\x9d\xe8\x5c\xe7\x2b\
-\x65\x75\x4f\x89\x8f\xc5\x69\x62\xdc\xb2\xdd\x03\xfd\x83\xfd\x58\
-\xf9\xfe\x5b\xf8\x3e\xbf\x03\x2e\x70\xe3\x1b\x53\x63\x9e\xe7\xe1\
-\xe5\xca\x0b\x8c\x8c\x9e\xd1\x1d\xca\x17\xa5\xa9\x1b\xa5\x7f\xc0\
-\xfe\xee\x73\xae\xea\x2c\xcb\x74\xa3\x32\x23\x20\xd0\x30\x78\xb8\
-\x6c\xf8\xcc\x10\x96\x5f\x2d\xc3\x33\x34\x49\xa1\xe3\x63\x02\x60\
-\xb1\x4e\xd7\xae\xa7\x38\x77\xf1\x9c\xee\x50\xbe\x28\x8a\x63\x28\
-\x47\x4a\xff\x80\xdd\xfd\xe7\x5d\xe7\x87\xee\x5c\x67\x4a\x29\x63\
-\x87\x02\x00\x60\xec\xdc\x28\x5e\xac\x3c\x37\xae\x7f\x01\x9d\x0c\
-\x3f\x3d\x4b\x09\x21\xb0\xf4\x7c\x09\x97\x26\xc6\x75\x87\xf2\x45\
-\x9e\xf2\x10\x1b\xb8\x14\xb1\x5b\x42\x08\x28\xbe\xf5\x18\xcb\x57\
-\xbe\x13\xab\x01\x0e\x44\x71\x02\xcf\x33\xb7\xd4\x7e\xf1\xd2\x05\
-\x3c\xf9\x66\xc9\xd8\x4a\x05\x1d\x8d\x09\x80\x85\x84\x10\x78\xf4\
-\x64\x01\xd7\x27\xaf\xea\x0e\xe5\x50\x0d\x87\x4a\xff\x00\x10\x3a\
-\xd0\x75\xce\x75\x81\x03\x3d\x01\x0e\x08\x01\x34\x0c\x6c\x10\xf4\
-\xb1\x89\x6b\x13\x58\x7a\xce\x24\xc0\x56\x4c\x00\x2c\x34\xff\xf0\
-\x1e\xa6\xa6\x27\x75\x87\x71\xa8\x38\x49\xe0\x39\x36\x59\x2e\x30\
-\x7c\xeb\x5f\xea\xac\x86\x71\x49\xa7\x8a\x66\xf6\x04\xda\xeb\x93\
-\x57\xf1\xe0\xf1\x03\xdd\x61\x50\x17\x98\x00\x58\x66\x6e\x7e\x0e\
-\xb7\xbf\x9a\xd5\x1d\xc6\xa1\x94\xa7\x9c\x2a\xfd\x03\x9d\x26\x46\
-\x9c\xfd\x6f\x3e\xa5\x94\x73\xe3\xd2\x71\x12\x43\x29\xb3\x87\x9e\
-\x6e\xdd\xbe\x89\xb9\xf9\x3b\xba\xc3\xa0\x13\x72\xeb\x9b\xe2\xb8\
-\xe9\x99\x29\xdc\xbb\xff\x95\xee\x30\x0e\x25\x04\x90\x36\xcd\x2e\
-\x5b\x76\x83\xcd\x7f\xec\xe1\xe2\x67\x95\x36\x9a\xc6\x97\xd9\xef\
-\xdd\xbf\x8b\x99\xb9\x19\xdd\x61\xd0\x09\x30\x01\xb0\xc4\xb5\x1b\
-\x57\xf1\x70\xe9\xa1\xee\x30\x8e\x14\x27\x89\x93\xcb\x83\x5c\x59\
-\x62\x56\x07\x2e\x7e\x56\x9d\x5e\x1a\xe6\x57\xd5\xee\x2f\xcc\xe3\
-\xc6\xd4\x75\xdd\x61\xd0\x31\x31\x01\xb0\xc0\xf8\x95\x71\x2b\x26\
-\xda\xf8\x4a\x19\xb9\xfb\x60\x5e\x2c\xff\xdb\x45\x29\x05\x4f\xba\
-\x97\x84\x46\x51\x0c\xdf\xf0\xeb\x50\x08\x81\xc5\x67\x8f\x71\xf9\
-\xea\x65\xdd\xa1\xd0\x31\x30\x01\x30\xdc\xd9\xf3\x63\x78\xb1\xfc\
-\x14\xd2\x82\xe5\x4d\x49\xd3\xad\x59\xff\x07\x5c\x2c\x29\xbb\xce\
-\x0f\xcc\x7e\x50\x76\x2b\x6d\x98\xbf\x95\x76\xa7\x3f\xc9\x13\x5c\
-\x18\x3f\xaf\x3b\x14\x3a\x02\x13\x00\x83\x0d\x8f\x0c\xe3\xe5\xda\
-\x37\xc6\xb6\x05\xfd\x58\x9a\xa6\x4e\xbe\x75\x01\x9d\xe5\x7f\xae\
-\x90\x52\x22\x8e\x63\x34\x7b\x9a\xe8\xed\xeb\x45\x6f\x5f\x2f\x9a\
-\x3d\x4d\x44\x71\xe4\xd4\xe4\xb9\x20\x70\xaf\x12\x05\x00\xd2\x93\
-\x88\x2d\xd8\x51\x53\x4a\x89\x17\x2b\xcf\x31\x3a\x36\xa2\x3b\x14\
-\x3a\x84\x3b\xdf\x78\xc7\x0c\x0c\x0e\x60\xe5\xfb\x65\x2b\x36\xd0\
-\xf1\x7d\xe5\xec\x06\x21\x52\x4a\x78\x86\xcf\xc0\x3e\xae\x24\x4d\
-\xd0\x7b\xaa\x17\x49\x23\x41\x10\x04\xf0\x94\x07\x4f\x79\x08\x82\
-\x00\x69\x23\xed\xfc\x37\x47\x76\x7b\x53\xca\x83\x34\x70\x6b\xdd\
-\x22\x44\x51\x68\xc5\x76\xd4\x4a\x29\x2c\x7f\xf7\x12\x43\xc3\xa7\
-\x75\x87\x42\x5f\xe0\xe6\x37\xc4\x72\xfd\x03\xa7\xf0\xea\xc7\x55\
-\x2b\xc6\xd3\x85\x10\x48\x1b\xee\xee\x13\xee\xc2\xba\x72\x21\x04\
-\x5a\x3d\x2d\xc4\x49\x7c\x68\xf9\x58\x08\x81\x38\x89\xd1\xea\x69\
-\x19\x5f\x66\x3e\x0e\x97\x2a\x37\x9f\x4a\xd3\xd4\x8a\xcd\x8f\x82\
-\x20\xc0\xea\xeb\x15\x0c\x0c\x9a\xb9\x51\x59\xdd\x99\x7f\x05\xd5\
-\x4c\xab\xb7\x07\xab\x3f\xac\x22\xb2\x64\x1d\x7d\x9a\x26\x4e\x95\
-\x8e\x3f\xe5\xc2\x36\xb3\x69\x23\x3d\xd1\x1b\xa3\x1f\xf8\x48\x0d\
-\xef\x40\x77\x1c\x36\xbc\x25\x77\x4b\x4a\x89\x24\x35\xbb\x41\xd0\
-\x81\x30\x0c\xb1\xf6\x7a\x05\x7d\x7d\xbd\xba\x43\xa1\x4f\xb8\x7b\
-\xe7\xb6\x50\xda\x48\xf1\xea\xc7\x15\xa4\x0d\x3b\xca\xb0\x41\x10\
-\x38\xbd\x39\x8e\xe7\x79\xd6\xf7\xfe\xf7\x7d\xbf\xab\xe1\x99\x30\
-\x0a\xad\x18\x7e\x3a\x8c\xf2\x94\x93\x4b\x52\x0f\x04\x61\x68\xcd\
-\x04\xd5\x38\x89\xb1\xf6\xe3\x2a\x9a\x2d\x77\xab\x85\x36\x62\x02\
-\x60\x88\x28\x8e\xf1\xea\xf5\x2a\x5a\xad\x96\xee\x50\x8e\x45\x48\
-\x81\xc4\x92\x44\xa5\x5b\xb6\xdc\x5c\x0f\x13\x27\xdd\xbf\x25\x46\
-\x16\xac\x3b\x3f\x8a\x0b\x9f\xe1\x61\x92\x34\xb5\xa6\x02\xd7\x68\
-\x36\xb0\xf6\x7a\xcd\x99\x79\x26\x2e\xb0\xe3\xca\x71\x5c\x18\x06\
-\x58\x7b\xfd\x2d\xfa\xfa\xfb\x74\x87\x72\x6c\xb6\x8c\x41\xe6\x61\
-\x7b\x43\x19\x21\x04\x94\xdf\xfd\x72\x38\xdf\xf7\xad\x9f\x0b\x60\
-\xfb\x67\x78\x14\x29\x05\x52\x8b\x1e\xa8\xbd\x7d\x3d\x58\xfb\x61\
-\xc5\xd9\x49\xc3\xb6\x71\xfb\x0e\x6e\x01\xe5\x2b\x2c\x7f\xb7\x8c\
-\xc1\xd3\x83\xba\x43\x39\xb6\x20\x08\x9c\x7f\xb3\x52\x9e\x67\x7d\
-\xf9\x58\x7a\x32\xd7\x03\x5c\x08\x61\xcd\xdb\xe5\x97\x78\x0e\x7c\
-\x8e\x47\xf1\x2d\xfb\x3e\xf6\x0f\xf6\x63\xe5\xfb\x6f\xe1\xe7\x48\
-\x4e\xa9\x18\x76\x7f\xbb\x2d\xe7\x79\x1e\x5e\xae\xbc\xc0\xc8\xe8\
-\x19\xdd\xa1\x1c\x9b\x90\xc2\x89\x09\x62\x47\x71\x61\xf2\x5f\x11\
-\x15\x1a\xdb\x13\x00\xc0\xfd\x2a\x00\xf0\x6b\x45\xce\xa2\xcf\x6a\
-\xf8\xcc\x10\x96\x5f\x2d\x3b\x9f\x9c\x99\xce\x9e\x2b\xc6\x31\x9d\
-\x6e\x59\x4f\x71\xee\xe2\x39\xdd\xa1\x9c\x48\x23\x35\xbf\x13\x59\
-\x11\x5c\x5e\x42\x56\x37\x36\x2c\xa7\xcd\xcb\xc6\xc4\x7c\xec\xdc\
-\x28\x5e\xac\x3c\xb7\x2a\x71\x71\x0d\xff\xf2\x1a\x08\x21\xb0\xf4\
-\x7c\x09\x97\x26\xc6\x75\x87\x72\x22\xa1\x25\x0d\x48\xf2\xf2\x1c\
-\x6e\x22\x53\x47\x52\xca\x5a\xbc\x69\x76\xbb\xe2\x43\xa7\x8b\x97\
-\x2e\xe0\xc9\x37\xe6\xef\x73\xe2\x2a\xde\xe5\x2a\x26\x84\xc0\xa3\
-\x27\x0b\xb8\x3e\x79\x55\x77\x28\x27\x22\xa5\x87\xc4\x82\x16\xa4\
-\x45\xe0\xdb\xbf\x7b\x5c\x68\xe8\x74\x1c\x49\x92\xc0\xb3\x2c\x79\
-\x9d\xb8\x36\x61\xc5\x66\x67\x2e\xb2\xeb\x4a\x71\xc0\xfc\xc3\x7b\
-\x98\x9a\x9e\xd4\x1d\xc6\x89\xa5\x8d\xa4\x36\x5f\xd0\x3a\x54\x39\
-\xea\x26\xf0\xeb\x91\x00\x08\x21\x90\xa6\x76\x0d\x05\x00\xc0\xf5\
-\xc9\xab\x78\xf0\xf8\x81\xee\x30\x6a\x87\x09\x40\x85\xe6\xe6\xe7\
-\x70\xfb\xab\x59\xdd\x61\x9c\x58\xe4\x40\x53\x98\xe3\x52\x9e\x9b\
-\x5b\xc9\xd6\x9d\xf4\xea\xb3\xa5\xb3\xf2\x7d\x44\x91\x7d\x3d\x1c\
-\x6e\xdd\xbe\x89\xb9\xf9\x3b\xba\xc3\xa8\x15\x26\x00\x15\xb9\x39\
-\x33\x85\x7b\xf7\xbf\xd2\x1d\xc6\x89\x79\x96\xec\x3e\x56\x94\x20\
-\xac\x47\xa2\x53\x47\x75\xaa\xec\xc4\x69\x6c\xc5\x2e\xa2\x9f\xba\
-\x77\xff\x2e\x66\xe6\x66\x74\x87\x51\x1b\x4c\x00\x2a\x70\xed\xc6\
-\x55\x2c\x2c\x3d\xd4\x1d\x46\x57\xd2\x34\xad\x4d\xe9\x1f\xa8\x4f\
-\xa9\xb8\x8e\xea\x34\xb7\x43\x40\xa0\xd1\xb0\xf3\xbb\x7b\x7f\x61\
-\x1e\x37\xa6\xae\xeb\x0e\xa3\x16\x98\x00\x94\x6c\xfc\xca\xb8\xb5\
-\x13\x5c\xa2\x38\x86\xaa\x49\xe9\x1f\xe8\x6c\x5f\xca\xd9\xff\xee\
-\x92\x52\xc2\xaf\xc9\x30\x00\xd0\xb9\x9e\x23\xcb\x56\x05\x00\x9d\
-\x79\x0c\x8b\xcf\x1e\xe3\xf2\xd5\xcb\xba\x43\x71\x1e\xef\x76\x25\
-\x3a\x7b\x7e\x0c\x2f\x96\x9f\x42\x4a\xfb\x1e\xfe\x9e\xf2\x10\x5b\
-\xb2\x23\x61\x51\x82\x9a\xcc\x14\xaf\x33\x17\x1a\x3c\x9d\x44\x14\
-\x27\xf0\x3c\xfb\x92\x9e\x4e\x9f\x94\x27\xb8\x30\x7e\x5e\x77\x28\
-\x4e\x63\x02\x50\x92\xe1\x91\x61\xbc\x5c\xfb\xc6\xca\x71\x38\x00\
-\x68\xd4\xac\xf4\x0f\x00\x41\x8d\xaa\x1d\x75\x55\xa7\x61\x00\x00\
-\x10\x02\x68\x58\xd6\x20\xe8\x80\x94\x12\x2f\x56\x9e\x63\x74\x6c\
-\x44\x77\x28\xce\x62\x02\x50\x82\x81\xc1\x01\xac\x7c\xbf\x6c\xed\
-\xcc\xf9\x38\x49\xe0\xd5\xa8\x54\x0a\x00\xbe\xaf\xd8\x91\xac\x06\
-\x84\xcc\xb7\x41\x92\x8d\x3a\xd5\xbc\xee\x77\x85\xd4\x49\x29\x85\
-\xe5\xef\x5e\x62\x68\xf8\xb4\xee\x50\x9c\xc4\x3b\x5e\xc1\xfa\x07\
-\x4e\xe1\xd5\x8f\xab\xd6\xb6\x1f\x55\x9e\xaa\x5d\xe9\x1f\x00\x02\
-\xdf\xce\xcf\x8b\x4e\x2e\xac\xe1\x44\xcf\x38\x89\xa1\x94\x9d\xd5\
-\xc8\x20\x08\xb0\xfa\x7a\x05\x03\x83\x03\xba\x43\x71\x0e\x13\x80\
-\x02\xb5\x7a\x7b\xb0\xfa\xc3\x2a\x22\x4b\x1f\xa0\x42\x00\x69\xd3\
-\xce\x72\x61\x1e\x42\x08\x2e\xff\xab\x11\x3f\xb4\x7f\x9b\xe3\x6e\
-\xa4\x8d\xa6\xb5\xbf\x77\x18\x86\x58\x7b\xbd\x82\xbe\xbe\x5e\xdd\
-\xa1\x38\x85\x09\x40\x41\xd2\x46\x8a\x57\x3f\xae\x20\x6d\xd8\xbb\
-\x66\x3e\x4e\x92\x5a\xf4\x4c\xff\x94\x52\xca\xda\x1b\x23\x9d\x9c\
-\x14\xf5\x69\x0a\xf4\xb1\x4e\x4f\x0f\x3b\x5f\x4e\x80\x4e\x15\x63\
-\xed\xc7\x55\x34\x5b\x0d\xdd\xa1\x38\x83\x09\x40\x01\xa2\x38\xc6\
-\xab\xd7\xab\x68\xb5\x5a\xba\x43\xe9\x9a\xaf\x94\xb5\xc3\x16\x79\
-\xd5\x61\xbb\x58\xfa\xbd\xba\x7e\xe6\x51\x14\x5b\xbd\x14\xb2\xd1\
-\x6c\x60\xed\xf5\x1a\x92\xd4\xde\x17\x2d\x93\x30\x01\xc8\x29\x0c\
-\x03\xac\xbd\xfe\x16\x7d\xfd\x7d\xba\x43\xc9\x25\x69\xd6\x6f\xd6\
-\x3f\xd0\x29\xff\xdb\x3a\x59\x93\xba\x17\x04\x41\x2d\xaf\x77\x00\
-\x48\x1b\x76\x6f\xe9\xdd\xdb\xd7\x83\xb5\x1f\x56\xac\xdb\xf9\xd0\
-\x44\x4c\x00\x72\x50\xbe\xc2\xf2\x77\xcb\x18\x3c\x3d\xa8\x3b\x94\
-\x5c\x92\x34\xad\x6d\xff\x7b\xe5\xf0\xec\xff\x2c\xcb\x8c\x38\x86\
-\x89\x84\x10\xb5\x1c\x06\x00\x3a\xfb\x22\xd8\xde\xde\xbb\x7f\xb0\
-\x1f\x2b\xdf\x7f\x0b\xbf\x66\x2b\x3a\x8a\xe6\xe6\x9d\xaf\x02\x9e\
-\xe7\xe1\xe5\xca\x0b\x8c\x8c\x9e\xd1\x1d\x4a\x2e\xbe\x6f\x67\xb7\
-\xb0\xa2\xb8\xbc\x2e\xbc\xdd\x6e\xe7\x3e\xc6\x7e\x7b\xbf\x80\x48\
-\xcc\x54\x97\x2d\x82\x3f\x27\x8a\x42\xeb\xf7\x46\x18\x3e\x33\x84\
-\xe5\x57\xcb\xb5\x9c\xb7\x54\x14\x26\x00\x5d\xe8\x74\xa9\x7a\x8a\
-\x73\x17\xcf\xe9\x0e\x25\x17\x21\x04\xd2\x46\xbd\x27\xd4\xb8\x5c\
-\xfe\x6f\xb7\xdb\xd8\xdb\xdb\xeb\xfa\xe7\xf7\xf6\xf6\x90\xb5\xdd\
-\xac\x00\x00\x6e\x7f\xf6\xc7\x91\xa6\x29\xa4\xb0\xfb\x11\x30\x76\
-\x6e\x14\x2f\x56\x9e\x5b\xd9\x6d\xd5\x04\x76\x7f\xfa\x1a\x08\x21\
-\xb0\xf4\x6c\x11\x97\x26\xc6\x75\x87\x92\x5b\x9a\x26\xce\x96\xbf\
-\x8f\x23\xf0\xdd\x5f\x0e\xb6\xbd\xb9\xdd\xf5\xcf\x6e\x6d\x6e\x15\
-\x18\x89\x79\x84\x10\xb5\xee\xfe\x28\xa5\x44\x92\xda\xd9\x20\xe8\
-\x63\x17\x2f\x5d\xc0\x93\x6f\xfe\xe4\xfc\x77\xb9\x0c\xf5\xbd\xfb\
-\x77\x41\x08\x81\x47\x4f\x16\x70\x7d\xea\x9a\xee\x50\x72\x0b\x82\
-\x00\x41\x4d\x67\xfd\x1f\xf0\x6b\x50\x02\xde\xda\xda\xea\xaa\x0a\
-\xb0\xb7\xb7\x87\xed\xad\xee\x93\x07\x5b\xd4\xfd\x3b\x10\x84\x21\
-\x02\x07\x86\xc1\x26\xae\x4d\x58\xbb\xe9\x9a\x4e\x4c\x00\x4e\x60\
-\xfe\xe1\x3d\x4c\x4d\x4f\xea\x0e\x23\x37\x21\x05\x12\x8b\xfb\x15\
-\x14\x42\xd4\xa7\xf7\xff\xfb\x5f\xde\x9f\x68\x3e\x40\xbb\xdd\xc6\
-\xfb\x77\xef\x4b\x8c\xc8\x1c\x75\xa8\x02\x1d\x25\x49\x53\x27\x2a\
-\x81\xd7\x27\xaf\xe2\xc1\xe3\x07\xba\xc3\xb0\x8a\xfd\x9f\x7a\x45\
-\xe6\xe6\xe7\x70\xfb\xab\x59\xdd\x61\x14\xc2\x85\xb1\xbf\xbc\x02\
-\xbf\x3e\xcb\xc0\xda\xfb\x6d\xbc\x7b\xf3\xee\x58\x95\x80\xbd\xdd\
-\x3d\xbc\x7b\xf3\xae\x90\x09\x84\x56\x10\x9c\x0b\x20\xa5\x40\xea\
-\xc8\xba\xfa\x5b\xb7\x6f\x62\x6e\xfe\x8e\xee\x30\xac\x51\xef\xa7\
-\xc0\x31\xdd\x9c\x99\xc2\xbd\xfb\x5f\xe9\x0e\xa3\x10\x41\x10\x38\
-\x51\xf2\xcb\xab\x6e\x8d\x60\xda\xed\x4e\x12\xf0\xe1\x97\x0f\xd8\
-\xdd\xd9\xfd\xc3\x7f\xdf\xdd\xd9\xc5\x87\x5f\x3e\xe0\xdd\xdb\x1a\
-\x3d\xfc\x7f\x55\xb7\x6b\xe1\x73\x7c\x87\xee\x0b\xf7\xee\xdf\xc5\
-\xcc\xdc\x8c\xee\x30\xac\xc0\x45\x94\x47\xb8\x76\xe3\x2a\x16\x96\
-\x1e\xea\x0e\xa3\x10\x42\x0a\xa4\x96\x6e\x0d\x5a\x24\x21\x84\x33\
-\x37\xbb\x93\xda\xde\xde\xc6\xf6\x76\x67\x6c\xff\xa0\xec\x5b\xb7\
-\x07\xfe\xa7\x3a\x4d\x81\x36\x9c\xed\x79\x70\x5c\x69\x9a\x62\x6f\
-\x6f\xcf\x89\xeb\xe1\xfe\xc2\x3c\x76\xb6\xb6\xf1\x3f\xfe\xfb\xff\
-\xd4\x1d\x8a\xd1\x58\x01\x38\xc4\xf8\x95\x71\xa7\x26\x96\x34\x52\
-\xbb\x3b\x80\x15\xc5\xf6\xf5\xcf\x45\x69\xb7\xdb\x4e\xdc\xec\x8b\
-\xc0\x6b\xc2\xad\x17\x04\x21\x04\x16\x9f\x3d\xc6\xe5\xab\x97\x75\
-\x87\x62\x34\x26\x00\x5f\x70\xf6\xfc\x18\x5e\x2c\x3f\x75\x66\x7d\
-\x69\xe8\x40\xe3\x8f\xa2\xd4\x71\x3b\x58\x3a\x1c\xaf\x89\x0e\xdf\
-\xf7\x9d\x69\xb1\xdb\xe9\xd7\xf2\x04\x17\xc6\xcf\xeb\x0e\xc5\x58\
-\x4c\x00\x3e\x63\x78\x64\x18\x2f\xd7\xbe\x81\x74\xa4\xc3\x94\x94\
-\x1e\x12\xcb\x5b\x7f\x16\x45\x08\xc1\x44\x88\xfe\xc0\xe5\x96\xd0\
-\x27\x95\x24\x09\x3c\xcf\x8d\xbf\x85\x94\x12\x2f\x56\x9e\x63\x64\
-\x6c\x44\x77\x28\x46\x72\xe3\x53\x2e\xd0\xc0\xe0\x00\x56\xbe\x5f\
-\x76\x6a\x66\x70\xda\x48\x58\xfa\xff\x55\x5d\xc7\xfe\xe9\x70\xdc\
-\x14\xea\xaf\x84\x10\x48\x53\x37\x86\x02\x80\xce\x76\xdf\xdf\x7e\
-\xf7\x12\x43\xc3\xa7\x75\x87\x62\x1c\x26\x00\x1f\xe9\x1f\x38\x85\
-\x57\x3f\xae\x3a\xb5\x2d\x6e\x14\x85\xbc\xb1\x7d\x84\x33\xbe\xe9\
-\x4b\x78\x6d\xfc\x95\xf2\x7d\x44\x51\xa4\x3b\x8c\xc2\x04\x41\x80\
-\xd5\xd7\x2b\x18\x18\x1c\xd0\x1d\x8a\x51\x98\x00\xfc\xaa\xd5\xdb\
-\x83\xd5\x1f\x56\x11\xc5\xee\x5c\xf4\x9e\x03\xbb\x7e\x15\x49\x0a\
-\x59\xdb\x1d\xe0\xe8\x68\x4a\x29\x56\xca\x3e\x12\xa7\xb1\x33\xc3\
-\xa0\x00\x10\x86\x21\xd6\x5e\xaf\xa0\xaf\xaf\x57\x77\x28\xc6\x60\
-\x02\x00\xa0\xd1\x4c\xf1\xdd\xeb\x55\xa4\x0e\x75\xc7\x3b\xd8\xe8\
-\x87\x37\xb4\xbf\xf2\x43\xde\xe0\xe9\xcb\x3a\xcb\x43\x59\x05\x38\
-\x20\x20\xd0\x68\xa4\x4e\x7d\x67\xe2\x24\xc6\xea\x0f\x2b\x68\x34\
-\xdd\x19\xe2\xc8\xa3\xf6\x09\x40\x14\xc7\x58\x7d\xbd\x8a\x66\x4f\
-\x53\x77\x28\x85\x0a\xa3\x88\x6f\xbb\x9f\x08\x7c\x77\x86\x76\xa8\
-\x1c\x75\xdf\x1b\xe0\x53\x4a\xb9\xb7\x5d\x78\xb3\xa7\x89\x57\x3f\
-\xbe\x42\xe2\x48\xf7\xc3\x3c\x6a\x9d\x00\x84\x61\x80\xb5\xd7\xdf\
-\xe2\xd4\xa9\x3e\xdd\xa1\x14\xca\x53\x1e\x62\x87\x86\x32\x8a\x20\
-\x84\x80\x52\xee\x94\x33\xa9\x1c\xbe\x52\x10\x8e\x2c\xfd\x2d\x4a\
-\x14\x27\xf0\x3c\xb7\x5e\x26\x7a\xfb\x7a\xb0\xf6\xc3\x8a\x33\x4b\
-\x1e\xbb\x55\xdb\x04\x40\xf9\x0a\xcb\xdf\x2d\x63\xf0\xf4\xa0\xee\
-\x50\x0a\xd7\x48\xdd\x2a\xdb\x15\x21\x0c\xea\xd3\xfb\x9f\xf2\x09\
-\xd8\x13\xe0\x77\x84\x00\x1a\x8e\x34\x08\xfa\x58\xff\x60\x3f\x56\
-\xbe\xff\x16\xbe\xef\x56\x72\x73\x12\xb5\x4c\x00\x3c\xcf\xc3\xcb\
-\x95\x17\x18\x19\x3d\xa3\x3b\x94\xc2\xc5\x49\x02\x8f\xa5\xff\x3f\
-\x08\x6a\xb0\xf5\x2f\x15\x23\xe4\xb5\xf2\x07\x9d\xaa\x62\xac\x3b\
-\x8c\xc2\x0d\x9f\x19\xc2\xf2\xab\x65\x78\x0e\x4d\x76\x3c\x89\xda\
-\x25\x00\x9d\xee\x50\x4f\x71\xee\xe2\x39\xdd\xa1\x14\x4e\x79\x8a\
-\xa5\xff\xcf\x90\x92\xb3\xff\xe9\xf8\x94\x62\x53\xa0\xcf\x89\x93\
-\xd8\xc9\x61\xb4\xb1\x73\xa3\x78\xb1\xf2\xdc\x99\xae\xaf\x27\x51\
-\xab\xab\x5c\x08\x81\xa5\x67\x8b\xb8\x34\x31\xae\x3b\x94\xc2\x09\
-\x01\xa4\x9c\xd9\xfa\x59\x6c\xfe\x43\x27\xc5\x6b\xe6\xf3\xd2\x46\
-\xd3\xc9\xa1\xb4\x8b\x97\x2e\xe0\xc9\x37\x7f\x72\xf2\x77\x3b\x4c\
-\x6d\x12\x00\x21\x04\x1e\x3d\x59\xc0\xf5\xa9\x6b\xba\x43\x29\x45\
-\x9c\x24\xb5\x2d\x63\x1d\x85\x4b\xbb\xe8\xa4\x78\xcd\x7c\x5e\xa7\
-\xb7\x88\x9b\x55\xc6\x89\x6b\x13\x4e\x6d\xfe\x76\x1c\xb5\x49\x00\
-\xe6\x1f\xde\xc3\xd4\xf4\xa4\xee\x30\x4a\xe1\x2b\xe5\x54\xf7\xc2\
-\x22\xb1\xfc\x4f\xdd\x50\x4a\xc1\x93\x4c\xa8\x3f\x27\x8a\x62\xf8\
-\x8e\x7e\xa7\xae\x4f\x5e\xc5\x83\xc7\x0f\x74\x87\x51\x19\x09\xc0\
-\xf9\x4d\xb0\xe7\xe6\xef\xe0\xf6\x57\xb3\xba\xc3\x28\x4d\xd2\xe4\
-\xac\xff\x2f\x61\x29\x97\xba\xe5\x07\x6e\x3e\xe4\x8a\xe0\x72\x93\
-\xb1\x5b\xb7\x6f\xe2\xce\xbd\x3b\xba\xc3\xa8\x42\x26\x33\xe0\x27\
-\xdd\x51\x94\xe9\xe6\xcc\x14\xee\xdd\xbf\xab\x3b\x8c\xd2\x24\x69\
-\xca\x37\x95\x43\x84\x4c\x00\xa8\x4b\x41\xc0\xaa\xda\x97\x48\xc7\
-\xdb\x8c\xcf\x3f\xb8\x8b\x99\xb9\x19\xdd\x61\x94\x4a\x00\xff\x28\
-\x05\xf0\xbf\x74\x07\x52\x96\x6b\x37\xae\x62\x61\xe9\xa1\xee\x30\
-\x4a\xd3\xd9\xb0\x83\x37\xa9\x2f\x91\x52\xc2\x73\x70\xd6\x32\x55\
-\x43\x29\x0f\xd2\x91\x6d\x71\xcb\x10\x45\x21\x02\x87\x37\x1a\xbb\
-\xbf\x30\x8f\x1b\x53\xd7\x75\x87\x51\x9a\x36\xf0\xbf\x25\x90\xfd\
-\x59\x77\x20\x65\x18\xbf\x32\xee\xf4\x84\x0e\x21\x84\x93\xcd\x39\
-\x8a\xc4\xf5\xdc\x94\x17\x2b\x48\x87\x4b\x1a\x29\xa4\x70\x33\x49\
-\x12\x42\x60\xf1\xd9\x63\x5c\xbe\x7a\x59\x77\x28\xa5\x10\xc0\x9f\
-\x65\xb0\x17\xfc\x7b\x00\xef\x74\x07\x53\xa4\xb3\xe7\xc7\xf0\x62\
-\xf9\xa9\xd3\xeb\x3a\xd3\x34\xe1\x5a\xe5\x23\xf8\xbc\x79\x53\x4e\
-\x3e\x57\x03\x1c\x4a\x4a\x89\x24\x75\xaf\x41\xd0\x81\x4e\xdf\x98\
-\x27\xb8\x30\x7e\x5e\x77\x28\x05\x13\x6f\x83\x1d\xf9\x1f\xa4\x18\
-\x99\xfb\x8b\xc8\xf0\xaf\x74\x87\x53\x94\xe1\x91\x61\xbc\x5c\xfb\
-\xc6\xa9\x6d\x2c\x3f\x15\x04\x01\x37\x2d\x39\x82\xe7\x79\x50\x0e\
-\x5f\x03\x54\x0d\xe5\x29\x2e\xaf\x3d\x42\x10\x86\x4e\x4f\xb6\x95\
-\x52\xe2\xc5\xca\x73\x8c\x8c\x8d\xe8\x0e\xa5\x30\x42\xe0\x5f\x8a\
-\xb1\x7b\x3f\x49\x00\x08\x86\xbe\xfe\xb7\x22\xc3\xbf\xd1\x1d\x54\
-\x5e\x03\x83\x03\x58\xf9\x7e\x19\xbe\xc3\xe3\x52\x42\x0a\x24\x0e\
-\x6d\x5b\x5c\x16\x97\x6f\x48\x54\x2d\x5e\x4b\x47\x4b\xd2\xd4\xe9\
-\x8a\xa4\x52\x0a\xdf\x7e\xf7\x12\x43\xc3\xa7\x75\x87\x92\x9f\xc8\
-\xfe\x75\x30\x38\xff\xef\x80\x8f\xfa\x00\x04\x43\x5f\xff\x73\x21\
-\xf0\xcf\x90\xe1\x67\x7d\x91\x75\xaf\x7f\xe0\x14\x5e\xfd\xb8\xea\
-\xfc\x7a\xf8\x34\x75\x77\xcc\xad\x48\x6c\xe4\x42\x45\xe1\xb5\x74\
-\x34\x29\x05\x52\xc7\xb7\xd7\x0d\x82\x00\xab\xaf\x57\x30\x30\x38\
-\xa0\x3b\x94\x6e\xfd\x24\x20\xfe\x69\x38\x78\xff\x5f\x1c\xfc\x0f\
-\x7f\x18\x24\xcf\xde\xfc\x4d\xef\xf6\x6e\xf4\x4f\x04\xb2\x15\x40\
-\x8c\x03\xe8\x3f\xec\x88\xfb\xdb\x1b\x61\xb6\xbd\x19\x22\x13\xed\
-\x0c\xed\x4c\x40\xb4\x21\xd0\x46\x96\xb5\xb3\x0c\x19\x04\xda\x00\
-\xda\xc5\xff\x2e\x7f\xf5\x9f\xfe\xf3\xff\x0b\xfc\xbe\x2b\x49\x9a\
-\xa6\x19\x80\x4c\x08\xd1\x06\xd0\x16\x52\xec\x0b\x21\xf7\x00\xec\
-\x97\x79\xfe\xaa\x04\x81\x2f\xd3\x66\xa3\x91\x65\x59\xfb\xe0\x77\
-\xfc\xf8\xff\x04\x44\xa9\x7f\x67\x5b\x78\xca\x43\xab\xd9\x6c\x22\
-\xc3\x1e\x04\xf6\x84\x10\x7b\xa8\x41\xbf\x0b\x2a\x94\xc8\xb2\x4c\
-\x65\x59\xa6\x84\x10\xea\x97\xf7\xef\xdf\xef\xef\x39\x71\x1b\xc9\
-\x2d\x43\x26\x01\xc8\x2c\xcb\xa4\x10\x42\x22\x83\xcc\xd0\xf9\xff\
-\xd7\xdf\xaf\xbf\xdf\xd9\xd9\x71\xe5\xbb\xe6\x65\x59\xa6\xb2\x76\
-\xdb\xc3\xaf\xbf\x2f\x00\xb1\xbe\xbe\x2e\x76\x7f\xfe\x3f\x9b\x8f\
-\xef\x9d\xdd\x2e\xf9\xfc\x12\x19\xa4\x10\x10\xf8\xf8\xef\x0c\x29\
-\x20\x32\x29\xc2\x78\xdb\x0b\x93\xa3\x62\xf8\x09\x10\xff\x37\x43\
-\xfb\xcf\xa1\xbf\xfd\x1f\x45\xdf\xd2\xdb\x92\x63\x26\x22\x22\x22\
-\x22\x22\x22\x22\x22\x22\x22\x22\x22\x22\x22\x22\x22\x22\x22\x22\
-\x22\x22\x22\x22\x22\x22\x22\x22\x22\x22\x22\x22\x22\x22\x22\x22\
-\x22\x22\x22\x22\x22\x22\x22\x22\x22\x22\x22\x22\x22\x22\x22\x22\
-\x22\x22\x22\x22\x22\x22\x22\x22\x22\x22\x22\x22\x22\x22\x22\x22\
-\x22\x22\x22\x22\x22\x22\x22\x22\x22\x22\x22\x22\x22\x22\x22\x22\
-\x22\x22\x22\x22\x22\x22\x22\x22\x22\x22\x22\x22\x22\x22\x22\x22\
-\x22\x22\x22\x22\x22\x22\x22\x22\x22\x22\x22\x22\x22\x22\x22\x22\
-\x22\x22\x22\x22\x22\x22\x22\x22\x22\x22\x22\x22\x22\x22\x22\x17\
-\xfc\x7f\xd2\x18\x57\xf1\x6c\xd5\x82\x39\x00\x00\x00\x00\x49\x45\
-\x4e\x44\xae\x42\x60\x82\
-\x00\x00\x1f\xa8\
-\x89\
-\x50\x4e\x47\x0d\x0a\x1a\x0a\x00\x00\x00\x0d\x49\x48\x44\x52\x00\
-\x00\x02\x00\x00\x00\x02\x00\x08\x06\x00\x00\x00\xf4\x78\xd4\xfa\
-\x00\x00\x00\x04\x73\x42\x49\x54\x08\x08\x08\x08\x7c\x08\x64\x88\
-\x00\x00\x00\x09\x70\x48\x59\x73\x00\x00\xb3\xfa\x00\x00\xb3\xfa\
-\x01\x66\xba\x30\x98\x00\x00\x00\x19\x74\x45\x58\x74\x53\x6f\x66\
-\x74\x77\x61\x72\x65\x00\x77\x77\x77\x2e\x69\x6e\x6b\x73\x63\x61\
-\x70\x65\x2e\x6f\x72\x67\x9b\xee\x3c\x1a\x00\x00\x1f\x25\x49\x44\
-\x41\x54\x78\x9c\xed\xdd\x7b\x9c\xdd\x75\x7d\xe7\xf1\xcf\xf7\x9c\
-\x49\x66\x50\xb9\x43\x0b\x02\x0a\x93\x11\xb4\xd8\xa2\x82\x6b\xbd\
-\xed\x06\x7b\x05\x32\x11\xec\x92\x2a\x90\x49\xe2\xf6\xe1\xa5\xb6\
-\xba\xdd\xd6\xcb\x6e\xd7\x2e\xda\xfa\x50\xac\xda\x47\x69\xb7\xd5\
-\xb6\x2b\x24\x41\xb4\xa4\x16\xc8\x04\x50\xec\x43\x52\xaf\x55\x4b\
-\xbd\xb4\x68\x81\x4c\x12\x21\xdc\x54\x0c\xb7\x9a\xdb\xcc\xf9\xee\
-\x1f\x0c\x24\x84\x4c\x98\xcc\xcc\x39\xdf\x33\xf3\x7d\x3e\x1f\x0f\
-\x1f\xc0\x5c\x7e\xe7\xcd\xe3\x98\xf9\xbd\xf8\x9d\xcb\xa4\x00\xe6\
-\x94\x67\x7d\xe2\x9c\xc3\xe7\xb7\xd2\x69\x11\x69\x20\xb7\xe2\xa4\
-\x94\xd2\xb3\x73\xe4\x67\x46\xc4\x91\xe3\xff\x7b\x5a\x44\xf4\x8e\
-\xff\x35\x22\xe2\x27\x11\xb1\x63\xfc\xaf\xf7\x47\xc4\xfd\x29\xd2\
-\xdd\x39\xf2\xe6\x94\x62\x73\xe4\xb8\x7d\x67\xb3\xf5\x9d\x3b\x2e\
-\xbc\x6e\x6b\x89\x7f\x1f\xa0\x3d\x52\xe9\x01\xc0\xf4\x0c\x5c\x3e\
-\x78\x6a\x6e\xa6\x33\x23\xe2\x55\x91\xf3\x19\x11\x71\x42\x9b\x6e\
-\xea\xce\x88\xf8\x46\x8a\xfc\xf9\x68\x34\x6f\xda\x70\xd1\xb5\xdf\
-\x6d\xd3\xed\x00\x1d\x20\x00\x60\x96\x39\xf1\xb2\xb3\x8f\x69\x36\
-\x1b\x83\x11\xf1\xaa\x88\x74\x66\x44\xfc\x74\xa1\x29\xf7\x46\x8e\
-\x9b\x52\x23\x3e\x3f\xd6\x4c\xc3\x9b\x2e\x58\x7b\x5f\xa1\x1d\xc0\
-\x14\x08\x00\x98\x05\x4e\xbc\x6c\x61\x5f\x4f\xf3\x19\xbf\x94\x23\
-\x2d\x8d\x88\x73\x23\x62\x5e\xe9\x4d\x7b\x19\x8b\xc8\x37\x45\x8a\
-\xd5\x4f\xcf\x3b\x3f\xfd\x9d\xa1\x1b\xff\xa3\xf4\x20\x60\xff\x04\
-\x00\x74\xb1\x93\x56\x9f\xf3\xca\x66\xab\xb1\x22\xa7\xf8\xb5\x88\
-\x38\xa4\xf4\x9e\x49\x7a\x30\x45\xfe\x74\x6e\x35\x3e\x3e\xb2\x7c\
-\xed\x97\x4b\x8f\x01\xf6\x4d\x00\x40\x17\xea\x5f\xf9\xea\x5f\x4c\
-\xa9\xf5\xde\x88\x78\x69\xe9\x2d\xd3\x93\xbf\x92\x22\x3e\xb0\x61\
-\xe9\xba\x75\x91\x22\x97\x5e\x03\xec\x26\x00\xa0\x5b\x5c\x7c\x71\
-\x63\xa0\xff\x9f\xcf\xc9\x91\xfe\x20\x22\xce\x28\x3d\x67\x86\xfd\
-\x6b\xa4\xfc\xa1\x91\xde\x83\x3e\x11\x4b\xd6\x8c\x95\x1e\x03\x08\
-\x00\xe8\x0a\x03\xab\x17\x2f\xce\xad\xfc\xa1\x48\xf1\x9c\xd2\x5b\
-\xda\xec\xd6\x9c\xd2\xef\x6e\x5c\xba\xf6\xba\xd2\x43\xa0\x76\x02\
-\x00\x0a\x3a\xf9\x13\xe7\xf4\xb7\xc6\x1a\x7f\x9a\x23\x16\x95\xde\
-\xd2\x49\x29\x62\x5d\x33\xe2\xad\xb7\x0e\x0d\x6f\x2a\xbd\x05\x6a\
-\x25\x00\xa0\x80\x53\xaf\x3a\x7f\xfe\xb6\x1d\x3b\xde\x1c\x39\xbf\
-\x2f\x45\x3c\xbd\xf4\x9e\x42\xb6\xa5\x9c\x3e\x38\xda\x7a\xe8\x03\
-\x9b\x57\xac\xdf\x5e\x7a\x0c\xd4\x46\x00\x40\x87\x0d\x5c\x31\xf8\
-\xf3\xb9\x15\xab\x23\x62\xa0\xf4\x96\xae\x90\xe3\xf6\x56\xe4\x8b\
-\x36\x2d\x5b\xf7\xf5\xd2\x53\xa0\x26\xcd\xd2\x03\xa0\x1a\x39\x52\
-\xff\xc0\xe2\xb7\x45\x8e\x2b\x23\xe2\xe8\xd2\x73\xba\x46\x8a\x23\
-\x53\x4a\x2b\x8e\x3c\xf7\xb9\xcd\x1f\xbf\xe0\x75\x5f\x88\xf5\xeb\
-\xbd\x5a\x00\x3a\xc0\x15\x00\xe8\x80\x81\x8f\x9f\x75\x74\xee\xe9\
-\xb9\x3c\x22\xce\x2e\xbd\xa5\xbb\xe5\x7f\x18\x1b\x6b\x2d\xdd\xbc\
-\xe2\xfa\x7b\x4b\x2f\x81\xb9\x4e\x00\x40\x9b\x0d\xac\x5e\xb4\x30\
-\xe7\x74\x65\x44\x1c\x5b\x7a\xcb\x2c\x71\x57\xa3\x95\x2e\xb8\x7d\
-\xf9\xda\x2f\x94\x1e\x02\x73\x59\xa3\xf4\x00\x98\xcb\x06\x56\x2e\
-\xbe\x28\xe7\x74\x63\x38\xf9\x1f\x88\xe3\x5a\x8d\xfc\xb9\xfe\xd5\
-\x8b\x2e\x2c\x3d\x04\xe6\x32\xcf\x01\x80\x36\xe9\x5f\xbd\xf8\x6d\
-\x11\xf9\xa3\x11\xd1\x53\x7a\xcb\x2c\xd4\x4c\x91\xce\x3b\xf2\xdc\
-\xe7\xa6\x1f\x5f\x73\xeb\xfa\xd2\x63\x60\x2e\x12\x00\x30\xd3\x72\
-\xa4\x05\x03\x8b\x3f\x98\x72\xfe\xc3\xf0\x30\xdb\x74\xa4\x48\xb1\
-\xf0\x88\xf3\x4e\x39\x62\xeb\x69\x17\xdc\xe8\xc9\x81\x30\xb3\xfc\
-\x70\x82\x19\x74\xfa\xc7\xde\x30\xef\x81\x83\xee\x59\x1d\x11\xbf\
-\x5e\x7a\xcb\xdc\x92\x3f\x75\xc2\x09\x8f\x2c\x5d\x7f\xe6\xfa\xd1\
-\xd2\x4b\x60\xae\xf0\x1c\x00\x98\x29\x39\xd2\x83\x7d\xf7\x7c\x2c\
-\x9c\xfc\xdb\x20\xbd\x76\xcb\x9d\x87\x5c\x1e\x17\x5f\xec\x67\x16\
-\xcc\x10\x0f\x01\xc0\x0c\xe9\x5f\x30\xf8\x91\x48\xf1\xe6\xd2\x3b\
-\xe6\xb0\x9f\x3b\xfc\x88\x7b\x8e\xde\x7a\xf5\x6d\xd7\x97\x1e\x02\
-\x73\x81\x00\x80\x19\x30\xb0\x6a\xf0\x3d\x11\xf1\xae\xd2\x3b\xe6\
-\xba\x14\xf1\xe2\xc3\xcf\x3b\x25\x6f\xbd\xfa\xb6\x7f\x2c\xbd\x05\
-\x66\x3b\x01\x00\xd3\x34\xb0\x6a\xd1\x5b\x72\xa4\x4b\x4a\xef\xa8\
-\x45\x8a\x38\xf3\xf0\xf3\x4e\x79\x70\xeb\xd5\xb7\xfd\x53\xe9\x2d\
-\x30\x9b\x79\x12\x20\x4c\x43\xff\x15\x8b\x7e\x21\xb5\xd2\x67\x43\
-\x4c\x77\x5a\x2b\x45\xeb\xec\x0d\x43\xd7\x7d\xb6\xf4\x10\x98\xad\
-\x04\x00\x4c\xd1\x82\x8f\xbf\xfa\x84\xe8\x69\xfd\x4b\x44\x1c\x55\
-\x7a\x4b\xa5\x7e\xd8\xcc\xf9\x85\xb7\x2d\x5b\x77\x57\xe9\x21\x30\
-\x1b\x79\x46\x2d\x4c\xc1\xe9\x1f\x7b\xc3\xbc\x98\xd7\xfa\x64\x38\
-\xf9\x97\x74\xf4\x58\xa4\xbf\x3b\xf5\xaa\xf3\xe7\x97\x1e\x02\xb3\
-\x91\x00\x80\x29\x78\xa0\xef\xee\x3f\x8e\x1c\x2f\x2f\xbd\xa3\x7a\
-\x29\x7e\x7e\xfb\xb6\xed\xef\x2b\x3d\x03\x66\x23\x0f\x01\xc0\x01\
-\x5a\xb0\x7a\xf0\xdc\xc8\xf1\xf7\xe1\xcf\x4f\xb7\xc8\x29\xf2\xab\
-\x37\x0c\xad\x1b\x2e\x3d\x04\x66\x13\x3f\xc0\xe0\x00\x0c\x5c\x71\
-\xd6\x21\xb9\xd5\xf3\xdd\x88\x38\xae\xf4\x16\x9e\xe0\x9e\xdc\xd7\
-\xf7\xbc\x8d\x4b\xd6\x3c\x58\x7a\x08\xcc\x16\x1e\x02\x80\x03\xd0\
-\xca\x3d\xef\x0f\x27\xff\x6e\x74\x6c\xda\xb6\xed\x3d\xa5\x47\xc0\
-\x6c\xe2\x0a\x00\x4c\x52\xff\x15\x83\x2f\x4e\xad\xf8\x6a\x78\xc9\
-\x5f\xb7\x6a\x35\xa2\xf1\xb2\xdb\x87\xae\xfd\x5a\xe9\x21\x30\x1b\
-\xb8\x02\x00\x93\xb0\xf0\xa6\x85\x3d\xa9\x15\x1f\x0b\x27\xff\x6e\
-\xd6\x68\xa5\xfc\x7f\xe3\xaa\xf3\xdd\x47\x30\x09\x02\x00\x26\xe1\
-\x8e\x2d\x87\xbc\x25\x22\x5e\x58\x7a\x07\x4f\x21\xe7\xd3\x07\xb6\
-\x6f\x7b\x53\xe9\x19\x30\x1b\x78\x08\x00\x9e\xc2\x89\x97\x2d\xec\
-\x6b\x36\x0f\xde\x18\x11\xc7\x96\xde\xc2\xa4\xdc\xbb\xa3\xaf\xaf\
-\x7f\xcb\x92\x35\xdb\x4a\x0f\x81\x6e\xe6\x0a\x00\x3c\x85\x9e\xc6\
-\x33\x7e\x33\x9c\xfc\x67\x93\x63\x7a\xb7\x6d\xff\x8d\xd2\x23\xa0\
-\xdb\xb9\x02\x00\xfb\x71\xe2\x65\x0b\xfb\x9a\x8d\x83\x47\x22\xc5\
-\x33\x4b\x6f\xe1\x80\xdc\xb3\xa3\xaf\x6f\x81\xab\x00\x30\x31\x57\
-\x00\x60\x3f\x9a\xcd\x83\xdf\xe0\xe4\x3f\x2b\x1d\xdb\xb7\x6d\xfb\
-\x8a\xd2\x23\xa0\x9b\xb9\x02\x00\x13\x18\xb8\xf4\xac\xde\x7c\x58\
-\xcf\x48\x78\xdd\xff\x6c\x75\x67\x5f\x5f\xdf\xc0\x2d\x4b\xd6\xec\
-\x2c\x3d\x04\xba\x91\x2b\x00\x30\x81\x7c\x68\xf3\xdc\x70\xf2\x9f\
-\xcd\x4e\xd8\xb1\x6d\xdb\xe2\xd2\x23\xa0\x5b\x09\x00\x98\x48\x23\
-\x2d\x2b\x3d\x81\x69\x4a\xee\x43\x98\x88\x87\x00\x60\x1f\x4e\xf9\
-\xe4\xe2\x67\x8e\xee\xca\x77\x84\x37\xfe\x99\xed\x46\x47\xd3\xbc\
-\x67\x7d\x7f\xe9\xdf\xdf\x53\x7a\x08\x74\x1b\x57\x00\x60\x1f\x76\
-\xed\xca\x43\xe1\xe4\x3f\x17\xf4\xf4\xc4\xae\x0b\x4b\x8f\x80\x6e\
-\x24\x00\x60\x1f\x52\xc4\x50\xe9\x0d\xcc\x90\x1c\x5e\x0d\x00\xfb\
-\x20\x00\x60\x2f\xfd\xab\x16\x9f\x11\x11\xcf\x2b\xbd\x83\x19\xf3\
-\x33\x03\x2b\x17\x7b\x1b\x67\xd8\x8b\x00\x80\xbd\x34\x22\x0f\x96\
-\xde\xc0\xcc\xca\xa9\x75\x4e\xe9\x0d\xd0\x6d\x04\x00\xec\x25\xa7\
-\xe4\x64\x31\xd7\x64\xf7\x29\xec\xcd\xab\x00\x60\x0f\x27\x5f\x39\
-\x78\xd4\xd8\x68\xfc\x20\xfc\xd9\x98\x6b\x5a\xbb\x9a\xad\xa3\xee\
-\xb8\xf0\xba\xad\xa5\x87\x40\xb7\x70\x05\x00\xf6\x30\x36\x16\xaf\
-\x08\x27\xff\xb9\xa8\xd1\xd3\x6a\xbe\xac\xf4\x08\xe8\x26\x02\x00\
-\xf6\xd4\x8a\x97\x97\x9e\x40\x7b\x34\x5a\xf9\x95\xa5\x37\x40\x37\
-\x11\x00\xb0\xa7\x14\x3f\x5f\x7a\x02\xed\x91\xdd\xb7\xf0\x04\x02\
-\x00\x1e\x93\x23\x45\xc4\xcf\x95\x9e\x41\xdb\x9c\x36\x7e\x1f\x03\
-\x21\x00\xe0\x71\x0b\xae\x58\xbc\x20\x22\x0e\x29\xbd\x83\xb6\x39\
-\xec\xa4\x2b\xcf\x7e\x56\xe9\x11\xd0\x2d\x04\x00\x8c\xcb\xad\xfc\
-\xdc\xd2\x1b\x68\xaf\xc6\x68\xf3\x67\x4a\x6f\x80\x6e\x21\x00\x60\
-\x5c\x4a\xd1\x5f\x7a\x03\xed\x95\x22\x4e\x2a\xbd\x01\xba\x85\x00\
-\x80\x71\x4e\x0e\x73\x5f\x76\x1f\xc3\xe3\x04\x00\x8c\xcb\x11\xc7\
-\x95\xde\x40\x9b\xa5\x38\xa1\xf4\x04\xe8\x16\x02\x00\x76\xfb\xa9\
-\xd2\x03\x68\xbb\xa3\x4b\x0f\x80\x6e\x21\x00\x60\xb7\xa3\x4a\x0f\
-\xa0\xed\xdc\xc7\x30\x4e\x00\xc0\x6e\x5e\x02\x38\xf7\x1d\x5a\x7a\
-\x00\x74\x0b\x01\x00\xbb\xf5\x96\x1e\x40\xdb\xb9\x8f\x61\x9c\x00\
-\x80\xdd\xe6\x97\x1e\x40\xdb\x09\x00\x18\x27\x00\x60\xb7\x9e\xd2\
-\x03\x68\xbb\x79\xa5\x07\x40\xb7\x10\x00\x00\x50\x21\x01\x00\x00\
-\x15\x12\x00\x00\x50\x21\x01\x00\x00\x15\x12\x00\x00\x50\x21\x01\
-\x00\x00\x15\x12\x00\x00\x50\x21\x01\x00\x00\x15\x12\x00\x00\x50\
-\x21\x01\x00\x00\x15\x12\x00\x00\x50\x21\x01\x00\x00\x15\x12\x00\
-\x00\x50\x21\x01\x00\x00\x15\x12\x00\x00\x50\x21\x01\x00\x00\x15\
-\x12\x00\x00\x50\x21\x01\x00\x00\x15\x12\x00\x00\x50\x21\x01\x00\
-\x00\x15\x12\x00\x00\x50\x21\x01\x00\x00\x15\x12\x00\x00\x50\x21\
-\x01\x00\x00\x15\x12\x00\x00\x50\x21\x01\x00\x00\x15\x12\x00\x00\
-\x50\x21\x01\x00\x00\x15\x12\x00\x00\x50\x21\x01\x00\x00\x15\x12\
-\x00\x00\x50\x21\x01\x00\x00\x15\x12\x00\x00\x50\x21\x01\x00\x00\
-\x15\x12\x00\x00\x50\x21\x01\x00\x00\x15\x12\x00\x00\x50\x21\x01\
-\x00\x00\x15\x12\x00\x00\x50\x21\x01\x00\x00\x15\x12\x00\x00\x50\
-\x21\x01\x00\x00\x15\x12\x00\x00\x50\x21\x01\x00\x00\x15\x12\x00\
-\x00\x50\x21\x01\x00\x00\x15\x12\x00\x00\x50\x21\x01\x00\x00\x15\
-\x12\x00\x00\x50\x21\x01\x00\x00\x15\x12\x00\x00\x50\x21\x01\x00\
-\x00\x15\x12\x00\x00\x50\x21\x01\x00\x00\x15\x12\x00\x00\x50\x21\
-\x01\x00\x00\x15\x12\x00\x00\x50\x21\x01\x00\x00\x15\x12\x00\x00\
-\x50\x21\x01\x00\x00\x15\x12\x00\x00\x50\x21\x01\x00\x00\x15\x12\
-\x00\x00\x50\x21\x01\x00\x00\x15\x12\x00\x00\x50\x21\x01\x00\x00\
-\x15\x12\x00\x00\x50\x21\x01\x00\x00\x15\x12\x00\x00\x50\x21\x01\
-\x00\x00\x15\x12\x00\x00\x50\x21\x01\x00\x00\x15\x12\x00\x00\x50\
-\x21\x01\x00\x00\x15\x12\x00\x00\x50\x21\x01\x00\x00\x15\x12\x00\
-\x00\x50\x21\x01\x00\x00\x15\x12\x00\x00\x50\x21\x01\x00\x00\x15\
-\x12\x00\x00\x50\x21\x01\x00\x00\x15\x12\x00\x00\x50\x21\x01\x00\
-\x00\x15\x12\x00\x00\x50\x21\x01\x00\x00\x15\x12\x00\x00\x50\x21\
-\x01\x00\x00\x15\x12\x00\x00\x50\x21\x01\x00\x00\x15\x12\x00\x00\
-\x50\x21\x01\x00\x00\x15\x12\x00\x00\x50\x21\x01\x00\x00\x15\x12\
-\x00\x00\x50\x21\x01\x00\x00\x15\x12\x00\x00\x50\x21\x01\x00\x00\
-\x15\x12\x00\x00\x50\x21\x01\x00\x00\x15\x12\x00\x00\x50\x21\x01\
-\x00\x00\x15\x12\x00\x00\x50\x21\x01\x00\x00\x15\x12\x00\x00\x50\
-\x21\x01\x00\x00\x15\x12\x00\x00\x50\x21\x01\x00\x00\x15\x12\x00\
-\x00\x50\x21\x01\x00\x00\x15\x12\x00\x00\x50\x21\x01\x00\x00\x15\
-\x12\x00\x00\x50\x21\x01\x00\x00\x15\x12\x00\x00\x50\x21\x01\x00\
-\x00\x15\x12\x00\x00\x50\x21\x01\x00\x00\x15\x12\x00\x00\x50\x21\
-\x01\x00\x00\x15\x12\x00\x00\x50\x21\x01\x00\x00\x15\x12\x00\x00\
-\x50\x21\x01\x00\x00\x15\x12\x00\x00\x50\x21\x01\x00\x00\x15\x12\
-\x00\x00\x50\x21\x01\x00\x00\x15\x12\x00\x00\x50\x21\x01\x00\x00\
-\x15\x12\x00\x00\x50\x21\x01\x00\x00\x15\x12\x00\x00\x50\x21\x01\
-\x00\x00\x15\x4a\xa5\x07\xcc\x88\x1c\x69\x60\xe5\xb9\xfd\xad\x34\
-\xf6\xbc\x94\xa2\x3f\x45\x9c\xd4\x4a\xe9\xf8\x94\xf3\xd1\x11\x71\
-\x64\x44\x3c\x2d\x22\x0e\x2f\xbc\x92\xee\x77\x58\xcc\x95\x3f\x13\
-\x4c\x24\x47\xc4\x03\xa5\x47\xd0\xbd\x52\x44\xce\x8f\xfe\x7f\xe4\
-\x27\x11\xf1\xa3\x88\xf8\x61\x8e\xd8\x92\x72\x6c\xca\x8d\xb4\xb1\
-\xa7\x31\xf6\xbd\xdb\x2e\xb8\x6e\x53\xa4\xc8\x85\xa7\x4e\xdb\xac\
-\xfc\x61\x77\xf2\x95\x83\x47\xb5\x76\xc5\xcb\x73\x8a\x57\x46\xc4\
-\x4b\x22\xe2\xe7\x22\xe2\x90\xc2\xb3\x00\xa8\xc3\x43\x11\xe9\xdb\
-\x91\xf3\xd7\x52\x23\x7d\xb1\xa7\xd5\xfc\xf2\xbf\x2f\xbb\xfa\xfe\
-\xd2\xa3\x0e\xd4\xac\x09\x80\xfe\x55\x8b\xcf\x68\xe4\x58\x94\x53\
-\x3e\x27\x22\x4e\x8f\x59\xb4\x1d\x80\x39\xad\x15\x11\x37\xe7\x94\
-\xaf\x4b\x63\x79\xdd\xc8\xf2\xeb\x6e\x2e\x3d\x68\x32\xba\xfa\x24\
-\xfa\xec\xd5\xaf\x39\xb6\x19\xa3\x4b\x52\xce\xaf\x8f\x47\xff\x2b\
-\x1f\x00\xba\x5a\x8a\xf8\xf7\xc8\xe9\x6f\xc7\x7a\x46\x2f\xdb\x74\
-\xe1\xf5\xdf\x2f\xbd\x67\x22\x5d\x17\x00\x03\x97\x9e\xd5\x1b\x87\
-\xf7\xbc\x3a\x47\x2c\x8f\x1c\xbf\x1c\x11\xcd\xd2\x9b\x00\x60\x0a\
-\xc6\x22\xe2\x33\x29\xd2\xca\xde\xbe\xde\x6b\x6f\x59\xb2\x66\x67\
-\xe9\x41\x7b\xea\x9a\x00\x38\xf5\xaa\xf3\xe7\x6f\xdf\xb1\x63\x79\
-\xe4\x78\x77\x44\x3e\xbe\xf4\x1e\x00\x98\x41\xf7\xe5\x14\x7f\xb2\
-\xb3\xb7\xef\xd2\x2d\x4b\xd6\x6c\x2b\x3d\x26\xa2\x0b\x02\x60\xe0\
-\xd2\xb3\x7a\xf3\xe1\xf3\x96\x45\xce\x7f\x10\x11\xc7\x95\xde\x03\
-\x00\x6d\xf4\x83\x9c\xe2\x23\xdb\x7f\x12\x7f\x76\xf7\x1b\x87\x7f\
-\x52\x72\x48\xb1\x00\x58\x78\xd3\xc2\x9e\x3b\xb6\x1c\xf2\x96\x94\
-\xf3\xff\x8c\x88\x9f\x2e\xb5\x03\x00\x0a\xb8\x37\x52\x7a\xdf\x48\
-\x6f\xef\x5f\xc6\x92\x35\x63\x25\x06\x14\x09\x80\x81\xd5\x83\x2f\
-\xca\x39\x3e\x1a\x11\x2f\x2e\x71\xfb\x00\xd0\x0d\x72\x4a\xdf\x6a\
-\xe6\xf4\xa6\xdb\x87\xae\xfd\x5a\xa7\x6f\xbb\xa3\x01\xd0\x7f\xd5\
-\xf9\x87\xa6\xed\xdb\xdf\x1b\x11\x6f\x09\x4f\xee\x03\x80\x88\x47\
-\x5f\x46\xf8\x37\xa9\x31\xfa\xf6\x0d\x17\xdd\xf0\x50\xa7\x6e\xb4\
-\x63\x01\xb0\x60\xf5\xe0\xb9\x91\xe3\x2f\x22\xe2\xd8\x4e\xdd\x26\
-\x00\xcc\x1a\x39\xee\x4e\x8d\xf4\xe6\x0d\x4b\xd7\xae\xed\xc4\xcd\
-\xb5\x3d\x00\x16\xde\xb4\xb0\x67\xcb\x1d\x07\xff\x51\x4e\xf1\x8e\
-\x4e\xdc\x1e\x00\xcc\x62\x39\x22\xfe\xac\xaf\xaf\xef\xed\xed\x7e\
-\xd9\x60\x5b\x4f\xc8\x03\x57\x9c\x75\x7c\x6e\x35\xff\x36\x22\xbd\
-\xac\x9d\xb7\x03\x00\x73\xcc\x37\xc6\xc6\x9a\x4b\x36\xaf\xb8\x66\
-\x73\xbb\x6e\xa0\x6d\x01\xb0\x60\xd5\xe0\xab\x22\xe2\xca\xf0\x0c\
-\x7f\x00\x98\x8a\x1f\xa5\x68\x5d\xb4\x61\xe8\xba\xcf\xb6\xe3\xe0\
-\x6d\xf9\x75\xc0\x0b\x56\x0d\xbe\x35\x22\x3e\x17\x4e\xfe\x00\x30\
-\x55\x47\xe5\x68\x5c\x3f\xb0\x6a\xd1\x5b\xda\x71\xf0\x19\x7f\x26\
-\x7e\xff\xea\xc1\x77\xa6\x88\x0f\x87\xc7\xfb\x01\x60\xba\x52\x44\
-\x3a\xfb\xc8\x73\x4f\x39\xe8\xc7\xd7\xdc\xf6\x0f\x33\x79\xe0\x99\
-\x0b\x80\x1c\xa9\x7f\xc1\xe0\x47\x52\xc4\xbb\x67\xec\x98\x00\x40\
-\x44\x8a\x57\x1c\x7e\xde\x73\x8f\xde\x7a\xda\xeb\x3e\x13\xeb\xd7\
-\xe7\x99\x39\xe4\x4c\xb8\xea\xfc\xe6\xc0\xb6\xed\x7f\x9d\x53\xac\
-\x98\x91\xe3\x01\x00\x4f\x92\x22\xae\x3c\x74\xdb\xb1\xcb\x6f\x7e\
-\xe3\x5f\xed\x9a\xee\xb1\xa6\x7f\x05\xe0\xe2\x8b\x1b\x0b\x0e\xbe\
-\xf3\xca\x48\x71\xd1\xb4\x8f\x05\x00\xec\xcf\xcf\x6e\x9f\xf7\xf0\
-\x73\xb6\x9e\x76\xc1\xd5\xd3\xbd\x12\x30\xed\x27\x01\xf6\xf7\xdf\
-\xfc\xa1\x88\xf8\xf5\xe9\x1e\x07\x00\x98\x8c\xf4\xda\xfe\x05\x37\
-\xff\xd9\x74\x8f\x32\xad\x2b\x00\xe3\x4f\xf8\xf3\x98\x3f\x00\x74\
-\x50\x8a\x78\xf1\x11\xe7\x3d\xf7\x91\xad\x57\xdf\xfa\xd5\x69\x1c\
-\x63\x6a\xfa\x57\x0d\x5e\x90\x22\xae\x98\xce\x31\x00\x80\x29\xcb\
-\x91\xd3\x8a\x91\x65\x6b\x57\x4e\xe5\x9b\xa7\x74\xf2\x1e\x58\xbd\
-\x68\x61\xce\xe9\xc6\x88\x98\x37\x95\xef\x07\x00\x66\xc4\xce\x46\
-\x2b\xfd\xd2\xed\xcb\xd7\x7e\xe1\x40\xbf\xf1\x80\x03\x60\xe0\xe3\
-\x67\x1d\x9d\x9b\x3d\xdf\x8a\x14\xcf\x3c\xd0\xef\x05\x00\x66\xdc\
-\x5d\xcd\x9e\x78\xc1\x6d\x17\x0c\xff\xe8\x40\xbe\xe9\xc0\x9e\x04\
-\x98\x23\xb5\x7a\x7a\xfe\x9f\x93\x3f\x00\x74\x8d\xe3\xc6\xc6\x62\
-\x55\xe4\x03\xfb\x8f\xfa\x03\x7a\x12\xe0\x82\x05\x8b\xdf\x91\x22\
-\xda\xf2\x96\x84\x00\xc0\x94\x3d\xe7\xc8\x6f\x9f\xfc\xd0\x8f\xaf\
-\xb9\x6d\xd2\x4f\x0a\x9c\x74\x2d\xf4\x5f\x31\xf8\xe2\xd4\x8a\x2f\
-\x45\xc4\xfc\x29\x4d\x03\x00\xda\x69\x57\xca\xf9\xbf\x6c\x58\xb6\
-\x6e\x52\x11\x30\xa9\x87\x00\x4e\xbc\x6c\x61\x5f\x6a\xc5\x95\xe1\
-\xe4\x0f\x00\xdd\x6a\x5e\x4e\x8d\xcb\x07\x2e\x3d\xab\x77\x32\x5f\
-\x3c\xa9\x00\x68\xf4\x3c\xe3\x9d\x11\x31\x30\xad\x59\x00\x40\x9b\
-\xe5\x93\xf3\x61\x3d\xbf\x37\x99\xaf\x7c\xca\x87\x00\x4e\xfa\xc4\
-\xd9\xcf\x6e\x8c\x35\xbf\x1b\x11\x4f\x9b\xf6\x2e\x00\xa0\xdd\xb6\
-\xf5\x44\x9c\x7a\xeb\xd0\xf0\xa6\xfd\x7d\xd1\x53\x5e\x01\x68\x8e\
-\x35\xff\x3c\x9c\xfc\x01\x60\xb6\x38\x68\x34\xa5\x0f\x3f\xd5\x17\
-\xed\x37\x00\x06\x56\x2f\x5e\x9c\x23\x16\xcd\xdc\x26\x00\xa0\xed\
-\x72\x3e\xaf\x7f\xf5\xe2\x73\xf6\xf7\x25\x13\x07\xc0\x55\xe7\x37\
-\x73\x2b\x7f\x68\xc6\x47\x01\x00\x6d\x97\x72\xfe\xe3\xb8\xf8\xe2\
-\x09\xcf\xf3\x13\x7e\xa2\x7f\xc7\xf6\x25\x91\xe2\x39\xed\x99\x05\
-\x00\xb4\xd9\xf3\xfa\x17\xdc\x7c\xde\x44\x9f\xdc\x77\x00\xe4\x48\
-\x29\xc7\xdb\xdb\x36\x09\x00\xe8\x80\xf4\xbf\x27\x7a\x87\xc0\x7d\
-\x06\xc0\xc0\xea\x45\x8b\x22\xe2\x85\x6d\xdd\x04\x00\xb4\x55\xca\
-\xf9\x05\x0b\x56\x0d\xfe\xea\xbe\x3e\xb7\xcf\x00\xc8\x29\xbd\xb3\
-\xbd\x93\x00\x80\x8e\x48\xf1\xee\x7d\x7d\xf8\x49\x01\x70\xd2\xea\
-\x73\x5e\x19\x39\x5e\xde\xfe\x45\x00\x40\x07\xbc\x74\xc1\xe5\x8b\
-\x9f\x74\x5e\x7f\x52\x00\x34\x5b\x8d\x15\x9d\xd9\x03\x00\x74\x44\
-\xca\xcb\x9f\xf4\xa1\x3d\xff\xe1\xf8\xab\xce\x3f\xa8\x77\xfb\xf6\
-\x7b\x22\xe2\xd0\x4e\x6d\x02\x00\xda\xee\xa1\x1d\x7d\x7d\xc7\x6c\
-\x59\xb2\x66\xdb\x63\x1f\x78\xc2\x15\x80\xf9\xdb\xb7\x9f\x17\x4e\
-\xfe\x00\x30\xd7\x1c\xd2\xb7\x63\xfb\xe0\x9e\x1f\x78\x42\x00\xa4\
-\x88\xa5\x9d\xdd\x03\x00\x74\x44\x7e\xe2\x39\xfe\xf1\x87\x00\x4e\
-\xba\x72\xf1\x4f\x37\x46\xf3\x96\x88\xe8\xe9\xf8\x28\x00\xa0\xdd\
-\x46\x5b\x3d\xe9\xf8\x4d\x17\xac\xbd\x2f\x62\x8f\x2b\x00\x8d\xd1\
-\xd6\xe2\x70\xf2\x07\x80\xb9\xaa\x67\xfc\x5c\x1f\x11\x4f\x7c\x08\
-\xe0\x55\x05\xc6\x00\x00\x1d\x93\x1e\x7f\x53\xa0\x47\x03\x20\x47\
-\x8a\x48\x0b\x4b\xcd\x01\x00\x3a\xe2\x17\x4f\xff\xd8\x1b\xe6\x45\
-\x8c\x07\xc0\xc0\xca\xc1\x9f\x89\x88\x63\x8a\x4e\x02\x00\xda\xed\
-\x90\x87\x0e\xba\xef\x45\x11\xe3\x01\x90\x93\xcb\xff\x00\x50\x83\
-\x56\xe4\x57\x44\x3c\xf6\x10\x40\x8a\x85\x25\xc7\x00\x00\x1d\x92\
-\x1e\x7d\xbb\xff\xc7\x9e\x04\xf8\x92\x82\x53\x00\x80\x4e\xc9\xf9\
-\x45\x11\x11\xe9\xf8\xbf\xf9\x95\x23\x7a\xe7\xcf\xbf\xbf\xf4\x1e\
-\x00\xa0\x23\xf2\xd8\x58\xf3\x88\x46\xdf\xfc\xf9\x3f\x5b\x7a\x09\
-\x00\xd0\x31\xa9\xd1\x1c\x7b\x7e\x23\x47\x3e\xb9\xf4\x12\x00\xa0\
-\x73\x52\xc4\x40\x23\x72\x3a\xb1\xf4\x10\x00\xa0\x73\x52\xc4\x49\
-\x8d\x94\xe2\xc4\xd2\x43\x00\x80\xce\x69\xa5\xe8\x6f\xe4\x88\x63\
-\x4b\x0f\x01\x00\x3a\x27\xe5\x7c\x4c\x23\x22\x8e\x2a\x3d\x04\x00\
-\xe8\x9c\x9c\x1a\x47\x35\x22\xe2\x88\xd2\x43\x00\x80\xce\x49\x39\
-\x1f\xd9\x88\x88\x67\x94\x1e\x02\x00\x74\xd4\x33\x1a\x11\x31\xbf\
-\xf4\x0a\x00\xa0\xa3\x7a\x05\x00\x00\xd4\xa7\xb7\xf1\xd4\x5f\x03\
-\x00\xcc\x35\x8d\x88\xd8\x59\x7a\x04\x00\xd0\x51\x3b\x04\x00\x00\
-\xd4\x67\x47\x23\x22\x1e\x29\xbd\x02\x00\xe8\xa8\x47\x1a\x29\xe2\
-\x47\xa5\x57\x00\x00\x1d\xf5\xc3\x46\x8e\xb8\xbf\xf4\x0a\x00\xa0\
-\x73\x52\xc4\xfd\x8d\x14\xe9\x9e\xd2\x43\x00\x80\xce\xc9\x11\xf7\
-\x36\x72\xce\xdf\x2f\x3d\x04\x00\xe8\x9c\x14\xb1\xa9\x91\x1a\xb1\
-\xa9\xf4\x10\x00\xa0\x73\x72\xc4\xa6\x46\xe4\xb8\xbd\xf4\x10\x00\
-\xa0\x83\x5a\xe9\xf6\xc6\xe8\x58\xf3\xdb\x11\x91\x4b\x6f\x01\x00\
-\x3a\x22\xa7\x9e\x5d\xff\xda\xd8\xbc\xe2\x9a\x07\x22\x62\x4b\xe9\
-\x35\x00\x40\x47\x7c\x7f\xc3\x45\x37\x3c\xd4\x88\x88\x48\x11\x5f\
-\x2f\xbd\x06\x00\xe8\x88\x7f\x89\x78\xf4\x77\x01\x44\x4e\x69\x7d\
-\xd1\x29\x00\x40\x47\xa4\x88\x2f\x45\x8c\x07\x40\x4a\xe9\xf3\x65\
-\xe7\x00\x00\x9d\xd0\x6a\xec\x11\x00\x1b\x2e\xbc\xf6\x7b\x11\x71\
-\x6f\xd1\x45\x00\x40\xbb\x3d\xf8\xac\xe3\x1e\xfe\x66\xc4\x78\x00\
-\x44\x8a\x1c\x39\x6e\x2a\x3a\x09\x00\x68\xab\x9c\xd2\xe7\xd6\x9f\
-\xb9\x7e\x34\xe2\xb1\x00\x88\x88\xd4\x08\x0f\x03\x00\xc0\x1c\xd6\
-\x88\xfc\xd9\xdd\x7f\x3f\x2e\xe7\x9e\xb5\x11\x31\x5a\x64\x11\x00\
-\xd0\x6e\xa3\x63\xcd\x34\xfc\xd8\x3f\x3c\x1e\x00\x23\x43\x57\xff\
-\x20\x22\x6e\x2c\x32\x09\x00\x68\xab\x1c\x71\xc3\xa6\x0b\xd6\xde\
-\xf7\xd8\x3f\x37\x9e\xf8\xe9\xb4\xba\xd3\x83\x00\x80\xf6\x6b\xec\
-\x75\x8e\x7f\x42\x00\x8c\x8d\x3d\x74\x4d\x44\x3c\xd0\xd1\x45\x00\
-\x40\xbb\x3d\xb8\xbd\xaf\x77\xdd\x9e\x1f\x78\x42\x00\x6c\x5e\xb1\
-\x7e\x7b\x8a\xfc\xf7\x9d\xdd\x04\x00\xb4\x57\xbe\x6a\xcb\x92\x35\
-\xdb\xf6\xfc\x48\x63\xef\x2f\x69\x45\xba\xac\x73\x83\x00\x80\xb6\
-\x4b\xcd\xcb\xf7\xfe\xd0\x93\x02\x60\xe3\xd0\xf0\x97\x62\xfc\x6d\
-\x02\x01\x80\x59\xef\xab\x23\x4b\xaf\xfd\xca\xde\x1f\x7c\x52\x00\
-\x44\x44\xe4\x94\x3e\xd0\xfe\x3d\x00\x40\xbb\xa5\x68\xbd\x67\xdf\
-\x1f\x9f\xc0\x82\x55\x83\x37\x47\xc4\x8b\xda\xb6\x08\x00\x68\xb7\
-\x6f\x8e\x2c\x1d\x3e\x3d\x52\xe4\xbd\x3f\xb1\xcf\x2b\x00\x11\x11\
-\x29\xc5\x25\xed\xdd\x04\x00\xb4\x55\xce\x7f\xb8\xaf\x93\x7f\xc4\
-\x7e\x02\x60\x43\x6f\xdf\xa7\x23\xe2\xd6\xb6\x8d\x02\x00\xda\xe9\
-\x96\x91\x4d\x67\x5c\x3b\xd1\x27\x27\x0c\x80\x58\xb2\x66\x2c\x45\
-\xeb\x6d\x6d\x99\x04\x00\xb4\x57\x8e\xb7\xc7\xc5\x17\xb7\x26\xfa\
-\xf4\xc4\x01\x10\x11\x1b\x86\xae\xfb\x6c\xe4\xbc\x76\xe6\x57\x01\
-\x00\xed\x92\x53\xfa\xbb\x91\x65\xc3\x37\xec\xef\x6b\xf6\x1b\x00\
-\xe3\x07\xf9\xed\x1c\xf1\x1f\x33\x37\x0b\x00\x68\xa3\x9f\xb4\x46\
-\x1b\x6f\x7f\xaa\x2f\x7a\xca\x00\xd8\x38\x34\x7c\x47\xca\xc9\x13\
-\x02\x01\x60\x16\x48\x91\xfe\x68\xf3\x8a\x6b\x36\x3f\xd5\xd7\x3d\
-\x65\x00\x44\x44\xa4\x07\x77\x7d\x30\x72\xdc\x3e\xed\x55\x00\x40\
-\x3b\xdd\xda\xdb\xd7\xfb\xe1\xc9\x7c\xe1\xa4\x02\x60\xc3\x5b\x6f\
-\xd8\x91\x9b\x71\x61\x44\xec\x9c\xd6\x2c\x00\xa0\x5d\x76\xa5\x46\
-\x2c\xbf\x65\xc9\x9a\x49\x9d\xab\x27\x15\x00\x11\x11\x1b\x2f\x1a\
-\xfe\x46\xa4\xf8\xfd\xa9\xef\x02\x00\xda\x25\x47\xbc\x63\xc3\x45\
-\xc3\xff\x34\xd9\xaf\x9f\xf0\x9d\x00\x27\x38\x7a\x5a\xb0\x6a\xd1\
-\x35\x91\xd2\xe2\x03\x5e\x06\x00\xb4\xcb\xf5\x23\x4b\x87\x17\x4d\
-\xf4\xa6\x3f\xfb\x32\xe9\x2b\x00\x11\x11\x91\x22\xa7\xb1\xb1\xdf\
-\x88\x88\xbb\x0e\x74\x19\x00\xd0\x0e\x69\x4b\xb3\x27\x96\x1d\xc8\
-\xc9\x3f\xe2\x40\x03\x20\x22\x36\xbc\xfe\x86\x1f\x36\x5a\xe9\x82\
-\xf0\x7c\x00\x00\x28\x6d\x67\x8e\xfc\xba\xdb\x2e\x18\xfe\xd1\x81\
-\x7e\xe3\x01\x07\x40\x44\xc4\xed\xcb\xd7\x7e\x21\x22\x2d\x8b\x88\
-\x09\xdf\x61\x08\x00\x68\xab\x9c\x22\x7e\x63\xe3\xd0\xf0\x97\xa6\
-\xf2\xcd\xcd\xa9\xde\xea\xd6\xab\x6f\xfd\xb7\x23\x5e\x73\xca\x4f\
-\x22\xe2\x97\xa7\x7a\x0c\x00\x60\x6a\x52\xc4\xef\x6e\x18\x1a\xfe\
-\xd8\x54\xbf\x7f\xca\x01\x10\x11\xb1\xf5\xea\xdb\xbe\x72\xf8\x6b\
-\x9e\x7b\x48\x8a\x78\xe9\x74\x8e\x03\x00\x1c\x90\x0f\x8f\x0c\x0d\
-\xbf\x77\x3a\x07\x98\xd2\x43\x00\x7b\xda\x38\xf2\xa2\xb7\x47\xe4\
-\x4f\x4d\xf7\x38\x00\xc0\x24\xe4\xf8\xe4\xc8\xc6\xd3\xdf\x31\xdd\
-\xc3\x1c\xd8\xcb\x00\x27\x72\xd5\xf9\xcd\x81\xed\xdb\xfe\x2a\x47\
-\x7a\xfd\x8c\x1c\x0f\x00\x78\x92\x14\xe9\x13\x87\x6e\x3b\x66\xc5\
-\xcd\x6f\xfc\xab\x5d\xd3\x3f\xd6\x4c\xc9\x91\x16\xac\x1e\xfc\xe3\
-\x88\xf8\xdd\x19\x3b\x26\x00\xf0\xa8\x9c\xff\x7c\x64\xd3\x19\x6f\
-\xdb\xdf\xaf\xf8\x3d\x10\x33\x17\x00\xe3\xfa\x57\x0f\xbe\x33\xe5\
-\xf8\xc0\x4c\x1f\x17\x00\x6a\x95\x72\x5c\xb2\x61\xd9\xf0\xbb\x66\
-\xf4\x98\x33\x79\xb0\xc7\x0c\xac\x5a\xf4\x96\x1c\xe9\x4f\x63\x9a\
-\x4f\x32\x04\x80\xca\x8d\xe5\xc8\xbf\xb5\x71\x68\xdd\x47\x67\xfa\
-\xc0\x6d\x09\x80\x88\x88\x81\xd5\x8b\x16\xe6\x9c\x3e\x19\x11\xc7\
-\xb4\xeb\x36\x00\x60\x0e\xfb\x61\x6a\xc5\x45\x1b\x96\x0f\xdf\xd8\
-\x8e\x83\xb7\x2d\x00\x22\x22\x4e\x5e\xb9\xe8\xb8\xb1\x94\x3e\x15\
-\x11\xaf\x68\xe7\xed\x00\xc0\xdc\x92\xbe\xd8\x33\x2f\x5e\x7b\xeb\
-\xeb\xd6\xde\xdd\xae\x5b\x98\xf6\xcb\x00\xf7\xe7\xb6\x65\xeb\xee\
-\x3a\xe1\x84\x87\xcf\x4c\x39\xbd\x27\xbc\x6b\x20\x00\x3c\x95\x1c\
-\x11\x97\x1e\xb6\xed\x98\x5f\x68\xe7\xc9\x3f\xa2\xcd\x57\x00\xf6\
-\x34\xb0\x6a\xd1\x60\x8e\xf4\x97\x11\x71\x5c\xa7\x6e\x13\x00\x66\
-\x91\x3b\x73\xe4\x37\x6d\x1c\x5a\x77\x7d\x27\x6e\xac\xad\x57\x00\
-\xf6\xb4\x61\x68\xdd\xf0\xd3\x63\xc7\x29\x29\xc7\x25\x11\x31\xd6\
-\xa9\xdb\x05\x80\x2e\x37\x1a\x11\x97\xf6\xec\x4a\xa7\x76\xea\xe4\
-\x1f\xd1\xc1\x2b\x00\x7b\x7a\xce\x65\x67\xbf\x60\xac\xd9\xfc\x68\
-\x8a\x78\x49\x89\xdb\x07\x80\x2e\xf1\xcd\xdc\x88\x37\x6e\xbc\x68\
-\xf8\x1b\x9d\xbe\xe1\x8e\x5d\x01\xd8\xd3\xed\x2b\xae\xff\xd6\xc6\
-\xbe\xbe\x97\xa7\xc8\xbf\x15\x11\xf7\x94\xd8\x00\x00\xc5\xe4\xb8\
-\x3b\x47\x7e\xf3\xc8\xc6\xd3\xcf\x28\x71\xf2\x8f\x28\x74\x05\x60\
-\x4f\xa7\x5e\x75\xfe\xfc\xed\x3b\x76\x2c\x8f\x1c\xef\x8e\xc8\xc7\
-\x97\xde\x03\x00\x6d\x74\x5f\x4e\xf1\x27\x3b\x7b\xfb\x2e\xdd\xb2\
-\x64\xcd\xb6\x92\x43\x8a\x07\xc0\x63\x1e\x0d\x81\x6d\xaf\x8d\x9c\
-\xfe\x4f\x44\xf4\x97\xde\x03\x00\x33\xe8\xce\x9c\xd2\x87\x5b\xa3\
-\x0f\x7d\x6c\xf3\x8a\xf5\xdb\x4b\x8f\x89\xe8\xa2\x00\x78\xcc\xa9\
-\x57\x9d\x3f\x7f\xc7\xb6\x6d\x8b\x73\x4a\xcb\x23\xe2\x57\x22\xa2\
-\xa7\xf0\x24\x00\x98\x8a\xd1\x14\xf1\x99\x56\xa4\xcb\x0e\xea\xeb\
-\x5d\x77\xcb\x92\x35\x3b\x4b\x0f\xda\x53\xd7\x05\xc0\x9e\x4e\xbc\
-\xec\xec\x63\x1a\x3d\x3d\xbf\x1e\x11\xcb\x53\xce\x2f\x28\xbd\x07\
-\x00\x26\xe1\x7b\x39\xc5\xca\xd6\xe8\xd8\xca\xcd\x2b\xae\xbf\xb7\
-\xf4\x98\x89\x74\x75\x00\xec\x69\x60\xe5\xe2\x17\xe6\xd4\x3a\x27\
-\x47\x5a\x94\x22\x5e\x1c\x85\x9e\xc0\x08\x00\x7b\x19\x8b\x88\xaf\
-\x47\xc4\x75\x8d\xb1\xb1\xeb\x6e\x5f\x71\xfd\xb7\x4a\x0f\x9a\x8c\
-\x59\x13\x00\x7b\x7a\xd6\x27\xce\x39\xbc\x67\xb4\xf1\xf2\x94\xf2\
-\x2b\x23\xd2\x4b\x22\xe2\xb4\x88\x38\xac\xf4\x2e\x00\xaa\xb0\x35\
-\x22\xbe\x93\x72\xfc\x53\xab\x91\xbe\xd8\x1a\x6d\x7c\x79\xf3\x8a\
-\x6b\x1e\x28\x3d\xea\x40\xcd\xca\x00\xd8\x97\x13\x2f\x3b\xf7\xc4\
-\x66\x63\xec\x79\x29\xe2\xa4\x9c\xa2\x3f\x22\x8e\x8f\x88\x9f\x8a\
-\x88\xa3\x22\xe2\xe9\x11\x71\x70\x78\x3e\x01\xfb\x77\x58\xcc\xa1\
-\x3f\x13\xec\x53\x8e\x88\x59\xf7\x83\x9a\x8e\x1a\x8d\x88\x87\x23\
-\xe2\x91\x88\xb8\x3f\x22\xdf\x17\x91\xee\x4a\x39\x36\xe6\x46\xda\
-\xd8\x6a\x8c\x7e\x6f\xd3\x85\xd7\x7f\xbf\xf0\xc6\x19\xe1\x87\x1d\
-\x8c\x5b\xb0\x6a\xf0\xe1\x88\x78\x46\xe9\x1d\xb4\xd5\x23\x23\x43\
-\xc3\x07\x97\x1e\x01\xdd\xc0\xe3\xe8\x00\x50\x21\x01\x00\x00\x15\
-\x12\x00\x00\x50\x21\x01\x00\x00\x15\x12\x00\x00\x50\x21\x01\x00\
-\x00\x15\x12\x00\x00\x50\x21\x01\x00\x00\x15\x12\x00\x00\x50\x21\
-\x01\x00\x00\x15\x12\x00\x00\x50\x21\x01\x00\x00\x15\x12\x00\x00\
-\x50\x21\x01\x00\x00\x15\x12\x00\x00\x50\x21\x01\x00\x00\x15\x12\
-\x00\x00\x50\x21\x01\x00\x00\x15\x12\x00\x00\x50\x21\x01\x00\x00\
-\x15\x12\x00\x00\x50\x21\x01\x00\x00\x15\x12\x00\x00\x50\x21\x01\
-\x00\x00\x15\x12\x00\x00\x50\x21\x01\x00\x00\x15\x12\x00\x00\x50\
-\x21\x01\x00\x00\x15\x12\x00\x00\x50\x21\x01\x00\x00\x15\x12\x00\
-\x00\x50\x21\x01\x00\x00\x15\x12\x00\x00\x50\x21\x01\x00\x00\x15\
-\x12\x00\x00\x50\x21\x01\x00\x00\x15\x12\x00\x00\x50\x21\x01\x00\
-\x00\x15\x12\x00\x00\x50\x21\x01\x00\x00\x15\x12\x00\x00\x50\x21\
-\x01\x00\x00\x15\x12\x00\x00\x50\x21\x01\x00\x00\x15\x12\x00\x00\
-\x50\x21\x01\x00\x00\x15\x12\x00\x00\x50\x21\x01\x00\x00\x15\x12\
-\x00\x00\x50\x21\x01\x00\x00\x15\x12\x00\x00\x50\x21\x01\x00\x00\
-\x15\x12\x00\x00\x50\x21\x01\x00\x00\x15\x12\x00\x00\x50\x21\x01\
-\x00\x00\x15\x12\x00\x00\x50\x21\x01\x00\x00\x15\x12\x00\x00\x50\
-\x21\x01\x00\x00\x15\x12\x00\x00\x50\x21\x01\x00\x00\x15\x12\x00\
-\x00\x50\x21\x01\x00\x00\x15\x12\x00\x00\x50\x21\x01\x00\x00\x15\
-\x12\x00\x00\x50\x21\x01\x00\x00\x15\x12\x00\x00\x50\x21\x01\x00\
-\x00\x15\x12\x00\x00\x50\x21\x01\x00\x00\x15\x12\x00\x00\x50\x21\
-\x01\x00\x00\x15\x12\x00\x00\x50\x21\x01\x00\x00\x15\x12\x00\x00\
-\x50\x21\x01\x00\x00\x15\x12\x00\x00\x50\x21\x01\x00\x00\x15\x12\
-\x00\x00\x50\x21\x01\x00\x00\x15\x12\x00\x00\x50\x21\x01\x00\x00\
-\x15\x12\x00\x00\x50\x21\x01\x00\x00\x15\x12\x00\x00\x50\x21\x01\
-\x00\x00\x15\x12\x00\x00\x50\x21\x01\x00\x00\x15\x12\x00\x00\x50\
-\x21\x01\x00\x00\x15\x12\x00\x00\x50\x21\x01\x00\x00\x15\x12\x00\
-\x00\x50\x21\x01\x00\x00\x15\x12\x00\x00\x50\x21\x01\x00\x00\x15\
-\x12\x00\x00\x50\x21\x01\x00\x00\x15\x12\x00\x00\x50\x21\x01\x00\
-\x00\x15\x12\x00\x00\x50\x21\x01\x00\x00\x15\x12\x00\x00\x50\x21\
-\x01\x00\x00\x15\x12\x00\x00\x50\x21\x01\x00\x00\x15\x12\x00\x00\
-\x50\x21\x01\x00\x00\x15\x12\x00\x00\x50\x21\x01\x00\x00\x15\x12\
-\x00\x00\x50\x21\x01\x00\x00\x15\x12\x00\x00\x50\x21\x01\x00\x00\
-\x15\x12\x00\x00\x50\x21\x01\x00\x00\x15\x12\x00\x00\x50\x21\x01\
-\x00\x00\x15\x12\x00\x00\x50\x21\x01\x00\x00\x15\x12\x00\x00\x50\
-\x21\x01\x00\x00\x15\x12\x00\x00\x50\x21\x01\x00\x00\x15\x12\x00\
-\x00\x50\x21\x01\x00\x00\x15\x12\x00\x00\x50\x21\x01\x00\x00\x15\
-\x12\x00\x00\x50\x21\x01\x00\x00\x15\x12\x00\x00\x50\x21\x01\x00\
-\x00\x15\x12\x00\xb0\xdb\x68\xe9\x01\xb4\xdd\xae\xd2\x03\xa0\x5b\
-\x08\x00\xd8\x6d\x67\xe9\x01\xb4\xdd\x8e\xd2\x03\xa0\x5b\x08\x00\
-\xd8\xcd\xc9\x61\xee\x73\x1f\xc3\x38\x01\x00\xbb\x3d\x58\x7a\x00\
-\xed\x95\x22\x1e\x28\xbd\x01\xba\x85\x00\x80\xdd\x7e\x58\x7a\x00\
-\xed\x95\x23\xbb\x8f\x61\x9c\x00\x80\xdd\x7e\x54\x7a\x00\xed\x96\
-\xee\x2f\xbd\x00\xba\x85\x00\x80\x71\x29\xe2\xae\xd2\x1b\x68\xb3\
-\x1c\x77\x96\x9e\x00\xdd\x42\x00\xc0\xb8\x1c\xb1\xa9\xf4\x06\xda\
-\x2b\xb9\x8f\xe1\x71\x02\x00\xc6\xe5\x1c\x1b\x4b\x6f\xa0\xbd\x72\
-\x23\xb9\x8f\x61\x9c\x00\x80\x71\x3d\x3d\xad\xef\x96\xde\x40\x9b\
-\xed\x4a\xb7\x94\x9e\x00\xdd\x22\x95\x1e\x00\x5d\x23\x47\x5a\xb0\
-\x7a\x70\x6b\x44\x1c\x5a\x7a\x0a\x6d\xf1\xc0\xc8\xd2\xe1\x23\x22\
-\x45\x2e\x3d\x04\xba\x81\x2b\x00\xf0\x98\x14\x39\x22\x7d\xa7\xf4\
-\x0c\xda\xe6\xdb\x4e\xfe\xb0\x9b\x00\x80\x3d\xe5\xfc\xb5\xd2\x13\
-\x68\x8f\x14\xf1\xd5\xd2\x1b\xa0\x9b\x08\x00\xd8\x43\x6a\xa4\x2f\
-\x96\xde\x40\x7b\xb4\x22\xbb\x6f\x61\x0f\x02\x00\xf6\xd0\xd3\x6a\
-\x7e\x39\x22\x5a\xa5\x77\x30\xe3\xc6\x5a\x63\x3d\x5f\x29\x3d\x02\
-\xba\x89\x00\x80\x3d\xfc\xfb\xb2\xab\xef\x8f\x88\x9b\x4b\xef\x60\
-\xa6\xe5\xaf\x6d\x5e\x71\x8d\xdf\x03\x00\x7b\x10\x00\xb0\x97\x9c\
-\xf2\x75\xa5\x37\x30\xd3\xd2\xf5\xa5\x17\x40\xb7\x11\x00\xb0\x97\
-\x46\xa4\xe1\xd2\x1b\x98\x59\xad\x94\xd7\x95\xde\x00\xdd\xc6\xfb\
-\x00\xc0\x3e\x2c\x58\x35\xf8\xdd\x88\x78\x5e\xe9\x1d\xcc\x88\x5b\
-\x46\x86\x86\x9f\x5f\x7a\x04\x74\x1b\x57\x00\x60\x1f\x72\x8a\x95\
-\xa5\x37\x30\x53\xd2\x65\xa5\x17\x40\x37\x12\x00\xb0\x0f\xad\xd1\
-\xb1\x95\x11\x31\x5a\x7a\x07\xd3\x36\x3a\x36\x36\xfa\x89\xd2\x23\
-\xa0\x1b\x09\x00\xd8\x87\xcd\x2b\xae\xbf\x37\x22\x6e\x2c\xbd\x83\
-\xe9\xc9\x11\x37\x8c\xdf\x97\xc0\x5e\x04\x00\x4c\x20\x45\xba\xbc\
-\xf4\x06\xa6\xcb\x7d\x08\x13\x11\x00\x30\x81\xde\xbe\xde\x6b\x23\
-\xd2\x96\xd2\x3b\x98\xb2\x3b\x0e\xea\xeb\xf5\xec\x7f\x98\x80\x00\
-\x80\x09\xdc\xb2\x64\xcd\xce\x48\x71\x49\xe9\x1d\x4c\x4d\x8e\xfc\
-\xfe\x5b\x96\xac\xd9\x59\x7a\x07\x74\x2b\x01\x00\xfb\x91\xb6\xee\
-\xfa\xeb\x88\xb8\xab\xf4\x0e\x0e\x54\xda\xd2\x78\x60\xcc\xb3\xff\
-\x61\x3f\x04\x00\xec\xc7\x86\xb7\xde\xb0\x23\x47\x7c\xa8\xf4\x0e\
-\x0e\x4c\x8a\xd6\x07\x36\xbc\xf5\x86\x1d\xa5\x77\x40\x37\x13\x00\
-\xf0\x14\x5a\x63\x0f\x7f\x34\x72\xdc\x5d\x7a\x07\x93\x76\xcf\xf6\
-\xbe\x83\x3e\x5e\x7a\x04\x74\x3b\x01\x00\x4f\x61\xf3\x8a\xf5\xdb\
-\xa3\x91\xde\x5f\x7a\x07\x93\x93\x23\xbf\x77\xcb\x92\x35\xdb\x4a\
-\xef\x80\x6e\x27\x00\x60\x12\x46\x7a\x7b\xff\x32\x52\xf2\x5b\x02\
-\xbb\xdf\x37\x36\xf6\x1d\xf4\xd7\xa5\x47\xc0\x6c\x20\x00\x60\x32\
-\x96\xac\x19\x8b\xb1\xb1\x37\x46\xc4\x58\xe9\x29\x4c\x68\x2c\xe5\
-\xf4\xc6\x58\xb2\xc6\x7d\x04\x93\x20\x00\x60\x92\x46\x96\x5f\x77\
-\x73\x44\xfc\x45\xe9\x1d\xec\x5b\x4e\xe9\x4f\x37\x2c\x5b\xfb\xcd\
-\xd2\x3b\x60\xb6\x10\x00\x70\x00\x7a\x76\xa5\xdf\x0f\x2f\x0b\xec\
-\x46\x77\x1e\xd4\xdb\xfb\x7f\x4a\x8f\x80\xd9\x44\x00\xc0\x01\xb8\
-\xf5\xbf\xad\x7d\x38\xa5\xf4\x9b\x11\x91\x4b\x6f\xe1\x71\x39\x47\
-\x7e\xd3\x2d\x4b\xd6\x3c\x52\x7a\x08\xcc\x26\x02\x00\x0e\xd0\x86\
-\xa5\x6b\xd7\x46\xc4\x47\x4a\xef\xe0\x51\x29\xe2\x92\x8d\x43\xeb\
-\xae\x2f\xbd\x03\x66\x1b\x01\x00\x53\x70\xc2\x09\x0f\xbf\x2b\x22\
-\x7d\xb1\xf4\x0e\xe2\x1f\x8f\x3f\xe1\xe1\x77\x97\x1e\x01\xb3\x51\
-\x2a\x3d\x00\x66\xab\x13\x2f\x3b\xfb\x98\x66\xb3\xf9\xcd\x88\x38\
-\xa6\xf4\x96\x4a\xfd\xa0\x67\x5e\x7a\xe1\xad\xaf\x5b\xeb\x4d\x9a\
-\x60\x0a\x5c\x01\x80\x29\x1a\xff\x3d\xf3\x17\x86\x97\x06\x96\xd0\
-\x6a\xa5\x74\x91\x93\x3f\x4c\x9d\x00\x80\x69\x18\x19\x1a\xfe\x7c\
-\x4e\xe9\xb7\x4b\xef\xa8\xd0\xef\x6c\x5a\xba\xf6\x73\xa5\x47\xc0\
-\x6c\xd6\x2c\x3d\x00\x66\xbb\xad\x57\xdf\xfa\xcf\x87\x9f\x77\x4a\
-\x4e\x11\x67\x96\xde\x52\x83\x94\xe2\xf7\x47\x86\x86\xfd\x82\x26\
-\x98\x26\x01\x00\x33\x60\xeb\xd5\xb7\xfd\xe3\xe1\xaf\x79\xee\x21\
-\x29\xe2\xa5\xa5\xb7\xcc\x69\x39\xff\xf9\xc8\xd0\xba\xff\x55\x7a\
-\x06\xcc\x05\x1e\x02\x80\x19\xb2\xf1\xa2\xb5\xbf\x97\x22\xfb\x2d\
-\x74\x6d\x92\x53\x5c\x31\xb2\xe9\x8c\xb7\x95\xde\x01\x73\x85\x00\
-\x80\x99\x92\x22\x1f\xba\xed\x99\x6f\x8a\xc8\x9f\x2a\x3d\x65\xce\
-\xc9\xf1\xc9\x67\x1d\xff\xf0\x8a\xb8\xf8\xe2\x56\xe9\x29\x30\x57\
-\x78\x19\x20\xcc\xb4\x1c\x69\x60\xd5\xe0\xfb\x73\x8a\x77\x96\x9e\
-\x32\x47\x5c\x3a\xb2\xf1\xf4\xdf\x71\xf2\x87\x99\x25\x00\xa0\x4d\
-\xfa\x57\x2f\x7e\x5b\xca\xf9\x23\xe1\x4a\xdb\x54\xe5\x88\xf4\xae\
-\x91\xa1\xb5\x1f\x2c\x3d\x04\xe6\x22\x01\x00\x6d\xd4\xbf\x7a\xf0\
-\xd7\x52\x8e\x2b\x22\xa2\xaf\xf4\x96\x59\x66\x67\x4e\xb1\x7c\xe3\
-\xd2\xe1\x4f\x96\x1e\x02\x73\x95\x00\x80\x36\x7b\xce\xe5\x8b\xff\
-\x73\xab\x91\xaf\x8c\x88\xe3\x4a\x6f\x99\x1d\xd2\x96\x1c\xf9\x75\
-\x1b\x87\x86\xbf\x54\x7a\x09\xcc\x65\x2e\x4d\x42\x9b\xdd\xbe\x7c\
-\xed\x17\x9a\x3d\xf1\x82\x14\xb1\xae\xf4\x96\x6e\x97\x23\x86\xe7\
-\xe5\xe6\x0b\x9c\xfc\xa1\xfd\x5c\x01\x80\x4e\xc9\x91\xfa\xaf\x58\
-\xfc\xd6\x94\xf3\x07\x23\x62\x7e\xe9\x39\x5d\x66\x34\xe5\xf4\xbe\
-\x0d\x9b\x5e\xf4\x5e\x4f\xf6\x83\xce\x10\x00\xd0\x61\x27\xad\x5c\
-\xf4\x9f\x1a\xa9\xb1\x3a\x22\x9f\x5c\x7a\x4b\x97\xb8\x35\x47\xba\
-\x68\xe3\xd0\xda\x7f\x2e\x3d\x04\x6a\xe2\x21\x00\xe8\xb0\x4d\xcb\
-\xd6\x7d\xfd\xb0\x6d\xc7\x3c\x3f\xa7\xf4\xdf\x23\xe2\x91\xd2\x7b\
-\x0a\xfa\x49\xca\xe9\x3d\xe9\x81\xd1\xd3\x9c\xfc\xa1\xf3\x5c\x01\
-\x80\x82\x4e\x5e\xb9\xe8\xb8\xb1\x94\xde\x1f\x11\x4b\x4b\x6f\xe9\
-\xa4\x14\xb1\x6e\x74\xac\xf9\xdb\x9b\x57\x5c\xb3\xb9\xf4\x16\xa8\
-\x95\x00\x80\x2e\xb0\x60\xe5\xe0\x59\x91\xe2\xc3\x11\xf1\xbc\xd2\
-\x5b\xda\xec\x96\xd4\x8a\xff\xb1\x61\xf9\xf0\x8d\xa5\x87\x40\xed\
-\x3c\x04\x00\x5d\x60\x64\xd9\xf0\x0d\x23\x1b\x4f\x7f\x7e\x8a\xbc\
-\x38\x45\x7c\xbd\xf4\x9e\x99\x96\x22\xbe\x1d\x29\x2f\x1b\xe9\xeb\
-\x3b\xcd\xc9\x1f\xba\x83\x2b\x00\xd0\x85\xfa\x57\x0d\xbe\x22\xe5\
-\xb8\x38\x52\xfc\x42\xe9\x2d\xd3\x92\xe2\xcb\x29\xe7\x4b\x36\x2c\
-\x5d\xb7\x2e\x52\xe4\xd2\x73\x80\xdd\x04\x00\x74\xb1\x05\x97\x2f\
-\x7e\x79\x6e\xe4\x15\x29\xe2\xbf\x46\xc4\xa1\xa5\xf7\x4c\xd2\x03\
-\x11\x79\x4d\xa4\xe6\xe5\x23\x4b\xaf\xfd\x4a\xe9\x31\xc0\xbe\x09\
-\x00\x98\x05\x06\x2e\x3d\xab\x37\x0e\x6b\xfe\x72\x8e\xb4\x34\x22\
-\xce\x8d\x88\x79\xa5\x37\xed\x65\x2c\x22\xdf\x14\x29\x56\x3f\x3d\
-\xef\xfc\xf4\x77\x86\x6e\xfc\x8f\xd2\x83\x80\xfd\x13\x00\x30\xcb\
-\x2c\x58\x75\xde\x4f\x45\xec\x7a\x75\x44\xfa\xd5\x88\xf8\xc5\x88\
-\x38\xa4\xd0\x94\x07\x53\xc4\x3f\x44\x8a\xcf\xc4\xae\xd1\x6b\x37\
-\xbc\xfe\x86\x1f\x16\xda\x01\x4c\x81\x00\x80\x59\x6c\xe1\x4d\x0b\
-\x7b\xb6\xdc\x75\xf0\x19\x31\x96\x5f\x96\x1b\x8d\x57\x44\xce\x2f\
-\x8a\x88\x67\xb7\xe9\xe6\x36\x47\xc4\xbf\xa4\x88\x2f\xa5\x68\x7c\
-\xe5\xb8\x13\x1e\xbc\x79\xfd\x99\xeb\x47\xdb\x74\x5b\x40\x9b\x09\
-\x00\x98\x63\xfa\xaf\x3a\xff\xd0\xd8\xbe\xfd\x67\x23\xe5\xe7\xa4\
-\x48\x27\x45\x8e\x13\x23\xf2\xb1\x39\x35\x8e\x4a\x39\x8e\x8a\xc8\
-\x4f\x8f\x88\x9e\x88\x38\x78\xfc\x5b\x1e\x8e\x88\xd1\x88\x78\x24\
-\xa7\x74\x7f\xca\xad\x1f\x45\xa4\x7b\x52\xc4\xa6\x1c\xb1\x29\x5a\
-\xe9\xf6\xfc\xb4\xde\x7f\xdb\xb8\x64\xcd\x83\xa5\xfe\x9d\x80\x99\
-\xf7\xff\x01\x3b\x40\x82\xa2\xb3\x19\x43\xe6\x00\x00\x00\x00\x49\
-\x45\x4e\x44\xae\x42\x60\x82\
-\x00\x00\x31\x1e\
-\x89\
-\x50\x4e\x47\x0d\x0a\x1a\x0a\x00\x00\x00\x0d\x49\x48\x44\x52\x00\
-\x00\x02\x00\x00\x00\x02\x00\x08\x06\x00\x00\x00\xf4\x78\xd4\xfa\
-\x00\x00\x00\x04\x73\x42\x49\x54\x08\x08\x08\x08\x7c\x08\x64\x88\
-\x00\x00\x00\x09\x70\x48\x59\x73\x00\x00\x0e\xc4\x00\x00\x0e\xc4\
-\x01\x95\x2b\x0e\x1b\x00\x00\x00\x19\x74\x45\x58\x74\x53\x6f\x66\
-\x74\x77\x61\x72\x65\x00\x77\x77\x77\x2e\x69\x6e\x6b\x73\x63\x61\
-\x70\x65\x2e\x6f\x72\x67\x9b\xee\x3c\x1a\x00\x00\x20\x00\x49\x44\
-\x41\x54\x78\x9c\xed\xdd\x69\x94\x5e\x57\x7d\xe7\xfb\xdf\x3e\xcf\
-\x58\xf3\xa8\xb1\x34\x1a\xd9\x06\x3c\x41\x62\xc0\x2e\xc9\x72\x4a\
-\xb2\x91\x71\x47\x96\x6c\x87\x0a\xc9\xa5\xe9\xee\xac\x10\xd2\x0d\
-\x61\xc8\x0a\xdd\xc9\x65\xe5\x46\x21\x2b\xdc\x4e\xe8\x26\x17\xe8\
-\xa6\x43\x08\xb9\x7d\x33\xf6\x2a\x62\x0d\x16\x51\xec\x58\x52\x61\
-\x6b\xb0\x21\xa6\x03\x18\x8c\xb1\x91\x35\x0f\xa5\x1a\x54\x73\xd5\
-\x33\x9d\x7d\x5f\xc8\x26\x6e\xb7\x07\xc9\x3a\xfb\xec\xf3\x3c\xcf\
-\xf7\xb3\x96\x17\xc3\x8b\xbd\x7f\xb2\x7d\x9e\xfd\x3f\xfb\xec\x41\
-\x02\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\
-\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\
-\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\
-\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\
-\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\
-\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\
-\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\
-\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\
-\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\
-\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\
-\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\
-\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\
-\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\
-\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\
-\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\
-\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\
-\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\
-\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\
-\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\
-\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x40\x6d\x32\xbe\x03\
-\xa0\x76\xed\x3a\x78\xb0\x25\x2c\xa5\xba\x82\x8a\x69\x0d\x83\x52\
-\x46\x92\x8c\x49\x77\x48\x92\x0d\x2b\x99\x40\x41\xb3\xdf\x84\x80\
-\x7f\xa1\xc2\x69\x13\xa4\x4a\x92\x64\x6d\xf9\x82\x24\x05\x61\xa6\
-\x14\xa6\xec\x64\x49\xf3\x23\xfd\x7d\x7d\xd3\x7e\x13\xa2\x56\x51\
-\x00\xe0\xb2\x0d\x3c\x74\xb8\xb3\x21\x63\x56\x85\xa6\xb2\x2a\x34\
-\x66\xb5\xb1\x5a\x29\xab\x25\x32\xa6\x5b\xd6\x76\xc9\xa8\x4b\x52\
-\x97\xa4\x9c\xef\xac\x40\x0d\x28\x48\x1a\x95\xd5\xa8\x8c\x19\x95\
-\xb5\x23\x32\x3a\x6b\xa4\x63\x92\x3d\x16\xd8\xd4\xb1\xb9\x92\x3d\
-\xd6\x7f\x57\xef\x98\xef\xa0\xa8\x2e\x14\x00\x78\x45\xd6\x5a\xb3\
-\x7d\xdf\xc1\xd5\x29\x93\xba\xc9\x1a\x5d\x6f\xac\xbd\x51\xc6\x5e\
-\x23\x99\x55\x92\x5a\xfd\xa6\x03\xf0\x0a\x26\x8c\x74\xcc\x1a\x3d\
-\x6b\xad\x79\x4a\x46\x4f\x85\x95\xca\xf7\xee\xdb\xb8\xee\xa8\x31\
-\xc6\xfa\x0e\x87\xe4\xa1\x00\x80\xac\xb5\x66\xd7\xbe\x03\x6f\x51\
-\x2a\xe8\x35\xd6\xbc\xc3\x4a\x37\x4a\xba\x5e\x12\x53\xf4\x40\xf5\
-\x9b\x92\xd1\xf7\x8d\xd5\x53\xa1\xb1\xdf\xb2\x41\xea\xf0\xbd\xeb\
-\x6f\x79\x86\xa2\x00\x14\x00\x75\xe8\xcb\x4f\x3e\x99\x59\x38\x39\
-\x77\x63\x60\x52\xeb\xac\xec\x5a\x59\xf5\x49\xea\xf6\x9d\x0b\x40\
-\x6c\x26\x25\xfb\x2d\x6b\xcd\x21\x13\x04\x07\x8b\x39\x7b\xa8\xbf\
-\xb7\x77\xce\x77\x28\xc4\x8b\x02\xa0\x4e\x3c\xb0\xf7\xc0\x55\x41\
-\x90\xba\x23\xb0\x76\xb3\x35\xba\x53\x7c\x9f\x07\xf0\xcf\xca\x92\
-\xfd\xa6\x8c\xd9\x6d\x6d\xb8\x77\x6b\xdf\xba\xff\xc9\x0c\x41\xed\
-\xa3\x00\xa8\x51\x03\x83\x83\xcd\x19\xe5\xee\x30\x36\xbc\x4b\x32\
-\xef\x91\xb4\xc2\x77\x26\x00\x55\xe3\x98\x8c\x79\x28\xb0\xf6\xa1\
-\x5c\x69\x7a\xef\xa6\x4d\x9b\x66\x7c\x07\x42\xf4\x28\x00\x6a\xc8\
-\xc0\xe1\xc3\x0d\xd9\xb9\xca\x1d\x32\xc1\x7b\x25\xdd\x2b\xbe\xe1\
-\x03\xb8\x72\xf3\xc6\x6a\xaf\x35\xe6\x6b\x45\x53\xd8\xce\xb6\xc4\
-\xda\x41\x01\x50\xe5\x06\x07\x07\xf3\x13\x61\xfa\xce\x17\x06\xfd\
-\xad\x92\x5a\x7c\x67\x02\x50\xb3\xe6\x8c\xd5\x3e\x6b\xcc\xd7\x1a\
-\x4a\x53\x0f\x30\x33\x50\xdd\x28\x00\xaa\xd4\x83\x7b\x0f\xbd\x23\
-\x0c\xf4\x41\x49\xef\x13\x83\x3e\x80\xf8\x4d\x4a\xf6\x6f\xac\xec\
-\x57\xee\xdd\x70\xdb\xb7\x7d\x87\xc1\xe5\xa3\x00\xa8\x22\x7b\xf6\
-\x3c\xd1\x5a\xc8\x87\xef\x93\xec\x87\x8c\xf4\x53\xbe\xf3\x00\xc0\
-\x45\xe6\x69\x19\xfb\xe7\x61\x25\xfd\xa7\xf7\xdd\xf1\xae\x51\xdf\
-\x69\x70\x69\x28\x00\xaa\xc0\xae\xc1\x83\x37\x87\x36\xf8\x88\x91\
-\x7d\xaf\xa4\x46\xdf\x79\x00\xe0\x55\xcc\xca\x6a\xc0\x9a\xf0\xbf\
-\x30\x2b\x90\x7c\x14\x00\x09\x65\xad\x35\xbb\xbe\xf1\xc4\x46\x13\
-\x86\x1f\xb3\x46\x3f\xeb\x3b\x0f\x00\x5c\x1e\x7b\xc8\xd8\xe0\xf3\
-\x85\xd1\x53\xdb\xfb\xfb\xfb\x2b\xbe\xd3\xe0\x7f\x47\x01\x90\x30\
-\x7b\xf6\xec\xc9\x15\xf3\xed\x3f\x2f\xe9\x3f\x48\xf6\xad\xbe\xf3\
-\x00\xc0\x15\xfa\xb1\x31\xe6\xbf\x14\x72\xfa\x13\x0e\x1b\x4a\x16\
-\x0a\x80\x84\x18\x18\x1c\x6c\xce\xd9\xcc\xaf\x59\x99\x8f\x4b\x5a\
-\xe8\x3b\x0f\x00\x44\x6c\xc8\x4a\x9f\x6b\x2c\x4d\xff\x57\x76\x0f\
-\x24\x03\x05\x80\x67\x03\x03\x3f\xc8\x66\xba\x27\xfe\xb5\x51\xf8\
-\xbb\x92\x59\xec\x3b\x0f\x00\x38\x36\x22\xa3\xff\x54\xcc\x99\x2f\
-\x30\x23\xe0\x17\x05\x80\x27\xff\x3c\xf0\xdb\xdf\x91\xb4\xd4\x77\
-\x1e\x00\x88\xd9\x79\x19\x7d\xae\x4d\xc5\xcf\xf7\xf5\xf5\xcd\xfb\
-\x0e\x53\x8f\x28\x00\x62\xb6\x6d\x9b\x0d\x6e\xba\xfd\xf0\x07\x8c\
-\xd5\xa7\x25\x2d\xf7\x9d\x07\x00\x3c\x3b\x6e\xad\x7e\x7b\xeb\x86\
-\xde\xbf\xe4\xfe\x81\x78\x51\x00\xc4\xe8\xc1\xbd\x87\xde\x11\xa6\
-\xf4\x79\x59\xdd\xea\x3b\x0b\x00\x24\x8b\xf9\x76\x68\xc2\x8f\xdf\
-\xd7\xb7\xee\xa0\xef\x24\xf5\x82\x02\x20\x06\xbb\xf7\x1d\xee\xa9\
-\x18\xfb\x7f\x4b\x7a\xbf\xf8\x7b\x0e\x00\xaf\xc6\xca\xe8\x6f\x2b\
-\xa1\x3e\x79\xff\xc6\xb5\xc7\x7d\x87\xa9\x75\x0c\x46\x0e\x0d\x1c\
-\x3e\xdc\x90\x99\xb3\xff\xc1\x18\x7d\x52\x1c\xe0\x03\x00\x97\xc8\
-\xce\x58\x05\x7f\xd0\x6e\x0a\x9f\x65\x7d\x80\x3b\x14\x00\x8e\x6c\
-\x1f\x3c\xb8\x2e\xb0\xe6\x2b\x92\xde\xec\x3b\x0b\x00\x54\xa9\x23\
-\x81\xd5\xaf\xdc\xb3\x71\xed\x7e\xdf\x41\x6a\x11\x05\x40\xc4\x06\
-\x1e\x79\xb2\x2d\x9b\x2a\x7c\x5a\xd2\x47\x24\x05\xbe\xf3\xc4\x21\
-\x93\x4e\x2b\x97\xcb\x28\x9f\xcd\x28\x9b\xce\x28\x9d\x4e\x2b\x93\
-\x4e\x29\x9d\x4a\x29\x9b\x4e\x2b\x9d\x4e\x2b\x15\x18\xc9\x48\xe9\
-\x54\x4a\x92\x14\x18\xa3\x20\xb8\xf8\xb7\x27\x0c\x43\x85\xf6\xe2\
-\xda\x9f\x72\xa5\x22\x59\xa9\x12\x5a\x95\xcb\x65\x15\xcb\x65\x95\
-\x2b\x15\x95\xca\x95\x17\xfe\x77\x49\xf3\xc5\x92\x0a\x85\x92\x4a\
-\xe5\xb2\xb7\x3f\x33\x80\xd8\x58\x49\x7f\x59\x2c\x9a\x8f\xf7\xdf\
-\xd5\x3b\xe6\x3b\x4c\x2d\xa1\x00\x88\xd0\xce\x7d\x07\x36\xcb\x04\
-\x5f\x92\xb4\xcc\x77\x96\xa8\x05\x81\x51\x43\x2e\xa7\xc6\x7c\x5e\
-\x4d\x0d\x39\x35\xe6\x73\xca\xe5\xb2\x6a\xc8\x66\x7f\x32\x90\xc7\
-\xad\x12\x86\x9a\x2f\x16\x55\x28\x14\x35\x3b\x5f\xd0\xcc\x5c\x41\
-\xb3\xf3\x73\x9a\x9b\x2f\xfe\xa4\xa0\x00\x50\x2b\xec\x39\x19\xf3\
-\x6b\x5b\xfb\xd6\xfe\xad\xef\x24\xb5\x82\x02\x20\x02\xdb\xf7\x7e\
-\xb3\x2b\x30\xe5\x3f\x96\xd1\xcf\xf9\xce\x12\x05\x63\x8c\x1a\xf3\
-\x39\xb5\x36\x37\xa9\xb5\xa9\x41\x8d\x0d\x79\x35\xe4\x72\x0a\x4c\
-\x75\xfc\xeb\x12\x5a\xab\xb9\xf9\xa2\x66\xe6\xe7\x34\x35\x3d\xab\
-\xc9\x99\x59\xcd\xce\x17\x64\x29\x0a\x80\xaa\x67\x64\x06\x0a\x45\
-\xfd\x5b\x66\x03\xae\x5c\x75\xfc\xa2\x27\xd8\x83\xfb\x0e\x6d\x08\
-\x8d\xfe\x5c\x52\x8f\xef\x2c\x6f\x94\x09\x02\xb5\x35\x35\xbc\x30\
-\xe0\x37\xa9\xa5\xa9\x41\x29\x4f\x6f\xf5\xae\x54\xc2\xf0\x27\xc5\
-\xc0\xc4\xcc\x8c\xa6\x66\x66\x15\x86\x14\x04\x40\x75\xb2\xe7\x8c\
-\x09\xfe\xcd\x96\xbe\xde\x87\x7c\x27\xa9\x66\x14\x00\x6f\xd0\x97\
-\x9f\x7c\x32\xb3\x70\xa2\xf0\x29\x63\xf4\xdb\xaa\xc2\x6f\xfd\xf9\
-\x6c\x46\xed\xad\xcd\x6a\x6f\x6e\x51\x47\x6b\xb3\x52\xa9\xaa\xfb\
-\x23\x5c\x91\x30\xb4\x9a\x9c\x99\xd5\xd8\xc4\xa4\xc6\x26\x26\x35\
-\x5f\x2c\xf9\x8e\x04\xe0\xf2\x58\x49\x5f\xcc\xce\x4f\xfc\xfb\xbb\
-\xef\xbe\xbb\xe0\x3b\x4c\x35\xa2\x00\x78\x03\xb6\x3f\xfa\xf8\x5b\
-\x82\x72\xf8\x57\x32\x7a\xbb\xef\x2c\x97\xa3\xa9\x21\xaf\x05\x1d\
-\x6d\xea\x6a\x6f\x55\x43\x2e\xe7\x3b\x4e\xa2\xcc\x16\x0a\x1a\x1d\
-\x9f\xd4\xc8\x85\x71\xcd\xcc\xf1\x5b\x02\x54\x91\xef\x2b\x65\x7e\
-\x71\xeb\xed\xbd\x4f\xf9\x0e\x52\x6d\x28\x00\x2e\xd3\x8e\xc1\x43\
-\xff\xda\x58\x7d\x49\x52\x83\xef\x2c\x97\xa2\x31\x9f\x57\x77\x47\
-\xab\x16\x74\xb4\x31\xe8\x5f\xa2\xf9\x62\x51\x63\x13\x53\x3a\x3f\
-\x36\xae\xe9\x59\xee\x2a\x01\xaa\xc0\xac\xb5\xfa\xd5\x7b\x37\xae\
-\xfd\x0b\xdf\x41\xaa\x09\x05\xc0\x25\xda\xb3\x67\x4f\xae\x98\x6f\
-\xfb\x43\x49\x1f\xf5\x9d\xe5\xf5\xa4\x53\x29\x2d\xec\x6c\xd7\xa2\
-\xee\x0e\x35\xe5\xf3\xbe\xe3\x54\xb5\xe9\xb9\x79\x0d\x8d\x5e\xd0\
-\xf0\xd8\xf8\xc5\x2d\x8a\x00\x12\xcb\x48\x7f\x52\x18\x69\xff\xb5\
-\xfe\xfe\xeb\x8a\xbe\xb3\x54\x03\x0a\x80\x4b\xb0\x7b\xdf\xe1\x9e\
-\x4a\x60\xbf\x96\xf4\x33\xfc\x9b\x1b\x1b\xb4\xb8\xab\x53\x0b\x3b\
-\xdb\x15\x04\xfc\xa3\x8d\x92\x0d\x43\x8d\x4e\x4c\xeb\xdc\xe8\xa8\
-\xc6\xa7\xb8\xca\x1c\x48\xb0\x27\x53\x15\x7b\xff\xe6\x3b\xd7\x9d\
-\xf0\x1d\x24\xe9\x18\x25\x5e\xc7\xce\xbd\x07\x6f\x53\xa0\x01\xc9\
-\x2c\xf6\x9d\xe5\x95\x04\x26\xd0\xc2\xae\x76\xf5\x2c\xe8\x52\x43\
-\x9e\x29\xfe\x38\xcc\x15\x0a\x3a\x7d\x7e\x44\xe7\x47\x27\x14\xda\
-\xd0\x77\x1c\x00\x2f\x63\xa4\xe1\x50\xe6\x17\xee\xdd\xd0\xbb\xcf\
-\x77\x96\x24\xa3\x00\x78\x0d\xbb\xf6\x1d\xfc\x88\x35\xe6\x8f\x24\
-\xa5\x7d\x67\x79\xb9\x4c\x3a\xad\x25\x0b\x3a\xb5\xa4\xbb\x53\x99\
-\x74\xe2\xe2\xd5\x85\x52\xb9\xac\xa1\xd1\x71\x9d\x19\x1e\x55\xb1\
-\xc4\x2e\x02\x20\x61\xca\xd6\xea\xa3\xf7\x6e\x5c\xfb\xdf\x7c\x07\
-\x49\x2a\x0a\x80\x57\x60\xad\x35\x3b\xf7\x1f\xfe\x1d\x63\xf4\x3b\
-\xbe\xb3\xbc\x5c\x3e\x97\xd5\xf2\x85\x0b\xb4\xb0\xb3\x4d\xa6\xc6\
-\xf6\xea\x57\xab\xd0\x86\x3a\x3f\x3a\xae\x53\x43\xc3\x6c\x27\x04\
-\x92\xe7\x0b\xdf\x79\xac\xf7\x13\xdb\xb6\x19\xa6\xeb\x5e\x86\x02\
-\xe0\x65\x06\x07\x07\xf3\x13\x36\xfb\xdf\x25\xfd\xbc\xef\x2c\x2f\
-\x95\xcb\x64\xd4\xb3\xa8\x5b\x4b\xba\x3a\x18\xf8\x13\x2a\xb4\x56\
-\x23\x17\x26\x74\xe2\xec\x79\xcd\x17\x59\x83\x04\x24\x86\xb1\x3b\
-\x52\xd3\xf9\xf7\x6f\xde\x7c\xf3\xac\xef\x28\x49\x42\x01\xf0\x12\
-\xdb\xf7\x7e\xb3\x2b\x08\x4a\xbb\x24\xb3\xd6\x77\x96\x17\x65\x32\
-\x69\xf5\x2c\xe8\x56\xcf\x82\x4e\x06\xfe\x2a\x11\x86\x56\xe7\xc7\
-\xc6\x75\xe2\xdc\x79\x3e\x0d\x00\xc9\xf1\x2d\x13\xa6\xee\xd9\x72\
-\xc7\x2d\x43\xbe\x83\x24\x05\x05\xc0\x0b\x76\xed\x3f\x78\xad\x55\
-\xf0\xf7\x92\x5d\xed\x3b\x8b\x24\xa5\x82\x40\xcb\x16\x2f\x50\xcf\
-\xc2\x2e\x05\x86\x81\xbf\x1a\x85\xa1\xd5\xa9\xf3\x23\x3a\x35\x74\
-\x9e\x63\x87\x81\x04\x30\xd2\xf3\x95\x30\x7c\xcf\x7d\x77\xdc\xf6\
-\xac\xef\x2c\x49\x40\x01\x20\xe9\xc1\xfd\x07\xaf\x0b\x65\x1e\x91\
-\xb4\xc4\x77\x16\x49\xea\xee\x68\xd5\xea\xa5\x4b\x94\xcb\x66\x7c\
-\x47\x41\x04\x8a\xa5\x92\x4e\x9c\x3b\xaf\xa1\xd1\x0b\xe2\x3e\x22\
-\xc0\xbb\xf3\xa1\xc2\x77\xdf\xb7\xe1\xb6\xef\xfa\x0e\xe2\x5b\xdd\
-\x17\x00\x3b\xf6\x1f\xf8\x69\xa3\xe0\x61\x49\x5d\xbe\xb3\x34\x37\
-\x35\xe8\xaa\x9e\x25\x6a\x6d\x6a\xf4\x1d\x05\x0e\x4c\xcf\xce\xe9\
-\xf9\x53\x67\x35\x39\xc3\x67\x48\xc0\xb3\xf1\xc0\xd8\xf7\xdc\xd3\
-\xb7\xee\x09\xdf\x41\x7c\xaa\xeb\x02\xe0\xe2\x1e\x7f\xf3\x75\x49\
-\xad\x3e\x73\xa4\x53\x81\x56\x2c\x59\xa4\x25\xdd\x5d\xaa\x92\x1b\
-\x77\x71\x05\xce\x8f\x8d\xeb\xe8\xe9\xb3\x2a\x95\x39\x59\x10\xf0\
-\x68\x3a\xb0\xda\x72\xcf\xc6\xb5\xfb\x7d\x07\xf1\xa5\x6e\x87\x9b\
-\x5d\x7b\x0f\xf6\xd9\xc0\x3c\x28\xa9\xd9\x67\x8e\xce\xb6\x56\xbd\
-\x69\xf9\x52\xe5\x32\xec\xe5\xaf\x27\xc5\x72\x49\xcf\x9f\x3c\xab\
-\x91\xf1\x49\xdf\x51\x80\x7a\x36\x2b\x99\xfb\xb6\x6e\xe8\x7d\xd8\
-\x77\x10\x1f\xea\xb2\x00\xd8\xb9\xff\xe0\xdd\x92\xd9\x2e\xc9\xdb\
-\xd1\x79\x99\x74\x5a\xab\x7b\x16\x6b\x61\x67\xbb\xaf\x08\x48\x80\
-\xb1\xc9\x29\x1d\x39\x71\x5a\x85\x52\xd9\x77\x14\xa0\x5e\x15\xac\
-\xb5\xf7\xde\xbb\x71\xdd\xdf\xfb\x0e\x12\xb7\xba\x2b\x00\x76\xed\
-\x7f\x7c\xad\x55\xe5\x61\xc9\x34\xf9\xca\xd0\xdd\xde\xaa\x37\x2d\
-\xef\x51\x26\x9d\xf2\x15\x01\x09\x52\xae\x84\x3a\x72\xf2\xb4\x86\
-\x2f\x4c\xf8\x8e\x02\xd4\xab\x39\x13\xda\x7f\xb1\xe5\x8e\x75\x83\
-\xbe\x83\xc4\xa9\xae\x0a\x80\x07\x07\x0f\xde\x12\x5a\xf3\x0f\x92\
-\x5a\x7c\xf4\x9f\x0a\x02\xad\xee\x59\xa2\xc5\xdd\x1d\x3e\xba\x47\
-\xc2\x9d\x1f\x1b\xd7\x91\x93\x67\x54\x09\x39\xb0\x0c\xf0\x60\x36\
-\x34\x76\xd3\x7d\x7d\xeb\x0e\xfa\x0e\x12\x97\xba\x29\x00\xb6\xef\
-\x3f\x70\x53\xa0\x60\xbf\xa4\x4e\x1f\xfd\xb7\x34\x35\xe8\xda\x95\
-\xcb\x95\xcf\x65\x7d\x74\x8f\x2a\x31\x5f\x2c\xe9\xd9\x63\x27\xd9\
-\x29\x00\xf8\x31\x61\x15\x6e\xbc\x77\xc3\x6d\xdf\xf6\x1d\x24\x0e\
-\x75\x51\x00\x5c\x3c\xe4\xc7\x3c\x2a\x69\x91\x8f\xfe\x97\x2d\xea\
-\xd6\xca\x25\x8b\x64\x58\xe2\x8f\x4b\x10\x5a\xab\xe3\x67\x87\x74\
-\x7a\x68\xc4\x77\x14\xa0\xee\x18\x69\xd8\x86\x95\x9f\xd9\x7a\xc7\
-\xfa\xa7\x7d\x67\x71\xad\xe6\x47\xa4\x07\x06\x9f\x58\x96\xb2\x95\
-\x27\x24\xf5\xc4\xdd\x77\x2a\x08\x74\xf5\xca\x65\xea\x6e\xf7\xba\
-\xcb\x10\x55\x6a\x6c\x62\x52\xcf\x1e\x3f\xa5\x72\x85\x4f\x02\x40\
-\xcc\x4e\xa6\xac\xb9\x75\xf3\xc6\xde\xd3\xbe\x83\xb8\x54\xd3\x05\
-\xc0\xae\x83\x07\x5b\x6c\xd1\x3c\x26\xe9\x6d\x71\xf7\xdd\x90\xcf\
-\xe9\x2d\xab\x97\xab\x31\x9f\x8f\xbb\x6b\xd4\x90\xb9\xf9\x82\x7e\
-\x78\xf4\xa4\x66\xe7\xe7\x7d\x47\x01\xea\xcd\xf7\x8b\x95\xdc\xba\
-\xfe\x3b\x6f\xae\xd9\xd5\xb9\x35\x7b\xc8\xfc\xc0\xc0\x40\xca\x96\
-\x82\xbf\x92\x87\xc1\xbf\xbb\xbd\x55\x6f\xbb\xf6\x4d\x0c\xfe\xb8\
-\x62\x0d\xf9\x9c\x6e\xba\xe6\x2a\x75\x31\x8b\x04\xc4\xed\xfa\x5c\
-\xba\xf8\x37\x83\x83\x83\x35\x7b\x48\x4b\xcd\x16\x00\xd9\xee\x9e\
-\x2f\xc8\xda\xcd\x71\xf7\xbb\x74\x41\x97\xae\x5d\xb5\x42\x29\x6e\
-\xee\x43\x44\x52\xa9\x40\x6f\x59\xbd\x42\x2b\x96\x2c\xf4\x1d\x05\
-\xa8\x2b\xd6\xda\xf7\x4c\x84\xd9\xff\xe6\x3b\x87\x2b\x35\xf9\x09\
-\x60\xd7\xfe\x83\xbf\x65\x65\x3e\x13\x67\x9f\xc6\x18\x5d\xb5\x6c\
-\x89\x96\x74\x7b\xd9\x64\x80\x3a\x71\x6e\x74\x4c\xcf\x9f\x3c\xab\
-\x90\x5b\x85\x80\xd8\x18\xd9\x7f\xbf\x65\xc3\xba\xcf\xfa\xce\x11\
-\xb5\x9a\x2b\x00\x1e\xdc\x7f\x68\x4b\x28\xed\x50\x8c\x7f\xb6\x54\
-\x10\xe8\xcd\xab\x97\xab\xa3\xd5\xcb\xf1\x02\xa8\x33\xe3\x93\xd3\
-\xfa\xe1\xb1\x13\xaa\xb0\x38\x10\x88\x4b\x28\x1b\x6e\xdd\xba\xf1\
-\xb6\xdd\xbe\x83\x44\xa9\xa6\x0a\x80\xdd\x8f\x3e\x71\x75\xa5\x52\
-\xf9\x47\x49\x6d\x71\xf5\x99\x4d\x67\x74\xdd\x9a\x55\x6a\x6a\xf0\
-\x76\xaa\x30\xea\xd0\xcc\xdc\xbc\xbe\xff\xe3\x63\x2a\x95\x39\x42\
-\x18\x88\xc9\x54\xca\x98\x77\x6e\xee\xeb\x7d\xc6\x77\x90\xa8\xd4\
-\xcc\x87\xea\x81\xc1\xc1\xe6\x4a\xa5\xb2\x43\x31\x0e\xfe\xb9\x6c\
-\x46\x37\x5e\xb3\x9a\xc1\x1f\xb1\x6b\x6a\xc8\xeb\xa6\x6b\xaf\x52\
-\x3e\xcb\xc1\x52\x40\x4c\x5a\x2a\xa1\x1d\x78\xf8\xe1\x87\xbd\x1d\
-\x23\x1f\xb5\x9a\x29\x00\x72\x36\xf7\x55\x49\xd7\xc5\xd5\x5f\x3e\
-\x9b\xd5\x0d\x6b\x56\x73\xb2\x1f\xbc\xc9\x67\xb3\xba\xe1\x6a\xfe\
-\x1d\x04\x62\x63\x74\xc3\x5c\xba\xf9\x4f\x7d\xc7\x88\x4a\x4d\x14\
-\x00\x3b\xf7\x1d\xfe\x0d\x2b\xdb\x1f\x57\x7f\x0d\xb9\x9c\x6e\xbc\
-\x86\x1f\x5e\xf8\x97\xcb\x66\x74\xd3\x35\x57\xa9\x89\x2d\xa7\x40\
-\x3c\x8c\xde\xb7\x63\xdf\xe1\x8f\xfb\x8e\x11\x85\xaa\x5f\x03\xb0\
-\x7d\xf0\xe0\xba\xc0\x9a\x41\x49\xb1\xec\xd5\x6c\xca\xe7\x75\xfd\
-\xd5\xab\x94\x49\xd7\xec\xd6\x50\x54\xa1\x52\xb9\xac\xef\x3f\x77\
-\x4c\x33\x1c\x18\x04\xc4\xa1\x24\x6b\x7e\x66\xeb\xc6\xde\xc3\xbe\
-\x83\x5c\x89\xaa\x9e\x01\x18\x78\xe4\xc9\xb6\xc0\x9a\xbf\x50\x4c\
-\x83\x7f\x3e\x97\xd5\x75\x57\xaf\x64\xf0\x47\xe2\x64\xd2\x69\x5d\
-\xbf\x66\x95\x1a\x72\xac\x47\x01\x62\x90\x91\xd1\x5f\xee\xd9\xf3\
-\x44\x55\x9f\xd0\x55\xd5\x05\x40\x36\x35\xff\x25\x49\xab\xe2\xe8\
-\x2b\x97\xc9\xe8\xfa\x35\xab\x95\x4d\x67\xe2\xe8\x0e\xb8\x6c\x99\
-\x4c\x5a\xd7\x5f\xbd\x5a\xf9\x2c\xff\x8e\x02\xee\xd9\xd5\xc5\x7c\
-\xf9\x8b\xbe\x53\x5c\x89\xaa\x2d\x00\x76\x0c\x1e\x7a\xbf\x64\x7e\
-\x31\x8e\xbe\x32\x99\x8b\x6f\x57\xfc\xb0\x22\xe9\x72\x99\xf4\xc5\
-\x42\x35\xc3\xbf\xab\x80\x7b\xe6\x03\x3b\xf6\x1d\xfe\x05\xdf\x29\
-\xde\xa8\xaa\x5c\x03\xb0\xf3\xd1\x47\x97\xab\x92\xfe\xae\xa4\x0e\
-\xd7\x7d\x65\xd2\x29\xdd\x70\xcd\x55\x6a\x64\x6a\x15\x55\x64\x66\
-\x7e\x5e\x4f\x3d\x7b\x54\xe5\x4a\xc5\x77\x14\xa0\xd6\x4d\x54\xac\
-\x6e\xba\x7f\xe3\xda\xe3\xbe\x83\x5c\xae\xaa\x9b\x01\x18\x18\x18\
-\x48\x99\x4a\xfa\xaf\x15\xc3\xe0\x1f\x04\x46\x6f\x5e\xb5\x82\xc1\
-\x1f\x55\xa7\x29\x9f\xd7\x5b\xaf\x5a\x21\xc3\x9d\x14\x80\x6b\x6d\
-\x29\xa3\x3f\xdf\xb6\xcd\x56\xdd\xc3\x56\x75\x81\xb3\xdd\x4b\x3f\
-\x6a\xa5\x75\x71\xf4\xb5\x66\x79\x8f\xda\x5a\x6a\xe6\xcc\x07\xd4\
-\x99\xd6\xe6\x26\x5d\xbb\xb2\xc7\x77\x0c\xa0\x1e\xac\x7f\xdb\xfa\
-\xc3\x1f\xf1\x1d\xe2\x72\x55\xd5\x27\x80\x07\xf6\x1d\x5a\x99\x32\
-\xfa\xbe\xa4\x66\xd7\x7d\xad\x5c\xb2\x48\xcb\x17\x2f\x70\xdd\x0d\
-\xe0\xdc\x89\x73\xe7\x75\xe2\xec\x79\xdf\x31\x80\x1a\x67\x67\x82\
-\x54\xe5\x86\x7b\x6e\xbf\xfd\xa8\xef\x24\x97\xaa\xaa\x66\x00\x52\
-\x46\x5f\x56\x0c\x83\xff\xa2\xae\x0e\x06\x7f\xd4\x8c\x15\x8b\x17\
-\x6a\x61\x67\xbb\xef\x18\x40\x8d\x33\x4d\x36\xcc\xfc\x57\xdf\x29\
-\x2e\x47\xd5\x14\x00\x3b\xf7\x1f\xfe\x80\xa4\x4d\xae\xfb\x69\x69\
-\x6a\xd0\x9a\x65\x4b\x5c\x77\x03\xc4\xea\xea\xe5\x4b\xd5\xdc\xd4\
-\xe0\x3b\x06\x50\xd3\xac\xb5\xef\xd9\xb9\xff\x70\x2c\xbb\xd3\xa2\
-\x50\x15\x9f\x00\x76\x0f\x0e\x76\x87\x36\xfb\xb4\x95\x9c\xbe\x96\
-\x67\xd2\x29\xdd\x74\xed\x1a\xb6\xfb\xa1\x26\x15\x8a\x25\x7d\xe7\
-\x47\x47\xb8\x41\x10\x70\x6b\xa4\x98\xae\xbc\xb5\x7f\xfd\xfa\x61\
-\xdf\x41\x5e\x4f\x55\xcc\x00\x94\xc3\xec\x1f\xb9\x1e\xfc\x8d\x31\
-\xba\x66\xe5\x72\x06\x7f\xd4\xac\x5c\x36\xa3\x6b\x57\x2d\x97\x31\
-\x55\x51\xf7\x03\xd5\xaa\x3b\x5b\x4a\xfd\xa1\xef\x10\x97\x22\xf1\
-\xbf\x04\xdb\xf7\x1e\xba\x35\x08\x74\x48\x8e\xb3\xae\x5e\xba\x58\
-\x3d\x8b\xba\x5d\x76\x01\x24\xc2\xa9\xa1\x11\x1d\x3b\x73\xce\x77\
-\x0c\xa0\x96\x59\x6b\xcd\x2d\xf7\x6e\xec\xfd\x96\xef\x20\xaf\x25\
-\xd1\x33\x00\xd6\x5a\x13\x04\xfa\x7f\xe4\x78\xf0\xef\x6c\x6b\x65\
-\xf0\x47\xdd\x58\xb6\xa8\x5b\x9d\xad\x2d\xbe\x63\x00\xb5\xcc\x18\
-\x63\x3f\x6f\xad\x4d\xf4\x4b\x76\xa2\x0b\x80\x07\xbf\x71\xe8\x03\
-\x92\xde\xe9\xb2\x8f\x4c\x26\xad\xab\x97\x2f\x75\xd9\x05\x90\x38\
-\x57\xaf\xe8\xe1\x52\x2b\xc0\xad\x5b\x76\x0d\x3e\x9e\xe8\x63\x82\
-\x13\x5b\x00\x0c\x0c\x0e\x36\x5b\x6b\x3e\xe3\xba\x9f\x6b\x56\xf4\
-\x28\x93\xe1\x87\x10\xf5\x25\x93\x49\xeb\x9a\x55\xcb\x7c\xc7\x00\
-\x6a\x9c\xfd\xc3\x87\x1f\x7e\x38\xb1\xa7\xc9\x25\xb6\x00\xc8\xda\
-\xec\x6f\x49\x72\xfa\x6a\xbe\x74\x41\x97\x3a\x98\x0a\x45\x9d\xea\
-\x68\x69\xd6\x92\xee\x4e\xdf\x31\x80\x5a\xd6\x33\x9b\x6e\xfe\xa4\
-\xef\x10\xaf\x26\x91\xdf\x27\x1e\x18\x7c\x62\x59\xca\x56\x9e\x93\
-\x94\x77\xd5\x47\x63\x3e\xaf\xb7\x5f\x7b\x15\x67\xa5\xa3\xae\x85\
-\x36\xd4\x77\x7e\x78\x44\xb3\x85\x82\xef\x28\x40\xad\x9a\xad\xa4\
-\x2b\x6b\xee\x5f\xbf\xfe\xac\xef\x20\x2f\x97\xc8\xd1\x2f\xa5\xf0\
-\x53\x72\x38\xf8\x1b\x23\xad\x59\xb1\x94\xc1\x1f\x75\x2f\x30\x81\
-\xae\x5e\xd9\xc3\xd6\x40\xc0\x9d\xc6\x54\x39\xf5\x5b\xbe\x43\xbc\
-\x92\xc4\x8d\x80\x0f\xec\x3b\xb4\x52\xd6\xfe\x92\xcb\x3e\x96\x2e\
-\xe8\x56\x6b\x53\xa3\xcb\x2e\x80\xaa\xd1\xd2\xd4\xc8\xa7\x00\xc0\
-\xad\x0f\xed\x18\x7c\x7c\x95\xef\x10\x2f\x97\xb8\x02\x20\x30\xfa\
-\xbf\x24\x65\x5d\xb5\x9f\xcf\x66\xb4\x62\xc9\x42\x57\xcd\x03\x55\
-\x69\xd5\xd2\x45\xca\x67\x9d\x3d\x76\x40\xbd\xcb\x1a\x5b\xf9\x4d\
-\xdf\x21\x5e\x2e\x51\x05\xc0\xae\xc1\xc3\x6b\x8c\xf4\x01\x97\x7d\
-\xbc\x69\x79\x8f\x52\x4c\xfd\x03\xff\x8b\x20\x08\x74\xd5\x72\xee\
-\xc0\x00\xdc\x31\xbf\xf4\xc0\xde\x03\x57\xf9\x4e\xf1\x52\x89\x1a\
-\x09\xad\xb5\xdb\x24\x39\xdb\x93\xb7\xa0\xa3\x5d\x1d\xad\xce\x2f\
-\x13\x04\xaa\x52\x67\x6b\x8b\x16\x74\xb4\xf9\x8e\x01\xd4\xaa\x4c\
-\xca\x04\xbf\xed\x3b\xc4\x4b\x25\xa6\x00\xd8\x35\x78\x78\x8d\xa4\
-\xf7\xb9\x6a\x3f\x08\x8c\x56\xf5\x2c\x72\xd5\x3c\x50\x13\x56\xf5\
-\x2c\x51\x10\xb0\x20\x10\x70\xc2\xe8\xfd\x0f\x3e\xfa\xe8\x6a\xdf\
-\x31\x5e\x94\x98\x02\x40\xd6\xfe\xba\xa4\x94\xab\xe6\x97\x2f\x5e\
-\xa8\x5c\x86\x8b\x7e\x80\xd7\x92\xcb\xa4\xb5\x6c\xa1\xd3\x7b\xb7\
-\x80\x7a\x96\x0e\x2b\xe9\x8f\xfb\x0e\xf1\xa2\x44\x14\x00\x03\x0f\
-\x1d\xee\xb4\xb2\xce\xbe\xfd\xe7\x32\x19\xf5\x2c\xe0\xac\x7f\xe0\
-\x52\x2c\x5b\xdc\xcd\xad\x98\x80\x3b\xbf\xbc\x7d\xef\x37\xbb\x7c\
-\x87\x90\x12\x52\x00\x64\xb2\xfa\xb0\x64\x9c\x1d\x97\xb8\xaa\x67\
-\x31\xd3\x9a\xc0\x25\x0a\x4c\xa0\x95\x4b\x17\xfb\x8e\x01\xd4\xaa\
-\xc6\x20\x28\x7d\xc8\x77\x08\x29\x01\x05\xc0\x9e\x3d\x7b\x72\x46\
-\xe1\xbf\x73\xd5\x7e\x6b\x53\x23\x0b\x9b\x80\xcb\xb4\xa0\xa3\x4d\
-\x2d\x9c\x95\x01\x38\x62\x3e\x3a\x38\x38\xe8\xec\xb0\xbb\x4b\xe5\
-\xbd\x00\x28\x36\xb4\xfe\x4b\xc9\x38\x7b\xdd\x58\xb9\x84\x85\x7f\
-\xc0\x1b\xb1\x62\x31\xe7\x65\x00\x8e\x2c\x9a\x08\xb3\xde\x6f\x0a\
-\xf4\x5e\x00\xc8\x9a\x8f\xb9\x6a\xba\xb5\xb9\x49\x6d\x2d\x89\xbd\
-\x88\x09\x48\xb4\x8e\xd6\x66\xb5\x35\xf3\xfc\x00\x4e\x18\xeb\x7d\
-\x31\xa0\xd7\x02\x60\xe7\xbe\xc3\xbd\x92\xae\x77\xd5\xfe\x2a\x4e\
-\xfc\x03\xae\xc8\x8a\xa5\x3c\x43\x80\x1b\xe6\xc6\x9d\xfb\x0f\xbc\
-\xcb\x67\x02\xcf\x33\x00\xf6\x83\xae\x5a\xee\x68\x6d\x56\x2b\x6f\
-\x2f\xc0\x15\x69\x6b\x6a\x52\x3b\xb3\x68\x80\x13\x46\x29\x67\x63\
-\xe0\xa5\xf0\x56\x00\x0c\x3c\xf2\x64\x9b\x8c\x7d\xaf\xab\xf6\x39\
-\xef\x1f\x88\xc6\x0a\xd6\xd1\x00\x4e\x58\x85\xef\xdb\xb3\xe7\x89\
-\x56\x5f\xfd\x7b\x2b\x00\xb2\xa9\xc2\xff\xe1\x6a\xeb\x5f\x6b\x73\
-\x93\x5a\x1a\x59\xc1\x0c\x44\xa1\xb5\xa9\x91\xdb\x33\x01\x27\x4c\
-\x53\x21\x1f\x3a\x3b\x01\xf7\xf5\xf8\xfb\x04\x60\xf5\xcb\xae\x9a\
-\x5e\xb6\x30\x11\x67\x2c\x00\x35\xa3\x87\x67\x0a\x70\xc2\x38\xfc\
-\x14\xfe\x7a\xbc\x14\x00\x3b\xf6\x1f\xf8\x69\x19\xbd\xdd\x45\xdb\
-\x0d\xf9\x9c\x3a\x5a\xbd\xcd\xa8\x00\x35\xa9\xb3\xad\x4d\xf9\x1c\
-\xd7\x05\x03\x0e\xdc\xbc\x63\xf0\xd0\xdb\x7c\x74\xec\x69\x06\x20\
-\xf8\x45\x57\x2d\xf7\x2c\xe8\x96\xe1\xd0\x3f\x20\x52\xc6\x48\x3d\
-\x0b\x39\x4e\x1b\x70\x21\xb0\xf2\x72\x26\x40\xec\x05\x80\xb5\xd6\
-\x18\xe9\x7e\x17\x6d\x67\xd2\x29\x2d\xec\xe2\xd4\x3f\xc0\x85\x45\
-\x9d\x1d\xca\xa4\x9d\xdd\xd7\x05\xd4\x2d\x2b\xbd\xcf\x5a\x1b\xfb\
-\xab\x6b\xec\x05\xc0\xae\xfd\x8f\xdf\x2a\x69\xa5\x8b\xb6\x17\x76\
-\x76\x28\x30\xfe\xcf\x36\x02\x6a\x51\x10\x18\x2d\xec\x6c\xf7\x1d\
-\x03\xa8\x45\x2b\x76\xee\x7f\xfc\x1d\x71\x77\x1a\xff\x0c\x80\x6c\
-\xbf\xab\xb6\x17\x75\xf1\xe3\x04\xb8\xb4\xb8\xbb\xd3\x77\x04\xa0\
-\x26\x05\x0e\xc7\xc6\x57\xef\x33\x46\xdb\xb6\xd9\xc0\x18\xfd\x9c\
-\x8b\xb6\x5b\x9b\x9b\xd4\x98\xf7\x7e\xb7\x02\x50\xd3\x1a\x72\x39\
-\xb6\x04\x02\x0e\x58\xa3\xfe\xb8\x3f\x03\xc4\x5a\x00\xbc\xfd\xb6\
-\xc3\xeb\x24\xf5\xb8\x68\x7b\x71\x57\x87\x8b\x66\x01\xbc\xcc\xa2\
-\x6e\x9e\x35\xc0\x81\xe5\x2f\x7c\x22\x8f\x4d\xac\x05\x80\x35\x66\
-\xab\x8b\x76\xd3\xa9\x40\xdd\xed\x2c\xfe\x03\xe2\xb0\xa0\xa3\x4d\
-\xe9\x14\x8b\x01\x81\xc8\x19\x39\x19\x23\x5f\x4d\xcc\x6b\x00\xec\
-\x7b\x5c\xb4\xda\xdd\xd1\xa6\x20\x60\xef\x1f\x10\x87\xc0\x04\xea\
-\x6a\xe7\xac\x0d\x20\x7a\x6e\xc6\xc8\x57\x13\x5b\x01\xb0\x63\xf0\
-\xf1\x55\x92\xde\xec\xa2\xed\xee\x76\x16\xff\x01\x71\x62\xc6\x0d\
-\x70\xe2\xfa\xdd\x8f\x1c\x5c\x11\x57\x67\xf1\xcd\x00\x84\xa1\x93\
-\xca\x26\x93\x4e\xab\xad\x99\x45\x49\x40\x9c\xda\x5b\x9a\x94\x49\
-\xa7\x7d\xc7\x00\x6a\x4e\x25\xad\x77\xc7\xd5\x57\x6c\x05\x80\x31\
-\xba\xcb\x45\xbb\xdd\xed\xad\x32\x1c\xfd\x07\xc4\xca\x18\xa3\xce\
-\xf6\x16\xdf\x31\x80\x9a\x63\x6d\x10\xdb\x67\x80\x58\x0a\x80\x81\
-\x81\x1f\x64\x25\xf5\xb9\x68\xbb\xbb\x83\xa9\x48\xc0\x87\x05\x7c\
-\x7a\x03\x22\x67\x64\xef\xf8\xf2\x93\x4f\x66\xe2\xe8\x2b\x96\x02\
-\x20\xdf\x35\xbe\x4e\x52\xe4\xaf\x0b\x99\x4c\x9a\x3d\xc9\x80\x27\
-\x6d\xcd\x8d\x7c\x06\x00\xa2\xd7\xba\x78\xa2\x10\xcb\x76\xc0\x58\
-\x0a\x80\xd0\x98\xdb\x5d\xb4\xdb\xd1\xd2\xcc\xf4\x3f\xe0\x89\x31\
-\x46\xed\x2d\x4d\xbe\x63\x00\xb5\x68\x7d\x1c\x9d\xc4\xb4\x06\xc0\
-\xae\x75\xd1\x6a\x47\x2b\xdf\x20\x01\x9f\x78\x06\x81\xe8\x59\xe3\
-\x66\xcc\x7c\x39\xe7\x05\xc0\xc0\xc0\x40\x4a\xd2\x3b\xa3\x6e\xf7\
-\xe2\xdb\x47\x73\xd4\xcd\x02\xb8\x0c\x1d\xad\xcd\x5c\xbf\x0d\x44\
-\xce\xf4\xbe\x30\x76\x3a\xe5\xbc\x00\x68\xe8\x5a\x7e\x93\x1c\x7c\
-\xff\x6f\x6e\x68\xe0\x6a\x52\xc0\xb3\x4c\x3a\xad\xa6\x86\x06\xdf\
-\x31\x80\x5a\xd3\x9a\xeb\x5c\x71\x9d\xeb\x4e\x9c\x17\x00\x65\x85\
-\x6e\xa6\xff\xdb\x78\xfb\x07\x92\xa0\xb3\x95\x67\x11\x88\x5a\x68\
-\x2a\xce\x3f\x03\x38\x2f\x00\x8c\x91\x93\x3f\x44\x1b\x8b\x8f\x80\
-\x44\x68\xe3\x53\x1c\x10\x39\x57\x63\xe7\x4b\xc5\xb1\x08\xf0\x5d\
-\x51\x37\x18\x04\x46\x2d\x8d\x4c\x3b\x02\x49\xd0\xd2\xd4\xc0\x5d\
-\x1c\x40\xc4\x8c\xe4\x7c\x2b\xa0\xd3\x02\x60\xe0\x91\x27\xdb\x24\
-\xad\x8c\xba\xdd\xe6\x86\x06\x05\x26\xe6\x7b\x8c\x00\xbc\xa2\xc0\
-\x04\x6a\x6c\xc8\xfb\x8e\x01\xd4\x14\x2b\xad\xde\xb3\xe7\x09\xa7\
-\xb7\x6e\x39\x1d\x45\xb3\x66\xfe\x46\x49\x91\xbf\x1a\xb4\x70\xf8\
-\x0f\x90\x28\x6d\x4d\x7c\x92\x03\x22\x66\xe6\xb3\x15\xa7\x0b\x01\
-\xdd\xbe\x46\x07\xe6\x06\x17\xcd\x72\xfa\x1f\x90\x2c\x14\xe5\x40\
-\xf4\x82\x94\xb9\xd1\x69\xfb\x2e\x1b\x97\x71\x54\x00\x70\xfb\x1f\
-\x90\x28\xad\xcd\xac\xc9\x01\x22\x67\x43\x27\x63\xe8\x8b\xdc\x16\
-\x00\xd6\x46\x5e\xbd\x64\x33\x19\xce\x1f\x07\x12\x26\x9b\xce\x28\
-\x93\xe1\xb9\x04\xa2\xe5\xe6\x25\xfa\x45\xce\x0a\x00\x6b\xad\x91\
-\x74\x7d\xd4\xed\x36\x35\xe4\xa2\x6e\x12\x40\x04\x9a\x58\x08\x08\
-\x44\xed\xc6\x17\xc6\x52\x27\x9c\x15\x00\xdb\xbf\xf1\xcd\x1e\x49\
-\x91\xaf\x60\x6c\xe4\xd4\x31\x20\x91\x9a\xf2\x14\x00\x40\xc4\xda\
-\xb7\x1f\x38\xb0\xd8\x55\xe3\xce\x0a\x80\x54\xa5\xbc\xda\x45\xbb\
-\x4d\x79\x66\x00\x80\x24\x6a\x64\x76\x0e\x88\x9c\x29\xa6\x56\xb9\
-\x6a\xdb\xdd\x1a\x80\x20\x70\x52\x00\xb0\xdf\x18\x48\xa6\xe6\x3c\
-\xb3\x73\x40\xd4\x82\xc0\x38\x19\x4b\x25\xa7\x8b\x00\xc3\x55\x51\
-\xb7\x68\x8c\x51\x53\x2e\x1b\x75\xb3\x00\x22\xd0\xd0\x90\xe5\x66\
-\x40\x20\x72\xd1\x8f\xa5\x2f\x72\x58\x00\x98\x55\x51\xb7\x98\xcd\
-\xa4\x65\x02\x4e\x00\x04\x92\x28\x30\x81\x32\xe9\x8c\xef\x18\x40\
-\x6d\xb1\xd5\x38\x03\x60\xb4\x2a\xea\x26\xf3\x59\xde\xfe\x81\x24\
-\xcb\x67\x29\x00\x80\x48\x19\xbb\xca\x55\xd3\xee\x0a\x00\xab\xc8\
-\xab\x96\x1c\x05\x00\x90\x68\x3c\xa3\x40\xd4\xaa\x6c\x06\xe0\x85\
-\x7d\x8b\x4b\xa3\x6e\x37\x9f\xe3\xed\x02\x48\x32\x9e\x51\x20\x72\
-\xcb\x5c\x35\xec\xa4\x00\xf8\xda\xde\x6f\xb7\x4a\x8a\xfc\x55\x80\
-\xe9\x45\x20\xd9\xf8\x4c\x07\x44\x2e\x37\x30\x38\xd8\xec\xa2\x61\
-\x27\x05\x40\x26\x28\x74\xbb\x68\x37\x97\xe1\xc7\x05\x48\x32\x3e\
-\x01\x00\xd1\xcb\x28\xef\x64\x4c\x75\xb4\x06\xc0\x74\xb9\x68\x35\
-\x9d\x49\xb9\x68\x16\x40\x44\x32\x69\x9e\x51\x20\x72\xb6\xec\x64\
-\x4c\x75\x52\x00\x18\x13\x3a\xa9\x56\x32\x29\x7e\x5c\x80\x24\x4b\
-\x53\x00\x00\x91\x33\x4a\x55\xd3\x0c\x40\x40\x01\x00\xd4\x21\x66\
-\x00\x80\xe8\xb9\x7a\xa9\x76\x54\x00\x84\x91\x4f\x57\xa4\x82\x80\
-\x43\x80\x80\x84\x0b\x4c\xa0\x20\xe0\x38\x40\x20\x4a\xd6\xba\xf9\
-\xac\xee\xe8\x13\x80\x89\xfc\x16\x40\xde\x2c\x80\xea\x90\x49\xa5\
-\x7d\x47\x00\x6a\x8a\x95\x69\x73\xd1\xae\x93\x02\x20\xb4\x26\xf2\
-\x6b\xc1\x52\x4c\xff\x03\x55\x21\x9d\x66\xa6\x0e\x88\x94\xb1\x4e\
-\xb6\xd7\x38\x79\x52\x03\x1b\x7d\xd8\x80\xe9\x7f\xa0\x2a\x18\xc3\
-\xb3\x0a\x44\xc9\x38\x78\xa9\x96\x5c\xcd\x00\x04\xd1\x87\x35\x5c\
-\x33\x06\x54\x85\x80\x67\x15\x88\x98\xad\x9e\x02\xc0\xc9\x0c\x00\
-\xbf\x29\x40\x55\x30\x3c\xac\x40\xb4\x8c\xa9\x9e\x4f\x00\xd6\x46\
-\x7f\x0c\x30\xd3\x8a\x40\x75\x08\x44\x01\x00\x44\xca\x56\xd1\x0c\
-\x80\x8b\x05\x0b\x4c\x2b\x02\xd5\x81\xed\xba\x40\xe4\xaa\x67\x06\
-\xc0\x28\x88\x7c\x1f\x10\xe3\x3f\x50\x1d\xf8\x02\x00\x44\xce\xc9\
-\xde\x5a\x47\xdb\x00\x6d\x31\xfa\x36\xa3\x6e\x11\x80\x0b\x21\x0f\
-\x2b\x10\xb5\xc8\xc7\x54\xc9\xd9\x27\x80\xe8\xc3\xda\x30\x8c\xba\
-\x49\x00\x0e\x58\x51\x00\x00\x51\x32\x32\xd5\x53\x00\x18\x13\x7d\
-\xd8\x90\x1f\x15\xa0\x2a\x30\x03\x00\x44\xcb\xca\x16\x5c\xb4\xeb\
-\x66\x17\x40\x18\x7d\x58\xcb\x8f\x0a\x50\x15\xac\xe5\x59\x05\xa2\
-\x65\xaa\xa7\x00\x60\x06\x00\xa8\x5f\x15\xcb\xe7\x3a\x20\x52\x0e\
-\xd6\xd5\x49\xae\xd6\x00\xb8\x58\x04\x58\xa1\x00\x00\xaa\x81\xe5\
-\x59\x05\xa2\x65\xaa\x68\x06\x40\x81\xe6\xa2\x6e\xb2\x5c\xae\x44\
-\xdd\x24\x00\x07\x4a\x21\xcf\x2a\x10\x25\xa3\x70\xde\x45\xbb\x8e\
-\xd6\x00\x68\x2c\xea\x36\xcb\x95\x72\xd4\x4d\x02\x70\x80\x62\x1d\
-\x88\x56\xa8\x60\xd4\x45\xbb\xae\x4e\x02\x8c\x3c\x6c\x68\xad\x2a\
-\x15\xbe\x2d\x02\x49\x56\xae\x54\x58\x04\x08\x44\x2e\xfa\x31\x55\
-\x72\x54\x00\xa4\xac\x19\x71\xd1\x6e\x89\x59\x00\x20\xd1\x78\xfb\
-\x07\xa2\x67\xe5\x66\x4c\x75\x52\x00\x94\x4d\xe8\xa4\x5a\x29\x97\
-\xf8\x71\x01\x92\x8c\x22\x1d\x70\xc0\xc1\xac\xba\xe4\xa8\x00\xc8\
-\xd8\x14\x33\x00\x40\x1d\x2a\x95\x78\x46\x81\xa8\xe5\x94\xa9\x9e\
-\x19\x80\x54\x61\xdc\x49\xd8\xf9\x62\xc9\x45\xb3\x00\x22\xc2\x33\
-\x0a\x44\x6f\x66\xb8\x29\xf2\x85\xf5\x92\xa3\x02\xe0\xee\xbb\xef\
-\x2e\x48\x9a\x8a\xba\xdd\xf9\xa2\x93\xb3\x10\x00\x44\xa4\x40\x01\
-\x00\x44\x6d\xa2\xbf\xff\xba\x2a\x3a\x08\xe8\xa2\xe3\x51\x37\x58\
-\x28\x50\x00\x00\x49\x36\xcf\x33\x0a\x44\xca\x48\xc7\x5c\xb5\xed\
-\xac\x00\x30\x36\xfa\xd0\x4c\x2f\x02\xc9\xc6\x2c\x1d\x10\xad\xb0\
-\x1a\x0b\x80\x30\x30\xc7\xa2\x6e\xb3\xc0\x8f\x0b\x90\x68\x3c\xa3\
-\x40\xb4\x02\x63\x8f\x3a\x6b\xdb\x55\xc3\x92\x3d\x16\x75\x8b\xa5\
-\x72\x45\x25\xf6\x19\x03\x89\x54\x2a\x97\x55\xe6\xb0\x2e\x20\x62\
-\xc1\x31\x67\x2d\x3b\x6b\xd8\xba\xa9\x5a\x66\xe7\x9d\x1c\x89\x0c\
-\xe0\x0a\xcd\xcc\x39\xb9\xaf\x04\xa8\x6f\x36\xac\xbe\x19\x80\xc0\
-\xa6\x8e\xb9\x68\x77\x66\x8e\x02\x00\x48\xa2\x99\xb9\xc8\xef\x00\
-\x03\x10\xa6\x8f\xb9\x6a\xda\x59\x01\x30\x17\x66\x8e\xb8\x68\x77\
-\x96\xb7\x0c\x20\x91\x66\xe7\x79\x36\x81\x88\x59\xe5\xcb\xd5\x37\
-\x03\xd0\x7f\xe7\xcd\x13\x92\x4e\x46\xdd\xee\xcc\x3c\x6f\x19\x40\
-\x12\x31\x3b\x07\x44\xcd\x1c\xdb\xb2\x6e\x5d\xe4\x67\xea\xbc\xc8\
-\xe5\x39\x00\x92\xf4\xbd\xa8\x1b\x9c\x99\x9b\x17\x97\x8d\x01\xc9\
-\x62\xad\x65\x7d\x0e\x10\x39\xfb\x94\xcb\xd6\x9d\x16\x00\x56\x26\
-\xf2\x02\x20\x0c\xad\x66\x0b\xfc\xd0\x00\x49\x32\x3b\x5f\x54\x18\
-\x52\x99\x03\x51\xb2\x26\xfa\x97\xe8\x97\x72\x3b\x03\x60\xe5\xa4\
-\x7a\x99\x9a\xe6\x33\x00\x90\x24\x93\x33\x33\xbe\x23\x00\xb5\xc7\
-\x56\xf3\x0c\x40\xe0\x26\x3c\x3f\x36\x40\xb2\x4c\x4e\xcf\xfa\x8e\
-\x00\xd4\x9c\xb4\x09\xaa\x77\x06\xa0\x43\xc5\x67\x24\x45\xbe\x34\
-\x78\x72\x86\x1f\x1b\x20\x49\xa6\x28\xca\x81\xa8\x15\x9a\x55\xf8\
-\xb1\xcb\x0e\x9c\x16\x00\x7d\x7d\x7d\x65\xc9\x7c\x3f\xea\x76\xe7\
-\x0b\x45\x15\xcb\xdc\x0b\x00\x24\x41\xb1\x54\xe2\x9e\x0e\x20\x62\
-\xd6\xe8\x7b\x17\xc7\x50\x77\x5c\xef\x02\x90\x64\x0f\xbb\x68\x75\
-\x92\x75\x00\x40\x22\x4c\x30\xfd\x0f\x44\xce\x58\x73\xd0\x75\x1f\
-\xee\x0b\x00\x63\x0f\xb9\x68\x76\x7c\xca\xd9\xd6\x48\x00\x97\x61\
-\x62\x8a\xe9\x7f\x20\x6a\x56\x6e\xc6\xce\x97\x72\x5e\x00\xa4\xc2\
-\xc0\x49\x15\x73\x61\x62\xda\x45\xb3\x00\x2e\xd3\x85\x49\x8a\x71\
-\x20\x6a\x61\xba\xe2\x64\xf6\xfc\xa5\x9c\x17\x00\x9b\x37\xf6\x9e\
-\x96\x74\x22\xea\x76\x0b\xa5\x12\x07\x8f\x00\x9e\xcd\xcc\x15\x54\
-\x28\xf1\xfd\x1f\x88\xd8\x91\xfb\xd7\xaf\x3f\xeb\xba\x93\x18\xd6\
-\x00\x48\x46\x72\x32\x95\x71\x61\x92\x59\x00\xc0\x27\xde\xfe\x01\
-\x17\xdc\x4f\xff\x4b\x31\x15\x00\xd6\x18\x47\x05\x00\x3f\x3e\x80\
-\x4f\x3c\x83\x40\xf4\xac\x82\xda\x29\x00\xc2\xc0\xec\x77\xd1\xee\
-\xe4\xcc\xac\xca\x95\x8a\x8b\xa6\x01\xbc\x8e\x52\xb9\xa2\x29\xce\
-\xe4\x00\x22\x17\x18\x39\x19\x33\xff\xb7\x7e\xe2\xe8\xe4\xbe\xdb\
-\x6f\xfd\xa1\x91\x9e\x8f\xba\xdd\x30\xb4\x1a\x9b\x98\x8c\xba\x59\
-\x00\x97\x60\x74\x62\x42\x21\x37\x73\x01\x11\x33\x47\xb7\xf4\xf5\
-\x3a\x3d\x00\xe8\x45\xb1\x14\x00\x92\x64\x8d\xf9\x07\x17\xed\x8e\
-\x5c\xa0\x00\x00\x7c\x18\x19\xe7\xd9\x03\xa2\x66\x8d\xfe\x2e\xae\
-\xbe\x62\x2b\x00\x02\x6b\x1f\x72\xd1\xee\xf8\xd4\xb4\x4a\x65\x3e\
-\x03\x00\x71\x2a\x95\xcb\xec\xff\x07\x1c\x30\x36\xfc\xfb\xb8\xfa\
-\x8a\xad\x00\xc8\x95\xa6\xf7\xca\xc1\xbd\x00\xa1\xb5\x1a\x9d\x98\
-\x88\xba\x59\x00\xaf\x61\x74\x7c\x4a\x96\xe9\x7f\x20\x6a\x85\x86\
-\xd2\xcc\xa3\x71\x75\x16\x5b\x01\xb0\x69\xd3\xa6\x19\xeb\x68\x3b\
-\x20\x53\x91\x40\xbc\x86\xc7\xc7\x7d\x47\x00\x6a\xd1\xa3\x9b\x36\
-\x6d\x8a\x6d\x6a\x2d\xb6\x02\xe0\x85\xce\x9c\x7c\xdb\x98\x98\x9a\
-\xe6\x32\x12\x20\x26\xf3\xc5\xa2\x26\xa7\x99\xfe\x07\xa2\x66\x8c\
-\xd9\x13\x67\x7f\xb1\x16\x00\x36\x55\xfe\x9a\xa4\xc8\xe7\x0d\xad\
-\x95\xce\x8f\x5e\x88\xba\x59\x00\xaf\x60\x68\xe4\x82\x98\xfd\x07\
-\x22\x67\x83\x72\xb8\x23\xce\x0e\x63\x2d\x00\xb6\xde\x7e\xfb\x49\
-\x49\xdf\x74\xd1\xf6\xd0\xe8\x18\xdf\x24\x01\xc7\xac\xb5\x1a\x1a\
-\x63\xfa\x1f\x88\x9a\x91\x0e\x6d\xbe\x73\x5d\xe4\xc7\xe6\xbf\x96\
-\x58\x0b\x80\x8b\xec\x80\x8b\x56\x0b\xa5\xb2\xc6\xa7\x38\x1a\x18\
-\x70\xe9\xc2\xe4\x94\x8a\x9c\xfd\x0f\x44\x2e\xb4\x72\x32\x36\xbe\
-\x96\xd8\x0b\x80\x8a\x49\x7f\x4d\x52\xe8\xa2\xed\xb3\x23\x7c\x06\
-\x00\x5c\x3a\x37\xca\xdb\x3f\xe0\x40\x18\x54\xec\x03\x71\x77\x1a\
-\x7b\x01\x70\x7f\xdf\x2d\xa7\x8c\xe4\xe4\x9a\xc3\x0b\x93\x53\x9a\
-\x2f\x14\x5d\x34\x0d\xd4\xbd\xf9\x62\x91\xb3\xff\x01\x27\xcc\x63\
-\x5b\xde\xbd\xee\x4c\xdc\xbd\x7a\xf8\x04\xe0\x6e\xaa\xc3\x5a\xab\
-\x33\xc3\xa3\x2e\x9a\x06\xea\xde\xe9\xf3\xa3\xac\xb3\x01\x1c\xb0\
-\xd6\xcd\xa7\xf1\xd7\xe3\xa5\x00\x48\x07\xc5\xbf\x91\x83\x43\x81\
-\x24\xe9\xdc\xe8\x18\x27\x03\x02\x11\x2b\x95\x2b\xec\xb4\x01\xdc\
-\x28\x96\x32\x95\xbf\xf5\xd1\xb1\x97\x02\x60\x73\x5f\xdf\x88\xac\
-\x76\xbb\x68\x3b\x0c\xad\x86\x46\xc7\x5c\x34\x0d\xd4\xad\x73\x23\
-\x63\xaa\x84\x4e\x96\xee\x00\xf5\xcd\x6a\x7b\xff\xfa\xf5\xc3\x3e\
-\xba\xf6\x52\x00\x48\x92\x95\xbe\xe2\xaa\xed\xd3\xc3\xa3\xb2\xfc\
-\x58\x01\x91\xb0\x61\xa8\xb3\xc3\x14\xd5\x80\x0b\xd6\x98\x3f\xf5\
-\xd5\xb7\xb7\x02\x60\xeb\x86\xde\x47\x24\x1d\x71\xd1\x76\xa9\x54\
-\xd6\xf9\x31\xee\x07\x00\xa2\x30\x34\x36\xae\x62\x99\xad\x7f\x40\
-\xf4\xcc\xd1\xef\x3e\x76\xeb\xa0\xaf\xde\xbd\x15\x00\xc6\x18\x6b\
-\xac\xfe\xbb\xab\xf6\x4f\x0c\x9d\x67\x16\x00\xb8\x42\x36\x0c\x75\
-\xf2\x9c\x97\xd9\x49\xa0\xe6\x19\x85\x5f\xd9\xb6\xcd\x78\x1b\xa8\
-\xbc\x15\x00\x92\x54\xce\x54\xbe\x2a\xa9\xec\xa2\xed\x42\xb1\xa4\
-\x73\x9c\x58\x06\x5c\x91\xb3\xa3\x17\x54\xe0\xe0\x1f\xc0\x85\xb2\
-\xca\xfa\xff\x7c\x06\xf0\x5a\x00\xdc\xbf\x7e\xfd\x59\x19\xeb\x64\
-\x31\xa0\x24\x9d\x3c\x3b\xac\xd0\x32\x0b\x00\xbc\x11\x36\x0c\x75\
-\x6a\x68\xc4\x77\x0c\xa0\x56\xed\xf2\xb1\xf7\xff\xa5\xbc\x16\x00\
-\x92\x14\x4a\x9f\x73\xd5\x76\xb1\x5c\xd2\xd9\x61\xb6\x2e\x01\x6f\
-\xc4\x99\xe1\x31\x8e\xfd\x05\x1c\x09\x43\xfd\x67\xdf\x19\xbc\x17\
-\x00\xf7\xf5\xad\x3b\x28\xa3\xc7\x5d\xb5\x7f\xea\xfc\xb0\x2a\x15\
-\x66\x01\x80\xcb\x51\xae\x54\x74\xea\x3c\x6f\xff\x80\x0b\x46\x3a\
-\x78\xdf\x1d\x6b\x9d\x8d\x7b\x97\xca\x7b\x01\xf0\x02\x67\xb3\x00\
-\xa5\x52\x59\x27\x86\x58\xc4\x04\x5c\x8e\x93\xe7\x86\x55\x2a\x3b\
-\x59\x9e\x03\xd4\xbd\xd0\x18\xef\x6f\xff\x52\x42\x0a\x80\xe2\xf0\
-\xe9\x1d\x72\xb4\x25\x50\x92\xce\x0e\x8f\x68\x6e\xde\xc9\xc1\x83\
-\x40\xcd\x99\x2f\x14\x75\x76\x84\x23\xb5\x01\x17\xac\xd5\x73\xdf\
-\x7d\xf4\xd6\x07\x7d\xe7\x90\x12\x52\x00\xf4\xf7\xf7\x57\xac\xd5\
-\xe7\x5d\xb5\x1f\x86\x56\x47\xcf\x0c\xb9\x6a\x1e\xa8\x29\x47\x4e\
-\x9d\x55\x18\x72\xe6\x3f\xe0\xc8\x1f\xf9\xdc\xfa\xf7\x52\x89\x28\
-\x00\x24\xa9\xb1\x3c\xfd\x67\x92\x9c\x7d\x74\x1c\x9b\x98\xd4\x85\
-\xc9\x69\x57\xcd\x03\x35\x61\x7c\x6a\x86\x1b\xff\x00\x77\xce\xa7\
-\x67\x73\x5e\xb7\xfe\xbd\x54\x62\x0a\x80\x4d\x9b\x36\xcd\x58\xe9\
-\xb3\x2e\xfb\x38\x7a\xea\x2c\x87\x03\x01\xaf\xc2\x86\xa1\x8e\x9c\
-\xf2\xba\x2b\x09\xa8\x71\xf6\x3f\x6e\xde\x7c\xf3\xac\xef\x14\x2f\
-\x4a\x4c\x01\x20\x49\xa5\xbc\xf9\xa2\x24\x67\xbf\x40\xb3\x85\x82\
-\x4e\xb2\xb2\x19\x78\x45\x27\xce\x0d\xb3\x56\x06\x70\xe7\x6c\x6a\
-\x26\xff\x65\xdf\x21\x5e\x2a\x51\x05\x40\x7f\x6f\xef\x9c\xb5\xc6\
-\xe9\x2c\xc0\xa9\xa1\x61\xcd\xce\xcf\xbb\xec\x02\xa8\x3a\x33\xf3\
-\xf3\x3a\x4d\x71\x0c\xb8\x63\xcc\xef\x27\xe9\xed\x5f\x4a\x58\x01\
-\x20\x49\xed\x41\xe1\x8f\x25\x9d\x72\xd5\x7e\x18\x5a\x3d\x77\xe2\
-\x8c\xac\x65\x91\x13\x20\x49\xd6\x4a\x47\x4e\x9c\x51\xc8\x33\x01\
-\xb8\x72\x0e\xb3\x5d\xb7\x00\x00\x10\x8f\x49\x44\x41\x54\x22\x3b\
-\x37\xee\xed\xd6\xbf\x57\x93\xb8\x02\xa0\xaf\xaf\x6f\xde\x5a\x7d\
-\xc6\x65\x1f\x53\x33\xb3\x3a\x3b\xc2\xf5\xa6\x80\x24\x9d\x19\x1e\
-\xd5\xe4\x4c\xa2\x5e\x4c\x80\xda\x62\xec\xef\xdd\x7d\xf7\xdd\x89\
-\xfb\xbe\x96\xb8\x02\x40\x92\x4a\xa3\xed\x5f\x35\xd2\xf3\x2e\xfb\
-\x38\x76\xe6\x1c\xdf\x3b\x51\xf7\x66\x0b\x05\x1d\x3f\x7b\xce\x77\
-\x0c\xa0\x66\x59\xab\xe7\x86\x5a\xf2\x89\x59\xf9\xff\x52\x89\x2c\
-\x00\xfa\xfb\xaf\x2b\x5a\x6b\x7e\xc3\x65\x1f\x61\x68\xf5\xcc\xf1\
-\x93\xec\x77\x46\xdd\x0a\xad\xd5\xb3\xc7\x4f\xf1\x0c\x00\x0e\xd9\
-\xc0\xfc\xfa\x87\x6e\xbe\x39\x91\x97\x6a\x24\xb2\x00\x90\xa4\xad\
-\x1b\x7b\x77\x58\xa3\x47\x5c\xf6\x31\x33\x3b\xaf\x13\xe7\xce\xbb\
-\xec\x02\x48\xac\xe3\x67\x87\x34\x3d\x33\xe7\x3b\x06\x50\xcb\xf6\
-\xdd\xd7\xd7\xfb\x75\xdf\x21\x5e\x4d\x62\x0b\x00\x49\x4a\x59\xfb\
-\x09\x49\x4e\x0f\x24\x3f\x7d\x7e\x58\x13\x53\x33\x2e\xbb\x00\x12\
-\x67\x62\x7a\x46\x67\x58\xf5\x0f\xb8\x54\x51\xca\x7c\xc2\x77\x88\
-\xd7\x92\xe8\x02\xe0\x9e\x0d\xeb\x7e\x20\x63\x9c\xae\x9c\xb4\x56\
-\x7a\xf6\xf8\x29\x95\xca\x15\x97\xdd\x00\x89\x51\x2a\x97\xf5\xa3\
-\x63\xa7\xc4\xa2\x7f\xc0\xa9\x2f\x6d\xbd\xbd\xf7\x29\xdf\x21\x5e\
-\x4b\xa2\x0b\x00\x49\x2a\x16\xf4\x29\x49\x4e\x97\xec\x17\x4a\x25\
-\xfd\xe8\xd8\x09\xb6\x06\xa2\xe6\xbd\x58\xf0\x16\x4b\x89\xfc\x24\
-\x09\xd4\x8a\x0b\x61\x98\xfe\x5d\xdf\x21\x5e\x4f\xe2\x0b\x80\xfe\
-\xbb\x7a\xc7\x8c\xb5\xbf\xe3\xba\x9f\xf1\xa9\x19\x9d\x38\xcb\x7a\
-\x00\xd4\xb6\xe3\x67\x87\xb8\x13\x03\x70\xcc\x58\xfb\x7f\xde\x77\
-\xc7\xbb\x12\x7f\xa5\x66\xe2\x0b\x00\x49\xfa\xa7\x03\x6b\xbf\x24\
-\xd9\x43\xae\xfb\x39\x39\x34\xac\x91\xf1\x49\xd7\xdd\x00\x5e\x8c\
-\x4d\x4c\xea\xd4\xd0\xb0\xef\x18\x40\xad\x7b\xe2\x9f\x0e\xac\xfd\
-\x13\xdf\x21\x2e\x85\xf1\x1d\xe0\x52\xed\x1e\x3c\xfc\xe6\x8a\xb5\
-\xdf\x91\x94\x73\xd9\x4f\x3a\x15\xe8\xa6\x6b\xde\xa4\x86\xbc\xd3\
-\x6e\x80\x58\xcd\x15\x0a\xfa\xce\x33\x47\x54\xe1\x32\x2c\xc0\xa5\
-\x82\xc2\xca\x4f\x6d\xbd\x63\xfd\xd3\xbe\x83\x5c\x8a\xaa\x98\x01\
-\x90\xa4\xcd\x7d\xbd\xcf\x58\xab\xff\xe8\xba\x9f\x72\x25\xd4\x0f\
-\x9e\x3f\xae\x52\xd9\xe9\xe6\x03\x20\x36\xa5\x72\x45\x4f\x3f\x7f\
-\x82\xc1\x1f\x70\xcc\xca\xfc\x7e\xb5\x0c\xfe\x52\x15\x15\x00\x92\
-\x54\x1a\x6d\xff\x8c\xa4\x1f\xb8\xee\x67\xbe\x50\xd4\x0f\x8f\x9e\
-\xe4\xea\x60\x54\x3d\x1b\x86\xfa\xe1\xf3\xc7\x39\xf5\x12\x70\xef\
-\xfb\xa5\x91\xb6\x3f\xf0\x1d\xe2\x72\x54\x55\x01\xd0\xdf\x7f\x5d\
-\x51\xd6\xfc\x8a\x24\xe7\x23\xf3\xe4\xf4\x8c\x9e\x3d\x71\xda\x75\
-\x37\x80\x53\xcf\x9e\x38\xc3\x39\xff\x80\x7b\x95\xc0\xd8\x0f\xf6\
-\xf7\x5f\x57\xf4\x1d\xe4\x72\x54\x55\x01\x20\x49\x5b\x37\xf6\x1e\
-\x96\x95\xd3\x2b\x83\x5f\x34\x7c\x61\x42\xc7\xcf\x0e\xc5\xd1\x15\
-\x10\xb9\x63\x67\xce\x69\xf8\xc2\xb8\xef\x18\x40\x3d\xf8\x83\x7b\
-\xfa\xd6\x3d\xe1\x3b\xc4\xe5\xaa\xba\x02\x40\x92\x86\xda\x72\xbf\
-\x2d\xe9\x5b\x71\xf4\x75\xf2\xdc\x30\x37\x07\xa2\xea\x9c\x19\x1e\
-\xd5\xa9\x21\x4e\xfa\x03\xdc\x33\xdf\x2e\x8e\xb4\x27\x7e\xcf\xff\
-\x2b\xa9\x9a\x5d\x00\x2f\xb7\x6b\xf0\xf0\x1a\x6b\xed\x3f\x49\x6a\
-\x8e\xa3\xbf\x35\x2b\x96\x6a\x71\x57\x67\x1c\x5d\x01\x57\xe4\xfc\
-\xd8\xb8\x9e\x3b\xc1\x49\x7f\x80\x7b\x76\xc6\x48\x3f\xbd\x65\xc3\
-\xba\x1f\xf9\x4e\xf2\x46\x54\xe5\x0c\x80\x24\x6d\xe9\xeb\xfd\xb1\
-\x8c\xdb\x1b\x03\x5f\xea\xc8\xc9\xb3\x1a\x19\x9f\x88\xab\x3b\xe0\
-\x0d\x19\x1d\x9f\xd0\x73\x27\x4e\x33\xf8\x03\x31\xb0\x46\x1f\xab\
-\xd6\xc1\x5f\xaa\xe2\x19\x80\x17\xed\x1c\x3c\x34\x20\xab\xf7\xc6\
-\xd1\x57\x60\x8c\xde\x7c\xd5\x0a\x75\xb6\xb6\xc4\xd1\x1d\x70\x59\
-\x2e\x4c\x4e\xeb\xe9\xa3\x27\xd8\xbd\x02\xc4\xc1\xd8\x1d\x5b\xfb\
-\xd6\xdd\xe7\x3b\xc6\x95\xa8\xda\x19\x80\x17\xa5\x54\xfc\x77\x92\
-\x4e\xc4\xd1\x57\x68\xad\x9e\x79\xfe\xa4\x2e\x4c\x71\x94\x2a\x92\
-\x65\x6c\x72\x4a\x4f\x3f\xcf\xe0\x0f\xc4\xe4\x58\xb1\x10\xfc\xb2\
-\xef\x10\x57\xaa\xea\x67\x00\x24\x69\xc7\xe0\xa1\xb7\x19\xab\xc3\
-\x92\x1a\xe2\xe8\x2f\x08\x8c\xae\x59\xb9\x5c\xdd\xed\xad\x71\x74\
-\x07\xbc\xa6\xb1\x89\x49\xfd\xf0\xe8\x29\x59\xcb\xe0\x0f\xc4\x60\
-\xde\x18\x7b\xdb\x96\xbe\x75\x4f\xfa\x0e\x72\xa5\xaa\x7e\x06\x40\
-\x92\xee\xed\x5b\xfb\x1d\x6b\xf5\xa1\xb8\xfa\x0b\x43\xab\x1f\x1d\
-\x3b\xa9\xa1\xb1\x0b\x71\x75\x09\xbc\xa2\xe1\x0b\x13\x17\x0f\xad\
-\x62\xf0\x07\x62\x61\x64\x3e\x5c\x0b\x83\xbf\x54\x23\x33\x00\x2f\
-\xda\xb9\xef\xd0\x57\x64\x14\xeb\xb4\xcc\x55\xcb\x96\x68\xe9\x82\
-\xae\x38\xbb\x04\x24\x49\xe7\x46\x2e\xe8\xc8\x29\x16\xfc\x01\xb1\
-\x31\xe6\x8f\xb7\xf6\xf5\xfe\x5b\xdf\x31\xa2\x52\x13\x33\x00\x2f\
-\xca\x16\x26\x3e\x62\x8d\xfe\x31\xce\x3e\x9f\x3f\x75\x56\x27\xb9\
-\x61\x0d\x31\x3b\x71\x6e\x58\x3f\x3e\xc9\xe0\x0f\xc4\xc7\x7c\x33\
-\x3b\x37\xfe\x71\xdf\x29\xa2\x54\x53\x33\x00\x92\xb4\xfb\x91\x83\
-\x2b\x2a\x29\xf3\x2d\x49\x8b\xe2\xec\x77\x51\x57\x87\xde\xb4\x7c\
-\xa9\x02\x53\x73\x7f\x4b\x91\x20\xd6\x5a\x1d\x39\x75\x46\xe7\x46\
-\xf8\xfc\x04\xc4\xc7\x9e\xab\x98\xf4\x3b\xee\xef\xbb\xe5\x94\xef\
-\x24\x51\xaa\xc9\xd1\x6a\xc7\xfe\x03\x3f\x6d\x64\x1e\x95\x4c\x53\
-\x9c\xfd\xb6\xb7\x34\xe9\xcd\xab\x57\x2a\x9d\xaa\xa9\x89\x15\x24\
-\x44\x25\x0c\xf5\xa3\xa3\x27\x35\x36\x39\xe5\x3b\x0a\x50\x4f\xe6\
-\xa4\xb0\x6f\xeb\x86\xdb\xbe\xe9\x3b\x48\xd4\x6a\xb2\x00\x90\xa4\
-\xed\x83\x87\x7f\x36\xb0\x76\xa7\xa4\x54\x9c\xfd\x36\xe5\xf3\x7a\
-\xeb\x9a\x95\xca\x65\x32\x71\x76\x8b\x1a\x37\x5f\x2c\xe9\x87\x47\
-\x8e\x6b\x66\x7e\xde\x77\x14\xa0\x9e\x84\xd6\x98\xfb\xef\xed\xeb\
-\xdd\xe9\x3b\x88\x0b\x35\x5b\x00\x48\xd2\xce\xfd\x07\x3f\x21\x99\
-\xcf\xc5\xdd\x6f\x26\x9d\xd6\xb5\xab\x96\xab\xbd\x25\xd6\x09\x08\
-\xd4\xa8\x89\xe9\x19\x3d\x73\xec\xa4\x4a\xa5\xb2\xef\x28\x40\xbd\
-\xf9\xd8\xd6\x0d\x6b\xbf\xe0\x3b\x84\x2b\x35\x5d\x00\x48\xd2\xce\
-\xfd\x87\x3e\x2f\xe9\xa3\x71\xf7\x6b\x8c\xd1\xca\x25\x8b\xb4\x6c\
-\x51\x77\xdc\x5d\xa3\x86\x9c\x19\x1e\xd5\xb1\xd3\xe7\x14\xb2\xda\
-\x0f\x88\x99\xf9\xa3\xad\x1b\x7a\x7f\xdd\x77\x0a\x97\x6a\xfe\x63\
-\x75\x71\xe4\xf4\xaf\xcb\x2a\xf6\xe9\x1b\x6b\xad\x8e\x9d\x39\xa7\
-\xa7\x9f\x3f\xa1\x72\x85\x3d\xda\xb8\x3c\x95\x30\xd4\x33\xc7\x4e\
-\xe8\xf9\x53\x67\x19\xfc\x81\x98\x59\x99\xed\xdf\x79\xec\xd6\xd8\
-\xee\x9a\xf1\xa5\xe6\x67\x00\x24\x69\x60\xe0\x07\xd9\xdc\x82\x89\
-\x9d\xd6\xda\xf7\xf8\xe8\xbf\x31\x9f\xd7\xb5\xab\x97\xa9\x29\x9f\
-\xf7\xd1\x3d\xaa\xcc\xcc\xdc\xbc\x9e\x39\x7a\x52\x73\x85\x82\xef\
-\x28\x40\x1d\xb2\x7b\xdb\x4c\x69\x73\x5f\x5f\x5f\xcd\x2f\xb8\xa9\
-\x8b\x02\x40\x92\x76\xef\x7e\xb2\xb1\xd2\x54\xf8\x7b\x49\xeb\x7d\
-\xf4\x6f\x4c\xa0\x95\x4b\x16\xaa\x67\x61\xb7\xd8\x29\x88\x57\x73\
-\x66\x78\x54\x47\xcf\x0c\x71\xa6\x3f\xe0\xc7\xe1\x86\xd2\xf4\xbb\
-\x37\x6d\xda\x34\xe3\x3b\x48\x1c\xea\x6a\x28\xda\xb3\xe7\x89\xd6\
-\x42\x43\x65\xaf\xb1\x7a\x87\xaf\x0c\xed\x2d\x4d\xba\x66\xe5\x32\
-\x65\xd9\x25\x80\x97\x28\x95\xca\x7a\xf6\xc4\x69\x5d\x60\x8b\x1f\
-\xe0\xcb\x77\xac\x29\xf6\xdd\xdb\xd7\x37\xee\x3b\x48\x5c\xea\xaa\
-\x00\x90\xa4\x1d\x83\x83\xed\x26\xcc\xee\x97\xd1\xdb\x7d\x65\xc8\
-\xa4\xd3\x5a\xb3\x7c\xa9\xba\xb8\x4c\x08\x92\x46\xc6\x27\x75\xe4\
-\xe4\x19\x95\xca\xac\xf2\x07\xbc\xb0\x7a\x2a\xb4\xe9\xbe\xfb\xee\
-\x78\xd7\xa8\xef\x28\x71\xaa\xbb\x02\x40\x92\xfe\x6e\xf0\x5b\x8b\
-\x4b\xb6\xbc\x4f\xb2\x6f\xf5\x99\xa3\xb3\xad\x55\x6f\x5a\xbe\x54\
-\xb9\x4c\xda\x67\x0c\x78\x52\x2a\x97\x75\xf4\xf4\x39\x9d\x1f\xab\
-\x9b\x17\x0e\x20\x81\xcc\xd3\x26\x0c\x36\x6c\xb9\xe3\x96\x21\xdf\
-\x49\xe2\x56\x97\x05\x80\x24\x7d\xfd\xc0\x81\x8e\x72\x29\x78\x48\
-\xd2\x3b\x7d\xe6\x48\xa7\x52\x5a\xb1\x64\xa1\x96\x74\x77\xb1\x36\
-\xa0\x8e\x9c\x1f\x1b\xd7\xd1\xd3\x67\x55\x2a\x57\x7c\x47\x01\xea\
-\x96\x95\xfe\x67\x29\x5d\xb9\xab\x7f\xfd\xfa\xba\xbc\xd0\xa5\xae\
-\x87\x9c\x81\x47\x9e\x6c\xcb\xa6\x0a\x7b\x24\xf5\xfa\xce\xd2\xd6\
-\xd2\xa4\x35\xcb\x96\xaa\x21\x9f\xf3\x1d\x05\x0e\xcd\x16\x0a\x3a\
-\x72\xe2\x8c\x26\xa6\xeb\x62\x8d\x11\x90\x58\xd6\xe8\x1f\x4b\x05\
-\x73\x57\xff\x5d\xbd\x63\xbe\xb3\xf8\x52\xd7\x05\x80\x24\x3d\xfc\
-\xf0\xc3\x4d\xb3\xd9\xe6\x1d\xc6\xea\x4e\xdf\x59\x02\x63\xb4\xb0\
-\xab\x5d\x2b\x97\x2c\x52\x26\xcd\x67\x81\x5a\x52\xae\x54\x74\x6a\
-\x68\x58\x67\x86\x47\x15\x86\xec\xeb\x07\xfc\x32\xdf\x30\xd9\xf0\
-\x9e\x2d\xeb\xd6\xd5\xf5\xaa\xdb\xba\x2f\x00\x24\x69\xcf\x9e\x3d\
-\xb9\x62\xae\xed\x7f\xc8\x68\xab\xef\x2c\x92\x94\x49\xa7\xb4\x7c\
-\xf1\x42\x2d\xe9\xee\x94\xe1\xbb\x40\x55\xb3\x56\x1a\xbe\x30\xae\
-\xa3\x67\xce\x71\x94\x2f\x90\x0c\x7f\x57\xcc\x9b\xf7\xf6\xf7\xf6\
-\xce\xf9\x0e\xe2\x1b\xa3\xcb\x0b\x06\x07\x07\xd3\x13\xca\x7d\x51\
-\xd6\xfe\xaa\xef\x2c\x2f\x6a\x6a\xc8\x69\x55\xcf\x12\x75\xb4\x34\
-\xfb\x8e\x82\x37\xe0\xc2\xe4\x94\x8e\x9d\x1e\xe2\x02\x1f\x20\x21\
-\xac\xf4\x67\xe7\x5b\x73\xbf\xfa\xa1\x9b\x6f\x2e\xf9\xce\x92\x04\
-\x14\x00\x2f\xb3\x6b\xf0\xf0\xc7\xac\xb5\x9f\x53\x82\x8e\x49\x6e\
-\x69\x6c\xd4\xf2\x25\x0b\xd4\xd9\xda\xe2\x3b\x0a\x2e\xc1\xe4\xcc\
-\xac\x8e\x9f\x19\xe2\x3b\x3f\x90\x1c\xd6\x5a\x7d\xfa\xde\x8d\x6b\
-\xb7\xf9\x0e\x92\x24\x14\x00\xaf\x60\xe7\xe0\xa1\x9f\x93\xd5\x5f\
-\x48\x4a\xd4\xd9\xbd\x6d\x4d\x4d\x5a\xb1\x64\xa1\xda\xb8\x65\x30\
-\x91\x26\x67\x66\x75\xfc\xec\x90\x26\xa6\x18\xf8\x81\x04\x29\x48\
-\xe6\x97\xb6\x6e\xe8\xfd\x6b\xdf\x41\x92\x86\x02\xe0\x55\x6c\xdf\
-\x7b\xe8\xd6\x54\xa0\x5d\x56\x5a\xe0\x3b\xcb\xcb\xb5\xb5\x34\x69\
-\xd9\xc2\x6e\x75\x30\x23\x90\x08\x63\x93\x53\x3a\x3d\x34\xc2\x1b\
-\x3f\x90\x3c\x63\xc6\xea\xde\x2d\x1b\xd7\x3e\xe6\x3b\x48\x12\x51\
-\x00\xbc\x86\xed\x7b\x0f\x5c\x13\x98\x60\xa7\x8c\xde\xe2\x3b\xcb\
-\x2b\xc9\xe7\xb2\x5a\xba\xa0\x4b\x8b\xbb\x3b\x14\x98\xc4\x7c\xb1\
-\xa8\x0b\x61\x68\x35\x32\x3e\xa1\x53\x43\x23\x9a\xe5\x1b\x3f\x90\
-\x40\xe6\xe9\x54\x2a\xd8\xba\xf9\xf6\x5b\x9e\xf3\x9d\x24\xa9\x28\
-\x00\x5e\xc7\xc0\xe0\x60\x73\x56\xd9\x3f\x93\xd5\x7b\x7d\x67\x79\
-\x35\x99\x74\x5a\x4b\x16\x74\x6a\x71\x57\x07\x77\x0c\x38\x56\x28\
-\x95\x35\x34\x3a\xa6\xb3\x23\x63\xac\xea\x07\x12\xca\x4a\xbb\x4a\
-\x95\xdc\xbf\xea\xbf\xf3\xe6\x09\xdf\x59\x92\x8c\x02\xe0\x12\x58\
-\x6b\xcd\x83\xdf\x78\xfc\xa3\xd6\xda\xcf\x4a\x4a\xec\x08\x6b\x8c\
-\xd4\xd6\xdc\xa4\xc5\x5d\x5d\xea\x6c\x6f\x51\xc0\x16\xc2\x48\x58\
-\x6b\x35\x31\x3d\xab\x73\xa3\xa3\x1a\x1d\x9f\x92\xb5\xec\xe3\x07\
-\x12\xaa\x22\xa3\x4f\x6d\xf9\x99\xde\x3f\x34\xc6\xf0\xa0\xbe\x0e\
-\x46\x88\xcb\xb0\x6b\xdf\xa1\xf5\xd6\x68\x40\xd2\x22\xdf\x59\x5e\
-\x4f\x36\x93\xd1\xa2\xce\x76\x75\x77\xb6\xa9\x29\x9f\xa8\xb5\x8c\
-\x55\x63\x66\xae\xa0\xe1\x0b\x17\x74\x7e\x74\x42\xc5\x32\xbb\x86\
-\x80\x84\x1b\x91\x09\x7e\x61\x6b\xdf\xad\x7b\x7d\x07\xa9\x16\x14\
-\x00\x97\x69\xf7\x23\x07\x57\x54\x52\xe6\x6f\x94\x80\xe3\x83\x2f\
-\x55\x63\x3e\xaf\xee\x8e\x56\x75\x77\xb4\xa9\x31\xc7\x51\xc3\xaf\
-\x65\x76\x7e\x5e\x23\xe3\x93\x1a\x19\x9b\xd0\x6c\xa1\xe0\x3b\x0e\
-\x80\x4b\x60\xa4\x83\x65\x93\xfa\x85\xfb\xfb\x6e\x39\xe5\x3b\x4b\
-\x35\xa1\x00\x78\x03\x06\x06\x06\x52\xd9\x05\x3d\xbf\x21\xab\xdf\
-\x53\x82\x3f\x09\xbc\x92\xa6\x86\x9c\xba\xda\xda\xd4\xd1\xd6\xac\
-\xe6\x86\x86\xba\x3f\x69\xd0\x5a\xab\xa9\xd9\x39\x5d\x98\x9c\xd2\
-\xd8\xf8\x14\x87\xf6\x00\xd5\xa5\x6c\xad\x7e\xbf\x34\x7a\xfa\xf7\
-\xfa\xfb\xfb\xb9\x59\xeb\x32\xd5\xf7\xaf\xff\x15\xda\xb1\xef\xf0\
-\x3b\x8d\xb1\x7f\x25\x69\x8d\xef\x2c\x6f\x44\x26\x9d\x52\x7b\x4b\
-\xb3\x3a\x5a\x5b\xd4\xd1\xd2\xac\x4c\x9d\x5c\x4b\x5c\x2a\x97\x75\
-\x61\x72\x4a\x17\x26\xa7\x35\x3e\x35\xcd\x8d\x7c\x40\x75\x3a\x66\
-\x14\xbc\x7f\xcb\x86\x5b\x0f\xf9\x0e\x52\xad\x28\x00\xae\xd0\xae\
-\x83\x07\x5b\x54\x34\xff\xc9\x4a\xbf\xe2\x3b\xcb\x95\xca\xe7\xb2\
-\x6a\x6d\x6a\x54\x6b\x53\x93\x5a\x9b\x1b\xd4\x58\x23\x6b\x07\xe6\
-\x0b\x45\x4d\xce\xcc\x6a\x7a\x76\xee\x27\xff\x09\xa0\xaa\xfd\x85\
-\xc9\xda\x0f\xd7\xfb\x65\x3e\x57\x8a\x02\x20\x22\xbb\xf6\x1d\x7e\
-\xaf\x35\xf6\x8b\xaa\x82\x05\x82\x97\x2a\x93\x4e\xab\xa5\xa9\x51\
-\x4d\xf9\x9c\x1a\x1b\xf2\x6a\x6a\xcc\xab\x21\x9b\x4d\xec\x67\x03\
-\x6b\xad\xe6\x8a\x45\xcd\xcc\xce\x6b\x76\x6e\x5e\x33\x73\xf3\x9a\
-\x9a\x9d\x53\xa9\xcc\x76\x3d\xa0\x36\xd8\x73\x56\xe6\x23\xf7\x6e\
-\x58\xfb\x80\xef\x24\xb5\x20\x99\xbf\xe4\x55\x6a\xc7\xe0\x60\x7b\
-\x60\xb3\x7f\x60\xa5\x0f\xaa\x46\xff\xde\x1a\x13\xa8\xb1\x21\xab\
-\xc6\x5c\x5e\xf9\x5c\x46\xb9\x6c\x46\x0d\xd9\x9c\x72\xd9\x8c\xb2\
-\xd9\x8c\xf3\xad\x87\xa1\xb5\x2a\x16\x4b\x9a\x2f\x96\x34\x5f\x2c\
-\xa8\x50\x28\x69\xbe\x58\xd4\x6c\xa1\xa0\xd9\xf9\xa2\x6c\x18\x3a\
-\xed\x1f\x80\x17\x56\xd2\x5f\x86\x61\xfa\x13\xf7\xdd\xf1\xae\x51\
-\xdf\x61\x6a\x45\x4d\x0e\x52\xbe\xbd\xb0\x5d\xf0\x4f\x24\x5d\xeb\
-\x3b\x4b\x9c\x8c\x31\xca\xa4\xd2\xca\xa4\x53\x4a\xbf\xf0\x57\x26\
-\x9d\x52\x26\x95\x56\x2a\x95\x92\x24\xa5\x5f\xf8\x4f\x13\x48\x29\
-\x73\xf1\xbf\x57\x6c\x45\x36\x94\x24\xab\x72\xe5\xe2\x00\x5e\xa9\
-\x54\x54\xaa\x94\x55\x2a\x57\x54\x7e\xe1\xaf\x52\xf9\xe2\xff\xc7\
-\x3e\x7c\xa0\x7e\x18\xe9\x79\x6b\x82\x0f\xb1\xbd\x2f\x7a\x14\x00\
-\x8e\xec\xde\xfd\x64\x63\xa5\xa9\xb8\x4d\xb2\x9f\x90\x54\x1f\xab\
-\xeb\x00\x20\x3a\x25\x19\xfb\x9f\x8b\xb9\xe0\xd3\xfd\xbd\xbd\x2c\
-\xdc\x71\x80\x02\xc0\xb1\x5d\xfb\x0f\x5e\x6b\x65\x3e\x27\xe9\x6e\
-\xdf\x59\x00\xa0\x4a\xec\x53\xca\x7c\x62\xeb\xed\xbd\x4f\xf9\x0e\
-\x52\xcb\x28\x00\x62\xb2\x73\xf0\xf1\x3b\x64\xed\xe7\x25\xfb\x56\
-\xdf\x59\x00\x20\x89\xac\xd5\x73\x81\xcc\xa7\xb6\x6c\xec\xfd\x9a\
-\xef\x2c\xf5\x80\x2b\xe4\x62\xb2\xb5\xef\xd6\xbd\x43\xad\xd9\xb7\
-\x19\x63\x3e\x2e\x89\x0b\x2a\x00\xe0\x9f\x8d\xcb\xe8\x37\x73\x85\
-\x89\x1b\x18\xfc\xe3\xc3\x0c\x80\x07\xdb\x1f\x3e\xb4\x30\xc8\xe8\
-\x53\xba\x78\x76\x40\x6d\x6c\xb6\x07\x80\xcb\x37\x6f\x8c\xfd\xe3\
-\x42\x2a\xfc\x4c\xff\xfa\xf5\xc3\xbe\xc3\xd4\x1b\x0a\x00\x8f\x1e\
-\x18\x7c\x62\x59\xca\x56\x3e\x29\xe9\x43\x92\x38\xa4\x1f\x40\xbd\
-\x28\x19\xe9\xff\x0d\xac\xf9\xf4\xe6\x8d\xbd\xa7\x7d\x87\xa9\x57\
-\x14\x00\x09\xb0\xfb\x91\x83\x2b\xc2\x94\xf9\x94\x95\x7e\x49\xec\
-\x18\x00\x50\xbb\x4a\x92\xfe\x87\xb5\xfa\xdd\x7b\x37\xae\x3d\xe2\
-\x3b\x4c\xbd\xa3\x00\x48\x90\xdd\x8f\x3e\x71\x75\xa5\x52\xf9\xa4\
-\xa4\x7f\x29\x3e\x0d\x00\xa8\x1d\x73\x92\xfd\x73\x6b\xcd\x67\x19\
-\xf8\x93\x83\x02\x20\x81\x06\x1e\x7b\x6c\x41\xa6\x94\xfa\xb0\x31\
-\xfa\xb0\xa4\x6e\xdf\x79\x00\xe0\x0d\x1a\x91\xd5\x57\x4d\xc5\x7e\
-\x61\xcb\xbb\xd7\x9d\xf1\x1d\x06\xff\x2b\x0a\x80\x04\xdb\xb3\x67\
-\x4f\xae\x98\x6f\xff\x79\x59\xfb\x9b\x32\x7a\x8b\xef\x3c\x00\x70\
-\x29\x8c\xf4\xbc\x8c\xf9\x42\x30\x9d\xfd\xca\xe6\xcd\x37\xcf\xfa\
-\xce\x83\x57\x46\x01\x50\x05\xb6\x6d\xb3\xc1\xdb\xd6\x1f\xba\x4b\
-\xd6\x7c\x50\x46\x3f\x2b\xd6\x09\x00\x48\x9e\x92\x8c\xfd\xba\x0d\
-\xf5\x95\xef\x1e\x58\xfb\xf0\xb6\x6d\x86\x8b\x39\x12\x8e\x02\xa0\
-\xca\xfc\xdd\xe0\xb7\x16\x97\x54\xfa\x57\xb2\xfa\x65\x49\x6b\x7c\
-\xe7\x01\x50\xdf\xac\xd5\x73\x92\xfe\xda\xa4\xcb\x5f\xdd\x7a\xfb\
-\xed\x27\x7d\xe7\xc1\xa5\xa3\x00\xa8\x52\xd6\x5a\xb3\x7b\xff\xe1\
-\xbe\x8a\xf4\x6f\x8c\xd1\x16\x49\x2d\xbe\x33\x01\xa8\x1b\x93\x92\
-\x76\x59\x13\xfe\xd9\xd6\x9f\x59\xf7\xa8\x31\x86\x1b\xba\xaa\x10\
-\x05\x40\x0d\x18\x1c\x1c\xcc\x4f\x84\xe9\x3b\x65\x82\xf7\x4a\xda\
-\x2a\x8a\x01\x00\xd1\x9b\x33\x56\xfb\xac\x31\x5f\x6b\x28\x4d\x3d\
-\xb0\x69\xd3\xa6\x19\xdf\x81\x70\x65\x28\x00\x6a\xcc\xee\xdd\x4f\
-\x36\x86\x8d\xc5\x7f\x61\x65\xfb\x65\xb4\x49\x14\x03\x00\xde\xb8\
-\x49\x23\xf3\x50\x28\x3b\x50\xca\x9b\x3d\xdc\xca\x57\x5b\x28\x00\
-\x6a\xd8\xc0\xc0\x40\x2a\xd3\xbd\xe4\x6d\xb2\xc1\x66\x63\xcc\xcf\
-\x4a\xf6\xa7\xc4\x3f\x73\x00\xaf\xc1\x48\xcf\x5b\xe9\xeb\x32\xc1\
-\xee\xe2\x70\xeb\x63\xfd\xfd\xd7\x15\x7d\x67\x82\x1b\x0c\x06\x75\
-\x64\xf7\xbe\xc3\x3d\xe5\x20\xbc\xcb\x58\x73\xa7\xa4\xdb\x24\x2d\
-\xf5\x9d\x09\x80\x77\xa7\x64\x75\xd0\x18\xf3\x88\xca\xe1\x43\xec\
-\xd7\xaf\x1f\x14\x00\x75\x6c\xd7\x3f\x1c\x5c\xaa\x54\xb0\xd6\x1a\
-\xbb\x4e\x32\x6b\x25\xfb\x76\x71\x43\x24\x50\xd3\x5e\x78\xc3\x3f\
-\x64\x65\x0e\xa6\x14\x1e\xba\x67\xc3\xba\x1f\xf8\xce\x04\x3f\x28\
-\x00\xf0\x13\x03\x8f\x3c\xd9\x96\x49\x15\x6f\x96\xd5\x0d\x32\xf6\
-\x06\x23\xdd\x28\xe9\xad\x92\x1a\x7d\x67\x03\x70\xd9\x66\xad\xd1\
-\x0f\x02\x6b\xbe\x27\xa3\xa7\x4c\x68\x9f\x9a\x0f\x73\xdf\xee\xbf\
-\xf3\x66\xae\x23\x87\x24\x0a\x00\xbc\x8e\x81\x81\x81\x54\xba\x73\
-\xc9\x9b\x82\x54\x70\xa3\xb1\xf6\x6a\xc9\xac\x0a\x8d\x56\x2b\xd4\
-\x2a\x63\xb4\x52\x52\xd6\x77\x46\xa0\x8e\x15\xac\xd5\x09\x63\x74\
-\xd4\x48\xc7\xac\x35\x47\xad\xb1\xcf\xa5\x53\xa9\xef\x7d\x7b\xf0\
-\x5d\x47\x38\x8c\x07\xaf\x85\x02\x00\x6f\xd8\xb6\x6d\x36\xb8\xe1\
-\xf6\x6f\x2e\x35\x2a\xaf\x32\xd6\x2c\x0a\xac\x5d\x20\x99\x6e\x05\
-\xb6\xcb\x5a\xd3\x25\xa9\x4b\x32\x5d\x92\x6d\x36\x52\x83\x24\x59\
-\xa9\x4d\x17\x3f\x33\x64\x24\x35\xfb\xcc\x0f\x24\xc4\xb4\x2e\xde\
-\x92\x17\x1a\x69\x42\x92\xac\x34\x27\x99\x69\xc9\x8e\x4a\x1a\x35\
-\xc6\x8e\x5a\x99\x11\x13\xda\xd1\xd0\x98\x61\x6b\xec\x50\x26\x0c\
-\x8e\x7e\xfb\xc0\xad\x67\x19\xe4\x01\x00\x00\x00\x00\x00\x00\x00\
-\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\
-\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\
-\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\
-\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\
-\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\
-\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\
-\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\
-\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\
-\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\
-\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\
-\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\
-\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\
-\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\
-\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\
-\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\
-\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\
-\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\
-\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\
-\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\
-\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\
-\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\
-\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\
-\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\
-\x00\x00\x00\x00\x00\x50\x2b\xfe\x7f\x1d\x29\x68\xbd\x56\x75\x53\
-\x4b\x00\x00\x00\x00\x49\x45\x4e\x44\xae\x42\x60\x82\
-\x00\x00\x69\x41\
-\x89\
-\x50\x4e\x47\x0d\x0a\x1a\x0a\x00\x00\x00\x0d\x49\x48\x44\x52\x00\
-\x00\x02\x00\x00\x00\x02\x00\x08\x06\x00\x00\x00\xf4\x78\xd4\xfa\
-\x00\x00\x00\x09\x70\x48\x59\x73\x00\x00\x0e\xc3\x00\x00\x0e\xc3\
-\x01\xc7\x6f\xa8\x64\x00\x00\x00\x19\x74\x45\x58\x74\x53\x6f\x66\
-\x74\x77\x61\x72\x65\x00\x77\x77\x77\x2e\x69\x6e\x6b\x73\x63\x61\
-\x70\x65\x2e\x6f\x72\x67\x9b\xee\x3c\x1a\x00\x00\x20\x00\x49\x44\
-\x41\x54\x78\x9c\xec\xdd\x79\xb8\x55\x65\xd9\x3f\xf0\xef\xfd\xac\
-\xbd\xf7\x19\x99\xe7\x19\x44\x10\x41\x1c\x00\x41\x50\xc0\x21\x53\
-\x4b\xeb\xad\x37\xb5\xf4\xd5\xac\x04\x1c\xca\x06\x4d\xb2\xfa\xf5\
-\xd2\xe8\x6c\x66\x99\x49\x36\x98\xda\xa0\x65\x59\xbe\xa9\x69\x29\
-\x32\xc8\x3c\x88\x20\x88\x0a\x08\x32\x73\x38\xc0\x19\xf6\xd9\x7b\
-\xad\xe7\xfe\xfd\x81\x1a\x21\xc3\xd9\xe3\xb3\xf6\x5e\xdf\xcf\x75\
-\x75\x55\x70\xd6\xb3\xbe\xe2\xe1\x3c\xf7\x7e\x46\x80\x88\x88\x88\
-\x88\x88\x88\x88\x88\x88\x88\x88\x88\x88\x88\x88\x88\x88\x88\x88\
-\x88\x88\x88\x88\x88\x88\x88\x88\x88\x88\x88\x88\x88\x88\x88\x88\
-\x88\x88\x88\x88\x88\x88\x88\x88\x88\x88\x88\x88\xf2\x49\x5c\x07\
-\x20\xa2\xc3\xbb\x67\x8d\x56\x34\xef\x44\x17\xb5\xe8\x10\x8b\xa1\
-\x83\x5a\x74\x50\x83\x0e\x50\x74\x50\xb5\x1d\x8c\xa0\x83\x02\x1d\
-\x00\xe9\x00\xec\xfb\x75\x08\x12\xef\x3c\xee\x01\x68\xbb\x5f\x73\
-\x35\xc0\x7b\xbf\x77\x20\x05\x50\xff\xce\xff\x6e\x00\x90\x7e\xe7\
-\x3f\x0d\xef\xfc\xda\x6e\x00\x29\x40\x77\xaa\x62\xa7\xc0\xec\x04\
-\xb0\x13\x82\x3a\x55\xec\x88\x79\xd8\x91\x16\xec\xf4\xe2\xd8\xf9\
-\xd5\x13\xa4\x31\x9f\x7f\x06\x44\x94\x7f\x2c\x00\x88\x1c\x7a\xf4\
-\x51\xf5\x36\xf6\x46\xf7\x54\x0c\xfd\x3c\xa0\xb7\x05\xfa\xc0\xda\
-\xbe\x22\xd2\x07\x40\x1f\x00\xbd\x01\x74\x77\x1c\x33\x1b\x49\x00\
-\x3b\x01\x6c\x80\xea\x7a\x08\xd6\xab\x98\xf5\x46\xb1\x3e\x10\xac\
-\x4b\x36\x62\xfd\xb4\x33\xa4\xe1\x48\x8d\x10\x51\xe1\xb0\x00\x20\
-\x2a\x82\x5b\x16\x6a\x5f\xe3\x63\x08\x04\xc3\x54\xed\xb1\x22\x32\
-\x04\x40\x3f\x00\x3d\x00\xc4\x1d\xc7\x73\x65\x27\x04\xeb\xa1\x58\
-\xaf\xa2\xeb\xa1\x66\xb5\x00\x2b\x62\x01\x56\x7c\x65\x9c\xd4\xb9\
-\x0e\x47\x54\xee\x58\x00\x10\xe5\xd1\xad\xb3\xb4\xa7\xa9\xc0\x50\
-\x0d\x30\x0c\xc6\x0e\x85\x95\x61\x10\x0c\xc7\x7f\x0e\xc3\xd3\x91\
-\xed\x82\x62\x25\x8c\xae\x80\x35\x2b\xc5\xc3\x0a\x11\x2c\xbd\x61\
-\x94\xec\x70\x1d\x8c\xa8\x5c\xb0\x00\x20\xca\xd2\x6d\x73\x75\x90\
-\x1a\x8c\x86\xb5\xa3\x45\x64\x0c\x80\xe1\x00\xaa\x5d\xe7\x2a\x73\
-\xeb\x55\xb1\x52\x44\x97\xa8\x35\xf3\x7c\xc1\xbc\x6f\x9c\x22\x5b\
-\x5d\x87\x22\x2a\x45\x2c\x00\x88\x5a\xe1\x96\x85\xda\x0e\x3e\x86\
-\x8b\xe0\x54\x81\x9e\x06\x60\x0c\x80\x2e\xae\x73\x11\xa0\xc0\x66\
-\x01\x16\x29\x64\x96\x2a\x66\x27\x2c\x16\x7d\x65\x9c\x34\xbb\xce\
-\x45\x14\x76\x2c\x00\x88\x0e\xa0\xaa\x72\xc7\x3c\x0c\x57\xe0\x0c\
-\x88\x1d\x03\xc8\x18\x00\x47\xb9\xce\x45\xad\x96\x02\xb0\x44\x55\
-\xe7\x19\x31\xf3\x02\x0f\xb3\xbe\x36\x4a\xde\x72\x1d\x8a\x28\x6c\
-\x58\x00\x10\x01\xf8\xe1\x42\xed\x91\x0e\x70\x1a\xc4\x7e\x00\x2a\
-\x1f\xc2\xbe\xd5\xf7\x54\x3e\xde\x84\xe8\x73\x50\xf3\x5c\x2c\xc0\
-\x3f\xb9\xc8\x90\x88\x05\x00\x45\xd4\xad\xb3\xb4\x8d\xa9\xc0\x18\
-\x58\xfb\x01\x85\x7c\x00\xc0\x48\xd7\x99\xa8\x68\x02\x00\x4b\x05\
-\xfa\x1c\x8c\x79\xae\xb1\x01\xb3\xa6\x9d\x21\x49\xd7\xa1\x88\x8a\
-\x8d\x05\x00\x45\xc2\xa3\x8f\xaa\xb7\xae\x3f\x4e\x13\xb5\xe7\xbd\
-\xd3\xe1\x9f\x04\xc0\xb8\xce\x45\xa1\xd0\x08\x60\xa6\x8a\x3c\xe7\
-\x59\x3c\x75\xc3\x29\xb2\xd2\x75\x20\xa2\x62\x60\x01\x40\x65\xeb\
-\x9e\x35\x5a\xd1\x52\x8f\xf1\x36\xb0\x17\x40\xe4\x42\xd9\xb7\xe7\
-\x9e\xe8\x48\xd6\xaa\xea\xdf\x14\xe6\xb1\xa9\x63\x30\x5b\x44\xd4\
-\x75\x20\xa2\x42\x60\x01\x40\x65\x65\xda\x42\xad\xae\xb1\x38\x0b\
-\x6a\x2f\x54\xc8\x47\xc1\xfd\xf7\x94\x9b\xed\x02\x7d\x1a\x62\x1e\
-\x6b\xac\xc1\x33\xd3\x86\x49\xca\x75\x20\xa2\x7c\x61\x01\x40\x25\
-\xef\x07\xf3\xb4\x53\x0c\xf8\x30\xa0\x17\x02\x38\x1b\x40\x85\xeb\
-\x4c\x54\x96\x76\x01\x78\x0e\x90\x27\x35\x8d\x3f\x4f\x3d\x4d\xf6\
-\xba\x0e\x44\x94\x0b\x16\x00\x54\x92\x6e\x9d\xa5\x6d\x10\xc3\x27\
-\xc4\xe8\xe5\x50\x8c\xc7\xbe\x4b\x6f\x88\x8a\xa5\x09\xd0\x27\x20\
-\xe6\x37\xfd\xd7\xe1\xd9\x8b\x2e\x92\xc0\x75\x20\xa2\x4c\xb1\x00\
-\xa0\x92\x31\x4d\xd5\x54\xce\xc3\x38\x63\xec\x65\xa2\x72\x89\x02\
-\xb5\xae\x33\x11\x29\xb0\x19\xaa\x8f\x89\x9a\x07\x6f\x1c\x2b\x8b\
-\x5d\xe7\x21\x6a\x2d\x16\x00\x14\x7a\x77\xce\xd3\xc1\x3e\xec\x25\
-\x02\xb9\x1c\xc0\x00\xd7\x79\x88\x0e\x63\xa5\x42\x7e\x23\x82\x07\
-\x6f\x1c\x2d\x5b\x5c\x87\x21\x3a\x1c\x16\x00\x14\x4a\xb7\x2c\xd4\
-\x76\x26\xc0\x47\xa1\x7a\x19\x04\x67\x81\xdf\xab\x54\x5a\x02\x28\
-\x9e\x87\xc8\x43\x4d\x1e\xfe\x38\x6d\x94\x34\xb9\x0e\x44\x74\x20\
-\xfe\x50\xa5\x50\x49\x2f\xb9\xea\xf4\xf9\xc1\x79\xe7\xcf\x0e\x2e\
-\xb8\x1a\xbc\x58\x87\xca\x43\x1d\x44\x7f\x19\x88\xb9\xef\xa6\x93\
-\xe5\x4d\xd7\x61\x88\xde\xc5\x02\x80\x9c\xd3\x55\x9f\x6d\x63\x93\
-\xf1\x4f\x41\xf5\x5a\x00\xc7\x03\xc0\x3a\x7b\xec\x2b\x7f\x09\xae\
-\xa9\x0a\x34\x3e\xd0\x71\x3c\xa2\x7c\xb1\x50\xfc\x0b\x22\xd3\xfb\
-\xaf\xc7\xe3\x5c\x38\x48\xae\xb1\x00\x20\x67\x74\xd1\x95\xc7\x5a\
-\x63\xae\x05\x70\x19\x0e\xb2\x5f\x3f\x40\xac\xe5\xd1\xf4\xf5\xf3\
-\x36\xe9\x80\x09\xc5\x4f\x47\x54\x50\x6b\x00\xb9\x2f\x9e\xc0\xaf\
-\xbe\x7c\x92\xd4\xbb\x0e\x43\xd1\xc4\x02\x80\x8a\x4a\x15\x12\x2c\
-\x9b\xf4\x61\x63\xcd\x97\x55\xf4\x0c\xb4\xe2\x7b\x70\x7e\x70\xce\
-\xac\x99\xc1\xc7\x4e\x02\x50\x53\xf8\x84\x44\x45\x95\x14\xe8\x63\
-\x01\xcc\x9d\x5f\x1b\x23\xcb\x5c\x87\xa1\x68\x61\x01\x40\x45\xa1\
-\x2b\x2e\x4c\x04\x2d\x1d\x3f\x29\xa2\x37\x02\x18\x96\xe9\xf3\x9b\
-\xb4\xff\xda\xc7\xfc\xeb\x3d\x5f\xe3\x7d\x0b\x10\x8f\xc8\x39\x05\
-\x5e\x34\x22\x77\xdc\x70\x32\x9e\xe4\xf1\xc3\x54\x0c\x2c\x00\xa8\
-\xa0\x74\xd5\x67\xdb\xd8\x66\xef\xb3\x80\xdc\x80\x1c\xaf\xd8\x4d\
-\xa1\x6a\xef\x43\xe9\xaf\xaf\xa8\xd7\x2e\xa7\xe4\x29\x1e\x51\x18\
-\xbd\x02\xc8\xed\x4d\x4d\xf8\xed\xb4\x33\xc4\x77\x1d\x86\xca\x17\
-\x0b\x00\x2a\x08\x5d\xfc\xd9\x9e\x16\xde\xf5\x10\x99\x04\xa0\x4d\
-\xfe\x5a\x16\x7d\xca\xff\xcc\x8c\x95\x76\xf4\x04\xf0\x36\x3f\x2a\
-\x6f\x6f\x40\xe5\xb6\xca\x4e\x78\xf0\xba\x41\xd2\xe2\x3a\x0c\x95\
-\x1f\x16\x00\x94\x57\xba\xfc\xca\x6e\x36\x2d\x5f\x86\xc8\x75\x00\
-\xaa\x0a\xf5\x9e\x97\x83\x09\xf3\x9e\x0d\x2e\x19\x0e\x6e\x15\xa4\
-\xf2\xb7\x55\xa1\x3f\x53\xcf\xfc\xf0\x6b\xa3\x64\xb7\xeb\x30\x54\
-\x3e\x58\x00\x50\x5e\xe8\xf2\x6b\xfa\xd8\xc0\xbf\x01\x8a\x49\x28\
-\x60\xc7\xbf\xbf\x4d\x3a\xe0\xb5\xdf\xfb\x5f\xad\x55\x35\x3d\x8b\
-\xf1\x3e\x22\xc7\x76\x2a\xf4\x27\xf1\xc0\xdc\xf3\x95\x71\x52\xe7\
-\x3a\x0c\x95\x3e\x16\x00\x94\x13\x5d\x38\xb9\xaf\x8d\xe1\x7a\x00\
-\x93\xa1\xa8\x2c\xf6\xfb\xf7\xa0\xd3\xd6\x5f\xa7\xbe\xb5\x3b\x8d\
-\x8a\xc1\xc5\x7e\x37\x91\x23\x7b\x15\x7a\x8f\x7a\xe6\x76\x8e\x08\
-\x50\x2e\x58\x00\x50\x56\x74\xde\xb5\x9d\x6c\x3c\xf5\x55\x18\xf9\
-\xa2\x8b\x8e\x7f\x7f\x3e\x2a\x1b\x7f\xe5\x7f\xeb\x95\x3d\xb6\xe3\
-\x18\x97\x39\x88\x8a\xac\x4e\x21\xb7\xc5\x03\xdc\xf3\x95\x71\xd2\
-\xec\x3a\x0c\x95\x1e\x16\x00\x94\x11\x5d\x76\x59\x8d\xd5\xea\xcf\
-\x43\xf5\x26\x00\xed\x5c\xe7\x79\x97\xc2\x04\xbf\x4d\xdd\x38\x67\
-\x0b\xfa\x8f\x77\x9d\x85\xa8\xc8\x36\x42\xe5\xbb\x4d\xcd\xf8\x25\
-\x77\x0d\x50\x26\x58\x00\x50\xab\xe8\xc2\xc9\x71\x1b\x93\xcf\x00\
-\xfa\x6d\x28\xba\xbb\xce\x73\x70\xa2\x7f\xf2\x3f\xff\xe2\x3a\x3b\
-\x6c\xa2\xeb\x24\x44\x45\xa7\x58\x05\x91\x6f\x7d\x75\x34\xfe\xc8\
-\x73\x04\xa8\x35\x58\x00\xd0\x61\xa9\x42\x82\x25\x93\x2e\x16\x91\
-\xef\x03\x38\xca\x75\x9e\xd6\x78\x3a\xb8\xe2\x5f\x2b\x82\x53\xce\
-\x74\x9d\x83\xc8\x91\x79\xaa\x72\xd3\xd4\x53\xe4\x79\xd7\x41\x28\
-\xdc\x58\x00\xd0\x21\xe9\xa2\x2b\x47\x06\xe2\xfd\x50\x44\x4b\x6e\
-\x58\xfd\x85\xe0\xc2\x99\x8b\x82\xb3\x4e\x05\xcf\x0a\xa0\x88\x52\
-\xe0\xff\x3c\x95\x1b\x6f\x38\x45\x56\xba\xce\x42\xe1\xc4\x02\x80\
-\xde\x47\x17\x4e\xee\x61\x3d\xf9\x01\xa0\x97\xa3\x84\x3b\xd0\x79\
-\xc1\xb9\xb3\x67\x05\xff\x35\x16\x25\xfc\xcf\x40\x94\xa3\xb4\x42\
-\x7f\x5c\xa5\xe6\xdb\xd7\x9d\x22\x7b\x5c\x87\xa1\x70\x61\x01\x40\
-\xef\xd1\x15\x17\x26\x6c\xaa\xfd\xd5\x80\x7c\x07\x07\xb9\x9d\xaf\
-\x14\xcd\x0d\xce\x9f\x35\x3b\x38\x7f\x1c\x58\x04\x50\x84\x29\xb0\
-\x59\x20\x5f\xfb\xea\x68\x3c\xc4\xf5\x01\xf4\x2e\x16\x00\x04\x00\
-\xf0\x97\x4d\xb9\x40\xac\xfe\x08\xc0\x00\xd7\x59\xf2\xed\x79\xff\
-\xa2\x17\x17\xdb\x33\x79\xa5\x30\x11\xb0\xc0\x88\x5c\x7b\xc3\x68\
-\x59\xe0\x3a\x08\xb9\xc7\x02\x20\xe2\x74\xf1\x67\x7b\x5a\x13\xbb\
-\x05\x8a\xcb\x5c\x67\x29\xa4\x7f\xf9\x9f\x9a\xb1\xc4\x4e\xe4\xee\
-\x00\x22\xc0\x0a\xf4\x11\xf1\xcc\x57\x6e\x18\x25\x3b\x5c\x87\x21\
-\x77\x58\x00\x44\x94\x3e\x3f\x2d\x66\x3b\x6c\xbe\x0e\xaa\xdf\x06\
-\x50\xeb\x3a\x4f\x31\xfc\x9f\x3f\xe9\x85\x55\x76\xe4\xe9\xae\x73\
-\x10\x85\xc4\x36\x55\xf9\xda\x8d\x63\xf0\x6b\x4e\x0b\x44\x13\x0b\
-\x80\x08\xd2\x65\x93\x47\x04\x16\x3f\x13\xe0\x64\xd7\x59\x8a\xed\
-\x77\xe9\x1b\x67\x6e\xd2\xa3\x4a\x6e\x57\x03\x51\x01\xcd\x15\x23\
-\x93\xbe\x7a\xb2\xbc\xe2\x3a\x08\x15\x17\x0b\x80\x08\xd1\x55\x9f\
-\x6d\x63\x9b\xe3\xb7\x00\x7a\x15\x22\xba\x28\x4e\x61\xfc\xe9\xa9\
-\x1f\x2c\x6a\x40\x7b\x1e\x1b\x4c\xf4\x6f\x69\x81\xde\xd5\x58\x6b\
-\xbe\x35\x6d\x98\xa4\x5c\x87\xa1\xe2\x60\x01\x10\x11\xba\xec\xca\
-\xf1\xd6\x9a\x5f\x02\x38\xda\x75\x16\xd7\x52\x5a\xd9\xf0\xb3\xf4\
-\xad\x9b\x78\x81\x10\xd1\x01\x04\xcb\x8d\x95\xcf\xdc\x70\x8a\x2c\
-\x72\x1d\x85\x0a\x8f\x05\x40\x99\xd3\xb9\x5f\x68\x6b\x2b\x5a\x6e\
-\x07\x30\x09\xfc\xf7\xfd\x9e\xbd\xda\x71\xeb\x03\xfe\xf7\xac\x55\
-\xd3\xc3\x75\x16\xa2\x90\xf1\x05\x7a\x67\x45\x47\xf3\xbf\xd7\x0d\
-\x92\x16\xd7\x61\xa8\x70\xd8\x21\x94\xb1\xf4\xa2\x29\xe7\x1a\xd1\
-\xe9\x10\xf4\x71\x9d\x25\x8c\x36\xe8\xe0\x95\x8f\xa6\xbf\x32\x10\
-\x40\x85\xeb\x2c\x44\xa1\x23\x58\xae\x2a\x9f\x9d\x3a\x46\x16\xba\
-\x8e\x42\x85\xc1\x02\xa0\x0c\xe9\xaa\xcf\xb6\xb1\x4d\xb1\xbb\x21\
-\xf8\xac\xeb\x2c\x61\x37\xc3\xbf\xe8\xc5\x85\x3c\x23\x80\xe8\x50\
-\x7c\x55\xfd\x69\x73\xcc\xdc\x34\x6d\x94\x34\xb9\x0e\x43\xf9\xc5\
-\x02\xa0\xcc\xe8\xd2\xab\x46\x5b\xb5\x8f\x80\x73\xfd\xad\xf6\xcb\
-\xf4\xff\xce\xdd\xa5\x3d\x4e\x71\x9d\x83\x28\xc4\x5e\x55\x23\x57\
-\x4c\x3d\x59\xe6\xbb\x0e\x42\xf9\xc3\x02\xa0\x4c\xbc\xb3\xaf\xff\
-\x7a\xa8\x7e\x17\x40\xdc\x75\x9e\x52\x92\xd2\x8a\xc6\xfb\xd2\x77\
-\x6c\xf5\x11\x2f\x89\xdb\x0e\x89\x1c\xf1\x15\xfa\xfd\xe6\xd1\xe6\
-\x3b\xd3\x44\xac\xeb\x30\x94\x3b\x16\x00\x65\x40\x5f\xbe\xfa\xa8\
-\x20\x08\x1e\x16\x60\xac\xeb\x2c\xa5\x6a\xb3\xed\xb7\xe6\xb7\xfe\
-\x4d\xbd\x01\x54\xb9\xce\x42\x14\x6a\x82\x67\x01\xb9\xfc\xc6\xd1\
-\xb2\xc5\x75\x14\xca\x4d\x24\xf7\x82\x97\x13\x7f\xc9\xe4\x4f\xdb\
-\x20\x58\xca\xce\x3f\x37\x3d\xcc\xfa\x41\xc7\x99\xd9\x1c\xde\x24\
-\x3a\x12\xc5\xd9\x50\x7d\xf9\xf6\x79\xfa\x61\xd7\x51\x28\x37\x1c\
-\x01\x28\x51\x3a\xe7\xcb\x55\xb6\xaa\xf1\x1e\x00\x57\xba\xce\x52\
-\x2e\x14\x62\x7f\x9a\xbe\x73\x45\x52\xab\x87\xbb\xce\x42\x54\x02\
-\x54\x55\x7f\x5c\xd5\xc9\xdc\xc8\xed\x82\xa5\x89\x23\x00\x25\x48\
-\x17\x4e\x1e\x62\xab\x1a\xe7\x83\x9d\x7f\x5e\x09\xd4\x5c\x9c\xb8\
-\xab\x06\x40\xd2\x75\x16\xa2\x12\x20\x22\x72\x5d\x72\x97\xce\xb9\
-\x6d\xae\x0e\x72\x1d\x86\x32\xc7\x02\xa0\xc4\xf8\x8b\xa7\x5c\x6e\
-\x3d\x2c\x04\x70\x9c\xeb\x2c\xe5\xa8\xb3\x6e\x3c\xea\x58\xb3\x70\
-\xae\xeb\x1c\x44\x25\x43\x31\x02\xa2\x8b\x6e\x9b\xab\x93\x5d\x47\
-\xa1\xcc\x70\x0a\xa0\x44\xe8\xc2\xc9\xd5\xd6\x93\x7b\x01\xbd\xc2\
-\x75\x96\x72\x67\xe1\xa5\xef\x49\xfd\x68\x43\x80\x18\x77\x05\x10\
-\x65\x40\xa0\x0f\x36\x36\x99\xab\xa6\x9d\x21\x1c\x45\x2b\x01\x1c\
-\x01\x28\x01\xba\x74\xd2\x60\xeb\x61\x3e\x3b\xff\xe2\x30\x08\xe2\
-\x67\xc7\x7e\xbb\xd3\x75\x0e\xa2\x52\xa3\x90\x4f\x57\x57\xeb\x4b\
-\x37\xbf\xa4\xfd\x5d\x67\xa1\x23\x63\x01\x10\x72\xfe\xe2\x49\xe7\
-\x59\x95\xb9\x00\x86\xb9\xce\x12\x25\xc3\xcc\x9c\x93\xab\x65\xcf\
-\x62\xd7\x39\x88\x4a\xd0\x89\x9e\xd1\x05\xb7\xcf\xd3\x33\x5d\x07\
-\xa1\xc3\x63\x01\x10\x52\xaa\x90\x60\xe9\x94\xa9\x22\xf2\x24\x80\
-\x0e\xae\xf3\x44\xd1\x47\x63\xf7\xd5\x02\x08\x5c\xe7\x20\x2a\x41\
-\x9d\x15\xfa\xcc\xad\xf3\x74\xaa\xeb\x20\x74\x68\x5c\x03\x10\x42\
-\xba\xe2\x9a\x5a\x4d\xa5\x7f\xa5\x90\x4f\xb8\xce\x12\x75\x0f\xa5\
-\xbe\x31\x6b\x1b\xfa\x9c\xe6\x3a\x07\x51\xa9\x12\xd1\x5f\x35\x36\
-\x9a\x6b\xb8\x2e\x20\x7c\x38\x02\x10\x32\xba\x70\xf2\x40\xdb\xe2\
-\xcf\x61\xe7\x1f\x0e\xe7\xc5\x7f\xd5\x1b\x00\x8f\x3d\x25\xca\x92\
-\xaa\x7c\xa6\xaa\x5a\xe7\xdc\x31\x5b\xfb\xb9\xce\x42\xff\x89\x05\
-\x40\x88\xe8\xe2\x49\x13\xad\x87\xf9\x10\xf0\x20\x9a\x90\xe8\x2c\
-\x9b\xfa\xb7\x97\x1d\x3c\x21\x90\x28\x07\x02\x9c\x64\x63\xba\xf0\
-\xd6\xb9\x7a\x86\xeb\x2c\xf4\x6f\x2c\x00\x42\xc2\x5f\x3a\xe5\x62\
-\x6b\xe4\x69\x00\x1d\x5d\x67\xa1\xff\xf4\xc1\xd8\x43\x6d\x5d\x67\
-\x20\x2a\x03\x9d\x45\xf4\xe9\xdb\xe6\x29\x0f\x30\x0b\x09\x16\x00\
-\x8e\xed\x5b\xec\x37\xf9\x3b\xa2\xfa\x3b\x28\x2a\x5d\xe7\xa1\xf7\
-\xeb\x23\xab\x87\x56\x49\xe3\x52\xd7\x39\x88\xca\x40\x02\xd0\x9f\
-\xdf\x36\x37\xf8\xae\xaa\x72\x0d\x9a\x63\xfc\x17\xe0\x90\xae\xf9\
-\x42\x85\x6d\x68\x79\x00\xc0\xff\xb8\xce\x42\x87\xb7\xd4\x9e\xf1\
-\xd2\x3f\xfd\x8b\x79\xe1\x12\x51\xde\xe8\x6f\xda\x79\xe6\xca\x29\
-\xa3\x24\xed\x3a\x49\x54\x71\x04\xc0\x11\x9d\x77\x6d\xa7\xa0\xa1\
-\xe5\x1f\x60\xe7\x5f\x12\x86\x9b\x59\x23\x05\xa8\x73\x9d\x83\xa8\
-\x7c\xc8\xe5\xbb\x03\x7d\xea\x96\x85\xda\xce\x75\x92\xa8\x62\x01\
-\xe0\x80\x2e\xb9\xaa\xbf\x4d\xa4\xe7\x08\x30\xc1\x75\x16\x6a\x1d\
-\x0f\xe9\x44\x0f\x59\xfb\x8a\xeb\x1c\x44\x65\xe6\x2c\x13\xe8\xac\
-\x3b\xe7\x6b\x1f\xd7\x41\xa2\x88\x05\x40\x91\xe9\xd2\x49\xc3\x2c\
-\xec\x4c\x00\x83\x5d\x67\xa1\xcc\x8c\xf3\xfe\xca\x05\x9a\x44\xf9\
-\x77\x5c\x00\x9d\x7b\xcb\x3c\x3d\xc1\x75\x90\xa8\x61\x01\x50\x44\
-\xba\xec\xca\xf1\x56\x65\x16\x80\xde\xae\xb3\x50\xe6\xfa\x99\x57\
-\x8f\xf3\xe0\x6f\x70\x9d\x83\xa8\xec\x28\x7a\x1a\xe8\xf3\xb7\xcd\
-\xd7\x89\xae\xa3\x44\x09\x0b\x80\x22\xf1\x97\x4d\xb9\xc0\x5a\xf3\
-\x0c\x80\xf6\xae\xb3\x50\xf6\xba\x99\x75\x6b\x5d\x67\x20\x2a\x53\
-\x1d\xa0\xfa\x8f\xdb\xe7\xe9\x25\xae\x83\x44\x05\x0b\x80\x22\xf0\
-\x17\x4f\xb9\x5c\xac\x3e\x0e\xa0\xca\x75\x16\xca\xcd\x70\x99\xc3\
-\xad\x9a\x44\x85\x93\x50\xe8\x43\xb7\xcf\xd3\x29\xae\x83\x44\x01\
-\x0b\x80\x02\x0b\x96\x4c\xba\x46\x44\x7f\x0d\x20\xe6\x3a\x0b\xe5\
-\x6e\x88\xb7\x78\x18\x80\x16\xd7\x39\x88\xca\x98\x51\xe8\x7d\xb7\
-\xcf\xd5\x2f\xb9\x0e\x52\xee\x58\x00\x14\x50\xb0\x64\xd2\x4d\x80\
-\xdc\x0b\x9e\xb7\x50\x36\x62\x48\xd6\x54\xc9\xde\x95\xae\x73\x10\
-\x95\x39\x51\xd1\x1f\xde\x3a\x4f\xbf\xea\x3a\x48\x39\x63\x01\x50\
-\x20\xc1\xd2\x29\x53\x01\xf9\x81\xeb\x1c\x94\x7f\xbd\x64\xed\x6e\
-\xd7\x19\x88\xa2\x40\xa0\xb7\xdd\x3e\x2f\xb8\xc5\x75\x8e\x72\xc5\
-\x02\xa0\x00\x82\xc5\x93\xbe\x0b\x55\x7e\xd3\x96\xa9\x7e\xe6\xd5\
-\x0a\xd7\x19\x88\xa2\x42\x21\x53\x59\x04\x14\x06\x0b\x80\x3c\x52\
-\x85\x04\x4b\x26\xff\x10\x22\xdf\x74\x9d\x85\x0a\xa7\xb7\xac\xee\
-\xe9\x3a\x03\x51\x94\x28\x64\xea\x6d\x73\x83\x3b\x78\x7f\x40\x7e\
-\xb1\x00\xc8\x13\x55\x88\x5d\x3a\xf9\x5e\x00\x5c\xb8\x52\xe6\x3a\
-\xcb\xe6\xbe\x02\xdd\xe3\x3a\x07\x51\xa4\x88\x5c\x7f\xfb\x7c\xfb\
-\xd3\x69\xaa\xec\xb7\xf2\x84\x7f\x90\x79\x62\x97\x4e\xbe\x0b\xc0\
-\xd5\xae\x73\x50\x31\xa8\xc4\x91\xdc\xe8\x3a\x05\x51\xf4\xc8\x55\
-\xd5\x0b\xec\x7d\x2c\x02\xf2\x83\x7f\x88\x79\x10\x2c\x99\xf2\x03\
-\xf0\x93\x7f\xa4\x54\xa1\x69\xaf\xeb\x0c\x44\x91\xa4\x32\xb9\x66\
-\x81\x7d\x80\xd3\x01\xb9\x63\x01\x90\xa3\x60\xe9\x94\x6f\x03\x7a\
-\x93\xeb\x1c\x54\x5c\x35\x66\x17\xcf\x02\x20\x72\x44\x55\x3e\x73\
-\xdb\x02\x7b\x97\xeb\x1c\xa5\x8e\x05\x40\x0e\x82\xa5\x53\xbe\x02\
-\xd5\x6f\xb9\xce\x41\xc5\xd7\x1e\x3b\xad\xeb\x0c\x44\x51\x26\x2a\
-\x5f\xba\x6d\xbe\x7e\xcd\x75\x8e\x52\xc6\x02\x20\x4b\xc1\x92\xc9\
-\x5f\x82\xea\x9d\xae\x73\x90\x1b\xed\xb0\x83\x27\x3b\x12\xb9\xa6\
-\xfa\x83\x5b\xe7\xe9\x55\xae\x63\x94\x2a\x16\x00\x59\xf0\x97\x4c\
-\xba\x14\x00\x3b\xff\x08\x8b\x7b\x29\xce\x3f\x12\xb9\x27\x02\xfd\
-\xe9\xad\x73\xf5\x33\xae\x83\x94\x22\x16\x00\x19\xf2\x97\x4c\xfe\
-\xb0\x40\x7e\x0d\xfe\xd9\x45\x9a\xa7\x3e\xff\xfd\x13\x85\x83\x88\
-\xe8\xcf\x6f\x9d\xaf\x1f\x77\x1d\xa4\xd4\xf0\x87\x58\x06\x74\xd9\
-\xe4\x31\x02\xfc\x01\xbc\xd8\x27\xf2\x62\x9a\xe2\xdf\x1d\xa2\xf0\
-\xf0\x44\xf5\xe1\xdb\x5f\xd2\xd3\x5d\x07\x29\x25\xfc\x21\xd6\x4a\
-\xba\xec\xaa\xe3\xac\xc5\x53\x00\x6a\x5c\x67\x21\xf7\x62\xc2\x11\
-\x00\xa2\x90\xa9\x52\xa3\x4f\xdc\x3a\x4f\x47\xb9\x0e\x52\x2a\xf8\
-\x43\xac\x15\x74\xf9\x35\x7d\x6c\x60\xff\x0e\xa0\x83\xeb\x2c\x14\
-\x0e\x49\x54\xfa\xae\x33\x10\xd1\xfb\xb4\x15\xe8\x53\xb7\x2e\xd0\
-\x63\x5c\x07\x29\x05\x2c\x00\x8e\x40\x5f\xbe\xba\x83\x0d\xfc\x7f\
-\x40\xd0\xc7\x75\x16\x0a\x8f\x66\x6d\x13\xb8\xce\x40\x44\x07\xd5\
-\x59\xac\x3e\xf5\x83\xc5\xda\xc5\x75\x90\xb0\x63\x01\x70\x18\xba\
-\x70\x72\x5c\x6d\xf0\x18\x14\x43\x5c\x67\xa1\x70\x69\xd0\x76\x2c\
-\x00\x88\xc2\x6b\x40\x3c\xad\x8f\xdf\xb3\x46\x79\x73\xe7\x61\xb0\
-\x00\x38\x0c\xeb\xe1\xe7\xaa\x38\xcb\x75\x0e\x0a\x9f\x24\x6a\xd5\
-\x75\x06\x22\x3a\x34\x05\x4e\x4b\xee\xb4\x0f\xf2\xc8\xe0\x43\x63\
-\x01\x70\x08\xc1\xd2\x29\xdf\x04\xf0\x69\xd7\x39\x28\x9c\x1a\xb4\
-\xbd\xe7\x3a\x03\x11\x1d\x81\xc8\xc5\x77\x2c\x00\xaf\x67\x3f\x04\
-\x16\x00\x07\xe1\x2f\x9d\x74\x11\x54\xbf\xe3\x3a\x07\x85\xd7\x6e\
-\x74\x6c\xe3\x3a\x03\x11\x1d\x99\xaa\x7e\xfb\xd6\xf9\x7a\xa9\xeb\
-\x1c\x61\xc4\x02\xe0\x00\xba\xe4\xaa\x53\x05\xf2\x20\x00\x0e\x1b\
-\xd1\x21\x25\x51\xd3\xd5\x75\x06\x22\x6a\x15\x11\xd5\x07\x6e\x99\
-\xaf\xe3\x5c\x07\x09\x1b\x16\x00\xfb\xd1\x85\x93\xfb\x5a\xd8\xc7\
-\xa1\xa8\x74\x9d\x85\xc2\x2b\x40\xac\x45\xd5\x74\x77\x9d\x83\x88\
-\x5a\xad\xd2\xa8\xfe\xf5\xe6\x39\x7a\xb4\xeb\x20\x61\xc2\x02\xe0\
-\x1d\x3a\xe7\xcb\x55\x36\x26\x8f\x03\xe0\x27\x3b\x3a\xac\x6d\xb6\
-\xd7\x5b\xe0\xdf\x1d\xa2\x52\xd3\xc9\xf3\xf4\x89\x1f\x2e\xd1\xf6\
-\xae\x83\x84\x05\x7f\x88\xbd\xc3\x56\x35\xfd\x14\xaa\x23\x5d\xe7\
-\xa0\xf0\x5b\xab\x27\x6c\x71\x9d\x81\x88\xb2\x32\xd4\x4f\xe9\xef\
-\xa7\xa9\xb2\xef\x03\x0b\x00\x00\x40\xb0\x64\xf2\x8d\x80\x5e\xe1\
-\x3a\x07\x95\x86\x37\xec\x70\xd7\x11\x88\x28\x4b\x0a\x9c\x53\x35\
-\xdf\x7e\xcb\x75\x8e\x30\x88\x7c\x01\x90\x5e\x32\xe5\x6c\x00\x3f\
-\x70\x9d\x83\x4a\x47\x9d\x76\xef\xe1\x3a\x03\x11\x65\x4f\x20\xff\
-\xef\x8e\x05\x7a\x9e\xeb\x1c\xae\x45\xba\x00\xd0\x45\x9f\x3b\xda\
-\x40\xff\x00\x80\x7b\xba\xa9\x55\x92\xa8\xda\xe3\x23\x7e\x94\xeb\
-\x1c\x44\x94\x13\x63\xad\x3e\x74\xc7\x6c\xed\xe7\x3a\x88\x4b\x91\
-\x2d\x00\xf4\xf9\x2b\x2a\xad\x78\x7f\x00\x2f\xf8\xa1\x0c\xbc\x1a\
-\x9c\xb2\x12\x11\xfe\x7b\x43\x54\x46\x3a\xd9\x98\xfe\xe5\xae\x39\
-\x5a\xe5\x3a\x88\x2b\x91\xfd\x41\x66\xdb\x27\x7e\x04\xc1\x08\xd7\
-\x39\xa8\xb4\xbc\x12\x8c\xe3\x2d\x80\x44\xe5\xe3\x44\xdf\xb3\x77\
-\xb9\x0e\xe1\x4a\x24\x0b\x00\x7f\xf1\xa4\x4f\x02\x98\xec\x3a\x07\
-\x95\x16\x85\xd8\xed\xe8\x3d\xd8\x75\x0e\x22\xca\x27\xb9\xea\xb6\
-\xf9\xd1\x5c\x04\x1e\xb9\x02\x40\x97\x4e\x1a\x2c\x22\xd3\x5d\xe7\
-\xa0\xd2\xb3\x51\x07\xad\x52\x08\xcf\x89\x20\x2a\x37\xaa\xf7\xdd\
-\xb9\x40\x4f\x72\x1d\xa3\xd8\x22\x55\x00\xe8\xb2\xcb\x6a\xac\xca\
-\xe3\x00\x78\x8e\x3b\x65\x6c\x81\x7f\xf6\x76\xd7\x19\x88\xa8\x20\
-\x2a\x7d\xab\xbf\xbf\x67\xae\xb6\x75\x1d\xa4\x98\x22\x55\x00\x58\
-\x5b\x75\x2f\x80\x61\xae\x73\x50\xe9\x51\x88\x5d\x8f\x61\x1c\xfe\
-\x27\x2a\x53\x02\x0c\x6e\x11\xfd\x85\xeb\x1c\xc5\x14\x99\x02\xc0\
-\x5f\x3c\xe5\x13\xe0\xf5\xbe\x94\xa5\xd7\x82\x11\x4b\xad\x1a\xee\
-\xff\x27\x2a\x63\x0a\x7c\x22\x4a\xeb\x01\x22\x51\x00\xe8\xb2\x2b\
-\x7b\x8b\xe8\xfd\xae\x73\x50\xe9\x7a\xc9\x7e\xb8\xd9\x75\x06\x22\
-\x2a\x3c\x51\xfd\x71\x54\x2e\x0d\x2a\xfb\x02\x40\x1f\xbd\xd0\x0b\
-\x02\xef\xb7\x00\x3a\xba\xce\x42\xa5\x29\x89\x9a\xdd\x3b\xb5\xe7\
-\x89\xae\x73\x10\x51\xe1\x29\x50\xeb\x79\xfa\xcb\x47\x1f\xd5\xb2\
-\x3f\x20\xae\xec\x0b\x00\x3b\xb8\xe3\x4d\x22\x3a\xde\x75\x0e\x2a\
-\x5d\x33\xfc\x8f\x2f\x05\x50\xe3\x3a\x07\x11\x15\xcd\xf8\x75\xfd\
-\xf1\x55\xd7\x21\x0a\xad\xac\x0b\x00\x5d\x74\xe5\x48\xa8\xf2\xd2\
-\x07\xca\x9a\xc2\x04\x2b\xed\x58\x1e\xfd\x4b\x14\x35\xaa\xdf\xb9\
-\x63\xbe\x9e\xec\x3a\x46\x21\x95\x6d\x01\xa0\xcb\x2e\xab\xb1\xc6\
-\xfc\x1e\x40\xdc\x75\x16\x2a\x5d\xcb\xec\xc4\x05\x16\xa6\x8f\xeb\
-\x1c\x44\x54\x74\x71\xab\xfa\x60\x39\x1f\x15\x5c\xb6\x05\x80\x0d\
-\xaa\x6e\x01\x10\x89\x85\x1c\x54\x38\xb3\xd3\x17\x70\xe8\x9f\x28\
-\xba\x8e\xf5\x63\xf6\x66\xd7\x21\x0a\xa5\x2c\x0b\x80\xf4\x92\xab\
-\x4e\x87\xe0\x5a\xd7\x39\xa8\xb4\xbd\x66\x4f\x5a\x92\x94\xea\xe1\
-\xae\x73\x10\x91\x43\x2a\xd7\x95\xeb\xd5\xc1\x65\x57\x00\xe8\xc2\
-\xc9\xd5\x06\xf6\xe7\x00\xc4\x75\x16\x2a\x6d\xcf\xfa\xff\x53\x76\
-\x7f\x3f\x88\x28\x63\x62\xad\xfe\xfc\xae\x39\x5a\x76\x3b\xc9\xca\
-\xee\x07\x9c\x35\xb8\x15\x1c\xfa\xa7\x1c\xad\xb2\x27\x2f\x4a\xa2\
-\xe6\x04\xd7\x39\x88\x28\x14\x7a\xf9\x9e\xfd\xa1\xeb\x10\xf9\x56\
-\x56\x05\x80\x2e\x9e\x32\x01\x82\x6b\x5c\xe7\xa0\xd2\xf7\x6c\x70\
-\x49\xa5\xeb\x0c\x44\x14\x26\x72\xd9\xed\xf3\xf4\x4c\xd7\x29\xf2\
-\xa9\x6c\x0a\x00\x5d\x76\x59\x8d\x15\xfd\x25\xca\xe8\x9f\x89\xdc\
-\x58\x6a\xcf\x78\x29\xa5\x55\xbc\x33\x82\xb2\xa0\x5b\x8d\xd8\xcd\
-\xae\x53\x50\x41\x88\x42\x7f\x36\xed\x79\x2d\x9b\x0f\x07\x65\xd3\
-\x59\x5a\x5b\x3d\x0d\xc0\x40\xd7\x39\xa8\xb4\xf9\x12\x4f\x3e\xef\
-\x5f\xc8\x6d\x7f\x94\x11\x81\x36\x0c\x34\xcb\x66\x7f\x21\xfe\xe5\
-\x9a\xab\xe3\xd7\xd7\x74\x92\xcd\xb3\x5d\x67\xa2\x82\x18\x54\x5d\
-\x65\xbf\xe1\x3a\x44\xbe\x94\xc5\x42\x39\x7d\x79\xf2\x70\x1b\x60\
-\x11\xb8\xe7\x9f\x72\xf4\x77\xff\xb3\x2f\xbc\x6a\x47\x9f\xee\x3a\
-\x07\x95\x8c\xa6\x01\xb2\x7c\xc1\x79\xb1\x07\x4f\xac\x92\x86\x76\
-\xfb\xff\xc6\x4b\xc1\x87\x67\xbf\x14\x9c\x7f\x82\x42\x6a\x5d\x85\
-\xa3\x82\x48\x19\x95\x93\x6e\x38\x45\x56\xba\x0e\x92\xab\x92\x2f\
-\x00\x54\xa7\x99\x60\xe9\xa6\x59\x02\x8c\x75\x9d\x85\x4a\x5b\x83\
-\xb6\xdf\x7e\x7f\xfa\xe6\x4a\x40\xda\xb8\xce\x42\xe1\xd7\x46\xea\
-\x16\x5c\x18\xbf\xbb\x47\x07\x6c\xeb\x7d\xa8\xaf\xd9\xa5\x5d\xdf\
-\xfe\x6d\xea\x6b\x75\xdc\x4e\x5a\x76\xe6\x35\x8d\x96\x71\xd3\x44\
-\xac\xeb\x20\xb9\x28\xf9\x29\x00\xbb\xf4\xed\xab\xd8\xf9\x53\x3e\
-\xfc\xd1\xff\xe2\x6b\xec\xfc\xe9\x48\x3c\xf8\xeb\x3f\x14\xff\xd5\
-\x82\xc9\xf1\xaf\x9f\x7c\xb8\xce\x1f\x00\x3a\xc8\xb6\x5e\x57\x57\
-\xdc\x70\xec\x31\xb2\x70\x0e\x80\xa0\x48\x11\xa9\xf0\xc6\x54\xcf\
-\xc3\x95\xae\x43\xe4\xaa\xa4\x47\x00\x74\xfe\x35\xdd\x6d\xdc\x7f\
-\x15\x40\x7b\xd7\x59\xa8\xb4\xad\xd6\xd1\x0b\x9f\x4c\x7f\x76\x94\
-\xeb\x1c\x14\x6a\xe9\xc1\x66\xd1\xec\xf3\x62\xbf\x1e\x1b\x43\xba\
-\x22\xd3\x87\xdf\xb4\xc7\x2d\x7f\xc2\xbf\xa6\xa3\x85\xe9\x55\x88\
-\x70\x54\x74\xbb\x20\x32\xf4\xc6\xd1\xb2\xc5\x75\x90\x6c\x95\xf4\
-\x08\x80\x8d\x07\x3f\x02\x3b\x7f\xca\x51\x1a\x89\xa6\xa7\xd2\x97\
-\x77\x73\x9d\x83\xc2\x2b\xa6\xa9\xd7\x3f\x19\xbf\xf3\xf5\x0b\x62\
-\x3f\x3f\x3d\x9b\xce\x1f\x00\x8e\x32\xaf\x0c\xbf\x36\x71\x7d\xdb\
-\xae\xb2\x71\x6e\xbe\xf3\x91\x13\x1d\x14\xa5\x7d\x36\x40\xc9\x8e\
-\x00\xa4\x97\x4e\xfe\xa0\x51\x3c\xe3\x3a\x07\x95\xbe\x3f\xfa\x5f\
-\x9a\xb1\xde\x0e\x99\xe8\x3a\x07\x85\x92\x3f\x40\x96\xcf\xfe\x68\
-\x7c\xfa\x58\x0f\xe9\x44\xbe\x1a\x5d\x6a\xcf\x78\xe9\x5f\xc1\x45\
-\xc7\xaa\x0a\x3f\xc0\x94\x3c\xb9\xe0\xc6\x31\xf2\xa4\xeb\x14\xd9\
-\x28\xc9\x02\x40\x17\x4e\x8e\x5b\x0f\x4b\x01\x0c\x75\x9d\x85\x4a\
-\xdb\x5b\xc1\x90\x15\x8f\x05\x5f\x1a\x02\xc0\x73\x9d\x85\xc2\xc5\
-\xd3\xf4\xfa\x4f\xc4\xef\x69\xee\x6d\xd6\x0c\x29\x44\xfb\x5c\x20\
-\x58\x36\xde\xa8\xec\x28\xc3\xae\x1b\x24\x2d\xae\x83\x64\xaa\x24\
-\xa7\x00\xac\x87\x6b\xc1\xce\x9f\x72\x94\x46\xa2\xe9\xf1\xe0\xda\
-\x1a\xb0\xf3\xa7\x03\xb4\xc7\xb6\xb9\x57\x55\x4c\xed\x50\xa8\xce\
-\x1f\xd8\xb7\x40\xf0\x9a\x8a\x1b\x86\x0d\xf7\x66\xcf\x06\x90\x2e\
-\xd4\x7b\xa8\xe0\x06\x26\x77\xe2\x0b\xae\x43\x64\xa3\xe4\x46\x00\
-\x74\xc5\xe7\x3a\xda\x94\xb7\x06\x40\xd9\x5d\xcc\x40\xc5\xf5\xbb\
-\xf4\xd4\x17\x37\xe9\x80\x09\xae\x73\x50\xa8\x34\x9f\x68\x5e\x58\
-\x70\x56\xec\xf7\x45\xfd\xbe\xd8\xa0\xc7\xac\xfc\x53\xfa\x0b\xd5\
-\x01\x62\xfd\x8b\xf9\x5e\xca\x9b\x7a\xe3\xc9\xa0\x1b\x46\xc9\x0e\
-\xd7\x41\x32\x51\x72\x23\x00\x36\xe5\xdd\x0c\x76\xfe\x94\xa3\x55\
-\xc1\x29\x8b\x37\xe9\x80\xf1\xae\x73\x50\x78\x78\x92\x7e\xe3\xb2\
-\xd8\xf7\x36\x17\xbb\xf3\x07\x80\x3e\xb2\x7a\xe8\x35\xf1\x1b\x3a\
-\x77\x91\x0d\x3c\x41\xb0\x34\xb5\xd7\xc0\xfe\xaf\xeb\x10\x99\x2a\
-\xa9\x11\x00\x5d\x32\xe9\x44\x0b\x59\x08\x0e\xd9\x52\x0e\x1a\xb5\
-\xed\xce\xfb\xd3\xb7\x06\x0a\xe9\xea\x3a\x0b\x85\x43\x5b\xa9\x7b\
-\xe9\xd3\xb1\xef\x0c\x4b\x48\xb2\xad\xeb\x2c\x4b\x82\x33\xe6\xff\
-\x2b\xb8\xe8\x18\x40\xda\x1d\xf9\xab\x29\x44\xd2\xc6\x93\xe3\x6f\
-\x18\x25\xab\x5c\x07\x69\xad\x92\x1a\x01\x08\x20\x3f\x02\x3b\x7f\
-\xca\x81\x42\xec\x43\xe9\x6f\xac\x65\xe7\x4f\xef\xd0\x01\xb2\x7c\
-\xc6\x95\xf1\x6f\x8c\x09\x43\xe7\x0f\x00\x27\x79\xcf\x8f\x9e\x14\
-\xff\x66\x63\x95\x34\x2e\x75\x9d\x85\x32\x12\xb7\x81\xde\xee\x3a\
-\x44\x26\x4a\x66\x04\xc0\x5f\x32\xf9\xbf\x04\xf8\xb3\xeb\x1c\x54\
-\xda\xfe\xcf\x9f\xf4\xc2\x2a\x3b\xf2\x74\xd7\x39\xc8\x3d\x81\x36\
-\x7c\xc0\xfb\xed\x8a\xe3\xbd\x99\x63\x5c\x67\x39\x38\xd1\x7f\xfa\
-\x17\xcf\x5c\x6a\x4f\x3f\x05\x40\xde\xb6\x20\x52\x81\xa9\x9c\x73\
-\xe3\x29\xf2\x0f\xd7\x31\x5a\xa3\x24\x0a\x00\x7d\xf4\x42\xcf\x0e\
-\xea\xb0\x0c\x00\xaf\x68\xa5\xac\xbd\x1e\x9c\xb8\xf4\x89\xe0\xaa\
-\xe1\xe0\x28\x52\xe4\x19\xd8\x0d\x97\xc6\x7e\x90\xee\x6a\x36\x1e\
-\xe5\x3a\xcb\x91\x6c\xd4\x41\xaf\xfe\x31\x7d\x5d\x55\x80\x78\x7f\
-\xd7\x59\xa8\x55\x5e\xee\xbf\x5e\x46\x5c\x74\x91\x84\xfe\xe8\xe7\
-\x92\x98\x02\x08\x8e\xee\x78\x05\xd8\xf9\x53\x0e\xf6\x6a\xc7\xad\
-\x7f\xb5\x53\x7a\x81\x9d\x7f\xe4\x25\xd0\xbc\x62\x52\xfc\xeb\x95\
-\xa5\xd0\xf9\x03\x40\x6f\x59\x73\xec\xb5\x89\x1b\xba\xf5\xc0\x1b\
-\x3c\x41\xb0\x34\x1c\xbf\xae\x1f\x3e\xe3\x3a\x44\x6b\x84\x7e\x04\
-\x40\xe7\x7c\xb9\xca\x56\x36\xae\x86\x80\x77\xb4\x53\x56\x2c\xbc\
-\xf4\x7d\xa9\xdb\x5e\x4d\xa2\xe6\x78\xd7\x59\xc8\xad\xb6\xd8\x3e\
-\xef\x8a\xc4\x77\x87\xc7\x91\xaa\x76\x9d\x25\x1b\xcb\xed\x84\x79\
-\xcf\xfa\x97\x0c\x52\xee\x84\x0a\xbb\x6d\x95\x2a\x83\xae\x3b\x45\
-\xf6\xb8\x0e\x72\x38\xa1\x1f\x01\xb0\x55\x0d\x5f\x62\xe7\x4f\xb9\
-\xf8\xad\x3f\x75\x1e\x3b\x7f\xea\x67\x56\xcd\xb8\x32\xf1\xad\x93\
-\x4b\xb5\xf3\x07\x80\xe1\xe6\xc5\x31\x93\xe2\x5f\x4f\xd7\x60\xcf\
-\x12\xd7\x59\xe8\xb0\xba\x36\xc3\xde\xe0\x3a\xc4\x91\x84\x7a\x04\
-\x40\x5f\xbe\xba\x83\x0d\x82\xd7\xc1\x6a\x97\xb2\xf4\x2f\xff\x53\
-\x33\x96\xd8\x89\x3c\xe7\x3f\xda\x74\xb8\x79\xe9\xc5\x0f\xc6\x1e\
-\x2c\xa3\xef\x83\xf7\x16\x08\x8e\x01\x90\xd5\xe5\x44\x54\x58\x02\
-\x34\xa4\xe3\x72\xd4\xd7\x47\xc8\x76\xd7\x59\x0e\x25\xd4\x23\x00\
-\x36\x08\x6e\x02\x3b\x7f\xca\xd2\x6b\xf6\xa4\x25\x4b\xec\xc4\x53\
-\x5d\xe7\x20\xa7\x82\xb1\xb1\xa7\x66\x95\x57\xe7\x0f\x00\x2a\x67\
-\xc5\x7e\x3f\xe1\xb2\xf8\xcd\x1b\x62\x92\x7a\xcd\x75\x1a\x7a\x3f\
-\x05\x6a\xbd\xb4\xfd\xa2\xeb\x1c\x87\x13\xda\x11\x00\x5d\x76\x55\
-\x57\x6b\xed\x9b\x00\x6a\x5c\x67\xa1\xd2\xb3\x5d\x7b\xad\xfd\x4d\
-\xfa\x9b\xed\x01\xe9\xe0\x3a\x0b\x39\x93\x3c\x3b\xf6\xdb\xc5\xc7\
-\x9b\x17\xc7\xb9\x0e\x52\x48\x69\x49\x24\xff\x98\xfa\xc2\xa2\x4d\
-\x3a\x68\x1c\x42\xfc\x33\x3d\xa2\xf6\xfa\x90\x01\x5f\x1f\x23\x3b\
-\x5d\x07\x39\x98\xd0\x8e\x00\x58\xab\x5f\x05\x3b\x7f\xca\x42\x13\
-\xda\xd4\x3d\x92\xbe\x49\xd8\xf9\x47\x97\x40\x1b\xcf\xf7\x7e\xbe\
-\xb2\xdc\x3b\x7f\x00\x88\x6b\xaa\xf2\x53\xf1\x3b\x4f\x3d\x3f\xf6\
-\x8b\xc5\x80\x6e\x75\x9d\x87\xfe\x43\x1b\x0f\xf6\xcb\xae\x43\x1c\
-\x4a\x28\xab\x45\x5d\x38\xb9\xb3\xf5\xb0\x16\x40\xad\xeb\x2c\x54\
-\x5a\x7c\x24\x9a\xef\x4f\xdd\xf2\x66\x12\xd5\xdc\x36\x1a\x59\xba\
-\xfb\xa2\xf8\xdd\x6f\xf7\x91\xd5\x91\xbb\x31\xb4\x01\xed\xb6\x3d\
-\x92\xfa\xfa\x86\x06\xb4\x1b\xe9\x3a\x0b\xbd\x27\xb4\xa3\x00\xa1\
-\x1c\x01\xb0\x9e\x4c\x05\x3b\x7f\xca\x90\x42\xec\x83\xe9\x6f\x2d\
-\x63\xe7\x1f\x65\xba\xfb\xa2\xf8\xdd\x1b\xa3\xd8\xf9\x03\x40\x2d\
-\x76\x77\x9d\x92\xf8\xda\x88\xd1\xf2\xcc\x4c\x00\x4d\xae\xf3\x10\
-\x80\x10\x8f\x02\x84\x6e\x04\x80\x73\xff\x94\xad\x3f\xa4\xbf\x32\
-\x63\xa3\x0e\x2e\xb3\xc5\x5e\xd4\x5a\x02\xd4\x5d\x1c\xbf\x6d\x4b\
-\x2f\x79\x33\x92\x9d\xff\x81\xb6\xda\x7e\x6f\xfc\xde\xbf\x5e\x7d\
-\x24\x8e\x76\x9d\x85\xc2\x39\x0a\x10\xba\x11\x00\xce\xfd\x53\x36\
-\xfe\xee\x5f\xf9\x02\x3b\xff\xe8\x12\x41\xfd\xc5\xf1\x3b\x77\xb2\
-\xf3\xff\xb7\x6e\x66\xfd\xc0\x6b\x13\xd7\xf7\x19\x20\xcb\x67\x00\
-\xb0\xae\xf3\x44\x5c\x9b\x18\xec\x57\x5c\x87\x38\x50\xa8\x46\x00\
-\x74\xde\xb5\x9d\x6c\x22\xbd\x1e\x2c\x00\x28\x03\x33\xd3\x1f\x9b\
-\x39\x5f\xcf\x19\xef\x3a\x07\xb9\x21\xaa\x3b\x3f\x15\xbf\xa5\xae\
-\x87\x59\x3f\xc8\x75\x96\xb0\x5a\xad\xa3\x17\xfe\x9f\xff\x99\x7e\
-\xaa\xd2\xc5\x75\x96\x08\x0b\xdd\x28\x40\xa8\x46\x00\x6c\x22\xfd\
-\x79\xb0\xf3\xa7\x0c\xbc\x1c\x8c\x9f\x37\x5f\xcf\x29\xfb\x95\xde\
-\x74\x70\x02\xdd\x73\x71\xe2\xae\x6d\xec\xfc\x0f\xef\x18\x99\x3f\
-\x6a\x4a\x6c\xaa\x69\x2b\x3b\xe7\xbb\xce\x12\x61\xa1\x1b\x05\x08\
-\x4d\x01\xa0\x0b\x27\x57\x03\xf8\xbc\xeb\x1c\x54\x3a\x56\xdb\x93\
-\x17\x3d\x1b\x5c\x7a\x22\x78\xc1\x4f\x24\x09\xb4\xe1\x13\xb1\xbb\
-\x37\xf6\x92\x35\xc7\xba\xce\x52\x0a\x6a\x64\x4f\xa7\x49\xf1\x6f\
-\x9e\x3c\xd2\x7b\x76\x26\x80\x66\xd7\x79\xa2\xa8\x33\x36\x8e\xd5\
-\x97\xaf\x0e\xcd\xf6\xe4\xd0\x14\x00\xd6\xc8\xe7\x00\x74\x76\x9d\
-\x83\x4a\xc3\x9b\x3a\x7c\xd9\x93\xfe\xe7\x86\x80\xc7\xa0\x46\x55\
-\xd3\x47\x62\xf7\xbf\xd1\xd7\x44\x73\xb5\x7f\xf6\x54\x4e\xf7\xfe\
-\x34\xfe\xd3\x15\xdf\xdb\x1c\x47\xcb\x6a\xd7\x69\xa2\x43\xf7\x8e\
-\x96\x67\x66\x7e\x3a\xf1\xfd\x33\xac\x1f\x4c\x71\x9d\xe6\x5d\xa1\
-\x58\x03\xa0\x8f\x5e\xe8\xd9\x41\x1d\x56\x03\x18\xe8\x3a\x0b\x85\
-\xdf\x1b\xc1\x71\x2f\x3f\x11\x5c\x3b\x50\x21\x9c\x2e\x8a\xa6\xd4\
-\x87\xe2\xbf\x7a\xf9\x58\x99\x37\xca\x75\x90\x52\x66\xe1\xa5\x9f\
-\xf4\x3f\x33\x67\x8d\x1d\x35\x1e\x21\xfa\x30\x58\x6e\x2a\xa4\xf9\
-\x95\x4b\x62\xb7\xb6\xed\x28\x5b\xfa\xbe\xf3\x4b\x9b\x4c\x62\xd7\
-\x00\x19\xf6\x58\xca\x69\x30\x84\xe4\x5f\x7a\x30\xa8\xfd\x27\xc1\
-\xce\x9f\x5a\x61\x4d\x70\xc2\xf2\xbf\x04\x9f\x3f\x9a\x9d\x7f\x64\
-\xa5\xcf\x8d\xfd\x66\x19\x3b\xff\xdc\x19\x04\xf1\x8f\xc4\x1e\x98\
-\x78\x41\xec\xe7\x4b\x0d\x2c\x4f\x10\xcc\xbf\xf4\xb1\x66\xde\x8c\
-\x6b\xe3\xd7\x1f\xbb\x5f\xe7\x0f\x00\x3d\x83\x74\xc7\x8b\x9c\xa5\
-\xda\x8f\xf3\x11\x00\x55\x88\x5d\x3a\x79\x09\x80\x13\x5c\x67\xa1\
-\x70\x7b\x23\x38\x61\xe9\x5f\x82\xab\x07\x03\x28\xd9\xeb\x5c\x29\
-\x27\x3a\xde\xfb\xeb\x9c\xd1\xde\xdf\x79\xc1\x53\x9e\x35\x4b\x9b\
-\xba\x87\x53\x37\xbe\xbe\x47\xbb\x8c\x76\x9d\xa5\xc4\x69\x42\x9a\
-\x57\x0e\xf7\xe6\xed\x18\x25\x4f\x0f\xad\x95\xfa\x83\xef\xba\x50\
-\x2c\xf6\x46\x4c\x77\x7e\x5a\xa3\xf3\x02\x20\xbd\x78\xca\x59\x46\
-\xf4\x39\xd7\x39\x28\xdc\x5e\xb7\xc7\x2f\x7f\x22\x7d\xf5\x40\x88\
-\xb0\xf3\x8f\xa8\xe1\xb1\x59\x33\x3e\x68\x1e\xe6\x59\x0f\x05\x34\
-\x3b\xf8\xc8\xac\xb9\xc1\x87\x4e\x02\x77\x63\xb5\x9a\x07\xff\xad\
-\xf6\xb2\x7d\xe3\x31\x66\x81\x0e\x37\xb3\x8f\xa9\x95\xdd\xad\x5a\
-\xcb\x66\x61\xce\x88\x9f\xf4\xb3\x17\x0a\x1c\xef\xb0\x62\x2e\x5f\
-\x0e\x00\x9e\xd8\x2f\xa8\xfb\x3a\x84\x42\x6c\xad\x1d\xb6\xfc\xaf\
-\xfe\xd5\x03\xd8\xf9\x47\x57\x7f\x79\x85\x9d\x7f\x11\x9c\xea\xfd\
-\xf5\xb4\x61\x66\xee\x86\x47\xfc\xaf\xbd\x99\xd4\xea\xe1\xae\xf3\
-\x84\x8d\xa8\xdd\x56\x6b\xea\xd7\x77\x97\x37\x9b\x06\x9a\x95\xd5\
-\xfd\x65\xc5\x51\x35\xb2\xbb\x2f\x80\xbe\x47\x7c\xf8\x00\xef\x1c\
-\x0f\xfc\x42\xde\x43\x66\xc0\x69\xcf\xab\x8b\x3f\xd7\xcf\x8a\xf7\
-\x06\xb8\x8d\x8b\x0e\x61\xad\x1d\xb6\xfc\xcf\xfe\xe7\x07\x28\x84\
-\x77\x43\x44\x54\x27\xd9\x34\xfb\x8a\xf8\x77\xc7\x01\xca\x4f\x0a\
-\x45\x62\x61\xfc\x27\xfd\xcf\xce\x5e\x63\x47\x9d\x86\x88\xfd\x7c\
-\x16\xd1\xdd\x71\x6d\xda\xd6\xd6\xec\xd9\xd3\x51\xb7\xa4\x3b\x99\
-\x2d\xe8\x2c\x1b\x13\x9d\xb1\xa1\x4b\x47\xb3\xbd\x0f\xa0\xf9\x7a\
-\x95\x9a\x00\x43\x65\xd4\xf4\x55\xf9\x6a\x30\x53\x4e\x47\x00\xac\
-\x78\xd7\x22\x62\xdf\x5c\xd4\x7a\x6f\x06\xc3\x5e\xf9\x8b\xfd\xfc\
-\x51\x5c\xf0\x17\x5d\xb5\xa8\x5b\x70\x79\xfc\x7b\x63\xd8\xf9\x17\
-\x97\x81\x8d\x7d\x24\xf6\xc0\xc4\x75\x76\xf6\x2b\x6b\x75\xf8\xae\
-\x16\xad\xb2\x2d\xa8\x82\x8f\x98\x24\xb5\x46\x02\x89\x1b\x5f\x13\
-\x26\xa5\x89\x84\x85\xf1\x7c\x54\x54\x00\x92\xb0\x30\x09\xab\x5e\
-\x8d\x0a\xe2\x80\xb4\x71\x14\x3f\x10\xd1\xbd\x00\xd2\x46\x83\xa4\
-\x81\x4d\x89\xd8\x74\x0c\x2d\x4d\x55\x68\x4a\x56\xa1\xc1\xaf\x91\
-\xdd\x5a\x2b\xbb\x4d\x5b\xd9\x99\x68\xab\x75\x15\x35\x52\x5f\x5b\
-\x2b\xbb\xdb\xd6\xc8\xee\x4e\x06\xb6\x1d\x80\x76\x45\xc8\x29\xd6\
-\x93\x2f\x00\xb8\xb6\x08\xef\x3a\x78\x00\x57\x2f\xd6\x39\x5f\xae\
-\xb2\x55\x8d\x1b\x00\x74\x72\x95\x81\xc2\xeb\xb5\x60\xc4\xb2\x27\
-\xed\xa4\xa3\x55\xd9\xf9\x47\x55\x02\xcd\xaf\x5e\x9d\xb8\xa9\x6f\
-\x0c\x49\x7e\x0f\x94\x30\x85\x20\xa9\xd5\x7b\xf0\xce\x7d\x04\x69\
-\xa9\x6a\xf1\xad\x49\x01\x40\x20\x71\x4d\xa1\xba\xf1\xdd\xaf\x4d\
-\x6a\x35\xe2\x48\x8a\x27\xf6\x88\x1f\xb3\x05\xd6\xab\x40\xb2\xca\
-\xc0\x47\x85\x34\xb5\x31\x6a\x63\x95\xd2\x58\x6a\x23\x85\x7b\x4d\
-\x95\xdf\x4b\x86\xfc\x72\xaf\x8b\x97\x3b\x1b\x01\x08\xaa\x1a\x2f\
-\x15\x76\xfe\x74\x10\x2f\x07\xe3\xe7\x3d\x1b\x5c\x7a\x02\x80\x4a\
-\xd7\x59\xc8\x0d\x03\xbb\xf1\x33\x89\x69\x9d\xd8\xf9\x97\x3e\x81\
-\xa2\x4a\x1a\xdb\xbe\xfb\xff\xab\xd0\x78\xe8\x0d\xe8\xb9\x7c\x24\
-\x2d\xcd\x31\xa2\x36\x36\x19\xff\x14\x80\xe9\x2e\x5e\xee\xec\x1c\
-\x00\xe1\xb1\xbf\x74\x10\x73\x82\xf3\x5f\x78\x36\xb8\x74\x24\xd8\
-\xf9\x47\x98\xee\xfd\x64\xec\xd6\xe6\x5a\xec\xee\xea\x3a\x09\x51\
-\xc1\xa9\x5e\xe3\xea\xd5\x4e\x0a\x00\x5d\x3c\x65\x2c\xb8\xef\x9f\
-\x0e\xf0\xb4\xff\xe9\x19\x2f\x05\xe7\x4f\x44\x08\x76\xa7\x90\x33\
-\xe9\x0b\x62\x0f\xac\xe1\xe5\x3e\x14\x21\x27\xe8\xa2\x2b\x9d\x9c\
-\x09\xe0\xa4\x00\xb0\xc6\x7e\xce\xc5\x7b\x29\xac\x44\xff\xe4\x7f\
-\x61\xc6\x0a\x3b\x76\x22\x4a\x75\x20\x8f\xf2\x41\x4f\x8d\xfd\x6d\
-\xde\x60\xb3\x68\x84\xeb\x20\x44\xc5\x64\x8d\x99\xec\xe2\xbd\x45\
-\xff\x61\xab\x2b\xae\xa9\xb5\x29\x7f\x13\x00\x57\x2b\x44\x29\x44\
-\x2c\x4c\xf0\x70\xea\x6b\xf3\xb6\xa3\x2f\xaf\xf4\x8d\xb8\x41\x66\
-\xf1\x0b\x1f\x89\x4d\x3f\xdd\x75\x0e\x22\x07\x1a\x4c\x95\xdf\xb3\
-\xd8\x8b\x01\x8b\x3e\xd4\x1a\xa4\xfc\x4f\x0a\x3b\xff\x23\x5a\xa7\
-\xc3\x96\xcf\x4e\x5f\x50\x0f\x51\x54\xa1\xc1\x7a\x62\xb5\x02\x4d\
-\x12\x83\x8f\x0a\x6d\x32\x09\xd3\x6c\x2a\xa4\xc5\x24\x90\x8c\xc5\
-\x90\xf2\x2a\xd0\x94\x88\x89\xef\x55\xa0\xb1\xda\xa8\x6f\xaa\xa4\
-\xb1\x8d\x88\x35\x95\x68\x6e\x7b\xe4\xb7\xb9\xe1\x4b\x3c\xf9\xab\
-\xf4\xb7\x97\xed\x41\x47\x76\xfe\x11\xd7\x41\xb6\xbf\xf4\x91\xd8\
-\xcf\x27\xb8\xce\x41\xe4\x48\xad\x4d\xc6\x2e\x01\x70\x7f\x31\x5f\
-\xea\x62\xae\xf5\x4a\x07\xef\x2c\x39\x3b\xb5\x7b\xc3\x16\xf4\x1f\
-\xff\xde\x99\x13\x07\x6e\x8a\x09\x32\x6e\x32\x29\xa2\x49\x58\x4d\
-\x19\xb1\x2d\x10\x4d\x19\xb5\x29\x4f\x03\xdf\x18\x3f\xed\xc1\x0f\
-\x2a\x25\x99\xf2\xb4\xc5\x7a\x48\x69\x02\x29\x8d\x49\x0b\x12\x48\
-\x23\x8e\x16\x49\x68\x8b\x54\x98\x16\x93\x90\x66\x13\x47\x4b\x2c\
-\x8e\x16\x2f\x86\x96\x78\x85\xb4\xc4\x62\x68\x49\x54\x63\x6f\x9b\
-\x18\x52\x89\x84\xb4\x54\x79\xf0\x8f\x78\x45\x6f\x4a\x2b\x1a\x7f\
-\x91\xfe\xee\xea\x26\x6d\x3b\x26\xe3\x7f\x12\x2a\x2b\x71\xa4\x56\
-\x5f\x1e\xff\xfe\xf1\x80\x86\xe2\x72\x32\x22\x27\x14\x57\xa3\x9c\
-\x0b\x00\x5d\x76\xd5\x71\xd6\x5a\xfe\xc0\x77\xa3\x52\x55\x2a\x21\
-\x82\x00\x06\xd0\x7d\x35\x44\x5a\xf0\x5e\x71\xb1\xf7\xc0\x22\x23\
-\xfb\xa2\x23\x2d\xa2\x8d\x50\xa4\x0c\x82\x16\x81\xb6\x08\x6c\x3a\
-\x86\x74\x4a\xc4\x06\x09\xa4\x52\x0d\xda\xae\xab\x8f\x38\xe7\x7a\
-\x23\x4e\xa0\xdb\xae\x88\x7f\xbb\x0d\xb7\xfb\x11\xed\x5b\x0c\x28\
-\x23\x1f\x58\x54\xac\x17\x16\xb5\x00\xb0\x56\xf9\xe9\x3f\x1a\xe2\
-\xaa\xd2\x1e\x00\x82\xfd\xbe\xc5\xd2\xa8\x00\x14\x68\x72\x16\x8b\
-\x42\x26\xf9\xf1\xd8\x3d\xdb\xda\xca\xce\xe3\x5c\x07\x21\x0a\x03\
-\x6b\xcc\xa5\x00\x8a\x56\x00\x14\x6d\xc8\x4d\x9f\x9f\x16\x03\xf4\
-\x93\xc5\x7a\x1f\x11\x85\xdb\xb8\xd8\xdf\x17\xf4\x37\xaf\xb2\xf3\
-\x27\xfa\xb7\x4b\xf6\xf5\x95\xc5\x51\xb4\x02\x20\x68\xbf\xf9\x83\
-\x00\xba\x15\xeb\x7d\x44\x14\x5e\xfd\xcc\x8a\x19\x63\xcd\x5f\xc7\
-\xbb\xce\x41\x14\x32\xdd\xfc\x0e\x9b\xce\x2c\xd6\xcb\x8a\x56\x00\
-\x08\x70\x49\xb1\xde\x45\x44\xe1\x55\x85\x3d\x4b\x3e\x1e\xbb\xf7\
-\x54\xd7\xe6\xcc\x89\x41\x00\x00\x20\x00\x49\x44\x41\x54\x39\x88\
-\xc2\xc8\xa8\x5e\x5a\xb4\x77\x15\xe3\x25\xba\x70\x72\x35\xa0\x1f\
-\x2d\xc6\xbb\x88\x28\xbc\x0c\x82\xb7\xaf\x88\x7f\xaf\xaf\x81\xe5\
-\x69\x8f\x44\x07\x25\xff\xad\xcb\x2e\x2b\xca\xa2\xd8\xa2\x14\x00\
-\x81\x91\x8f\x02\x28\xb5\x5b\x9a\x88\x28\xbf\x92\x17\xc5\xef\xde\
-\x53\x2d\x7b\x78\x09\x18\xd1\xa1\xd5\x04\x41\xe5\x05\xc5\x78\x51\
-\x51\x0a\x00\x23\x1c\xfe\x27\x8a\xba\x53\xbd\x27\x17\xf6\x92\x35\
-\xc7\xba\xce\x41\x14\x76\x46\x4c\x51\xa6\x01\x0a\x5e\x00\xe8\x8a\
-\xcf\x75\x54\xe8\x07\x0b\xfd\x1e\x22\x0a\xaf\x7e\x66\xd5\x8c\x53\
-\xbc\x27\x4f\x73\x9d\x83\xa8\x14\x28\xf4\x5c\x5d\x76\x55\xc1\x6f\
-\xc3\x2c\x78\x01\x10\xa4\xcc\x7f\x03\x48\x14\xfa\x3d\x44\x14\x4e\
-\x55\x68\x58\xf6\xf1\xd8\x3d\x5c\xf4\x47\xd4\x7a\x31\xab\xfa\x5f\
-\x85\x7e\x49\xc1\x0b\x00\x23\xf2\xf1\x42\xbf\x83\x88\xc2\x49\x44\
-\xb7\x5f\x16\xff\x41\x77\x2e\xfa\x23\xca\x8c\x40\x3f\x56\xe8\x77\
-\x14\xb4\x00\xd0\x25\x57\xb4\x57\x45\xd1\xf6\x34\x12\x51\xa8\x04\
-\xe7\x7b\x0f\x6c\x68\x23\x75\x3c\xff\x83\x28\x43\xaa\x38\x4b\x97\
-\x5c\xd1\xbe\x90\xef\x28\x68\x01\x10\x68\xfc\x02\x70\xf8\x9f\x28\
-\x92\x8e\xf3\xe6\xcd\x1c\x6c\x16\xf1\xbe\x07\xa2\xec\xc4\x03\xad\
-\x38\xaf\x90\x2f\x28\x68\x01\x60\xc4\x14\x7c\x08\x83\x88\xc2\xa7\
-\x56\x76\x2d\x38\xc7\xfb\x35\xaf\xf7\x25\xca\x81\x91\xc2\x4e\x03\
-\x14\xac\x00\xd0\x85\x93\xab\xb9\xfa\x9f\x28\x7a\x8c\x06\x9b\x2e\
-\x4f\x7c\x7f\x20\xaf\xf7\x25\xca\x8d\x02\xe7\xe9\xf3\x57\x54\x16\
-\xaa\xfd\x82\xfd\x05\x0d\x8c\x9e\x07\x80\x57\x7c\x12\x45\x4b\xcb\
-\x7f\xc7\x7f\xb4\xb3\x4a\x1b\x3a\xba\x0e\x42\x54\x06\x6a\x83\xf6\
-\x89\xb3\x0a\xd5\x78\xc1\x0a\x00\x11\x7c\xa4\x50\x6d\x13\x51\x38\
-\x9d\x64\x66\xcc\xed\x6b\x5e\x1b\xee\x3a\x07\x51\xb9\x90\x02\x4e\
-\x03\x14\xa4\x00\x50\x9d\x66\x00\x39\xb7\x10\x6d\x13\x51\x38\xd5\
-\xa2\x7e\xd1\x99\xb1\xdf\x73\xde\x9f\x28\x9f\x54\x3e\xa2\x8f\x5e\
-\xe8\x15\xa2\xe9\xc2\x8c\x00\x2c\x7d\x7b\x24\x80\x82\x9f\x62\x44\
-\x44\xe1\x20\xa2\x3b\x2e\x4d\xdc\xdc\x07\x50\x71\x9d\x85\xa8\xcc\
-\x74\xc1\xe0\x4e\x23\x0b\xd1\x70\x41\x0a\x00\xab\x28\xe8\xd6\x05\
-\x22\x0a\x15\xfb\x61\xf3\xc0\x5b\xb5\xd8\xcd\xa2\x9f\xa8\x00\xac\
-\xb5\xe7\x14\xa2\xdd\xc2\x4c\x01\x18\xc3\x02\x80\x28\x22\xfa\xcb\
-\x2b\x33\x8f\xf1\xb8\xdf\x9f\xa8\x50\x14\x72\x76\x21\xda\xcd\x7b\
-\x01\xa0\x2b\x3e\xd7\x51\x54\x4f\xce\x77\xbb\x44\x14\x3e\x71\xb4\
-\xbc\xfa\x5f\xf1\xfb\xc7\xba\xce\x41\x54\xce\x44\x74\xac\x2e\x9c\
-\xdc\x2e\xdf\xed\xe6\xbd\x00\x08\x5a\x62\xe7\x00\x28\xc8\x82\x05\
-\x22\x0a\x95\xc6\x4f\xc5\x6f\xab\xf4\x90\xe6\x69\x9f\x44\x85\x15\
-\x0b\x3c\x9c\x91\xef\x46\xf3\x5e\x00\x88\x58\xae\xfe\x27\x8a\x80\
-\xd3\xbc\xbf\x2c\xed\x22\x6f\x0f\x70\x9d\x83\x28\x0a\xa4\x00\xd3\
-\x00\x05\x58\x03\x20\x05\x3b\xb4\x80\x88\xc2\xa1\x83\x6c\x7d\x69\
-\x8c\xf7\x34\xaf\xf8\x25\x2a\x1a\xcd\xfb\xda\xba\xbc\x16\x00\xba\
-\x64\xca\x20\x00\xbd\xf2\xd9\x26\x11\x85\x8b\x07\x7f\xc3\xff\xc4\
-\x6f\x39\xce\x75\x0e\xa2\x88\x19\xa0\x0b\x27\x0f\xcc\x67\x83\x79\
-\x2d\x00\xac\xe4\x7f\x8e\x82\x88\x42\xc5\xff\x78\xfc\xde\x3d\x09\
-\x34\xb7\x71\x1d\x84\x28\x6a\xac\x41\x5e\xef\xd7\xc9\xf3\x14\x80\
-\xb2\x00\x20\x2a\x63\x43\xbd\x79\xb3\xfa\xca\xab\xc3\x5c\xe7\x20\
-\x8a\x24\xc1\x69\xf9\x6c\x2e\xbf\x05\x80\x82\xc7\x80\x12\x95\xa9\
-\x2a\x34\x2c\x3b\xd7\x7b\x70\xbc\xeb\x1c\x44\x11\x96\xd7\x3e\x36\
-\x6f\x05\x80\x2e\x9c\x3c\x04\x40\xcf\x7c\xb5\x47\x44\xe1\x21\xa2\
-\xf5\x97\xc4\x6f\xee\x22\xb0\xdc\xe2\x4b\xe4\x4e\x6f\x5d\xfc\xb9\
-\x7e\xf9\x6a\x2c\x6f\x05\x80\x35\x9c\xff\x27\x2a\x57\x06\xba\xc7\
-\x97\x8a\xa4\xeb\x1c\x44\x51\x17\x98\x58\xde\x46\xe1\xf2\x37\x05\
-\x20\xca\xa1\x41\xa2\x32\x15\xa8\xe9\xfb\x9b\xd4\xff\xeb\xba\x52\
-\x4f\x9d\xef\x3a\x0b\x51\x94\x09\x6c\xde\xb6\xdf\xe6\x71\x0d\x80\
-\x9c\x92\xbf\xb6\x88\x28\x6c\x14\x52\xfb\x54\xfa\xb2\x91\x4f\xfb\
-\x9f\x9e\xe1\x3a\x0b\x51\x64\xa9\xe4\x6d\x21\x60\x5e\x0a\x00\x5d\
-\x76\x55\x57\x00\x3c\x11\x8c\xa8\xfc\x79\x2b\xec\xd8\x89\xbf\x4a\
-\xff\xef\x6c\x1f\xf1\x66\xd7\x61\x88\x22\x68\x98\xae\xf8\x5c\xc7\
-\x7c\x34\x94\x97\x02\x20\xb0\xca\xcb\x40\x88\x22\xa4\x4e\x7b\x9c\
-\x7a\x7f\xcb\xad\xaf\x37\xa0\xdd\x36\xd7\x59\x88\x22\x46\x82\xb4\
-\x19\x97\x8f\x86\xf2\x52\x00\x08\x30\x26\x1f\xed\x10\x51\xe9\x48\
-\x4a\xf5\xf0\xe9\xe9\x9b\xed\x06\x7b\xf4\x6a\xd7\x59\x88\xa2\x44\
-\x20\x79\x59\x07\x90\xa7\x02\x40\x39\xff\x4f\x14\x41\xaa\xa6\xfb\
-\xa3\xfe\x0d\xfd\xe6\x07\xe7\xcc\x76\x9d\x85\x28\x2a\x44\x31\x22\
-\x1f\xed\xe4\x5c\x00\xa8\x4e\x33\x0a\x8c\xcc\x47\x18\x22\x2a\x49\
-\x95\x33\x83\x8f\x8d\x7b\x3c\x7d\xed\x0c\x85\x58\xd7\x61\x88\xca\
-\x5d\xbe\xfa\x5c\xc9\xb5\x81\x59\xf3\xff\x3a\xac\xca\x6b\xfc\xf9\
-\xc1\x7e\xaf\x09\x6d\xfd\x20\xc8\x7d\x90\xc1\x97\xb8\xb6\xa0\x4a\
-\x73\x69\xc3\x22\xae\x49\xad\x38\xe8\x3f\xaf\x15\x83\x16\xad\x3e\
-\x44\x50\x83\x16\x54\xc5\x0e\xf6\x3b\xaa\x90\x94\x54\x1e\xf2\x2e\
-\xf4\xb4\x56\x54\x1d\x3a\x8f\x57\x8d\x43\x14\x60\x56\xbd\x1a\x15\
-\xa9\x00\x50\x73\xa8\xe7\x89\xc2\xa8\xad\xec\x98\x7d\x45\xe2\xbb\
-\xc7\xc7\xb5\x85\x77\x05\x10\x15\x90\xd1\xa0\xbf\x8c\xf8\xc5\xfa\
-\x5c\xda\x38\x68\xc7\x96\x89\x39\x7a\xc1\x48\xf8\x05\x5e\x04\x98\
-\x53\xd7\x5f\xe0\xf6\x0b\x91\x2d\xe7\xb2\x8c\xc8\x8d\x3d\xda\xf9\
-\xd4\x9f\xa6\x6e\x7f\xed\xf2\xd8\xf7\x76\x77\x90\x6d\xbd\x5d\xe7\
-\x21\x2a\x57\x81\x31\x23\x00\xe4\x54\x00\xe4\xfe\xf1\x5c\xed\xf1\
-\x39\xb7\x41\x44\x65\xc3\xd7\xc4\xe0\x5f\xa6\xbf\x53\xf5\xba\x1e\
-\xbf\xd4\x75\x16\xa2\x72\x25\x90\x93\x72\x6d\x23\x0f\x8b\x00\xe5\
-\x84\xdc\xdb\x20\xa2\x32\xd3\xe9\x89\xf4\x35\x43\x67\x07\x1f\xfd\
-\x97\xeb\x20\x44\xe5\x48\x54\x73\x5e\x07\x90\x7b\x01\x20\xe0\x08\
-\x00\x11\x1d\x4c\x62\x6e\x70\xde\x99\x8f\xa4\xa7\xce\xb4\x30\x69\
-\xd7\x61\x88\xca\x89\x42\x72\x2e\x00\x72\x9a\x6d\xbe\x6d\xbe\x76\
-\x87\xea\xe6\x5c\x43\x10\x51\x79\xab\xc1\x9e\x45\x9f\x8e\x7f\x7b\
-\x60\x95\x34\xb6\x77\x9d\x85\xa8\x5c\x18\xf5\x7b\xc9\x88\x5f\x6e\
-\xca\xfa\xf9\x5c\x5e\x6e\x15\x1c\xfe\x27\xa2\x23\x6a\x44\xdb\x91\
-\xf7\xa7\x6f\xdd\xbd\x1d\xbd\xdf\x74\x9d\x85\xa8\x5c\x04\x12\x3f\
-\x31\x97\xe7\x73\x2a\x00\x0c\x58\x00\x10\x51\xeb\x04\x88\xf5\x7b\
-\x28\xf5\x0d\xde\x28\x48\x94\x27\x22\x18\x92\xcb\xf3\x39\xae\x01\
-\xe0\x0e\x00\x22\x6a\x3d\xde\x28\x48\x94\x47\xea\xb4\x00\x90\xe1\
-\xb9\x3d\x4f\x44\x11\xe4\xad\xb0\x63\x27\xfe\xc6\xff\x7f\x2f\x04\
-\x12\xe3\x8d\x82\x44\x59\x52\xe8\xb1\xb9\x3c\x9f\x75\x01\x30\x4d\
-\xd5\x00\x18\x94\xcb\xcb\x89\x28\xba\xb6\xdb\x5e\xa7\xff\x2c\x79\
-\x1b\x6f\x14\x24\xca\x92\x00\x6e\x0a\x80\xca\x45\xe8\x0d\xe0\x90\
-\x47\xdd\x12\x11\x1d\x49\x52\xaa\x87\x4f\x4f\xdd\x6c\x37\xd8\xa3\
-\x5f\x75\x9d\x85\xa8\x04\x75\xd2\x85\x93\x3b\x67\xfb\x70\xd6\x05\
-\x80\x58\x7e\xfa\x27\xa2\xdc\x29\x4c\xf7\x47\xfd\x1b\x06\xf0\x46\
-\x41\xa2\x2c\xc4\x6d\xd6\xa3\x00\x59\x17\x00\x46\x71\x74\xb6\xcf\
-\x12\x11\x1d\x80\x37\x0a\x12\x65\xc1\xaa\x57\xfc\x02\x40\xc5\xb2\
-\x00\x20\xa2\x7c\x92\xb5\x3a\x7c\xe2\x03\xe9\xef\xbe\x94\x96\x8a\
-\xbd\xae\xc3\x10\x95\x04\xd5\xac\x77\x02\x64\xbf\x0b\x40\x85\x53\
-\x00\x44\x94\x77\xef\xdc\x28\xb8\x79\x97\x76\x7d\xdb\x75\x16\xa2\
-\xb0\x13\x60\x70\xb6\xcf\xe6\xb2\x0d\x90\x23\x00\x44\x54\x10\xef\
-\xdc\x28\x58\xc9\x1b\x05\x89\x0e\x4f\x15\x7d\xb3\x7d\x36\xab\x02\
-\xe0\x9d\x2d\x80\x47\x65\xfb\x52\x22\xa2\x56\xe0\x8d\x82\x44\x47\
-\x22\xe8\x97\xed\xa3\x59\x15\x00\xdc\x02\x48\x44\x45\x92\x98\x1b\
-\x9c\x77\xe6\x1f\xfc\xeb\x9f\x53\xde\x28\x48\x74\x30\x6d\x75\xc9\
-\x15\x59\x5d\xb2\x95\xdd\x14\x80\x9f\xfd\x90\x03\x11\x51\xa6\x36\
-\xda\x41\x1f\xb8\x3f\x7d\xcb\xb2\x24\xaa\xeb\x5d\x67\x29\x0c\x51\
-\xd7\x09\xa8\x84\x69\x45\x56\xa3\x00\x59\x15\x00\x1e\xd0\x3b\x9b\
-\xe7\x88\x88\xb2\xd5\xa8\x6d\x47\xfd\x2c\x75\xdb\xee\x6d\xb6\xf7\
-\x1b\xae\xb3\xe4\xcb\x1e\x74\x7e\xfb\x69\xff\xd3\x33\xee\x4e\xfd\
-\x78\xfd\x66\x3d\x6a\x95\xeb\x3c\x54\x9a\x02\x2f\xbb\x0f\xe5\xb1\
-\x6c\x1e\xb2\x06\xbd\x58\xaf\x12\x51\xb1\x05\x88\xf5\x7b\xd8\xff\
-\x46\xc3\xb9\xf1\x87\xe7\x0f\x95\xd9\xa3\x5d\xe7\xc9\x46\x12\x55\
-\x7b\x5e\x0e\xce\x58\xbe\xc8\x9e\x5e\xd5\xa4\x6d\x4f\x02\xd0\x0b\
-\x00\x66\xf8\x1f\x7f\xf1\x93\xf1\x3b\x72\xba\xdc\x85\xa2\x49\x54\
-\xb3\x1a\x01\xc8\xaa\x00\x10\xb5\xbd\x00\xc9\xe6\x51\x22\xa2\x9c\
-\xbc\x7b\xa3\xe0\x5b\xe6\xe8\x19\xe7\xc6\x1e\x9c\xe8\x3a\x4f\x6b\
-\x28\x24\x58\x63\x47\x2c\x9b\x6b\x3f\xdc\xbc\xdd\xf6\x3c\x11\xc0\
-\xa9\x07\x7e\xcd\x26\x1d\x78\xa2\x8f\xca\xc6\x18\x92\x35\x0e\x22\
-\x52\x29\xcb\x72\x27\x40\x56\x05\x00\x14\x3d\xd9\xff\x13\x91\x43\
-\xde\x0a\x3b\x76\xe2\xe6\xf4\x80\xd9\x97\xc5\x7f\x30\x22\x86\x54\
-\x28\x17\x25\x6f\xd5\xbe\x6f\xcc\xf6\x2f\xd8\xb8\x4e\x8f\x3b\x56\
-\x21\x23\x0e\xf7\xb5\x0a\x69\x3b\xdf\xff\xc0\xac\x71\xb1\x27\x4f\
-\x2b\x56\x3e\x2a\x17\x52\xc4\x11\x00\x91\x5e\x9c\x01\x20\x22\xd7\
-\xea\xb4\xfb\xa9\x3f\x4b\xdf\xf2\xca\x15\xf1\x6f\x77\xad\xc5\xee\
-\xae\xae\xf3\x00\x40\x33\x6a\xb7\xce\xf3\xcf\x7d\x79\x99\x9d\xd0\
-\xcb\x47\x62\x28\x80\x81\xad\x7d\x76\xb1\x3d\xb3\xfd\x38\x3c\x59\
-\xc0\x74\x54\x8e\x14\xb6\x57\x36\xcf\x65\x55\x00\xe8\x3b\x73\x56\
-\x44\x44\xae\xb5\x68\xf5\x71\xd3\x53\x37\x6f\xb9\x30\x76\xd7\xab\
-\x7d\xcc\xeb\x39\x5d\x8f\x9a\xad\x40\x62\xc9\x55\xc1\xe8\xe5\xf3\
-\x82\x73\xfd\x5d\xda\x75\x14\x80\xb3\xb3\x69\xa7\x05\xd5\xc7\x6d\
-\xd2\x01\xaf\xf5\x94\xb5\x59\x9f\xee\x46\xd1\x23\x90\xac\x8a\xdf\
-\x8c\x07\xf2\x55\x55\x6e\x9f\xaf\x4d\x00\x2a\xb3\x79\x21\x11\x51\
-\x81\x24\xc7\x7b\x7f\x5e\x34\xda\x7b\xe6\x7d\xf3\xeb\x85\xf2\xb6\
-\x0e\x7a\x75\xa6\x7f\xfe\xf6\x4d\x7a\xcc\x71\x0a\x74\xcc\x47\x9b\
-\xbd\xe5\xb5\x19\x17\xc7\xef\x2a\x89\xb5\x0d\x14\x1a\xf5\xde\x49\
-\xd3\x3b\x64\xfa\x50\xc6\x05\xc0\xd7\x66\xea\x51\x1d\x12\xfa\x06\
-\x97\x00\x10\x51\x08\xe9\x20\xb3\xf4\x9f\x1f\x89\xdd\x7f\x26\xa0\
-\xb9\x1c\x75\x7e\x48\x75\xe8\xbe\x69\x8e\xff\xa1\xb5\xaf\xdb\x11\
-\x7d\x03\xc4\xfa\xe4\xbb\x7d\x11\xad\xbf\x2e\xfe\xc5\x44\x0c\xa9\
-\xea\x7c\xb7\x4d\xe5\xcb\x24\x76\x55\xc8\xb0\xc7\x52\x99\x3c\x93\
-\xf1\x14\x80\xef\xe3\x28\xdf\x03\xe2\x5e\xa6\x4f\x12\x11\x15\x9c\
-\xac\xb1\x27\x7e\xe0\x97\xe9\xef\xbc\x74\x79\xfc\xfb\xc7\xe7\x6b\
-\x45\x7d\x12\x35\xbb\x17\xd9\xb3\x97\x2d\xf5\x27\xb4\x4f\xa2\x7a\
-\x38\x80\x9e\xf9\x68\xf7\x60\x54\xa5\xfd\xa2\xe0\xcc\xd9\x63\xbc\
-\xa7\x8b\x36\x92\x41\x65\xa0\xa5\x4d\x67\x00\x9b\x32\x79\x24\xf3\
-\x35\x00\x82\x3e\x69\x05\xe2\x19\x3f\x48\x44\x54\x1c\xbb\xb4\xcb\
-\xd8\x7b\xd3\xb7\xbd\x76\x79\xec\x7b\xd5\x1d\x64\x5b\x56\x07\x97\
-\x29\x4c\xb0\xc6\x9e\xb4\xff\xd6\xbd\x09\x79\x8e\x79\x48\x8b\xec\
-\x59\xd5\x63\xbc\xa7\x8b\xf5\x3a\x2a\x07\xe2\x75\x45\xa1\x0b\x00\
-\xb5\xe8\x91\xb6\x99\x3e\x45\x44\x54\x5c\xef\xdc\x28\xb8\xf3\xbf\
-\xbc\xfb\x96\x0e\xf4\x96\x9d\xd8\xda\xe7\x32\xd9\xba\x57\x28\xcd\
-\xda\xe6\xc4\x5d\xb6\xcb\xe6\x0e\x66\x7b\x0f\x17\xef\xa7\xd2\xe3\
-\xc3\x74\xc9\xf4\x99\x6c\x76\x01\x74\xf7\x59\x00\x10\x51\x69\xe8\
-\xf4\x97\xe0\xea\x36\xa7\xe0\xa9\x7f\x9d\xea\x3d\x71\xe6\xa1\xbe\
-\xa8\x51\x3a\x6c\x9d\x9b\x3e\x67\xf5\x4a\x1d\xdb\x35\xa5\x15\x43\
-\x90\xc1\xd6\xbd\x02\x91\x97\xec\x87\x5f\xfb\x90\xf9\x35\x0b\x00\
-\x6a\x15\x81\x16\xbe\x00\xb0\x82\x2e\x69\x2b\x00\x78\x12\x00\x11\
-\x95\x84\xc4\xdc\xe0\xbc\x33\xd7\xd9\x21\x33\x3f\x15\xbf\xfd\x14\
-\x03\x1b\x07\x00\x5f\xe2\xc9\x57\xfd\xd1\x8b\xe6\xda\x73\xb1\x47\
-\xbb\x8c\x46\x11\x87\xf8\x5b\x63\x8d\x1d\xd9\x07\xf8\xb5\xeb\x18\
-\x54\x22\x04\xc8\x78\x2b\x60\xe6\x05\x80\x45\xa7\x4c\x9f\x21\x22\
-\x72\x6d\x8b\x0e\x18\x3f\x3d\x7d\xcb\xc2\x33\xcc\xa3\x32\xdf\x9e\
-\xdd\xb4\x5d\xfb\x9e\xa0\x90\xd0\x2e\xb4\xf3\x11\x3f\x6a\xa3\x0e\
-\x7a\xb5\xb7\xac\x71\x72\xb6\x01\x95\x18\x91\x8c\xb7\x01\x66\xbc\
-\x4d\x46\x81\xf6\x29\x4e\x01\x10\x51\x09\x6a\xd4\xb6\xa3\x9e\x0c\
-\xae\x1c\xb9\x4d\xfb\x8d\x57\x48\x5b\xd7\x79\x8e\x64\x96\x7f\xfe\
-\x76\xd7\x19\xa8\x44\x28\x32\xde\x36\x9a\xf9\x08\x80\x6a\xbb\x7d\
-\x53\x00\x44\x25\x2b\x25\xa2\x4d\x80\x36\x19\xb5\x01\x00\x78\x12\
-\x34\xaa\xee\x9b\xd7\x8a\x49\xaa\x45\xa0\x16\x00\xe2\x9a\x4e\x1b\
-\x09\x8e\x5c\xf2\xaa\xbe\x73\xaa\xc6\xc1\xff\x6e\xa4\x11\x8f\x59\
-\x78\x07\xdd\x3c\xab\x10\xe3\x6b\xa2\xe2\x50\x4d\x5b\x78\x55\x2a\
-\xa6\xc2\xaa\xe1\x7c\x70\xc4\x6c\xb2\x83\x87\x59\x78\x69\x83\x80\
-\x1b\xaf\xe8\xf0\xc4\xd6\x66\xfa\x48\xe6\xbb\x00\x14\xb5\xbe\xdd\
-\xb7\x02\x80\x65\x00\xb9\x20\xa2\x3b\x3c\x9b\xae\x8f\x9b\x96\xbd\
-\x95\x68\x4e\x56\xa0\xd1\xaf\x44\xa3\xad\x35\x8d\x5a\x2d\x7b\x4c\
-\x35\xea\xe3\x35\xd8\x93\xa8\x91\x3d\x95\x1e\x52\xf1\x4a\x6d\xac\
-\x4a\x98\x96\x0a\x4f\xfd\x44\x95\x34\xb5\x03\x34\x01\x20\x01\xa0\
-\xbd\xeb\x7f\x96\xd6\x52\x98\xe0\x27\xe9\x3b\x57\xa4\xb4\x6a\x98\
-\xeb\x2c\x54\x3c\x2a\xd2\xe9\x55\x3b\x66\xe1\x30\x33\x67\x94\xeb\
-\x2c\x14\x72\x2a\x85\x2f\x00\x2c\xa4\x12\x00\x5a\x02\xa0\x92\x87\
-\x01\x51\x7e\xa5\x3c\xf8\x9b\x13\x68\xaa\x6b\x63\xea\x1b\x3b\x62\
-\xbb\xdf\x49\x36\xc7\xda\xc9\x8e\x8a\xf6\xb2\xad\x4d\x2d\xea\x3b\
-\xd4\x48\x7d\x27\x03\xdb\x19\x40\xe7\x56\xb7\x2a\x07\xfc\x77\x09\
-\x12\x58\xef\xe2\xd8\x5d\x95\x0f\xa5\xbf\xd1\x02\xe0\x90\xa3\x05\
-\x54\x7e\x16\x04\x67\xa7\x86\x99\x39\xae\x63\x50\xc8\x09\x50\x84\
-\x11\x00\x68\x1c\x10\xa4\x59\x00\x50\x76\x92\x31\x49\xbd\xd5\x06\
-\xf5\x3b\x3b\xc9\xe6\x96\xee\xb2\x36\xde\x55\x36\xb4\xed\x8c\x4d\
-\x5d\x6a\x4d\x7d\x57\x81\xf6\x03\x90\xd5\xd5\x96\xe5\xae\xab\x6c\
-\x18\x38\xd4\xcc\x7f\x61\xa5\x1d\x7d\xba\xeb\x2c\x54\x3c\x3b\xb5\
-\xfb\xf0\x40\x62\x49\x4f\x7d\xde\xbf\x42\x87\xa1\x19\x9f\x7a\x99\
-\xcd\x14\x80\x07\x00\x5c\x08\x48\x47\xd0\x94\x40\xf3\xba\x8e\xb2\
-\x6d\x67\x0f\x59\x67\x7b\x99\xd7\x6b\xbb\xca\xfa\x6e\xed\x65\x7b\
-\x4f\x81\xf2\xa6\xb3\x2c\x9d\x13\xfb\xf5\x69\x6b\x52\x27\xbc\x9a\
-\x46\x05\x57\x86\x47\x86\xb4\x59\x1d\x8c\x5a\x38\xd4\xcc\xe5\x34\
-\x00\x1d\x92\x45\x11\xa6\x00\x20\x62\x00\x20\xc5\xb3\x00\xe8\x1d\
-\x46\xec\xe6\x5a\xec\xda\xd0\x4d\x36\x34\xf5\x35\xab\x2b\x7a\xcb\
-\xea\x1e\x9d\x64\x4b\x1f\x81\x1d\xea\x3a\x5b\xb9\x31\xb0\xb1\x8b\
-\xe2\x77\x7b\x8f\xa4\xa7\xa6\xb0\x6f\x1d\x03\x45\xc0\x62\x7b\x56\
-\x72\xa8\x99\xeb\x3a\x06\x85\x98\x68\x31\xa6\x00\x74\xdf\xd6\xc1\
-\x94\x9f\xe9\x93\x54\x0e\x44\xb4\xbe\x0a\x7b\xdf\xec\x25\xaf\xed\
-\x1d\x68\x56\x56\xf7\x33\x2b\xfa\xd5\x62\x77\x0f\x00\x5c\xa1\x5e\
-\x24\xdd\x65\xed\xe0\x21\x66\xd1\x0b\xab\xec\xc8\xd3\x5d\x67\xa1\
-\xe2\xd8\xa6\x7d\x8e\xb3\xf0\x7c\x83\x20\x9b\xd3\x5b\x29\x0a\xa4\
-\x98\x05\x00\xa7\x00\xa2\xa0\xb1\x0a\x0d\xaf\xf7\x32\x6f\xee\x1a\
-\x68\x5e\xae\xea\x87\x15\xfd\xda\x98\x5d\xdd\x01\x38\x39\x1f\x9d\
-\xfe\xed\xbc\xd8\x2f\x4f\x7d\x23\x75\xdc\x6b\x69\x54\x70\x3a\x25\
-\x02\x54\xd1\xfe\x75\x7b\xc2\x92\xc1\x66\xf1\x49\xae\xb3\x50\x68\
-\x65\xbc\x38\x38\x9b\x6a\xd2\x00\x80\x6f\x01\xab\x80\x29\xe1\x95\
-\xd5\xf4\x9f\x44\xed\xb6\xf6\x66\xc7\x1b\xfd\x64\x65\x7a\x80\x79\
-\xa5\x43\x3f\xb3\xfa\x18\x0f\xe9\x13\x5c\xe7\xa2\xf7\x33\x08\xe2\
-\x9f\x88\xdf\x8d\xdf\xa5\xa7\xa6\xc1\xcb\x39\x23\x61\x61\xf0\x81\
-\x86\xc1\x66\xb1\xeb\x18\x14\x5e\x19\x2f\xcb\xcf\x62\x17\xc0\xbe\
-\xcd\x54\x8a\x7d\x5b\x01\xab\x38\x20\x55\xaa\xfc\x04\x5a\x56\xf7\
-\x30\x6b\x77\x0c\x31\x0b\x2b\x07\xc8\xcb\x03\x6b\x64\x4f\x57\x64\
-\x71\x9e\x34\xb9\xd1\x53\xd6\x0e\x3e\xda\x2c\x7b\xe1\x75\x7b\xc2\
-\xe9\xae\xb3\x50\xe1\x6d\xd1\x01\xc7\x00\xa2\x80\xf2\x63\x17\x1d\
-\x4c\x11\x0a\x00\xfd\xf7\x6e\xea\x24\x0b\x80\x52\xd2\x54\xa9\x4d\
-\x6f\xf4\x30\x6f\xd4\x1d\xe3\x2d\xa9\x1e\x68\x96\x0d\xae\x44\x23\
-\x0f\x95\x29\x71\xe7\xc7\x1e\x18\xf7\x93\x96\x3b\x5f\xf7\x25\x71\
-\xb4\xeb\x2c\x54\x58\x0a\xe9\xba\x49\xfb\xbf\xd6\x53\xd6\x72\xda\
-\x87\x0e\x26\xe3\xa3\xfd\x73\xea\xbe\x53\x01\x77\x02\x84\x95\x88\
-\xd6\x57\x6b\xfd\xaa\xfe\xe6\xb5\xbd\x43\xbc\xf9\xed\xfb\xca\xaa\
-\xe3\x0d\x82\xe1\xae\x73\x51\x7e\x79\x48\x27\x3e\x5e\xf1\x93\xe0\
-\xd1\xd4\x57\x02\x64\xf1\x09\x80\x4a\xcb\xf2\x60\xc2\xe6\x9e\x31\
-\x16\x00\x74\x50\x85\x1f\x01\xb0\xfb\xf5\xf7\xc9\x20\xd3\xa7\xa9\
-\x50\x04\xba\xad\x56\x76\xad\xef\x2b\xab\x9b\x86\x7b\x73\xba\xf6\
-\x94\xd7\x8f\x11\xe8\x29\xae\x73\x51\xe1\xf5\xc1\x6b\xc7\x0c\x30\
-\x2b\x66\xac\xb5\xc3\x26\xba\xce\x42\x85\xf5\xa6\x1e\xd7\xce\x75\
-\x06\x0a\xad\xc2\x17\x00\xfb\x6b\x61\x01\xe0\x8c\x87\xf4\xba\x4e\
-\xb2\x65\xc3\x20\x6f\xa9\x0c\xc6\x82\x7e\x1d\xcd\xb6\x3e\xe0\xfc\
-\x7d\x64\x7d\x24\x7e\xff\x98\x9f\xb4\xdc\xb9\x36\x40\x7c\x80\xeb\
-\x2c\x54\x38\x4d\xda\x66\x68\x4a\x2b\x1a\x13\xd2\x92\xf1\xa9\x6f\
-\x54\xf6\x8a\x3b\x05\xe0\x5b\x20\xb0\x80\x97\xf1\x6b\x29\x53\x1e\
-\xfc\x0d\x1d\xcd\xb6\xb7\x06\xe8\x72\x3b\x3c\xf6\xe2\xc0\xf6\xb2\
-\xb3\x3f\x80\xfe\x8e\x63\x51\x48\xc4\x34\x55\xf9\xb1\xd8\x4f\x1b\
-\xff\xe8\x7f\x91\x53\x01\xe5\x2d\xf1\xba\x8e\x5c\x36\x54\xe6\x9c\
-\xec\x3a\x08\x85\x4e\x71\x47\x00\x00\xa0\x39\x00\x6a\x59\x00\xe4\
-\x9d\x07\x7f\x43\x17\xd9\xb0\x6e\x90\x59\x6e\x86\x98\x79\x03\xda\
-\xca\xce\x3e\x00\xfa\xb8\xce\x45\xe1\xd5\xcf\xbc\x7a\x5c\x1f\xb3\
-\x7a\xc6\x06\x7b\x0c\xa7\x02\xca\xd8\xf2\x60\x5c\xf3\x50\x5e\x0e\
-\x44\xef\x57\xfc\x02\x20\xe9\x03\xb5\xdc\x85\x9c\x2b\xeb\x89\xff\
-\x5a\x77\xac\xdf\x74\x6c\x6c\x41\xe5\xd1\xb2\x68\x48\x0d\xf6\xb2\
-\xc3\xa7\x8c\x7d\x2c\x76\xef\xc9\xf7\xa6\xee\x7a\x2b\x40\xac\xaf\
-\xeb\x2c\x54\x18\x5b\xb4\x5f\x6f\xd7\x19\x28\x94\x32\x9e\x94\xcf\
-\xe2\x2e\x00\x28\xf6\xdb\x0a\xd8\xcc\x9d\x00\xd9\xb0\x9e\xa4\xd7\
-\x76\xc1\xc6\x4d\xc3\xbc\xf9\xb1\x63\xbc\x05\xc7\x54\x69\xc3\x10\
-\x00\x43\x5c\x07\xa3\xd2\x16\x47\xaa\xfa\xbf\xe2\xf7\xed\xfe\x53\
-\xfa\x0b\x16\x59\xcc\x09\x52\xf8\xf9\x88\x0f\x68\x46\xdb\x5d\x55\
-\xd8\xd3\xc1\x75\x16\x0a\x95\x96\x4c\x1f\xc8\xb8\x00\x38\xb0\xbb\
-\x6f\xe1\x9d\x00\xad\x11\x78\x92\x5e\xf7\x5e\x87\x2f\x0b\x86\x54\
-\x49\xc3\x40\x00\x03\x01\xb0\x7e\xa2\xbc\xea\x2f\x2b\x86\xf7\x92\
-\x37\x5e\x7c\x5b\x07\x4e\x70\x9d\x85\x0a\x42\xd6\xda\xa1\x6f\xf0\
-\x76\x40\x3a\x40\x71\x0a\x80\xfd\xa5\x2d\x10\x28\xe0\xf1\x6c\xaa\
-\x03\xe8\xae\xfe\xb2\xe2\xe5\x63\xbd\x45\xd5\x47\x9b\xa5\x43\x12\
-\x68\xfe\x77\x87\x4f\x54\x60\x1f\x8f\xdd\x33\xf2\xde\xf4\x0f\x37\
-\x5a\x18\x0e\x17\x97\xa1\x35\xc1\x09\x8d\xbc\x1d\x90\x0e\x90\x71\
-\x01\x90\xf1\x10\xa1\x1c\xf0\x79\x55\xb1\x6f\x1d\x00\xfd\x27\x0f\
-\xc1\xee\xff\x8e\xff\x64\xe2\x50\xf3\xd2\xc9\x09\x34\xb7\x71\x9d\
-\x87\xa2\x25\x21\x2d\x35\x17\xc4\x7f\xb1\x03\x1c\x5f\x2a\x4b\x6f\
-\xe3\xe8\xb6\xae\x33\x50\xe8\x14\xbe\x00\x80\xbc\xff\x07\x0a\x0f\
-\x04\x7a\xbf\x00\xb1\xee\xfb\xce\xed\x26\x72\xe3\x68\x59\x74\x62\
-\x77\x59\x37\xcb\x75\x0e\xca\xbf\x66\x5b\x7b\x8c\x85\xe1\x47\x2f\
-\xda\x5f\x11\x46\x00\xf4\xfd\x2b\x0d\x9b\xd2\x1c\xff\x3f\x88\xca\
-\x46\xd4\xee\x72\x1d\x82\xa2\xed\xc2\xf8\x8f\x4e\x14\xb1\x9b\x5c\
-\xe7\xa0\x3c\x13\xa9\xde\x8a\xfe\x6f\xba\x8e\x41\xa1\x52\xf8\x02\
-\xc0\x88\xbe\xaf\xea\x6c\xf2\xc1\x81\xc6\x83\xd8\x15\x74\xdb\xe6\
-\x3a\x03\x45\x5b\x02\xcd\x6d\xce\xf7\x7e\xb1\x05\xfc\x1b\x5a\x76\
-\x36\xd8\x41\x3b\x5c\x67\xa0\xf0\x50\x91\x22\x14\x00\x46\x52\x07\
-\xfe\x5a\xa0\x40\x8b\xcd\xb4\xa5\xf2\x57\x2f\xdd\x77\xbb\xce\x40\
-\x34\xd8\x2c\x1a\xd1\x15\x1b\x66\xbb\xce\x41\xf9\xb5\x31\x38\x3a\
-\xed\x3a\x03\x85\x88\x6a\x11\xd6\x00\x00\xef\x2b\x00\x00\xa0\x99\
-\xb3\x51\xef\xb3\xdd\xf6\xcc\xf8\x5f\x08\x51\x21\x5c\x98\xb8\xeb\
-\x78\x23\x76\xb3\xeb\x1c\x94\x3f\xdb\xb5\x67\xb5\xeb\x0c\x14\x1e\
-\x46\xb1\x27\xe3\x67\x32\x7d\x40\x0e\x31\xcf\xd0\xe4\x73\x1d\xc0\
-\x81\xea\xb4\x2b\x87\x5d\x29\x14\x2a\xd1\xdc\xf6\x1c\xef\xe1\x8d\
-\xae\x73\x50\xfe\x34\xa3\x5d\x77\xd7\x19\x28\x3c\xd4\xa0\x3e\xd3\
-\x67\x32\x9f\x02\x80\x26\x0f\xf6\xeb\x4d\x1c\x8c\x7a\x9f\xbd\xe8\
-\xcc\x43\x92\x29\x34\x86\x9a\x39\x27\x77\x92\xcd\x3c\x44\xbe\x4c\
-\x04\x88\xf5\xf2\x51\xd9\xe8\x3a\x07\x85\x85\x16\xbe\x00\x80\x48\
-\xd3\xc1\x7e\x39\x6d\xf7\xdd\x0e\x48\xff\xd6\x28\x6d\x6b\x5d\x67\
-\x20\xda\xdf\xc5\x89\x3b\x87\x88\xe8\x76\xd7\x39\x28\x2f\xcc\x16\
-\xed\xf3\x96\xeb\x10\x14\x12\x16\x19\xaf\x39\xcb\x62\x0a\x40\xf7\
-\x1e\xec\xd7\x15\x40\x23\xd7\x01\xfc\x87\x94\xad\xe8\xe4\x3a\x03\
-\xd1\xfe\xaa\xb4\xa1\xe3\x07\xbc\xdf\xaf\x73\x9d\x83\xf2\x63\x47\
-\xd0\x2b\xe3\x79\x5f\x2a\x57\x52\x84\x29\x00\x91\x43\x6e\x6d\xe3\
-\x79\x00\xff\xc9\xc2\xeb\xaa\x30\x3c\x26\x89\x42\xe5\x78\x33\xe3\
-\xe4\xf6\xd8\xca\x73\x64\xcb\xc0\x4e\x70\xa1\x31\xed\xa3\xc5\x28\
-\x00\x20\xd8\x72\xa8\xdf\x6a\xe0\x3a\x80\x03\xc5\x1b\xb4\x3d\xf7\
-\xea\x52\xe8\x7c\x2a\x71\xc7\x60\x11\xe5\xf7\x66\x89\xdb\xa5\x5d\
-\xb8\xd0\x98\xf6\x31\xc8\xf8\xe0\xb9\x8c\x0b\x00\x0f\x38\xe4\x4a\
-\xe2\xb4\x05\xd2\xfc\xbc\xfb\x1f\xea\xb4\x1b\xe7\x5b\x29\x74\xaa\
-\xb1\xb7\xe3\x04\xef\xf1\x35\xae\x73\x50\x6e\xf6\xa0\x53\xc2\x75\
-\x06\x0a\x07\x95\xa0\xf0\x23\x00\xd6\x60\xdd\xe1\x7e\x9f\xa3\x00\
-\xff\x69\x17\xba\x1f\x74\xcd\x04\x91\x6b\xa3\xcc\xb3\x63\xdb\xcb\
-\x0e\x4e\x05\x94\xb0\x26\xd4\xf2\xa2\x31\x02\x00\xc4\xfc\x22\x2c\
-\x02\x84\x7f\xf8\x02\xa0\x31\xe0\x3a\x80\xfd\xed\xb0\x3d\x0f\x7a\
-\x70\x12\x51\x18\x7c\x32\x71\xc7\x51\x80\xf2\xce\x8a\x12\x95\xd6\
-\xca\x0e\xae\x33\x50\x48\xc4\xb0\x35\xd3\x47\x32\x2e\x00\xd2\xc0\
-\x6b\x87\xfb\xfd\xc6\x34\x78\xea\xf8\x7e\xea\xd0\xd5\x75\x04\xa2\
-\x43\xaa\xd1\xfa\xae\xe3\xbd\xbf\xad\x74\x9d\x83\xb2\x63\x21\xbc\
-\x16\x98\x00\xc0\xa2\xae\xf7\x21\xd7\xe7\x1d\x4a\xc6\x05\xc0\xbd\
-\x67\xa1\xee\x70\x9f\xf1\x03\x0b\x34\x73\x1d\xc0\x7b\xf6\x6a\xc7\
-\x0a\xd7\x19\x88\x0e\x67\xb4\xf7\xf7\x53\xdb\xc8\xce\xf9\xae\x73\
-\x50\x36\xa4\x56\x61\x78\x02\x4b\xd4\x09\xb6\xc9\x19\xd3\x32\xde\
-\x88\x9f\xcd\x41\x40\xea\x79\x38\xec\x4c\xff\x5e\x6e\x07\x7c\x4f\
-\x93\xb6\xe5\x1c\x1d\x85\xde\xa7\x62\x77\xf4\x17\xc9\xfc\x24\x31\
-\x72\x4e\x92\x5a\xcd\x75\x46\x51\xa7\xc8\xea\x9e\x8f\x6c\x2e\x03\
-\x42\x4c\x70\xd0\xd3\x00\xdf\xd5\xc8\x85\x80\xef\x49\x21\xd1\xd9\
-\x75\x06\xa2\x23\x69\x23\xbb\xba\x9e\x62\x9e\x7a\xc5\x75\x0e\xca\
-\x5c\x52\x58\x00\x44\x9d\x00\x9b\xb2\x79\x2e\xab\x02\xc0\x1c\xe1\
-\x93\x42\xd2\xdf\xb7\x25\x90\x00\x40\xba\x04\x88\x73\x21\x20\x85\
-\xde\x38\xef\xaf\xa7\xd5\x60\xf7\x42\xd7\x39\x28\x33\x49\xb4\xe1\
-\x7d\x00\x11\xa7\x90\x22\x16\x00\x2a\x87\x5d\x6c\xa0\x00\x1a\xd8\
-\xe5\xbd\xcb\xec\x41\x87\x43\x9e\x9e\x48\x14\x26\x9f\x8a\xdf\xd1\
-\x5b\xa0\x0d\xae\x73\x50\xeb\x35\xdb\x2a\xfe\xb4\x8d\x3a\xd1\x8c\
-\x17\x00\x02\xd9\x16\x00\x06\x1b\x8e\xf4\x35\x0d\x5c\x07\xf0\x9e\
-\xba\xa0\x6b\x9d\xeb\x0c\x44\xad\xd1\x4e\xb6\x77\x1f\xe5\x3d\xbb\
-\xc4\x75\x0e\x6a\x3d\x0b\x8f\xfb\xae\xa2\xce\x16\x73\x04\x40\x70\
-\xc4\x13\xc4\x1a\xd2\x80\xe5\xb7\x25\x00\xa0\xce\xf4\xe2\x1c\x1d\
-\x95\x8c\x09\xde\x9f\x4f\xab\x96\x3d\x8b\x5d\xe7\xa0\xd6\xf2\xb8\
-\xef\x2a\xe2\x14\xb6\x78\x05\x00\x04\x2b\x8e\xf4\x25\x0a\x2e\x06\
-\x7c\x57\x9d\xed\xc9\x3f\x09\x2a\x21\x2a\x9f\x8c\xdd\xd1\x55\xa0\
-\x9c\x5b\x2e\x01\x3e\x0c\x3f\x6a\x45\x9c\x17\x93\xb5\xd9\x3c\x97\
-\x55\x01\xd0\xd8\x84\x05\xad\xf9\xba\x3d\x9c\x06\x00\x00\xec\xb2\
-\x9d\xb2\x2b\xb4\x88\x1c\xe9\x20\xdb\x7a\x9f\x14\x7b\x61\x91\xeb\
-\x1c\x74\x64\x8a\x04\x97\x5c\x47\x9d\x17\x2b\x5e\x01\xf0\xf3\x0f\
-\x61\x8d\x31\x47\x3e\xef\x6f\x6f\x8a\x87\x02\x02\xc0\x1e\x74\xac\
-\x74\x9d\x81\x28\x53\xa7\x9b\x47\x4f\xab\x44\xe3\x32\xd7\x39\xe8\
-\xf0\x7c\xcb\x11\x80\x48\x13\x6c\x91\x61\x3f\xcd\x6a\xe1\x6e\x96\
-\x53\x00\xa2\x31\xe0\x88\xf7\x50\x5b\xe5\x34\x00\x00\x24\xb5\xb6\
-\x9d\xeb\x0c\x44\x99\x12\xa8\xf9\x64\xfc\xce\x4e\x00\x9a\x5d\x67\
-\xa1\x43\x33\xc6\x72\xa8\x35\xc2\x54\xf5\x8d\x6c\x9f\xcd\x7a\x68\
-\x3a\x66\xd0\xaa\x95\xed\x7b\x52\xfc\xde\xf4\x91\xe8\xe2\x3a\x03\
-\x51\x36\x3a\xc9\xa6\xde\xa7\xc7\x1e\x5b\x5a\x2d\x7b\x97\x72\x4d\
-\x40\x38\x79\x08\x38\xc5\x18\x61\x02\x64\x5d\x00\xc4\xb2\x7d\xd0\
-\x40\x37\x00\xd2\xf3\x48\x5f\xb7\x37\x0d\xa8\x02\x12\xe1\x3a\x40\
-\x81\x8e\x69\x24\x9a\xe2\x48\x55\xbb\xce\x42\x94\xa9\x91\xe6\x9f\
-\x63\x47\x9a\x7f\x42\x61\x82\x6d\xda\xfb\x8d\xf5\xf6\xb8\x2d\x6b\
-\xec\x70\xbb\x1d\xbd\x7b\x06\x1a\x3f\x0a\x40\x84\xff\x76\xbb\xe7\
-\x49\x9a\x05\x40\x94\xa9\x83\x02\xc0\x33\xf2\x2a\x80\x31\x47\xfa\
-\xba\xc0\x02\x8d\x3e\x50\x1b\xcf\xf6\x4d\xe5\x61\xb7\x76\xde\xd6\
-\x59\x36\xf5\x77\x9d\x83\x28\x5b\x02\xeb\x75\x93\xb7\x06\x76\xf3\
-\xde\x1a\x38\xda\xfb\x3b\x00\x20\x85\xaa\xbd\xeb\xec\xd0\x35\xab\
-\xec\x49\x7b\xb7\xe8\x51\xd5\x0d\xe8\x30\x48\x55\xda\x3b\x8e\x1a\
-\x29\x9e\xa6\x3d\x96\x60\xd1\xa5\xe2\xa0\x00\x80\xc1\x22\x00\x57\
-\xb4\xe6\x4b\x77\xa7\x04\xb5\xf1\x68\xaf\x53\xa9\xd3\x6e\xbb\x58\
-\x00\x50\xb9\x49\xa0\xb9\xcd\x60\xb3\x68\xc4\x60\xb3\x6f\xc3\x00\
-\x47\x09\x8a\x2f\x26\x3e\x47\x00\x22\xcc\xb3\xd9\xaf\x01\xc8\xba\
-\x00\x68\x01\x5e\x68\xed\xd7\xee\x4d\x01\x5a\x13\xed\x9f\x00\x75\
-\xda\xab\x11\xe0\x01\x6b\x54\xde\x38\x4a\x50\x7c\x46\x7d\x8e\x00\
-\x44\x99\x04\xc5\x2f\x00\xba\xcf\xc0\xca\xf5\xa7\x40\x55\x8f\xfc\
-\xad\x67\x15\xd8\x93\x02\xda\x25\xb2\x7d\x5b\xe9\xdb\xa9\x3d\x32\
-\xbe\xab\x99\xa8\x1c\x70\x94\xa0\xb0\xe2\xa6\x25\xc2\x3f\x59\x23\
-\x6f\xab\x8c\xf8\xd5\xf6\x6c\x1f\xce\xba\x00\x98\x36\x4d\xec\x94\
-\x7f\xe8\xde\x96\x00\x6d\x5b\xf3\xf5\xf5\x2d\x82\x76\x89\xe8\x4e\
-\x03\xd4\x6b\x67\xcf\x75\x06\xa2\x30\xe0\x28\x41\x7e\x55\x6a\x53\
-\x15\x4b\xa7\x68\x12\x41\x4e\x57\x78\x67\xbf\x06\x00\x80\x67\xf0\
-\x36\x5a\x59\x00\x34\xbe\x73\x45\x70\x3c\xa2\xb3\x55\x7b\xb5\x3d\
-\x77\x00\x10\x1d\x02\x47\x09\xb2\x97\x40\x73\x8d\xeb\x0c\xe4\x86\
-\x2a\x96\xe7\xf2\x7c\x4e\x05\x40\xcc\xc3\x2a\xa4\x71\x6c\xab\xbe\
-\x58\xf7\xad\x05\x88\xea\x99\x78\x49\xa9\xe6\xa7\x19\xa2\x56\x3a\
-\xd8\x28\x41\x13\xda\xd4\xad\xb5\xc3\xdf\x78\xce\xff\x54\x07\x1f\
-\xf1\xa3\x1d\x47\x0c\x8d\x0a\x49\xf2\xc3\x45\x44\xa9\x68\x4e\x05\
-\x40\x4e\x9f\xc7\x63\x16\x73\x32\xf9\xfa\x5d\x2d\xd1\x2d\xde\xad\
-\xc6\xba\xb9\xce\x40\x54\xca\xaa\xb1\xb7\xe3\x30\x33\xe7\x64\x03\
-\x9b\x72\x9d\x25\x44\x92\x06\x41\x4e\x1f\xe4\xa8\x74\x79\x39\x8e\
-\x00\xe4\x54\x00\xa4\x7c\x3c\x99\xc9\xd7\xb7\x04\x40\x73\x44\x97\
-\xc2\x29\xa4\x36\x89\xaa\x3d\xae\x73\x10\x95\xba\xb4\xf0\x64\xcd\
-\x77\x89\xf2\x74\xc6\x08\xb3\x30\xc9\x95\xb9\x34\x90\x53\x01\xf0\
-\x93\x73\x64\x95\x11\x64\x74\x17\x75\x7d\x84\x8f\x06\xae\xb7\x5d\
-\xb7\xb9\xce\x40\x54\xca\x02\xc4\x53\xaa\xd2\xd9\x75\x8e\xb0\x30\
-\x12\x34\xb9\xce\x40\xce\xbc\x29\x27\x3c\x94\x53\x01\x98\xf3\x92\
-\xbc\x84\xc1\xce\x4c\xbe\xbe\x3e\xb9\x6f\x5b\x60\x14\xed\x92\xee\
-\xf5\xae\x33\x10\x95\xb2\x7a\xdb\x69\x2b\xb8\x10\xf0\x3d\x06\x01\
-\x2f\x6a\x8a\x28\x81\xe4\x34\xfc\x0f\xe4\xa1\x00\x88\x19\xac\xce\
-\xe4\xeb\x15\xfb\xce\x04\x88\xa2\x1d\x7e\x4f\xfe\x65\x25\xca\x41\
-\x1d\xba\xb7\xea\x12\xb2\xa8\xf0\x24\x38\xe2\xad\xac\x54\x9e\x14\
-\xfa\x72\xae\x6d\xe4\x5c\x00\x18\x83\x59\x99\x3e\x13\xd5\xc5\x80\
-\xbb\xa4\x5b\x46\xd3\x25\x44\xf4\x9f\xea\xa4\x57\x56\xf7\x9e\x97\
-\xab\x98\xa6\x22\xfa\x71\x8a\x54\x75\x5e\xae\x6d\xe4\x5c\x00\x88\
-\xc1\x9f\x33\x7d\xa6\xd9\xdf\xb7\x20\x30\x6a\xea\xb4\x73\xc4\xaf\
-\x44\x22\xca\xcd\x8e\x80\x27\x6a\xee\x2f\x2e\xa9\xb4\xeb\x0c\xe4\
-\x84\x7a\x56\x16\xe4\xda\x48\xce\x05\xc0\x8f\x26\x62\xa1\x27\xb0\
-\x99\x3e\x57\x97\x8c\xde\x28\x40\xbd\x76\xeb\xd9\xa8\x6d\x33\x5a\
-\x33\x41\x44\xff\xb6\xcb\x76\xe2\x89\x9a\xfb\x49\x48\x92\x05\x51\
-\x34\xbd\x29\xa3\xa6\xef\xc8\xb5\x91\xdc\xcf\xe5\x13\xd1\x4c\x17\
-\x02\x02\xc0\xee\x14\x10\x44\x6c\x31\x60\x80\xf8\x80\xe9\xe9\x5b\
-\x92\x1b\x83\xa3\x57\xb8\xce\x42\x54\x8a\x1a\x22\x7b\x94\xd8\xc1\
-\xc5\xd1\x9c\xf1\x87\x2f\x2a\x0b\x39\x0f\xff\x03\xf9\x28\x00\x00\
-\xc4\x62\xc8\xb8\x43\xb3\x0a\xd4\x47\x70\xf9\x8a\x85\xe9\xf5\x87\
-\xe0\x86\x81\x73\xfd\x0f\xbf\xe8\x3a\x0b\x51\xa9\x49\x4a\x75\x07\
-\xd7\x19\xc2\xa4\x52\x9b\x22\xf6\x31\x8a\xde\x91\xf3\xf0\x3f\x90\
-\xa7\x02\x40\x14\xcf\x65\xf3\x5c\x5d\x52\x10\xd1\xef\xde\xca\xd9\
-\xf6\x82\x09\x8f\xa4\xa7\xce\xb4\xf0\x38\x87\x47\xd4\x4a\x16\xb1\
-\xee\xae\x33\x84\x49\x8d\xf0\x18\x80\x28\x32\x2a\xa1\x1a\x01\xf8\
-\x4d\x36\xcf\xa5\xed\xbe\xfb\x01\xa2\x6a\x8b\x0e\x18\x7f\x9f\x7f\
-\xfb\xab\x0d\x68\xc7\x03\x82\x88\x8e\xa0\x09\xb5\xf5\xaa\xc2\x8b\
-\x6f\xf6\x53\x25\xbb\xb9\x26\x22\x7a\xd2\x48\x56\x2f\xcd\x47\x43\
-\x79\x29\x00\xee\x9a\x28\x1b\xe2\xa2\xc9\x6c\x9e\xdd\x15\xc1\xc5\
-\x80\xfb\x4b\xda\xea\xe3\xa7\xa7\x6e\xb6\xeb\xed\xb1\x39\x5d\xeb\
-\x48\x54\xee\xea\xb5\x0b\x0b\xe5\x03\x54\x49\x13\x0b\x80\x88\x51\
-\x60\x99\x8c\xfb\x61\x5e\xce\x94\xc9\xdb\xe5\xbc\xf1\x18\xd6\x64\
-\xf3\x5c\xa3\x0f\x24\x23\xb8\x25\x70\x7f\x0a\xd3\xfd\x8f\xfe\x17\
-\x07\xcd\xb1\x1f\x9d\xe9\x3a\x0b\x51\x58\xed\xd2\x5e\xbb\x5d\x67\
-\x08\x9b\x1a\xd9\xc3\xad\xc5\x11\x23\xa2\x2f\xe5\xab\xad\xfc\x15\
-\x00\x46\x9e\xcf\xf6\xd9\x9d\x11\x1f\x05\x78\x47\xc5\x4b\xfe\x79\
-\xe3\x1f\x49\x4f\x9d\x19\x20\x1e\xe1\x89\x11\xa2\x83\xdb\xa6\x3d\
-\xb3\x1a\x65\x2c\x67\x15\xd8\x5b\xe5\x3a\x03\x15\x97\x02\x59\xf7\
-\xb5\x07\xca\x5b\x01\x60\x63\x78\x24\xdb\x67\x77\xb7\xec\x5b\x0f\
-\x40\xfb\xd6\x05\xfc\xac\xe5\xd6\xd5\x8d\xd2\x61\xab\xeb\x2c\x44\
-\x61\x52\x67\xbb\x44\x74\xcd\xf0\xa1\x55\x49\x23\x0b\x80\x68\x51\
-\xcf\x97\xbc\x8d\x14\xe7\xad\x00\xf8\xf1\x04\x99\x1f\x33\xc8\xfa\
-\x50\x8a\x28\x1e\x0c\x74\x28\x49\xa9\x1e\x3e\xbd\xe5\xfb\x58\xc7\
-\x75\x01\x44\xef\xd9\x03\x9e\xa4\x79\xa0\x4a\x6d\xa8\x76\x9d\x81\
-\x8a\xea\xe5\x7c\x1c\x00\xf4\xae\xbc\x15\x00\x00\x90\x30\x78\x2b\
-\xdb\x67\x77\xb5\x44\xef\x60\xa0\xc3\xb1\x30\xdd\xfe\xc4\x75\x01\
-\x44\xef\x69\x92\x76\xdc\x01\x70\x80\x2a\x34\xb7\x71\x9d\x81\x8a\
-\x49\x5e\xc8\x67\x6b\x79\x2d\x00\x62\x82\x7f\x65\xfb\xac\x55\xa0\
-\x8e\x33\x7c\x07\x7a\x6f\x5d\x00\xcf\x0b\xa0\xa8\x4b\xd9\x8a\x2e\
-\xae\x33\x84\x8c\x4d\x48\x92\x23\x00\x11\xa2\xd0\x17\xf2\xd9\x5e\
-\x5e\x0b\x00\x04\xf8\x59\x2e\x8f\x47\xf8\x60\xa0\xc3\xda\xa2\x03\
-\xc6\xdf\x9f\xbe\x79\x79\xb3\xd6\xd4\xbb\xce\x42\xe4\x82\x85\x09\
-\x2c\x3c\x16\x00\xff\x41\xf7\x02\xca\xb9\xd3\xe8\xb0\x5e\x2a\x9e\
-\xd7\x11\xe1\xbc\x16\x00\xf7\x9c\x23\x8b\xe2\x06\x59\x1f\xf0\x1b\
-\x28\xb0\x8b\xa3\x00\x07\xd5\xa4\x6d\x47\xdc\x9f\xbe\x75\xf7\x36\
-\xdb\xfb\x4d\xd7\x59\x88\x8a\x6d\xaf\x76\xd8\x0a\x20\xe6\x3a\x47\
-\x98\x18\xb5\x8d\xae\x33\x50\x51\xbd\x2c\x63\xee\xcd\xeb\x65\x72\
-\xf9\x1d\x01\x00\x10\x37\x78\x35\x97\xe7\x77\x24\x05\xca\x61\x80\
-\x83\x0a\x10\xeb\xf7\xb0\xff\x8d\xae\x2b\xec\xb8\xbc\x9c\x03\x4d\
-\x54\x2a\x76\x6a\x0f\xde\xa2\x79\x00\xcf\x04\x2c\x00\xa2\xe5\x85\
-\x7c\x37\x98\xf7\x02\x20\x66\xf0\x44\x2e\xcf\xfb\x76\xdf\x82\x40\
-\x3a\x38\x85\xd4\x3e\xed\x5f\x3e\xe2\x69\xff\xd3\x33\x5c\x67\x21\
-\x2a\x96\x3a\xf4\x68\x70\x9d\x21\x6c\x3c\xf1\xf3\x72\x1a\x1c\x95\
-\x06\x2b\xfa\x74\xbe\xdb\xcc\x7b\x01\x90\x8c\xe3\x7e\xe4\x38\x2b\
-\xc5\x51\x80\x23\xf2\x56\xd8\xb1\x13\x1f\x49\xdf\xc4\x43\x83\x28\
-\x12\x76\xd8\x9e\x5c\x04\x7b\x80\x98\xb6\xf0\xa3\x52\x74\x34\xc6\
-\x76\xa5\xf3\xfe\xa1\x2f\xef\x05\xc0\xf4\x09\xb2\xb9\xc2\x20\xa7\
-\x23\x3b\x39\x0a\xd0\x3a\x5b\xb4\xdf\xbe\x43\x83\xb4\x6d\xde\xf6\
-\x85\x12\x85\xd1\x2e\xed\xc2\xc5\x6e\x07\xa8\x40\x0b\x8b\xa2\x88\
-\x10\xc8\xf3\x72\xc6\xaf\xf3\xbe\x42\x2e\xef\x05\x00\x00\xc4\x05\
-\x39\x5f\x55\xc8\x51\x80\xd6\x49\x4a\xf5\xf0\xe9\xe9\x5b\x9a\xb7\
-\x69\xbf\xd7\x5d\x67\x21\x2a\x94\x06\xe9\x58\xe1\x3a\x43\xd8\xc4\
-\xb4\x99\xe7\xa7\x46\x84\xaa\xfe\xbd\x10\xed\x16\xa4\x00\x10\x0f\
-\xf7\xe7\xda\x86\x6f\x81\x3a\x8e\x02\xb4\x8a\x85\xe9\xf3\x50\xfa\
-\x6b\x5d\x5e\xb7\xc7\x2f\x73\x9d\x85\xa8\x10\x9a\x6d\x4d\x7b\xd7\
-\x19\xc2\x26\x6e\x52\x2c\x00\x22\xc2\x88\x79\xaa\x20\xed\x16\xa2\
-\xd1\x4e\x2f\xe2\x2f\xb9\x1c\x0b\xfc\xae\x1d\xcd\xc2\xd3\x01\x5b\
-\x4d\xda\x3d\xe1\x5f\x33\x64\xb1\x3d\x7b\x8e\xeb\x24\x44\xf9\xe6\
-\x4b\x45\x57\xd7\x19\xc2\xa6\x02\x49\xfe\x74\x8c\x86\x57\xe4\xa4\
-\x9f\xad\x2b\x44\xc3\x05\x29\x00\xa6\x4d\x13\x5b\xe1\xe9\x8a\x5c\
-\xdb\x09\x94\x77\x04\x64\xa8\xe2\x79\xff\xbf\xc7\x72\x87\x00\x95\
-\x93\x34\x2a\x9a\x54\xc1\x11\x80\x03\xc4\xc1\x25\x00\x11\x51\x90\
-\xe1\x7f\xa0\x40\x05\x00\x00\x78\x9e\x3c\x9c\x8f\x76\x76\x26\xf7\
-\x4d\x07\x50\xab\xc9\x0a\x3b\x76\xe2\xe3\xe9\x6b\x59\x04\x50\x59\
-\xd8\x65\xbb\x6d\x71\x9d\x21\x8c\x2a\x0c\x4f\x4d\x8b\x02\x8b\xc2\
-\x0c\xff\x03\x05\x2c\x00\x92\x0d\xf8\xa9\xe4\xe1\x64\x5f\xab\xc0\
-\xf6\x66\x8e\x02\x64\x6a\xad\x0e\x9f\xf8\xfb\xf4\x0d\x2f\x02\xc2\
-\x61\x42\x2a\x69\x75\xe8\xbe\xcb\x75\x86\x30\x8a\x69\x73\xc1\x7e\
-\x7e\x53\x68\xec\x8a\x05\x76\x76\xa1\x1a\x2f\xd8\x37\xd0\xf4\x0b\
-\xa4\xa9\xd2\xcb\xfe\x76\xc0\xfd\xd5\xb7\x00\x2d\x41\x3e\x5a\x8a\
-\x96\xb7\xf5\xe8\x09\x8f\xa4\xa6\xce\x52\x08\xc7\x50\xa8\x64\x6d\
-\xd7\x9e\x3c\xf0\xe6\x20\x2a\x90\x64\x01\x50\xfe\xfe\x22\xa3\xa6\
-\x17\x6c\xae\xa7\xa0\xdf\x40\x9e\xc1\xe3\xf9\x68\x47\x01\x6c\xe3\
-\x28\x40\x56\xb6\xa0\xff\xf8\x87\xfd\x9b\xe6\x70\x24\x80\x4a\xd5\
-\x2e\xdb\x8d\xe5\xff\x41\x54\xa2\xd9\x73\x9d\x81\x0a\x4b\x21\x7f\
-\x2c\x64\xfb\x05\x2d\x00\x7c\x1f\xb7\xe4\xab\xdb\xde\x9b\x02\x9a\
-\xb8\xe6\x25\x2b\xdb\x6c\xdf\xd3\x7e\x9f\xfe\x4a\x5e\x6f\x91\x22\
-\x2a\x96\x7a\x74\xe6\x25\x40\x07\x51\x21\x49\x16\x00\xe5\xad\xde\
-\x4b\xd4\x3d\x57\xc8\x17\x14\xb4\x00\xf8\xd9\x39\xb2\xad\xc2\xc3\
-\xe6\x7c\xb5\xb7\xa5\x99\xd7\x05\x67\xeb\x6d\x1d\x34\xe1\x09\xff\
-\xea\x17\x5c\xe7\x20\xca\x54\x03\xda\xf3\xce\xfb\x83\x48\x20\xc9\
-\xc2\xa8\xbc\x3d\x21\xc3\x1e\x2b\xe8\x51\xef\x05\x9f\x43\x4a\x78\
-\xc8\xdb\x10\x46\xd2\x07\xea\xb9\xf0\x35\x6b\xaf\xdb\x13\x4e\xff\
-\xa7\x7f\x29\x77\x07\x50\x49\x49\x69\x55\x47\xd7\x19\xc2\x28\x26\
-\xcd\x09\xd7\x19\xa8\x70\x54\xb4\xa0\xc3\xff\x40\x11\x0a\x00\x6d\
-\xc1\x77\xf3\x39\x7b\xbf\xbd\x59\x10\x70\x49\x5b\xd6\x96\xda\xf1\
-\xe3\x5f\x0e\xc6\xe7\x7c\x54\x33\x51\x71\x88\x06\x88\x75\x77\x9d\
-\x22\x8c\x2a\xa4\x25\xee\x3a\x03\x15\xcc\x1e\x6f\x57\xba\xa0\xc3\
-\xff\x40\x11\x0a\x80\x1f\x7f\x48\xb6\x57\x78\xba\x21\x5f\xed\xf9\
-\xba\xef\x9e\x00\xca\x9a\x79\x36\xb8\xf4\xf8\x0d\x7a\x4c\xce\x07\
-\x35\x11\x15\x5a\x83\xb6\xdb\x01\x80\xf7\x00\x1c\x44\x85\x26\xf9\
-\xe7\x52\xae\x04\x4f\x14\xe2\xf2\x9f\x03\x15\x65\x1b\x49\xcc\xc8\
-\xef\xf2\xd9\x5e\x5d\x12\x48\x71\x5d\x70\x2e\xaa\x1e\x4b\x7f\xb1\
-\x53\x83\xb6\xdf\xee\x3a\x08\xd1\xe1\xec\x42\x17\xde\x74\x79\x08\
-\x1e\x58\x00\x94\x2b\x55\xf9\x53\x31\xde\x53\x94\x02\xa0\xd9\xc7\
-\xad\xf9\x38\x14\xe8\x5d\x0a\x60\x73\x13\x47\x01\x72\xa1\x30\xdd\
-\x7f\xe3\xff\xbf\xb7\x15\x86\xa5\x14\x85\xd6\x4e\xed\x9d\xd3\xd5\
-\xe2\xe5\x2c\x81\x96\x4a\xd7\x19\xa8\x20\xea\xbc\xda\xc4\xd3\xc5\
-\x78\x51\x51\x0a\x80\x5f\x9c\x2b\x75\x55\x46\xd7\xe4\xb3\xcd\xc6\
-\x34\xb0\xbb\xa0\xeb\x23\xcb\x5f\xb3\xd6\x9c\xf8\x37\x7f\x32\xb7\
-\x07\x52\x68\xed\xb0\x3d\xf8\xb7\xfc\x10\xe2\x92\xaa\x72\x9d\x81\
-\x0a\x40\xf1\x5b\x19\xf4\xe3\xa2\xdc\x85\x5b\xb4\x93\xa4\x62\x46\
-\x7e\x9a\xef\x36\xb7\x36\x71\x41\x60\xae\xd6\xd8\x13\x27\xac\xb2\
-\x27\x2f\x72\x9d\x83\xe8\x60\xea\xd1\x95\x3b\x7f\x0f\xce\xc6\xe0\
-\x73\x0a\xa0\x0c\x19\xc8\x83\xc5\x7b\x57\x91\x74\xf4\x70\x6f\x3e\
-\xae\x08\xde\x9f\x6f\x81\xed\x5c\x10\x98\x2b\xf3\x94\xff\x99\xde\
-\xcd\x52\x5b\xe7\x3a\x08\xd1\xfe\x36\xe3\xa8\xd7\x36\xd8\xc1\x47\
-\xbb\xce\x11\x4a\xaa\x49\xf0\x54\x94\x72\xb4\x52\x46\xdc\xbf\xb0\
-\x58\x2f\x2b\x5a\x01\x30\xed\x0c\xf1\x2b\x0c\xe6\xe6\xbb\xdd\xba\
-\x16\xa0\x39\xaf\x65\x45\xf4\x58\x98\x6e\x0f\xb7\x4c\xcd\xeb\x14\
-\x0d\x51\x2e\xe6\x07\x1f\x9a\xfd\xdb\xd4\x8d\xbd\x2d\x4c\x2f\xd7\
-\x59\xc2\x48\x00\xde\x8f\x50\x9e\x8a\xf6\xe9\x1f\x28\x62\x01\x00\
-\x00\x15\x71\x7c\x2b\xef\x8d\x2a\xb0\xa5\x91\x27\x04\xe6\x6a\x0f\
-\xba\x8c\x59\x68\x3f\x38\xc7\x75\x0e\x8a\xb6\xb4\x54\x24\x1f\x4a\
-\x7f\xe3\xa5\x99\xc1\x47\x4e\x05\xc0\x13\x00\x0f\x41\x45\xda\x3e\
-\xea\x7f\x79\xc6\x76\xed\xb5\xd6\x75\x16\xca\x9b\xc0\x88\x79\xa4\
-\x98\x2f\x2c\xfa\xf8\xf9\xe4\x7f\x68\x7d\x2a\x40\xbb\x7c\xb7\xdb\
-\xad\x5a\xd1\x89\x6b\x62\x73\xa4\xbb\xae\x8a\x4f\x0d\x6a\x64\x4f\
-\x67\xd7\x49\x28\x7a\xb6\xd9\xde\x6f\xfe\xce\x9f\x6a\x7d\xb5\x43\
-\x67\xc2\x00\x00\x20\x00\x49\x44\x41\x54\xc4\x39\xec\xdf\x7a\x5a\
-\x2d\x7b\x17\x8e\xf3\xfe\x96\x3e\xde\xcc\x1a\x2d\xb0\x3c\x1e\xb8\
-\x44\x89\xca\x33\x66\xc4\xfd\xe7\x16\xf3\x9d\x45\xbf\x4e\x32\x61\
-\xf0\x87\x42\xb4\xbb\xad\x59\x78\x36\x40\xce\xa4\xc3\x63\xfe\x75\
-\xab\x5d\xa7\xa0\xe8\x59\x64\x3f\xb0\xe0\xe1\xe0\x1b\xdd\xd8\xf9\
-\x67\x4c\x9a\xb4\xcd\xc9\xcf\xf9\x97\x8c\xbb\x2b\x75\xef\xce\xc7\
-\xd3\xd7\xce\xd8\xad\x9d\xf2\x76\xff\x0a\x15\x8f\x2d\xf2\xf0\x3f\
-\xe0\x60\x04\xe0\xda\xc7\xb5\x53\x53\x35\xb6\xab\xe6\xff\xdd\xd5\
-\x71\xa0\x5f\x9b\x02\x34\x1c\x31\x17\xc4\xee\x5f\x32\xd8\x2c\x39\
-\xc9\x75\x0e\x2a\x7f\x01\x62\x2d\x8f\xa5\xbf\x30\xef\x6d\x3d\x66\
-\x82\xeb\x2c\x65\x24\xd5\x1e\x5b\x97\x8c\x8f\xff\xb9\x76\xb0\x2c\
-\x1d\xe6\x3a\x0c\xb5\x4a\x9d\x69\xae\xe9\x2d\xe3\x7e\x58\xd4\xb5\
-\x1d\x4e\xfa\xca\x6b\x9f\xd3\xa5\x8d\x69\x9c\x50\x88\xb6\x7b\x54\
-\x2b\x3a\x70\x2a\x20\x27\x1e\xfc\x75\x9f\xaf\xf8\x72\xf7\x98\xa6\
-\xf9\x27\x49\x05\x53\xaf\x5d\xde\x7e\x38\xfd\xf5\xdd\x2d\xa8\x1a\
-\xea\x3a\x4b\xb9\xf2\xe0\xbf\x39\xdc\xcc\xda\x38\xc1\xfb\xf3\xc8\
-\xb8\xb4\xd4\xb8\xce\x43\x87\x20\xb8\xd3\x3b\x71\xfa\x0d\xc5\x7e\
-\x6d\xd1\xa7\x00\x00\xc0\x28\xbe\x53\xa8\xb6\xb7\x72\x2a\x20\x67\
-\x01\x62\xfd\x9f\x49\x5f\x91\xf7\x1d\x1b\x44\xef\x5a\x1e\x9c\x36\
-\xff\x97\xfe\x77\x6a\xd8\xf9\x17\x56\x80\xd8\x51\x4b\xed\xe9\x13\
-\xee\x49\xdf\x6d\x1f\x49\x4f\x9d\xb9\x55\xfb\x72\xb7\x4f\xf8\xa8\
-\x81\x4e\x77\xf1\x62\x67\xa3\xe5\x93\x9f\xd1\x3d\x29\x8b\x36\x85\
-\x68\xbb\x26\x0e\xf4\xe5\x54\x40\xae\x5a\x2e\x8f\x7f\x77\x53\x17\
-\x79\x7b\x80\xeb\x20\x54\x3e\x2c\x8c\xff\x97\xf4\xd5\xb3\xd7\xea\
-\xf0\x09\x70\xf8\xf3\x27\xca\x2a\xb5\x69\xf9\xa9\xf1\xbf\x35\x1c\
-\x6f\x66\x9c\x6c\xb8\x68\xd0\x39\x11\x3c\x6d\x4e\x9c\x7e\x9e\x8b\
-\x77\x3b\x19\x01\x00\x80\x84\x87\xbc\x5e\x10\xb4\xbf\xc6\x34\x50\
-\x5f\x94\x83\x14\xcb\x5a\xc5\x1f\xfd\x2f\xed\x04\x4f\x1b\xa1\x3c\
-\xd9\xad\x9d\x37\xff\x34\x75\xc7\x6b\x6b\x75\xf8\x44\xb0\xf3\x77\
-\x26\x29\xd5\xc3\xff\xe9\x5f\x3c\xf6\x47\x2d\x3f\xd9\xfa\x64\x30\
-\xf9\x99\x06\xdb\x9e\x8b\x06\x1d\xb2\x56\xef\x73\xf5\x6e\x67\x7f\
-\x09\xa7\x3e\xab\xed\xb6\x07\xa8\xb3\x5a\x98\x22\xc4\x08\x70\x54\
-\x5b\x45\xc2\x2b\x44\xeb\xd1\x31\x31\xf6\xa7\x39\xa3\xcc\xb3\xe3\
-\x5c\xe7\xa0\xd2\xf6\xaa\x1d\xb3\xec\xa9\xf4\x15\x7d\x55\xa4\x83\
-\xeb\x2c\xf4\x3e\xa9\x0e\xb2\x6d\xd1\x69\xde\x13\x15\x83\xcd\xa2\
-\x11\xae\xc3\x44\xcc\x5b\x66\xcd\xae\xa3\xe4\xa2\xc7\x9c\x4c\x5c\
-\x3b\xad\xc2\xaf\xf9\x87\xce\x6e\x0a\x50\xb0\xce\xa5\xca\x03\xfa\
-\xb7\xe3\x54\x40\x2e\x04\xba\xed\x9a\xc4\x0d\x15\x95\x68\xcc\xfb\
-\xd9\x0d\x54\xfe\x38\xe4\x5f\x5a\x62\x9a\x5a\x35\x22\xf6\xfc\xa6\
-\x53\xcc\xdf\xc7\x70\xd1\x60\x51\x7c\xc3\x3b\x69\xfa\x0f\x5c\xbd\
-\xdc\xe9\x5f\xc8\xeb\xfe\xa5\x23\xf7\xa4\xb0\xb0\x90\x83\xcc\x5d\
-\xaa\x80\x2e\x55\x1c\xc5\xce\x45\x3f\xb3\x6a\xc6\x27\x62\x77\x4f\
-\x74\x9d\x83\x4a\x4b\xa3\xb6\xdd\xf1\x1b\xff\x9b\x6f\x35\x69\x5b\
-\x7e\xaa\x2c\x39\xba\xb7\xbb\xac\x5b\xfa\x81\xd8\xef\xba\x77\x93\
-\xb7\x06\xb9\x4e\x53\xa6\x52\x26\x66\xfb\xca\xf0\x07\xb6\xba\x0a\
-\xe0\xbc\x22\xbf\xea\x1f\x76\x5d\x32\x90\x7e\x05\x7b\x81\x00\xfd\
-\x6a\x15\x35\xf1\x82\xbd\x21\x0a\xfc\x4b\x63\x37\xaf\xeb\x6e\xd6\
-\xf3\x90\x16\x6a\x95\x37\x82\x13\x96\xfe\x25\xb8\xaa\x07\x20\xdd\
-\x5c\x67\xa1\xdc\x54\xa2\x61\xc5\xa9\xb1\xff\x6b\x3a\xde\xcc\x18\
-\x61\x60\x39\xa9\x9a\x3f\xbf\xf5\x4e\x9a\x7e\xa9\xcb\x00\xce\x16\
-\x01\xbe\xab\x42\x24\xff\xf7\x03\xec\x4f\x81\xcd\x8d\x82\x80\x83\
-\x00\xb9\x88\xfd\x39\xb8\x76\x8f\xeb\x10\x54\x0a\x44\x9f\xf6\x3f\
-\x3d\xe3\x2f\xc1\xd5\xc3\xd9\xf9\x97\x87\x24\x6a\x87\xfd\xd3\xbf\
-\xf8\xe4\x1f\xa6\xee\xdd\xc1\x93\x06\xf3\xc7\x18\xdc\xe9\x3a\x83\
-\xf3\x11\x00\x00\x98\xf4\x8c\xee\x49\x17\x68\x4b\xe0\xbb\xda\x55\
-\x00\xbd\x6a\x58\x05\xe4\xe2\xdc\xd8\x6f\x16\x0c\x33\x73\x4e\x76\
-\x9d\x83\xc2\xa9\x09\x6d\xea\x7e\x93\xfa\xe6\x9b\x8d\x68\x37\xca\
-\x75\x16\x2a\x28\x2e\x1a\xcc\x91\x00\xcf\x99\x93\xa6\x9f\xed\x3a\
-\x87\xf3\x11\x00\x00\xa8\x8a\xe1\x81\x42\xbf\x63\x77\xcb\xbe\xff\
-\x50\xf6\x9e\xf5\x2f\xe9\x16\x20\xc6\x3f\x45\x7a\x9f\x0d\x7a\xcc\
-\xca\xfb\x53\xb7\x36\xb3\xf3\x8f\x84\xc4\x2e\xed\x3a\xf6\x6f\xfe\
-\xa4\x11\x77\xa7\x7f\xf2\xc6\x3f\xfd\x4f\xbe\x98\xd6\x8a\x46\xd7\
-\xa1\x4a\x49\x20\xb8\xdd\x75\x06\x20\x24\x05\x40\x47\x83\xaf\x7b\
-\x02\xbf\xd0\xef\xd9\xdc\x24\x68\xe1\x29\x81\x59\x0b\x10\xeb\xfb\
-\x4f\xff\x92\x97\x5c\xe7\xa0\x30\x11\xfd\x87\xff\x3f\xb3\x1f\x4d\
-\x7f\x79\xb0\x85\xe9\xe5\x3a\x0d\x15\x57\xa0\xb1\x81\x4b\xed\xe9\
-\x13\x1e\x0d\xbe\xb4\xc4\x75\x96\x12\xf2\x72\xec\x84\xe9\xcf\xba\
-\x0e\x01\x84\xa4\x00\x98\x76\x86\x24\xab\x62\xf8\x73\xa1\xdf\x63\
-\x15\xd8\xd8\x20\x50\xce\x04\x64\xed\x15\x3b\x76\x54\xa3\x74\x70\
-\xb6\x6a\x95\xc2\xa3\x05\x55\x7b\x7f\x91\xfe\xce\xbc\xe5\xf6\xb4\
-\x53\x01\xf0\x44\xb9\x08\x6b\x8f\x9d\xfc\x68\xd5\x4a\x2a\x72\xbb\
-\x48\x38\x0e\x58\x0b\x45\x01\x00\x00\x41\x12\x53\x3c\x81\x2d\xf4\
-\x7b\x5a\x82\x7d\x23\x01\x94\x1d\x85\xd4\x3e\x9e\xbe\x9a\xe7\x89\
-\x47\xdc\x46\x3b\x68\xd5\x7d\xa9\xdb\xeb\xeb\xb5\xcb\x29\xae\xb3\
-\x90\x7b\x1d\x65\x13\x0b\xc0\xd6\xd9\xe8\xc5\xeb\x1e\x75\x1d\xe2\
-\x5d\xa1\x29\x00\xee\x3b\x5f\x76\x55\xc4\xf0\x4c\x31\xde\x55\xdf\
-\xc2\xa3\x82\x73\xb1\xcd\xf6\x1d\xb7\x41\x8f\x59\xe1\x3a\x07\xb9\
-\x31\x33\xfd\xb1\x99\x7f\xf0\xaf\x3f\x2a\x40\xac\x8f\xeb\x2c\x14\
-\x0e\x5d\xb0\x89\x87\x06\xb5\x86\xc8\x0f\x65\xd8\x63\x29\xd7\x31\
-\xde\x15\x9a\x02\x00\x00\x6a\x2b\x71\x65\xb1\x86\x46\xb6\x70\x3d\
-\x40\x2e\xcc\x13\xfe\x55\x0a\x48\x28\x86\xb1\xa8\x38\x52\x5a\xd9\
-\xf0\xab\xd4\xb7\x5f\x9a\xaf\xe7\x8c\x07\x90\x70\x9d\x87\xc2\xa3\
-\xa3\x6c\xee\xe4\x3a\x43\x09\xa8\x37\xc9\x44\xc1\x17\xbc\x67\x22\
-\x54\x05\xc0\x6d\xa7\xc9\xa6\xaa\x18\x66\x15\xe3\x5d\x56\x81\xb7\
-\xf6\xf2\x7c\x80\x6c\xb5\x68\xd5\x71\xf3\x82\x73\xe6\xb8\xce\x41\
-\xc5\xb1\xcd\xf6\x7d\xf3\xa7\xfe\xed\x5b\xeb\xd0\x6d\xac\xeb\x2c\
-\x14\x3a\xb6\x9d\xa9\xe3\x99\x0f\x47\x76\xb7\x9c\xf2\xe3\x50\x9d\
-\xa7\x12\xaa\x02\x00\x00\x02\x8b\xcf\xfd\xff\xf6\xee\x3c\x4e\x8a\
-\xea\xdc\x1b\xf8\xef\xa9\xaa\xee\x9e\xee\x59\xd9\xdd\x09\x22\x6e\
-\x28\x9b\xe0\xbe\x30\x03\x2e\xaf\x31\x1a\x73\x73\xaf\xde\xc4\x6b\
-\xa2\x46\x54\x70\x27\x6a\x34\xf1\x0d\x89\xd9\x50\x64\x58\x14\x05\
-\x63\xa2\xd1\x6c\x26\x51\xa3\xf1\xbe\x26\x8a\xbb\x71\x01\x17\x14\
-\x14\x05\x41\xf6\x65\x98\x99\x9e\xa5\xa7\x97\xaa\x3a\xcf\xfb\x47\
-\x0f\x8a\xc8\x32\x33\x74\xf7\xa9\xe5\xf9\x7e\x3e\x7c\x10\x1c\xba\
-\x7e\x03\xdd\x55\x4f\x9d\x3a\xe7\x39\x28\xd1\x28\x80\xad\x80\xb5\
-\x6d\x1e\x99\x8d\xe1\x43\xaf\xba\xe7\x0c\xc9\x21\xde\xa6\x3b\x87\
-\x28\xae\x37\xdd\x33\x5f\x7d\xc8\xb9\x65\x2f\x97\x23\x83\x75\x67\
-\x11\xde\x63\x40\x35\x98\xb0\x65\x44\x68\xd7\x5a\x0c\xd3\x9c\xa5\
-\x3b\xc4\xf6\x3c\x57\x00\xcc\x3d\x8d\x96\x95\x9b\x78\xab\x54\xc7\
-\x4b\x39\xc0\x96\xb4\x4c\x0a\xec\x09\x06\xf5\xff\x7f\xce\x45\x25\
-\xfb\xb7\x12\xa5\xe5\x50\x34\xf3\x70\xee\x07\xaf\xbc\xec\x9e\x7d\
-\x02\x80\x84\xee\x3c\xc2\x9b\xa2\xc8\x6c\xd1\x9d\xc1\xf3\x18\x77\
-\xd2\xb0\x7b\x9a\x75\xc7\xd8\x9e\xe7\x0a\x00\x00\x30\x2d\x5c\x54\
-\xca\x4b\xf2\x96\x34\xd0\xea\x99\x69\x19\xfe\xb2\x5c\x0d\x3b\xb6\
-\x91\x07\x7c\xaa\x3b\x87\x28\xac\x06\xde\x6f\xe5\x5d\xb9\x3b\xd7\
-\x6d\xc2\x57\x4e\xd4\x9d\x45\x78\x5b\x9c\xda\x65\x14\x70\xd7\x92\
-\x06\xe5\x66\xeb\x0e\xb1\x23\x9e\x2c\x00\x66\xd5\xd2\xe2\x72\x0b\
-\xaf\x97\xea\x78\x0c\x60\x7d\x4a\x26\x05\xf6\x50\xd9\x63\xf6\xd5\
-\xd2\x17\x20\x40\xde\x52\xe3\x17\x3c\xe4\xfc\xb0\xbf\x0c\xf9\x8b\
-\xae\xa8\xa6\x06\x59\x53\xb5\x6b\xd3\x68\xe4\x03\x49\xdd\x21\x76\
-\xc4\x93\x05\x00\x00\xb8\x84\x6f\x97\xb2\x59\x82\x62\x60\x4d\x1b\
-\xc1\x91\x09\x01\xdd\xd6\x82\x3e\xc7\x2c\x55\x63\xe4\x51\x80\xcf\
-\xb9\xb0\xb2\x7f\xb2\xaf\x7b\xe9\x05\xe7\x9b\x63\x98\x49\x96\x75\
-\x89\x2e\xe9\x6d\x6c\x96\x67\xa8\x3b\xd7\x68\x64\x63\x9e\xbc\xfb\
-\x07\x3c\x5c\x00\xdc\x33\x9e\x56\x94\x5b\x78\xbe\x94\xc7\xcc\xa9\
-\x7c\x11\x20\x9d\x02\xbb\xef\x69\xe7\xc2\x1a\x05\xd3\xd6\x9d\x43\
-\xf4\x4c\x92\xfb\xad\xbb\x27\x77\xc7\x27\xeb\xf8\x90\x93\x75\x67\
-\x11\xfe\xd2\x87\xd7\x95\xe9\xce\xe0\x59\x8c\x69\x5e\x9b\xf9\xbf\
-\x2d\xcf\x16\x00\x00\x90\x8b\xe2\x82\x52\x74\x07\xdc\x56\xda\x91\
-\x4e\x81\x3d\xe1\x22\x32\xf8\x05\xf5\x4d\x59\x16\xe8\x43\xef\xbb\
-\x27\xbe\x79\xbf\xfd\xd3\x8a\x2c\xe2\x87\xeb\xce\x22\xfc\xa7\x37\
-\x36\x54\xeb\xce\xe0\x51\x0d\x46\xcc\xba\x4b\x77\x88\x5d\xf1\x74\
-\x01\x30\xef\x64\xda\x50\x66\xe2\x7f\x4b\x7d\xdc\x64\x16\x68\xcc\
-\x94\xfa\xa8\xfe\xf7\xae\x3b\x76\x78\x07\x2a\x9b\x74\xe7\x10\x5d\
-\xa3\x60\x38\x8f\xda\x93\x5e\xfc\x97\x7b\xc1\x18\x80\xe4\x24\x2e\
-\x7a\xa4\x8f\xd9\xd0\x5f\x77\x06\x4f\x62\xba\x8d\x86\xce\x69\xd7\
-\x1d\x63\x57\x3c\x5d\x00\x00\x40\xd4\xc5\x77\x4c\x42\xc9\xa7\xe7\
-\x6d\x4a\x13\x5a\x65\x40\xbb\x5b\x98\xa9\xe6\x71\xfb\xf2\xc5\xba\
-\x73\x88\xdd\x6b\xe1\xbe\x1b\xe6\xd8\xd3\x96\xae\xe4\x23\x4f\x01\
-\x20\x43\x5e\xa2\xa7\x3a\xe2\x68\xed\xa5\x3b\x84\x07\xad\x30\x62\
-\x4d\x73\x75\x87\xd8\x1d\xcf\x17\x00\xf5\x67\x50\x53\x79\x14\xbf\
-\x2b\xf9\x81\x19\x58\xd7\x4e\x48\x17\x7d\x93\xe2\x60\xd9\xc0\x83\
-\x4f\x58\xcf\x83\x3e\xd6\x9d\x43\xec\xdc\x87\xea\x98\x45\xf7\xdb\
-\xb7\xc5\xb3\x9c\x38\x42\x77\x16\xe1\x6f\x16\xec\x8d\xba\x33\x78\
-\x11\x33\xdf\xe8\xa5\x9e\xff\x3b\xe3\xf9\x02\x00\x00\x86\x56\xe1\
-\xb2\x98\x89\x74\xa9\x8f\xcb\x9d\xed\x82\x65\x79\x60\xb7\x98\x8f\
-\x39\x57\xa6\x00\x69\xb0\xe8\x35\x0a\x86\xfb\xb8\x73\xc5\xab\xff\
-\xeb\x5c\x34\x8c\x41\x35\xba\xf3\x08\xff\x8b\x52\x87\x27\x97\xb7\
-\xe9\xc4\xc0\x1b\xe6\xc8\xfb\x1e\xd5\x9d\xa3\x2b\x7c\x51\x00\x5c\
-\x36\x9a\x6c\xcb\xc4\x4f\x74\x1c\xdb\x65\x60\x55\x1b\xc1\x2e\xe9\
-\x54\x44\x7f\xcb\x70\xf9\xc8\xb7\x55\x6d\xc9\xfa\x38\x88\xdd\x4b\
-\x71\xd5\x96\xb9\xf6\xaf\x16\x7d\xa2\x86\x9f\x00\x19\xf2\x17\x05\
-\x52\x85\xe6\x94\xee\x0c\x5e\x63\x12\xbe\x5f\xca\x25\xec\x7b\xc2\
-\x17\x05\x00\x00\xdc\x3d\x8e\xa6\xc6\x2c\x68\x69\x38\xe3\xa8\xce\
-\x8d\x83\xa4\x08\xe8\xb2\x17\xdc\xff\x1c\x68\x23\xda\xa1\x3b\x87\
-\x00\x3e\x71\x87\xbf\x7b\xaf\x3d\xd5\xed\xe0\xaa\x51\xba\xb3\x88\
-\x60\xa9\xa1\x2d\x72\x56\xdc\x06\x11\xfe\x46\x23\xe6\x95\x64\x43\
-\xbb\x42\xf0\x4d\x01\x00\x00\x16\xe1\x7b\xba\x6e\x5d\xb2\x2e\xb0\
-\xb6\x5d\x7a\x04\x74\x15\xb3\xb1\xcf\xbf\xdc\xef\xbc\xa9\x3b\x47\
-\xb8\x11\x3f\xed\x7c\xe7\xc5\xc7\xdd\x2b\x8e\x04\x48\x76\x6b\x13\
-\x05\xd7\x9b\xd6\x5b\xba\x33\x78\x88\x4d\x4c\x37\xeb\x0e\xd1\x1d\
-\xbe\x2a\x00\xee\x1e\x4f\xff\x28\x33\xa1\x6d\x96\x79\xca\x01\xd6\
-\x75\x90\x3c\xdd\xee\xa2\xa5\xee\x51\x47\xb7\x70\xef\xf5\xba\x73\
-\x84\x51\x8a\xab\x1b\xef\xb5\xa7\xbe\xb3\x44\x1d\x77\x0a\x00\x53\
-\x77\x1e\x11\x4c\xfd\xb0\x5e\x3a\x46\x6e\xc5\x98\x4b\x23\xe7\x2e\
-\xd3\x1d\xa3\x3b\x7c\x55\x00\x00\x40\x4e\xe1\x5c\x9d\x97\xe0\xd6\
-\x2c\xb0\xbe\xc3\x27\x0f\x78\xf4\x8b\x02\x24\xcf\x9b\x4b\x6c\x85\
-\x3a\x62\xe9\x5c\xe7\x97\x76\x4a\x86\xfc\x45\x91\xf5\x36\x36\xf6\
-\xd5\x9d\xc1\x23\x1a\x0d\x3b\x32\x45\x77\x88\xee\xf2\x5d\x01\x70\
-\xff\x19\xb4\xbc\x3c\x82\xbf\xea\xcc\x90\xcc\x02\x9b\xa4\x5b\xe0\
-\x6e\x55\x63\xd3\x82\x6a\x6a\xdc\x5b\x77\x8e\xf0\x20\x9e\xef\x9c\
-\xff\xd2\x63\xce\x95\x83\x99\x8d\xbd\x74\xa7\x11\x81\xc7\xd5\xd4\
-\x28\x4d\x80\x00\x30\xf1\x8d\x74\xcc\xdd\x8d\xba\x73\x74\x97\x2f\
-\x9f\xdf\xb4\x9b\xb8\x30\xe2\xe2\x6b\xb6\x82\xb6\x1e\xd4\x4d\x19\
-\xc0\x24\x42\xbf\xb8\x8c\x05\xec\x4c\xad\xf9\x17\x19\x1e\x2c\x91\
-\x34\xca\xdb\x7e\x9f\xbb\xe5\xe3\x16\xf4\x91\x5e\xfe\xa2\x24\x88\
-\x55\x83\x09\x3b\xf4\x05\x00\x03\x0b\xcc\xe1\xfb\x3e\xa0\x3b\x47\
-\x4f\xf8\x6e\x04\x00\x00\x1e\xa8\xa5\x4c\x45\x04\x93\x75\xe7\x68\
-\x48\x03\x5b\x4a\xde\x9d\xc0\x1f\x2c\xca\x2d\x1d\x6c\x2e\x1e\xa6\
-\x3b\x47\x18\xac\x55\x43\x96\xce\xcd\x4d\x4d\xb6\xa0\xcf\x51\xba\
-\xb3\x88\xf0\x88\x51\xa6\x41\x77\x06\x0f\x50\x26\x78\x12\xd1\x14\
-\x5f\xae\x86\xf0\x65\x01\x00\x00\xf5\x75\x34\x27\x6e\xf1\x0a\xdd\
-\x39\x36\xa7\x09\x4d\xb2\x1b\xf6\x97\x1c\x6d\x3e\xbb\x59\x77\x86\
-\x30\x78\xd9\x3e\xf7\xe5\x3f\x3b\x93\x0f\x74\x61\xed\xaf\x3b\x8b\
-\x08\x97\x38\xb5\x7b\x76\x97\xbb\x92\x61\xcc\xa1\x91\xf7\x2d\xd0\
-\x1d\xa3\xa7\x7c\xf9\x08\x60\xab\x32\x93\xce\xce\xb8\x78\x9f\x59\
-\x6f\x63\x93\x4d\x29\x02\x81\xd1\x2b\xa6\x33\x85\x97\x70\xf3\x18\
-\xe3\xe9\xd1\xba\x53\x04\x59\x8e\xcb\x52\x0f\x3b\xb7\xbc\xdf\xcc\
-\xfd\x4f\xd2\x9d\x45\x84\x53\x15\x1a\xc2\xbe\x5b\x8a\x2f\x27\xfe\
-\x6d\xcb\xb7\x23\x00\x00\x50\x5f\x47\x4b\xca\x4d\xfc\x49\x77\x0e\
-\x06\xb0\x31\x45\x68\x92\x1d\x04\x01\x00\x83\x68\xc9\x22\x0b\xb9\
-\x84\xee\x1c\x41\xf6\x29\x1f\xf1\x51\x33\xf7\x3f\x56\x77\x0e\x11\
-\x5e\x7d\xcc\x70\x0f\xf2\x31\xd1\x0d\x7e\x9c\xf8\xb7\x2d\x5f\x17\
-\x00\x00\xd0\xd7\xc2\x85\x31\x13\x2d\xba\x73\x30\xf2\x2b\x03\xe4\
-\x71\x00\xdc\x3a\xeb\x91\xc1\xba\x43\x04\x9d\x83\xa8\xec\x50\x21\
-\xb4\xea\xc3\xeb\xb4\x4d\xc2\xd6\x8d\x81\x57\xcc\xe1\x73\x1f\xd0\
-\x9d\x63\x4f\xf9\xbe\x00\x98\x52\x4b\x4e\x04\xb8\xd0\x0b\x8b\xf2\
-\x18\xf9\xc7\x01\x8d\x21\x1e\x09\xa8\x42\xe3\xc2\x1a\xda\x2c\xcf\
-\xa3\x8b\x2c\xa7\xa2\xbe\x9c\x74\x24\x82\xa3\x37\x36\x54\xeb\xce\
-\xa0\x49\xd6\x64\xba\xcc\x2f\xfd\xfe\x77\xc5\xf7\x05\x00\x00\xdc\
-\x75\x1a\x3d\x91\x88\xe0\xdf\xba\x73\x00\x9f\x8f\x04\x84\xb5\x08\
-\x18\x6b\xfd\x2d\xa2\x3b\x43\x18\xb8\x86\x8c\x00\x08\xbd\xfa\x98\
-\x0d\xe1\x5c\x02\xc8\x98\x42\xa3\xe6\x7e\xa0\x3b\x46\x21\x04\xa2\
-\x00\x00\x80\x88\x89\xaf\x5a\x06\x3c\xb3\xff\xf2\xa6\x0e\xc2\xa6\
-\xb4\x17\xc6\x25\x4a\xc7\x84\xfd\xc9\x10\xe3\x9d\x91\xba\x73\x84\
-\x41\x56\x46\x00\x84\x5e\x1d\x71\xb4\xf6\xd2\x1d\x42\x83\x45\x86\
-\xc2\x9d\xba\x43\x14\x4a\x60\x0a\x80\x19\xb5\x94\x2c\x8f\xe0\x3a\
-\xdd\x39\xb6\xd5\x98\x06\x36\x86\x68\xef\x80\x51\xd6\x8b\x6b\x01\
-\x0e\x57\xd5\xa3\x89\x43\xd1\x90\xbc\xab\x84\x17\x59\xb0\x37\xea\
-\xce\xa0\x81\x63\x28\x75\x09\x8d\x9e\x17\x98\xd5\x0f\x81\x29\x00\
-\x00\x60\x66\x1d\xcd\x49\x58\x78\x4f\x77\x8e\x6d\x35\x65\xc2\xb1\
-\x77\x00\x81\x5b\x8f\x35\x9e\x94\xde\xf3\x25\x62\x73\x59\xd0\xdf\
-\x52\xc2\xc3\x22\x94\xd1\x3e\xf1\xba\xf4\xe8\x0e\x3a\xea\xd7\x6f\
-\xe9\x4e\x51\x48\x81\x2a\x00\x00\x80\x08\x75\x16\x79\xe7\x51\x00\
-\x90\xdf\x3b\x60\x6d\x5b\xb0\x8b\x80\xfd\x8d\x8f\xde\x8e\x22\x5b\
-\xa9\x3b\x47\x58\xd8\x90\x11\x00\xa1\x4f\x9a\x2b\x47\xfc\xde\xbe\
-\xe9\x65\x07\xd1\xb0\xf4\x42\xfd\xc8\x48\x66\x7f\xaa\x3b\x44\xa1\
-\x05\xae\x00\xb8\x7b\x3c\x35\x26\xa2\xb8\xca\x6b\xe3\xd0\x6d\x36\
-\xb0\xba\x95\xa0\x82\x79\xda\xe6\x5a\xf3\x91\x81\xba\x43\x84\x89\
-\xe3\xef\x1e\x5e\xc2\xff\x68\x23\x0f\x3a\xe9\xee\xdc\x9d\xeb\x36\
-\xf2\xa0\x8f\x75\x87\x29\x32\x65\x10\xbe\x47\xb5\x0f\x04\x6e\x6a\
-\x77\xe0\x0a\x00\x00\x98\x55\x47\xf3\x12\x16\x3c\xd7\x9e\x31\xe5\
-\x00\xab\xda\x08\x6e\xc0\x8a\x80\x0a\x6a\x5e\xd8\x97\xd6\x0f\xd2\
-\x9d\x23\x4c\x1c\xc8\x62\x0b\xa1\x9f\x83\xc8\x41\xbf\xb7\x6f\x3a\
-\xe0\x39\xe7\xbc\x57\xa1\xb7\x21\x6b\xf1\x10\xea\x69\xc4\xbc\x57\
-\x74\xc7\x28\x86\x40\x16\x00\x00\x10\xb1\x70\x5a\xc4\x80\xe7\xda\
-\xf2\xa4\x1d\x60\x65\x0b\x21\x1b\xa0\x45\x5c\xa7\x58\x8f\x07\xac\
-\xa4\xf1\x3e\x07\xd2\x77\x5a\x78\x46\xd9\x3b\xaa\xf6\x84\xb9\xf6\
-\x2f\x5e\xef\x40\x65\xd0\xda\x03\x2e\x36\x9a\x73\x3f\xd2\x1d\xa2\
-\x58\x02\x5b\x00\xcc\xa8\xa5\x64\x99\x81\x09\x5e\xac\x49\x73\x0a\
-\xf8\xb4\x95\x90\x0a\xc0\x5c\x52\x13\x6a\xf5\x21\xf4\xa6\xec\x42\
-\x57\x62\x36\x2c\x2f\xbe\xb5\x45\x88\xb5\x73\xaf\x63\xef\xc9\xdd\
-\xce\x4b\xdd\x31\x6f\xea\xce\x52\x10\x84\x8c\x61\xe2\x5b\x41\x1c\
-\xfa\xdf\x2a\xb0\x05\x00\x00\xcc\x3e\x95\x7e\x97\x88\xe0\x05\xdd\
-\x39\x76\xc4\x65\x60\x75\x1b\xa1\xcd\x53\xd3\x15\xbb\xef\x50\x73\
-\xc1\x27\x04\x36\x75\xe7\x08\x1b\x47\x45\x03\xfd\xd9\x15\x7e\x45\
-\x03\x9e\x72\x2f\x19\xf3\x27\xfb\xba\x97\x5c\x58\x9e\x1b\x81\xed\
-\xa6\x1b\x68\xd8\xbc\xf7\x75\x87\x28\xa6\xc0\x9f\x44\x8c\x1c\xce\
-\x88\x1a\xec\xc9\x25\x2b\x0c\x60\x8d\xbf\x5b\x07\xdb\x27\x9a\x8f\
-\x1f\xae\x3b\x44\x18\xb9\x30\x03\xff\xd9\x15\xbe\x45\xeb\xf8\x90\
-\x93\xef\xca\xd5\xaf\xd9\xa0\x06\x2e\xd3\x1d\xa6\x27\x08\xf8\x97\
-\x31\x7c\xde\xdd\xba\x73\x14\x5b\xe0\x4f\x22\xb3\xcf\xa4\xac\x15\
-\xa3\x53\x0d\xaf\xae\xc2\xe3\x7c\xd7\xc0\xf5\x29\x02\x7b\x33\xe1\
-\x4e\x55\x63\xf3\xc2\x0a\x34\x0f\xd0\x9d\x23\x8c\x14\x45\x02\xff\
-\xd9\x15\xfe\xe6\x20\x72\xd0\x1f\x9c\x9b\xf7\x9f\xef\x9c\xff\x12\
-\x40\x7e\x3a\xbb\x6d\x21\x17\xdf\x0d\x42\xaf\xff\xdd\x09\xc5\x49\
-\x64\xce\x58\x5a\x50\x61\x62\xaa\xee\x1c\xbb\x92\xcc\x02\xab\xda\
-\xfd\xb5\x42\xe0\x64\xeb\xef\x51\xdd\x19\xc2\xca\x66\x53\x1e\xbb\
-\x08\x3f\x28\x7b\x57\x8d\x3d\x79\x9e\xfd\xb3\x05\x1d\xa8\x6c\xd2\
-\x1d\xa6\x2b\x98\xf9\x12\x1a\x3d\x6f\x83\xee\x1c\xa5\x10\x8a\x02\
-\x00\x00\x66\x9d\x4a\x37\x97\x47\xe0\xe9\x0d\x1c\x3a\x6c\xe0\x93\
-\x16\x42\xc6\x07\x2b\x04\x4c\x38\xab\x0e\x36\xde\x96\xbe\xff\x9a\
-\xb0\x21\x23\x00\xc2\x3f\x1a\xec\x3e\x47\xdf\xb0\xe5\x8e\xca\xa7\
-\xd3\x67\xaf\xd0\x9d\x65\x37\xee\xb1\x46\xdd\xf7\x84\xee\x10\xa5\
-\x12\xaa\x93\x48\x65\x0c\x27\x46\x0c\x78\xfa\x89\xbb\xa3\xf2\xcb\
-\x04\x5b\x3d\x3e\x39\xf0\x30\xe3\x8d\x95\x00\x87\xea\xfd\xe3\x25\
-\x4a\x19\xd2\x09\x48\xf8\x42\x4b\x0e\x58\xd9\x46\xc8\x38\x14\xf9\
-\x4b\xcb\x57\x0f\xfc\x79\xf2\xa7\xab\x14\x1b\x5e\xdc\xcc\x6a\x91\
-\x91\x2e\x9f\xac\x3b\x44\x29\x85\xea\x04\xfe\xab\x93\xa8\x39\x6e\
-\xe1\x5b\x5e\x5f\x3f\xc5\x00\xd6\xa6\x08\x0d\x69\xcf\xee\x23\x94\
-\x3b\xd1\x7c\x62\xa8\xee\x10\x61\xe6\x92\x29\x05\x80\xf0\xbc\x4d\
-\x69\xc2\xba\xf6\x2f\xce\x6f\x5a\x91\x19\x30\x70\x72\xd3\xec\xd6\
-\x46\xb7\xbf\x97\x26\x67\x27\x0d\xd3\xfc\x06\x1d\x5f\x1f\x96\xd6\
-\xc6\x00\x42\x56\x00\x00\xc0\xac\x71\xf4\x58\x55\x04\xf7\xeb\xce\
-\xb1\x5b\x0c\x34\xa4\x09\x6b\x3d\xd8\x39\xb0\x86\x36\x2e\x2c\xa7\
-\x96\x7e\xba\x73\x84\x99\x82\xcc\x01\x10\xde\xe5\xaa\x7c\xd7\xd3\
-\xc6\x9d\x5c\x4e\x5b\x6d\xab\xe6\x87\x8d\xb7\x95\xbf\x9c\xad\x5b\
-\x59\xda\x64\x3b\xc4\x4c\x7c\x31\x0d\xbb\xc7\xeb\x8f\x27\x0a\x2e\
-\x74\x05\x00\x00\xcc\x1c\x4f\xdf\x2b\x8f\x60\x89\xee\x1c\x5d\xd1\
-\x66\x03\x2b\x5a\x08\x69\x47\x77\x92\xcf\x8d\x35\x1e\x8f\xeb\xce\
-\x10\x7a\x4c\x32\x01\x53\x78\x52\xda\x01\x56\x74\xa1\xd1\x99\xad\
-\x60\x3d\x98\x3c\x6f\xd0\x8c\xb6\x9b\x3f\x29\x4d\xb2\x9d\x60\xbe\
-\xdd\x1a\x71\xdf\x63\x5a\x33\x68\x12\xca\x02\x00\x00\xd2\x29\x1c\
-\x17\x33\xd1\xae\x3b\x47\x57\xd8\x9d\x9d\x03\x93\x1e\x68\xab\x61\
-\xc2\x59\x31\xd8\x5c\x34\x42\x77\x8e\xb0\x53\x64\xca\x66\x00\xc2\
-\x73\x92\xd9\xfc\x9d\xbf\xdd\xc5\x27\xfc\xcc\xc0\xfb\xa9\xaf\x0c\
-\x9e\xbc\x65\x66\x53\xb3\xaa\x29\xf9\xf0\x3b\x03\xaf\x19\x8a\x6e\
-\x2d\xf5\x71\xbd\x22\xb4\x05\xc0\x6f\xce\xa1\xb6\x68\x04\xa7\x1a\
-\x04\x2f\x4e\x46\xf9\x12\x06\xb0\x3e\x45\xd8\xa0\xb9\x5f\xc0\x50\
-\xe3\xf5\xd5\x00\x7b\x7d\x1a\x45\xf0\x31\x64\x04\x40\x78\x86\xe2\
-\xfc\x96\xe7\xeb\x53\x3d\xdb\xf1\x34\xe9\x94\xf5\xbe\x65\xcb\xaf\
-\xac\x45\xf6\x51\xa5\x5c\x7e\xb7\xd9\x24\xe3\x3f\x69\xf4\xbc\x00\
-\x34\x65\xef\x99\xd0\x16\x00\x00\x30\xbb\x96\x5e\x2f\x8f\xe2\x07\
-\x7e\xba\x9a\x35\x67\xf3\xc3\x6b\x9a\x36\x13\xca\x1e\x6f\xfe\xfd\
-\x08\x2d\x47\x16\x5f\xc0\x30\x64\x04\x40\x78\x42\xc6\xcd\x2f\x5f\
-\x6e\xdd\xc3\xcb\x68\x4e\x51\xe4\xae\xe6\x09\x7b\xfd\xb1\xfd\xe2\
-\x52\x74\x0f\x74\x95\xa1\xfe\x9b\x46\xdc\xbb\xae\x04\xc7\xf2\xac\
-\x50\x17\x00\x00\x30\xbb\x8e\xee\x48\x44\xf0\x4f\xdd\x39\xba\x23\
-\xeb\xe6\xe7\x05\xb4\x94\x78\xa9\x60\x6f\xda\xb0\xb0\x9c\xda\xfa\
-\x96\xf6\xa8\x62\xc7\x58\xb6\x03\x14\xda\x25\xb3\xf9\xc7\x93\x5d\
-\x1d\xf2\xdf\x1d\xa5\x40\xf3\xdb\x8f\x19\xf2\xb3\xe4\xcf\x57\x29\
-\x18\xc5\x1b\xeb\x24\xdc\x10\x19\xfe\xeb\xe7\x8a\xf6\xfa\x3e\x11\
-\xfa\x02\x00\x00\xfa\xbd\x82\x33\xe3\x16\x56\xeb\xce\xd1\x1d\x0c\
-\x60\x5d\x7b\x69\x57\x09\x9c\x62\x3d\x56\x5e\x9a\x23\x89\xdd\x61\
-\x90\x14\x00\x42\x1b\x77\x0f\x87\xfc\x77\x85\x01\xac\xcc\xf4\x1d\
-\x78\x43\xe3\xac\xe6\x76\x55\xd5\x56\xd8\x57\x07\x00\x3c\x68\x8e\
-\x98\x57\x5f\x84\xd7\xf5\x1d\x29\x00\x00\x4c\x99\x42\xaa\x5c\x61\
-\x4c\xd4\x44\x87\xee\x2c\xdd\xd5\xda\xb9\x4a\xa0\xa3\xc8\x4f\xb1\
-\x4c\x38\xcb\x0f\xa4\xf7\x86\x17\xf7\x28\xa2\x2b\x18\xa4\x00\x48\
-\x1f\x00\xa1\x45\xca\x2e\xcc\x90\xff\xee\x24\xed\x48\xef\x9b\x1a\
-\xa7\x46\x57\xb8\x07\x6f\x2c\xd4\x6b\x32\xf0\x6f\xa3\x22\x76\x59\
-\xa1\x5e\xcf\xef\xa4\x00\xe8\x34\xed\x74\xda\x1c\x67\xd4\x99\xf0\
-\xc7\xa4\xc0\x6d\xd9\x9d\x6b\x6e\xb7\x14\xb1\xc7\xe1\x30\xe3\xd5\
-\xb5\x00\xfc\x34\x5d\x22\xb0\x1c\x44\x3c\xb0\x1e\x44\x84\x0d\x03\
-\xd8\x98\x22\xac\x6e\x23\x38\x25\x3a\x4b\x66\x5c\x23\x36\x75\xcb\
-\xe4\xfe\xff\xb6\x6b\x0b\xb1\x46\x7f\x95\x69\x18\xe7\xd2\x90\xd9\
-\xf2\xf9\xe9\x24\x05\xc0\x36\x66\x9e\x4e\x6f\x24\x62\xb8\xc8\x8f\
-\x57\x39\x06\xb0\xb9\x83\xb0\xb2\x95\x90\x2b\xfc\x04\xc1\xf4\xf1\
-\xd6\x93\x32\xf9\xcf\x23\x1c\x8e\x7a\xbc\x51\xb4\x08\x9a\xad\xf3\
-\x8e\x9a\xb2\xa5\xef\x4e\xea\x30\x8c\xdf\x34\x9d\x3f\xe8\xef\x1d\
-\xe7\x7d\xbc\x07\x2f\xd3\x6e\x28\x75\x36\x0d\xbf\x77\x73\xc1\x82\
-\x05\x80\x14\x00\xdb\x99\x5d\x47\xbf\x2b\x8f\x60\x8e\xee\x1c\x3d\
-\xb5\xb5\x09\x47\x63\x1a\x05\xfb\xa4\xf6\x35\xd6\xbf\x55\x86\x76\
-\x99\xfc\xe7\x11\x2e\x2c\x29\x00\x44\x49\x30\x80\x2d\x19\xad\x2b\
-\x8f\xf2\x39\x18\xf4\x64\x6b\xdd\xc1\xbf\x6d\x9f\xf4\x61\x8f\xfe\
-\x38\xf1\x25\x74\xd4\xaf\xdf\x2b\x78\x30\x9f\x93\x02\x60\x07\xee\
-\x1a\x4f\x93\xca\x23\x78\x49\x77\x8e\x9e\x52\x9c\xef\xc1\xbd\xaa\
-\xbd\x30\xb3\x73\x4f\x36\xfe\x5a\xb5\xe7\xaf\x22\x0a\xc5\x86\x8c\
-\x00\x88\xe2\xdb\xfa\x68\x71\x73\x87\xde\xde\x23\x5b\x31\x80\x57\
-\xdb\x87\x1d\x36\xbb\xf5\xa6\xee\x2d\x13\x24\xfa\xbf\xd6\x88\xfb\
-\x1e\x29\x4e\x2a\x7f\x93\x02\x60\x27\xfa\xbd\x82\xda\x84\x05\x2f\
-\xf4\xa9\xee\xb1\x94\x9d\xaf\xdc\x5b\x72\x3d\x1f\x0c\xb0\x60\x2f\
-\x1f\x64\x7c\x30\xac\xa0\xc1\xc4\x1e\x71\x10\x09\x6d\xe3\x12\x51\
-\x1a\x5b\xd2\xc0\xf2\x64\xf1\x27\x17\x77\x17\x03\x58\xd4\x71\xe0\
-\x90\x69\x2d\x3f\x5a\xde\xb5\x3f\x41\xbf\x37\x86\xcf\xfd\x79\x51\
-\x43\xf9\x98\x14\x00\x3b\x31\x65\x0a\x29\xd3\xc6\x88\x98\x09\x2f\
-\xed\x58\xd5\x6d\xae\xca\x2f\x17\x5c\xdd\xd6\xb3\xb9\x01\x87\x1b\
-\x6f\xac\x2d\x7c\x2a\xb1\x27\x1c\x8e\x7a\xec\xb4\x2c\x82\x22\xeb\
-\x02\x2b\x5b\x09\x9b\xd3\xe4\xd5\x9d\x48\xc1\x00\x3e\x4c\xef\x7f\
-\x50\x7d\xfb\x0f\x77\xb9\x87\x00\x11\x9e\x36\x5c\xbe\x88\xbc\xfb\
-\xad\x68\x27\x05\xc0\x2e\xcc\x3e\x93\x5a\xe3\x11\x8c\x88\x18\xec\
-\xfb\x59\xa3\x5b\x47\x03\xba\xb9\xc5\xb0\x7d\xbc\xf5\xc4\xe1\xc5\
-\x4b\x25\x7a\xc2\x21\x29\x00\x44\x61\x31\x03\x0d\x69\xef\x6d\x3c\
-\xb6\x2b\x4b\xda\x0f\x18\xfc\x60\xfb\xe5\x3b\x7e\x1c\x40\xf4\x16\
-\x45\xac\x50\xb7\xf9\xed\x0a\x29\x00\x76\x63\x46\x2d\x7d\x5a\x69\
-\xd0\x58\x93\xa0\x71\x0a\x4c\x61\xa8\xce\x2d\x86\x57\xb4\x10\x32\
-\x5d\xf8\x90\x57\xa1\xe1\xad\x72\xb4\xf6\x2f\x7e\x32\xd1\x55\x2e\
-\xac\xec\x4a\x35\xb4\x51\x77\x0e\x11\x1c\x1d\xce\xd6\x9b\x03\x7f\
-\xdd\x2a\x33\x80\x97\xdb\x47\x0e\x79\x35\xf7\xa5\x25\x82\x2b\x0c\
-\xd3\xfd\x2a\x0d\x9d\xe3\x8b\xcd\xde\x74\xf2\xe3\x8a\x37\x2d\xae\
-\x79\x86\xff\xa3\xd5\xc5\x5f\x98\x83\xf3\x77\xd6\xa7\x0c\xe8\x9f\
-\xd8\xf9\x37\xf4\x7f\xcc\x07\xdf\x3c\xdc\x7c\xed\xe8\x92\x86\x12\
-\x5f\xd2\xa0\xf6\x5b\xb3\x58\x1d\xbf\x76\x19\x8f\x28\x6b\x57\xbd\
-\x0e\x65\x22\xd9\x8e\x59\xec\x31\x97\xf3\xeb\xfa\x5b\xf7\x60\x8e\
-\x90\x17\xc4\x4c\xce\xce\xe9\x77\xf9\xd6\xce\x98\x0d\x86\x72\x8f\
-\xa7\xa3\xee\xef\xe2\x1c\x81\x70\x0b\xcc\xc5\xac\x14\xae\x7e\x96\
-\x27\xb4\xd9\x98\xeb\xe7\x0f\xcb\xf6\x2c\xca\x17\x01\xd5\xb1\x2f\
-\xbe\x19\x08\x6a\xe3\x75\xd1\x2b\xfb\x10\x94\x6c\x3a\x53\x62\x69\
-\xae\x48\x7d\xcc\xa3\x97\x2e\x76\x8f\xe9\xd8\xcc\x07\x1c\xa8\x60\
-\xee\xab\x3b\x93\x08\x10\x06\x92\x39\x60\x53\x47\xe9\xda\x88\x17\
-\xdb\x7f\x54\xff\x73\xf9\x99\xf1\x47\xf7\x31\x98\xc6\xd3\xa8\xb9\
-\xaf\xe9\xce\xe3\x17\x52\x00\x74\xd3\xb5\xcf\xf1\xad\xc9\x2c\x7e\
-\xaa\x3b\x47\xa1\x95\x5b\xc0\x5e\xe5\x8c\x98\x99\xff\xf5\x81\xc6\
-\x7b\x2f\x9c\x6b\xcd\x19\xab\x35\x54\x48\x28\x98\xee\x6a\x1c\xb6\
-\xfc\x3d\xfb\xd8\xa6\xd5\x7c\x78\xef\x2c\x12\x43\x20\x8f\xe7\x44\
-\x11\xa4\xdd\xfc\x5d\xbf\x5f\x9e\xf3\x77\x55\xa5\xe5\x24\xeb\xfb\
-\x4e\xba\xc0\x1a\x39\xef\x29\xdd\x59\xfc\x44\x0a\x80\x1e\xb8\xe6\
-\x59\x9e\xd9\x6a\xe3\xea\x80\x14\xcf\x9f\x21\x00\xbd\xcb\x80\xbe\
-\x71\xe6\x8b\x63\x3f\x5d\xd9\x17\xeb\x0f\xd4\x9d\x29\xa8\x9a\x54\
-\xff\x35\x4b\xdc\x13\x3e\x5d\x86\x91\x56\x33\xf7\x3b\x1c\xa0\x6a\
-\xdd\x99\x44\x70\xb9\x0c\x6c\x49\x13\x9a\x32\xfe\x1e\xee\xdf\x21\
-\x02\x7a\xc5\x70\x6f\x7d\x2d\x5d\xa1\x3b\x8a\xdf\x48\x01\xd0\x43\
-\x57\xcf\xe7\x47\x5b\x73\x38\x57\x77\x8e\x62\xa8\x8e\xb8\xc9\xe9\
-\x7d\x26\xd6\xe8\xce\x11\x24\x59\x8e\x77\x7c\xc4\x47\x2d\xff\x50\
-\x1d\x93\x5e\xaf\x0e\xdc\x57\xc1\xdc\x4f\x77\x26\x11\x7c\x0c\xa0\
-\x39\x9b\x6f\x13\x5e\xe8\x5d\xfb\xbc\x80\x00\x54\x47\xf1\xd0\x8c\
-\x71\x74\xa1\xee\x2c\x7e\x24\x05\xc0\x1e\x98\xf8\x0c\x3f\xd3\xe1\
-\x60\xbc\xee\x1c\x85\x76\x42\xe5\x7b\x4b\x2f\x2e\xbf\xfb\x50\xdd\
-\x39\xfc\x8c\x61\xa8\xf5\x3c\xf8\xa3\xf7\xdd\xe3\x37\xaf\xe4\xa1\
-\x95\x1d\x5c\x75\x04\x80\xa8\xee\x5c\x22\x3c\xda\x72\xf9\x8e\xa0\
-\x45\xd8\x1b\xc4\x13\x08\x40\x75\x0c\x8f\xcc\xa8\xa3\xf3\x74\x67\
-\xf1\x2b\x29\x00\xf6\xd0\xc4\x67\xf8\xa5\x0e\x07\x27\xe9\xce\x51\
-\x28\xa6\x01\x9e\xd1\xef\xfa\x54\x82\x52\x15\xba\xb3\xf8\x4d\x3b\
-\xaa\x37\x7f\xe8\x1e\xf7\xe9\x62\x75\x1c\x9a\xb8\xff\x10\x80\x7a\
-\xe9\xce\x24\xc2\x27\xed\xe4\xef\xf8\x53\x01\x7b\xce\xbf\xbd\xea\
-\x32\x3c\x35\xb3\x96\xce\xd2\x9d\xc3\xcf\xa4\x00\xd8\x53\xcc\x34\
-\xe9\x59\xbc\x9c\x72\x70\x82\xee\x28\x85\x30\x20\x96\x5a\xff\x8b\
-\x5e\xd7\xef\xa3\x3b\x87\x1f\xd8\x88\x76\xac\x54\x47\x2e\x5d\xec\
-\x1e\xdb\xb6\x96\x0f\xee\x6f\x23\x76\x98\xee\x4c\x22\xbc\x6c\x95\
-\x7f\xce\x9f\xd4\xb0\x63\x5f\xa9\x55\x45\x31\x7f\xd6\x38\x0a\xdc\
-\xe8\x6b\xa9\x59\xba\x03\xf8\x1e\x11\xdf\xcd\x7c\xd2\xa4\x67\xf9\
-\x8d\x94\x43\x63\x74\xc7\xd9\x53\x67\x26\x9e\xea\xd0\x9d\xc1\xcb\
-\x36\xf1\x01\x9f\xbc\xe3\xd6\xae\xed\x1c\xd6\x1f\x0a\x60\x94\xee\
-\x4c\x22\xdc\x5c\x05\x6c\xc9\x76\x4e\xf0\x0b\xfa\x95\x1f\x40\x65\
-\x14\x6f\xc9\xc5\xbf\x30\x64\x04\xa0\x50\x98\xe9\xca\xf9\xbc\xa0\
-\xdd\xa6\xa3\x74\x47\xe9\xa9\xa8\xc1\xb9\x7b\xfa\x5f\x1e\x81\xbc\
-\x2f\x3e\xd3\xce\xbd\xb6\x2c\xe1\x63\x57\x2e\x55\xa3\xd1\xa8\xf6\
-\x19\xcc\xa0\xde\xba\x33\x09\x01\x74\xce\xec\xcf\x84\xe7\xc2\x0f\
-\x00\x95\x11\x2c\x9c\x3d\xde\xff\x37\x5a\x5e\x21\x23\x00\x85\x42\
-\xc4\x77\x31\x8f\x99\x34\x9f\x17\xa6\x6c\xf2\xe5\x5d\xe1\xc1\x65\
-\x6b\x56\x03\x38\x48\x77\x0e\x9d\x1c\x44\xd3\x2b\xd4\x91\x1f\x6e\
-\x33\xac\x7f\x28\x80\xbe\xba\x73\x09\xb1\x95\xab\x80\xa6\x2c\xd0\
-\x94\x25\xb8\x05\xd8\xee\xdb\x2f\x2a\x23\x78\x6d\xf6\x78\x3a\x5e\
-\x77\x8e\x20\x91\x02\xa0\x90\x88\xb8\xdf\x14\x1e\xc3\x27\xf0\x5b\
-\x1d\x0e\x8d\xd0\x1d\xa7\x3b\x08\xc0\xf9\x15\x0f\x86\x70\x2d\x3a\
-\x61\x23\x0f\x5c\xbb\xd8\x3d\x6e\xdd\x0a\x0c\x8b\xb7\xa9\x5e\x07\
-\x43\x86\xf5\x85\x07\xb9\x0c\x24\x33\xf9\xbb\xfe\xa0\x74\xf0\xeb\
-\xaa\xea\x28\x9e\x9b\x39\x8e\xc6\xe9\xce\x11\x34\x32\xd4\x5b\x0c\
-\xcc\x34\xe9\x39\xbc\x90\xca\xe1\x64\xdd\x51\xba\xaa\x26\x92\x6b\
-\xba\xb3\xcf\x55\xa1\x18\xde\x4e\xa1\xb2\x69\x99\x1a\xfd\xd1\x12\
-\xf7\x68\x67\x33\x06\x1e\xa4\xd8\xd8\x5b\x77\x26\x21\x76\x26\xac\
-\x77\xfc\x40\xfe\x02\x55\x15\xc3\x13\x33\xeb\xe8\x1c\xdd\x59\x82\
-\x48\x46\x00\x8a\x81\x88\xef\x06\x4e\xb9\xea\x19\xfe\x7b\x9b\x83\
-\xb3\x75\xc7\xe9\x8a\xe3\xca\x5e\xdf\x02\x20\xd0\x05\xc0\xe3\xce\
-\xe5\x2f\xae\x56\x87\xed\x65\x23\x76\x30\x80\xe3\x74\xe7\x11\x62\
-\x57\x1c\x06\x1a\x83\xda\xbd\xaf\x2b\x08\xa8\x8a\xe2\x8f\x33\xeb\
-\xe8\x5b\xba\xa3\x04\x95\xf4\x1b\x2f\xa2\xd9\xa7\xd2\x39\x15\x31\
-\x3c\xe8\xf5\x61\x16\x13\x50\x5f\x2f\x7f\x64\x90\xee\x1c\xc5\xb4\
-\x85\xf7\x59\xf5\x89\x1a\x71\x8a\x8d\xd8\x21\x90\x91\x2f\xe1\x61\
-\x59\x17\xd8\x90\x22\x2c\x6b\x26\x34\x86\xf4\xe2\x4f\x00\x6a\xa2\
-\xf8\x8d\x5c\xfc\x8b\x4b\x0a\x80\x22\xbb\xab\x8e\xbe\x5b\x11\xc1\
-\x5c\x2f\x5f\x72\xf6\x8d\x37\xaf\xb5\x60\x07\x7a\xd7\xbf\x0f\x9d\
-\x63\x56\xeb\xce\x20\xc4\xae\xa4\x1c\x60\x55\x1b\x61\x45\x0b\xa1\
-\x39\x04\x6b\xf9\x77\xa6\xf3\xe2\x3f\x73\x46\x1d\x5d\xa2\x3b\x4b\
-\xd0\x49\x01\x50\x02\xb3\xc7\xd3\xe5\x35\x65\xb8\xdd\xab\x35\xc0\
-\x37\xe2\x7f\x0e\xfc\xfb\x60\x19\x46\xca\xe3\x2e\xe1\x39\xcc\x40\
-\x32\x0b\x7c\xd2\x42\x58\xd5\x4a\x48\xd9\xe1\xbd\xf0\x03\x00\x11\
-\xb8\x77\x19\x6e\xad\x1f\x47\xd7\xea\xce\x12\x06\x81\x3f\xf1\x7b\
-\xc5\x8c\xb1\x74\x53\xaf\x28\xae\x33\xc8\x5b\x9f\xef\xb8\xe9\x76\
-\x1c\x19\x7d\x27\xd0\x1b\xd3\x30\x48\x25\x55\xbf\x83\x75\xe7\x10\
-\x62\x2b\x87\x81\x86\x34\xb0\x2c\x49\x58\x9f\x22\x64\x03\xda\xaf\
-\xbf\x3b\x4c\x82\xea\x15\xc3\x85\x77\xd6\xd2\xcf\x74\x67\x09\x0b\
-\x29\x00\x4a\x68\xfa\x38\x9a\xd1\xcb\xc2\x37\x2c\x03\x9e\xf9\xb8\
-\x1f\x51\xf6\xf1\x3a\xdd\x19\x8a\x6d\x83\x1a\xb4\x8c\x89\xfa\xe8\
-\xce\x21\x44\xda\x01\xd6\xb6\x13\x3e\x6e\x26\x34\xa4\x09\x8e\xa7\
-\x6e\x07\xf4\x89\x98\xb0\x6b\xca\x70\xc6\xf4\x5a\x7a\x58\x77\x96\
-\x30\x91\x02\xa0\xc4\xee\x1c\x4f\x8f\x97\xc7\x70\x5c\xc4\x40\x46\
-\x77\x16\x83\x80\xf3\xca\x1f\x1a\xa0\x3b\x47\xb1\x2d\xc6\xf1\x1b\
-\x75\x67\x10\xe1\xe5\x2a\xa0\x29\x93\x1f\xe6\x5f\xd9\x4a\x68\xcd\
-\xe9\x4e\xe4\x2d\x31\x13\xa9\x5e\x31\x0c\xbf\x73\x2c\x3d\xa3\x3b\
-\x4b\xd8\x48\x01\xa0\xc1\xcc\xb1\xb4\xa0\x57\x14\x43\x62\x26\x9a\
-\x74\xe6\xa8\x89\x64\x1a\x7a\x19\x8d\x55\x3a\x33\x94\xc2\x0a\x67\
-\x68\xb9\xee\x0c\x22\x64\x18\x48\xd9\xc0\xba\x76\xc2\xb2\x16\xc2\
-\xc6\x0e\x19\xe6\xdf\x91\xb8\x85\xc6\x3e\x0a\x43\x6e\x3f\x85\x3e\
-\xd4\x9d\x25\x8c\xa4\x00\xd0\xe4\xf6\x5a\x5a\x1b\x75\x30\x28\x6e\
-\x61\x95\xae\x0c\x27\x97\xbd\xa2\xb5\x00\x29\x05\x05\xd3\xe9\xa0\
-\x1a\xd9\xa5\x4f\x94\x44\xd6\x05\x36\xa5\xf3\x17\xfd\x55\x6d\x84\
-\x96\x1c\xa0\x64\x98\x7f\x87\x2a\x22\xfc\xf1\x00\x0b\xfb\xfd\xe2\
-\x0c\xda\xa0\x3b\x4b\x58\x49\x01\xa0\xd1\xec\x33\xa9\x75\xc0\xab\
-\x38\xb0\xd2\xc2\xfc\x52\x1f\x3b\x42\xac\xce\x8c\x3f\x7a\x60\xa9\
-\x8f\x5b\x6a\xab\xd4\x61\x1f\x30\x93\x8c\x00\x88\xa2\x71\x19\x68\
-\xce\x02\x2b\x5b\x09\x9f\xb4\x10\x1a\xd3\xf9\xad\x79\xc5\x4e\x10\
-\x50\x15\xe3\x67\xef\x1a\x6f\x1c\x32\xa5\x96\xb4\x3f\x0a\x0d\x33\
-\x29\x00\x34\x9b\x32\x85\xd4\xec\x53\x69\x7c\xef\x18\xee\x29\xe5\
-\x32\xc1\xbd\xa3\xc9\x35\x26\xb9\x81\x5e\xfb\x0f\x00\x8b\xd5\x71\
-\x81\x1f\xe5\x10\xa5\xa7\x3a\x97\xef\xad\x6e\xcb\x4f\xe8\xdb\x90\
-\x22\xa4\x1d\xdd\xa9\xbc\x8f\x08\xdc\x2b\x8a\x5f\xcc\xaa\x33\x4e\
-\xd5\x9d\x45\x48\x01\xe0\x19\xd3\xeb\x68\x62\x4d\x14\x17\x9b\x54\
-\x9a\x15\x02\x67\x95\x3f\x16\x8a\x7b\x94\xd5\xea\xd0\x40\xb7\x37\
-\x16\xa5\xa3\x18\x68\xcd\x02\x6b\xda\x08\x1f\x75\x2e\xdf\x6b\x0f\
-\xf9\xba\xfd\xee\x88\x1a\x70\xfa\x44\x71\x7e\x7d\x1d\xfd\x50\x77\
-\x16\x91\x27\x05\x80\x87\xd4\x8f\xa3\xdf\x26\x4c\x9c\x18\x35\x38\
-\x5d\xcc\xe3\x94\x59\x9c\x39\x2a\xfa\x46\xa0\x5b\xff\x02\x80\x8d\
-\x68\x47\x06\xe5\x87\xe8\xce\x21\xfc\xcb\x55\x9f\xdf\xe9\x7f\x94\
-\x24\xac\x4d\x11\xda\xec\x7c\x03\x1f\xd1\x75\x31\x03\x6d\x55\x51\
-\x8c\x9c\x56\x47\x8f\xe8\xce\x22\x3e\x27\x05\x80\xc7\xcc\x3e\x95\
-\x5e\x8f\xc5\x69\x60\xdc\x42\xd1\x5a\xd7\x0e\x8e\xac\x5e\x5b\xac\
-\xd7\xf6\x92\xf9\x99\xb3\x56\xaf\x6b\xa7\x58\x4b\x0e\xa1\xdb\x45\
-\x4d\xf4\x5c\xce\x05\x1a\xd3\xc0\xa7\xad\x84\x8f\x5a\xb6\xb9\xd3\
-\x97\x8b\x7e\x8f\x54\x44\xf1\xb1\x19\xc5\x3e\xd3\x6a\x69\xb1\xee\
-\x2c\xe2\x8b\xa4\x3d\xaa\x07\xcd\x3e\x99\x1a\xc0\xfc\x95\x6b\xe6\
-\xe3\x89\x16\x07\x67\x15\x7a\x8c\xf1\xbc\x8a\x87\x2b\x0b\xfb\x8a\
-\xde\xf4\x46\xfa\xe8\x44\x4b\x0e\x68\xc9\x11\x40\x40\xdc\x04\x2a\
-\x22\x8c\x8a\x28\x50\x66\xca\x8e\x40\x22\x8f\x01\xb4\xe7\x80\x76\
-\x27\xdf\x8a\x37\x27\xcb\xf5\x0a\xa6\x26\x86\xbf\xcf\xa8\xa3\xaf\
-\xeb\xce\x21\x76\x4c\x46\x00\xbc\x8a\x88\x67\x8e\xa7\xaf\x55\x47\
-\x71\xa3\x41\x85\xbb\xf7\xa8\x8a\x38\xc9\x7d\xcd\xd5\x81\x6f\xfe\
-\x03\x00\x9b\xec\x9a\xcf\xbf\x4f\xce\x77\x61\x6b\x48\x13\x56\xb6\
-\xe4\x27\x6e\xad\x4f\x11\x5a\xb2\x32\x63\x3b\x6c\x18\xf9\xe5\x7a\
-\x8d\x69\x60\x55\x2b\x61\x69\x33\x61\x4d\x3b\xa1\x39\x23\x17\xff\
-\x42\xb1\x08\xaa\x6f\x1c\x93\xe5\xe2\xef\x6d\x32\x02\xe0\x71\x33\
-\xeb\xe8\x8e\xc9\xaf\xf0\x6b\xed\x1d\x78\x3a\xeb\x62\x8f\x97\xb3\
-\x8d\x2a\x7b\x6f\x23\x80\x9a\x02\x44\xf3\xb4\x4d\xbc\x77\x32\xa7\
-\x68\xa7\xdf\xa7\xdb\x39\x8b\x3b\x99\xcd\x8f\x03\x44\x4c\x20\x61\
-\x02\x89\x08\xa3\x32\x02\x58\x52\x1a\x07\x8a\xed\x02\xed\x0e\xd0\
-\x61\x13\x52\x0e\xe0\x48\xd1\x57\x34\xf1\x08\x92\x71\x03\x63\xa7\
-\x8d\xa5\x45\xba\xb3\x88\x5d\x93\x51\x50\x9f\xb8\x69\x21\x57\xb7\
-\x27\xf9\xdf\x29\x9b\x0e\xef\xe9\x6b\x18\x04\x9e\xd9\xff\xfa\x54\
-\x82\x52\x15\x85\xcc\xe6\x45\x0f\xa4\x2e\x5b\xfe\x72\xdb\xa8\x83\
-\x7a\xf2\x67\x09\x40\xd4\x04\x12\x16\x90\xb0\x18\x71\x2b\xff\x6b\
-\xe1\x0f\x0c\x20\xe3\xe4\x47\x7c\x52\x36\xa1\xc3\xc9\x17\x7c\xa2\
-\xb8\x08\x40\x55\x0c\x0b\x07\x96\xe1\xe4\xeb\x8f\xa7\xa2\x4e\x64\
-\x16\x85\x21\x23\x00\x3e\x31\x75\x34\xb5\x00\x18\x7a\xd5\x73\x7c\
-\x6f\xca\xc6\x04\xa5\xba\x5f\xbc\xf5\x8e\x74\x6c\x4a\x50\x6a\xaf\
-\x22\xc4\xf3\x9c\x0f\xb2\x87\xf5\xb8\xc5\xf1\xd6\x21\xe2\xac\x0b\
-\x34\x77\x8e\x10\x98\x04\xc4\x2d\x20\x6e\x31\x12\x91\xfc\x7c\x02\
-\x43\xca\x67\x4f\xb0\x15\xd0\xe1\x00\x69\x27\xbf\x16\x3f\xe3\xc8\
-\xd2\xbc\x52\x33\x0d\x70\x95\x85\xa9\xf5\x75\x74\xb3\xee\x2c\xa2\
-\xeb\xa4\x00\xf0\x99\xd9\x75\x74\xf9\x75\xcf\xf2\xe3\x29\xe2\xc7\
-\x72\x2e\x95\x75\xe7\xcf\x8e\x2b\x7f\xae\x15\x40\xe0\x0b\x00\x06\
-\x21\x99\x2b\xeb\x5b\xc8\xd7\x74\x19\x68\xb7\x81\x76\x9b\x80\x34\
-\x00\x02\x62\x06\x10\xb3\x80\xb8\xc1\xf9\x9f\x4d\xc0\x94\x47\x07\
-\xc5\xc3\x40\x8e\x81\xac\x03\x64\x5c\x42\xc6\x05\x3a\x6c\xb9\xbb\
-\xd7\x2d\x66\xa2\xa3\xaa\x0c\x67\xde\x71\x32\xbd\xa8\x3b\x8b\xe8\
-\x1e\xb9\x87\xf1\xa9\x2b\xfe\xc1\xbd\x22\x71\xbc\xd4\x9a\xc3\x11\
-\x5d\xf9\x7a\xcb\x60\xf7\x9e\xfe\x13\x61\x40\x05\x7e\x30\x7b\x61\
-\xf6\xb8\x35\xf7\x34\x7f\x77\x7f\x1d\xc7\xb6\x0c\x7c\xf6\xc8\x20\
-\x66\x30\x62\x26\x10\x93\xd1\x82\x6e\xb3\x55\x7e\x42\x5e\x4e\x75\
-\x5e\xec\x9d\xfc\x88\x8c\xf4\xd5\xf7\x0e\x02\x50\x11\xe1\x45\xa6\
-\x49\x63\x67\xd4\x52\x52\x77\x1e\xd1\x7d\x32\x02\xe0\x53\xf7\x9c\
-\x45\xcd\x00\x8e\xbc\xee\x79\x9e\xd1\x92\xc3\xd5\xbb\x7b\x24\xb0\
-\x5f\xb4\x71\xad\x01\x35\xb0\x44\xf1\xb4\x7a\x3e\x37\xce\xd6\x75\
-\x6c\x47\x01\x6d\x9f\x6d\xf7\xfa\xf9\x3f\x49\xc4\xd8\x5a\x14\x00\
-\x11\x93\x11\xed\xfc\x75\x34\xc4\xcb\x11\x1d\xce\x4f\xce\xb3\x55\
-\xfe\xe2\x9e\x73\xe9\xb3\x47\x2f\x72\x9d\xf7\x36\x8b\xa0\x2a\x63\
-\xf8\x71\x7d\xad\xf1\x33\xdd\x59\x44\xcf\x49\x01\xe0\x73\xf5\xb5\
-\x74\xed\x0d\xcf\xf1\x63\x2d\x2e\x9e\xcc\x39\xd8\xe9\xfa\xfe\x73\
-\x12\x7f\x29\x65\x2c\xad\xd6\xe4\xf6\xe9\xa7\x3b\xc3\xf6\x6c\x95\
-\xff\x91\x02\xb0\xfd\x25\xdf\x34\x90\x2f\x08\x8c\xfc\x08\x42\xc4\
-\x64\x58\x00\x2c\x13\xb0\x28\xff\x7b\xbe\x1a\x41\xe0\xfc\xc5\xdd\
-\xe5\x2f\x5e\xe4\x6d\x45\x70\xd4\xe7\x7f\x17\x72\x37\xef\x4f\x09\
-\x0b\x0d\x95\x51\x8c\x9b\x7a\x0a\xbd\xaf\x3b\x8b\xd8\x33\x52\x00\
-\x04\xc0\x1d\x75\xf4\xe2\xdc\x85\xdc\x67\x49\x12\x7f\x6b\x73\xf0\
-\xb5\xed\xbb\x06\xc4\x2d\xee\x18\x16\x7d\x37\x14\x77\xff\x1d\x5c\
-\x99\xee\xb0\x4d\x5f\x35\x3a\x72\x15\x90\x56\xf9\xa9\x05\x79\x5f\
-\xbe\xda\x1b\x94\x2f\x06\x4c\x23\xff\xb3\x61\xe4\x9b\x78\xe4\x8b\
-\x03\xce\xff\xdc\xf9\x75\xa0\xfc\xcf\x04\xc0\x04\x40\x94\xff\xb1\
-\x3d\xc2\x17\x0b\x0b\x57\xe5\x7f\x53\x31\x3e\xbb\x05\xdf\xba\xbf\
-\x8d\xea\xbc\x60\x6f\xfd\xe1\x32\xe0\x82\xa0\x54\xe7\x7f\x73\x7e\
-\xf4\xc3\x51\xc8\x6f\x66\x21\x17\xf7\xc0\x31\x08\xa8\x8a\xe0\xaf\
-\x35\x75\x38\x6f\x0a\x91\x2c\xa4\x0c\x00\x29\x00\x02\xe2\xb2\xd1\
-\x64\x03\x38\xfb\xba\xe7\xf9\xfc\x54\x8e\x1f\xc8\x29\x8a\x6d\xfd\
-\x7f\x87\x44\x57\xac\x03\x30\x44\x5f\xba\x28\x56\xfe\x44\x00\x00\
-\x08\xaa\x49\x44\x41\x54\xd2\xf9\x57\xe6\xac\xb5\x1c\xc0\xef\x55\
-\x75\x4e\x80\xc3\x0e\x4f\xbb\x7e\x1a\x1e\x10\x7e\x14\x35\x90\x4d\
-\x44\x71\xc1\x8c\x5a\xfa\xab\xee\x2c\xa2\x70\x64\xce\x72\xc0\xd4\
-\xd7\xd2\x9f\x12\x51\xda\xab\x2a\x8a\x05\xe8\xbc\x0b\x3c\x2f\xf1\
-\x70\x68\x76\xc4\x5b\x98\x19\x91\xd0\x9d\x41\x88\xa0\x20\x00\x55\
-\x51\xbc\xb1\x4f\x35\xfa\xcb\xc5\x3f\x78\x64\x04\x20\x80\x3a\x67\
-\xe4\x1e\x7d\xfd\xf3\xfc\x7d\x93\x3b\x26\xf5\xb7\xd6\x7f\x45\x77\
-\xa6\x52\x69\xb4\xab\xfb\xeb\xce\x20\x44\x10\x44\x0d\xce\x56\x44\
-\xe9\xf2\xe9\xb5\xf4\x80\xee\x2c\xa2\x38\x64\xec\x30\xe0\xf8\xf5\
-\xab\xaa\x54\x59\xf6\x36\x30\xae\x44\xc0\x47\x7c\x3e\x75\x07\x6f\
-\xbe\xad\xe1\x46\x29\x00\x84\xd8\x43\x55\x31\xbc\xde\x3b\x81\xd3\
-\xa7\x1c\x4b\xad\xba\xb3\x88\xe2\x91\x02\x20\x24\xf8\xdd\x09\x27\
-\x2a\xe0\x3e\x30\x0e\xd5\x9d\xa5\x58\xee\x6d\xbb\x6e\xd9\x82\xd4\
-\xa1\x81\x7b\xfe\x2f\x44\xa9\x44\x4d\x64\x2a\x22\xb8\x74\x7a\x2d\
-\x3d\xac\x3b\x8b\x28\xbe\x40\xdf\x11\x8a\xcf\xd1\x88\x79\xaf\x18\
-\xcd\xb9\x91\x00\x7e\x02\x40\xdb\x3a\xf9\x62\x5a\x66\x0f\x0e\xcd\
-\x5c\x07\x21\x0a\xa9\xb3\x8f\xff\xeb\x56\x04\xfd\xe4\xe2\x1f\x1e\
-\x32\x02\x10\x42\xbc\x68\xc2\x28\xa5\x70\x3f\x80\x11\xba\xb3\x14\
-\x8a\x03\xcb\xb9\x62\xd3\xdd\xa6\x62\x79\x4f\x0b\xd1\x1d\x71\x0b\
-\xc9\x98\x89\x0b\x66\xd4\xd1\x53\xba\xb3\x88\xd2\x92\x11\x80\x10\
-\xa2\xe1\xf3\xde\x36\x92\xfb\x8c\x01\xf8\x5a\x00\x81\x78\xc6\xf7\
-\x72\x66\xdc\x2a\xb9\xf8\x0b\xd1\x75\x16\x41\xf5\x8e\x61\xee\x80\
-\xf1\xe8\x23\x17\xff\x70\x92\x13\x66\xc8\xf1\xc2\x09\x7b\x2b\x0b\
-\x53\xc1\xb8\x00\x3e\x7e\x3f\xfc\x2c\x79\xdb\xaa\x95\x99\xfe\xa1\
-\x68\x76\x24\xc4\x1e\x21\xa0\xdc\xc2\x0a\x33\x82\x33\x66\x9d\x42\
-\xcb\x74\xc7\x11\xfa\xf8\xf6\x84\x2f\x0a\xcb\x5e\xf4\xbd\x3a\x43\
-\x19\x77\x01\x38\x4c\x77\x96\x9e\xb8\xb2\xe1\xde\x74\xda\xa5\xb8\
-\xee\x1c\x42\x78\x59\xcc\x40\x2a\x1e\xc3\x15\x33\xc6\xd2\x43\xba\
-\xb3\x08\xfd\xe4\x11\x80\x00\x00\x44\x86\xff\xfa\x39\x23\xda\x3c\
-\x02\x8c\x9b\x01\xb4\xeb\xce\xd3\x1d\xeb\x9c\x03\x1a\x33\x72\xf1\
-\x17\x62\xa7\x4c\x02\xd7\xc4\xf0\xbb\xbd\xa3\xa8\x91\x8b\xbf\xd8\
-\x4a\x46\x00\xc4\x97\xf0\xc2\x09\x7d\x95\x85\x5b\xc1\x98\x84\x7c\
-\x3b\x79\x4f\x9b\xd7\x76\xcd\xb2\x37\x52\x87\xcb\xf2\x3f\x21\xb6\
-\x43\x00\xca\x23\xf8\xb0\x32\x86\xaf\xff\xf2\x24\xfa\x58\x77\x1e\
-\xe1\x2d\x52\x00\x88\x9d\xe2\xb7\x2f\x3b\x9c\x0d\xbe\x93\x19\x67\
-\xe8\xce\xb2\x2b\x93\x1b\x67\x37\x25\xed\xa8\x2c\x01\x14\x62\x1b\
-\x09\x0b\x9b\xca\x22\xf8\xef\xe9\x63\xe9\x79\xdd\x59\x84\x37\x49\
-\x01\x20\x76\xcb\x7e\xfb\xd2\xf1\x06\xd1\x0c\x00\x43\x75\x67\xd9\
-\x9e\x8d\x58\x6e\xe2\xe6\x59\x11\xa5\xe4\xbd\x2c\x04\x00\xc4\x0c\
-\x4e\x25\x22\x74\x63\x7d\x1d\xcd\xd1\x9d\x45\x78\x9b\xcc\x01\x10\
-\xbb\x15\x19\x75\xdf\xb3\x46\xb4\x79\x14\x18\xd7\x00\xd8\xac\x3b\
-\xcf\xb6\x9e\xc9\x7c\x75\x95\x5c\xfc\x85\x00\x22\x06\x9c\x9a\x18\
-\xe6\xed\x7d\x1a\x55\xc9\xc5\x5f\x74\x85\x9c\x38\x45\xb7\xf0\xa2\
-\xff\x29\x57\x9c\xb8\x12\xcc\x3f\x00\x50\xa3\x3b\xcf\x8f\x9b\xa7\
-\xae\x59\x9b\xad\xd9\x5f\x77\x0e\x21\x74\xb1\x88\x55\x45\x84\x1e\
-\xcd\x19\xb8\x68\x4e\x2d\xf9\x6a\x02\xaf\xd0\x4b\x0a\x00\xd1\x23\
-\xbc\xe4\x92\xde\x2a\x6b\xdc\x08\xa2\xab\x01\x68\x9b\x81\x3f\xb1\
-\xe1\x5e\x3b\xeb\x52\x44\xd7\xf1\x85\xd0\xc5\x34\xa0\x2a\x2c\xfc\
-\xd3\xb0\x71\x41\xfd\x19\xd4\xa4\x3b\x8f\xf0\x1f\x29\x00\xc4\x1e\
-\xe1\x77\x2f\xdf\x57\x29\x75\x2b\x08\x17\x01\x88\x96\xf2\xd8\x1f\
-\xba\x47\xae\x9e\xd6\x70\xe5\x01\xa5\x3c\xa6\x10\xba\x99\x04\x4e\
-\x44\xf8\xa5\x2a\xd0\xb7\x7f\x3e\x8e\xd6\xe9\xce\x23\xfc\x4b\x0a\
-\x00\x51\x10\xfc\xfe\xc4\xfd\x95\xeb\x7c\x1f\x8c\x4b\x51\xa2\x11\
-\x81\xe9\x6d\x3f\x5a\xb6\x24\xb5\xbf\x2c\xff\x13\xa1\x60\x18\xe0\
-\x8a\x08\xde\xa8\x34\xf1\x5f\x3f\x3f\x85\xd6\xe8\xce\x23\xfc\x4f\
-\x0a\x00\x51\x50\xbc\xe8\xf2\xfe\xca\x75\xaf\x07\xd1\x55\x00\x12\
-\xc5\x3c\xd6\xb5\x5b\xe6\xb4\xb5\x39\x66\x65\x31\x8f\x21\x84\x6e\
-\x16\x41\x25\x22\x78\x3e\x02\x5c\x72\xe7\x38\x5a\xa5\x3b\x8f\x08\
-\x0e\x29\x00\x44\x51\x6c\x53\x08\x4c\x04\x50\xf0\x8b\x74\x52\xf5\
-\x49\x7e\x7f\xf3\x2f\x6a\xb8\xd0\x2f\x2c\x84\x47\x44\x0c\x38\x09\
-\x0b\x4f\x5a\x06\x26\xdc\x59\x4b\x5b\x74\xe7\x11\xc1\x23\x05\x80\
-\x28\x2a\x5e\x7a\x71\xa5\x4a\x9b\x17\x83\x69\x32\x08\x05\x9b\xad\
-\xff\x50\xfa\xb2\xa5\x2f\xb4\x8c\x3a\xb4\x50\xaf\x27\x84\x57\x44\
-\x4d\x64\x12\x16\x7e\x57\x43\xb8\x66\x4a\x2d\x65\x74\xe7\x11\xc1\
-\x25\x05\x80\x28\x09\x5e\x38\x21\xe2\x9a\xf8\x3a\x80\x1b\x08\x18\
-\xb3\xa7\xaf\x77\x63\xd3\xcc\xcd\x8d\xb9\xb2\xfe\x05\x88\x26\x84\
-\x27\xc4\x2d\xb4\x96\x59\x98\x55\x3d\x16\x3f\x9e\x42\xa4\x74\xe7\
-\x11\xc1\x27\x05\x80\x28\x29\x66\x90\xb3\x68\xc2\xa9\x26\xf3\xf7\
-\x19\x34\x1e\x3d\x78\x0f\x2a\x36\x9d\x2b\x36\xcf\x31\x1c\x96\x46\
-\x56\xc2\xdf\x08\x40\x22\x82\x15\x31\x13\xb7\x4c\xaf\xa5\x3f\xeb\
-\xce\x23\xc2\x45\x0a\x00\xa1\x0d\xbf\x73\xd9\x10\xc5\xea\x12\x10\
-\x5d\x0a\xa0\xcb\xbd\xfc\x9f\xcd\x7c\x75\xf9\x1f\x93\x67\x1f\x54\
-\xc4\x68\x42\x14\x55\xc4\x80\x53\x16\xc1\x0b\x15\x11\x4c\x92\x4d\
-\x7a\x84\x2e\x52\x00\x08\xed\x78\xc9\xc4\x0a\x65\xbb\xdf\x02\xf3\
-\x24\x00\xc3\x76\xf7\xf5\x3f\x69\xf9\xd5\xea\xd5\xe9\x5e\xb2\xfe\
-\x5f\xf8\x4e\xcc\x42\x32\x61\xe2\xb7\xd5\x84\x5b\xe4\xf9\xbe\xd0\
-\x4d\x0a\x00\xe1\x29\xfc\xf6\xa5\xa7\x28\xd0\x15\x20\x7c\x1d\x40\
-\x6c\x47\x5f\x33\x71\xf3\xbd\xb9\xac\xa2\x92\x36\x1d\x12\xa2\xa7\
-\xcc\xfc\x32\xbe\x77\x12\x84\x1f\x4e\xad\xa3\x7f\xea\xce\x23\xc4\
-\x56\x52\x00\x08\x4f\xe2\x77\xbe\x5b\xa3\x28\xf6\x5f\x00\x26\x80\
-\xf9\xa8\xad\xbf\xff\x91\x7d\xd8\x86\xdb\x1b\xaf\xdd\x5b\x63\x34\
-\x21\x76\x8b\x00\xc4\x4c\x34\xc5\x2d\x3c\x68\xda\xb8\x75\xda\xe9\
-\x94\xd2\x9d\x49\x88\xed\x49\x01\x20\x3c\x8f\xdf\xbd\x74\xa8\x52\
-\xf8\x1f\x10\x5d\x5c\xdf\x72\x4b\xeb\xe2\xf4\xc0\xc1\xba\x33\x09\
-\xb1\x23\x11\x03\xb9\x84\x85\xf9\x86\xc2\x4d\xf5\xa7\xd2\xfb\xba\
-\xf3\x08\xb1\x2b\x52\x00\x08\xdf\xe0\x65\x57\xc5\x6e\x5b\xf7\x93\
-\xc9\x1b\x9d\x5e\x13\xd3\x36\xf6\x95\x26\x40\xc2\x0b\x4c\x82\x8a\
-\x47\xf0\x41\x99\x89\xe9\xd3\xc6\xd2\x6f\x75\xe7\x11\xa2\xab\xa4\
-\x00\x10\xbe\x74\xdd\xd3\xdc\x1b\x31\x5c\x97\x73\xf9\xbb\x1d\x0e\
-\xed\xc7\x52\x0d\x88\x12\x32\x0d\x70\x99\x89\x95\x51\x13\x7f\xa8\
-\xae\xc4\x2f\xa7\x8c\xa6\x0e\xdd\x99\x84\xe8\x2e\x29\x00\x84\xef\
-\x4d\x9e\xcf\x03\x5d\xc2\x2d\x39\x17\xe7\xa4\x1d\x0c\x90\x5a\x40\
-\x14\x83\x41\xe0\xb8\x95\xbf\xe8\x67\x81\xa9\x73\x6a\xa9\x5d\x77\
-\x26\x21\xf6\x84\x14\x00\x22\x50\xae\x7d\x8d\x0f\x43\x1a\x3f\xc8\
-\x29\x9c\x96\x71\xb0\x97\x92\x6a\x40\xec\x01\x93\xa0\xca\x2c\x2c\
-\x8f\x9a\x78\xa4\x3a\x8e\x3b\xa6\x1c\x4b\xad\xba\x33\x09\x51\x28\
-\x52\x00\x88\xc0\xba\xe2\x1f\xdc\x2b\x51\x81\x4b\x73\x0e\x7f\x2b\
-\xed\xd2\x11\x8e\x82\xa9\x3b\x93\xf0\xbe\xa8\x89\x6c\x99\x85\x77\
-\x0c\xc6\x9f\x6b\xf6\xc2\x9c\x29\x43\x29\xa7\x3b\x93\x10\xc5\x20\
-\x05\x80\x08\x85\x29\xcc\x46\xdb\x8b\xf8\xb6\xed\xf2\xf7\xb2\x2e\
-\x8d\xce\xb9\x48\xc8\xe0\x80\x00\xf2\x27\xc1\xb8\x85\x86\xa8\x81\
-\x67\x0d\x03\xb3\xa6\xd7\xd2\xeb\xba\x33\x09\x51\x0a\x52\x00\x88\
-\x50\xba\xf1\x15\x3e\xc4\xce\xe1\x32\x9b\x71\x6a\xd6\xe5\x83\x6c\
-\x97\xca\x74\x67\x12\xa5\x41\x00\xa2\x06\x3a\x62\x11\xbc\x67\x12\
-\x9e\x32\x73\x98\x37\xed\x74\xda\xac\x3b\x97\x10\xa5\x26\x05\x80\
-\x10\x00\x6e\x78\x9e\x47\x38\x8c\x0b\x6d\x85\x33\x32\x0e\x1f\xec\
-\x30\xc9\xe3\x82\x00\x89\x98\xb0\x63\x06\x96\x47\x0c\x3c\x0d\x85\
-\xbb\xea\xc7\xd3\x0a\xdd\x99\x84\xd0\x4d\x0a\x00\x21\x76\xe0\xfa\
-\xe7\xf9\x2c\x66\x7c\x33\xa7\x70\x9c\xad\x30\xd0\x76\x11\x93\x47\
-\x06\xfe\x90\xbf\xc3\xe7\xb6\xa8\x89\x8f\x2d\xa2\x17\x88\xf0\xd0\
-\xf4\x3a\x5a\xa4\x3b\x97\x10\x5e\x23\x05\x80\x10\x5d\x70\xcb\xd3\
-\xbc\x77\x3a\x8a\x73\x15\xe3\x2c\x5b\x61\x54\xc6\x45\x7f\xc5\xf2\
-\xf9\xf1\x02\x8b\x58\x45\x4d\x6a\x88\x18\x78\xdb\x20\xfc\x83\x09\
-\x7f\x98\x51\x4b\x49\xdd\xb9\x84\xf0\x3a\x39\x81\x09\xd1\x03\x53\
-\x9e\x67\xab\x15\x38\x03\x8c\xd3\x6c\x85\x31\xae\xc2\xe0\x1c\xa3\
-\xb7\xac\x34\x28\x1e\x02\x10\x31\x91\x8d\x18\xd8\x64\x1a\xf8\xc0\
-\x24\xbc\x4a\x8c\x27\xe5\xee\x5e\x88\x9e\x91\x02\x40\x88\x02\xba\
-\xf1\x15\x3e\xc4\x76\x70\xb6\xeb\xe2\x24\xc5\x38\xdc\x56\xd8\xdb\
-\x66\xc4\x95\x92\xcf\x5a\x77\x58\x06\xdc\x88\xc1\x6d\x16\x61\x8d\
-\x69\xd0\x3b\x06\x30\x9f\x73\xf8\x47\xfd\x19\xd4\xa4\x3b\x9b\x10\
-\x41\x21\x27\x25\x21\x4a\xe0\xca\x7f\xf2\xa0\x68\x14\x27\x30\x63\
-\x94\xc3\x3c\x4a\x31\x06\x3b\x2e\xf5\xb6\x19\xf1\xb0\x3e\x4a\x30\
-\x0d\xb0\x05\xa4\x2d\x93\x9b\x4c\x83\xd6\x1a\xc0\x7b\x06\xe1\x65\
-\xcb\xc6\x73\xb7\x9f\x46\xeb\x75\xe7\x13\x22\xe8\x42\x79\xe2\x11\
-\xc2\x2b\x1e\x79\x84\xcd\xb7\x07\x60\x98\xc3\x18\x61\xbb\x38\x04\
-\x84\x83\x98\x79\x3f\x57\xa1\xbf\x0b\xf4\x76\x15\x25\x1c\x85\x88\
-\xdf\x26\x20\x1a\x04\xb6\x08\x39\x8b\xd0\x6a\x1a\x68\x32\xc0\x1b\
-\x40\xb4\xd2\x20\x2c\x37\x0d\xbc\x4f\x8c\x05\x77\xd4\xd2\x46\xdd\
-\x39\x85\x08\x33\x29\x00\x84\xf0\x81\x29\xcf\xf3\x7e\x2d\x84\x41\
-\x06\xf0\x15\xa5\xb0\x3f\x01\x7b\x39\xc0\x00\x66\xf4\x05\xa3\x97\
-\x62\xae\x66\xa2\xa8\x52\x9c\x00\x11\x58\xa1\x0c\xc4\xa4\x40\x16\
-\x18\xa4\x00\x53\x31\x00\x06\x19\x06\x76\x5d\x4f\x30\x60\x12\xbb\
-\x0c\x52\x06\xe0\x10\xc1\x01\xe0\x98\x84\x0c\x03\xae\x41\x68\x27\
-\x42\x9b\x01\x6c\x21\x42\x03\x33\x36\x1a\xc0\x5a\x10\xd6\x10\xf0\
-\xa9\x61\x63\xf9\xb4\xd3\x29\x55\x92\xbf\x18\x21\x84\x10\x42\x08\
-\x21\x84\x10\x42\x08\x21\x84\x10\x42\x08\x21\x84\x10\x42\x08\x21\
-\x84\x10\x42\x08\x21\x84\x10\x42\x08\x21\x84\x10\x42\x08\x21\x84\
-\x10\x42\x08\x21\x84\x10\x42\x08\x21\x84\x10\x42\x08\x21\x84\x10\
-\x42\x08\x21\x84\x10\x42\x08\x21\x3c\xe2\xff\x03\xdc\xac\x35\x6d\
-\xd3\xf5\xbe\xe4\x00\x00\x00\x00\x49\x45\x4e\x44\xae\x42\x60\x82\
-\
-\x00\x00\x34\x61\
-\x89\
-\x50\x4e\x47\x0d\x0a\x1a\x0a\x00\x00\x00\x0d\x49\x48\x44\x52\x00\
-\x00\x02\x00\x00\x00\x02\x00\x08\x06\x00\x00\x00\xf4\x78\xd4\xfa\
-\x00\x00\x00\x04\x73\x42\x49\x54\x08\x08\x08\x08\x7c\x08\x64\x88\
-\x00\x00\x00\x09\x70\x48\x59\x73\x00\x00\x0e\xc4\x00\x00\x0e\xc4\
-\x01\x95\x2b\x0e\x1b\x00\x00\x00\x19\x74\x45\x58\x74\x53\x6f\x66\
-\x74\x77\x61\x72\x65\x00\x77\x77\x77\x2e\x69\x6e\x6b\x73\x63\x61\
-\x70\x65\x2e\x6f\x72\x67\x9b\xee\x3c\x1a\x00\x00\x20\x00\x49\x44\
-\x41\x54\x78\x9c\xed\xdd\x79\x98\x5d\x55\x9d\xef\xff\xcf\xda\xa7\
-\x4e\xcd\x95\xa4\x92\x90\x99\x0c\x64\x1e\x19\x12\x50\x06\x11\x34\
-\x10\x32\x54\xaa\x2a\xa1\xe2\x84\x0a\xb6\x82\xb6\xb6\x8d\xd3\x6d\
-\xfb\xfa\xf4\xed\xb4\x7d\xbb\x6f\x77\x6b\xeb\x0f\x6d\x07\x44\xc4\
-\x59\xac\x32\xa9\xaa\x54\x06\x88\x80\x80\x61\x16\xc8\x44\x08\x09\
-\x21\x01\x32\x91\x54\xe6\x9a\x4f\x9d\xbd\x7e\x7f\x80\x4a\xdb\x0c\
-\x19\xce\xda\xeb\x9c\xb3\xdf\xaf\xe7\xe1\x4f\xd6\xf7\x93\xc0\x3e\
-\xeb\xbb\xd7\xde\x6b\x6d\x09\x00\x00\x00\x00\x00\x00\x00\x00\x00\
-\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\
-\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\
-\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\
-\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\
-\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\
-\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\
-\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\
-\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\
-\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\
-\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\
-\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\
-\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\
-\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\
-\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\
-\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\
-\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\
-\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\
-\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\
-\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\
-\x00\x00\xf9\xc9\xf8\x0e\x80\xfc\xb5\xb0\x79\x61\x45\x10\x06\x03\
-\xc2\x20\xec\x93\x0e\x83\xa4\x24\xc9\xd8\x4a\x49\x0a\xac\x49\x86\
-\xd6\x94\x7b\x0d\x08\x64\x81\xc0\xd8\xb6\xd0\xd8\x94\x24\xc9\x9a\
-\x23\x92\x94\x08\xc2\x54\x10\x06\xc7\x93\xa9\x64\x6b\xc3\x92\x86\
-\x36\xaf\x01\x91\xb7\x68\x00\x70\xca\xe6\xd4\xd7\xf5\x2f\x4c\xa4\
-\x47\x87\xc6\x8e\x96\xb1\x63\x02\x69\x94\xb5\x66\xa8\x8c\x1d\x68\
-\xa4\x01\x56\x1a\xa0\x57\xff\x29\xf2\x9d\x15\xc8\x03\xdd\x92\x0e\
-\x19\xe9\x90\x95\x0e\xc9\x9a\x56\x63\xec\x3e\x6b\xcd\x2e\x2b\xed\
-\x0a\xac\xd9\xd5\x93\x4e\xec\xba\x7b\x49\xc3\x61\xdf\x41\x91\x5b\
-\x68\x00\xf0\xc6\xac\xcc\xfc\xe5\x8b\xc7\x98\x44\xef\xb9\xd6\x9a\
-\x69\xc6\x9a\x19\x92\x26\xc8\xd8\xd1\x92\xfa\x78\x4e\x07\xe0\x2f\
-\x18\xe9\x98\x95\x76\x19\xa3\x6d\xa1\xd5\xa6\x40\xda\x14\x86\x89\
-\x8d\xab\x16\x2d\xdb\x29\x23\xeb\x3b\x1f\xb2\x0f\x0d\x00\x24\x2b\
-\x53\xdd\x5c\x3d\x39\x94\x2e\x91\x35\x17\x5a\x63\x67\xc8\x9a\x69\
-\x92\x58\xa2\x07\x72\xdf\x09\x49\x9b\x8d\xb4\x49\xd2\xe3\xa1\x35\
-\x0f\xaf\xaa\x6d\xdc\x4a\x53\x00\x1a\x80\x18\x9a\x79\xeb\x8d\xc9\
-\x21\x83\x0e\xcc\x30\xd2\x65\xc6\xe8\x52\x6b\x75\xa5\xa4\x81\xbe\
-\x73\x01\x88\xcc\x71\x49\x8f\x4b\x7a\xc8\x1a\xbb\xae\xb4\xa7\xf0\
-\xa1\x86\x25\x0d\x9d\xbe\x43\x21\x5a\x34\x00\x31\x31\x7f\xd9\xe2\
-\x73\x14\xa4\x67\x1b\xa9\x4a\xd2\x55\xe2\xf9\x3c\x80\x3f\xeb\xb5\
-\xc6\x3e\x26\xa9\x45\xd6\xdc\xb3\xaa\xa6\xe9\x29\x56\x08\xf2\x1f\
-\x0d\x40\x9e\xaa\xab\xaf\x2b\xef\x4a\xa6\x66\x87\xd6\x5c\x63\x8c\
-\x9d\x2b\x69\xa4\xef\x4c\x00\x72\xc3\xab\xef\x12\xd8\xbb\x4c\x18\
-\xdc\xd5\x5d\xd6\x7e\xcf\xda\x39\x6b\xdb\x7d\x67\x42\xe6\xd1\x00\
-\xe4\x91\xba\xfa\xba\x92\xce\xc2\x9e\xd9\xb2\xa6\x4e\x52\xad\x78\
-\x86\x0f\xe0\x4c\x19\xdb\x25\x6b\xee\x91\xb1\x0d\x25\x3d\x85\xcb\
-\xd9\x96\x98\x3f\x68\x00\x72\xdc\x15\x77\x5c\x5f\x5c\x5e\x79\xe4\
-\xaa\xd7\x26\xfd\x1a\x49\x15\xbe\x33\x01\xc8\x5b\x9d\x92\xee\x95\
-\xb1\x0d\x3d\x25\x9d\xcb\x58\x19\xc8\x6d\x34\x00\x39\xaa\x6a\xd9\
-\xa2\x0b\x6d\x22\xfd\x09\x59\xf3\x7e\x31\xe9\x03\x88\xde\x71\x6b\
-\xcd\xaf\x64\xec\x6d\xab\x6a\x9b\x9e\xf4\x1d\x06\xa7\x8e\x06\x20\
-\x87\xcc\x5d\x3d\xb7\x4f\xd0\x5d\xf4\x7e\x23\xdd\x24\xe9\x02\xdf\
-\x79\x00\x40\x92\xac\xb4\x45\xc6\xfe\xb4\x30\x0c\x7e\xd8\xb8\xa8\
-\xf1\x90\xef\x3c\x38\x39\x34\x00\x39\x60\x5e\xf3\xc2\x59\x89\x30\
-\xf8\x8c\x95\xea\x24\x95\xfa\xce\x03\x00\x6f\xa2\xc3\x4a\xf5\x92\
-\xfe\x8b\x55\x81\xec\x47\x03\x90\xad\xac\xcc\xfc\xe6\xea\xf7\x1a\
-\x6b\xfe\x56\xd2\x02\xdf\x71\x00\xe0\x54\x58\x63\x1f\x52\x18\xdc\
-\x52\xda\x5b\xb0\xbc\x61\x49\x43\xda\x77\x1e\xfc\x4f\x34\x00\x59\
-\x66\xee\xea\xb9\x45\x89\x9e\xc2\xf7\x59\x6b\xfe\xce\x48\x53\x7c\
-\xe7\x01\x80\x33\xf4\xbc\xa4\xff\x2a\x49\x25\x7f\xc0\x61\x43\xd9\
-\x85\x06\x20\x4b\xd4\xd5\xd7\x95\x77\x26\x53\x7f\x23\xe9\x66\x49\
-\x83\x7c\xe7\x01\x80\x0c\x7b\x45\xd2\x37\x7a\x4a\x3b\xbe\xc3\xee\
-\x81\xec\x40\x03\xe0\x59\x5d\x7d\x5d\x61\x47\x32\x75\xbd\x31\xf6\
-\x9f\x64\xcd\x10\xdf\x79\x00\xc0\xb1\x56\x6b\xec\xd7\x4b\x7b\x0a\
-\xbf\xc5\x8a\x80\x5f\x34\x00\x9e\xfc\x69\xe2\x97\xfe\x51\xd2\x30\
-\xdf\x79\x00\x20\x62\x07\xac\xb1\xdf\x68\x3f\x52\x79\xcb\xfd\x37\
-\xfc\xb8\xcb\x77\x98\x38\xa2\x01\x88\xd8\xd2\xa5\x4b\x83\x27\xcf\
-\x5d\xff\x11\x2b\x7d\x55\xd2\xd9\xbe\xf3\x00\x80\x67\x2f\x1a\xe9\
-\x1f\x5a\x6a\x9a\x7e\xce\xf7\x07\xa2\x45\x03\x10\xa1\xaa\x65\x8b\
-\x2e\xb4\x41\x78\x8b\xa4\x8b\x7d\x67\x01\x80\x2c\xf3\xa4\xb1\xe6\
-\xe6\x96\x45\x8d\xeb\x7c\x07\x89\x0b\x1a\x80\x08\x2c\x68\x59\x30\
-\x5c\xbd\x05\xff\x4f\xd2\x75\xe2\xef\x1c\x00\xde\x8c\x35\x46\xbf\
-\x49\xa7\x83\x2f\xad\x5e\xbc\xfc\x45\xdf\x61\xf2\x1d\x93\x91\x43\
-\x75\xf5\x75\x25\x9d\xc9\xd4\xdf\x49\xfa\x92\x38\xc0\x07\x00\x4e\
-\x56\xbb\x95\xfe\xbd\xfd\x68\xbf\xaf\xf1\x7e\x80\x3b\x34\x00\x8e\
-\x54\x2d\xaf\xbd\xcc\x06\xe1\x6d\xb2\x66\x92\xef\x2c\x00\x90\x8b\
-\x8c\xb4\x43\xd6\xdc\xd8\xb2\xa8\xf1\x3e\xdf\x59\xf2\x11\x0d\x40\
-\x86\xcd\xae\xaf\xeb\x5b\x5c\xd8\xf3\x55\x59\xf3\x19\x49\x81\xef\
-\x3c\x00\xdc\xaa\x28\x2c\xd7\x80\x92\x01\x1a\x58\x32\x50\xfd\x8a\
-\xfa\xaa\x2c\x59\xae\x8a\x64\x99\xca\x93\xe5\x2a\x2f\xaa\x50\x79\
-\xb2\x4c\x45\x41\xb1\x8c\x91\x4a\x93\x25\x92\xa4\x84\x29\x50\x51\
-\xa2\x48\x92\xd4\x9d\xee\x56\xda\xf6\x4a\x92\x3a\x52\x9d\xb2\x56\
-\xea\x0e\xbb\xd4\x96\x6a\x57\x5b\xf7\x09\xb5\xa5\xda\x74\x22\xd5\
-\xae\xf6\x54\x9b\x8e\x76\x1f\x53\x6b\x67\xab\x5a\x3b\x0e\xa9\x2d\
-\x15\x9b\xaf\xf2\x5a\x49\x3f\x4f\xa5\x92\x37\xdf\xbd\xa4\xe1\xb0\
-\xef\x30\xf9\x84\x06\x20\x83\x16\x34\x55\x57\xc9\x9a\xef\x4a\x1a\
-\xe1\x3b\x0b\x80\xcc\x49\x04\x09\x0d\x2b\x1b\xaa\x11\xe5\xc3\x35\
-\xbc\x62\xb8\x86\x96\x0d\xd5\xc0\x92\x81\x1a\x58\x32\xe0\x4f\x13\
-\x79\xd4\xba\x7b\xbb\xd5\xda\x75\x48\xad\x9d\xad\xda\xd7\xbe\x4f\
-\xbb\x4f\xec\xd6\xee\x13\x7b\xb5\xbf\x63\x9f\x7a\xc3\x3c\x3c\x79\
-\xd7\xd8\xfd\x92\xfe\x66\x65\x4d\xf3\x6f\x7c\x47\xc9\x17\x34\x00\
-\x19\x50\xbb\xbc\x76\x40\x4a\xfa\xbe\x8c\xbd\xd6\x77\x16\x00\x67\
-\x26\x30\x81\x46\x94\x8f\xd0\xb8\xca\xb1\x3a\xa7\xef\x39\x1a\x51\
-\x31\x5c\x43\x4a\x87\xa8\x20\x48\xf8\x8e\x76\x52\x7a\xc3\xb4\xf6\
-\x77\xec\xd3\xcb\x27\xf6\xe8\x85\x63\x2f\x68\xc7\x91\x1d\xda\xdd\
-\xb6\x47\xa1\x0d\x7d\x47\xcb\x08\x2b\xd5\xf7\xa6\x92\x9f\x62\x35\
-\xe0\xcc\xd1\x00\x9c\xa1\xaa\xe5\xb5\xef\xb1\xd2\x4f\x65\xec\x70\
-\xdf\x59\x00\x9c\xba\x82\xa0\x40\xe3\xfb\x8d\xd3\xf8\xca\xf1\xaf\
-\x4d\xfa\x63\x54\x9c\x28\xf6\x1d\x2b\xa3\xba\xd2\x5d\x7a\xe1\xe8\
-\x4e\x3d\x7f\xf4\x79\x6d\x3b\xbc\x5d\xdb\x8f\x3d\xaf\x74\x2e\xaf\
-\x12\x18\xbb\x3f\x0c\x83\x1b\x56\x2f\x6a\xbc\xcb\x77\x94\x5c\x46\
-\x03\x70\x9a\x66\xde\x7a\x63\x72\xe8\xa0\x03\x5f\x91\xf4\x0f\xe2\
-\x59\x3f\x90\x53\x06\x94\x0c\xd0\xb4\x01\x53\x34\xb9\xff\x64\x4d\
-\x3d\x6b\x8a\x4a\x12\x25\xbe\x23\x45\xaa\x27\xdd\xa3\xe7\x8f\xed\
-\xd0\xc6\x83\x1b\xf5\xf4\x81\x0d\x3a\xd4\x79\xc8\x77\xa4\xd3\x61\
-\x65\xec\xb7\xd3\x85\x3d\xff\x6b\xcd\xbc\x35\xdd\xbe\xc3\xe4\x22\
-\x1a\x80\xd3\x30\x7f\x79\xed\x64\x63\xec\x2f\x24\x9d\xef\x3b\x0b\
-\x80\x93\x33\xb2\xe2\x6c\xcd\x1a\x32\x53\x17\x0c\x3a\x5f\x43\xca\
-\xf8\xec\xc6\xeb\xed\x6b\xdf\xaf\xa7\x0e\x3c\xad\x27\xf6\xfd\x41\
-\xbb\xdb\x76\xfb\x8e\x73\xaa\x36\x87\xc6\x7e\x70\x75\x4d\xf3\x26\
-\xdf\x41\x72\x0d\x0d\xc0\x29\xaa\x6a\xac\xb9\xde\x4a\xdf\x95\x14\
-\xaf\x5b\x06\x20\x07\x0d\x2b\x1b\xa6\x59\x43\x66\xea\xa2\x21\xb3\
-\x98\xf4\x4f\x52\x6b\x67\xab\x36\x1c\xd8\xa8\x87\xf7\x3d\xaa\x17\
-\x8f\xe7\xcc\x59\x3c\x1d\x46\xfa\x64\x4b\x6d\xd3\xcf\x7c\x07\xc9\
-\x25\x34\x00\x27\x69\xee\xea\xb9\x45\x89\x9e\xc2\xff\x90\x35\x9f\
-\xf5\x9d\x05\xc0\x9b\x2b\x2d\x28\xd3\xc5\xc3\xdf\xa1\xcb\x87\xbf\
-\x4b\xc3\xcb\xf9\xce\xd6\x99\x78\xf9\xc4\x6e\xfd\x7e\xcf\x3a\x3d\
-\xba\xf7\x31\x75\xf4\x76\xf8\x8e\xf3\xb6\x8c\xf4\x83\xe2\x54\xf2\
-\x6f\x1a\x96\x34\xf4\xf8\xce\x92\x0b\x68\x00\x4e\xc2\x6b\x47\xf9\
-\x36\x88\x33\xfc\x81\xac\x35\xaa\xcf\x28\x5d\x3e\xe2\x5d\xba\x78\
-\xe8\x3b\x54\x98\x28\xf4\x1d\x27\xaf\xf4\x86\xbd\x5a\x7f\x60\x83\
-\x1e\xdc\xfd\x7b\x3d\x7b\x78\xab\x6c\x16\x7f\xb3\xc7\x4a\x7f\x08\
-\x0a\xd2\x8b\x5b\xaa\x5a\x5e\xf2\x9d\x25\xdb\xd1\x00\xbc\x8d\xf9\
-\x4d\xd5\xef\x32\x52\xbd\xac\x61\xfd\x10\xc8\x32\xc9\x44\x52\x97\
-\x0e\xbb\x58\x57\x8d\x7a\xaf\x06\x97\x72\x89\x46\x61\x7f\xfb\x7e\
-\xfd\xf6\xc5\x7b\xf5\xf0\xbe\x47\x94\x4a\xa7\x7c\xc7\x79\x33\x07\
-\x25\x7d\x60\x65\x6d\xd3\xbd\xbe\x83\x64\x33\x1a\x80\xb7\xb0\xa0\
-\xb1\xe6\x33\x92\xbe\x29\xa9\xc0\x77\x16\x00\x7f\x56\x51\x58\xae\
-\x2b\xcf\xbe\x52\xef\x19\x79\x85\xca\x93\xe5\xbe\xe3\xc4\xd2\x89\
-\x9e\x36\xad\xdb\xbb\x4e\xf7\xbe\xf8\x3b\x1d\xed\x3e\xea\x3b\xce\
-\x1b\xe9\xb5\xd2\x67\x57\xd5\x36\x7d\xcf\x77\x90\x6c\x45\x03\xf0\
-\x46\xac\xcc\x82\xa6\x9a\x7f\x94\xf4\x8f\xbe\xa3\x00\xf8\xb3\xb3\
-\x4a\x07\x6a\xee\xe8\xb9\xba\x78\xe8\x3b\x95\x4c\xd0\x97\x67\x83\
-\x54\x3a\xa5\x87\xf6\x3e\xa2\x35\xbb\xee\xca\xce\xed\x84\xc6\x7e\
-\x6b\xd6\xfa\xf3\x3f\xb7\x74\xe9\xd2\xfc\x38\x09\x29\x83\x68\x00\
-\xfe\xc2\x15\x77\x5c\x5f\x5c\xde\xef\xe8\x8f\x25\xbd\xcf\x77\x16\
-\x00\xaf\xaa\x2c\xae\xd4\x35\xa3\xae\xd6\xbb\xcf\xbe\x5c\x05\x01\
-\x13\x7f\x36\xea\x0d\xd3\x7a\xe2\x95\x27\xd4\xfc\x7c\x8b\x5a\x3b\
-\x5b\x7d\xc7\xf9\xef\xac\x69\x34\xc9\xde\xeb\x5a\xaa\x5a\xb2\xff\
-\x4d\xc6\x08\xd1\x00\xbc\x4e\xed\xf2\xda\x01\x3d\x41\xd8\x6c\xac\
-\xb9\xd4\x77\x16\x00\x52\x45\x61\x85\xae\x1e\x3d\x5b\xb3\xcf\x9e\
-\xcd\x1d\x7f\x8e\x48\x87\x69\xad\xdb\xfb\xb0\x5a\x76\xac\xcc\xb6\
-\x47\x03\x8f\x07\x41\xb8\x70\x45\xf5\x8a\x57\x7c\x07\xc9\x16\x34\
-\x00\xaf\x59\xd8\xbc\x70\x62\x18\x06\x6b\x24\x8d\xf1\x9d\x05\x88\
-\xbb\xa2\x82\x22\xcd\x1b\x3d\x57\x57\x8f\x9a\xad\x64\x22\xe9\x3b\
-\x0e\x4e\x43\x4f\xba\x47\x77\xbf\xf8\x5b\xdd\xb5\xf3\x6e\x75\xa7\
-\xb3\xe6\xa0\xbe\x17\x42\x6b\xe6\xae\x5e\xd4\xb8\xcd\x77\x90\x6c\
-\x40\x03\x20\xa9\x6a\x45\xd5\x54\xa5\x13\xbf\xb5\xd2\x50\xdf\x59\
-\x80\x38\x33\x32\x9a\x39\xe4\x02\x2d\x99\x70\xad\xfa\x17\xf7\xf7\
-\x1d\x07\x19\x70\xb4\xfb\xa8\x5a\x76\xac\xd4\x83\x7b\xd6\xc9\xda\
-\xac\xd8\x3e\x78\x40\xd6\x5c\xbd\x72\x51\xe3\x06\xdf\x41\x7c\x8b\
-\x7d\x03\x30\xbf\xb1\x66\xa6\x91\xee\x96\x34\xc0\x77\x16\x20\xce\
-\x46\xf7\x1d\xa5\xf7\x4f\x7c\x9f\xc6\xf5\x1b\xeb\x3b\x0a\x1c\xd8\
-\x75\x7c\x97\xee\x7c\xae\x5e\xcf\x1f\xd9\xe1\x3b\x8a\x24\x1d\x35\
-\x61\x30\xb7\x65\xf1\xf2\x47\x7d\x07\xf1\x29\xd6\x0d\xc0\xfc\xa6\
-\xea\x77\x19\x6b\x56\x4a\xea\xe3\x3b\x0b\x10\x57\xa5\x05\x25\xaa\
-\x1e\xbb\x50\xef\x19\x79\xa5\x8c\x89\xf5\x4f\x52\xde\xb3\xb2\x7a\
-\x74\xdf\x63\xba\x73\xeb\xaf\xd5\x9e\xf2\xfe\x3e\x5e\x9b\xb1\xa6\
-\xba\x65\x51\xe3\x7d\xbe\x83\xf8\x12\xdb\xab\x6d\x7e\xf3\xc2\x2b\
-\x4d\x18\xac\x90\xc4\x26\x62\xc0\x93\x73\xcf\x9a\xa1\xeb\x26\x7f\
-\x50\x95\xc5\x95\xbe\xa3\x20\x42\x47\xbb\x8f\xe9\x57\x5b\x7f\xad\
-\x27\x5f\x79\xd2\x77\x94\x0e\x6b\xec\xa2\x55\x35\xcd\x77\xfb\x0e\
-\xe2\x43\x2c\x1b\x80\x05\x4d\xd5\xf3\x64\xcd\x72\x49\x45\xbe\xb3\
-\x00\x71\xd4\xb7\xa8\x8f\xae\x9d\xb0\x58\x17\x0f\x7d\xa7\xef\x28\
-\xf0\x68\xe3\xc1\x4d\xfa\xd9\xb3\xbf\xd0\x91\xae\x23\x3e\x63\x74\
-\x1b\xa9\xb6\xa5\xb6\x69\x8d\xcf\x10\x3e\xc4\xae\x01\x58\xb8\x6c\
-\xd1\xa5\x61\x10\xde\x2d\xa9\xcc\x77\x16\x20\x8e\x66\x0e\xbe\x40\
-\x1f\x99\x72\x9d\xca\x92\x5c\x82\x90\x3a\x7a\x3b\xf5\xf3\x67\x7f\
-\xa1\xc7\xf7\x3d\xe1\x33\x46\xa7\x0d\xc2\xf9\xab\xaa\x57\xfc\xce\
-\x67\x88\xa8\xc5\xaa\x01\xa8\x5a\xb6\xe8\x9d\x36\x08\xd7\x4a\xaa\
-\xf0\x9d\x05\x88\x9b\xe2\x44\xb1\xea\x26\x5e\xab\x77\x8f\x78\x97\
-\xef\x28\xc8\x42\x8f\xec\x7b\x54\x3f\x7f\xf6\x97\xea\xee\xf5\xb6\
-\x65\xb0\xc3\x58\x33\xa7\x65\x51\xe3\x3a\x5f\x01\xa2\x16\x9b\x06\
-\x60\xc1\xf2\xda\x73\x65\xec\x7d\x92\xd8\x5b\x04\x44\x6c\x4c\xdf\
-\xd1\xfa\xf8\xb4\xbf\xd2\xe0\xb2\x41\xbe\xa3\x20\x8b\x1d\xea\x3c\
-\xa4\xdb\x36\xdf\xee\x6d\xa7\x80\x91\x8e\x85\xd2\x7b\x57\xd5\x36\
-\x79\x7f\x39\x21\x0a\xb1\x68\x00\x5e\x3b\xe4\xe7\x01\x49\x83\x7d\
-\x67\x01\xe2\xc4\xc8\xe8\x9a\x31\x73\x54\x33\x6e\xa1\x12\x26\xe1\
-\x3b\x0e\x72\x40\x6f\x98\x56\xe3\xf6\x26\xad\x7d\xf1\xb7\xbe\x3e\
-\x3b\x7c\x30\x61\xec\x15\xcd\x35\xcd\x5b\x7c\x14\x8f\x52\xde\x37\
-\x00\x73\x97\x2d\x1a\x91\x30\xf6\x51\x19\x3b\xdc\x77\x16\x20\x4e\
-\x8a\x13\xc5\xba\x61\xda\x47\x34\x73\xf0\x4c\xdf\x51\x90\x83\xd6\
-\x1f\xdc\xa0\x1f\x6d\xba\x43\x1d\xbd\x9d\x3e\xca\xbf\xac\x82\xde\
-\x8b\x57\x56\xad\xdc\xe3\xa3\x78\x54\xf2\xba\x01\x58\xd8\xbc\xb0\
-\x22\x0c\x83\x07\x25\x9d\xe7\x3b\x0b\x10\x27\x43\xca\x06\xeb\xd3\
-\xe7\x7d\x4a\x43\xcb\x38\x5c\x13\xa7\x6f\x7f\xfb\x2b\xfa\xee\xfa\
-\xef\x6b\x6f\xfb\x5e\x1f\xe5\x37\x77\xa5\x92\x97\xdd\xb3\xa4\xe1\
-\x98\x8f\xe2\x51\xc8\xdb\x06\xa0\xae\xbe\x2e\xd1\x99\x4c\x35\x4a\
-\xaa\xf2\x9d\x05\x88\x93\x99\x83\x2f\xd0\x0d\xd3\x3e\xaa\xe2\x44\
-\xb1\xef\x28\xc8\x03\x9d\xe9\x4e\xdd\xb1\xe9\x27\x7a\xea\xc0\xd3\
-\x3e\xca\xaf\x69\xeb\x77\x74\xe1\xfd\x57\xde\xdf\xeb\xa3\xb8\x6b\
-\x81\xef\x00\xae\x74\x24\x53\xdf\x12\x93\x3f\x10\xa9\xd9\xa3\xde\
-\xa3\x4f\xce\xb8\x91\xc9\x1f\x19\x53\x92\x28\xd1\xa7\xce\xbb\x49\
-\x0b\xc7\x7a\xf9\x39\x9f\x5b\x7e\xa4\xf2\x7b\x3e\x0a\x47\x21\x2f\
-\xdf\xca\x59\xd0\x58\xf3\xf7\x46\xfa\xb2\xef\x1c\x40\x5c\x04\x26\
-\xd0\x07\x27\x7f\x40\x55\xe7\xcc\xe7\x38\x5f\x64\x9c\x91\xd1\xc4\
-\xfe\x13\xd4\xbf\xb8\xbf\x36\x1f\xda\xac\x30\xca\x8f\x0a\x19\x5d\
-\x30\xe1\x7d\x93\x3b\xb6\xfd\x7a\xeb\xc3\xd1\x15\x8d\x46\xde\x5d\
-\xa9\x55\xcb\x6b\xab\xad\xb1\x8d\xca\xc3\x3f\x1b\x90\x8d\x8a\x0a\
-\x8a\x74\xd3\xf4\x4f\x68\xc6\x59\xd3\x7d\x47\x41\x0c\x6c\x39\xf4\
-\xac\xbe\xb7\xfe\x56\x75\xa6\x23\x7d\x39\x30\x94\xb1\x35\x2b\x6b\
-\x9a\x5b\xa2\x2c\xea\x5a\x5e\x4d\x92\x0b\x7e\xb3\x78\xbc\x49\xa4\
-\x9f\xb0\x52\x5f\xdf\x59\x80\x38\xe8\x57\xd4\x57\x37\xcf\xfc\xac\
-\x46\x94\x8f\xf0\x1d\x05\x31\xf2\xd2\x89\x97\x75\xcb\x53\xdf\xd2\
-\xb1\xee\xe3\x51\x96\x3d\x61\xd2\x89\x8b\x5a\xae\x5d\xb6\x35\xca\
-\xa2\x2e\xe5\x4d\x03\x50\x57\x5f\x57\xde\x59\xd0\xfb\xa8\x8c\x9d\
-\xea\x3b\x0b\x10\x07\xfd\x8b\xfb\xeb\x0b\x33\x3f\xc7\xe1\x3e\xf0\
-\xa2\xb5\xb3\x55\x5f\xff\xc3\x37\xd5\xda\xd9\x1a\x59\x4d\x23\x6d\
-\xea\x2e\xed\xb8\x78\xed\x9c\xb5\xed\x91\x15\x75\x28\x6f\x5e\x02\
-\xec\x48\xa6\x6e\x67\xf2\x07\xa2\x31\xb0\x64\xa0\xbe\x34\xeb\x0b\
-\x4c\xfe\xf0\x66\x60\xc9\x40\xfd\xaf\x0b\xbf\xa0\x41\xa5\xd1\xfd\
-\x3f\x68\xa5\xe9\x85\x9d\x25\x3f\x8c\xac\xa0\x63\x79\xf1\x12\x60\
-\x55\x53\xf5\x17\x25\xf3\x39\xdf\x39\x80\x38\x18\x52\x36\x44\x5f\
-\xba\xf0\xf3\x1a\x50\x32\xc0\x77\x14\xc4\x5c\x49\x41\x89\x66\x0d\
-\x9e\xa5\x2d\x87\xb6\xe8\x78\xcf\x89\x88\xaa\x9a\x69\xe3\xdf\x3f\
-\xe9\xd8\xf6\x5f\x6f\x7d\x34\xa2\x82\xce\xe4\xfc\x23\x80\xaa\xe5\
-\xb5\x97\x59\x63\x7f\x27\xa9\xc0\x77\x16\x20\xdf\x0d\x2f\x1f\xa6\
-\x2f\xce\xfa\x82\x2a\x0a\xcb\x7d\x47\x01\xfe\xe4\x44\x4f\x9b\xbe\
-\xfe\x87\xff\xd4\x9e\xb6\x68\x0e\x0c\x32\x52\x2a\x34\xf6\x8a\x55\
-\x35\xcd\x39\xbd\x33\x20\xa7\x1f\x01\xcc\xae\xaf\xeb\x1b\x1a\xfb\
-\x33\x31\xf9\x03\xce\x0d\x2a\x1d\xa4\xcf\xcd\xbc\x99\xc9\x1f\x59\
-\xa7\xa2\xb0\x5c\x5f\x9c\xf5\x79\x0d\x29\x1b\x12\x49\x3d\x2b\x25\
-\x8d\x35\x3f\x9f\xbb\x7a\x6e\x9f\x48\x0a\x3a\x92\xd3\x0d\x40\x71\
-\x32\xf5\x5d\x23\x8d\xf6\x9d\x03\xc8\x77\x95\xc5\x95\xfa\xc2\xcc\
-\x9b\xd5\xaf\x88\x0d\x36\xc8\x4e\x15\x85\x15\xfa\xc2\xcc\x9b\xa3\
-\x7c\x34\x35\x26\xd1\x55\xfc\xed\xa8\x8a\xb9\x90\xb3\x0d\xc0\xfc\
-\xc6\x9a\xeb\x24\x7d\xd0\x77\x0e\x20\xdf\xf5\x29\xec\xa3\x2f\xce\
-\x8a\xf4\x87\x15\x38\x2d\x7f\x6e\x54\xfb\x45\x53\xd0\xd8\x8f\x54\
-\x35\xd6\x7c\x20\x9a\x62\x99\x97\x93\xef\x00\x54\x37\x55\x9f\x9d\
-\xb6\x66\x83\xa4\x4a\xdf\x59\x80\x7c\x56\x96\x2c\xd5\x97\x2f\xfa\
-\x3b\x0d\x8d\x68\x69\x15\xc8\x84\x3d\x6d\x7b\xf5\xef\x8f\x7f\x4d\
-\x1d\xbd\x1d\xce\x6b\x19\xe9\x58\x3a\x0c\xce\x5d\xbd\x78\xf9\x8b\
-\xce\x8b\x65\x58\xce\xad\x00\xd4\xd5\xd7\x25\xd2\xd6\xfc\x52\x4c\
-\xfe\x80\x53\x89\x20\xa1\x4f\x9d\xfb\x49\x26\x7f\xe4\x9c\xe1\xe5\
-\xc3\xf4\x99\xf3\x3f\xa5\x82\xc0\xfd\xeb\x61\x56\xea\x9b\x30\xf6\
-\xa7\x4b\x97\x2e\xcd\xb9\xf9\x34\xe7\x02\x77\x15\xf6\x7c\x56\xd2\
-\x65\xbe\x73\x00\xf9\xcc\xc8\xe8\xfa\xa9\x1f\xd1\xa4\xfe\x13\x7d\
-\x47\x01\x4e\xcb\x84\xca\x09\xfa\xd8\xd4\x1b\x64\x22\x58\xe8\xb6\
-\xc6\x5e\xfe\xe4\x8c\x0d\x9f\x71\x5e\x28\xc3\x72\xea\x1c\x80\x79\
-\xcb\x16\x8d\x32\x46\x0d\x92\x0a\x7d\x67\x01\xf2\x59\xcd\xb8\x6a\
-\xbd\x77\xe4\x95\xbe\x63\x00\x67\x64\x78\xc5\x30\x49\xd2\x73\x47\
-\xb6\xb9\x2f\x66\x74\xf9\xc4\x0f\x8d\xff\xd5\xb6\x5f\x6d\x3b\xea\
-\xbe\x58\x66\xe4\xd4\x0a\x40\x10\x84\xb7\x4a\x62\x0f\x12\xe0\xd0\
-\xa5\xc3\x2e\xd5\x82\x73\xe6\xf9\x8e\x01\x64\x44\xd5\xd8\xf9\xba\
-\x64\xe8\xc5\x51\x94\x2a\xb3\xe9\xc4\x77\xa2\x28\x94\x29\x39\xd3\
-\x00\x2c\x68\xaa\xfe\x88\xa4\x39\xbe\x73\x00\xf9\x6c\x4c\xdf\xd1\
-\xfa\xf0\x14\x36\xd7\x20\x7f\x18\x19\x7d\x78\xca\x75\x1a\xdd\x77\
-\x54\x14\xe5\xe6\x56\x35\x55\xe7\xcc\x05\x94\x13\x0d\x40\x55\x4b\
-\xd5\x40\x59\xf3\x75\xdf\x39\x80\x7c\x56\x96\x2c\xd3\x27\x67\xdc\
-\x18\xc9\x8b\x53\x40\x94\x92\x89\x02\xfd\xf5\xb9\x9f\x8c\xe4\x10\
-\x2b\x6b\xcd\x2d\x73\xeb\xeb\xce\x72\x5e\x28\x03\x72\xa2\x01\x50\
-\x6f\xe2\x9b\x92\x72\xe2\x2f\x14\xc8\x45\x81\x09\x74\xe3\x8c\x8f\
-\xb3\xd7\x1f\x79\xab\x7f\x71\x7f\xdd\x38\xe3\x13\x0a\x8c\xf3\x69\
-\x6f\x60\x90\x4c\xfd\x87\xeb\x22\x99\x90\xf5\x0d\xc0\x82\xe5\xb5\
-\x17\x5b\xe9\x43\xbe\x73\x00\xf9\x6c\xf1\x84\x5a\x4d\x1d\x30\xc5\
-\x77\x0c\xc0\xa9\xc9\xfd\x27\xa9\x76\x5c\xb5\xf3\x3a\x46\xfa\xe8\
-\x82\xc6\x9a\x8b\x9c\x17\x3a\x43\xd9\xdd\x00\x58\x19\x19\xfb\xff\
-\x29\x47\x0f\x2c\x02\x72\xc1\xb9\x67\xcd\xd0\xd5\xa3\xae\xf2\x1d\
-\x03\x88\xc4\x35\x63\xe6\x68\xda\xc0\x69\xae\xcb\x18\x19\x7b\x8b\
-\x6c\x76\xcf\x5d\x59\xdd\x00\xcc\x6f\xac\xfd\x88\xa4\xac\xef\xa2\
-\x80\x5c\x55\x51\x58\xa1\x8f\x4e\xfd\x70\x24\x7b\xa5\x81\x6c\x60\
-\x64\xf4\x57\xd3\xae\x57\xdf\x22\xc7\xdf\xf1\xb1\xe6\x9d\x55\xcd\
-\xd5\x59\x7d\x4c\x70\xd6\x36\x00\x75\xf5\x75\xe5\xc6\xd8\x7f\xf5\
-\x9d\x03\xc8\x57\x46\x46\x37\x4c\xfd\xa8\xfa\x14\xe6\xf4\x07\xcd\
-\x80\x53\x56\x51\x58\xa1\xeb\xa7\x5e\xef\xbc\xf1\xb5\x61\xf0\x1f\
-\x57\xdf\x7d\x75\x99\xd3\x22\x67\x20\x6b\x1b\x80\xae\x82\xde\xbf\
-\x97\x34\xcc\x77\x0e\x20\x5f\xbd\x67\xd4\x95\x9a\x71\xd6\x74\xdf\
-\x31\x00\x2f\xa6\x0f\x9c\xaa\x77\x9f\xfd\x6e\xb7\x45\x8c\x1d\x5e\
-\xd8\x51\xfa\x25\xb7\x45\x4e\x5f\x56\x36\x00\x73\x97\x2d\x1a\x61\
-\x83\xf0\xf3\xbe\x73\x00\xf9\x6a\x58\xd9\x30\x5d\x3b\x6e\xb1\xef\
-\x18\x80\x57\xef\x9b\x70\x6d\x14\xdf\xba\xf8\xd2\x9c\x65\x8b\x86\
-\xba\x2e\x72\x3a\xb2\xb2\x01\x48\x24\xd2\x5f\x91\x35\xc5\xbe\x73\
-\x00\xf9\xc8\x18\xa3\x8f\x4c\xbd\x4e\xc9\x04\xfb\xfd\x11\x6f\xc9\
-\x44\x52\x37\x4c\xbb\xde\xf5\xd6\xc0\xd2\xc2\x20\xfc\x7b\x97\x05\
-\x4e\x57\xd6\x35\x00\xf3\x96\x2d\x1a\x25\x6b\x3e\xe6\x3b\x07\x90\
-\xaf\x66\x8f\x7c\xaf\xc6\xf5\x1b\xeb\x3b\x06\x90\x15\xce\xe9\x3b\
-\x46\x57\x9e\x7d\x85\xd3\x1a\x56\xba\xa9\xa6\xb1\x66\xb4\xd3\x22\
-\xa7\x21\xeb\x1a\x80\x20\x08\xff\x8f\xf8\xd8\x0f\xe0\xc4\x80\x92\
-\xfe\xaa\x19\xbb\xd0\x77\x0c\x20\xab\x2c\x1a\x5f\xa3\x81\x25\x03\
-\x5d\x96\x28\x4c\x59\xf3\x65\x97\x05\x4e\x47\x56\x35\x00\x0b\x9b\
-\x17\x8e\x93\xf4\x11\xdf\x39\x80\x7c\xf5\xe1\x29\xd7\xa9\xa8\xa0\
-\xc8\x77\x0c\x20\xab\x14\x25\x8a\x74\xdd\x64\xb7\x3b\xf6\x02\x63\
-\x3f\x36\x7f\xd9\xe2\x73\x9c\x16\x39\x45\x59\xd5\x00\x84\xd6\x2c\
-\x95\xc4\x83\x49\xc0\x81\x77\x0e\xbd\x48\xd3\x06\x4c\xf5\x1d\x03\
-\xc8\x4a\xd3\x06\x4e\xd3\x85\x43\x66\x39\x1b\xdf\x4a\x49\x05\xe9\
-\x7f\x70\x56\xe0\x34\x64\x4d\x03\xb0\xb0\x79\xe1\x38\x59\xf3\x7e\
-\xdf\x39\x80\x7c\x54\x98\x28\xd4\xe2\xf1\xb5\xbe\x63\x00\x59\x6d\
-\xc9\x84\x6b\x55\x94\x70\xb7\x42\x66\xa4\xeb\xaa\x56\x54\x8d\x71\
-\x56\xe0\x14\x65\x4d\x03\x60\xc3\xe0\xf3\x92\x12\xbe\x73\x00\xf9\
-\x68\xfe\x98\x79\xaa\x2c\xee\xef\x3b\x06\x90\xd5\x2a\x8b\x2b\x35\
-\x67\xb4\xd3\x63\xb1\x0b\x6c\x18\xdc\xec\xb2\xc0\xa9\xc8\x8a\x06\
-\x60\x4e\x7d\x5d\x7f\xcb\xb3\x7f\xc0\x89\xca\xe2\x4a\x5d\x35\xea\
-\xbd\xbe\x63\x00\x39\x61\xee\xe8\x6b\x34\xa0\xc4\x61\xb3\x6c\xcd\
-\xc7\x6b\x97\xd7\x66\xc5\x67\x37\xb3\xa2\x01\x28\x48\xa6\x3e\x2d\
-\x29\x6b\x8f\x4b\x04\x72\xd9\xfb\x26\x5c\xab\xc2\x04\x1b\x6b\x80\
-\x93\x91\x4c\x24\xb5\xc8\xed\xe3\xb2\xd2\x9e\x20\xbc\xc9\x65\x81\
-\x93\xe5\xbd\x01\x98\xbb\x7a\x6e\x91\x31\xf6\xaf\x7d\xe7\x00\xf2\
-\xd1\xb8\x7e\x63\x35\x73\xc8\x4c\xdf\x31\x80\x9c\x72\xd1\x90\x0b\
-\x75\x4e\x5f\x77\x8f\xea\x8d\x35\x9f\xbd\xe2\x8e\xeb\xbd\x1f\x76\
-\xe7\xbd\x01\x28\xe8\x29\xfc\xb0\xac\x71\x7e\x16\x23\x10\x47\x35\
-\xe3\xaa\xf9\xd2\x1f\x70\x8a\x8c\x8c\xaa\xc7\x39\x3d\x2f\x63\x70\
-\x79\xe5\x11\xef\x5f\x0a\xf4\xde\x00\x58\x6b\xfe\xd6\x77\x06\x20\
-\x1f\x8d\xaf\x1c\xaf\x49\xfd\x27\xfa\x8e\x01\xe4\xa4\xa9\x03\xa6\
-\x68\x42\xff\x09\xee\x0a\x64\xc1\xcb\x80\x5e\x1b\x80\xf9\x4d\xd5\
-\x97\x48\x9a\xe6\x33\x03\x90\xaf\x6a\xdd\xde\xc1\x00\x79\xaf\x76\
-\x6c\xb5\xbb\xc1\x8d\x9d\x31\xaf\xa9\xfa\x1d\xee\x0a\xbc\x3d\xbf\
-\x2b\x00\xd6\x7c\xc2\x6b\x7d\x20\x4f\x4d\x1b\x30\x55\x13\x2a\x1d\
-\xde\xbd\x00\x31\x30\xbe\x72\x9c\x26\xf7\x9f\xe4\x6c\x7c\xe3\x79\
-\x0e\xf4\xd6\x00\xcc\xae\xaf\xeb\x6b\xa4\x3a\x5f\xf5\x81\x7c\xb6\
-\x70\x6c\x95\xef\x08\x40\x5e\xa8\x76\xf8\xed\x0c\x23\xbd\x7f\xee\
-\xea\xb9\x7d\x9c\x15\x78\x1b\xde\x1a\x80\x92\xc2\x9e\x0f\x89\xad\
-\x7f\x40\xc6\x4d\xa8\x9c\xa0\x73\xfa\x65\xcd\x61\x63\x40\x4e\x1b\
-\x57\x39\xd6\xe5\xd7\x33\xcb\x82\xee\x22\x6f\x27\xe0\x7a\x6b\x00\
-\xac\x35\x1f\xf7\x55\x1b\xc8\x67\x57\x8f\x9e\xed\x3b\x02\x90\x57\
-\xae\x1a\xe5\xf4\x74\x40\x6f\x8f\x01\xbc\x34\x00\xf3\x1b\x6b\x66\
-\x4a\x3a\xdf\x47\x6d\x20\x9f\x0d\x29\x1b\xac\x73\x07\xce\xf0\x1d\
-\x03\xc8\x2b\x17\x0c\x3a\x4f\x83\xcb\x06\x39\x19\xdb\x48\xb3\xe6\
-\x35\xd6\x9c\xe7\x64\xf0\xb7\xe1\xa5\x01\x30\xd2\x07\x7d\xd4\x05\
-\xf2\xdd\x55\xa3\x66\xcb\x18\xf6\xfd\x03\x99\x64\x8c\xd1\x55\x23\
-\xdd\x1d\xa7\x1d\x48\x5e\xce\x04\x88\xbe\x01\xb0\x32\x92\x16\x47\
-\x5e\x17\xc8\x73\x65\xc9\x32\x5d\x32\xf4\x62\xdf\x31\x80\xbc\x74\
-\xc9\xb0\x4b\x54\x96\x74\xf6\xda\xda\xfb\x5f\x9b\x1b\x23\x15\x79\
-\x03\x30\xbf\xb9\xfa\x62\x49\xa3\xa2\xae\x0b\xe4\xbb\xcb\x86\x5d\
-\xa2\x64\x22\xe9\x3b\x06\x90\x97\x0a\x13\x85\xba\x64\xd8\x3b\x5d\
-\x0d\x3f\x72\x41\x53\xcd\x85\xae\x06\x7f\x33\x91\x37\x00\xc6\x9a\
-\x25\x51\xd7\x04\xe2\xe0\xb2\x11\x97\xfa\x8e\x00\xe4\xb5\x77\x8f\
-\xb8\xdc\xd9\xd1\xda\x46\x8a\x7c\x6e\x8c\xb4\x01\x58\xba\x74\x69\
-\x20\x6b\xae\x8d\xb2\x26\x10\x07\xe3\x2b\xc7\x6b\x68\xd9\x50\xdf\
-\x31\x80\xbc\x36\xa4\x6c\x88\xc6\xf6\x3b\xc7\xc9\xd8\x56\x5a\x12\
-\xf5\x63\x80\x48\x1b\x80\xc7\xcf\x7f\xea\x32\x19\x3b\x3c\xca\x9a\
-\x40\x1c\x5c\x3e\xe2\x32\xdf\x11\x80\x58\x70\x78\xad\x9d\xfd\xda\
-\x23\xf2\xc8\x44\xda\x00\x98\x74\xa2\x26\xca\x7a\x40\x1c\x94\x16\
-\x94\x68\xe6\xa0\x0b\x7c\xc7\x00\x62\xe1\xc2\xc1\x17\xaa\xb4\xa0\
-\xd4\xc9\xd8\x46\x8a\x74\x8e\x8c\xb6\x01\x08\xc2\xb9\x51\xd6\x03\
-\xe2\xe0\xc2\x21\xb3\x54\x98\x28\xf4\x1d\x03\x88\x85\x64\x22\xa9\
-\x0b\x06\x3b\x3a\xc6\xc6\x9a\x48\xe7\xc8\xc8\x1a\x80\x9a\xc6\x9a\
-\xd1\xb2\xc6\xdd\x57\x15\x80\x98\x9a\x35\x64\x96\xef\x08\x40\xac\
-\xcc\x1a\x32\xd3\xd5\xd0\xd3\xaa\x5a\xaa\x46\xba\x1a\xfc\x2f\x45\
-\xd6\x00\xa4\x24\xee\xfe\x81\x0c\xab\x28\x2c\xd7\x84\xca\xf1\xbe\
-\x63\x00\xb1\x32\xb9\xff\x24\x55\x14\x96\xbb\x19\x3c\x1d\x5c\xed\
-\x66\xe0\xff\x29\xb2\x06\xc0\x58\x73\x4d\x54\xb5\x80\xb8\x98\x35\
-\x78\xa6\x12\x26\xe1\x3b\x06\x10\x2b\x09\x93\xd0\xf9\x83\x1c\x9d\
-\xde\x1b\xe1\x63\x80\x48\x1a\x80\xba\xfa\xba\x42\x19\x7b\x65\x14\
-\xb5\x80\x38\x61\xf9\x1f\xf0\xc3\xd5\xb5\x67\xa5\xd9\x33\x6f\xbd\
-\x31\x92\x13\xbd\x22\x69\x00\xba\x0a\x7a\x2f\x93\x54\x11\x45\x2d\
-\x20\x2e\x2a\x0a\x2b\x34\xbe\xdf\x38\xdf\x31\x80\x58\x9a\x54\x39\
-\x51\xe5\x49\x27\x8f\x01\xfa\x0c\x1e\xb2\x3f\x92\xed\x80\x91\x34\
-\x00\x61\x10\xbe\x3b\x8a\x3a\x40\x9c\x4c\x1f\x30\x4d\x81\xf1\xf6\
-\x45\x6f\x20\xd6\x02\x13\x68\xea\x80\x29\x6e\xc6\x0e\x83\xcb\x9d\
-\x0c\xfc\x97\x75\xa2\x28\x62\xac\xe1\x8c\x52\x20\xc3\xa6\x0d\x9c\
-\xea\x3b\x02\x10\x6b\xd3\xce\x72\x73\x0d\x1a\x63\x23\x99\x33\x9d\
-\x37\x00\x75\xf5\x75\x09\x49\x17\xb9\xae\x03\xc4\x49\x60\x02\x4d\
-\x1d\xe8\xe6\xee\x03\xc0\xc9\x99\x36\x60\x9a\x93\xcf\x6f\x5b\x6b\
-\x2e\x79\x6d\xee\x74\xca\x79\x03\xd0\x95\x48\x9f\x2b\x9e\xff\x03\
-\x19\x35\xba\xef\x28\x97\x9f\x26\x05\x70\x12\x2a\x0a\xcb\x35\xb2\
-\xc2\xc9\xc7\x6d\xfb\x74\x17\x75\x3b\x5f\xe2\x73\xde\x00\x84\x41\
-\xc8\xf2\x3f\x90\x61\xd3\x06\x4c\xf3\x1d\x01\x80\xa4\x19\x8e\x1e\
-\xc5\xa5\xc3\xc0\xf9\xdc\xe9\xbc\x01\x30\x12\x0d\x00\x90\x61\x93\
-\xfb\x73\xa8\x26\x90\x0d\x26\x0d\x70\x73\x2d\x46\xf1\x1e\x80\xf3\
-\x06\xc0\x4a\xef\x70\x5d\x03\x88\x93\x44\x90\xd0\xe8\x3e\x4e\x96\
-\x1d\x01\x9c\xa2\x73\xfa\x8c\x51\x22\x70\xf0\xb8\xde\x1a\xe7\x5b\
-\x01\x9d\x36\x00\xb3\xeb\xeb\xfa\x1a\x89\x5f\x2a\x20\x83\x46\xf7\
-\x19\xa5\x64\x22\x92\x73\x42\x00\xbc\x8d\x64\x22\xa9\xb3\x2b\x46\
-\xb8\x18\x7a\xcc\xdc\xd5\x73\xfb\xb8\x18\xf8\x8f\x9c\x36\x00\x45\
-\x85\x3d\x33\x24\x65\xfe\x15\x49\x20\xc6\xc6\xf5\x1d\xeb\x3b\x02\
-\x80\xd7\x19\xdf\xcf\xc9\xf7\x38\x4c\xa2\xab\xd8\xe9\x8b\x80\x4e\
-\x1b\x80\x40\x9a\xee\x72\x7c\x20\x8e\xc6\x56\xd2\x00\x00\xd9\x64\
-\x5c\x3f\x37\xd7\xa4\x09\xc2\x19\x4e\x06\x7e\x8d\xd3\x06\xc0\xd2\
-\x00\x00\x19\x37\x96\x15\x00\x20\xab\x8c\x75\xd4\x00\xb8\x9e\x43\
-\xdd\xbe\x04\x68\x8d\xd3\xee\x05\x88\x9b\x7e\x45\xfd\xd4\xb7\xc8\
-\xe9\x63\x41\x00\xa7\xa8\x5f\x51\x5f\xf5\x29\xcc\xfc\x75\x69\xc2\
-\x20\x47\x1b\x00\x2b\x23\x89\xcd\xca\x40\x06\x8d\x28\x1f\xee\x3b\
-\x02\x80\x37\x30\xa2\x22\xf3\xd7\xa6\x35\x76\xc6\x6b\x73\xa9\x13\
-\xce\x1a\x80\xb9\xcb\x17\x0d\x97\xc4\xad\x0a\x90\x41\xc3\x1d\xfc\
-\xc8\x00\x38\x73\x2e\x1a\x00\x49\xfd\xe6\x2c\x5f\x34\xc4\xc5\xc0\
-\x92\xc3\x06\x20\x48\xa4\xc7\xb8\x1a\x1b\x88\x2b\x47\x3f\x32\x00\
-\xce\x90\xab\xd5\xb9\xa4\xb1\xa3\x9d\x0c\x2c\x87\x0d\x80\x91\x68\
-\x00\x80\x0c\x1b\x51\xee\x64\xbf\x31\x80\x33\xe4\xea\xda\x34\x41\
-\xe8\x6c\x2e\x75\xd7\x00\x84\xc1\x68\x57\x63\x03\x71\x14\x98\x40\
-\x43\xcb\x9c\xad\x06\x02\x38\x03\x43\xcb\x86\x3a\xf9\x32\x60\x28\
-\x8d\xce\xf8\xa0\xaf\x71\xd6\x00\x58\x87\xa1\x81\x38\xea\x57\xd4\
-\x4f\x05\x41\x81\xef\x18\x00\xde\x40\x32\x91\x54\xdf\xc2\xbe\x19\
-\x1f\xd7\x84\x41\x0e\xae\x00\xd0\x00\x00\x19\x35\xb0\x74\xa0\xef\
-\x08\x00\xde\xc2\xc0\xd2\x01\x99\x1f\x34\x17\xdf\x01\x08\x8d\xe5\
-\x1d\x00\x20\x83\x06\x16\x3b\xf8\x71\x01\x90\x31\x67\x15\x67\xbe\
-\x49\x77\xf9\x3e\x9d\x9b\x06\xc0\xca\x18\x69\x98\x93\xb1\x81\x98\
-\x1a\x58\xc2\x0a\x00\x90\xcd\x06\x94\x64\xbe\x49\xb7\x92\xb3\x37\
-\x7f\x9d\x34\x00\xb3\x1b\xea\xfa\x48\x2a\x74\x31\x36\x10\x57\x03\
-\x1d\xfc\xb8\x00\xc8\x1c\x47\x4d\x7a\x51\x5d\x7d\x5d\xb9\x8b\x81\
-\x9d\x34\x00\xc9\x64\x8a\x5b\x15\x20\xc3\xfa\x17\xf7\xf7\x1d\x01\
-\xc0\x5b\xe8\x5f\xe2\xe6\x1a\x4d\x39\x9a\x53\x9d\x34\x00\x09\x89\
-\x5b\x15\x20\xc3\xca\x0b\x9d\xdc\x04\x00\xc8\x90\xf2\xa4\x9b\x6b\
-\x34\xe5\x68\x4e\x75\xf3\x0e\x80\xb1\xac\x00\x00\x19\x56\x9e\x2c\
-\xf3\x1d\x01\xc0\x5b\xa8\x70\x75\x8d\x3a\x9a\x53\x5d\xed\x02\xa0\
-\x01\x00\x32\xcc\xd5\xdd\x05\x80\xcc\x28\x4f\x56\x38\x19\xd7\x84\
-\x41\xee\x34\x00\x86\x47\x00\x40\x46\x15\x27\x8a\x39\x04\x08\xc8\
-\x72\xc9\x44\x52\x85\x89\xcc\xbf\xff\xee\x6a\x4e\x75\xd2\x00\x58\
-\x6b\xf8\x0a\x20\x90\x41\x65\x85\x2c\xff\x03\xb9\xa0\xcc\xc1\x63\
-\x80\xd0\xd8\xcc\x1f\x31\x28\x77\x8f\x00\x8a\x1c\x8d\x0b\xc4\x52\
-\x59\x41\xa9\xef\x08\x00\x4e\x42\x59\x41\xe6\x1b\x00\xe3\x68\x5b\
-\xbd\xab\x47\x00\x9c\x01\x00\x64\x10\xcb\xff\x40\x6e\x48\xb8\xb8\
-\x56\x8d\x75\x72\x53\xed\xe6\x11\x00\x2b\x00\x40\x46\x39\xf9\x51\
-\x01\x90\x71\xc9\x44\xc2\xc5\xb0\xb9\xd3\x00\xb0\x02\x00\x64\x56\
-\xd2\xd0\x00\x00\xb9\xa0\x40\x4e\xae\xd5\xdc\x79\x04\x10\xd2\x00\
-\x00\x19\xc5\x0a\x00\x90\x1b\x92\x09\x07\xd7\x6a\x18\xb0\x02\x00\
-\xc4\x55\x41\xe0\x64\x59\x11\x40\x86\x39\x69\xd6\x83\x30\x77\x56\
-\x00\xac\xdc\xac\x81\x00\x71\x15\x18\x67\x5f\xee\x06\x90\x41\x09\
-\xe3\xa0\x59\xb7\x6e\x9e\x01\x3a\xf9\x55\x09\xa4\x1e\x17\xe3\x02\
-\x71\x95\x0e\xd3\xbe\x23\x00\x38\x09\xa9\x30\xe5\x62\x58\x27\x73\
-\xaa\xab\x15\x00\x1a\x00\x20\x83\xd2\xb6\xd7\x77\x04\x00\x27\xc1\
-\x45\xb3\xee\x6a\x4e\x75\xf5\x31\x20\x1a\x00\x20\x83\x52\x69\x1a\
-\x00\x20\x17\xa4\xdc\x34\xeb\xdd\x2e\x06\x75\xd3\x00\x58\xe3\x24\
-\x2c\x10\x57\xbd\xa2\x01\x00\x72\x41\x3a\x74\x70\xad\x3a\x9a\x53\
-\x59\x01\x00\x72\x40\xaf\x8b\x1f\x15\x00\x19\x97\x72\x70\xad\xba\
-\x7a\xaf\x8e\x77\x00\x80\x1c\xd0\xd3\xeb\xe4\xc5\x22\x00\x19\x96\
-\x4a\x67\x7e\xfa\x0b\x83\x30\x77\x56\x00\x82\x30\xe8\x74\x31\x2e\
-\x10\x57\x1d\xbd\xed\xbe\x23\x00\x38\x09\x6d\xa9\xcc\x5f\xab\xc6\
-\x9a\xae\x8c\x0f\x2a\x57\x27\x01\x1a\x7b\xd8\xc5\xb8\x40\x5c\xb5\
-\xa5\xda\x64\x65\x7d\xc7\x00\xf0\x16\xac\xac\x3a\x52\x1d\x0e\xc6\
-\xd5\xa1\x8c\x0f\x2a\x77\xe7\x00\x38\x09\x0b\xc4\x55\x6f\x98\x56\
-\x57\xda\xc9\x4d\x00\x80\x0c\xe9\xec\xed\x50\xda\x66\x7e\x1b\xa0\
-\xab\x39\xd5\xd5\x2e\x80\x56\x27\xe3\x02\x31\xd6\xde\xc3\x63\x00\
-\x20\x9b\xb5\xb9\xba\x46\x1d\xcd\xa9\xae\x5e\x02\x64\x05\x00\xc8\
-\x30\x67\x3f\x2e\x00\x32\xc2\xd5\x35\x1a\xe6\xd4\x0a\x40\x32\xc5\
-\x0a\x00\x90\x61\xc7\x7b\x8e\xfb\x8e\x00\xe0\x2d\x9c\x48\x9d\x70\
-\x32\xae\xed\x2d\xc8\x9d\x15\x80\x74\x22\x4d\x03\x00\x64\xd8\xa1\
-\x4e\x16\xd6\x80\x6c\xd6\xda\xe1\x66\xea\x2b\x93\x9c\xbc\x58\xef\
-\xa4\x01\x58\x33\x6f\x4d\xb7\x24\x37\xad\x10\x10\x53\xad\x34\x00\
-\x40\x56\x6b\xed\xca\xfc\x35\x6a\xa4\x63\x0d\x4b\x1a\x72\xe7\x20\
-\xa0\xd7\xbc\xe8\x70\x6c\x20\x76\x5c\xfc\xb8\x00\xc8\x9c\xd6\xce\
-\xcc\xaf\x00\x58\x69\x57\xc6\x07\x7d\x8d\xcb\x06\x60\x97\xc3\xb1\
-\x81\xd8\x71\xf1\xe3\x02\x20\x73\x68\x00\xfe\x6c\x97\xc3\xb1\x81\
-\xd8\xa1\x01\x00\xb2\x9b\x8b\xf7\x74\x02\x69\x67\xc6\x07\xfd\xf3\
-\xd8\x6e\xb8\xec\x5a\x80\x38\x6a\x4f\xb5\xab\xdd\xc1\x29\x63\x00\
-\xce\xdc\x89\x9e\x36\x75\xf4\x66\xfe\x14\xfc\xdc\x5c\x01\xb0\xc6\
-\x59\xd7\x02\xc4\xd5\xee\xb6\xdd\xbe\x23\x00\x78\x03\xae\xae\x4d\
-\x1b\x84\xb9\xb7\x02\x10\x58\xb3\xcb\xd5\xd8\x40\x5c\xed\x3e\x4e\
-\x03\x00\x64\xa3\xdd\x27\xdc\x5c\x9b\x89\x5c\x5c\x01\xe8\x4c\x27\
-\x76\xb8\x1a\x1b\x88\xab\xdd\x6d\x7b\x7c\x47\x00\xf0\x06\x76\x9f\
-\xd8\xeb\x62\x58\xab\x5c\x7c\x07\xe0\x9e\x25\x0d\xc7\x24\xbd\xec\
-\x6a\x7c\x20\x8e\x78\x04\x00\x64\x27\x47\xcd\xf9\xae\x15\xd5\x2b\
-\x9c\x9d\xa9\xe3\x72\x17\x80\x8c\xb1\x1b\x5d\x8e\x0f\xc4\xcd\xde\
-\xb6\x7d\xb2\x96\xcf\x02\x03\xd9\x24\xb4\xa1\xf6\xb5\x3b\x58\x01\
-\xb0\x66\x53\xe6\x07\xfd\x33\xa7\x0d\x80\xb5\x86\x06\x00\xc8\xa0\
-\xee\x74\xb7\xf6\xb6\xef\xf3\x1d\x03\xc0\xeb\xec\x6d\xdf\xab\x9e\
-\xb4\x83\xc3\xfa\x1c\xdf\x44\xbb\x5d\x01\x90\x9c\x76\x2f\x40\x1c\
-\x3d\x7f\x94\xd7\x6b\x80\x6c\xb2\xfd\x88\x9b\x6b\xd2\xf5\x1c\xea\
-\xb4\x01\x08\x1d\x2f\x5f\x00\x71\xb4\xc3\xd1\x8f\x0d\x80\xd3\xb3\
-\xe3\xe8\xf3\x6e\x06\x4e\x27\x72\x77\x05\xa0\xbd\xf2\xc8\x56\x49\
-\xdd\x2e\x6b\x00\x71\xf3\xfc\x31\x47\x3f\x36\x00\x4e\xcb\x76\x37\
-\xab\x72\xdd\x27\x06\x1c\x72\x7a\xb1\x3b\x6d\x00\xee\xbf\xf2\xfe\
-\x5e\x49\x9b\x5d\xd6\x00\xe2\xe6\x40\xc7\x41\x1d\xed\x3e\xe6\x3b\
-\x06\x00\x49\x47\xbb\x8f\xba\xfa\x54\xf7\xc6\xd7\xe6\x50\x67\x9c\
-\x36\x00\x92\x64\xa4\x87\x5d\xd7\x00\xe2\x66\x07\xef\x01\x00\x59\
-\xe1\xf9\x23\x6e\x6e\xd2\xad\x35\xeb\x9c\x0c\xfc\x3a\xce\x1b\x00\
-\x6b\xec\x43\xae\x6b\x00\x71\xb3\xe5\xd0\xb3\xbe\x23\x00\x90\xb4\
-\xf9\xd0\x16\x27\xe3\x06\x11\xcc\x9d\xce\x1b\x00\x25\xd2\xce\xbb\
-\x18\x20\x6e\x36\xb6\xf2\x7e\x2d\x90\x0d\x9e\x71\xd4\x00\xf4\x84\
-\x81\xf3\xd5\x73\xe7\x0d\xc0\xca\xaa\x95\x7b\x24\xbd\xe4\xba\x0e\
-\x10\x27\x47\xba\x8e\x68\x1f\xe7\x01\x00\x5e\xed\x6e\xdb\xad\x23\
-\x5d\x47\x32\x3e\xae\x91\x76\xdc\xbd\x78\xb9\xf3\x0b\xdc\xfd\x0a\
-\x80\x24\x2b\xf1\x18\x00\xc8\xb0\x8d\xad\xbc\x5f\x0b\xf8\xb4\xc9\
-\xd1\x35\x68\xad\x89\x64\xce\x8c\xa4\x01\x30\x11\xfd\x61\x80\x38\
-\x79\xe6\xe0\x33\xbe\x23\x00\xb1\xb6\xd9\xd1\x35\x18\xd5\xbb\x73\
-\x51\xad\x00\xdc\x17\x45\x1d\x20\x4e\x9e\x3b\xba\x4d\x1d\xbd\x1d\
-\xbe\x63\x00\xb1\xd4\x9e\xea\xd0\x8e\x63\x6e\x76\xe3\x24\x82\x30\
-\x92\x39\x33\x92\x06\x60\xd5\xa2\xc6\x67\x25\xbd\x10\x45\x2d\x20\
-\x2e\xd2\x61\x5a\xeb\x0f\x6c\xf0\x1d\x03\x88\xa5\xa7\x0f\x3c\xad\
-\xde\x30\xed\x62\xe8\x9d\x2b\xaa\x57\x44\x72\xda\x57\x24\x0d\x80\
-\x24\xc9\xd8\xb5\x91\xd5\x02\x62\xe2\xf1\xfd\x7f\xf0\x1d\x01\x88\
-\xa5\xc7\xf7\x3f\xe1\x6a\xe8\x55\xae\x06\xfe\x4b\x91\x35\x00\x26\
-\x0c\xee\x8a\xaa\x16\x10\x17\x5b\x0f\x3f\xab\xf6\x54\xbb\xef\x18\
-\x40\xac\xb4\xa5\xda\xf4\xdc\xe1\x6d\x6e\x06\x37\x76\x8d\x9b\x81\
-\xff\xa7\xc8\x1a\x80\xee\xb2\xf6\x7b\xc4\x77\x01\x80\x8c\xea\x0d\
-\xd3\x7a\xfa\xc0\x7a\xdf\x31\x80\x58\x79\xf2\x95\xa7\x94\xb6\x4e\
-\x96\xff\xbb\x7b\x4a\x3a\x1f\x70\x31\xf0\x1b\x89\xac\x01\x58\x3b\
-\x67\x6d\xbb\xd8\x0e\x08\x64\x9c\xc3\xa5\x48\x00\x6f\xe0\x09\x77\
-\x8f\xde\x1e\x78\x6d\xae\x8c\x44\x74\xef\x00\x48\x92\x35\x91\x3d\
-\xdb\x00\xe2\xe2\xd9\xc3\x5b\x75\xa8\xf3\xb0\xef\x18\x40\x2c\xb4\
-\x76\xb6\xea\xb9\x23\x8e\x96\xff\xa5\xd5\xae\x06\x7e\x23\x91\x36\
-\x00\x89\x20\x6c\x90\x64\xa3\xac\x09\xe4\x3b\x6b\xad\xd6\xed\xe5\
-\xc4\x6d\x20\x0a\xbf\xdf\xb3\x4e\xd6\x3a\x99\xc6\xac\x29\x48\x37\
-\xba\x18\xf8\xcd\x44\xda\x00\x34\xd7\x34\xbf\x2c\x63\x1f\x8b\xb2\
-\x26\x10\x07\xeb\xf6\x3c\xac\xd0\x86\xbe\x63\x00\x79\x2d\x6d\xd3\
-\x7a\x78\xcf\xa3\xae\x86\x7f\xa8\xa5\xaa\x25\xd2\x63\xf3\xa3\x7d\
-\x04\x20\xc9\x48\xf5\x51\xd7\x04\xf2\xdd\x91\xae\x23\xda\xdc\xca\
-\xc9\x80\x80\x4b\x9b\x5a\x37\xeb\x48\x77\xe6\xcf\xfe\x97\x24\xeb\
-\x61\x6e\x8c\xbc\x01\xe8\x4d\x27\x1a\x24\x71\xab\x02\x64\xd8\x83\
-\x7b\x7e\xef\x3b\x02\x90\xd7\x7e\xbf\xdb\xd9\xa3\xb6\x30\x11\x84\
-\xcb\x5c\x0d\xfe\x66\x22\x6f\x00\xd6\x2c\x5e\xbe\x5b\x92\xf3\xcf\
-\x1c\x02\x71\xb3\xf1\xe0\x26\x1d\xe8\x38\xe8\x3b\x06\x90\x97\x5a\
-\x3b\x5b\x5d\xae\xb2\x3d\xb8\xa2\x7a\xc5\x5e\x57\x83\xbf\x99\xc8\
-\x1b\x00\xc9\xcf\x52\x07\x90\xef\x42\x1b\xea\xbe\x97\xf9\xec\x06\
-\xe0\xc2\xda\x17\xef\x71\xb5\xf7\xdf\xdb\x9c\xe8\xa5\x01\x08\x0a\
-\xd2\xbf\x12\x87\x02\x01\x19\xf7\xfb\xdd\x0f\x71\x32\x20\x90\x61\
-\xed\xa9\x0e\x3d\xb4\xd7\xd9\xc2\x75\x4f\x98\x4a\xfe\xc6\xd5\xe0\
-\x6f\xc5\x4b\x03\xd0\x52\xd5\xd2\x2a\x6b\x5a\x7c\xd4\x06\xf2\x59\
-\x77\xba\x5b\x0f\xec\x7e\xd0\x77\x0c\x20\xaf\xfc\xee\xe5\xfb\xd5\
-\xdd\xeb\xe8\x9e\xd5\xd8\xe5\x6b\x96\x34\x78\x79\x76\xe7\xa5\x01\
-\x90\x24\x63\xec\x6d\xbe\x6a\x03\xf9\xec\x9e\x17\xef\x53\x2a\xdd\
-\xeb\x3b\x06\x90\x17\x7a\xc3\x5e\xdd\xff\xf2\xfd\xee\x0a\x58\xf3\
-\x43\x77\x83\xbf\x35\x6f\x0d\x40\x4b\x4d\xd3\x6f\x8d\xe4\xe6\x63\
-\xca\x40\x8c\x1d\xef\x39\xae\x47\xf6\x39\xdb\xab\x0c\xc4\xca\xba\
-\x3d\x0f\xeb\x68\xf7\x31\x57\xc3\xef\x9c\xb5\xe1\xbc\xdf\xb9\x1a\
-\xfc\xed\x78\x6b\x00\x64\x64\xad\xf4\x63\x6f\xf5\x81\x3c\xb6\xf2\
-\x85\x55\x43\x52\x7a\x65\x00\x00\x13\xd2\x49\x44\x41\x54\xea\x0d\
-\x59\x05\x00\xce\x44\x6f\xd8\xab\x55\x3b\x9d\x9e\xce\x7b\xdb\xd2\
-\xa5\x4b\xbd\x6d\x8b\xf7\xd7\x00\x48\x4a\x85\xc1\xed\x92\xf8\x95\
-\x02\x32\xec\x70\xd7\x61\xad\xdb\xc3\xf1\xc0\xc0\x99\x78\xe0\xe5\
-\x07\x75\xa4\xcb\xcd\xc1\x3f\x92\x7a\x83\x20\xfc\x89\xab\xc1\x4f\
-\x86\xd7\x06\xe0\xee\xc5\xcb\xf7\xf1\x32\x20\xe0\xc6\xca\x17\x56\
-\x2b\x95\x4e\xf9\x8e\x01\xe4\xa4\x54\xba\x57\x77\xed\x5a\xeb\xb2\
-\x44\xb3\x8f\xbd\xff\xaf\xe7\xb5\x01\x90\x24\x23\x7d\xc3\x77\x06\
-\x20\x1f\x1d\xed\x3e\xa6\xfb\xd9\x11\x00\x9c\x96\xfb\x76\xdf\xe7\
-\xec\xd8\x5f\x49\x92\x35\xff\xe9\x6e\xf0\x93\xe3\xbd\x01\x68\x59\
-\xd4\xb8\x4e\xd2\x23\xbe\x73\x00\xf9\x68\xf5\xce\x35\xea\x4c\x77\
-\xfa\x8e\x01\xe4\x94\x8e\xde\x0e\xdd\xb5\xf3\x6e\x97\x25\xd6\xad\
-\x5c\xd4\xe8\x7d\xde\xf3\xde\x00\x48\x92\x8c\x65\x15\x00\x70\xe0\
-\x44\xcf\x09\xad\xdc\x11\xe9\x27\xc6\x81\x9c\xd7\xb2\x63\x95\x4e\
-\xf4\xb4\x39\x1b\xdf\x48\xde\xef\xfe\xa5\x2c\x69\x00\x4a\x7a\x0a\
-\x1b\xd9\x12\x08\xb8\x71\xcf\x4b\xf7\x6a\x7f\xfb\x2b\xbe\x63\x00\
-\x39\xe1\x40\xc7\x01\xdd\xf7\xb2\xd3\x9d\x79\xdb\x67\x6e\x38\x6f\
-\x85\xcb\x02\x27\x2b\x2b\x1a\x80\x86\x25\x0d\xe9\x50\xba\xc5\x77\
-\x0e\x20\x1f\xa5\xc3\xb4\x7e\xb3\x3d\xf2\x0f\x8d\x01\x39\xe9\x57\
-\x5b\xeb\x95\x0e\xdd\x9c\xf9\x2f\x49\x56\xfa\xa6\xcf\xad\x7f\xaf\
-\x97\x15\x0d\x80\x24\xa5\x4a\x3b\x7e\x24\xa9\xd5\x77\x0e\x20\x1f\
-\xad\x3f\xb0\x41\xcf\x1c\xda\xe2\x3b\x06\x90\xd5\xb6\x1c\x7e\x56\
-\x9b\x5a\x37\xb9\x2c\x71\x20\x28\x48\x7b\xdd\xfa\xf7\x7a\x59\xd3\
-\x00\xac\x9d\xb3\xb6\x5d\xd2\xd7\x7c\xe7\x00\xf2\xd5\x9d\x5b\x7f\
-\xcd\xe1\x40\xc0\x9b\x48\xa5\x7b\xf5\x8b\x2d\x77\x3a\xad\x61\x8c\
-\xfd\xb7\x96\xaa\x96\x0e\xa7\x45\x4e\x41\xd6\x34\x00\x92\x54\x92\
-\x4a\x7e\x5b\x92\xd7\x7d\x91\x40\xbe\xda\xd7\xbe\x5f\xab\x77\xde\
-\xe5\x3b\x06\x90\x95\x56\xee\x5c\xa9\x57\x3a\xf6\x3b\x1b\xdf\x48\
-\xfb\x94\x08\x6f\x75\x56\xe0\x34\x64\x55\x03\xd0\xb0\xa4\xa1\xd3\
-\xb2\x0a\x00\x38\xb3\x6a\xe7\x6a\xed\x6d\xa7\xc7\x06\x5e\x6f\x77\
-\xdb\x1e\xdd\xed\xf6\xd0\x1f\x59\x6b\xfe\x25\x9b\xee\xfe\xa5\x2c\
-\x6b\x00\x24\xa9\xfd\x68\xbf\xef\x4b\xda\xed\x3b\x07\x90\x8f\xd2\
-\x61\x5a\x3f\xde\xfc\x53\x85\x36\x2b\xde\x41\x02\xbc\xb3\xd6\xea\
-\x67\x5b\x7e\xae\x5e\x87\x2f\xfe\x49\x7a\x29\x5d\xdc\xe5\xed\xab\
-\x7f\x6f\x26\xeb\x1a\x80\xfb\x6f\xf8\x71\x97\x95\xfe\xd5\x77\x0e\
-\x20\x5f\xbd\x70\x6c\xa7\x7e\xe7\xf2\xf3\xa6\x40\x0e\xb9\xe7\xa5\
-\xfb\xb4\xe3\xe8\x0b\x4e\x6b\x18\x63\xff\x79\xcd\xbc\x35\xdd\x4e\
-\x8b\x9c\x86\xac\x6b\x00\x24\xa9\x34\x95\xbc\x5d\x92\xdb\xff\x22\
-\x40\x8c\x2d\xdf\xde\xe4\xf4\x79\x27\x90\x0b\xf6\xb5\xef\x57\xe3\
-\xf3\x4d\xae\xcb\x6c\xdf\xfb\xca\xe0\xac\x79\xf3\xff\xf5\xb2\xb2\
-\x01\x68\x58\xd2\xd0\x23\x63\xbf\xe8\x3b\x07\x90\xaf\xba\xd3\xdd\
-\xba\x75\xe3\xed\x4e\xf7\x3b\x03\xd9\xac\x37\x4c\xeb\xf6\xcd\x3f\
-\x52\x4f\xba\xc7\x69\x1d\x63\xcd\xe7\x9f\xbc\xe9\x07\x59\xf9\x55\
-\xae\xac\x6c\x00\x24\x69\x65\x4d\x73\xa3\x95\x7e\xeb\x3b\x07\x90\
-\xaf\x5e\x3a\xfe\x92\x9a\x77\xf0\x31\x4e\xc4\x53\xe3\xf6\x26\xed\
-\x3a\xf6\xa2\xeb\x32\xf7\xb6\x2c\x6a\x5c\xe9\xba\xc8\xe9\xca\xda\
-\x06\x40\x92\x82\x44\xfa\x73\x92\xd8\xb8\x0c\x38\xb2\x66\xd7\x5d\
-\xda\x7a\xf8\x39\xdf\x31\x80\x48\x6d\x3b\xbc\x4d\x6b\x5f\x72\x7e\
-\x7f\x99\x0e\x8d\xfd\x9c\xeb\x22\x67\x22\xab\x1b\x80\x96\x85\x2d\
-\xcf\xc8\xd8\xac\x7b\x73\x12\xc8\x17\xd6\x5a\xdd\xbe\xf9\x0e\xb5\
-\xa7\xda\x7d\x47\x01\x22\x71\xa2\xa7\x4d\xb7\x6d\xfa\x91\xac\xb5\
-\x4e\xeb\x18\xe9\xbb\xab\x6b\x9a\x9d\x1e\x2b\x78\xa6\xb2\xba\x01\
-\x90\xa4\x54\x4f\xe1\x57\x24\x1d\xf6\x9d\x03\xc8\x57\x47\xba\x8e\
-\xe8\xfb\x1b\x7e\xc0\xd6\x40\xe4\x3d\x6b\xad\x7e\xb8\xe9\x76\x1d\
-\xe9\x3e\xe2\xba\xd4\x91\x02\x6b\xfe\xc9\x75\x91\x33\x95\xf0\x1d\
-\xe0\xed\xec\x68\xd8\xd2\x39\xe1\xfd\x93\x3a\x24\xcd\xf3\x9d\x05\
-\xc8\x57\xad\x9d\xad\x0a\x6d\xa8\xc9\x03\x26\xf9\x8e\x02\x38\xb3\
-\x6c\x7b\xa3\x1e\xd9\xf7\xa8\xfb\x42\xd6\x7c\x7e\xc5\xa2\xc6\xdf\
-\xbb\x2f\x74\x66\xb2\x7e\x05\x40\x92\x66\x6d\x38\xef\xbb\xd6\xd8\
-\x87\x7c\xe7\x00\xf2\xd9\xea\x9d\x77\xe9\xc9\x57\x9e\xf2\x1d\x03\
-\x70\x62\xfd\x81\x0d\xce\x4f\xfb\x93\x24\x19\xfb\xe8\xac\x8d\xe7\
-\xfe\xc0\x7d\xa1\x33\x67\x7c\x07\x38\x59\x55\xbf\x59\x3c\xc9\x26\
-\xd2\xeb\x25\x15\xf9\xce\x02\xe4\xab\xd2\x82\x12\xfd\xef\x77\xfc\
-\xbd\x86\x94\x0d\xf6\x1d\x05\xc8\x98\xfd\xed\xfb\xf5\x7f\x1f\xfd\
-\x7f\xea\x4a\x77\xb9\x2e\xd5\x9d\x30\xf6\x82\xe6\x9a\xe6\x9c\xf8\
-\xf4\x66\x4e\xac\x00\x48\x52\xcb\xb5\xcb\xb6\x4a\xfa\x37\xdf\x39\
-\x80\x7c\xd6\xd1\xdb\xa9\x6f\x3d\xfd\x6d\x9d\xe8\x69\xf3\x1d\x05\
-\xc8\x88\xf6\x54\xbb\xfe\x6b\xfd\x77\xa3\x98\xfc\x65\xa5\x7f\xc9\
-\x95\xc9\x5f\xca\xa1\x06\x40\x92\x4a\x52\xc9\x7f\x95\x35\xcf\xf8\
-\xce\x01\xe4\xb3\x03\x1d\x07\xf5\xdd\x0d\xdf\xe7\xd3\xc1\xc8\x79\
-\xa9\x74\xaf\xbe\xbd\xfe\x3b\xda\xdf\xfe\x4a\x14\xe5\x36\x97\xa6\
-\x92\xff\x1e\x45\xa1\x4c\xc9\xa9\x06\xa0\x61\x49\x43\x8f\x0d\xc2\
-\x1b\x25\xf1\xba\x32\xe0\xd0\xf6\x23\xdb\xf5\xc3\xcd\x77\xc8\xca\
-\xed\x56\x29\xc0\x15\x2b\xab\x9f\x6c\xf9\x89\x9e\x3f\xb2\x23\x8a\
-\x72\x69\x13\x06\x9f\x68\x58\xd2\xe0\xf6\x58\xc1\x0c\xcb\xfa\x5d\
-\x00\x7f\x69\xfb\x9d\xcf\xbd\x3c\xf1\x7d\x93\x4b\x65\x74\x99\xef\
-\x2c\x40\x3e\xdb\xdb\xb6\x57\xd6\x86\x9a\xd4\x9f\x9d\x01\xc8\x3d\
-\xcb\xb7\x35\xe9\xfe\xdd\x0f\x44\x52\xcb\x58\xf3\x6f\x2d\x8b\x1b\
-\x7f\x1a\x49\xb1\x0c\xca\xa9\x15\x80\x3f\xda\x7b\xf0\xac\x7f\x90\
-\xf4\xb8\xef\x1c\x40\xbe\x5b\xf9\xc2\x6a\xfd\xee\xe5\x68\x7e\x44\
-\x81\x4c\xb9\xf7\xa5\xfb\xb4\x66\xd7\x5d\x51\x95\x7b\xb2\xb8\xb7\
-\x20\xeb\xf7\xfc\xbf\x91\x9c\x5b\x01\x90\xa4\x7d\x2b\x9f\x0c\x27\
-\x7d\x70\xc2\xfd\xd6\x9a\x8f\x49\x2a\xf4\x9d\x07\xc8\x67\x9b\x5b\
-\x37\xab\xb2\xb8\x9f\x46\xf5\x19\xe9\x3b\x0a\xf0\xb6\x1e\xde\xf7\
-\x88\x7e\xfe\xec\x2f\xa3\x2a\xd7\x1e\x04\xe1\x9c\xc6\xc5\x8d\x07\
-\xa2\x2a\x98\x49\x39\xd9\x00\x48\xd2\x73\x77\x3e\x77\x78\xe2\x07\
-\x26\x1e\x96\xcc\x02\xdf\x59\x80\x7c\xb7\xa9\x75\xb3\x06\x97\x0e\
-\xd1\xf0\x8a\x61\xbe\xa3\x00\x6f\xea\xc9\x57\x9e\xd6\x8f\x36\xdd\
-\x11\xd9\xa9\x96\x46\xfa\xeb\x96\x9a\xe6\x9c\xfd\x68\x5d\xce\x36\
-\x00\x92\xb4\xed\xce\xe7\x9e\x9c\xf8\x81\x49\x53\x25\x4d\xf5\x9d\
-\x05\xc8\x67\x56\x56\x1b\x5a\x37\x68\x64\xc5\x48\x0d\xe6\x8c\x00\
-\x64\xa1\x67\x0e\x6d\xd1\xf7\x36\xdc\xaa\xb4\x8d\xe8\x13\xd7\xd6\
-\x34\xae\x5c\xd4\xf4\xe5\x68\x8a\xb9\x91\x93\xef\x00\xfc\x37\x89\
-\xf4\x5f\x4b\x7a\xc9\x77\x0c\x20\xdf\xf5\x86\x69\x7d\x6f\xe3\xad\
-\xda\xd4\xca\x4e\x5c\x64\x97\xcd\xad\x9b\xf5\x5f\xeb\xbf\x13\xd9\
-\xd6\x55\x2b\xed\x4a\xf5\x16\x7c\x3c\x92\x62\x0e\xe5\xcc\x49\x80\
-\x6f\x65\x5e\x63\xcd\x79\x81\xf4\xb0\xa4\x12\xdf\x59\x80\x7c\x97\
-\x08\x12\xba\x71\xfa\x5f\x69\xe6\xe0\x99\xbe\xa3\x00\xda\x70\x70\
-\xa3\xbe\xbf\xf1\x56\xa5\xd2\x11\x9d\x5b\x61\x6c\x57\x68\xec\xbb\
-\x56\x57\xaf\xf8\x43\x34\x05\xdd\xc9\xe9\x47\x00\x7f\xb4\xfd\xd7\
-\x5b\xf7\x4f\x7c\xff\xa4\x97\x24\xd5\xfa\xce\x02\xe4\x3b\x6b\xad\
-\x9e\x3a\xf0\xb4\x06\x94\xf4\xd7\xd9\x15\x67\xfb\x8e\x83\x18\x7b\
-\x6c\xff\xe3\xfa\xc1\xc6\x1f\xaa\x37\x8c\x68\xd9\x5f\x92\xb5\xc1\
-\x4d\xab\x6b\x9b\x57\x45\x56\xd0\xa1\xbc\x68\x00\x24\x69\xdb\xaf\
-\xb7\x6e\x9c\xf0\xbe\xc9\x23\x64\x74\x81\xef\x2c\x40\xbe\xb3\xb2\
-\x5a\x7f\x60\xa3\xca\x92\xa5\x3a\xa7\xef\x18\xdf\x71\x10\x43\x0f\
-\xec\x7e\x50\x3f\x7e\xe6\xa7\xd1\x7e\xc6\xda\xd8\xef\xaf\xaa\x6d\
-\xfa\xbf\xd1\x15\x74\x2b\xf7\xdf\x01\x78\x9d\x74\x71\xd7\x67\x24\
-\x3d\xe1\x3b\x07\x10\x07\x56\x56\x77\x6e\xad\xd7\xaa\x9d\x6b\x7c\
-\x47\x41\xcc\xb4\xbc\xb0\x4a\x3f\xdf\xf2\x4b\x59\x1b\xdd\x49\x95\
-\x46\x7a\x2c\x5d\xd8\x73\x73\x64\x05\x23\x90\x17\xef\x00\xbc\x5e\
-\x55\x4b\xd5\x48\xdb\x9b\x78\x5c\x12\xaf\x2a\x03\x11\xb9\x74\xd8\
-\xa5\xfa\xf0\x94\x0f\xa9\x20\xc8\x9b\x45\x45\x64\xa1\xb4\x4d\xeb\
-\x97\xcf\xde\xa9\x07\x76\x3f\x18\x6d\x61\x63\xf7\xa7\xd3\x89\x0b\
-\xd7\x2c\x5e\xbe\x3b\xda\xc2\x6e\xe5\x5d\x03\x20\x49\xf3\x1b\x6b\
-\x66\x1a\xe9\x01\x49\x65\xbe\xb3\x00\x71\x31\xb9\xff\x24\x7d\xea\
-\xbc\x4f\xaa\xb4\x80\x77\x71\x91\x79\x5d\xe9\x2e\x7d\x7f\xc3\x6d\
-\xda\xdc\xba\x39\xea\xd2\x9d\xa1\xb1\x57\xae\xae\x69\x7e\x2c\xea\
-\xc2\xae\xe5\x65\x03\x20\x49\x55\xcb\x6b\x17\x58\x63\x9b\x94\x47\
-\xef\x39\x00\xd9\x6e\x44\xf9\x70\xfd\xed\x05\x9f\x51\x65\x71\x7f\
-\xdf\x51\x90\x47\x0e\x75\x1e\xd6\xb7\x9e\xfe\xb6\xf6\xb4\xed\x8d\
-\xba\x74\x68\xa4\xc5\x2d\xb5\x4d\x4d\x51\x17\x8e\x42\xde\x4e\x8e\
-\xdb\x7e\xbd\x75\xdb\xc4\x0f\x4c\x3c\x21\x99\x39\xbe\xb3\x00\x71\
-\x71\xbc\xe7\x84\x1e\xd9\xfb\x98\x46\xf6\x1d\xa9\xb3\x4a\xce\xf2\
-\x1d\x07\x79\x60\xdb\xe1\x6d\xfa\xe6\x53\xb7\xa8\xb5\xb3\x35\xf2\
-\xda\xc6\x9a\x9b\x5b\x16\x35\xfd\x24\xf2\xc2\x11\xc9\xdb\x06\x40\
-\x92\xb6\xdd\xf9\xdc\xa3\x13\x3e\x30\xb1\xbf\x64\xde\xe1\x3b\x0b\
-\x10\x17\x3d\x61\x8f\x1e\xdb\xf7\xb8\x0a\x12\x05\x1a\xd7\x6f\xac\
-\x4c\xfe\x2e\x34\xc2\x21\x2b\xab\xfb\x5e\xfc\x9d\x6e\x7f\xe6\x47\
-\xea\xec\xed\x8a\xbe\xbe\x35\xdf\x5c\xb9\xa8\xf1\xab\x91\x17\x8e\
-\x50\x5e\xed\x02\x78\x23\x25\x3d\x85\x9f\x97\x94\x97\xcb\x37\x40\
-\xb6\x0a\x6d\xa8\x65\xdb\x1a\xf5\x9d\xf5\xdf\x53\x47\x6f\xa7\xef\
-\x38\xc8\x31\x5d\xe9\x2e\xdd\xba\xf1\x36\xfd\xea\xb9\x5f\x47\xba\
-\xc7\xff\x8f\x8c\xb4\xfc\xc2\x8d\xe7\x7e\x31\xf2\xc2\x11\x8b\x45\
-\x6b\x5e\x57\x5f\x57\xd8\x99\x4c\x35\x49\x9a\xeb\x3b\x0b\x10\x37\
-\x43\xcb\x86\xea\xa6\x73\x3f\xa1\x11\xe5\xc3\x7d\x47\x41\x0e\x78\
-\xe9\xc4\xcb\xfa\xc1\xc6\x1f\x6a\x7f\xfb\x7e\x5f\x11\xee\x69\x3b\
-\xda\xaf\xea\xfe\x1b\x7e\x1c\xfd\xb2\x43\xc4\x62\xd1\x00\x48\x52\
-\x55\x4b\x55\xa9\x52\x05\x6b\xac\xb1\x97\xfb\xce\x02\xc4\x4d\x32\
-\x51\xa0\x85\x63\xab\x74\xcd\xa8\x39\x32\x26\x36\x3f\x3b\x38\x05\
-\x7f\x5c\xf2\x6f\xd8\xbe\x2c\xb2\x33\xfd\xdf\xc0\xc3\x3d\xa5\x1d\
-\x57\xaf\x9d\xb3\xb6\xdd\x57\x80\x28\xc5\xea\x4a\x9c\xbb\x7a\x6e\
-\x9f\x44\x77\xd1\x3d\x92\x2e\xf4\x9d\x05\x88\xa3\x29\xfd\x27\xeb\
-\x63\xd3\xaf\x57\xbf\xa2\x7e\xbe\xa3\x20\x8b\x1c\xef\x39\xae\x3b\
-\x36\xff\x54\x9b\x5a\x37\xf9\x8c\xb1\xbe\x40\xba\xb2\xa9\xb6\xe9\
-\xa8\xcf\x10\x51\x8a\x55\x03\x20\x49\x35\x8d\x35\xfd\x7a\xa5\xfb\
-\x24\x9d\xef\x3b\x0b\x10\x47\x15\x85\xe5\xfa\xf0\x94\xeb\x74\xc1\
-\x20\x2e\x41\x48\x4f\xbe\xf2\x94\x7e\xb6\xe5\x17\x6a\x4b\xb5\x79\
-\xcb\x60\xa4\x4d\x05\xd6\x5c\xd9\xb8\xa8\xf1\x90\xb7\x10\x1e\xc4\
-\xae\x01\x90\xa4\x79\xf5\x75\x43\x4c\x32\x75\xaf\x91\xa6\xf8\xce\
-\x02\xc4\xd5\xb9\x67\xcd\xd0\x75\x93\x3f\xa8\xca\xe2\x4a\xdf\x51\
-\xe0\xc1\xb1\xee\xe3\x5a\xb6\x6d\xb9\x1e\xde\xf7\x88\xd7\x1c\x56\
-\xda\x92\x08\xc2\xf7\xac\xa8\x5e\xf1\x8a\xd7\x20\x1e\xc4\xb2\x01\
-\x90\xa4\xf9\x2b\xe7\x57\x9a\x54\xf2\x2e\x49\x17\xf9\xce\x02\xc4\
-\x55\x69\x41\xa9\xaa\xc7\x56\xe9\x3d\x23\xaf\xe4\xdd\x80\x98\xb0\
-\xb2\x7a\x74\xdf\x63\xba\x73\x6b\xbd\xda\x53\xde\x1f\xb5\x3f\x95\
-\x4e\x25\xaf\x59\xb3\xa4\xe1\xa0\xef\x20\x3e\xc4\xfa\x8a\x9b\x5d\
-\x5f\xd7\xb7\x38\x99\x5a\x2d\xe9\x12\xdf\x59\x80\x38\x9b\x54\x39\
-\x51\xd7\x4d\xf9\x90\x86\x94\xf1\x09\x8f\x7c\xb6\xaf\x7d\xbf\x7e\
-\xf6\xec\x2f\xb4\xed\xf0\x36\xdf\x51\x24\xe9\x89\x54\x2a\x79\xcd\
-\xdd\x4b\x1a\x0e\xfb\x0e\xe2\x4b\xac\x1b\x00\x49\xba\xfa\xee\xab\
-\xcb\x92\x1d\xa5\x8d\x46\xba\xca\x77\x16\x20\xce\x0a\x82\x84\x2e\
-\x1d\x76\x89\x6a\xc7\xd7\xa8\x3c\x59\xee\x3b\x0e\x32\xa8\xa3\xb7\
-\x43\x6b\x5e\xb8\x5b\x6b\x5f\xfa\xad\xd2\x1e\xf6\xf5\xbf\x81\xfb\
-\x83\x20\x5c\xb8\xa2\x7a\xc5\x09\xdf\x41\x7c\x8a\x7d\x03\x20\x49\
-\x73\x57\xcf\x2d\x4a\x74\x17\xdd\x29\xa9\xc6\x77\x16\x20\xee\xca\
-\x92\xa5\x5a\x78\x4e\x95\xae\x1c\x79\x85\x02\x93\xf7\x67\x95\xe5\
-\x35\x6b\xad\x1e\xdd\xff\x98\xea\x9f\xfb\x8d\x4e\xf4\x64\xc7\x5c\
-\x6b\x8c\x5d\x55\xdc\x53\x58\xd7\xb0\xa4\x21\xf6\x27\x54\xd1\x00\
-\xbc\xe6\x8a\xdf\x5d\x51\x50\x7e\xac\xef\xb7\x65\xcd\x27\x7d\x67\
-\x01\x20\x8d\x28\x1f\xa1\xc5\x13\x16\x69\xfa\xc0\xa9\xbe\xa3\xe0\
-\x34\x6c\x6a\xdd\xa4\x65\xdb\x1a\xb5\xbb\x6d\x8f\xef\x28\xaf\xf7\
-\xa3\x7d\x07\x06\x7d\xf2\xc9\x9b\x7e\x90\xf2\x1d\x24\x1b\xd0\x00\
-\xfc\x85\x05\x8d\x35\x7f\x2b\xe9\x1b\x8a\xc1\x31\xc9\x40\x2e\x38\
-\xa7\xdf\x18\x2d\x18\x33\x5f\x33\xce\x9a\xee\x3b\x0a\x4e\xc2\xf3\
-\x47\x76\x68\xf9\x8e\xa6\x6c\x79\xce\xff\x47\x56\xd2\x57\x57\xd6\
-\x36\x2d\xf5\x1d\x24\x9b\xd0\x00\xbc\x81\x05\x4d\xd5\xd7\x4a\xfa\
-\x99\xac\x29\xf6\x9d\x05\xc0\xab\xc6\x57\x8e\x53\xf5\xb8\x85\x9a\
-\x54\x39\xd1\x77\x14\xbc\x81\xe7\x8f\xee\x50\xd3\xf3\xcd\xda\x7a\
-\xf8\x39\xdf\x51\xfe\x52\xb7\x31\xf6\x63\x2d\x35\xcd\xbf\xf4\x1d\
-\x24\xdb\xd0\x00\xbc\x89\x05\xcb\x6b\x2f\x96\xb1\xcd\x92\xf8\xa6\
-\x29\x90\x45\x26\xf5\x9f\xa8\x39\xa3\xaf\xd2\xb4\x81\xd3\xf8\xd2\
-\xa0\x67\x56\x56\x9b\x0e\x6e\xd6\x5d\x2f\xae\xcd\xb6\x3b\xfe\x3f\
-\x3a\x1c\x06\x61\xed\xea\xea\x15\x0f\xfa\x0e\x92\x8d\xb8\x7a\xde\
-\xc2\xbc\xe5\xb5\x13\x02\x63\x9b\x24\x4d\xf6\x9d\x05\xc0\x7f\x37\
-\xb8\x6c\x90\xde\x33\xe2\x4a\x5d\x3e\xe2\x5d\x4a\x26\x92\xbe\xe3\
-\xc4\x4a\x3a\x4c\xeb\xf1\x57\x9e\xd0\x9a\x17\xee\xd6\xde\xf6\xbd\
-\xbe\xe3\xbc\x21\x2b\x6d\x31\xe9\x44\xcd\xca\x6b\x97\x6d\xf7\x9d\
-\x25\x5b\xd1\x00\xbc\x8d\xba\xfa\xba\xf2\xae\xc2\xd4\x8f\xac\x55\
-\x9d\xef\x2c\x00\xfe\xa7\xbe\x45\x7d\x74\xc5\x88\x2b\x74\xd9\x88\
-\x4b\x54\x59\xc4\xa9\x82\x2e\x1d\xe9\x3a\xa2\xdf\xef\x79\x48\xf7\
-\xbf\xfc\x80\x8e\xf7\x1c\xf7\x1d\xe7\x4d\x59\xa9\xb9\x3b\x95\xfc\
-\xe8\x3d\x4b\x1a\x8e\xf9\xce\x92\xcd\x68\x00\x4e\x86\x95\x59\xd0\
-\x54\xf3\x59\x23\x7d\xcd\x4a\xdc\x6a\x00\x59\xc8\x18\xa3\xc9\x95\
-\x93\x74\xf9\x88\x77\xe9\xbc\x41\xe7\xa9\x20\x48\xf8\x8e\x94\x17\
-\x42\x1b\x6a\xeb\x91\xe7\xf4\xe0\xee\xdf\xeb\xe9\x57\xd6\x2b\x6d\
-\xb3\x62\x1f\xff\x9b\x49\x5b\x63\xbf\xb2\xaa\xba\xf9\x3f\x64\x64\
-\x7d\x87\xc9\x76\x34\x00\xa7\x60\x5e\xf3\xc2\xcb\x83\x30\xa8\x97\
-\xc4\x71\x65\x40\x16\xeb\x57\xd4\x4f\x97\x0e\xbb\x58\x17\x0d\xbd\
-\x48\xc3\xcb\x87\xf9\x8e\x93\x93\x76\xb7\xed\xd6\x63\x7b\x9f\xd0\
-\x23\xfb\x1e\xd1\xd1\xee\x9c\xb8\x91\x6e\xb5\xc6\x7e\x60\x55\x4d\
-\xf3\x3d\xbe\x83\xe4\x0a\x1a\x80\x53\x54\xd5\x52\x35\xd2\xf6\x26\
-\x7e\x25\x8e\x0f\x06\x72\xc2\xd0\xb2\xa1\xba\x70\xc8\x2c\x5d\x38\
-\x64\x96\x86\x96\x0d\xf1\x1d\x27\xab\xed\x6b\xdf\xa7\x27\xf6\x3f\
-\xa9\x27\xf6\x3f\xa1\x7d\xed\xfb\x7d\xc7\x39\x15\xeb\xd2\x61\xf0\
-\x81\x35\x8b\x97\xef\xf6\x1d\x24\x97\xd0\x00\x9c\x86\xba\xfa\xba\
-\x44\x47\x61\xcf\x17\x03\x6b\xfe\x99\x47\x02\x40\xee\x18\x51\x3e\
-\x42\xe7\x0f\x3e\x57\xd3\x07\x4c\xd7\xe8\xbe\xa3\x62\x7f\xd2\x60\
-\x68\x43\xed\x3c\xb6\x4b\x9b\x5a\x37\xe9\xe9\x03\xeb\xb5\xa7\x2d\
-\x3b\x5f\xe8\x7b\x0b\xbd\x92\xfe\xa5\x24\x95\xfc\xe7\x86\x25\x0d\
-\x59\xfd\x6c\x22\x1b\xd1\x00\x9c\x81\x05\x8d\x35\x17\x49\xfa\x85\
-\xa4\x71\xbe\xb3\x00\x38\x35\x65\xc9\x32\x4d\x1d\x38\x45\xd3\x07\
-\x4e\xd3\xd4\x01\x53\xd4\xa7\xb0\x8f\xef\x48\x91\x38\xd6\x7d\x5c\
-\xcf\x1c\x7a\x46\x9b\x5a\x37\x6b\xcb\xa1\x2d\x6a\x4f\x75\xf8\x8e\
-\x74\x5a\xac\xb4\x2b\x11\x06\xd7\xad\x58\xbc\xfc\x21\xdf\x59\x72\
-\x15\x0d\xc0\x19\x5a\xd8\xbc\xb0\xc2\x86\xc1\xd7\xad\x74\xa3\xef\
-\x2c\x00\x4e\xdf\x59\xa5\x03\x35\xbe\xef\x78\x8d\xad\x1c\xab\x09\
-\x95\xe3\x34\xa4\x6c\x48\x5e\x9c\x33\x70\xb0\xa3\x55\xcf\x1f\x7b\
-\x5e\x2f\x1e\x7f\x51\xdb\x8f\xec\xd0\x4b\xc7\x5f\x92\xcd\xfd\xf7\
-\xe3\x7e\x16\x04\xe1\xa7\xe3\xfe\x31\x9f\x33\x95\xfb\xff\x77\x67\
-\x89\xf9\xcb\x6b\xeb\x8c\xb1\xdf\x16\x2f\x08\x02\x79\xa1\xa2\xb0\
-\x5c\xe7\xf4\x3d\x47\x23\x2a\x86\xeb\xec\xf2\x11\x1a\x5e\x31\x42\
-\x83\x4a\xcf\x52\xc2\x64\xe7\xee\x82\xb4\x4d\xeb\x40\xc7\x41\xed\
-\x39\xb1\x5b\x2f\x9f\xd8\xad\x97\xdb\x76\x6b\xe7\xb1\x9d\x3a\xd1\
-\xd3\xe6\x3b\x5a\xe6\x18\xbb\xdf\x58\xf3\x99\x96\xda\xa6\x65\xbe\
-\xa3\xe4\x03\x1a\x80\x0c\xaa\x69\xac\xe9\x97\x96\xfe\xdd\x4a\x9f\
-\x10\x7f\xb7\x40\xde\x49\x26\x0a\x34\xb4\x6c\x98\x86\x95\x0d\xd1\
-\xc0\x92\x81\x7f\xfa\x67\x40\xf1\x00\x55\x16\x57\x3a\xdf\x7a\xd8\
-\x1b\xa6\x75\xa4\xeb\x88\x5a\xbb\x5a\x75\xa8\xf3\x90\x0e\x76\x1e\
-\x54\x6b\xc7\x21\xed\xeb\xd8\xaf\xbd\x6d\x7b\xd5\x1b\xf6\x3a\xad\
-\xef\x91\x95\xf4\xf3\xa4\x35\x9f\x6b\x5c\xd4\x78\xc8\x77\x98\x7c\
-\xc1\x24\xe5\xc0\x6b\xdb\x05\x7f\x20\x89\x43\xcb\x81\x98\x08\x4c\
-\xa0\x3e\x85\x15\x2a\x4b\x96\xa9\xac\xb0\x5c\x15\xc9\x32\x95\x27\
-\xcb\x55\x9e\x2c\x57\x71\xf2\xd5\xcf\x8a\x94\x16\x94\x4a\x32\x4a\
-\x06\x09\x15\x06\x45\x92\xa4\x9e\xb0\x5b\xa9\x30\x2d\x6b\xad\x3a\
-\xd3\xaf\x3e\x8f\xef\x4a\x75\xa9\x2d\xd5\xa6\xb6\x54\x9b\x4e\xa4\
-\xda\xd5\xde\xd3\xa6\xf6\x54\xbb\x8e\xf7\x9c\x50\x68\x43\x5f\x7f\
-\x44\x5f\x5e\xb0\xc6\xde\xc4\xf6\xbe\xcc\xa3\x01\x70\xa4\xaa\xa5\
-\xaa\xd4\xa6\x83\xa5\xb2\xe6\x73\x92\x0a\x7c\xe7\x01\x80\x5c\x62\
-\xa4\x94\x35\xf6\x3f\x4b\x7a\x0a\xbf\xda\xb0\xa4\xa1\xd3\x77\x9e\
-\x7c\x44\x03\xe0\xd8\xc2\xe6\x85\x13\xc3\x30\xf8\x86\xa4\x79\xbe\
-\xb3\x00\x40\x8e\xb8\x37\x34\xf6\x73\xab\x6b\x9a\x37\xf9\x0e\x92\
-\xcf\x68\x00\x22\x32\xbf\xa9\x7a\xb6\xac\xb9\xc5\x48\x53\x7c\x67\
-\x01\x80\x2c\xb5\xdd\x5a\xf3\x95\x55\x8b\x1a\x1b\x7c\x07\x89\x83\
-\x78\x9f\x82\x11\xa1\x55\x35\xcd\xf7\xec\x3f\x30\xe8\x3c\x49\x37\
-\x1b\x29\x27\xce\xd5\x04\x80\x88\x1c\xb5\xc6\x7e\x39\x5d\xd4\x3d\
-\x9d\xc9\x3f\x3a\xac\x00\x78\x50\xbb\xbc\x76\x50\x2a\x08\xbf\x22\
-\xe9\x46\x59\x53\xec\x3b\x0f\x00\x78\x61\x6c\x97\xb1\xe6\xfb\xbd\
-\xa9\xe4\xbf\xae\x59\xd2\x70\xd0\x77\x9c\xb8\xa1\x01\xf0\x68\xee\
-\xb2\x45\x23\x12\x89\xf4\x97\x64\xcd\x4d\x92\x8a\x7c\xe7\x01\x80\
-\x28\x18\x29\x25\xe9\x0e\x5b\xd0\xfb\xd5\x95\x55\x2b\xf7\xf8\xce\
-\x13\x57\x34\x00\x59\xa0\xaa\xa5\x6a\xa4\x7a\x13\x5f\xb1\xd2\xc7\
-\xc4\x8e\x01\x00\x79\xca\x48\x29\x2b\xdd\x99\x96\xfe\x69\x4d\x6d\
-\xd3\x0e\xdf\x79\xe2\x8e\x06\x20\x8b\x2c\xf8\xcd\xe2\xf1\x2a\xe8\
-\xfd\x92\xa4\x0f\xf3\x68\x00\x40\x1e\xe9\xb4\xd6\xfc\x34\x34\xf6\
-\x6b\x4c\xfc\xd9\x83\x06\x20\x0b\xcd\xad\xaf\x3b\x2b\x91\x4c\x7d\
-\x5a\xd2\xa7\x25\x0d\xf4\x9d\x07\x00\x4e\x53\xab\xb1\xe6\x76\x93\
-\x48\x7f\x6b\x45\xf5\x8a\x9c\xfb\xd4\x60\xbe\xa3\x01\xc8\x62\x73\
-\x57\xcf\x2d\x4a\xf4\x14\xbe\x4f\xd6\x7c\x59\xd2\x64\xdf\x79\x00\
-\xe0\x24\xbd\x20\xe9\x5b\xa6\x20\x7d\x5b\x4b\x55\x4b\x6e\x7e\x6e\
-\x30\x06\x68\x00\x72\xc0\xd2\xa5\x4b\x83\x3f\x9c\xf7\xf4\x35\xb2\
-\xe6\x13\x92\x16\x88\xf7\x04\x00\x64\x19\x23\xa5\xac\x35\x2b\x8d\
-\xb1\xb7\xcd\xdc\x70\xde\xdd\x4b\x97\x2e\x8d\xdd\x99\xc5\xb9\x86\
-\x06\x20\xc7\xcc\xab\xaf\x1b\x62\x0a\x7b\x3e\x6a\xac\xf9\xb8\xa4\
-\x71\xbe\xf3\x00\x88\xbd\xed\x92\x7e\x99\x30\xf6\xf6\xe6\x9a\xe6\
-\x97\x7d\x87\xc1\xc9\xa3\x01\xc8\x55\x56\xa6\xaa\xb1\xf6\x4a\x19\
-\x7b\x83\x95\xaa\x25\x55\xf8\x8e\x04\x20\x36\x8e\x4b\x6a\x96\xf4\
-\xa3\x95\x35\x4d\x0f\xc8\xc8\xfa\x0e\x84\x53\x47\x03\x90\x07\xae\
-\xb8\xe3\xfa\xe2\xf2\xca\x23\x57\xc9\x9a\x3a\x49\x35\xa2\x19\x00\
-\x90\x79\x9d\x92\xee\x95\xb1\x0d\x3d\x25\x9d\xcb\xd6\xce\x59\xdb\
-\xee\x3b\x10\xce\x0c\x0d\x40\x9e\xa9\x6a\xa9\x2a\x0d\x53\x05\xf3\
-\x8d\xb4\x44\xc6\xce\x11\xcd\x00\x80\xd3\x77\xdc\x4a\x77\x05\x52\
-\x7d\x71\x2a\xb9\x9a\xaf\xf2\xe5\x17\x1a\x80\x3c\x56\x57\x5f\x97\
-\xe8\x48\xa6\xce\x33\x52\x95\x5e\x7d\x79\xf0\x02\xf1\xdf\x1c\xc0\
-\x5b\x7b\x41\xc6\xae\xb4\x52\x4b\x69\x4f\xe1\x83\x0d\x4b\x1a\x7a\
-\x7c\x07\x82\x1b\x4c\x06\x31\xb2\xa0\x65\xc1\x70\xd3\x5b\x70\x8d\
-\x95\xae\x92\xf4\x2e\x49\xc3\x7c\x67\x02\xe0\xdd\x6e\x19\xbb\xce\
-\x86\xc1\x6f\x13\x89\xf4\x5d\xec\xd7\x8f\x0f\x1a\x80\x18\x5b\xd8\
-\xbc\x70\x58\x3a\x9d\xb8\xd4\x04\xe1\x65\xb2\xe6\x52\x49\xe7\x8b\
-\x2f\x44\x02\xf9\xee\x05\x49\x0f\x59\x69\x5d\x90\x48\x3f\xd4\xb2\
-\xb0\xe5\x19\xdf\x81\xe0\x07\x0d\x00\xfe\x64\x76\x7d\x5d\xdf\xe2\
-\x64\x6a\x96\x95\xa6\x1b\x69\xba\x95\x66\x18\x69\x8a\xa4\x52\xdf\
-\xd9\x00\x9c\xb2\x0e\x49\xcf\x58\x69\xa3\x91\x36\x19\x6b\x36\x75\
-\xf6\x16\x3c\x79\xcf\x92\x06\x3e\x47\x0e\x49\x34\x00\x78\x1b\x75\
-\xf5\x75\x89\xf6\x82\xde\xb1\x41\x10\xce\x90\x35\xe3\x8d\x34\x3a\
-\x94\xc6\x18\x69\xb4\xa4\x51\x92\x0a\x3d\x47\x04\xe2\xac\x5b\xd2\
-\x4b\x92\x76\x1a\x69\x97\xac\xd9\x29\x63\xb7\xdb\x74\x62\xe3\xac\
-\xcd\xd3\x77\x70\x18\x0f\xde\x0a\x0d\x00\x4e\xdb\xd2\xa5\x4b\x83\
-\xc7\xa6\x6f\x1c\x56\x60\xec\x68\x19\x3b\xd8\x5a\x73\x96\x8c\x1d\
-\x68\xa4\x01\x56\x1a\x20\x69\x80\x91\x06\x58\x6b\xca\x65\x6c\xc9\
-\x6b\xff\x5a\x5f\xbd\xfa\x98\x21\x29\xa9\xdc\x5b\x78\x20\x7b\xb4\
-\xe9\xd5\xcf\xe3\x86\x92\x5e\xbd\x3b\xb7\xa6\xd3\x18\xdb\x66\xa5\
-\x43\x92\x0e\x19\xe9\x90\xac\x69\xb5\xd2\x21\x63\xec\x41\x59\xf3\
-\x8a\x4d\xa6\x76\xce\x7a\x72\xd6\x3e\x26\x79\x00\x00\x00\x00\x00\
-\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\
-\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\
-\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\
-\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\
-\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\
-\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\
-\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\
-\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\
-\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\
-\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\
-\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\
-\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\
-\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\
-\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\
-\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\
-\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\
-\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\
-\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\
-\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\
-\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\
-\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\
-\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\
-\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\
-\x00\x00\x00\x00\x00\x00\x00\x00\xe4\x8b\xff\x1f\x4d\x81\x81\x7a\
-\xae\x62\x5b\x0e\x00\x00\x00\x00\x49\x45\x4e\x44\xae\x42\x60\x82\
-\
-\x00\x00\x4e\x5f\
-\x89\
-\x50\x4e\x47\x0d\x0a\x1a\x0a\x00\x00\x00\x0d\x49\x48\x44\x52\x00\
-\x00\x02\x00\x00\x00\x02\x00\x08\x06\x00\x00\x00\xf4\x78\xd4\xfa\
-\x00\x00\x00\x09\x70\x48\x59\x73\x00\x00\x0e\xc3\x00\x00\x0e\xc3\
-\x01\xc7\x6f\xa8\x64\x00\x00\x00\x19\x74\x45\x58\x74\x53\x6f\x66\
-\x74\x77\x61\x72\x65\x00\x77\x77\x77\x2e\x69\x6e\x6b\x73\x63\x61\
-\x70\x65\x2e\x6f\x72\x67\x9b\xee\x3c\x1a\x00\x00\x20\x00\x49\x44\
-\x41\x54\x78\x9c\xec\xdd\x77\x98\x5d\x55\xb9\x3f\xf0\xef\xbb\x4f\
-\x9b\x9e\x9e\x4c\xc2\xf4\x49\x20\x24\xf4\x22\xa8\x20\xa8\x80\x20\
-\x08\x28\x1d\x6c\xe0\x55\x44\x14\x15\x29\x33\x01\xef\x6f\xae\x92\
-\x42\x11\x14\x54\xe0\xc2\xb5\x52\x03\x62\xa1\x08\xa8\x20\x4d\x3a\
-\x4a\x09\x10\x92\x4c\x4f\x98\xf4\x4c\xa6\x9e\xb6\xd7\xef\x8f\x49\
-\x08\x49\x26\xc9\xcc\x39\x67\xef\x77\xef\x7d\xbe\x9f\xe7\xf1\x21\
-\xe5\xcc\xde\x5f\x82\x99\xf7\xdd\x6b\xad\xbd\x96\x80\x88\x3c\xef\
-\x95\x5b\x0f\x8c\x8c\x5f\xb3\x6e\x7c\x48\xd2\x13\x52\x16\xc6\x8b\
-\x6d\xc6\x8b\x60\xbc\x18\x8c\xb7\x61\x4d\x10\x31\xe3\x61\x30\x1e\
-\x96\x44\xc5\x98\x12\x00\x30\x40\x0c\x40\xd1\xa6\x4b\x14\x02\x28\
-\xd8\xf4\xe3\x12\x00\x91\x6d\x6e\x11\x07\xd0\x0f\x00\x02\xf4\x9b\
-\xa1\x9f\x03\x90\x5e\x81\x49\x02\x80\x11\xb3\x11\xb6\x95\x30\x82\
-\x75\x16\xec\xb5\xc6\xc8\x3a\x63\x61\x9d\xb1\xb1\x2e\x64\xc9\x3a\
-\x5b\xac\xb5\xe9\xf4\xc0\xba\xe9\xd3\xbb\xd6\xc9\xe9\x48\x3b\xfa\
-\x07\x42\x44\x59\x13\xed\x00\x44\xf9\xae\x79\x6e\xed\x14\x84\x93\
-\xd5\x48\x5b\x55\x16\x4c\x95\x11\xa9\x06\x50\x2d\x06\xbb\x19\xc1\
-\x24\x00\xe3\x01\x94\x2a\xc7\x1c\xad\x6e\x00\x6b\x01\xb3\xca\x40\
-\x96\x0b\xa4\x1d\x62\xda\x00\xd3\x2a\xc6\x6a\x0f\x9b\x54\x7b\xc5\
-\x9c\xe5\x6b\xb5\x43\x12\xe5\x33\x36\x00\x44\x0e\x7b\xf7\xea\x3d\
-\x4a\xa3\xe8\xdb\x13\xc6\x9a\x29\x40\x8d\x81\xa9\x12\x5b\xaa\x20\
-\xa8\x02\x50\x8d\x2d\x4f\xe6\xf9\xa6\x0f\x40\x1b\x80\x56\x00\xed\
-\x43\xff\x33\xad\x62\x5b\x8b\x43\x85\xe9\x77\x2a\x2f\xee\x1c\x50\
-\x4d\x47\x14\x70\x6c\x00\x88\x72\x64\x51\xd3\xec\x68\x49\x41\xcf\
-\x8c\xb4\xc1\x2c\x01\x66\x0b\x30\xcb\x00\xb3\x01\xcc\x04\x60\x69\
-\xe7\xf3\xa1\xf7\x05\x58\x64\x80\xb7\x8d\xe0\xd5\x90\xc1\xa2\x48\
-\x3c\xf5\xce\xb4\xa6\x15\xfd\xda\xc1\x88\x82\x80\x0d\x00\xd1\x28\
-\x19\x03\x69\xbb\xa6\x7a\x26\x6c\x1c\x60\x8c\xd9\x0b\x82\x59\x00\
-\xf6\x02\x50\x03\x16\x7a\x47\x19\x20\x25\xc0\x52\x11\xbc\x65\x6c\
-\xbc\x6d\x2c\x2c\x0a\x19\xbc\x52\xdd\xd8\xde\xac\x9d\x8d\xc8\x6f\
-\xd8\x00\x10\xed\xc2\x92\xa6\xe9\x65\x56\x41\x62\x1f\xcb\xe0\xe3\
-\x02\x1c\x66\x80\x8f\x02\x98\xa0\x9d\x8b\xb6\xd2\x2d\xc0\xcb\x06\
-\x78\xce\x08\x5e\x8d\x44\xed\xe7\x2a\x2f\xee\x5c\xa7\x1d\x8a\xc8\
-\xcb\xd8\x00\x10\x7d\x88\x59\x88\x50\x7b\x73\xd5\xcc\x34\x70\xa0\
-\x18\x7c\x1c\xc0\x61\xe0\x10\xbe\x1f\xa5\x01\x2c\x16\xe0\x55\x23\
-\x78\xd5\x32\x78\xb6\x2a\xde\xfe\x6f\x69\x82\xad\x1d\x8c\xc8\x2b\
-\xd8\x00\x50\x5e\x7b\xe5\xd6\x03\x23\xe3\xd7\xaf\xfa\xa8\x65\xe3\
-\x68\x23\x72\x04\x80\x03\xb1\xe5\xd5\x39\x0a\x96\x6e\x18\xbc\x64\
-\x44\x9e\x09\x19\xf3\xc4\xea\x09\x93\x5e\x3a\xe8\xfc\x57\x93\xda\
-\xa1\x88\xb4\xb0\x01\xa0\xbc\xd3\x36\xaf\x6a\x96\x6d\xe1\x68\x63\
-\x70\xb4\x05\x1c\x61\x86\xde\x8b\xa7\x3c\x23\x40\xaf\x81\x3c\x0b\
-\x63\x9e\xb4\x43\xe6\x89\xba\x81\x8e\xd7\x38\x42\x40\xf9\x84\x0d\
-\x00\x05\xde\x92\x79\xe5\x93\x42\x12\x3d\x52\x80\xa3\x00\x73\x2c\
-\x20\x55\xda\x99\xc8\x93\xd6\x0a\xf0\x84\x01\xfe\x1e\x4e\xdb\x0f\
-\x57\x5e\xd9\xb9\x5c\x3b\x10\x91\x93\xd8\x00\x50\xe0\x3c\xd9\x84\
-\x70\x6d\xa4\xfa\x70\x84\xec\xcf\x1a\x83\xa3\x01\xd9\x07\xfc\xff\
-\x3a\x8d\x8e\x2d\x06\xaf\x01\xe6\x51\x3b\x64\x1e\xac\xbd\xac\xf3\
-\x65\x11\x18\xed\x50\x44\xb9\xc4\x6f\x8a\x14\x08\x1d\xd7\x57\x14\
-\x26\x13\xd6\x51\x62\x70\x02\x80\x93\x00\x4c\xd1\xce\x44\x41\x22\
-\xab\x05\xe6\x51\x5b\x70\x5f\xba\x28\xfa\xf8\x8c\x8b\x96\xc6\xb5\
-\x13\x11\x65\x8b\x0d\x00\xf9\x56\xdb\xfc\xaa\x71\xb6\x31\x27\x43\
-\xe4\x54\x00\x9f\x42\xfe\xee\xa8\x47\xee\xea\x11\xe0\x51\x5b\x70\
-\x7f\x51\x28\xfe\x70\xf9\xa5\x2b\xfb\xb4\x03\x11\x65\x82\x0d\x00\
-\xf9\xca\xb2\x05\x75\x63\x04\xa9\x93\x2c\x83\xd3\x0c\x70\x0c\x80\
-\xa8\x76\x26\xca\x6b\x83\x02\xfc\xdd\x16\xdc\x37\x30\x38\xf0\xc0\
-\xec\xa6\xd5\xbd\xda\x81\x88\x46\x8a\x0d\x00\x79\x5e\xc7\xf5\x15\
-\x85\xa9\x84\x9c\x04\x23\x67\x63\xa8\xe8\xc7\xb4\x33\x11\x0d\xa3\
-\x0f\x46\x1e\xb4\x61\xee\x5c\x3f\x61\xd2\x63\x7c\xc5\x90\xbc\x8e\
-\x0d\x00\x79\x92\x69\x82\xd5\x5c\x50\xf5\x31\xcb\xe0\x34\x00\xe7\
-\x80\x3b\xef\x91\xbf\xac\x07\x70\x9f\x2d\xf8\x7d\xdd\xe5\xed\xcf\
-\x71\x01\x21\x79\x11\x1b\x00\xf2\x94\xa5\xf3\x2b\xa6\x87\x60\x9d\
-\x07\x98\x73\xf8\xba\x1e\x05\xc4\xbb\x22\xe6\xf7\x96\xe0\x37\x55\
-\x97\x77\xac\xd0\x0e\x43\xb4\x19\x1b\x00\x52\xb7\xe4\xc6\xe9\xb1\
-\x50\x5f\xe2\x44\x0b\xf8\x86\x01\x3e\x0d\xfe\xff\x92\x82\xc9\x16\
-\xe0\x09\x1b\xf8\xdf\x75\xe3\x27\xfd\x89\x53\x04\xa4\x8d\xdf\x68\
-\x49\xcd\xd2\xb9\x95\x7b\x85\x2c\xf9\x3a\x0c\xbe\x08\xc1\x78\xed\
-\x3c\x44\x2e\x5a\x61\x8c\xfc\xc6\x4a\xe3\xf6\x9a\x1f\xb6\xb5\x68\
-\x87\xa1\xfc\xc4\x06\x80\x5c\x65\x16\x22\xd4\xd2\x5c\xf5\x59\xcb\
-\xe0\x22\x3e\xed\x13\x6d\x19\x15\xa8\xad\x6f\x7f\x40\x4e\x47\x5a\
-\x3b\x10\xe5\x0f\x7e\xf3\x25\x57\xb4\x5c\x53\x53\x8e\xb4\xfd\x15\
-\xc0\x7c\x8b\x73\xfb\x44\xc3\x30\x58\x06\xc1\x6d\x11\x93\xbe\xbd\
-\x62\xce\xf2\xb5\xda\x71\x28\xf8\xd8\x00\x90\xa3\xda\xe6\x57\x1d\
-\x68\x43\x7e\x00\x98\x53\x01\x44\xb4\xf3\x10\xf9\x40\x3f\x80\xdf\
-\x19\x2b\xf4\xd3\xba\xcb\x5b\x16\x6b\x87\xa1\xe0\x62\x03\x40\x39\
-\x67\x9a\x60\x35\xc7\xaa\x3e\x15\x02\xbe\x6b\x80\x13\xb4\xf3\x10\
-\xf9\xd4\xd0\xf4\x80\xe0\xc6\xba\x86\xf6\x07\xb5\xc3\x50\xf0\xb0\
-\x01\xa0\x9c\x69\x69\xaa\x29\x40\x2c\xfd\x55\xc0\xfa\x3e\x60\x76\
-\xd7\xce\x43\x14\x20\xaf\x02\xe6\x27\xad\xf1\x8e\xfb\x3e\xd9\x84\
-\x94\x76\x18\x0a\x06\x36\x00\x94\xb5\x45\x4d\x93\x4a\x8a\x0a\x0a\
-\xbf\x06\x83\xcb\x00\x4c\xd3\xce\x43\x14\x60\xad\x10\xfc\x34\x1c\
-\xb5\xff\xb7\xf2\xe2\xce\x01\xed\x30\xe4\x6f\x6c\x00\x28\x63\x4b\
-\x9a\xa6\x97\x85\x63\x89\x0b\x60\x70\x19\x5f\xe3\x23\x72\xd5\x4a\
-\x00\xb7\xa4\xe2\xd1\xeb\x67\x34\x2d\xdd\xa8\x1d\x86\xfc\x89\x0d\
-\x00\x8d\xda\x92\x79\xe5\x93\x22\x12\xbd\x14\xc0\x05\x06\x28\xd1\
-\xce\x43\x94\xaf\x04\x58\x03\x31\x37\xf4\x0d\x0e\xde\xc8\x83\x88\
-\x68\xb4\xd8\x00\xd0\x88\x75\x5c\x5f\x31\x3e\x15\xb7\x2e\x02\xf0\
-\x7d\x00\x65\xda\x79\x88\xe8\x03\x6b\x01\xfc\x9c\x23\x02\x34\x1a\
-\x6c\x00\x68\x97\x16\x35\x4d\x2a\x29\x8a\x15\x5e\x08\x41\x03\x0c\
-\xc6\x6a\xe7\x21\xa2\xe1\x09\xb0\xc6\x00\xd7\x85\x63\xf6\x8d\x5c\
-\x23\x40\xbb\xc2\x06\x80\x76\x68\xe8\x18\x5e\xeb\xbb\x9b\x16\xf7\
-\x8d\xd3\xce\x43\x44\x23\xb6\x1c\x82\x1f\xb7\x0e\xb6\xff\x1f\xdf\
-\x1a\xa0\x1d\x61\x03\x40\xdb\x31\x4d\xb0\x5a\x62\x55\xa7\x08\x70\
-\x0d\x80\x1a\xed\x3c\x44\x94\xb1\xc5\x06\xf8\x61\x6d\x43\xfb\xfd\
-\x3c\x92\x98\xb6\xc5\x06\x80\xb6\xb2\x6c\x7e\xd5\x51\x16\xe4\x27\
-\x80\xd9\x47\x3b\x0b\x11\xe5\x88\xc1\x4b\x80\x7d\x59\xed\x9c\xce\
-\xa7\xb4\xa3\x90\x77\xb0\x01\x20\x00\xc0\xb2\xab\x2b\x0f\x0a\xd9\
-\x72\x83\x01\x0e\xd3\xce\x42\x44\x8e\xf9\xb3\x1d\xb2\x2f\xad\xbf\
-\xac\x73\x89\x76\x10\xd2\xc7\x06\x20\xcf\xb5\xce\xad\x9e\x6a\x2c\
-\xd3\x04\xe0\x6b\x00\x42\xca\x71\x88\xc8\x79\x49\x00\x37\xdb\x12\
-\xfe\xef\xfa\x86\xe6\x6e\xed\x30\xa4\x87\x0d\x40\x9e\x5a\xd4\x34\
-\x3b\x5a\x54\xd0\x73\x01\x0c\x7e\x04\xbe\xd2\x47\x94\x8f\xd6\x42\
-\xf0\xe3\x9a\xba\xf6\x9f\xf3\x18\xe2\xfc\xc4\x06\x20\x0f\xb5\x2c\
-\xa8\x3c\x09\x46\xae\x07\x50\xa7\x9d\x85\x88\x94\x09\xfe\x63\x03\
-\xdf\xa9\x6f\x68\x7f\x56\x3b\x0a\xb9\x8b\x0d\x40\x1e\x59\x72\xf5\
-\x6e\x15\x11\x13\xba\xc1\x18\x9c\xaa\x9d\x85\x88\x3c\xc5\x08\x70\
-\x47\x2a\x1c\xb9\x64\xfa\xa5\xcb\x56\x69\x87\x21\x77\xb0\x01\xc8\
-\x03\xaf\xdc\x7a\x60\x64\xc2\xfa\xd5\xdf\x12\x83\xab\xb8\x75\x2f\
-\x11\xed\x90\x60\x03\x80\x26\x4e\x0b\xe4\x07\x36\x00\x01\xd7\x7c\
-\x75\xd5\xd1\x62\xe3\x17\x00\x66\x68\x67\x21\x22\xdf\x78\xd9\x02\
-\x2e\xa8\x6e\x6c\x7f\x55\x3b\x08\x39\x87\x0d\x40\x40\xb5\x34\xd5\
-\x8c\x45\xcc\xbe\x1a\xc0\xd7\xc1\xff\xce\x44\x34\x7a\x36\x80\xdb\
-\xfb\xe3\x03\x3f\xe0\x41\x43\xc1\xc4\xc2\x10\x40\xcd\x0b\xaa\x3e\
-\x27\x06\xb7\x00\x98\xa6\x9d\x85\x88\x7c\x4e\xd0\x62\x04\xe7\xd7\
-\x5d\xde\xfe\x37\xed\x28\x94\x5b\x6c\x00\x02\xa4\x75\x6e\xf5\x54\
-\x13\xb2\x7f\x0e\x23\x5f\xd0\xce\x42\x44\xc1\x22\xc0\x7d\xf1\x48\
-\xea\x5b\x7b\x5c\xb2\x62\x8d\x76\x16\xca\x0d\x36\x00\x01\xd1\x3a\
-\xaf\xfa\x6b\x46\xcc\xf5\xe0\x3b\xfd\x44\xe4\x9c\x2e\x63\xcc\xf9\
-\x75\x73\x3a\xfe\xa2\x1d\x84\xb2\xc7\x06\xc0\xe7\x5a\xae\xa9\x29\
-\x47\xda\xbe\x15\xc0\x89\xda\x59\x88\x28\x3f\x08\x70\x5f\x28\x66\
-\x7f\xb3\xf2\xe2\xce\x75\xda\x59\x28\x73\x6c\x00\x7c\xac\x79\x7e\
-\xd5\x69\x02\xdc\x0c\x60\x82\x76\x16\x22\xca\x3b\x5d\xb6\xc1\xd7\
-\xeb\xe7\xb4\x3f\xa4\x1d\x84\x32\xc3\x06\xc0\x87\x96\xcc\x2b\x9f\
-\x14\xb6\x22\xb7\x70\xae\x9f\x88\x94\x19\x00\xb7\xf6\xc7\x07\x2e\
-\xe5\x9b\x02\xfe\xc3\x06\xc0\x67\x86\x8e\xeb\xc5\x6f\xc1\x15\xfe\
-\x44\xe4\x15\x82\x16\x81\x7c\xb1\xa6\xa1\xed\x5f\xda\x51\x68\xe4\
-\xd8\x00\xf8\xc4\x92\x1b\xa7\xc7\xc2\x7d\x89\xff\x01\x70\x29\x00\
-\x4b\x3b\x0f\x11\xd1\x87\x19\x20\x25\xc0\xdc\x9a\xfa\xf6\x1f\x73\
-\x17\x41\x7f\x60\x03\xe0\x03\xad\x57\x57\xef\x69\x6c\x73\x27\x80\
-\xfd\xb5\xb3\x10\x11\xed\x94\xe0\xc9\x94\xa4\xbf\x3c\xe3\xf2\xe5\
-\x9d\xda\x51\x68\xe7\xf8\x24\xe9\x71\x2d\xf3\x2b\xbf\x69\x6c\xf3\
-\x2a\x58\xfc\x89\xc8\x0f\x0c\x3e\x19\x4e\x87\x5e\x6f\x9d\x5f\xfd\
-\x79\xed\x28\xb4\x73\x1c\x01\xf0\xa8\x77\xaf\xde\xa3\x34\x66\x0f\
-\xde\x0a\x98\xb3\xb4\xb3\x10\x11\x65\xe8\x7f\xfb\xe3\xa5\xdf\x99\
-\xdd\xb4\x28\xa1\x1d\x84\xb6\xc7\x06\xc0\x83\xda\xe6\x55\xcd\xb2\
-\x05\x0b\x01\xcc\xd6\xce\x42\x44\x94\x0d\x31\x78\x45\x04\x67\x54\
-\x37\xb6\x37\x6b\x67\xa1\xad\x71\x0a\xc0\x63\x9a\x17\x54\x7d\xd9\
-\x16\xbc\x0c\x16\x7f\x22\x0a\x00\x23\x38\xc8\x06\x5e\x6b\x9d\x5f\
-\x7d\x8a\x76\x16\xda\x1a\x47\x00\x3c\xa2\xe3\xfa\x8a\xc2\x74\xdc\
-\xba\xd5\x00\x5f\xd2\xce\x42\x44\xe4\x00\x03\xc1\xb5\x35\x75\xed\
-\x73\xf8\x96\x80\x37\xb0\x01\xf0\x80\xa5\x57\x4d\xab\x0c\x85\xc2\
-\x7f\x00\x70\xb0\x76\x16\x22\x22\x67\xc9\x53\xe9\x70\xf8\xf4\xe9\
-\x97\x2e\x5b\xa5\x9d\x24\xdf\xb1\x01\x50\xd6\x32\xaf\xe2\x08\x88\
-\xb5\x10\xc0\x64\xed\x2c\x44\x44\x2e\xe9\xb0\x61\x4e\xa9\x6f\xec\
-\x78\x59\x3b\x48\x3e\xe3\x1a\x00\x45\x2d\xf3\xab\xbe\x01\xb1\xfe\
-\x06\x16\x7f\x22\xca\x2f\x95\x16\xe4\xe9\x96\x79\x95\xe7\x6a\x07\
-\xc9\x67\x1c\x01\x50\xd0\x71\x7d\x45\x61\x6a\x30\xf4\x2b\x88\x39\
-\x53\x3b\x0b\x11\x91\x2e\xb9\xa1\xa6\xbe\xed\x52\xae\x0b\x70\x1f\
-\x1b\x00\x97\xb5\xce\xad\x9e\x6a\xc4\xfc\x09\x82\x8f\x68\x67\x21\
-\x22\xf2\x88\xc7\x11\xb7\xce\xa8\x6d\x6a\xdd\xa0\x1d\x24\x9f\xb0\
-\x01\x70\x51\xf3\x82\xda\x7d\xc5\xa4\xfe\x02\x48\x95\x76\x16\x22\
-\x22\x6f\x91\xf7\x6c\x93\xfa\x5c\xfd\x9c\xe5\xef\x69\x27\xc9\x17\
-\x5c\x03\xe0\x92\xd6\xf9\xd5\xa7\x88\x49\x3f\xc7\xe2\x4f\x44\x34\
-\x1c\xb3\xbb\x25\xa1\x7f\xb5\xcc\xaf\x39\x52\x3b\x49\xbe\x60\x03\
-\xe0\x82\xd6\x05\x95\x73\x0c\xcc\x7d\x00\x8a\xb5\xb3\x10\x11\x79\
-\xd8\x04\xc0\x7e\xac\x65\x7e\xe5\x57\xb5\x83\xe4\x03\x4e\x01\x38\
-\xc8\x2c\x44\xa8\x75\x59\xd5\xcf\x01\x7c\x53\x3b\x0b\x11\x91\xcf\
-\x5c\x5d\xd3\xd0\xde\x28\x02\xa3\x1d\x24\xa8\xd8\x00\x38\xa4\xeb\
-\xda\x29\xc5\x83\xa9\xd8\x3d\x06\x38\x41\x3b\x0b\x11\x91\x4f\xfd\
-\x66\xed\xf8\x49\xdf\x38\xe8\xfc\x57\x93\xda\x41\x82\x88\x0d\x80\
-\x03\x9a\xe7\xd6\x4e\xb1\x24\xfd\x90\x11\x1c\xa4\x9d\x85\x88\xc8\
-\xcf\x04\xf8\x7b\x32\x1e\x3d\x65\x46\xd3\xd2\x8d\xda\x59\x82\x86\
-\x0d\x40\x8e\x35\x5f\x5d\xbb\x87\x98\xf4\x5f\x61\x50\xab\x9d\x85\
-\x88\x28\x10\x04\xaf\xc1\xb2\x8e\xaf\xbd\xac\xb5\x4b\x3b\x4a\x90\
-\xb0\x01\xc8\xa1\xb6\xf9\x55\x07\xda\x90\xbf\x02\x66\x92\x76\x16\
-\x22\xa2\x80\x69\xb5\x43\xf6\x31\xf5\x97\x75\x2e\xd1\x0e\x12\x14\
-\x7c\x0b\x20\x47\x5a\xe6\x55\x1c\x61\x03\x4f\xb0\xf8\x13\x11\x39\
-\xa2\xc6\x4a\x5b\x4f\xb7\xcc\xad\xd9\x4f\x3b\x48\x50\xb0\x01\xc8\
-\x81\xe6\x05\x55\x9f\x83\x58\x7f\x05\x50\xa6\x9d\x85\x88\x28\xc0\
-\xca\x11\xb2\x9f\x6c\x9b\x57\xf5\x71\xed\x20\x41\xc0\x06\x20\x4b\
-\xcd\x0b\xaa\xbe\x08\x83\x07\x00\x14\x6a\x67\x21\x22\x0a\x3c\x83\
-\xb1\xb6\xe0\xf1\xd6\x05\xd5\xc7\x69\x47\xf1\x3b\x36\x00\x59\x68\
-\x59\x50\xf5\x5d\x31\xf8\x9d\x00\x61\xed\x2c\x44\x44\x79\xa4\xc8\
-\x18\xf3\xa7\xe6\xf9\x55\xa7\x69\x07\xf1\x33\x36\x00\x19\x6a\x9e\
-\x57\x7d\x09\x0c\x7e\x0a\x2e\xa4\x24\x22\xd2\x10\x15\xe0\xee\xe6\
-\x05\x55\x5f\xd6\x0e\xe2\x57\x6c\x00\x32\xd0\x32\xbf\xea\x72\x11\
-\x73\xad\x76\x0e\x22\xa2\x3c\x17\x12\x83\x5f\xb5\xcc\xab\x3c\x57\
-\x3b\x88\x1f\xb1\x01\x18\xa5\x96\xf9\x55\x97\x03\x58\xa0\x9d\x83\
-\x88\x88\x00\x00\x21\x88\xfc\x5f\xeb\x82\xea\x0b\xb5\x83\xf8\x0d\
-\x1b\x80\x51\x68\x9d\x5f\xf9\x23\xb0\xf8\x13\x11\x79\x8d\x18\x63\
-\x6e\x6a\x59\x50\xf5\x5d\xed\x20\x7e\xc2\xf9\xeb\x11\x6a\x9e\x57\
-\x3d\x57\xc4\xcc\xd1\xce\x41\x44\x44\x3b\x64\x44\xe4\x3b\x35\x0d\
-\x6d\xbf\xd0\x0e\xe2\x07\x6c\x00\x46\xa0\x65\x5e\xd5\xff\x40\xf0\
-\xdf\xda\x39\x88\x88\x68\x97\x0c\xc4\x5c\x58\xdb\xd0\x71\xb3\x76\
-\x10\xaf\x63\x03\xb0\x0b\xcd\xf3\xaa\x2f\xe1\x82\x3f\x22\x22\x5f\
-\x31\xc6\xe0\xfc\xba\x39\xed\xb7\x69\x07\xf1\x32\x36\x00\x3b\xd1\
-\x32\xbf\xf2\xfb\x80\x5c\xaf\x9d\x83\x88\x88\x46\x2d\x6d\x04\x5f\
-\xad\x6b\x68\xbf\x43\x3b\x88\x57\xb1\x01\xd8\x81\x96\x79\x55\xdf\
-\x83\xe0\x06\xed\x1c\x44\x44\x94\x19\x03\xa4\x60\x70\x56\xdd\x9c\
-\xf6\xfb\xb5\xb3\x78\x11\x1b\x80\x61\x34\xcf\xab\xfa\x92\x08\x7e\
-\x0b\xfe\xf9\x10\x11\xf9\x5d\x52\x44\x4e\xaa\x69\x68\xfb\xab\x76\
-\x10\xaf\x61\x81\xdb\x46\xf3\xbc\xca\x13\x21\xf2\x07\x6e\xef\x4b\
-\x44\x14\x18\xfd\xb6\xe0\x33\xf5\x0d\xed\xcf\x6a\x07\xf1\x12\x36\
-\x00\x1f\xd2\x3a\xb7\xfa\x93\xc6\x32\x8f\x00\x28\xd0\xce\x42\x44\
-\x44\x39\xd5\x0d\xdb\x3a\xb2\xf6\x8a\xd6\xff\x68\x07\xf1\x0a\x36\
-\x00\x9b\x2c\x9b\x5f\x79\xb0\x05\xf9\x07\x80\x52\xed\x2c\x44\x44\
-\xe4\x88\x55\xb6\x49\x1f\x5e\x3f\x67\xf9\x7b\xda\x41\xbc\x80\x0d\
-\x00\x80\x96\x79\x35\x33\x45\xec\x67\x0c\x30\x51\x3b\x0b\x11\x11\
-\x39\xc8\x60\x19\xc2\xd6\x61\xb5\x97\xb5\x76\x69\x47\xd1\x96\xf7\
-\x5b\x01\x2f\x99\x57\x3e\x49\xc4\x7e\x90\xc5\x9f\x88\x28\x0f\x08\
-\xea\x91\xb6\x1f\x5a\xd4\x34\xa9\x44\x3b\x8a\xb6\xbc\x6e\x00\x56\
-\x34\x4d\x2b\x0a\x4b\xec\x41\x03\x4c\xd7\xce\x42\x44\x44\xae\x39\
-\xb0\x28\x56\xb0\xf0\xc9\xa6\xfc\x5e\xec\x9d\xb7\x0d\x80\x59\x88\
-\x50\x3c\x16\xbe\x1b\x30\x87\x68\x67\x21\x22\x22\xb7\xc9\x71\xd5\
-\x05\x95\xb7\x68\xa7\xd0\x94\xb7\x0d\x40\xeb\xd2\xea\x9b\x00\x9c\
-\xa8\x9d\x83\x88\x88\x74\x88\x91\xaf\x35\x2f\xa8\xbe\x52\x3b\x87\
-\x96\xbc\x5c\x04\xd8\xbc\xa0\xfa\x4a\x31\xe6\xc7\xda\x39\x88\x88\
-\x48\x9d\x31\x82\x2f\xe7\xe3\x96\xc1\x79\xd7\x00\xb4\xce\xaf\x3e\
-\xc5\xc0\xdc\x87\x3c\xfc\x77\x27\x22\xa2\x61\x25\x60\xec\x63\x6a\
-\xe7\x74\x3e\xa5\x1d\xc4\x4d\x79\x55\x04\x5b\xe7\x56\x1f\x60\x2c\
-\xf3\x34\x80\x62\xed\x2c\x44\x44\xe4\x1d\x02\xac\xb1\x42\xe6\xd0\
-\xaa\xcb\x3a\x96\x69\x67\x71\x4b\xde\x34\x00\xad\x73\xab\xa7\xc2\
-\x32\x2f\x19\xa0\x42\x3b\x0b\x11\x11\x79\xd2\xdb\xb6\x84\x3f\x56\
-\xdf\xd0\xdc\xad\x1d\xc4\x0d\x79\xb1\x08\xb0\xe3\xfa\x8a\x42\x23\
-\xe6\x4f\x2c\xfe\x44\x44\xb4\x13\xb3\x2c\x93\xbe\xc7\x2c\x44\x48\
-\x3b\x88\x1b\x02\xdf\x00\x18\x03\x49\xc7\xad\xdf\x42\xf0\x11\xed\
-\x2c\x44\x44\xe4\x75\xe6\xd8\xb6\xe6\xca\x05\xda\x29\xdc\x10\xf8\
-\x06\xa0\x75\x41\x55\x83\x01\x4e\xd3\xce\x41\x44\x44\xfe\x60\x8c\
-\x5c\xd2\x32\xaf\xea\x2b\xda\x39\x9c\x16\xe8\x35\x00\xcb\xe6\x57\
-\x1d\x65\x01\x8f\x02\xf9\x31\x9c\x43\x44\x44\x39\x33\x20\xb6\x1c\
-\x56\x73\x45\xdb\x6b\xda\x41\x9c\x12\xd8\x06\xa0\xf9\xaa\xda\x6a\
-\x2b\x94\x7e\x85\x7b\xfc\x13\x11\x51\x86\x5a\x13\x91\xd4\xc1\x7b\
-\x5c\xb2\x62\x8d\x76\x10\x27\x04\x72\x0a\xa0\xe3\xfa\x8a\x42\x09\
-\xa7\x1f\x60\xf1\x27\x22\xa2\x2c\xd4\x44\x13\xe1\xbb\x82\xba\x28\
-\x30\x90\x0d\x40\x6a\x50\x6e\x87\xc1\x01\xda\x39\x88\x88\xc8\xe7\
-\x04\x47\xb7\x2d\xad\x6c\xd2\x8e\xe1\x84\xc0\x4d\x01\xb4\xcc\xaf\
-\xfc\x26\x20\x37\x6b\xe7\x20\x22\xa2\xc0\xb0\x01\xfb\xf8\xda\xc6\
-\xce\x47\xb5\x83\xe4\x52\xa0\x1a\x80\xe6\xb9\x15\xfb\x88\x65\xbd\
-\x00\xa0\x50\x3b\x0b\x11\x11\x05\x88\xc1\x3a\x63\x87\x0e\xa8\xbb\
-\xb2\xa5\x4d\x3b\x4a\xae\x04\x66\x0a\x60\x51\xd3\xa4\x12\xb1\xac\
-\x85\x60\xf1\x27\x22\xa2\x5c\x13\x8c\x97\x50\xea\x9e\x57\x6e\x3d\
-\x30\xa2\x1d\x25\x57\x02\xd3\x00\x14\x45\x0b\x6e\x05\xb0\x87\x76\
-\x0e\x22\x22\x0a\x2a\x39\x74\xc2\xfa\xd5\x57\x69\xa7\xc8\x95\x40\
-\x4c\x01\xb4\x2e\xa8\xbe\xd0\x18\xf3\x73\xed\x1c\x44\x44\x14\x78\
-\xc6\x36\x38\xb1\x7e\x4e\xfb\x43\xda\x41\xb2\xe5\xfb\x06\xa0\x6d\
-\x41\xd5\x6c\xdb\xe0\x65\x70\xe8\x9f\x88\x88\x5c\x20\xc0\x1a\xd8\
-\xb2\x4f\xcd\x15\x6d\xef\x6b\x67\xc9\x86\xaf\xa7\x00\x96\xdc\x38\
-\x3d\x66\x1b\xb9\x0b\x2c\xfe\x44\x44\xe4\x12\x03\x4c\x34\x62\x7e\
-\x6b\x8c\xbf\x1f\xa2\x7d\xdd\x00\x44\xfa\xe2\xd7\x01\x66\x1f\xed\
-\x1c\x44\x44\x94\x67\x04\x47\xb7\x2e\xa8\xfc\x9e\x76\x8c\x6c\xf8\
-\xb6\x7b\x69\x99\x5f\x71\x2c\x60\x3d\x02\x1f\xff\x3b\x10\x11\x91\
-\xaf\xc5\x61\x5b\x87\xd6\x5e\xd1\xfa\x1f\xed\x20\x99\xf0\x65\xf1\
-\x6c\x9e\x5b\x3b\x45\xac\xf4\x1b\x00\x26\x6b\x67\x21\xa2\xd1\xb1\
-\x62\xa5\x90\x50\x14\x12\x2d\x1e\xfa\x67\xa4\x10\x12\x8e\xc1\x0a\
-\x17\x60\xe8\x5b\x92\x81\xb1\x53\xb0\x13\x7d\x00\x00\x7b\xb0\x1b\
-\x00\x60\x12\x7d\x48\x0f\x76\x03\x76\x4a\x2f\x3c\xd1\xf6\xde\x89\
-\xc5\x53\x07\x4d\x6b\x5a\xd1\xaf\x1d\x64\xb4\xc2\xda\x01\x32\x21\
-\x56\xea\x66\x40\x58\xfc\x89\x3c\xc6\x8a\x16\x23\x32\x61\x06\x22\
-\x13\xea\x10\x2a\x99\x8c\x50\xc9\x14\x84\x4a\xa6\x20\xbc\xe9\x9f\
-\xa1\x92\xc9\x90\x70\x2c\x8b\x3b\x18\xa4\xfb\xd6\x0c\xfd\xaf\x77\
-\xe5\xa6\x1f\xaf\x42\xba\x77\x35\x92\xeb\x5b\x91\x5c\xbb\x14\xa9\
-\xee\x4e\xc0\xd8\x39\xfb\x77\x22\xda\x85\x3d\xe3\xb1\xf0\x7c\x00\
-\xdf\xd5\x0e\x32\x5a\xbe\x1b\x01\x68\x99\x57\x79\x2e\x44\x7e\xa5\
-\x9d\x83\x28\x9f\x49\x38\x86\xe8\xa4\x3d\x11\x99\xbc\x07\x22\xe3\
-\xa7\x23\x3a\x69\x77\x44\x26\xcc\x40\x78\xcc\x6e\xda\xd1\x60\x52\
-\x83\x48\xae\x5d\x86\xe4\xda\xa5\x48\xae\x59\x82\xe4\xba\x65\x88\
-\xbf\xff\xc6\x50\x63\x40\xe4\x0c\x63\x60\x8e\xad\x6b\xec\x78\x5c\
-\x3b\xc8\x68\xf8\xaa\x01\xe8\xb8\xaa\x62\xb7\x54\xc8\x7a\x13\xc0\
-\x38\xed\x2c\x44\xf9\xc4\x8a\x95\x20\x36\x75\x3f\xc4\x2a\x0e\x46\
-\xac\xe2\x20\x14\x54\x1c\x9c\xe5\x93\xbc\xfb\xd2\x7d\xab\x11\x7f\
-\xff\x0d\xc4\x3b\x5f\x46\xbc\xf3\x15\xc4\xdf\x7f\x1d\x26\x9d\xd0\
-\x8e\x45\xc1\xd1\x9a\x8a\x47\xf7\x9d\xd1\xb4\x74\xa3\x76\x90\x91\
-\xf2\x4d\x03\x60\x0c\xa4\x75\x41\xf5\x23\x80\x39\x56\x3b\x0b\x51\
-\xd0\x49\xa4\x08\x85\xb5\x87\xa3\xb0\xee\x48\x14\x54\x1c\x8c\xc8\
-\xc4\xe9\xf0\xd1\xb7\x8b\x11\x31\xc9\x7e\xc4\x57\xbc\x8e\xfe\x25\
-\x8f\xa3\xf7\xcd\xfb\x60\xc7\x7b\xb4\x23\x91\xcf\x89\xe0\xb6\x9a\
-\x86\xf6\x6f\x68\xe7\x18\x29\xdf\xfc\x8d\x6e\x59\x50\x79\x01\x8c\
-\xfc\x52\x3b\x07\x51\x50\x85\xcb\xa6\xa1\xb0\xfe\xd3\x28\x9a\x71\
-\x14\x0a\xaa\x3e\xea\xbb\x27\xfc\x6c\xd8\x89\x3e\x6c\x78\xfa\x3a\
-\x6c\x7c\x85\xb3\x8b\x94\x1d\x31\x72\x7c\xcd\x9c\xb6\x47\xb4\x73\
-\x8c\x84\x2f\x1a\x80\xe6\xab\x6a\xab\xad\x50\xfa\x2d\x03\x94\x68\
-\x67\x21\x0a\x92\xc8\xb8\x5a\x14\xef\xf5\x79\x14\x4d\x3f\x1a\xd1\
-\x29\xb3\xb4\xe3\xa8\xeb\x7d\xeb\x0f\x58\xf3\xd0\x0f\x00\x18\xed\
-\x28\xe4\x5f\xcb\x6d\x09\xcf\xae\x6f\x68\xee\xd6\x0e\xb2\x2b\xbe\
-\x78\x0b\x40\x42\xe9\x9b\x58\xfc\x89\x72\xc3\x8a\x95\xa0\x68\xc6\
-\x67\x50\xbc\xd7\x17\x50\x58\xf3\x71\xf8\xe4\x39\xc0\x15\x25\x7b\
-\x9d\x82\xe4\x9a\x25\xe8\x7e\xe1\x66\xed\x28\xe4\x5f\xbb\x59\x26\
-\xb5\x00\xc0\x05\xda\x41\x76\xc5\xf3\x7f\xf3\x9b\xe7\x55\x7d\x49\
-\x04\xbf\xd3\xce\x41\xe4\x6b\x62\xa1\xb0\xfa\x63\x28\xd9\xfb\x34\
-\x14\xed\xfe\x19\x48\x84\xbb\x67\xef\x88\xb1\x53\x58\x7e\xcb\xe1\
-\x48\x6d\x5c\xa1\x1d\x85\xfc\xcb\x18\x63\x8e\xa8\x9b\xd3\xf1\x8c\
-\x76\x90\x9d\xf1\x74\x03\xb0\xf8\xba\x69\x13\xa3\xc9\xc8\xdb\x80\
-\x99\xa4\x9d\x85\xc8\x8f\x24\x1c\x43\xf1\xcc\x13\x30\xe6\xa3\x17\
-\x22\x32\xa1\x5e\x3b\x8e\x6f\x74\xff\xeb\x26\xac\x7f\xfa\x3a\xed\
-\x18\xe4\x6b\xf2\x1e\xe2\xb2\x6f\x6d\x53\xeb\xa0\x76\x92\x1d\xf1\
-\xf4\x59\x00\xd1\x64\xe4\x46\x16\x7f\xa2\xd1\x0b\x95\x4c\xc6\xb8\
-\x23\x2e\x45\xe5\xb7\x5f\xc2\xc4\x13\xae\x67\xf1\x1f\xa5\xc2\xe9\
-\x47\x69\x47\x20\xdf\x33\xbb\x9b\x98\xb9\x52\x3b\xc5\xce\x78\x76\
-\x04\xa0\x75\x5e\xf5\x67\x8d\x98\x87\xb5\x73\x10\xf9\x49\x74\xd2\
-\x4c\x94\x7d\xe4\xbf\x50\x3c\xeb\x24\x48\x28\xaa\x1d\xc7\xb7\xec\
-\x78\x2f\xda\x6f\x98\xad\x1d\x83\xfc\x2f\x69\x8b\x7d\x60\x7d\x43\
-\xe7\x9b\xda\x41\x86\xe3\xc9\x45\x80\x1d\xd7\x57\x14\xa6\xe2\xe6\
-\x26\xed\x1c\x44\x7e\x11\x19\x57\x8b\xb1\x9f\xf8\x01\x8a\xf7\x3c\
-\x01\x1e\xee\xeb\x7d\x43\xc2\x31\x40\x2c\x6e\x29\x4c\xd9\x8a\x88\
-\xb1\x6e\x36\x06\x87\x8b\x78\xef\xd5\x12\x4f\x36\x00\xe9\xb8\x34\
-\x02\xa8\xd3\xce\x41\xe4\x75\xa1\xa2\x09\x28\xfb\xc8\xd7\x51\x76\
-\xf0\xd7\xf8\xc4\x9f\x43\xa9\xee\x0e\x16\x7f\xca\x09\x01\x3e\xde\
-\xba\xa0\xf2\x2b\x40\xc7\x6f\xb4\xb3\x6c\xcb\x73\x8f\x0a\x4b\xe7\
-\x57\x4c\x0f\xc1\x7a\x13\x40\x81\x76\x16\x22\xaf\xb2\x0a\xc6\x62\
-\xcc\xa1\x17\xa0\xec\xc0\xaf\x70\x45\xbf\x03\x7a\xdf\x7a\x00\x6b\
-\x1e\xfa\xbe\x76\x0c\x0a\x8e\xb5\x11\x93\xde\xa3\x62\xce\xf2\xb5\
-\xda\x41\x3e\xcc\x73\x23\x00\x21\x58\x3f\x03\x8b\x3f\xd1\xf0\x24\
-\x84\xb2\x03\xbf\x82\xb1\x87\x7d\x1f\x56\x41\x99\x76\x9a\xc0\xea\
-\xf9\xf7\x1d\xda\x11\x28\x58\x26\x24\x11\xfe\x31\x80\x6f\x69\x07\
-\xf9\x30\x4f\x8d\x00\x34\xcf\xab\x3a\x55\x04\xf7\x69\xe7\x20\xf2\
-\xa2\xd8\xd4\xfd\x30\xe1\xd8\x79\x88\x4e\xe1\xe2\x34\x27\xf5\x2f\
-\x7e\x14\xab\xfe\x78\xbe\x76\x0c\x0a\x1e\xdb\x86\x39\xb4\xbe\xb1\
-\xe3\x65\xed\x20\x9b\x79\x66\x04\x60\x68\xe1\x1f\xf8\xe2\x2d\xd1\
-\x36\xac\x82\x32\x8c\x3b\xe2\x32\x94\xee\x77\xce\xd0\xc2\x34\x72\
-\x4c\x72\x7d\x2b\xd6\x3c\x72\x89\x76\x0c\x0a\x26\xcb\x82\x75\x93\
-\x31\xf8\xa8\x57\x16\x04\x7a\xe6\xbb\x49\x2a\x6e\x5d\x06\xa0\x5a\
-\x3b\x07\x91\x97\x14\x4d\x3f\x0a\xbb\x7d\xed\x6f\x28\xdd\xff\x4b\
-\x2c\xfe\x0e\x4b\x6d\x5c\x81\x95\xf7\x7e\x91\xa7\x02\x92\x83\xcc\
-\x21\x2d\x57\x57\x9d\xa3\x9d\x62\x33\x4f\x4c\x01\x74\x5c\x55\xb1\
-\x5b\x2a\x64\x2d\x06\x50\xac\x9d\x85\xc8\x0b\x42\x45\x13\x30\xf1\
-\xf8\xeb\x50\x58\xff\x29\xed\x28\x79\x21\xb5\xa1\x03\x5d\x77\x9f\
-\x81\x54\xf7\x72\xed\x28\x14\x7c\xcb\x0b\xc3\xf1\x3d\xca\x2f\x5d\
-\xd9\xa7\x1d\xc4\x13\x8f\x14\x29\x4b\xae\x01\x8b\x3f\x11\x00\xa0\
-\xb0\xe6\x70\x4c\x3b\xef\x51\x16\x7f\x97\xa4\x36\xae\x40\xd7\x3d\
-\x67\xb1\xf8\x93\x5b\x76\x1b\x48\xc6\x2e\xd3\x0e\x01\x78\x60\x04\
-\xa0\x75\x5e\xf5\x47\x8d\x98\xe7\xbc\x90\x85\x48\x93\x84\x63\x18\
-\x7b\xd8\xf7\x31\xe6\x90\xf3\x39\xdc\xef\x92\xd4\xc6\x15\xe8\xba\
-\xeb\x74\xa4\x36\x74\x68\x47\xa1\xfc\x32\x60\xd2\xa1\x3d\xeb\xae\
-\x6c\x69\xd3\x0c\xa1\xfa\x5d\xc6\x18\x88\x11\xdc\x00\x16\x7f\xca\
-\x73\x91\x89\xbb\x63\xea\x97\xff\x8c\x31\x87\x5e\xc0\xe2\xef\x12\
-\x16\x7f\x52\x54\x28\x56\x6a\x9e\x76\x08\xd5\xc2\xdb\xbc\xa0\xea\
-\x74\x31\xb8\x57\x33\x03\x91\xb6\x92\x7d\xcf\xc0\x84\xa3\x7f\x3c\
-\xb4\xfd\x2c\xb9\x82\x73\xfe\xe4\x01\xc6\x02\x0e\xae\x6e\x6c\x7f\
-\x55\x2b\x80\xda\xa3\xc6\x2b\xb7\x1e\x18\x11\x83\xab\xb4\xee\x4f\
-\xa4\xce\x0a\x63\xdc\x91\x0d\x98\x78\xdc\x35\x2c\xfe\x2e\xe2\x9c\
-\x3f\x79\x84\xd8\x30\xaa\xaf\xbe\xab\x35\x00\x13\xd7\xaf\xf9\x06\
-\x80\x19\x5a\xf7\x27\xd2\x64\x15\x8e\x43\xf9\xe9\xbf\x1b\x1a\xf2\
-\x27\xd7\xa4\xba\x97\x73\xd8\x9f\x3c\x44\x8e\x6c\x59\x50\xf9\x19\
-\xb5\xbb\x6b\xdc\x74\x51\xd3\xa4\x92\xa2\x58\xe1\x12\x00\xe5\x1a\
-\xf7\x27\xd2\x14\x9d\x34\x13\x93\x4f\xb9\x1d\xe1\xb1\x95\xda\x51\
-\xf2\x4a\xaa\x7b\xf9\xd0\xb0\x3f\x8b\x3f\x79\x8a\xbc\x51\x13\x6f\
-\xdb\x5f\x9a\xe0\xfa\xe9\x53\x2a\x23\x00\x45\x05\x85\x17\x83\xc5\
-\x9f\xf2\x50\xd1\x1e\xc7\xa2\xfc\x4b\x0f\xb0\xf8\xbb\x2c\xb5\xa1\
-\x03\x5d\x77\x9d\xc6\xe2\x4f\x1e\x64\xf6\x69\x29\xa8\x3a\x5b\xe3\
-\xce\xae\x8f\x00\x74\xce\xdb\x6d\x42\x52\x42\xcd\x00\x78\x92\x09\
-\xe5\x95\xd2\xfd\xbf\x88\x09\xc7\xfc\x98\xab\xfc\x5d\xc6\x27\x7f\
-\xf2\x81\xd6\xfe\x78\xe9\x1e\xb3\x9b\x16\x25\xdc\xbc\xa9\xeb\xdf\
-\x89\x92\x12\xba\x14\x2c\xfe\x94\x67\xc6\x1c\x7a\x01\x26\x7c\xe6\
-\x2a\x16\x7f\x97\xb1\xf8\x93\x4f\xd4\x14\x46\x7b\xbe\xe2\xf6\x4d\
-\x5d\x1d\x01\x58\x7c\xdd\xb4\x89\xd1\x64\xb8\x19\x40\xa9\x9b\xf7\
-\x25\xd2\x23\x18\x77\x64\x03\xc6\x1c\xfa\x4d\xed\x20\x79\x87\xc5\
-\x9f\xfc\xc5\xb4\xa7\x8a\x63\xbb\xcf\xb8\x68\x69\xdc\xad\x3b\xba\
-\xfa\x38\x12\x49\x45\x1a\xc1\xe2\x4f\xf9\x42\x42\x98\x70\xec\x7c\
-\x16\x7f\x05\x2c\xfe\xe4\x3f\x52\x15\xee\x8f\x9f\xe7\xea\x1d\xdd\
-\xba\x51\xeb\xdc\xea\xa9\xc6\x32\x4b\x01\x14\xb9\x75\x4f\x22\x2d\
-\x12\x8a\x60\xe2\xe7\x7e\x86\xe2\x99\xc7\x6b\x47\xc9\x3b\x43\x0b\
-\xfe\x4e\x47\x6a\xe3\x0a\xed\x28\x44\xa3\xf5\x7e\x38\x66\xd7\x57\
-\x5e\xdc\x39\xe0\xc6\xcd\x5c\x1b\x01\x30\x96\x69\x00\x8b\x3f\xe5\
-\x03\x09\x61\xe2\x09\xd7\xb3\xf8\x2b\x48\x75\x2f\x1f\xda\xe4\x87\
-\xc5\x9f\xfc\x69\x6a\x6a\xd0\xfa\xba\x5b\x37\x73\x65\x04\xa0\x79\
-\x6e\xed\x14\xb1\xd2\x2d\x00\x0a\xdd\xb8\x1f\x91\x1a\xb1\x30\xe9\
-\x84\x1b\x50\x3c\xfb\x64\xed\x24\x79\x87\xc3\xfe\x14\x04\x02\x74\
-\xf6\xc5\x4b\xeb\xdd\x78\x23\xc0\x95\x11\x00\xb1\xd2\xdf\x07\x8b\
-\x3f\x05\x9e\x60\xe2\x71\x57\xb3\xf8\x2b\x48\x6d\xe8\x40\xd7\x9d\
-\xa7\xb2\xf8\x93\xef\x19\xa0\xa2\x30\xd6\xfb\x65\x37\xee\xe5\x78\
-\x03\xb0\x6c\x41\xdd\x18\x00\x5c\x05\x45\x81\x37\xee\xc8\x06\x94\
-\xec\x73\xba\x76\x8c\xbc\xc3\x61\x7f\x0a\x1a\x81\x69\x7c\xb2\x09\
-\x61\xa7\xef\xe3\x78\x03\x60\x21\xf5\x5d\x00\x63\x9c\xbe\x0f\x91\
-\xa6\xd2\xfd\xbf\xc4\xd5\xfe\x0a\x38\xec\x4f\x01\x55\x57\x5b\x50\
-\xed\xf8\xd3\x84\xa3\x6b\x00\xba\xae\x9d\x52\x3c\x90\x2a\x68\x01\
-\xcc\x24\x27\xef\x43\xa4\xa9\x68\x8f\xe3\x30\xf9\xe4\x5f\x72\x93\
-\x1f\x97\xa5\x36\xb4\xa3\xeb\xae\x33\xf8\xe4\x4f\x41\xf5\x4e\x4d\
-\xbc\x7d\x2f\x27\xcf\x08\x70\xf4\x3b\xd6\x40\x32\xf6\x75\x16\x7f\
-\x0a\xb2\xe8\xe4\x3d\x31\xe9\x84\xeb\x59\xfc\x5d\x36\x34\xec\x7f\
-\x36\x8b\x3f\x05\xd9\x9e\x2d\xd1\xca\x13\x9c\xbc\x81\x63\xdf\xb5\
-\xcc\x42\x84\x20\xf8\x8e\x53\xd7\x27\xd2\x66\x15\x8c\xc5\xe4\x2f\
-\xdc\x0a\x89\xf0\xed\x56\x37\x71\xd8\x9f\xf2\x85\x88\x75\xb1\x93\
-\xd7\x77\xac\x01\x68\x69\xae\x3a\x05\x40\x9d\x53\xd7\x27\x52\x25\
-\x21\x4c\x3a\xf1\x67\x08\x8f\xad\xd6\x4e\x92\x57\x58\xfc\x29\xbf\
-\x98\x23\x9a\xaf\xae\xf8\x88\x53\x57\x77\xac\x01\x10\x63\xbe\xef\
-\xd4\xb5\x89\xb4\x8d\xff\x64\x23\x0a\xeb\x8e\xd4\x8e\x91\x57\x58\
-\xfc\x29\x1f\x89\x1d\xfa\x9e\x53\xd7\x76\xa4\x01\x58\xb6\xa0\xea\
-\x30\x40\x0e\x75\xe2\xda\x44\xda\x8a\x67\x9d\x84\xb2\x8f\xb8\xb6\
-\x59\x17\x81\xc5\x9f\xf2\x97\x81\x39\x6d\xd9\x82\xba\x2a\x27\xae\
-\xed\x48\x03\x60\x81\x4f\xff\x14\x4c\xd1\x29\xb3\x30\xf1\xb8\xab\
-\xb5\x63\xe4\x95\xd4\x86\x76\x6e\xf2\x43\x79\x4b\x80\x70\x08\x49\
-\x47\xd6\xd3\xe5\xfc\x35\xc0\x65\x0b\xea\xaa\x2c\x93\x6a\x06\x10\
-\xca\xf5\xb5\x89\x34\x49\xa4\x10\xd3\xce\x7d\x04\x91\xf1\x5c\xda\
-\xe2\x16\x3e\xf9\x13\x01\x10\x6c\x28\x0c\xc5\x2b\xca\x2f\x5d\xd9\
-\x97\xcb\xcb\xe6\x7c\x04\xc0\x32\xa9\x6f\x81\xc5\x9f\x02\x68\xfc\
-\x27\xe7\xb0\xf8\xbb\x88\xc5\x9f\x68\x13\x83\xb1\x03\xa9\xd8\x39\
-\xb9\xbe\x6c\x4e\x1b\x80\x25\x37\x4e\x8f\x01\x38\x37\x97\xd7\x24\
-\xf2\x82\xc2\x9a\xc3\x50\x7a\xc0\x97\xb4\x63\xe4\x0d\x16\x7f\xa2\
-\xed\x5c\x64\x4c\x6e\x47\xed\x73\xda\x00\x84\xfa\x13\x67\x00\x98\
-\x9c\xcb\x6b\x12\x69\xb3\x62\xa5\x98\xf0\xd9\x6b\xe1\xd2\xe1\x99\
-\x79\x8f\xc5\x9f\x68\x58\xb3\x5b\xae\xae\x3c\x3c\x97\x17\xcc\x69\
-\x03\x20\x36\x2e\xcc\xe5\xf5\x88\xbc\x60\xc2\x67\xe6\x22\x5c\x36\
-\x4d\x3b\x46\x5e\x60\xf1\x27\xda\x31\xb1\x25\xa7\x35\x36\x67\x0d\
-\xc0\xb2\xab\x2b\x0f\x82\xc0\xb1\x0d\x0b\x88\x34\x14\xed\xfe\x19\
-\x14\xcf\x3a\x49\x3b\x46\x5e\x60\xf1\x27\xda\x05\xc1\xe7\x5b\xe7\
-\x56\x4f\xcd\xd5\xe5\x72\xd6\x00\x84\x8c\x7c\x23\x57\xd7\x22\xf2\
-\x82\x50\xd1\x04\xbe\xf2\xe7\x12\xbe\xea\x47\x34\x22\x11\x63\x99\
-\x2f\xe7\xea\x62\x39\x69\x00\xba\xae\x9d\x52\x6c\x0c\xce\xc8\xc5\
-\xb5\x88\xbc\x62\xec\x27\x2e\x85\x55\x38\x4e\x3b\x46\xe0\xf1\x60\
-\x1f\xa2\xd1\x90\xf3\x72\xb5\x18\x30\x27\x0d\xc0\x60\xb2\xe0\x4c\
-\x00\x65\xb9\xb8\x16\x91\x17\x44\xa7\xcc\x46\xe9\xbe\x8e\x1f\xc7\
-\x9d\xf7\x38\xec\x4f\x34\x5a\x66\xf7\xd6\x6b\x6a\x0e\xc9\xc5\x95\
-\x72\xd2\x00\x18\xb1\xff\x2b\x17\xd7\x21\xf2\x06\xc1\xf8\xa3\x9a\
-\x00\xe1\x76\x16\x4e\x62\xf1\x27\xca\x50\xda\xfe\x6a\x2e\x2e\x93\
-\x75\x03\xb0\x74\x6e\xe5\x5e\xdc\xf7\x9f\x82\xa4\x64\xaf\xcf\xa3\
-\xa0\x92\xeb\x59\x9d\x94\xea\x5e\x8e\xae\xbb\x4e\x67\xf1\x27\xca\
-\x84\xe0\xcc\x15\x4d\xd3\xb2\x3e\x87\x3c\xeb\x06\x20\x64\x59\xe7\
-\x65\x7b\x0d\x22\xaf\xb0\xa2\xc5\x18\x77\x64\x83\x76\x8c\x40\xfb\
-\xa0\xf8\x77\x77\x6a\x47\x21\xf2\xab\x31\x89\x82\xc8\xc9\xd9\x5e\
-\x24\xab\x06\xe0\xc9\x26\x84\x01\x73\x56\xb6\x21\x88\xbc\x62\xcc\
-\xc7\x2e\x42\xa8\x64\x8a\x76\x8c\xc0\x62\xf1\x27\xca\x0d\x63\x9b\
-\xaf\x66\x7b\x8d\xac\x1a\x80\xda\x68\xf5\x31\x00\xca\xb3\x0d\x41\
-\xe4\x05\xe1\x31\xbb\xa1\xec\xe0\xaf\x69\xc7\x08\xac\x0f\x5e\xf5\
-\x63\xf1\x27\xca\x9e\xe0\xd3\xd9\x1e\x13\x9c\x55\x03\x60\x00\x6e\
-\x8e\x4e\x81\x31\xe6\xa3\x17\x42\x42\x11\xed\x18\x81\x34\xb4\xe0\
-\xef\x2c\xbe\xea\x47\x94\x3b\x96\x20\x9d\xd5\x9e\x00\x19\x37\x00\
-\x4b\x9a\xa6\x97\x41\xcc\x89\xd9\xdc\x9c\xc8\x2b\xc2\x65\xd3\x50\
-\xb2\xf7\x69\xda\x31\x02\x89\xc3\xfe\x44\xce\x10\x98\xac\xf6\x04\
-\xc8\xb8\x01\x08\x47\xe3\xa7\x00\xc8\x7a\x15\x22\x91\x17\x8c\xf9\
-\xe8\xb7\x20\xa1\xa8\x76\x8c\xc0\x61\xf1\x27\x72\x90\x41\x6d\xcb\
-\xfc\xca\xc3\x32\xfd\xf2\x8c\x1b\x00\x11\x39\x3b\xd3\xaf\x25\xf2\
-\x92\x50\xc9\x64\x94\xec\xcd\x4d\x7f\x72\x8d\xc5\x9f\xc8\x79\x96\
-\x48\xc6\xd3\x00\x19\x35\x00\x4b\xe6\x95\x4f\xb2\x81\x23\x33\xbd\
-\x29\x91\x97\x8c\xf9\xe8\xb7\x21\xe1\x98\x76\x8c\x40\x61\xf1\x27\
-\x72\x87\x01\x4e\x59\xd4\x34\x3b\xa3\xe1\xcb\x8c\x1a\x80\xb0\x15\
-\x39\x55\x80\x70\x26\x5f\x4b\xe4\x25\xa1\x92\xc9\x28\xdd\x97\xc7\
-\x58\xe4\x12\x8b\x3f\x91\xab\xc6\x15\xc5\xba\x3f\x95\xc9\x17\x66\
-\x36\x05\x60\xc0\xf1\x52\x0a\x84\xb2\x83\xbf\x0e\x09\x17\x68\xc7\
-\x08\x8c\xd4\x86\x36\xbe\xea\x47\xe4\x3a\xc9\x68\x05\xf3\xa8\x1b\
-\x80\x96\x6b\x6a\xca\x01\x39\x3c\x93\x9b\x11\x79\x89\x84\xa2\x28\
-\xd9\xfb\x14\xed\x18\x81\x31\xf4\xaa\x1f\x4f\xf5\x23\x72\x9d\xc8\
-\x17\x32\x99\x06\x18\x75\x03\x60\xd2\xe6\x54\x00\x3c\x25\x85\x7c\
-\xaf\x78\xcf\x13\x10\x2a\x9a\xa0\x1d\x23\x10\x38\xec\x4f\xa4\xc8\
-\x60\x6c\x71\x41\xef\xa7\x47\xfb\x65\xa3\x6e\x00\x44\xcc\x17\x46\
-\xfb\x35\x44\x5e\x54\xba\xff\x17\xb5\x23\x04\x02\x8b\x3f\x91\x3e\
-\x1b\xf6\xa8\x87\x33\x47\xd5\x00\x74\x5c\x5f\x31\xde\x18\x70\xf8\
-\x9f\x7c\x2f\x3a\x79\x4f\xc4\x76\x3b\x50\x3b\x86\xef\xb1\xf8\x13\
-\x79\x83\x18\xf9\x9c\x59\x38\xba\xd1\xf9\x51\x35\x00\xc9\x84\x75\
-\x02\x57\xff\x53\x10\x94\xee\x7f\x8e\x76\x04\xdf\x63\xf1\x27\xf2\
-\x94\xc9\xcd\xcd\x55\x1f\x1d\xcd\x17\x8c\xaa\x01\x10\x98\x93\x46\
-\x97\x87\xc8\x7b\xac\x68\x31\x8a\x67\x7d\x5e\x3b\x86\xaf\xb1\xf8\
-\x13\x79\x4f\x68\x94\x35\x7a\xc4\x0d\xc0\x92\x1b\xa7\xc7\x60\xe4\
-\xe8\xd1\x47\x22\xf2\x96\xe2\x59\x27\xc2\x8a\x95\x68\xc7\xf0\x2d\
-\xbe\xea\x47\xe4\x51\x46\x4e\x1e\xcd\xc7\x47\xdc\x00\x44\xfa\x93\
-\x47\x01\x28\x1d\x75\x20\x22\x8f\x29\x9e\xf9\x39\xed\x08\xbe\xc5\
-\x57\xfd\x88\xbc\xcb\x00\xd3\xdb\xe6\x55\xcd\x1a\xe9\xe7\x47\xdc\
-\x00\xd8\x06\x9f\xcd\x2c\x12\x91\x77\x84\x0a\xc7\x23\x56\x75\x88\
-\x76\x0c\x5f\xe2\xb0\x3f\x91\xf7\xa5\x45\x8e\x1f\xe9\x67\x47\xdc\
-\x00\x58\x30\xc7\x64\x16\x87\xc8\x3b\x0a\x77\x3f\x1a\x62\x71\x1d\
-\xeb\x68\x71\xd8\x3f\xbf\xf0\xef\x88\x7f\x89\x31\x23\x9e\xaa\x1f\
-\xd1\x39\xc2\xcd\x57\xd5\x56\x4b\x28\xdd\x9a\x71\x22\x22\x8f\x98\
-\x72\xfa\x6f\x51\x58\x77\xa4\x76\x0c\x5f\x49\x6d\xe8\x18\x7a\xf2\
-\xe7\xb0\x7f\xa0\x15\x54\x1c\x8c\xd2\xfd\xbf\x88\xd8\x6e\x07\x20\
-\x54\x36\x0d\x30\x36\x52\xdd\x9d\x18\x58\xf6\x24\x7a\x5e\xfb\x3d\
-\x92\xeb\x5b\xb4\x23\xd2\xc8\x0c\x86\x63\xf6\xf8\xca\x8b\x3b\x07\
-\x76\xf5\xc1\x91\xb5\x79\x56\x9a\x4f\xff\xe4\x7b\x56\x41\x19\x0a\
-\xaa\x3f\xae\x1d\xc3\x77\xec\x44\x2f\x8b\x7f\x80\x59\xb1\x12\x4c\
-\x38\xee\x5a\x14\xcf\xdc\x7e\x96\x37\x32\xbe\x0e\x91\xf1\x75\x28\
-\x3b\xf8\x3c\x74\xbf\x70\x0b\xd6\x3f\x75\x0d\x60\x6c\x85\x94\x34\
-\x0a\x05\x89\xb8\xf5\x71\x00\x7f\xdf\xd5\x07\x47\x34\x05\x60\x09\
-\xb8\xfa\x9f\x7c\xaf\x68\xc6\x31\x90\x50\x44\x3b\x86\xef\x44\x27\
-\xef\x89\xd8\xd4\x7d\xb5\x63\x90\x03\xc2\x63\x2a\x30\xed\xdc\x47\
-\x86\x2d\xfe\x5b\x13\x8c\x39\xf4\x02\x4c\x3a\xe1\x06\x57\x72\x51\
-\x76\x46\x5a\xb3\x77\xd9\x00\x98\x26\x58\x00\x3e\x99\x75\x22\x22\
-\x65\x45\x7b\x70\x1d\x6b\xa6\x4a\xf6\x3d\x53\x3b\x02\xe5\x58\x78\
-\x4c\x05\xca\xcf\xbe\x17\xe1\xb1\xd5\x23\xfe\x9a\xe2\xd9\x27\xa3\
-\xec\xa0\x73\x1d\x4c\x45\x39\x61\x72\xd4\x00\x34\x17\x56\x1e\x60\
-\x80\x89\xd9\x27\x22\xd2\x23\xa1\x08\x0a\xab\x3f\xa6\x1d\xc3\xb7\
-\x8a\x67\x9d\x04\x2b\x5a\xac\x1d\x83\x72\x24\x5c\x36\x0d\xe5\x67\
-\xdd\x8d\xf0\x98\x8a\x51\x7f\xed\xd8\x4f\x5c\x0a\x2b\xc6\x37\xc2\
-\x3d\x6e\xbf\xa5\xd7\xd6\x4f\xde\xd5\x87\x76\xd9\x00\x58\x36\x37\
-\xff\x21\xff\x8b\x4d\xdd\x0f\x12\x29\xd4\x8e\xe1\x5b\x56\xb4\x18\
-\x45\x33\x47\xfc\x76\x11\x79\x58\x78\x4c\x05\xca\xcf\xb9\x0f\xe1\
-\xb1\x55\x19\x7d\xbd\x15\x2d\x46\xc9\x5e\x3c\x13\xce\xe3\x24\x94\
-\x4e\x7c\x6a\x57\x1f\xda\xf5\x1a\x00\xce\xff\x53\x00\x14\x54\x8f\
-\x6a\x8b\x6c\x1a\x46\xe9\xbe\x67\x69\x47\xa0\x2c\x65\xf3\xe4\xff\
-\x61\x85\x33\x58\x16\x3c\x6f\x04\xd3\x00\x3b\x6d\x00\x56\x34\x4d\
-\x2b\x82\x01\xc7\x4d\xc9\xf7\x0a\x2a\x0f\xd5\x8e\xe0\x7b\xb1\xdd\
-\x0e\x40\x64\xe2\xee\xda\x31\x28\x43\xe1\xb2\x69\x9b\xe6\xfc\x33\
-\x7b\xf2\xff\xb0\xd8\xb4\x03\x00\xee\x15\xe0\x71\xf2\x99\x5d\x7d\
-\x62\xa7\x0d\x40\xa2\x20\x72\x04\x80\x58\xce\xf2\x10\x29\x90\x50\
-\x04\xb1\xdd\x0e\xd0\x8e\x11\x08\xa5\x5c\x0c\xe8\x4b\xb9\x2c\xfe\
-\xc0\xd0\x34\x40\x74\xd2\x1e\x39\xb9\x16\x39\x66\xb7\x96\x79\x35\
-\x33\x77\xf6\x81\x9d\x36\x00\x66\x84\x2b\x09\x89\xbc\x2c\x36\x6d\
-\x7f\xce\xff\xe7\x48\xc9\x5e\x5f\x80\x84\xf9\x4c\xe0\x27\xb9\x2e\
-\xfe\x9b\x15\x54\x1c\x94\xd3\xeb\x51\xee\x19\xcb\xde\x69\x0d\xdf\
-\xc5\x1a\x00\xf3\x89\x5c\x86\x21\xd2\x50\x50\xc5\xe1\xff\x5c\xb1\
-\x0a\xc7\xa1\x68\xc6\x2e\x47\x16\xc9\x23\x9c\x2a\xfe\x00\x10\x63\
-\x03\xe0\x7d\x06\x47\xec\xec\xb7\x77\xd8\x00\xac\x68\x9a\x56\x64\
-\x00\xee\xfe\x41\xbe\x17\xab\x38\x58\x3b\x42\xa0\x70\x1a\xc0\x1f\
-\xb2\x5d\xed\xbf\x2b\xb1\xdd\xd8\x00\x78\x9d\x00\x3b\x5d\xfd\xbc\
-\xc3\x06\x60\xb0\x20\x74\x90\x8c\x74\xab\x60\x22\x0f\x8b\x4e\x99\
-\xad\x1d\x21\x50\x0a\x6a\x3e\x86\xc8\xb8\x1a\xed\x18\xb4\x13\xb9\
-\x5a\xed\xbf\xab\x7b\x84\xcb\xa6\x39\x76\x7d\xca\x89\x69\x4b\xaf\
-\x9a\x56\xb9\xa3\xdf\xdc\x61\x03\x20\xb6\x70\xdc\x94\x7c\x2f\x54\
-\x3c\x11\xa1\xa2\x09\xda\x31\x02\x46\x50\xb2\xcf\x69\xda\x21\x68\
-\x07\x9c\x1c\xf6\xdf\x56\xb4\x7c\x6f\xc7\xef\x41\xd9\xb1\x42\xe1\
-\x1d\xd6\xf2\x1d\xaf\x01\xb0\x0c\x0f\x4d\x27\xdf\x8b\x4e\xda\x53\
-\x3b\x42\x20\x95\xec\x73\x06\x8f\x8c\xf5\x20\x37\x8b\x3f\x00\x44\
-\x26\xcc\x70\xe5\x3e\x94\x8d\x1d\xd7\xf2\x1d\x37\x00\x46\xd8\x00\
-\x90\xef\x45\x26\xef\xf4\x2d\x18\xca\x50\xa8\x78\x12\x0a\xeb\x79\
-\x44\x88\x97\xb8\x5d\xfc\x01\x20\x32\x71\xba\x6b\xf7\xa2\x4c\xed\
-\x78\x34\x7f\xd8\x06\x60\xd9\x82\xba\x2a\x00\xbb\x39\x96\x87\xc8\
-\x25\x7c\x57\xd9\x39\x3c\x20\xc8\x3b\x34\x8a\x3f\x00\x44\x39\x02\
-\xe0\x79\x02\x1c\xb8\xa8\x69\x76\x74\xb8\xdf\x1b\xb6\x01\x10\xa4\
-\x38\xff\x4f\x81\xc0\x29\x00\xe7\x14\xd5\x7f\x92\x8b\xc0\x3c\x40\
-\xab\xf8\x03\x40\x64\x42\x3d\x20\x23\x3a\x55\x9e\xf4\x14\x14\xc4\
-\x36\x0e\xfb\x46\xdf\x0e\xfe\xcb\x71\xf8\x9f\x02\x40\x42\x1c\xa2\
-\x74\x92\x84\x50\xb2\xd7\x29\xda\x29\xf2\xda\x50\xf1\x5f\xa8\x52\
-\xfc\x01\x40\x22\x85\x08\x8f\xe1\x60\xb1\xd7\x89\x0c\x3f\x0d\x30\
-\xfc\x08\x80\x31\x1c\x01\x20\xdf\x0b\x97\x4d\x85\x84\x0b\xb4\x63\
-\x04\x5a\xc9\x3e\x67\xf0\x09\x50\xc9\x96\xf7\xfc\x77\xf8\x96\x97\
-\x2b\xb8\x10\xd0\x07\x0c\x86\x7d\xa8\xdf\xee\x6f\xee\x2b\xb7\x1e\
-\x18\x01\xb0\xbf\xe3\x81\x88\x1c\x16\x2a\x2d\xd7\x8e\x10\x78\xe1\
-\xb1\x95\xc0\xab\xdc\xab\x00\x00\x20\x00\x49\x44\x41\x54\x28\xac\
-\xfe\xb8\x76\x8c\xbc\x13\x1e\x53\x31\x34\xec\xef\xe0\x7b\xfe\x23\
-\xc5\x3d\x21\xbc\x4f\x0c\x46\x36\x02\x30\x7e\xc3\xca\xfd\x01\x70\
-\xe3\x74\xf2\xbd\x70\x09\x1b\x00\x37\x94\xec\xc7\xc5\x80\x6e\x1a\
-\xda\xe4\xe7\x1e\x4f\x14\x7f\x00\x08\x95\x4c\xd2\x8e\x40\xbb\x22\
-\xa8\x6f\x9e\x5b\x3b\x65\xdb\x5f\xde\xae\x01\x10\x5b\x78\x6c\x1a\
-\x05\x02\x47\x00\xdc\x51\x34\xe3\x33\xdc\x6c\xc9\x25\x5b\xe6\xfc\
-\x75\x87\xfd\x3f\x2c\x54\xcc\x06\xc0\x0f\xc4\x4a\x6e\x37\xb2\xbf\
-\x7d\x03\x00\x70\xdf\x54\x0a\x84\x30\x1b\x00\x57\x48\x28\x82\xe2\
-\xbd\xbe\xa0\x1d\x23\xf0\xbc\x58\xfc\x01\x20\x54\x32\x59\x3b\x02\
-\x8d\x80\x18\x99\xb5\xed\xaf\x6d\xd7\x00\x18\x11\x36\x00\x14\x08\
-\xa1\xd2\xed\x46\xbc\xc8\x21\xa5\xfb\x9d\x0d\x40\xb4\x63\x04\x96\
-\x57\x8b\x3f\x00\x84\x8a\xd9\x00\xf8\x81\x91\xed\x1f\xee\xb7\x5f\
-\xbe\x6b\x64\x2f\x57\xd2\x10\x39\x2c\xc4\x35\x00\xae\x89\x8c\xaf\
-\x43\xac\xe2\x40\xed\x18\x81\xe4\xe5\xe2\x0f\x70\x0a\xc0\x37\x86\
-\xa9\xed\x5b\x35\x00\x8b\xaf\x9b\x36\x11\x30\xfc\xaf\x49\x81\xc0\
-\xa1\x49\x77\x95\xee\x7b\x96\x76\x84\xc0\x19\x7a\xd5\xef\x7e\xcf\
-\x16\x7f\x00\x08\x15\x8d\x07\x78\x2e\x84\xe7\x89\x60\x96\x31\x5b\
-\x0f\xd3\x6d\xd5\x00\x44\x93\x51\x3e\xfd\x53\x60\x58\x05\x65\xda\
-\x11\xf2\x4a\xf1\xcc\xe3\x61\xc5\x4a\xb5\x63\x04\xc6\xd0\xab\x7e\
-\x0b\xbd\xbf\xd1\x8e\x58\x08\x15\x8e\xd5\x4e\x41\xbb\x60\x80\x92\
-\x96\xb9\xb5\x5b\xed\x18\x65\x6d\xfd\x01\xc3\x06\x80\x02\xc3\xe2\
-\x26\x40\xae\x92\x48\x21\x8a\x67\x9d\xac\x1d\x23\x10\xb6\xbc\xea\
-\xe7\xf1\xe2\xbf\x89\x84\x63\xda\x11\x68\x04\xac\xb0\xbd\x55\x8d\
-\xdf\xaa\x01\x10\x18\x2e\x00\xa4\xc0\xe0\x37\x25\xf7\x95\xee\x7f\
-\x8e\x76\x04\xdf\xf3\xfa\x9c\xff\x70\x24\xc4\xbf\x6b\x7e\x60\xec\
-\xad\x6b\xfc\xb6\x8b\x00\xd9\x00\x50\x20\x48\x28\x02\x48\x48\x3b\
-\x46\xde\x89\x4e\xde\x13\xd1\x72\x0e\x24\x66\xca\x8f\xc5\x1f\x60\
-\xb3\xed\x1b\xdb\xbc\x09\xb0\x6d\x03\xb0\xdd\x7b\x82\x44\x7e\xc4\
-\x6f\x48\x7a\x4a\x79\x4c\x70\x46\xfc\x5a\xfc\x01\xf0\xcc\x0d\xff\
-\x18\xbe\x01\x68\x9d\x5b\x3d\x15\x00\xb7\xf3\xa2\x40\xe0\x37\x24\
-\x3d\xc5\xb3\x4e\x86\x44\xb8\x9b\xf8\x68\xf8\xb9\xf8\x03\x80\x84\
-\x86\x3d\x6e\x9e\xbc\x67\x4f\xd3\xb4\xa5\xee\x7f\xf0\x83\xb4\xc5\
-\xf9\x7f\x0a\x0e\x36\x00\x7a\xac\x58\x29\x8a\x67\x1e\xaf\x1d\xc3\
-\x37\xfc\x5e\xfc\x01\x8e\xb8\xf9\x48\x51\x47\x51\x65\xed\xe6\x9f\
-\x7c\xd0\x00\x84\x44\xf6\xd0\xc9\x43\x94\x7b\x7c\x22\xd1\xc5\x3d\
-\x01\x46\xc6\x0f\xef\xf9\x8f\x04\xff\xbe\xf9\x87\x6d\x5b\x33\x37\
-\xff\x78\xcb\x1a\x00\x63\xaa\x55\xd2\x10\x39\xc0\xd8\x29\xed\x08\
-\x79\x2d\x56\x71\x10\x22\x13\x79\x4e\xfc\xce\xf8\xed\x55\xbf\x9d\
-\x31\xa9\xb8\x76\x04\x1a\x29\x63\x7f\x50\xeb\x3f\x68\x00\x8c\x01\
-\x1b\x00\x0a\x0c\x93\x1c\xd0\x8e\x90\xf7\x4a\xf7\x39\x43\x3b\x82\
-\x67\x05\x61\xd8\xff\xc3\x4c\x6a\x50\x3b\x02\x8d\x90\x81\x7c\xb0\
-\x19\xd0\x96\x11\x00\x11\x36\x00\x14\x18\xfc\x86\xa4\xaf\x64\xef\
-\x53\x39\x34\x3c\x8c\xa0\x15\x7f\x00\xb0\xf9\xf7\xcd\x3f\x8c\x6c\
-\x3f\x02\x00\x70\x0a\x80\x82\x83\x23\x00\xfa\xac\xc2\x71\x28\x9a\
-\x71\x8c\x76\x0c\x4f\x09\x62\xf1\x07\xd8\x70\xfb\x8a\x98\xad\x1b\
-\x80\x25\x37\x4e\x8f\x01\xe0\xd9\xa9\x14\x18\xc6\x4e\x71\x1d\x80\
-\x07\x94\xec\xc7\x3d\x01\x36\x0b\x6a\xf1\x07\xd8\x00\xf8\xcc\xd6\
-\x53\x00\xd2\x37\x58\x09\x1e\xe6\x4d\x01\xc3\x51\x00\x7d\x85\x35\
-\x87\x21\x3c\x96\x83\x8b\x41\x2e\xfe\x00\x60\x92\x6c\x00\x7c\x64\
-\xea\xa2\xa6\xd9\x51\x60\x53\x03\x10\xb1\x2d\xfe\x0d\xa5\xc0\x61\
-\x03\xe0\x05\x82\x92\x7d\x4e\xd3\x0e\xa1\x2a\x28\xaf\xfa\xed\x0c\
-\x47\x00\x7c\xc5\x2a\x89\xf5\x54\x00\x9b\x1a\x00\x63\x71\x01\x20\
-\x05\x8f\x9d\xec\xd3\x8e\x40\x00\x4a\xf7\x3e\x2d\x6f\xcf\x65\xf0\
-\xcd\x91\xbe\x59\x30\xe9\x04\xec\x78\xaf\x76\x0c\x1a\x05\x63\x0f\
-\xd5\xfc\xa1\x06\x00\xa6\x6a\xe7\x1f\x27\xf2\x9f\x74\xcf\x4a\xed\
-\x08\x04\x20\x54\x5a\x8e\xa2\xfa\x23\xb5\x63\xb8\x2e\x48\xef\xf9\
-\xef\xcc\xd0\xdf\x33\xa3\x1d\x83\x46\xc1\xc8\x50\xcd\xdf\xfc\x16\
-\x00\x47\x00\x28\x70\xd2\xbd\x6c\x00\xbc\x62\xec\xe1\x3f\x40\x61\
-\xcd\xe1\x80\x6c\x7b\xfe\x58\x30\x85\xc7\x56\x06\x7e\xd8\x7f\xb3\
-\x74\xdf\x2a\xed\x08\x34\x5a\xd6\x50\xcd\x0f\x03\x00\x04\xd5\x6c\
-\xe0\x28\x68\x52\x1b\x57\x68\x47\xa0\x4d\xa2\x53\x66\x63\xca\x99\
-\x77\x20\xdd\xd3\x85\xde\x45\x7f\x44\xcf\xbf\xef\x40\xaa\xbb\x53\
-\x3b\x96\x23\xc2\x65\xd3\x50\x7e\xe6\xdd\x81\x7f\xf2\xdf\x2c\xc5\
-\x91\x36\xff\xd9\xb4\xf3\xef\x50\x3b\x6e\x50\xa1\x1a\x86\xc8\x01\
-\xe9\x9e\x2e\xed\x08\xb4\x8d\x50\x69\x39\xc6\x1c\x7a\x01\x2a\xbe\
-\xf9\x0c\xa6\x9c\x79\x27\x8a\x67\x1e\x0f\xb1\xc2\xda\xb1\x72\x26\
-\xe8\xab\xfd\x87\xc3\x91\x36\x1f\x32\x52\x09\x6c\x1e\x01\x00\x26\
-\x2a\x46\x21\x72\x44\xaa\xe7\x7d\xed\x08\xb4\x23\x62\xa1\xb0\xe6\
-\x30\x14\xd6\x1c\x86\x74\xdf\x6a\xf4\xbd\xf3\x10\x7a\x5f\xbf\x1b\
-\x89\xd5\x8b\xb5\x93\x65\x2c\x1f\x8b\x3f\x00\xa4\x7b\x39\x05\xe0\
-\x3b\x16\x26\x00\x80\x65\x16\x22\x04\x60\x8c\x72\x1c\xa2\x9c\xe3\
-\x08\x80\x3f\x84\x8a\x27\xa1\xec\xa0\x73\x31\xed\x6b\x8f\xa1\xfc\
-\xec\x7b\x51\x3c\xfb\x64\xdf\x1d\x2f\x9b\x4f\x73\xfe\xdb\xe2\x1a\
-\x00\x1f\x32\x43\x0d\x40\xf8\xbd\xf6\x69\xe3\xa2\x5b\x6d\x09\x4c\
-\x14\x0c\x1c\x01\xf0\x1b\x41\x41\xd5\xa1\x28\xa8\x3a\x14\xf6\x31\
-\x57\xa1\xef\x9d\x07\xd1\xf3\xef\x3b\x90\x58\xb9\x48\x3b\xd8\x4e\
-\xe5\xdb\x9c\xff\xb6\x92\xeb\x9a\xb5\x23\xd0\xe8\x8d\x07\x80\x70\
-\x38\x21\xe3\xb9\x07\x20\x05\x51\xba\x6f\x0d\x4c\x6a\x10\x12\x2e\
-\xd0\x8e\x42\xa3\x64\xc5\x4a\x51\xba\xdf\xd9\x28\xdd\xef\x6c\xc4\
-\xdf\x7f\x1d\xbd\xaf\xdf\x83\xbe\x77\xfe\xe2\xb9\xf7\xcd\xc3\x63\
-\x2b\x51\x7e\xd6\xbd\x79\x5b\xfc\x01\x20\xb9\x76\xa9\x76\x04\x1a\
-\xbd\xd2\x45\x4d\xb3\xa3\x96\x15\x8a\x8c\xd7\x4e\x42\xe4\x08\x63\
-\x23\xb1\xe6\x3d\xed\x14\x94\xa5\xd8\xd4\x7d\x31\xe1\xd8\xf9\xa8\
-\xfc\xce\x6b\x98\x74\xf2\x2f\x51\x58\x73\x18\xbc\xb0\x73\x79\xbe\
-\x3f\xf9\x03\x43\xa3\x6c\xf6\xe0\x46\xed\x18\x94\x81\xc2\x48\xff\
-\xb8\xb0\x18\x33\x81\x6f\x00\x52\x50\x25\x57\xbe\x83\x58\xf9\x3e\
-\xda\x31\x28\x07\x24\x1c\x43\xf1\xcc\xe3\x51\x3c\xf3\x78\x24\xd7\
-\x35\xa3\xf7\x8d\x85\xe8\x7d\x63\x21\xd2\xfd\x6b\x5d\xcf\x92\xaf\
-\x0b\xfe\xb6\x95\x5c\xb3\x44\x3b\x02\x65\x28\x24\xe9\x09\x96\x6d\
-\x1b\x8e\x00\x50\x60\x25\x56\xbd\xad\x1d\x81\x1c\x10\x19\x5f\x87\
-\x71\x47\x36\xa0\xe2\xc2\x17\x31\xe9\xe4\x5f\xa2\x68\xfa\x51\xae\
-\x6d\x37\xcc\xe2\xbf\x45\x92\x23\x6c\xbe\x95\xb2\x30\x3e\x2c\x18\
-\x5a\x0d\x48\x14\x44\x6c\x00\x82\x4d\x42\x91\x0f\x46\x05\x52\x3d\
-\xef\xa3\x6f\xd1\x9f\x1c\xdd\x64\x88\xc5\x7f\x6b\x1c\x01\xf0\x2f\
-\x0b\x66\x82\x05\x60\x9c\x76\x10\x22\xa7\x24\x56\xbf\x0b\xee\x53\
-\x9e\x1f\xc2\xa5\x53\x37\x6d\x32\xf4\x34\x26\x9f\xfa\x2b\x14\xed\
-\xfe\x19\x20\x87\x9b\x0c\xe5\xf3\xab\x7e\x3b\x92\x60\x03\xe0\x5f\
-\x36\xc6\x87\x0d\xcc\x04\xf1\xc0\x82\x1a\x22\x27\xd8\x83\x1b\x91\
-\xea\x5e\x8e\xf0\x18\x6e\x76\x99\x37\x24\x84\xa2\xe9\x9f\x46\xd1\
-\xf4\x4f\xe7\x6c\x93\x21\x2e\xf8\xdb\x9e\xb1\x53\x1c\x61\xf3\x31\
-\x11\x6b\xbc\x25\x62\x71\x0d\x00\x05\x1a\xbf\x49\xe5\xaf\x2d\x9b\
-\x0c\x3d\x8e\x69\x5f\x7d\x08\xa5\xfb\x9d\x0d\x89\x14\x8e\xea\x1a\
-\x1c\xf6\x1f\x5e\xa2\xeb\x4d\x98\xe4\x80\x76\x0c\xca\x90\x6d\x30\
-\x9e\x53\x00\x14\x78\xf1\x15\xaf\x6b\x47\x20\x0f\x88\x96\xef\x3d\
-\xf4\x3a\xe1\x85\x2f\x62\xfc\xd1\xff\x83\xe8\xe4\x3d\x77\xf9\x35\
-\x1c\xf6\xdf\xb1\x78\xe7\x2b\xda\x11\x28\x0b\x22\x66\xbc\x05\x60\
-\x74\xed\x30\x91\xcf\x0c\xb6\x3d\xa7\x1d\x81\x3c\xc4\x2a\x18\x83\
-\xb2\x03\xbf\x8a\x69\xe7\x3d\x8a\x69\x5f\x7d\x08\x65\x07\x9d\x07\
-\xab\x60\xec\x76\x9f\xe3\xb0\xff\xce\x0d\x76\xbe\xac\x1d\x81\xb2\
-\x53\x10\x06\x4c\x54\x3b\x05\x91\x93\xe2\x5d\x6f\xc2\x8e\xf7\xc2\
-\x8a\x95\x68\x47\x21\x8f\x89\x96\xef\x8d\xf1\xe5\x7b\x63\xdc\x91\
-\x0d\xe8\x5f\xfa\x77\xf4\xfe\xe7\x2e\x0c\xb4\x3e\x87\x70\xd9\x54\
-\x0e\xfb\xef\x94\xe1\x08\x80\xdf\x19\x13\x0d\x03\x60\x03\x40\xc1\
-\x66\xa7\x30\xd8\xf1\xc2\xd0\xbb\xe2\x44\xc3\xd8\x6a\x93\xa1\x35\
-\x4b\x20\xd1\x62\x84\xcb\xa6\x69\xc7\xf2\xac\xe4\xfa\x56\x95\x0d\
-\x98\x28\x77\x8c\x48\xcc\x02\x1b\x00\xca\x03\x83\x6d\xff\xd2\x8e\
-\x40\x3e\x11\x99\x38\x83\xc5\x7f\x17\xe2\x1d\x1c\xfe\xf7\x3b\x01\
-\xa2\x6c\x00\x28\x2f\xb0\x01\x20\xca\x9d\x81\xe6\x7f\x6a\x47\xa0\
-\x6c\x19\x44\x2d\x08\x1b\x00\x0a\xbe\xc4\xaa\x77\x91\xee\x5b\xa3\
-\x1d\x83\xc8\xf7\x4c\x3a\x89\x81\x96\xa7\xb4\x63\x50\xb6\x2c\x44\
-\x2d\x18\x36\x00\x94\x0f\x0c\x06\xdb\x9f\xd7\x0e\x41\xe4\x7b\x83\
-\x1d\x2f\x78\xee\x58\x66\x1a\x3d\x63\x10\xb5\x00\x61\x03\x40\x79\
-\xa1\x7f\xc9\xdf\xb4\x23\x10\xf9\xde\x00\xff\x1e\x05\xc2\xa6\x35\
-\x00\x7c\x0d\x90\xf2\x43\xff\x92\xbf\xc1\x24\xfb\xb5\x63\x10\xf9\
-\x5a\xff\xd2\x7f\x68\x47\xa0\x9c\x30\x5c\x04\x48\xf9\xc3\x24\xfb\
-\xd1\xbf\xec\x9f\xda\x31\x88\x7c\x2b\xb1\xea\x1d\xc7\x4e\x5a\x24\
-\xb7\x09\x1b\x00\xca\x2f\xfd\xef\x3e\xa8\x1d\x81\xc8\xb7\x38\x8d\
-\x16\x20\x43\x6b\x00\x10\xd2\xce\x41\xe4\x96\xfe\xa5\xff\xe0\x02\
-\x26\xa2\x0c\xf5\x2d\xfa\xa3\x76\x04\xca\x11\x11\xc4\x2c\xed\x10\
-\x44\x6e\x32\xa9\x38\x06\x96\x71\x0e\x93\x68\xb4\xe2\x9d\xaf\x20\
-\xb9\xae\x59\x3b\x06\xe5\x90\x05\x20\xad\x1d\x82\xc8\x4d\x7d\xef\
-\x3c\xa4\x1d\x81\xc8\x77\x7a\xdf\xba\x5f\x3b\x02\xe5\x90\x31\x88\
-\x5b\x00\x12\xda\x41\x88\xdc\x94\x58\xbd\x18\x80\xd1\x8e\x41\xe4\
-\x1b\x26\x35\xc8\xc6\x39\x68\x04\x09\x36\x00\x94\x57\xc2\xa5\x53\
-\x31\xe5\x8c\xdf\x01\x10\xed\x28\x44\xbe\xd1\xff\xde\x63\xb0\xe3\
-\x3d\xda\x31\x28\xa7\x4c\xc2\x02\x84\x0d\x00\xe5\x85\x70\xe9\x54\
-\x4c\x39\xfb\x1e\x44\xc6\xd5\x68\x47\x21\xf2\x95\xde\x37\x39\xfc\
-\x1f\x3c\x92\xb0\x00\xc3\x06\x80\x02\x8f\xc5\x9f\x28\x33\xa9\x0d\
-\xed\x18\x68\x7d\x4e\x3b\x06\xe5\x98\x01\x12\x16\x84\x53\x00\x14\
-\x6c\x2c\xfe\x44\x99\xdb\xf8\xf2\xed\x80\xe1\x5a\xf1\xa0\x11\x41\
-\xc2\x82\x61\x03\x40\xc1\xc5\xe2\x4f\x94\x39\x7b\xb0\x9b\xc3\xff\
-\x41\x65\x73\x11\x20\x05\x18\x8b\x3f\x51\x76\x7a\xfe\xfd\x7b\xd8\
-\x89\x3e\xed\x18\xe4\x04\xbe\x05\x40\x41\xc5\xe2\x4f\x94\x1d\x93\
-\x4e\x62\xe3\xab\xbf\xd5\x8e\x41\x0e\x11\xe1\x3e\x00\x14\x40\x2c\
-\xfe\x44\xd9\xeb\x5b\xf4\x47\xa4\x7b\x57\x69\xc7\x20\x87\x18\x9b\
-\xaf\x01\x52\xc0\x84\x4a\xcb\x59\xfc\x89\xb2\x66\xb0\xf1\xe5\xff\
-\xd3\x0e\x41\x4e\x12\x49\x58\x00\x06\xb4\x73\x10\xe5\x42\xa8\x78\
-\x12\xca\xcf\xbc\x93\xc5\x9f\x28\x4b\x7d\xef\x3c\x88\xc4\xea\x77\
-\xb5\x63\x90\xb3\x06\x2d\x18\x7b\x9d\x76\x0a\xa2\x6c\x85\x8a\x27\
-\xa1\xfc\xec\x7b\x10\x99\x30\x5d\x3b\x0a\x91\xbf\x99\x34\x36\x3c\
-\xfb\x53\xed\x14\xe4\x30\x03\x59\x6b\x09\x64\xad\x76\x10\xa2\x6c\
-\xb0\xf8\x13\xe5\x4e\xcf\xeb\xf7\x20\xb9\x76\x99\x76\x0c\x72\x98\
-\x65\xec\x75\x96\x11\x70\x04\x80\x7c\x8b\xc5\x9f\x28\x77\x4c\x2a\
-\x8e\xee\xe7\x6e\xd2\x8e\x41\x2e\x30\x82\x75\x16\x0c\x1b\x00\xf2\
-\x27\x16\x7f\xa2\xdc\xda\xf8\xca\xaf\x91\xea\x79\x5f\x3b\x06\xb9\
-\xc0\x88\xac\xb5\x8c\xc5\x06\x80\xfc\x87\xc5\x9f\x28\xb7\xec\x78\
-\x0f\xba\x5f\xbc\x45\x3b\x06\xb9\x24\x64\x63\x9d\x65\x71\x0d\x00\
-\xf9\x0c\x8b\x3f\x51\xee\x6d\x78\xf6\x06\xd8\x03\xeb\xb5\x63\x90\
-\x4b\x6c\x58\x6b\x2d\x63\xa7\x39\x02\x40\xbe\xc1\xe2\x4f\x94\x7b\
-\x89\x55\xef\x70\xd7\xbf\x3c\x93\x8e\x84\xd6\x59\x76\x98\x53\x00\
-\xe4\x0f\x2c\xfe\x44\x0e\x30\x36\xd6\x3e\x36\x07\xb0\x53\xda\x49\
-\xc8\x45\x1b\xca\xc6\xae\xb7\xa2\x61\x70\x0a\x80\x3c\x8f\xc5\x9f\
-\xc8\x19\x3d\xff\xbe\x03\xf1\xe5\xaf\x69\xc7\x20\x77\x6d\x3c\xe8\
-\xfc\x57\x93\x56\xc5\xc6\xce\x0d\x00\x6c\xed\x34\x44\x3b\xc2\xe2\
-\x4f\xe4\x8c\x74\xdf\x1a\xac\x7f\xfa\x5a\xed\x18\xe4\x36\x19\x7a\
-\xf0\xb7\xa4\x09\x36\x0c\x36\x68\xe7\x21\x1a\x0e\x8b\x3f\x91\x73\
-\xd6\xfd\xe3\x47\xb0\x07\x37\x6a\xc7\x20\xb7\x6d\x7a\xfd\xdf\x02\
-\x00\x88\xac\x51\x0d\x43\x34\x8c\x50\x69\x39\xca\xbf\x78\x1f\x8b\
-\x3f\x91\x03\xfa\x97\xfc\x0d\x7d\x6f\xff\x59\x3b\x06\x69\xd8\xaa\
-\x01\x80\xe9\xd4\xcc\x42\xb4\xad\x2d\x07\xfb\xd4\x6a\x47\x21\x0a\
-\x9c\x74\xff\x5a\xac\x7d\xb4\x41\x3b\x06\x29\x31\x96\x69\x07\xb6\
-\x8c\x00\xb4\xa9\xa6\x21\xfa\x10\x0e\xfb\x13\x39\xc9\x60\xcd\xc3\
-\x97\x20\xdd\xc7\x81\xdf\x7c\x25\x90\x0f\x35\x00\x66\xa8\x1b\x20\
-\xd2\xc6\xe2\x4f\xe4\xac\x8d\x2f\xff\x0a\x03\xcb\x9e\xd0\x8e\x41\
-\x9a\x6c\xb4\x01\x5b\x1a\x00\x8e\x00\x90\x3a\x16\x7f\x22\x67\x25\
-\xd7\x2c\xc1\xfa\xa7\xae\xd1\x8e\x41\xda\xc4\xda\xd2\x00\xc8\xa6\
-\x9f\x10\x69\x61\xf1\x27\x72\x96\x49\x27\xb0\xfa\x2f\xdf\x81\x49\
-\x0d\x6a\x47\x21\x65\x92\x32\x5b\x1a\x80\x14\xd2\x9c\x02\x20\x35\
-\x2c\xfe\x44\xce\x5b\xf7\xf8\x0f\x91\x58\xf5\x8e\x76\x0c\xd2\x67\
-\xf7\xa5\x4b\x96\x03\x9b\x1a\x80\x78\x7c\x4c\x3b\xb8\x19\x10\x29\
-\x08\x15\x4f\x64\xf1\x27\x72\xd8\xc6\x57\x7e\x85\x9e\xd7\xef\xd1\
-\x8e\x41\xde\xf0\xfe\xec\xa6\x45\x09\x60\x53\x03\xb0\xe9\x27\x2b\
-\x55\x23\x51\xde\x09\x15\x4f\x44\xf9\x59\x2c\xfe\x44\x4e\x1a\x6c\
-\x7d\x0e\xeb\x9e\x98\xab\x1d\x83\xbc\xe3\x83\x29\x7f\x6b\xcb\xaf\
-\x71\x21\x20\xb9\xe7\x83\xe2\x3f\x71\x86\x76\x14\xa2\xc0\x4a\x75\
-\x77\x62\xf5\x9f\xbf\xcd\x83\x7e\xe8\x43\x64\xb8\x06\x80\x7b\x01\
-\x90\x3b\x58\xfc\x89\x9c\x67\x27\xfa\xb0\xea\xfe\xf3\x90\x1e\xe0\
-\x81\xaf\xf4\x61\x5b\x5e\xfb\x0f\x6f\xfe\x81\x00\xed\x46\x27\x0d\
-\xe5\x91\x50\xc9\x94\xa1\x39\xff\xf1\x75\xda\x51\x88\x82\xcb\xa4\
-\xb1\xe6\xc1\xef\x22\xb1\x7a\xb1\x76\x12\xf2\x1a\x31\xc3\x4e\x01\
-\xb4\x2a\x44\xa1\x3c\x12\x2a\x9e\x38\xb4\xbd\x2f\x8b\x3f\x91\x83\
-\x0c\xd6\x3e\x76\x05\xfa\x97\xfc\x4d\x3b\x08\x79\x90\xd8\xd6\xf6\
-\x0d\x80\xd8\xc2\x56\x91\x1c\xc3\x61\x7f\x22\x77\xac\x7f\x72\x3e\
-\x7a\xfe\x73\xb7\x76\x0c\xf2\x28\x11\xf3\xee\xe6\x1f\x7f\xd0\x00\
-\xd8\x11\x6b\x91\x4e\x1c\x0a\x3a\x16\x7f\x22\x77\x74\x3f\xff\x73\
-\x74\xbf\x78\xab\x76\x0c\xf2\xae\xfe\xaa\x78\x7b\xeb\xe6\x9f\x7c\
-\xd0\x00\xd4\x5e\xd6\xda\x25\x00\x4f\x87\xa0\x9c\x62\xf1\x27\x72\
-\x47\xcf\xbf\xef\xc0\xfa\xa7\xae\xd5\x8e\x41\x1e\x26\x06\x6f\x4b\
-\xd3\x96\x3d\x7f\xac\x0f\xff\xa6\x01\xde\x76\x3f\x12\x05\x15\x8b\
-\x3f\x91\x3b\xfa\x17\x3f\x8a\xb5\x8f\xff\xb7\x76\x0c\xf2\x38\x23\
-\xd8\x6a\xa4\xdf\xda\xe6\x77\x39\x0d\x40\x39\xc1\xe2\x4f\xe4\x8e\
-\xbe\xb7\xff\x8c\xd5\x7f\xbe\x10\x30\x69\xed\x28\xe4\x71\x06\xb2\
-\xe3\x06\x40\x2c\xb0\x01\xa0\xac\xb1\xf8\x13\xb9\xa3\xe7\xb5\xdf\
-\x61\xf5\x83\xdf\x83\xe1\x46\x3f\x34\x02\x96\xd9\xba\xc6\x87\x3f\
-\xfc\x13\x63\x64\x11\xc0\xdd\x00\x28\x73\x2c\xfe\x44\xee\xe8\x7e\
-\xe1\x66\xac\xff\xe7\x02\xed\x18\xe4\x23\xb6\x6d\xed\x78\x04\x20\
-\x11\x49\xbc\xe5\x6e\x1c\x0a\x12\x16\x7f\x22\x37\x18\xac\x7b\xe2\
-\x2a\x16\x7f\x1a\x15\x01\x7a\x6b\xaf\x68\xd9\xea\xe4\xdf\xad\x1a\
-\x80\x3d\x2e\x59\xb1\x06\xc0\x2a\x57\x53\x51\x20\xb0\xf8\x13\xb9\
-\xc0\xa4\xb1\xe6\x91\xcb\xb0\xf1\xa5\xdb\xb4\x93\x90\xcf\x18\xc8\
-\x22\x91\xad\x87\xf8\xc3\xdb\x7d\x4a\xb0\x08\x06\x93\x5d\x4b\x45\
-\xbe\xc7\xed\x7d\x89\x9c\x67\xc7\x7b\xb1\xfa\x2f\xdf\xc6\xc0\xb2\
-\x27\xb5\xa3\x90\x2f\xd9\xdb\xad\xf1\xb3\xb6\xfd\x05\xb1\xc1\x69\
-\x00\x1a\x31\x6e\xef\x4b\xe4\xbc\xe4\xfa\x16\xbc\xff\xfb\xcf\xb3\
-\xf8\x53\xc6\xc4\x6c\xbf\xc8\x7f\xbb\x11\x00\x63\x61\x11\xd7\x01\
-\xd2\x48\x70\xd8\x9f\xc8\x79\x03\xcb\x9e\xc4\xea\x07\x2f\x82\x3d\
-\xb8\x51\x3b\x0a\xf9\x98\x19\xe6\x2d\xbf\xed\x1a\x00\x5b\xcc\xab\
-\x96\x11\x77\x12\x91\x6f\xb1\xf8\x13\x39\xcd\xa0\xfb\x85\x5b\xb0\
-\xfe\xa9\x6b\x00\x63\xef\xfa\xe3\x44\x3b\x66\x12\xe1\xf4\xab\xdb\
-\xfe\xe2\x76\x0d\xc0\xfa\xb1\x93\x5f\x9f\xb0\x6e\x75\x3f\x80\x22\
-\x57\x62\x91\xef\xb0\xf8\x13\x39\xcb\x4e\xf4\x61\xcd\xc3\x3f\x40\
-\xff\xe2\xbf\x6a\x47\xa1\x60\x58\xba\x69\x91\xff\x56\xb6\x5b\x03\
-\x70\xd0\xf9\xaf\x26\x05\x78\xcd\x9d\x4c\xe4\x37\xa1\x92\xc9\x28\
-\x3f\xe7\x3e\x16\x7f\x22\x87\x24\x56\xbf\x8b\xf7\x7f\x7b\x22\x8b\
-\x3f\xe5\x8c\x00\x2f\x0c\xf7\xeb\xdb\x35\x00\x43\x9f\x36\xc3\x7e\
-\x98\xf2\xdb\xd0\x82\xbf\xbb\xb8\xe0\x8f\xc8\x09\xc6\xc6\xc6\x57\
-\x7e\x8d\xf7\x7f\xf3\x39\x24\xd7\x2e\xd5\x4e\x43\x41\x22\xf2\xe2\
-\x70\xbf\xbc\xfd\x6b\x80\x00\x6c\x5b\x5e\x14\x2e\x03\xa0\x0f\xe1\
-\xb0\x3f\x91\x73\x52\xdd\x9d\x58\xf3\xf0\x0f\x30\xd8\xce\x67\x2f\
-\xca\x3d\x31\xc3\x3f\xd4\x0f\xdb\x00\x84\x43\xe6\x5f\x69\x9b\x1d\
-\x00\x0d\x61\xf1\x27\x72\x4e\xef\x5b\x0f\x60\xdd\xe3\x57\xc2\x4e\
-\xf4\x69\x47\xa1\x60\x1a\x58\x3d\x7e\xd2\x1b\x40\xfb\x76\xbf\xb1\
-\xc3\x2a\xdf\x3a\xbf\xaa\xc3\x00\x15\x8e\xc6\x22\xcf\x0b\x95\x4c\
-\x46\xf9\xd9\xf7\x72\xd8\x9f\x28\xc7\xd2\xbd\xab\xb0\xe6\x91\x4b\
-\x31\xd0\xfc\x4f\xed\x28\x14\x6c\xcf\xd4\x36\xb6\x7f\x62\xb8\xdf\
-\x18\x76\x04\x00\x00\x20\x78\x01\x06\xa7\x3a\x16\x89\x3c\x8f\x73\
-\xfe\x44\xb9\x67\xec\x14\x7a\x5e\xfb\x3d\x36\x3c\xf3\x13\xd8\xf1\
-\x1e\xed\x38\x14\x70\x3b\x5a\x00\x08\xec\xa4\x01\x18\x5a\x07\x60\
-\xd8\x00\xe4\x29\x0e\xfb\x13\xe5\xde\x60\xdb\xf3\x58\xf7\xf7\xff\
-\x87\xc4\xea\xc5\xda\x51\x28\x6f\x0c\xbf\x00\x10\xd8\x49\x03\x60\
-\x2c\xf3\x82\x70\x47\xc0\xbc\xc4\xe2\x4f\x94\x5b\xa9\x9e\xf7\xb1\
-\xe1\xa9\x6b\xd1\xfb\xd6\x1f\xb4\xa3\x50\x9e\x09\xa5\xd3\xa3\x1f\
-\x01\x88\x46\xed\x57\x53\x71\x2b\x01\x20\xea\x48\x2a\xf2\xa4\x50\
-\xc9\xe4\xa1\xe2\x3f\xa1\x5e\x3b\x0a\x91\xef\x99\xe4\x00\xba\x5f\
-\xb8\x19\xdd\x2f\xde\x0a\x93\x1a\xd4\x8e\x43\xf9\xa7\xa3\xf2\xca\
-\xce\xe5\x3b\xfa\xcd\xe1\xf7\x01\x00\x50\x79\x71\xe7\x80\x18\xbc\
-\xe1\x4c\x26\xf2\xa2\x0f\xe6\xfc\x59\xfc\x89\xb2\x62\xd2\x09\xf4\
-\xfc\xe7\x2e\x74\xde\x7a\x04\x36\x3c\xf7\x33\x16\x7f\x52\x21\x82\
-\x1d\x0e\xff\x03\x3b\x5b\x04\x08\xc0\x88\x3c\x03\x98\x83\x72\x1b\
-\x89\xbc\x88\xc3\xfe\x44\xd9\x33\xc9\x7e\xf4\xbc\x7e\x2f\xba\x5f\
-\xf8\x25\xd2\xbd\xab\xb4\xe3\x50\x9e\x33\x36\x9e\xd9\xd9\xef\xef\
-\xa2\x01\x30\x4f\x8a\xc1\xf7\x73\x1b\x89\xbc\x86\xc5\x9f\x28\x3b\
-\x76\xa2\x0f\xbd\x6f\x2c\x44\xf7\xf3\xbf\x40\xba\x6f\xb5\x76\x1c\
-\x22\x00\x40\xda\x98\x27\x76\xf6\xfb\x3b\x6f\x00\x10\x7e\x5a\x90\
-\x4a\x03\x08\xe5\x34\x15\x79\x06\xe7\xfc\x89\x32\x97\xee\xe9\x42\
-\xcf\x7f\xee\xc2\xc6\xd7\x7e\x07\x7b\x60\xbd\x76\x1c\xa2\x0f\x5b\
-\x55\x3f\xa7\x63\x11\xae\xd8\xf1\x07\x76\xda\x00\xd4\x37\x34\x77\
-\xb7\xcc\xab\x7a\x15\x82\x8f\xe4\x3a\x19\xe9\xe3\x9c\x3f\x51\x26\
-\x0c\x06\x5a\x9f\x43\xef\x7f\xee\x42\xff\x7b\x8f\xc1\xd8\x29\xed\
-\x40\x44\xdb\x33\xf2\x84\x08\x76\xfa\x2e\xdf\x4e\x1b\x80\x4d\x9e\
-\x00\xd8\x00\x04\x0d\x87\xfd\x89\x46\xc7\x1e\xdc\x88\xbe\x77\x1f\
-\xc2\xc6\x57\x7e\x85\xe4\x9a\x25\xda\x71\x88\x76\x4e\xcc\x93\xbb\
-\xfa\xc8\x2e\x1b\x00\x23\xe6\x49\x81\x34\xe4\x26\x11\x79\x01\x87\
-\xfd\xf3\x57\x6a\x43\x07\x56\xde\x7f\x2e\xa2\x93\x66\xa2\x78\xe6\
-\x09\x28\xac\x3f\x12\x12\x2e\xd0\x8e\xe5\x59\x26\x15\xc7\x40\xcb\
-\x53\xe8\x7b\xe7\x21\xf4\xbf\xf7\x28\x4c\x2a\xae\x1d\x89\x68\x44\
-\xd2\xb0\x77\x3a\xff\x0f\xec\xe4\x2c\x80\xcd\x3a\xae\xaf\x28\x4c\
-\xc5\xad\x35\x00\x8a\x72\x92\x8a\x54\x0d\x3d\xf9\xdf\x8d\xc8\xc4\
-\xdd\xb5\xa3\x90\xcb\x52\xdd\xcb\xd1\x75\xf7\x19\x48\x6d\xe8\xf8\
-\xe0\xd7\x24\x5c\x80\xc2\x9a\xc3\x50\x34\xf3\x78\x14\xef\x71\x1c\
-\x24\x52\xa8\x98\xd0\x1b\x4c\x2a\x8e\x81\xd6\x67\xd1\xff\xee\xc3\
-\xe8\x5f\xf2\x18\xec\x78\xaf\x76\x24\xa2\xd1\x11\xb4\xd4\x36\xb4\
-\xef\x72\x0f\xf7\x11\x1d\xf9\xd7\x32\xbf\xfa\xaf\x80\x39\x36\xfb\
-\x54\xa4\x29\x54\x3c\x69\xe8\x60\x1f\x3e\xf9\xe7\x9d\xd4\x86\x8e\
-\xa1\xe2\xdf\xbd\xc3\x3d\x41\x60\xc5\x4a\x51\x34\xe3\x18\x14\xcd\
-\x38\x1a\x05\x55\x87\xc2\x2a\x1c\xe7\x62\x42\x5d\xf6\xe0\x46\x0c\
-\xb4\x3c\x85\xfe\xc5\x7f\x45\xff\xb2\x27\x61\x92\xfd\xda\x91\x88\
-\x32\x66\x20\xbf\xac\x6b\x6c\xbb\x70\x57\x9f\x1b\xc9\x1a\x00\x40\
-\xcc\xa3\x30\x60\x03\xe0\x63\x2c\xfe\xf9\x2b\xb5\xa1\x03\x5d\x77\
-\x9d\x8e\xd4\xc6\x15\x3b\xfd\x9c\x1d\xef\x41\xef\x5b\x7f\x18\xda\
-\xae\x56\x2c\x44\x27\xef\x89\x82\xea\x8f\xa1\xb0\xfa\xe3\x88\x55\
-\x7e\x04\x56\xb4\xd8\xa5\xc4\xce\xb3\xe3\x3d\x18\xec\x78\x09\x83\
-\xed\xcf\x63\xb0\xfd\x79\x24\x56\xbe\x03\x98\xb4\x76\x2c\xa2\xdc\
-\x10\xf3\xe8\x48\x3e\x36\xa2\x06\xc0\x48\xe8\x51\xe1\x5f\x0e\xdf\
-\xb2\x62\xa5\x98\x72\xc6\xef\x59\xfc\xf3\x50\x6a\x43\x3b\xba\xee\
-\x3a\x63\x97\xc5\x7f\x3b\xc6\x46\x62\xe5\x22\x24\x56\x2e\xc2\xc6\
-\x97\x6e\x03\xac\x30\x62\x53\xf7\x45\x41\xf5\xc7\x10\x9b\xba\x0f\
-\xa2\x93\x67\x21\x3c\xc6\x3f\xa7\x85\xa7\x36\xae\x40\x62\xd5\x3b\
-\x88\x77\xbc\x88\xc1\xf6\x17\x10\xef\x7a\x8b\x05\x9f\x82\x2a\x31\
-\x30\x38\xb0\xcb\x05\x80\xc0\x08\xa7\x00\x00\xa0\x65\x5e\xd5\x52\
-\x08\x58\x41\x7c\x46\x42\x11\x4c\x3e\xed\xd7\x28\xac\x39\x5c\x3b\
-\x0a\xb9\x6c\xb8\x39\xff\x5c\xb2\x62\x25\x08\x8f\xab\x45\x74\xe2\
-\xee\x88\x96\xef\x8d\x58\xf9\xde\x88\x4e\x99\x05\x89\xe8\x2d\x17\
-\xb2\xe3\xbd\x48\xad\x6f\x41\x62\xcd\x12\x24\xba\xde\x44\x72\xcd\
-\x7b\x48\xac\x7a\x07\xe9\xfe\xb5\x6a\x99\x88\xdc\x64\x04\xff\xa8\
-\x6b\x68\x3f\x6a\x24\x9f\x1d\xd9\x14\x00\x00\x23\xf2\x98\xc0\x7c\
-\x2b\xf3\x58\xe4\x3a\x09\x61\xd2\x89\x37\xb1\xf8\xe7\xa1\x8c\x9f\
-\xfc\x47\xc1\x8e\xf7\x22\xd1\xf5\x26\x12\x5d\x6f\x02\x1f\x3a\xe5\
-\x2e\x54\x3c\x09\xa1\xd2\x72\x84\x4b\xcb\x11\x2a\x9d\xba\xe5\x9f\
-\x65\xd3\x10\x2a\x99\x0c\x09\xc5\x60\xc5\x4a\x20\xa1\xc8\x88\x9a\
-\x05\x93\xec\x87\x49\x27\x61\x27\xfb\x61\xe2\xbd\x48\xf5\xbc\x8f\
-\x74\xef\xaa\x0f\xfe\x99\xee\x79\x1f\xe9\x9e\x95\x48\xf5\x76\x71\
-\xfb\x5d\x22\x23\x8f\x8d\xf4\xa3\x23\x6e\x00\x04\xe9\x07\x01\x8b\
-\x0d\x80\x8f\x8c\x3b\xe2\x52\x14\xed\x71\x9c\x76\x0c\x72\x99\x1b\
-\xc5\x7f\x67\xd2\x7d\xab\x91\xee\x5b\x3d\xd4\x18\x8c\x80\x84\x0b\
-\x20\xe1\xd8\xd0\x1a\x03\x2b\x0c\x93\x1c\x80\x49\x27\x3e\xf8\x27\
-\x11\x8d\x82\x65\xfd\x65\xa4\x1f\x1d\x71\x03\x90\x2a\x2e\x78\x32\
-\xdc\x97\xd8\x08\xa0\x2c\xa3\x50\xe4\xaa\xc2\xda\x23\x30\xe6\x90\
-\xf3\xb5\x63\x90\xcb\x52\xdd\xcb\xd1\x75\xcf\xd9\x6a\xc5\x3f\x13\
-\x26\x35\x08\x93\x1a\x84\x3d\xd8\xad\x1d\x85\xc8\xef\x96\xd4\x5d\
-\xde\xb2\x78\xa4\x1f\xde\xe1\x71\xc0\xdb\x9a\x71\xd1\xd2\xb8\x00\
-\x23\x1e\x5a\x20\x3d\xa1\xa2\x09\x98\x78\xc2\x4f\x00\x19\xf1\x7f\
-\x5e\x0a\x80\x54\xf7\xf2\xa1\xd5\xfe\x0e\xcd\xf9\x13\x91\xe7\x3d\
-\x30\x9a\x0f\x8f\xb2\x42\xc8\x9f\x47\xf7\x79\x72\x9f\x60\xe2\x89\
-\x37\x22\x54\x3c\x49\x3b\x08\xb9\x28\xb5\xa1\x1d\x5d\x77\x9e\x8a\
-\x54\x77\xa7\x76\x14\x22\x52\x22\x66\x74\x35\x7a\x54\x0d\x80\x89\
-\xcb\xc3\x00\x92\xa3\x4a\x44\xae\x2a\xd9\xe7\x34\x14\xd6\x1c\xa6\
-\x1d\x83\x5c\x34\xb4\xda\xff\x2c\x5f\x0d\xfb\x13\x51\xce\xad\xac\
-\x4e\xb4\xbd\x38\x9a\x2f\x18\x55\x03\x50\xdb\xd4\xba\x01\xc0\x33\
-\xa3\x8a\x44\xae\xb1\x62\x25\x18\xf7\x89\x4b\xb5\x63\x90\x8b\x3e\
-\x18\xf6\xe7\x93\x3f\x51\x5e\x13\xe0\x41\x69\x82\x3d\x9a\xaf\x19\
-\xfd\x24\xb1\x98\xfb\x47\xfd\x35\xe4\x8a\xb1\x87\xff\x00\xa1\x92\
-\xc9\xda\x31\xc8\x25\x2c\xfe\x44\xb4\x99\xc9\xa0\x36\x8f\xba\x01\
-\x48\xd9\xc9\xfb\x0d\xc0\x03\xb0\x3d\x26\x32\x61\x3a\x4a\x0f\xf8\
-\xb2\x76\x0c\x72\x49\x6a\x43\x1b\xe7\xfc\x89\x68\xb3\xb5\x6b\xc7\
-\x4d\xde\xe5\xe9\x7f\xdb\x1a\x75\x03\x30\x63\x4e\xd7\x6a\x08\x9e\
-\x1a\xed\xd7\x91\xb3\xc6\x7c\xec\xdb\x10\x6b\xc4\x6f\x75\x92\x8f\
-\xa5\xba\x3b\xd1\x75\xb7\xbf\x5e\xf5\x23\x22\xe7\x88\xe0\x81\x83\
-\xce\x7f\x75\xd4\xeb\xf3\x32\x7a\x4f\x4c\x80\xfb\x32\xf9\x3a\x72\
-\x46\xb8\x74\x2a\x8a\xf7\xfc\x9c\x76\x0c\x72\x41\xaa\xbb\x73\x68\
-\x93\x1f\x3e\xf9\x13\xd1\x26\xb6\x64\x56\x93\x33\x6a\x00\x12\xe1\
-\xd4\x1f\x38\x0d\xe0\x1d\x65\x87\x7c\x83\x4f\xff\x79\x80\xc5\x9f\
-\x88\xb6\x25\xc0\x9a\xb6\x81\xf6\x11\x1d\xfe\xb3\xad\x8c\x1a\x80\
-\x3d\x2e\x59\xb1\x46\x0c\x32\xba\x21\xe5\x96\x55\x50\x86\x92\x7d\
-\xce\xd0\x8e\x41\x0e\x4b\xae\x6f\x45\xd7\x1d\x9c\xf3\x27\xa2\x6d\
-\x08\xfe\xf8\xc9\xa6\xcc\x1e\xc8\xb3\xd9\x2a\xee\xce\x2c\xbe\x96\
-\x72\xa4\x78\x8f\xcf\x06\xea\x9c\x76\xda\x5e\xaa\xbb\x13\x2b\xef\
-\x39\x07\xa9\x9e\xf7\xb5\xa3\x10\x91\xc7\xd8\x30\x77\x64\xfa\xb5\
-\x19\x37\x00\x85\x91\xf8\xfd\x02\xf4\x66\xfa\xf5\x94\x1b\xc5\xb3\
-\x4e\xd2\x8e\x40\x0e\xe2\xb0\x3f\x11\xed\x44\x5b\xed\x60\xc7\xb3\
-\x99\x7e\x71\xc6\x0d\x40\xf9\xa5\x2b\xfb\x8c\x31\x23\x3e\x75\x88\
-\x72\x2f\x54\x32\x19\x05\x55\x87\x68\xc7\x20\x87\x70\xd8\x9f\x88\
-\x76\x46\x8c\xf9\xfd\x68\x37\xff\xf9\xb0\xec\x4e\x8b\x11\xf3\xfb\
-\xac\xbe\x9e\xb2\x52\x3c\xf3\x04\x40\x42\xda\x31\xc8\x01\xc9\xf5\
-\xad\x58\x79\xd7\x99\x1c\xf6\x27\xa2\x1d\x32\x08\x65\x35\x15\x9f\
-\x55\x03\x50\x53\xdf\xf9\x37\x00\x5d\xd9\x5c\x83\x32\x57\x58\xfb\
-\x09\xed\x08\xe4\x80\xe4\xfa\x96\xa1\x61\x7f\x16\x7f\x22\xda\x11\
-\x83\x97\x6a\xe7\xb4\xbe\x9b\xcd\x25\xb2\x6a\x00\xe4\x74\xa4\x8d\
-\xc8\x5d\xd9\x5c\x83\x32\x24\x21\xc4\x76\x3b\x50\x3b\x05\xe5\xd8\
-\x50\xf1\x3f\x13\xe9\x1e\xf6\xd5\x44\xb4\x63\x62\xc9\xef\xb2\xbd\
-\x46\xd6\x07\xc6\x8b\x2d\xb7\x65\x7b\x0d\x1a\xbd\xe8\x94\x3d\x61\
-\x15\x94\x69\xc7\xa0\x1c\x62\xf1\x27\xa2\x11\x1a\x14\x63\xb2\x7e\
-\xf8\xce\xba\x01\xd8\x34\x04\xf1\x7c\xb6\xd7\xa1\xd1\x29\xa8\xe4\
-\xe2\xbf\x20\x61\xf1\x27\xa2\x91\x32\xc0\x1f\xaa\x1b\xdb\xd7\x67\
-\x7b\x9d\xac\x1b\x00\x00\x10\xc8\xed\xb9\xb8\x0e\x8d\x5c\x74\xf2\
-\x2c\xed\x08\x94\x23\x2c\xfe\x44\x34\x1a\x96\x2d\xff\x97\x93\xeb\
-\xe4\xe2\x22\x05\xe1\xc1\x7b\x01\x6c\xcc\xc5\xb5\x68\x64\x22\xe3\
-\x6b\xb5\x23\x50\x0e\xb0\xf8\x13\xd1\x28\x35\x57\xcf\x69\xfb\x67\
-\x2e\x2e\x94\x93\x06\xa0\xfc\xd2\x95\x7d\x00\xee\xc9\xc5\xb5\x68\
-\x64\xc2\xe3\x6a\xb4\x23\x50\x96\x58\xfc\x89\x28\x03\xb7\x8b\xc0\
-\xe4\xe2\x42\x39\x69\x00\x36\x5d\xe8\x7f\x73\x75\x2d\xda\x39\x2b\
-\x56\x8a\x50\xd1\x04\xed\x18\x94\x05\x16\x7f\x22\xca\x40\x52\x6c\
-\xf9\x4d\xae\x2e\x96\xb3\x06\xa0\xba\xb1\xfd\x55\xc0\xbc\x90\xab\
-\xeb\xd1\x8e\x85\xcb\x76\xd3\x8e\x40\x59\x48\xae\x6b\x66\xf1\x27\
-\xa2\x0c\xc8\xfd\x35\x57\xb4\xe5\x6c\x83\x90\x9c\x35\x00\x00\x60\
-\x44\x7e\x91\xcb\xeb\xd1\xf0\x84\x87\xff\xf8\x56\x72\x7d\x0b\xba\
-\xee\x3e\x8b\xc5\x9f\x88\x46\xcd\x32\x26\xa7\x35\x36\xa7\x0d\xc0\
-\xc0\x60\xe9\x42\x00\x2b\x73\x79\x4d\xda\x9e\x15\x29\xd2\x8e\x40\
-\x19\xe0\xb0\x3f\x11\x65\xce\xbc\x5e\x3d\xa7\xfd\xb9\x5c\x5e\x31\
-\xa7\x0d\xc0\xec\xa6\x45\x09\x63\x72\xf3\x7a\x02\xed\x98\x44\xd9\
-\x00\xf8\x0d\x8b\x3f\x11\x65\xc3\xc0\xfa\x79\xae\xaf\x99\xd3\x06\
-\x00\x00\x6c\x3b\x79\x8b\x01\x52\xb9\xbe\x2e\x6d\x21\xe1\x02\xed\
-\x08\x34\x0a\xc9\x75\xcd\xe8\xba\xf3\x0c\x16\x7f\x22\xca\x8c\x60\
-\x43\x51\x78\xf0\xee\x5c\x5f\x36\xe7\x0d\xc0\xf4\x2b\x57\x74\x00\
-\xf8\x73\xae\xaf\x4b\x5b\x98\x74\x5c\x3b\x02\x8d\xd0\x07\x73\xfe\
-\xbd\x9c\x19\x23\xa2\xcc\x88\xc1\x6d\x9b\x5e\xb7\xcf\xa9\x9c\x37\
-\x00\x00\x60\x60\xae\x76\xe2\xba\x34\xc4\xc4\x73\xfe\xff\x03\x72\
-\x00\x57\xfb\x13\x51\x0e\x24\x53\xe9\xd4\x4d\x4e\x5c\xd8\x91\x06\
-\xa0\xbe\xb1\xe3\x65\xf0\x7c\x00\xc7\xd8\x49\x36\x00\x5e\xc7\xe2\
-\x4f\x44\xb9\x20\xc0\xbd\x9b\x46\xd6\x73\xce\x91\x06\x00\x00\x8c\
-\xc1\xf5\x4e\x5d\x3b\xdf\x99\x04\x1b\x00\x2f\xfb\xa0\xf8\x73\xd8\
-\x9f\x88\xb2\x26\x8e\xd5\x52\xc7\x1a\x80\xda\xe9\xed\x7f\x84\xc1\
-\x32\xa7\xae\x9f\xcf\x52\x1b\x57\x68\x47\xa0\x1d\x60\xf1\x27\xa2\
-\x9c\x11\x3c\x59\xd3\xd8\xf6\x6f\xa7\x2e\xef\x58\x03\x20\xa7\x23\
-\x0d\xe0\x46\xa7\xae\x9f\xcf\xec\x78\x0f\xd2\x03\xeb\xb4\x63\xd0\
-\x36\x58\xfc\x89\x28\x97\x6c\xdb\xd9\x91\x74\xc7\x1a\x00\x00\x88\
-\x25\x52\xb7\x03\xb2\xda\xc9\x7b\xe4\xab\xd4\xba\x56\xed\x08\xf4\
-\x21\x2c\xfe\x44\x94\x63\x6f\xd7\x25\xda\x1f\x71\xf2\x06\x8e\x36\
-\x00\xd3\x9a\x56\xf4\x0b\xec\x9f\x39\x79\x8f\x7c\x95\x5c\xdf\xa2\
-\x1d\x81\x36\x61\xf1\x27\xa2\x9c\x13\xf3\x63\x69\x82\xed\xe4\x2d\
-\x1c\x6d\x00\x00\x20\x19\x8f\xdd\x04\xc1\x06\xa7\xef\x93\x6f\x12\
-\x2b\x17\x69\x47\x20\x00\xc9\xb5\xcb\xd0\x75\xd7\x19\x2c\xfe\x44\
-\x94\x3b\x06\xcb\x5a\x07\x3b\xee\x77\xfa\x36\x8e\x37\x00\x33\x9a\
-\x96\x6e\x84\xc1\xcd\x4e\xdf\x27\xdf\x0c\x76\xbc\xa4\x1d\x21\xef\
-\x25\xd7\x35\x6f\xda\xe4\x67\x95\x76\x14\x22\x0a\x14\x33\xf7\x93\
-\x4d\xce\xef\xa8\xeb\x78\x03\x00\x00\x11\x93\xfe\x89\x00\xbd\x6e\
-\xdc\x2b\x5f\x24\x56\xbe\x0d\x3b\xde\xa3\x1d\x23\x6f\x71\xd8\x9f\
-\x88\x1c\xd2\xd1\x9f\x28\xbb\xd3\x8d\x1b\xb9\xd2\x00\x54\xcc\x59\
-\xbe\xd6\x08\x6e\x77\xe3\x5e\x79\xc3\xa4\x11\x5f\xfe\xaa\x76\x8a\
-\xbc\xc4\xe2\x4f\x44\x4e\x11\x91\xab\x67\x37\x2d\x4a\xb8\x71\x2f\
-\x57\x1a\x80\xa1\x3b\x59\x57\x03\xe8\x77\xed\x7e\x79\x60\xa0\xe5\
-\x69\xed\x08\x79\x87\x73\xfe\x44\xe4\xa0\x8e\x64\x51\xc4\xb5\x87\
-\x65\xd7\x1a\x80\xda\xcb\x5a\xbb\x04\xf8\x85\x5b\xf7\xcb\x07\x7d\
-\xef\x3c\x08\x98\xb4\x76\x8c\xbc\xc1\x39\x7f\x22\x72\x94\x60\xee\
-\x8c\x8b\x96\xba\x76\xda\x9b\x7b\x23\x00\x00\xe2\x91\xd4\x35\x00\
-\x38\x71\x9d\x23\xe9\xde\x55\x18\x6c\x7f\x51\x3b\x46\x5e\xe0\xb0\
-\x3f\x11\x39\xac\xad\x7f\xb0\xf4\xd7\x6e\xde\xd0\xd5\x06\x60\x8f\
-\x4b\x56\xac\x31\x46\x1c\x39\xd5\x28\x5f\xf5\xbd\xcd\x93\x97\x9d\
-\xc6\xe2\x4f\x44\x4e\x13\xc8\x8f\xdc\x9a\xfb\xdf\xcc\xd5\x06\x00\
-\x00\x24\x21\xd7\x72\x5f\x80\xdc\xe9\x5b\xfc\x08\x6c\x1e\x0e\xe4\
-\x98\xe4\xda\xa5\xe8\xba\xf3\x74\x16\x7f\x22\x72\x8e\xc1\xb2\x96\
-\x78\xdb\xef\xdc\xbe\xad\xeb\x0d\x40\x6d\x53\xeb\x06\x03\xf9\x89\
-\xdb\xf7\x0d\x2a\x7b\x70\x23\x7a\x5f\xbf\x47\x3b\x46\x20\x0d\xcd\
-\xf9\x9f\x8d\x74\x1f\x77\xb3\x26\x22\x07\x89\xf9\xa1\x1b\xef\xfd\
-\x6f\xcb\xf5\x06\x00\x00\x22\xd1\xf4\x4f\x04\xe8\xd4\xb8\x77\x10\
-\x6d\x7c\xe9\x36\x98\x74\x52\x3b\x46\xa0\x70\xd8\x9f\x88\xdc\x61\
-\x5e\xaf\x89\x77\xdc\xab\x71\x67\x95\x06\xa0\xf2\xe2\xce\x01\x23\
-\xb8\x4a\xe3\xde\x41\x94\xea\x79\x7f\xe8\x8d\x00\xca\x89\xa1\xe2\
-\xcf\x57\xfd\x88\xc8\x79\x36\xe4\x12\xa7\xf7\xfc\xdf\x11\x95\x06\
-\x00\x00\x6a\xea\xda\x6f\x07\xf0\xb6\xd6\xfd\x83\xa6\xfb\xf9\x5f\
-\xc0\xd8\xae\x8f\x20\x05\xce\xd0\x9c\xff\x69\x7c\xd5\x8f\x88\x9c\
-\x67\xf0\x58\x7d\x63\xfb\xdf\xb5\x6e\xaf\xd6\x00\xc8\xe9\x48\x8b\
-\x91\x1f\x6a\xdd\x3f\x68\x92\x6b\x97\xa2\xe7\xd5\xdf\x6a\xc7\xf0\
-\xb5\x0f\xde\xf3\xef\x5b\xa3\x1d\x85\x88\x82\xcf\x16\x23\x73\x34\
-\x03\xa8\x35\x00\x00\x50\xdd\xd8\xf6\x47\x00\xff\xd2\xcc\x10\x24\
-\x1b\x9e\xbd\x9e\x4f\xae\x19\xda\x32\xec\xcf\x3f\x3f\x22\x72\x9e\
-\x00\x77\xd6\x5c\xd1\xf6\x9a\x66\x06\xd5\x06\x40\x04\x46\x6c\xf9\
-\x0e\xa0\x33\xff\x11\x34\x76\xbc\x17\xeb\x9f\xba\x46\x3b\x86\xef\
-\xb0\xf8\x13\x91\xcb\x06\xd2\x12\xbe\x52\x3b\x84\x6a\x03\x00\x00\
-\x9b\x3a\xa0\x3b\xb4\x73\x04\x45\xef\x9b\xf7\x63\xa0\xf5\x19\xed\
-\x18\xbe\x91\x5c\xb3\x84\x73\xfe\x44\xe4\x2a\x03\x99\x5f\xdf\xd0\
-\xdc\xae\x9d\x43\xbd\x01\x00\x00\x63\x87\x2e\x03\xb0\x51\x3b\x47\
-\x30\x18\xac\xf9\xcb\x77\x59\xd0\x46\x20\xb9\x76\x19\xba\xee\x39\
-\x9b\x73\xfe\x44\xe4\x1a\x01\x3a\x0b\xe2\x49\x4f\xec\x85\xe3\x89\
-\x06\xa0\xee\x8a\x96\x95\x02\xc3\xb1\xeb\x1c\x49\xf7\xaf\xc5\xea\
-\x07\x2f\x02\x0c\x67\x56\x76\x24\xb9\x76\x19\xba\xee\x3e\x93\x8d\
-\x12\x11\xb9\xca\xc0\x5c\x32\xad\x69\x85\x27\x4e\xc6\xf5\x44\x03\
-\x00\x00\x26\x1e\xfa\x09\x04\x2d\xda\x39\x82\x62\xb0\xed\x79\x74\
-\xbf\x78\x8b\x76\x0c\x4f\x4a\xae\x59\x82\xae\xbb\x4e\x67\xf1\x27\
-\x22\xb7\x3d\x5f\xd3\xd0\xb1\x50\x3b\xc4\x66\x9e\x69\x00\x6a\x9b\
-\x5a\x07\xc5\xc8\x0f\xb4\x73\x04\xc9\xfa\xa7\xae\x45\xdf\xbb\x0f\
-\x6b\xc7\xf0\x14\x0e\xfb\x13\x91\x92\xb4\xd8\xf2\x6d\x11\x18\xed\
-\x20\x9b\x79\xa6\x01\x00\x80\x9a\xc6\xb6\x3f\x0a\xf0\x90\x76\x8e\
-\xc0\x30\x36\xd6\x3c\xf8\x5d\x2e\x0a\xdc\x84\xc3\xfe\x44\xa4\x45\
-\x0c\x7e\xa9\xfd\xda\xdf\xb6\x3c\xd5\x00\x00\x80\x15\x32\xdf\x03\
-\x30\xa8\x9d\x23\x28\x4c\x3a\x89\xd5\x7f\xfc\x26\x12\x2b\x17\x69\
-\x47\x51\xc5\xe2\x4f\x44\x8a\x56\x9a\x84\xf5\xdf\xda\x21\xb6\xe5\
-\xb9\x06\xa0\xea\xb2\x8e\x65\x00\x16\x68\xe7\x08\x12\x3b\xde\x8b\
-\x95\x0b\xbf\x82\xc4\xaa\x77\xb4\xa3\xa8\x48\x74\xbd\xc9\x57\xfd\
-\x88\x48\x8d\x11\x5c\x52\xdb\xd4\xba\x41\x3b\xc7\xb6\x3c\xd7\x00\
-\x00\x40\xaa\x38\xba\x00\xc0\x62\xed\x1c\x41\x92\xee\x5b\x8d\xae\
-\x3b\x4e\xc1\x40\xcb\xd3\xda\x51\x5c\x35\xd8\xf6\xaf\xa1\x27\xff\
-\xfe\xb5\xda\x51\x88\x28\x3f\x3d\x53\x7b\x79\xfb\x9d\xda\x21\x86\
-\xe3\xc9\x06\x60\xc6\x45\x4b\xe3\x10\xf3\x5d\xed\x1c\x41\x63\x27\
-\xfa\xb0\xea\xfe\xf3\xf2\xe6\xe4\xc0\xbe\x45\x7f\xc2\xca\x85\x5f\
-\x86\x1d\xef\xd5\x8e\x42\x44\xf9\x29\x61\x09\x2e\xf0\xd2\xc2\xbf\
-\x0f\xf3\x64\x03\x00\x00\xb5\x0d\x1d\x8f\x09\x77\x08\xcc\x39\x93\
-\x4e\x62\xf5\x5f\x2e\x42\xf7\xf3\xbf\x08\xee\x3e\x01\x26\x8d\x0d\
-\xcf\xde\x80\xd5\x0f\x7e\x0f\x26\x9d\xd4\x4e\x43\x44\xf9\x6b\x7e\
-\x75\x43\xbb\x67\x17\x60\x79\xb6\x01\x00\x80\xb0\x49\x7f\x0f\x00\
-\x27\x6e\x73\xcd\xd8\x58\xff\xd4\x35\xe8\xba\xe7\x9c\xc0\xcd\x8b\
-\xa7\xfb\xd6\x60\xe5\xbd\x5f\xc1\x86\x67\x7f\x0a\x78\xb3\xe9\x26\
-\xa2\xfc\xb0\x18\x71\xcb\xd3\xeb\xd9\x44\x3b\xc0\xae\xb4\x2e\xa8\
-\x3e\xdb\x18\xe3\xc9\xf9\x93\x20\x08\x15\x4f\xc4\xc4\x13\x6e\x40\
-\x61\xed\x27\xb4\xa3\x64\xad\x7f\xe9\x3f\xb0\xf6\xe1\x4b\x90\x1e\
-\x58\xa7\x1d\x85\x88\xf2\x9b\x6d\x0b\x8e\xa8\x6f\x68\x7f\x56\x3b\
-\xc8\xce\x78\xbe\x01\x00\x80\x96\xf9\x55\x7f\x06\x70\xa2\x76\x8e\
-\xe0\x12\x14\xcf\xfc\x2c\xc6\x7d\xea\x4a\x84\xcb\xa6\x69\x87\x19\
-\xb5\x74\xef\x4a\xac\xff\xe7\xd5\xe8\x7d\xeb\x01\xf0\xa9\x9f\x88\
-\xb4\x19\x63\x7e\x51\x37\xa7\xe3\xdb\xda\x39\x76\xc5\xd3\x53\x00\
-\x9b\xd9\x12\xfe\x0e\x80\x1e\xed\x1c\xc1\x65\xd0\xf7\xee\xc3\x58\
-\x7e\xdb\xa7\xb1\xe1\xd9\x9f\xc2\xa4\x13\xda\x81\x46\xc4\xd8\x29\
-\x6c\x7c\xe5\xd7\x58\xfe\xbf\x9f\x44\xef\x5b\x7f\x00\x8b\x3f\x11\
-\x69\x13\xa0\x33\x9d\x88\xcd\xd1\xce\x31\x12\xbe\x18\x01\x00\x80\
-\x96\xf9\x55\xdf\x00\x70\xab\x76\x8e\x7c\x10\x19\x5f\x87\x31\x87\
-\x5e\x80\xe2\xd9\x9f\x87\x84\x22\xda\x71\xb6\x63\xd2\x09\xf4\xbe\
-\x79\x3f\xba\x5f\xb8\x19\xa9\x0d\xea\x27\x6a\x12\x11\x6d\x66\x44\
-\xe4\xf8\x9a\x86\xb6\xbf\x6a\x07\x19\x09\xdf\x34\x00\x00\xd0\x32\
-\xbf\xea\x61\x00\x9f\xd5\xce\x91\x2f\x42\xc5\x13\x51\xba\xff\x97\
-\x50\x76\xd0\x79\xb0\x0a\xca\xb4\xe3\xc0\x4e\xf4\xa1\xf7\x8d\x85\
-\xe8\x7e\xf1\x16\xa4\x7b\xba\xb4\xe3\x10\x11\x6d\xeb\x96\xda\xc6\
-\xf6\x0b\xb4\x43\x8c\x94\xaf\x1a\x80\xf6\xab\x2b\xa7\xa5\xd3\xf2\
-\x26\x04\xe3\xb5\xb3\xe4\x13\x2b\x56\x82\xa2\xdd\x8f\x43\xf1\xac\
-\x13\x51\x58\xf3\x71\x40\x42\xae\xdd\xdb\xd8\x29\x0c\xb6\x3c\x83\
-\xbe\x77\xfe\x82\xfe\xf7\x1e\x83\x9d\xe8\x73\xed\xde\x44\x44\x23\
-\x26\x68\x89\x4b\xe1\xbe\x33\x2f\x5f\xec\x9b\xe9\x6a\x5f\x35\x00\
-\x00\xd0\x3c\xaf\xea\x4b\x22\xf8\x9d\x76\x8e\x7c\x15\x2a\x9a\x80\
-\xa2\x99\xc7\xa3\xb0\xf6\x13\x28\xa8\x3c\x18\x56\xc1\xd8\x9c\xdf\
-\x23\xdd\xbf\x16\xf1\x8e\x97\x31\xd0\xfa\x0c\xfa\xdf\x7d\x84\xab\
-\xfa\x89\xc8\xeb\x6c\x18\xfb\x53\xb5\x73\x3a\x9f\xd2\x0e\x32\x1a\
-\xbe\x6b\x00\x00\xa0\x75\x41\xd5\x7d\xc6\xe0\x54\xed\x1c\x79\x4f\
-\x2c\x44\x27\xee\x8e\x82\xaa\x43\x10\x99\x3c\x0b\x91\x71\x35\x88\
-\x8c\xab\x41\xa8\xb4\x7c\x84\x17\x30\x48\x6d\x7c\x1f\xa9\xf5\xad\
-\x48\xae\x6f\x45\x62\xe5\xdb\x18\xec\x78\x01\xc9\x35\x4b\xc1\x05\
-\x7d\x44\xe4\x17\x06\xe6\x27\x75\x8d\x1d\x97\x68\xe7\x18\xad\xb0\
-\x76\x80\x4c\xa4\x42\x91\x0b\x43\xa9\xe4\x61\x00\x46\x5a\x69\xc8\
-\x09\xc6\x46\x62\xf5\xbb\x48\xac\x7e\x77\xab\x5f\x96\x48\x11\xc2\
-\xa5\xe5\x90\x68\x31\xac\x58\x29\xac\x48\x21\x24\x5c\x00\x93\x1a\
-\x84\x9d\xe8\x83\x9d\xe8\x83\x89\xf7\x20\xd5\xd3\x05\x93\xe2\xc1\
-\x8f\x44\xe4\x6b\x8b\x22\x31\xf3\x43\xed\x10\x99\xf0\xe5\x08\x00\
-\x00\x34\xcf\xaf\x3c\x46\x20\x8f\xc2\xc7\xff\x0e\x44\x44\xe4\x6b\
-\x71\x23\xa1\x43\xea\x1a\x5a\x5e\xd7\x0e\x92\x09\x5f\xec\x03\x30\
-\x9c\xba\xc6\x8e\xc7\x01\xdc\xa8\x9d\x83\x88\x88\xf2\x94\xc1\x65\
-\x7e\x2d\xfe\x80\x8f\x1b\x00\x00\x48\x15\x47\x2f\x07\x8c\x6f\xff\
-\xf0\x89\x88\xc8\xa7\x0c\x1e\xab\x69\x6c\xbf\x49\x3b\x46\x36\x7c\
-\xdd\x00\xcc\xb8\x68\x69\xdc\x32\x72\x36\x80\x01\xed\x2c\x44\x44\
-\x94\x2f\x64\x35\xc2\xd6\x57\xbd\x7a\xcc\xef\x48\xf9\xba\x01\x00\
-\x80\xea\x39\xed\x6f\x03\xe6\x62\xed\x1c\x44\x44\x94\x17\x6c\x11\
-\x7c\xa5\xf6\xb2\x56\xdf\xef\x46\xe6\xfb\x06\x00\x00\x6a\x1b\x3b\
-\x6e\x11\xe0\x0e\xed\x1c\x44\x44\x14\x78\x57\xfb\x65\xab\xdf\x5d\
-\x09\x44\x03\x00\x00\x7d\xf1\x81\x0b\x00\xbc\xbb\xcb\x0f\x12\x11\
-\x11\x65\xe6\xe9\xd6\x78\xfb\x7f\x6b\x87\xc8\x95\x40\xbd\x8a\x2c\
-\x36\x82\x00\x00\x0d\xd4\x49\x44\x41\x54\x42\xb7\x6c\x41\xc5\xde\
-\x96\xb1\x5e\x00\x50\xa4\x9d\x85\x88\x88\x02\x65\x55\x38\x6d\x1f\
-\x50\x79\x65\xe7\x72\xed\x20\xb9\x12\x98\x11\x00\x00\xa8\x6f\xe8\
-\x7c\xd3\x18\x7c\x4f\x3b\x07\x11\x11\x05\x8a\x6d\x60\xbe\x14\xa4\
-\xe2\x0f\x04\xac\x01\x00\x80\xba\x39\xed\xb7\x01\x3c\x2b\x80\x88\
-\x88\x72\xe6\xc7\x9b\xf6\x9e\x09\x94\xc0\x35\x00\x00\x80\xb8\x75\
-\xbe\x18\xbc\xa2\x1d\x83\x88\x88\x7c\xef\xf1\x9a\xfa\xf6\x1f\x6b\
-\x87\x70\x42\x20\x1b\x80\xda\xa6\xd6\xc1\xb4\x15\x3e\x05\x90\xd5\
-\xda\x59\x88\x88\xc8\xb7\x96\x20\x6e\x9d\x21\xa7\x23\xad\x1d\xc4\
-\x09\x81\x6c\x00\x00\xa0\xbe\xa1\xb9\x5d\x80\x33\x0d\x90\xd2\xce\
-\x42\x44\x44\xfe\x22\x40\x6f\xda\x36\x5f\xa8\x6d\x6a\xdd\xa0\x9d\
-\xc5\x29\x81\x6d\x00\x00\xa0\xa6\xb1\xed\x09\x40\xe6\x68\xe7\x20\
-\x22\x22\x5f\x31\xb6\xe0\x6b\xd3\xaf\xe8\x78\x4b\x3b\x88\x93\x02\
-\xdd\x00\x00\x40\x6d\x43\xdb\x75\x30\x72\x8f\x76\x0e\x22\x22\xf2\
-\x09\xc1\xb5\x75\x0d\xed\x0b\xb5\x63\x38\x2d\xf0\x0d\x80\x08\x0c\
-\x12\x72\x2e\x20\x2f\x6a\x67\x21\x22\x22\xaf\x33\x7f\xad\xa9\x6b\
-\xcf\x8b\x91\xe3\xc0\x37\x00\xc0\xd0\xa2\x40\x84\xe4\x64\x00\x1d\
-\xda\x59\x88\x88\xc8\xb3\xde\xb6\x25\x72\x56\x50\x17\xfd\x6d\x2b\
-\x2f\x1a\x00\x00\xa8\xbd\xac\xb5\x4b\x20\x27\x01\xe8\xd3\xce\x42\
-\x44\x44\x9e\xb3\xd2\x96\xf0\x71\xf5\x0d\xcd\xdd\xda\x41\xdc\x92\
-\x37\x0d\x00\x00\xd4\x34\xb6\xfd\x5b\x8c\x7c\x19\x80\xad\x9d\x85\
-\x88\x88\x3c\x63\x50\x8c\x7c\xbe\xbe\xa1\xb9\x5d\x3b\x88\x9b\xf2\
-\xaa\x01\x00\x80\x9a\x39\x6d\x0f\x00\xb8\x52\x3b\x07\x11\x11\x79\
-\x82\x01\xcc\x79\x35\x73\xda\x9e\xd7\x0e\xe2\xb6\xbc\x6b\x00\x00\
-\xa0\xb6\xb1\x7d\xbe\x31\xe6\x17\xda\x39\x88\x88\x48\x5d\x63\x6d\
-\x63\xc7\xdd\xda\x21\x34\xe4\x65\x03\x00\x00\xb5\xd3\x3b\xbe\x0b\
-\x91\x3f\x69\xe7\x20\x22\x22\x1d\x22\xb8\xad\xb6\xb1\xfd\x6a\xed\
-\x1c\x5a\xf2\xb6\x01\x90\xd3\x91\x0e\x47\xd3\x67\x03\xc8\xbb\x61\
-\x1f\x22\xa2\x7c\x67\x80\x87\x5b\x06\xdb\xbf\xa5\x9d\x43\x93\x68\
-\x07\xd0\xb6\xf8\xba\x69\x13\xa3\xc9\xf0\xbf\x00\xcc\xd0\xce\x42\
-\x44\x44\xce\x13\x83\x57\x0a\x22\xf1\x23\xcb\x2f\x5d\x99\xd7\x6f\
-\x85\xe5\xed\x08\xc0\x66\x7b\x5c\xb2\x62\x8d\x6d\xd2\x27\xf0\xe0\
-\x20\x22\xa2\xe0\x13\x60\x69\x2a\x12\x39\x3e\xdf\x8b\x3f\xc0\x06\
-\x00\x00\x50\x3f\x67\xf9\x7b\x46\xac\xa3\x21\x08\xec\xa1\x0f\x44\
-\x44\x84\x15\x48\xc9\x31\xd3\x2f\x5d\xb6\x4a\x3b\x88\x17\xb0\x01\
-\xd8\xa4\xae\xa1\xe5\x75\x18\xeb\xf3\x00\x06\xb5\xb3\x10\x11\x51\
-\x8e\x09\x36\x18\x09\x7d\xb6\xe6\x87\x6d\x2d\xda\x51\xbc\x82\x0d\
-\xc0\x87\xd4\x36\xb6\xfe\xd3\x08\x4e\xe7\x11\xc2\x44\x44\x81\xd2\
-\x6f\xd9\x38\xa1\xae\xa1\xe5\x75\xed\x20\x5e\xc2\x06\x60\x1b\x75\
-\x0d\xed\x0f\x42\x70\x2e\xb8\x5b\x20\x11\x51\x10\x24\x00\xfb\x94\
-\xea\x39\xed\xcf\x69\x07\xf1\x1a\x36\x00\xc3\xa8\x6b\x68\xbf\xc3\
-\x08\xbe\xa7\x9d\x83\x88\x88\x32\x67\x80\x94\x18\x39\xab\xb6\xb1\
-\xf3\x51\xed\x2c\x5e\xc4\x06\x60\x07\xea\x1a\xda\x6f\x82\xc1\xf7\
-\xb5\x73\x10\x11\x51\x46\xd2\x16\xe4\xab\x9b\xb6\x7f\xa7\x61\xb0\
-\x01\xd8\x89\xda\x39\xed\x3f\x15\xc8\x25\xda\x39\x88\x88\x68\x54\
-\x8c\x31\xb8\xa0\xa6\xb1\xed\x4e\xed\x20\x5e\xc6\x06\x60\x17\x6a\
-\x1a\xdb\x7e\x02\xe0\x7f\xb4\x73\x10\x11\xd1\x88\x18\xc0\x7c\xab\
-\x6e\x4e\xfb\x6d\xda\x41\xbc\x8e\x0d\xc0\x08\xd4\x36\xb6\x37\x19\
-\x23\xf3\xb4\x73\x10\x11\xd1\x4e\x19\x11\xf9\x4e\x6d\x63\xc7\x2d\
-\xda\x41\xfc\x80\x0d\xc0\x08\xd5\xcd\x69\xbb\x02\x06\x3f\xd2\xce\
-\x41\x44\x44\xc3\x32\x30\xf8\x5e\x4d\x43\x1b\x4f\x7a\x1d\xa1\xbc\
-\x3f\x0b\x60\xb4\x5a\xe6\x57\x5d\x0e\x60\x81\x76\x0e\x22\x22\xfa\
-\x80\x11\x91\xef\xb0\xf8\x8f\x0e\x1b\x80\x0c\xb4\xcc\xab\xba\x0c\
-\x82\xbc\x3d\x42\x92\x88\xc8\x43\xd2\x80\xf9\xaf\xda\xc6\x8e\xdf\
-\x68\x07\xf1\x1b\x36\x00\x19\x6a\x9d\x57\x79\xb1\x11\xb9\x0e\xfc\
-\x33\x24\x22\xd2\x92\x36\x06\xe7\xd6\xcd\x69\xff\xbd\x76\x10\x3f\
-\x62\xf1\xca\x42\xf3\xfc\xea\x6f\x0b\xcc\x8d\xe0\x9f\x23\x11\x91\
-\xdb\x12\x02\x39\xbb\xa6\xb1\xed\x0f\xda\x41\xfc\x8a\x85\x2b\x4b\
-\xad\xf3\xab\xcf\x31\x30\xbf\x06\x10\xd1\xce\x42\x44\x94\x27\xfa\
-\x00\xfb\x54\xee\xf0\x97\x1d\x36\x00\x39\xb0\x6c\x5e\xd5\x09\x96\
-\x60\x21\x80\x42\xed\x2c\x44\x44\x01\xb7\x5e\x44\x4e\xa8\x69\x68\
-\xfb\x97\x76\x10\xbf\x63\x03\x90\x23\xcd\x0b\x2a\x3f\x21\x46\xfe\
-\x02\x60\x8c\x76\x16\x22\xa2\x80\xea\x32\x12\x3a\x96\xa7\xfa\xe5\
-\x06\x1b\x80\x1c\x6a\x9d\x5b\x7d\x80\xb1\xcc\x5f\x01\x4c\xd6\xce\
-\x42\x44\x14\x28\x82\x96\xb4\xb1\x8f\x99\xde\xd8\xb9\x54\x3b\x4a\
-\x50\x70\x23\xa0\x1c\xaa\xb9\xa2\xed\x35\x3b\x64\x1f\x06\x83\x65\
-\xda\x59\x88\x88\x82\x42\x0c\x5e\x31\xe9\xd0\x47\x59\xfc\x73\x8b\
-\x0d\x40\x8e\xd5\x5f\xd6\xb9\x24\x82\xf4\x21\x06\xe0\xd9\xd3\x44\
-\x44\xd9\x7b\x7c\x30\x54\xf8\xa9\xba\x2b\x5a\x56\x6a\x07\x09\x1a\
-\x36\x00\x0e\xa8\x98\xb3\x7c\xad\xc4\xad\xa3\x04\xb8\x4f\x3b\x0b\
-\x11\x91\x7f\x99\x5f\xb5\xc6\xdb\x8f\x9f\x79\xf9\xe2\x1e\xed\x24\
-\x41\xc4\x35\x00\x0e\x32\x0b\x11\x6a\x59\x5a\xf9\x33\x11\xb9\x50\
-\x3b\x0b\x11\x91\x8f\x18\x00\x3f\xaa\x6d\x6c\x6f\xd2\x0e\x12\x64\
-\x6c\x00\x5c\xb0\x69\xeb\xe0\xf9\xe0\x88\x0b\x11\xd1\xae\xc4\x05\
-\xf2\xb5\x9a\xc6\xb6\x3b\xb5\x83\x04\x1d\x1b\x00\x97\xb4\x2e\xa8\
-\x3e\xce\x18\x73\x0f\x80\x32\xed\x2c\x44\x44\x1e\xb5\xd6\x88\xf9\
-\x42\x5d\x43\xc7\xd3\xda\x41\xf2\x01\x1b\x00\x17\x2d\x5b\x50\xb1\
-\xb7\x65\xac\x07\x01\x54\x6b\x67\x21\x22\xf2\x12\x01\xde\x32\xb0\
-\x3e\x57\xdb\xd8\xda\xaa\x9d\x25\x5f\x70\x48\xda\x45\xf5\x0d\x9d\
-\x6f\x26\x22\xa9\x83\x00\x3c\xa3\x9d\x85\x88\xc8\x3b\xe4\xd1\xb4\
-\x84\x0f\x63\xf1\x77\x17\x47\x00\x14\xb4\x34\xd5\x14\x98\x98\x7d\
-\xbb\x00\xe7\x68\x67\x21\x22\xd2\x24\x62\xae\xab\xae\xeb\x68\x90\
-\xd3\x91\xd6\xce\x92\x6f\xd8\x00\x28\x6a\x99\x5f\xf5\x0d\x00\x3f\
-\x07\x0f\x12\x22\xa2\xfc\x33\x08\x83\x6f\xd6\xce\x69\xff\xad\x76\
-\x90\x7c\xc5\x06\x40\x59\xf3\xbc\xca\xc3\x45\x64\x21\x80\x72\xed\
-\x2c\x44\x44\xae\x30\x58\x66\x8c\xfd\x85\xba\x2b\x3a\xdf\xd0\x8e\
-\x92\xcf\xd8\x00\x78\x40\xc7\x55\x15\xbb\xa5\x42\xa1\x3f\x00\xe6\
-\x10\xed\x2c\x44\x44\xce\x92\x47\x2d\x98\xb3\xab\x1b\xdb\xd7\x6b\
-\x27\xc9\x77\x5c\x04\xe8\x01\x95\x57\x76\x2e\x47\x5c\x8e\x34\x62\
-\xfe\xef\xff\xb7\x77\xb7\xb1\x75\x96\x75\x1c\xc7\xbf\xff\xfb\x9c\
-\xae\xeb\xe6\x08\xb4\x0c\x90\x6d\xa7\xa7\xed\x1c\x63\x63\x22\x96\
-\x48\x08\x44\x85\x6c\x4b\xc8\x82\x31\x0a\xc4\xa8\x0c\x26\x1a\x14\
-\x34\xc6\x19\xe9\xba\xcd\x70\x10\xe9\xba\x8c\x07\x19\x11\x1c\x41\
-\x31\x20\x6f\x06\x84\x04\x10\x30\x02\x33\x88\x12\xdd\xa6\x89\xa4\
-\x30\x1c\x6b\x7b\xce\xaa\x0c\xc7\x0a\x08\x4b\x7b\xda\x9e\xeb\xef\
-\x0b\x98\x42\x1c\x0f\xeb\xda\x5d\xe7\xe1\xf7\x49\xfa\x76\xf9\xa6\
-\x59\x7a\xff\x7a\xdd\xe7\xbe\x1b\xbb\x45\x44\x64\x92\x04\x73\xff\
-\x71\xb6\x98\x5f\xa6\x8b\x7f\x79\xd0\x09\x40\x99\xe9\xed\xca\x5c\
-\x6c\xc6\x6d\xc0\xf4\xd8\x2d\x22\x22\x13\xc1\xe0\x15\xcc\x96\x67\
-\x57\xe5\x1f\x8d\xdd\x22\xff\xa3\x01\x50\x86\xfa\xba\xb2\xf3\xb1\
-\xb0\x19\x58\x14\xbb\x45\x44\xe4\x30\x6d\x85\xe4\x22\x3d\xe2\x57\
-\x7e\x74\x0b\xa0\x0c\xb5\xac\xee\xdf\x91\xae\x0f\x67\x18\xdc\x11\
-\xbb\x45\x44\x64\x9c\x1c\xd8\xb8\xaf\x71\xe6\x59\xba\xf8\x97\x27\
-\x9d\x00\x94\xb9\xfe\xae\xe6\xcb\xdc\xfc\x66\x74\x4b\x40\x44\x2a\
-\x84\xc1\x2b\x25\x67\x45\xdb\xea\xc2\xc3\xb1\x5b\xe4\xbd\x69\x00\
-\x54\x80\xfe\x6b\x9b\x5b\x3c\xed\xf7\x00\x67\xc6\x6e\x11\x11\x79\
-\x3f\x6e\x3c\x51\x37\x16\x2e\x99\xb3\x76\xe0\x1f\xb1\x5b\xe4\xfd\
-\xe9\x16\x40\x05\xc8\xfe\x30\xdf\xd7\x5f\x2c\x7c\x1a\xb8\x06\x08\
-\xb1\x7b\x44\x44\x0e\x62\x14\xb8\xa6\x65\xb8\xb0\x54\x17\xff\xca\
-\xa0\x13\x80\x0a\xd3\x7f\x5d\xf3\x39\x24\x7e\x97\xc3\xec\xd8\x2d\
-\x22\x22\x6f\xdb\x61\xd8\x97\xb3\x9d\xf9\xbf\xc6\x0e\x91\x0f\x4f\
-\x27\x00\x15\x26\xbb\x26\xbf\x25\xed\xa5\x4f\xe0\x6c\x8e\xdd\x22\
-\x22\x35\xcf\xcd\xb9\xa5\xbe\x38\xd6\xae\x8b\x7f\xe5\xd1\x09\x40\
-\x05\xeb\x5d\x97\xb9\x30\x81\x5b\x1d\x8e\x8d\xdd\x22\x22\x35\x27\
-\x9f\x04\x2e\x6b\x5e\x53\x78\x22\x76\x88\x8c\x8f\x06\x40\x85\x7b\
-\x71\x43\xdb\x71\xa9\xd2\xd8\x26\xdc\x3f\x1f\xbb\x45\x44\x6a\x83\
-\xc1\xbd\x06\x97\xeb\x8d\x7e\x95\x4d\x03\xa0\x4a\xf4\xad\x9b\x73\
-\x29\x66\x37\xe1\x1c\x1d\xbb\x45\x44\xaa\xd6\x4b\x66\xf6\x8d\xec\
-\xaa\xfc\xaf\x63\x87\xc8\xe1\xd3\x67\x00\xaa\x44\x4b\xe7\xee\x5f\
-\x92\x24\x27\x9b\x71\x5f\xec\x16\x11\xa9\x3a\x6e\x70\x77\x9d\x97\
-\x16\xe9\xe2\x5f\x3d\x74\x02\x50\x85\x7a\xbb\x33\xe7\x27\xce\xad\
-\x7a\x52\x40\x44\x0e\x9b\xb3\x2b\x71\x2e\xd7\xbd\xfe\xea\xa3\x13\
-\x80\x2a\xd4\xba\xaa\xf0\x50\xc9\xd2\xa7\x00\x1b\xd1\x7b\x03\x44\
-\x64\x1c\x1c\xc6\x80\x8d\x0d\x75\xc5\x53\x75\xf1\xaf\x4e\x3a\x01\
-\xa8\x72\x7d\xeb\xb2\x9f\x85\xf0\x53\x60\x41\xec\x16\x11\xa9\x18\
-\x7f\xf4\x10\xbe\xd5\xba\x66\xe0\x6f\xb1\x43\x64\xf2\x68\x00\xd4\
-\x80\x6d\x9b\xda\xeb\x9a\x5e\xdd\x7b\x05\xce\xb5\xc0\x8c\xd8\x3d\
-\x22\x52\xa6\x9c\x41\x12\x7e\x94\x1d\x2e\xdc\x62\x39\x9d\x1e\x56\
-\x3b\x0d\x80\x1a\x52\x58\x3f\xe7\xc4\x10\xac\xdb\xe1\xe2\xd8\x2d\
-\x22\x52\x56\xdc\xe0\x57\xa3\x3e\xf2\xfd\x8f\xad\xde\xb3\x37\x76\
-\x8c\x1c\x19\x1a\x00\x35\xa8\xbf\xbb\xf9\x3c\x77\x7e\x02\x3e\x2f\
-\x76\x8b\x88\x44\xb7\xd5\x93\xf0\xed\xd6\x8e\x81\x3f\xc7\x0e\x91\
-\x23\x4b\x03\xa0\x46\x6d\xdb\xd4\x5e\xd7\x34\xb8\x77\x85\xc1\x75\
-\x7a\x93\xa0\x48\x4d\xfa\x27\x70\x4d\xb6\x58\xb8\x43\xc7\xfd\xb5\
-\x49\x03\xa0\xc6\xed\xbe\x71\x76\xe3\x58\x31\xb9\xda\xe1\x0a\x83\
-\x74\xec\x1e\x11\x99\x74\x23\xc0\xcf\x8a\x49\xc3\xda\xf9\x1d\x2f\
-\xbc\x11\x3b\x46\xe2\xd1\x00\x10\x00\x76\x75\xcf\x5e\x94\xf2\xe4\
-\x46\x87\xc5\xb1\x5b\x44\x64\x52\x38\xb0\xd9\x4b\xa9\x8e\xd6\xb5\
-\x7d\xf9\xd8\x31\x12\x9f\x06\x80\xbc\xcb\xae\x75\x99\xc5\x89\xb1\
-\x1e\xe7\x93\xb1\x5b\x44\x64\xc2\x3c\x13\x8c\xab\xda\x56\x15\x9e\
-\x8e\x1d\x22\xe5\x43\x03\x40\xfe\x8f\x3b\xd6\xd7\x9d\xb9\xc0\xa0\
-\x1b\x68\x8d\xdd\x23\x22\xe3\xf6\xbc\xc3\xd5\xad\x9d\x85\x7b\x63\
-\x87\x48\xf9\xd1\x00\x90\xf7\xb4\x73\xe3\xdc\xfa\xba\x37\x8b\x57\
-\x62\xd6\xa9\x0f\x0a\x8a\x54\x94\x3c\x78\x2e\x5b\xdc\x7d\x97\x3e\
-\xe0\x27\xef\x45\x03\x40\x3e\xd0\x9e\x0d\xc7\x4f\x1f\x2a\xd5\x7f\
-\x1d\x67\x35\x70\x5c\xec\x1e\x11\x39\x38\x83\x01\x37\xae\x67\x38\
-\xd9\xd4\x92\xeb\x1f\x8e\xdd\x23\xe5\x4d\x03\x40\x3e\xb4\x9e\xdc\
-\xcc\x8f\x4c\xab\x6f\xb8\x12\xe8\x00\x8e\x89\xdd\x23\x22\x07\xd8\
-\x5e\xf0\x1b\xd2\xf5\x61\xe3\x9c\x95\x03\x43\xb1\x6b\xa4\x32\x68\
-\x00\xc8\x21\xcb\xaf\xcb\x1c\xe3\xf8\xf7\xdc\xec\x3b\x38\x47\xc7\
-\xee\x11\xa9\x61\x2f\x99\xfb\xf5\xa9\xa9\x7e\x9b\x2e\xfc\x72\xa8\
-\x34\x00\x64\xdc\x76\xac\x3f\x69\x46\xbd\x0f\x7d\x0d\xa7\x03\xf8\
-\x68\xec\x1e\x91\x1a\x92\xc7\xb8\x29\x3d\x25\xdc\xae\x0b\xbf\x8c\
-\x97\x06\x80\x1c\xb6\x9d\x1b\xe7\xd6\xa7\xf7\x8f\x5c\x02\xac\x05\
-\xe6\xc4\xee\x11\xa9\x62\xbd\xc0\xfa\x7d\x8d\x33\xef\x3c\xfd\xf2\
-\xed\xa3\xb1\x63\xa4\xb2\x69\x00\xc8\x84\xe9\xc9\x2d\x9c\x32\xbd\
-\xfe\xcd\xaf\x3a\xbe\x12\x58\x18\xbb\x47\xa4\x8a\x3c\x63\xd8\x0d\
-\xcd\xc5\xfc\x03\xfa\x54\xbf\x4c\x14\x0d\x00\x99\x14\xbb\xba\x33\
-\x67\xa7\x9c\x0e\x87\x65\xe8\xff\x99\xc8\x78\x04\x83\x47\x4a\x70\
-\x73\x5b\x67\xe1\xf1\xd8\x31\x52\x7d\xf4\x83\x59\x26\x55\xef\x75\
-\xb3\x3f\x6e\x49\xb2\x12\xf8\x12\x50\x1f\xbb\x47\xa4\x02\xbc\x01\
-\xdc\x99\xc0\xcd\xcd\x9d\x85\xde\xd8\x31\x52\xbd\x34\x00\xe4\x88\
-\x78\x71\x43\xdb\x71\xa9\xb1\xd1\x15\xc0\x37\x81\x6c\xe4\x1c\x91\
-\x72\xb4\x13\xf8\x79\x02\xb7\x37\x77\x16\x5e\x8d\x1d\x23\xd5\x4f\
-\x03\x40\x8e\x28\xcf\x91\xf4\xd6\x67\xce\x4d\xc1\x77\x75\x7b\x40\
-\x84\x60\xf0\x64\x30\x36\xb6\x74\x14\x1e\x36\xc3\x63\x07\x49\xed\
-\xd0\x0f\x5f\x89\xa6\x7f\x7d\xf3\xc9\x04\x5f\xe1\x70\x31\x70\x42\
-\xec\x1e\x91\x23\x68\x37\xce\x9d\x1e\x52\xbf\xd0\x5f\xe6\x93\x58\
-\x34\x00\x24\xba\x77\x9c\x0a\x2c\x77\xb8\x00\x68\x88\xdd\x24\x32\
-\x09\x4a\x06\x5b\x02\xdc\x9e\x2f\x16\x1e\x38\x27\xc7\x58\xec\x20\
-\xa9\x6d\x1a\x00\x52\x56\x06\xba\x66\x35\x8d\x92\xfa\x0a\xc6\xa5\
-\xc0\x69\xb1\x7b\x44\x26\xc0\xb3\xee\x76\x17\x9e\xdc\xdd\xba\xa6\
-\xef\xe5\xd8\x31\x22\x07\x68\x00\x48\xd9\xca\x77\x65\x16\x04\x63\
-\x39\x70\x29\x70\x7c\xe4\x1c\x91\x43\xb1\x0f\xb8\x3f\x18\x77\xb7\
-\xad\x2a\x3c\x1d\x3b\x46\xe4\x60\x34\x00\xa4\xec\x6d\xdb\xd4\x5e\
-\xd7\xb4\xef\x5f\xcb\x30\x96\x83\x9d\x07\x4c\x8d\xdd\x24\x72\x10\
-\xff\x36\x78\xd0\x09\xf7\x64\xdb\x06\x7e\x6b\x17\x51\x8a\x1d\x24\
-\xf2\x7e\x34\x00\xa4\xa2\xec\xbe\x71\x76\xc3\xe8\x48\xb2\x38\x71\
-\x2e\x74\xf8\x02\x30\x3d\x76\x93\xd4\xb4\x21\x83\x27\x82\x71\xef\
-\xb4\x54\xf1\xfe\x13\x7e\xf0\xf2\xfe\xd8\x41\x22\x1f\x96\x06\x80\
-\x54\xac\x9d\xb9\xb9\x47\xa5\xa6\x8e\x7c\xce\xb0\x2f\xe2\xbe\x14\
-\x98\x16\xbb\x49\x6a\x80\xf1\x1a\xc1\x1f\x31\x4b\xee\xf3\xa2\x3d\
-\xda\x92\xeb\x1f\x8e\x9d\x24\x32\x1e\x1a\x00\x52\x15\xfa\x72\xd9\
-\xa9\xa1\x3e\x9c\x9d\xc0\xf9\xc0\x85\xe8\xaf\x13\xca\x84\xf2\x02\
-\xd8\x63\x6e\x3c\x3c\x34\x3c\xe3\x37\x0b\x73\x3d\x23\xb1\x8b\x44\
-\x0e\x97\x06\x80\x54\x1d\xdf\x4c\xaa\xb7\x37\x73\x66\x12\x58\x86\
-\xb1\x84\xb7\x9e\x26\x48\x62\x77\x49\x45\x29\x81\x6f\x05\x7b\xcc\
-\x82\x3d\x94\x5d\x93\xff\x4b\xec\x20\x91\x89\xa6\x01\x20\x55\x6f\
-\xa0\x6b\x56\xd3\x88\xa5\xce\x35\x58\x0c\x2c\x45\xaf\x22\x96\x83\
-\xb2\xbd\x86\xff\xce\xe1\x71\x52\xc9\x83\x2d\x57\xf5\xef\x89\x5d\
-\x24\x32\x99\x34\x00\xa4\xe6\xec\xea\x9a\x35\x2f\x95\xa4\x97\xb8\
-\xfb\x12\xe0\x1c\xe0\xa8\xd8\x4d\x12\xc5\xeb\xc0\x53\x38\x4f\xba\
-\x87\x27\x5b\x56\x0f\x3c\xab\x57\xf1\x4a\x2d\xd1\x00\x90\x9a\xb6\
-\x25\x47\xba\x65\x6a\xf3\xa7\xdc\x7d\x09\xc6\x67\x70\x4e\x07\x66\
-\xc4\xee\x92\x49\xe0\x0c\x62\xfe\x27\xcc\x9e\x22\x84\x2d\xd9\xb9\
-\x03\xdb\xf4\xa8\x9e\xd4\x32\x0d\x00\x91\x77\xf0\xcd\xa4\x0a\xbd\
-\x99\xf9\x25\x68\x37\xa7\x1d\x38\x0b\x7d\x86\xa0\x12\x95\x80\x17\
-\x0c\xb6\x3b\x3c\x9d\x18\x7f\xc8\x0c\x17\x9e\xb7\x1c\x21\x76\x98\
-\x48\xb9\xd0\x00\x10\xf9\x00\x3b\xd6\x9f\x34\xa3\xce\x87\x4e\x4d\
-\x9c\xb3\x0c\xce\x76\xec\x0c\xf0\x99\xb1\xbb\xe4\x5d\xf6\x18\x6c\
-\x73\xd8\xee\xc6\x76\x1b\x4e\x7e\xdf\x92\xeb\x7f\x2d\x76\x94\x48\
-\x39\xd3\x00\x10\x19\x87\x5d\x5d\xb3\xe6\x25\x96\x9c\xe6\x24\x8b\
-\x8c\xb0\x00\xec\x14\xa0\x15\x48\xc5\x6e\xab\x72\xa3\xc0\xdf\x71\
-\x7a\x48\xe8\x31\xb7\x9e\x92\xa5\xb6\xb6\xad\xea\x2d\xc4\x0e\x13\
-\xa9\x34\x1a\x00\x22\x13\x64\xdb\xa6\xf6\xba\x99\xaf\xee\x9d\x57\
-\x72\x16\x18\x2c\x34\x58\xe0\xb0\x10\x98\x8f\x6e\x21\x1c\x12\x87\
-\x31\x83\x82\xc1\x73\x0e\x3d\x6e\x3c\x97\x72\x7a\x42\x31\xe9\xd1\
-\x8b\x77\x44\x26\x86\x06\x80\xc8\x24\xdb\xb3\xe1\xf8\xe9\xfb\xc3\
-\x94\x93\x53\x21\x39\x09\x0b\xcd\x1e\x2c\x83\x59\x33\x78\x86\xb7\
-\x1e\x49\xac\xd5\x37\x18\xbe\xce\x5b\x17\xf9\x7c\x70\xcf\x1b\x56\
-\xc0\x3c\xef\x96\xde\x31\x34\x3c\xed\x79\xbd\x6c\x47\x64\x72\x69\
-\x00\x88\x44\xf6\xc2\xf5\x27\x1e\x5b\x5f\xac\xcb\xb8\x85\x0c\x89\
-\x35\x03\x59\xf0\x0c\x9e\xcc\xc2\xfd\x58\x12\x9a\x70\x8e\x8e\xdd\
-\x79\x08\x1c\x18\x7c\xfb\xeb\x15\x9c\xdd\x66\xe4\xc3\xdb\x17\x78\
-\x4a\x21\x6f\xa3\xe9\x82\xee\xd1\x8b\xc4\xa5\x01\x20\x52\x01\x3c\
-\x47\xf2\xe2\x94\x13\x9a\x52\xa9\x86\xc6\xa4\x14\x1a\x49\x68\x0c\
-\xc1\x1b\x0d\x9a\xcc\xbc\x31\x38\x8d\x66\x49\xa3\xe1\x69\x77\x8e\
-\x32\x23\x15\x0c\xb3\xff\x0e\x07\x4f\x83\x1d\x78\xbc\x71\x2a\xd0\
-\xf0\xce\x7f\xdf\x60\xbf\xc3\x81\xdf\xb8\x5f\x07\x82\x39\x8e\xf1\
-\x1a\x80\xe3\xa3\x86\xbd\x19\x60\x24\x71\x06\xdd\x18\x74\x63\x5f\
-\xe2\x36\x88\x31\xe8\xa1\x34\x18\xd2\x0c\x4e\x49\xb3\x6f\xce\xca\
-\x81\xc1\x23\xf3\x5d\x11\x91\xc3\xf1\x1f\xc7\x8f\x5b\xbf\x9c\x1c\
-\x50\xab\x00\x00\x00\x00\x49\x45\x4e\x44\xae\x42\x60\x82\
-"
-
-qt_resource_name = b"\
-\x00\x05\
-\x00\x6f\xa6\x53\
-\x00\x69\
-\x00\x63\x00\x6f\x00\x6e\x00\x73\
-\x00\x08\
-\x00\x2f\x59\x07\
-\x00\x6b\
-\x00\x69\x00\x6c\x00\x6c\x00\x2e\x00\x70\x00\x6e\x00\x67\
-\x00\x0a\
-\x04\xb0\x2f\xe7\
-\x00\x74\
-\x00\x75\x00\x6e\x00\x6e\x00\x65\x00\x6c\x00\x2e\x00\x70\x00\x6e\x00\x67\
-\x00\x07\
-\x07\xa7\x57\x87\
-\x00\x61\
-\x00\x64\x00\x64\x00\x2e\x00\x70\x00\x6e\x00\x67\
-\x00\x09\
-\x08\x97\xa2\x07\
-\x00\x73\
-\x00\x74\x00\x61\x00\x72\x00\x74\x00\x2e\x00\x70\x00\x6e\x00\x67\
-\x00\x0b\
-\x09\x16\x7a\x87\
-\x00\x62\
-\x00\x72\x00\x6f\x00\x77\x00\x73\x00\x65\x00\x72\x00\x2e\x00\x70\x00\x6e\x00\x67\
-\x00\x08\
-\x0b\x63\x58\x07\
-\x00\x73\
-\x00\x74\x00\x6f\x00\x70\x00\x2e\x00\x70\x00\x6e\x00\x67\
-\x00\x0c\
-\x0b\xdf\x21\x47\
-\x00\x73\
-\x00\x65\x00\x74\x00\x74\x00\x69\x00\x6e\x00\x67\x00\x73\x00\x2e\x00\x70\x00\x6e\x00\x67\
-"
-
-qt_resource_struct_v1 = b"\
-\x00\x00\x00\x00\x00\x02\x00\x00\x00\x01\x00\x00\x00\x01\
-\x00\x00\x00\x00\x00\x02\x00\x00\x00\x07\x00\x00\x00\x02\
-\x00\x00\x00\x10\x00\x00\x00\x00\x00\x01\x00\x00\x00\x00\
-\x00\x00\x00\x26\x00\x00\x00\x00\x00\x01\x00\x00\x3b\x08\
-\x00\x00\x00\x40\x00\x00\x00\x00\x00\x01\x00\x00\xad\x73\
-\x00\x00\x00\x54\x00\x00\x00\x00\x00\x01\x00\x00\xcd\x1f\
-\x00\x00\x00\x6c\x00\x00\x00\x00\x00\x01\x00\x00\xfe\x41\
-\x00\x00\x00\x88\x00\x00\x00\x00\x00\x01\x00\x01\x67\x86\
-\x00\x00\x00\x9e\x00\x00\x00\x00\x00\x01\x00\x01\x9b\xeb\
-"
-
-qt_resource_struct_v2 = b"\
-\x00\x00\x00\x00\x00\x02\x00\x00\x00\x01\x00\x00\x00\x01\
-\x00\x00\x00\x00\x00\x00\x00\x00\
-\x00\x00\x00\x00\x00\x02\x00\x00\x00\x07\x00\x00\x00\x02\
-\x00\x00\x00\x00\x00\x00\x00\x00\
-\x00\x00\x00\x10\x00\x00\x00\x00\x00\x01\x00\x00\x00\x00\
-\x00\x00\x01\x98\xce\x08\xc5\xdd\
-\x00\x00\x00\x26\x00\x00\x00\x00\x00\x01\x00\x00\x3b\x08\
-\x00\x00\x01\x98\xce\x08\xc5\xde\
-\x00\x00\x00\x40\x00\x00\x00\x00\x00\x01\x00\x00\xad\x73\
-\x00\x00\x01\x98\xd2\x29\x03\x26\
-\x00\x00\x00\x54\x00\x00\x00\x00\x00\x01\x00\x00\xcd\x1f\
-\x00\x00\x01\x98\xce\x08\xc5\xde\
-\x00\x00\x00\x6c\x00\x00\x00\x00\x00\x01\x00\x00\xfe\x41\
-\x00\x00\x01\x98\xce\x08\xc5\xdd\
-\x00\x00\x00\x88\x00\x00\x00\x00\x00\x01\x00\x01\x67\x86\
-\x00\x00\x01\x98\xce\x08\xc5\xde\
-\x00\x00\x00\x9e\x00\x00\x00\x00\x00\x01\x00\x01\x9b\xeb\
-\x00\x00\x01\x98\xce\x08\xc5\xde\
-"
-
-qt_version = [int(v) for v in QtCore.qVersion().split('.')]
-if qt_version < [5, 8, 0]:
-    rcc_version = 1
-    qt_resource_struct = qt_resource_struct_v1
-else:
-    rcc_version = 2
-    qt_resource_struct = qt_resource_struct_v2
-
-def qInitResources():
-    QtCore.qRegisterResourceData(rcc_version, qt_resource_struct, qt_resource_name, qt_resource_data)
-
-def qCleanupResources():
-    QtCore.qUnregisterResourceData(rcc_version, qt_resource_struct, qt_resource_name, qt_resource_data)
-
-qInitResources()
@@ -0,0 +1,99 @@
+import json
+import os
+
+from PyQt6.QtCore import QObject, pyqtSignal
+from PyQt6.QtNetwork import QLocalServer, QLocalSocket
+
+from core import control
+
+CONNECT_TIMEOUT_MS = 200
+
+
+class InstanceServer(QObject):
+    """Listens for argv forwarded by later launches.
+
+    `handler(argv)` runs on the GUI thread and returns the reply dict sent
+    back to the caller, or a future of it for commands that finish on a
+    worker thread.
+    """
+
+    _reply_ready = pyqtSignal(object, object)
+
+    def __init__(self, handler, name=None, parent=None):
+        super().__init__(parent)
+        self.handler = handler
+        self.name = name or control.socket_name()
+        self.server = QLocalServer(self)
+        self.server.setSocketOptions(QLocalServer.SocketOption.UserAccessOption)
+        self.server.newConnection.connect(self._on_new_connection)
+        self._reply_ready.connect(self._reply)
+        self._buffers = {}
+
+    def listen(self):
+        """Start listening; False if another live instance already is."""
+        if os.path.isabs(self.name):
+            os.makedirs(os.path.dirname(self.name), exist_ok=True)
+        if self.server.listen(self.name):
+            return True
+        if self.server.serverError() != QLocalSocket.LocalSocketError.AddressInUseError:
+            print(f"Error listening on {self.name}: {self.server.errorString()}")
+            return False
+        # The name is taken: either a live instance or a socket file left by
+        # one that crashed. Only a live instance accepts a connection.
+        probe = QLocalSocket()
+        probe.connectToServer(self.name)
+        if probe.waitForConnected(CONNECT_TIMEOUT_MS):
+            probe.disconnectFromServer()
+            return False
+        QLocalServer.removeServer(self.name)
+        return self.server.listen(self.name)
+
+    def close(self):
+        self.server.close()
+
+    def _on_new_connection(self):
+        while self.server.hasPendingConnections():
+            socket = self.server.nextPendingConnection()
+            self._buffers[socket] = b""
+            socket.readyRead.connect(lambda socket=socket: self._on_ready_read(socket))
+            socket.disconnected.connect(lambda socket=socket: self._on_disconnected(socket))
+
+    def _on_disconnected(self, socket):
+        self._buffers.pop(socket, None)
+        socket.deleteLater()
+
+    def _on_ready_read(self, socket):
+        raw = self._buffers.get(socket, b"") + bytes(socket.readAll())
+        self._buffers[socket] = raw
+        if not raw.endswith(b"\n"):
+            return
+        try:
+            request = json.loads(raw)
+            reply = self.handler([str(arg) for arg in request["argv"]])
+        except (ValueError, KeyError, TypeError) as e:
+            reply = {"ok": False, "error": f"Bad request: {e}"}
+        except Exception as e:
+            # An exception escaping a slot would abort the whole GUI
+            reply = _error(e)
+        if hasattr(reply, "add_done_callback"):
+            # Done on a worker thread; the signal hands it back to this one
+            reply.add_done_callback(lambda future: self._reply_ready.emit(socket, future))
+            return
+        self._reply(socket, reply)
+
+    def _reply(self, socket, reply):
+        if hasattr(reply, "result"):
+            try:
+                reply = reply.result()
+            except Exception as e:
+                reply = _error(e)
+        if socket not in self._buffers:
+            # The caller gave up waiting and disconnected
+            return
+        socket.write(control.encode(reply))
+        socket.flush()
+        socket.disconnectFromServer()
+
+
+def _error(e):
+    return {"ok": False, "error": f"{type(e).__name__}: {e}"}
@@ -0,0 +1,26 @@
+import os
+import sys
+
+from PyQt6.QtCore import QResource
+
+RCC_FILE = "icons.rcc"
+
+
+def resource_path(name):
+    # PyInstaller unpacks bundled data files into sys._MEIPASS
+    base = getattr(sys, "_MEIPASS", os.path.dirname(os.path.abspath(__file__)))
+    return os.path.join(base, name)
+
+
+def register():
+    """Map icons.rcc so the `:icons/...` paths in vars.ICONS resolve.
+
+    Qt memory-maps the file where it can, so nothing is copied or unmarshalled
+    on startup. Rebuild it with build_icons.py after changing icons.qrc.
+    """
+    path = resource_path(RCC_FILE)
+    if not QResource.registerResource(path):
+        print(f"Error registering resources from {path}")
+
+
+register()
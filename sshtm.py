@@ -0,0 +1,163 @@
+#!/usr/bin/python3
+
+# -*- coding: utf-8 -*-
+
+"""Control SSH Tunnel Manager from the command line.
+
+Commands go to the running app over its local socket. Without a running
+app, `start` launches a headless server that keeps the tunnels up and exits
+once none are left running; `list` and `status` read the config directly.
+
+Usage: sshtm.py {list,status,start,stop,wait,quit} [--json] [--wait] [--timeout S] [KEY|@GROUP ...]
+"""
+
+import argparse
+import json
+import os
+import subprocess
+import sys
+import time
+
+from core import control
+from vars import ACTIONS, LANG
+
+WAIT = "wait"
+SERVE = "serve"
+WAIT_TIMEOUT = 30
+SERVER_START_TIMEOUT = 10
+# The headless server exits once no tunnel has been running for this long
+IDLE_INTERVAL_MS = 2000
+
+
+def print_tunnels(tunnels, as_json):
+    if as_json:
+        print(json.dumps(tunnels, indent=1))
+        return
+    for tunnel in tunnels:
+        state = "running" if tunnel["running"] else "stopped"
+        # bind and local_port are None for a tunnel no longer in the config
+        address = f"{tunnel['bind']}:{tunnel['local_port']}" if tunnel["local_port"] else "-"
+        print(f"{tunnel['key']:<24} {state:<8} {address:<15} {tunnel['name']}")
+
+
+def run_local(argv):
+    """Answer list/status from the config files when nothing is running."""
+    from core import Supervisor, TunnelStore
+    store = TunnelStore()
+    store.load()
+    try:
+        return control.Controller(store, Supervisor()).handle(argv)
+    finally:
+        store.flush()
+
+
+def start_server():
+    kwargs = {"start_new_session": True} if os.name != 'nt' else {
+        "creationflags": subprocess.DETACHED_PROCESS | subprocess.CREATE_NO_WINDOW}
+    subprocess.Popen([sys.executable, os.path.abspath(__file__), SERVE], stdin=subprocess.DEVNULL,
+                     stdout=subprocess.DEVNULL, stderr=subprocess.DEVNULL, **kwargs)
+    deadline = time.monotonic() + SERVER_START_TIMEOUT
+    while time.monotonic() < deadline:
+        if control.send([ACTIONS.STATUS]) is not None:
+            return True
+        time.sleep(0.05)
+    return False
+
+
+def serve():
+    """Headless server: the GUI's command handling without any widgets."""
+    from PyQt6.QtCore import QCoreApplication, QTimer
+    from core import Supervisor, TunnelStore
+    from instance import InstanceServer
+
+    app = QCoreApplication(sys.argv)
+    store = TunnelStore()
+    store.load()
+    supervisor = Supervisor()
+    controller = control.Controller(store, supervisor)
+
+    def handle(argv):
+        action = argv[0] if argv else ACTIONS.SHOW
+        if action == ACTIONS.SHOW:
+            return {"ok": False, "error": LANG.HEADLESS}
+        if action == ACTIONS.QUIT:
+            QTimer.singleShot(0, app.quit)
+            return {"ok": True}
+        store.apply(store.read())
+        return controller.handle(argv)
+
+    server = InstanceServer(handle)
+    if not server.listen():
+        return 1
+
+    def quit_when_idle():
+        if not supervisor.keys():
+            app.quit()
+
+    idle = QTimer()
+    idle.timeout.connect(quit_when_idle)
+    idle.start(IDLE_INTERVAL_MS)
+    app.aboutToQuit.connect(supervisor.stop_all)
+    result = app.exec()
+    server.close()
+    store.flush()
+    return result
+
+
+def wait_for(tunnels, timeout):
+    deadline = time.monotonic() + timeout
+    late = [tunnel["key"] for tunnel in tunnels if tunnel["local_port"]
+            and not control.wait_ready(tunnel["bind"], tunnel["local_port"], max(0, deadline - time.monotonic()))]
+    if late:
+        print(LANG.NOT_READY.format(timeout, ", ".join(late)), file=sys.stderr)
+        return False
+    return True
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+    parser.add_argument("action", choices=[ACTIONS.LIST, ACTIONS.STATUS, ACTIONS.START, ACTIONS.STOP,
+                                           WAIT, ACTIONS.QUIT, SERVE])
+    parser.add_argument("keys", nargs="*", metavar="KEY", help="a tunnel key, or @GROUP for every tunnel in a group")
+    parser.add_argument("--json", action="store_true", help="print tunnels as JSON")
+    parser.add_argument("--wait", action="store_true", help="after start, wait until the local ports accept connections")
+    parser.add_argument("--timeout", type=float, default=WAIT_TIMEOUT, help="seconds to wait (default %(default)s)")
+    args = parser.parse_intermixed_args()
+
+    if args.action == SERVE:
+        return serve()
+    if args.action in (ACTIONS.START, ACTIONS.STOP, WAIT) and not args.keys:
+        parser.error(f"{args.action} needs at least one KEY")
+
+    argv = [ACTIONS.STATUS if args.action == WAIT else args.action] + args.keys
+    reply = control.send(argv)
+    if reply is None:
+        if args.action in (ACTIONS.LIST, ACTIONS.STATUS, WAIT):
+            reply = run_local(argv)
+        elif args.action == ACTIONS.START and start_server():
+            reply = control.send(argv)
+        elif args.action == ACTIONS.START:
+            reply = {"ok": False, "error": LANG.NO_REPLY}
+        else:
+            # Nothing is running, so there is nothing to stop
+            reply = {"ok": True, "tunnels": []}
+
+    if not reply.get("ok"):
+        print(reply.get("error"), file=sys.stderr)
+        return 1
+    tunnels = reply.get("tunnels", [])
+    if args.action == WAIT:
+        stopped = [tunnel["key"] for tunnel in tunnels if not tunnel["running"]]
+        if stopped:
+            print(LANG.NOT_RUNNING.format(", ".join(stopped)), file=sys.stderr)
+            return 1
+    if args.action == WAIT or (args.action == ACTIONS.START and args.wait):
+        if not wait_for(tunnels, args.timeout):
+            return 1
+    if args.action in (ACTIONS.LIST, ACTIONS.STATUS) or args.json:
+        print_tunnels(tunnels, args.json)
+    return 0
+
+
+if __name__ == '__main__':
+    sys.exit(main())
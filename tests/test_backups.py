@@ -0,0 +1,35 @@
+import os
+import shutil
+import tempfile
+import unittest
+
+from core.backups import BackupStore, INDEX_FILE
+
+
+class IndexTest(unittest.TestCase):
+    """A damaged index line loses only itself, not the entries after it."""
+
+    def setUp(self):
+        self.dir = tempfile.mkdtemp()
+
+    def tearDown(self):
+        shutil.rmtree(self.dir)
+
+    def test_corrupt_line_in_middle(self):
+        store = BackupStore(self.dir)
+        first = store.add(b"a: 1\n", "config.yml", timestamp=1)
+        second = store.add(b"a: 2\n", "config.yml", timestamp=2)
+        index = os.path.join(self.dir, INDEX_FILE)
+        with open(index, "rb") as fp:
+            lines = fp.readlines()
+        with open(index, "wb") as fp:
+            fp.write(lines[0] + b"3.0 deadbe\xff\n" + b"not-a-time x y\n" + lines[1])
+
+        store = BackupStore(self.dir)
+        self.assertEqual([digest for _, digest, _ in store.list()], [second, first])
+        self.assertEqual(store.read(second), b"a: 2\n")
+        self.assertEqual(store.refs[second], 1)
+
+
+if __name__ == '__main__':
+    unittest.main()
@@ -0,0 +1,37 @@
+import sys
+import unittest
+
+from core import Supervisor
+from core.control import Controller
+
+
+class _Store:
+    def __init__(self, data):
+        self.data = data
+
+
+class RemovedTunnelTest(unittest.TestCase):
+    """A tunnel removed from the config while running is still reported and stoppable."""
+
+    def setUp(self):
+        self.supervisor = Supervisor()
+        self.supervisor.start("gone", [sys.executable, "-c", "import time; time.sleep(30)"])
+        self.controller = Controller(_Store({}), self.supervisor)
+
+    def tearDown(self):
+        self.supervisor.stop_all()
+
+    def test_status(self):
+        reply = self.controller.handle(["status"])
+        self.assertTrue(reply["ok"])
+        self.assertEqual([(tunnel["key"], tunnel["running"]) for tunnel in reply["tunnels"]], [("gone", True)])
+        self.assertTrue(self.controller.handle(["status", "gone"])["ok"])
+
+    def test_stop_and_start(self):
+        self.assertFalse(self.controller.handle(["start", "gone"])["ok"])
+        self.assertTrue(self.controller.handle(["stop", "gone"])["ok"])
+        self.assertFalse(self.supervisor.running("gone"))
+
+
+if __name__ == '__main__':
+    unittest.main()
@@ -0,0 +1,92 @@
+import json
+import shutil
+import tempfile
+import threading
+import unittest
+from http.server import BaseHTTPRequestHandler, ThreadingHTTPServer
+
+import requests
+
+from core.remote import RemoteConfig
+
+BODY = b"shared:\n  remote_address: db:5432\n  local_port: 5432\n"
+ETAG = '"v1"'
+LAST_MODIFIED = "Sat, 17 Oct 2026 12:00:00 GMT"
+
+
+class _Handler(BaseHTTPRequestHandler):
+    def do_GET(self):
+        self.server.requests.append(dict(self.headers))
+        if self.headers.get("If-None-Match") == ETAG:
+            self.send_response(304)
+            self.end_headers()
+            return
+        self.send_response(200)
+        self.send_header("ETag", ETAG)
+        self.send_header("Last-Modified", LAST_MODIFIED)
+        self.send_header("Content-Length", str(len(BODY)))
+        self.end_headers()
+        self.wfile.write(BODY)
+
+    def log_message(self, format, *args):
+        pass
+
+
+class RemoteConfigTest(unittest.TestCase):
+    """fetch() against a local HTTP server standing in for the shared endpoint."""
+
+    def setUp(self):
+        self.dir = tempfile.mkdtemp()
+        self.server = ThreadingHTTPServer(("127.0.0.1", 0), _Handler)
+        self.server.requests = []
+        threading.Thread(target=self.server.serve_forever, daemon=True).start()
+        self.url = f"http://127.0.0.1:{self.server.server_port}/tunnels.yml"
+
+    def tearDown(self):
+        self.server.shutdown()
+        self.server.server_close()
+        shutil.rmtree(self.dir)
+
+    def remote(self, url=None):
+        return RemoteConfig(url or self.url, self.dir, timeout=5)
+
+    def cached(self, remote):
+        with open(remote.cache_file, "rb") as fp:
+            return fp.read()
+
+    def test_fetch_fills_cache(self):
+        remote = self.remote()
+        self.assertTrue(remote.fetch())
+        self.assertEqual(self.cached(remote), BODY)
+        with open(remote.meta_file) as fp:
+            self.assertEqual(json.load(fp), {"url": self.url, "etag": ETAG, "last_modified": LAST_MODIFIED})
+
+    def test_not_modified(self):
+        remote = self.remote()
+        remote.fetch()
+        self.assertFalse(remote.fetch())
+        headers = self.server.requests[-1]
+        self.assertEqual(headers.get("If-None-Match"), ETAG)
+        self.assertEqual(headers.get("If-Modified-Since"), LAST_MODIFIED)
+        self.assertEqual(self.cached(remote), BODY)
+
+    def test_changed_url_ignores_meta(self):
+        self.remote().fetch()
+        remote = self.remote(self.url + "?team=ops")
+        self.assertTrue(remote.fetch())
+        headers = self.server.requests[-1]
+        self.assertNotIn("If-None-Match", headers)
+        self.assertNotIn("If-Modified-Since", headers)
+
+    def test_network_error_keeps_cache(self):
+        remote = self.remote()
+        remote.fetch()
+        self.server.shutdown()
+        self.server.server_close()
+        with self.assertRaises(requests.ConnectionError):
+            remote.fetch()
+        self.assertEqual(self.cached(remote), BODY)
+
+
+if __name__ == '__main__':
+    unittest.main()
@@ -0,0 +1,62 @@
+import os
+import shutil
+import tempfile
+import unittest
+
+from core.sshconfig import SSHConfigImporter
+from core.tunnelspec import TunnelSpec
+
+CONFIG = """\
+Host db
+    HostName 10.0.0.5
+    User admin
+    Port 2222
+    IdentityFile ~/.ssh/db_key
+    IdentityFile ~/.ssh/backup_key
+    ServerAliveInterval 30
+    ProxyJump bastion
+    LocalForward 5432 localhost:5432
+    LocalForward *:8080 web:80
+
+Host plain.example.com
+    LocalForward 9000 localhost:9000
+"""
+
+
+class ImportTest(unittest.TestCase):
+
+    def setUp(self):
+        self.dir = tempfile.mkdtemp()
+        self.config = os.path.join(self.dir, "config")
+        with open(self.config, "w") as fp:
+            fp.write(CONFIG)
+        self.tunnels = SSHConfigImporter(ssh_dir=self.dir).load(self.config)
+
+    def tearDown(self):
+        shutil.rmtree(self.dir)
+
+    def argv(self, key):
+        return TunnelSpec.from_dict(key, self.tunnels[key]).ssh_argv()[1:]
+
+    def test_one_tunnel_per_forward(self):
+        self.assertEqual(sorted(self.tunnels), ["db_5432", "db_8080", "plain.example.com_9000"])
+        self.assertTrue(self.tunnels["db_8080"]["all_interfaces"])
+        self.assertEqual(self.tunnels["db_5432"]["remote_address"], "localhost:5432")
+
+    def test_resolved_destination_with_options(self):
+        # The destination doesn't match `Host db`, so ssh won't add its other
+        # forwards; the block's options come along as -o
+        self.assertEqual(self.argv("db_5432"), [
+            "-o", "identityfile=~/.ssh/db_key", "-o", "identityfile=~/.ssh/backup_key",
+            "-o", "serveraliveinterval=30", "-J", "bastion",
+            "-L", "127.0.0.1:5432:localhost:5432", "ssh://admin@10.0.0.5:2222",
+        ])
+
+    def test_host_name_matching_a_forwarding_block(self):
+        self.assertEqual(self.argv("plain.example.com_9000"), [
+            "-o", "hostname=plain.example.com", "-L", "127.0.0.1:9000:localhost:9000", "sshtm-plain.example.com",
+        ])
+
+
+if __name__ == '__main__':
+    unittest.main()
@@ -0,0 +1,129 @@
+import os
+import shutil
+import tempfile
+import time
+import unittest
+from unittest import mock
+
+from core import configio
+from core.store import TunnelStore
+
+
+class RenameReadonlyTest(unittest.TestCase):
+    """Renaming a tunnel defined by a read-only source must survive a reload."""
+
+    def setUp(self):
+        self.dir = tempfile.mkdtemp()
+        self.remote = os.path.join(self.dir, "remote.yml")
+        self.conf = os.path.join(self.dir, "config.yml")
+        configio.save_config(self.remote, {
+            "r": {"remote_address": "r:1", "local_port": 5},
+            "shared": {"remote_address": "s:1", "local_port": 6},
+        })
+        configio.save_config(self.conf, {
+            "a": {"remote_address": "a:1", "local_port": 1},
+            "shared": {"remote_address": "s:1", "local_port": 7},
+        })
+
+    def tearDown(self):
+        shutil.rmtree(self.dir)
+
+    def store(self):
+        store = TunnelStore(readonly=[self.remote], conf_file=self.conf, conf_dir=os.path.join(self.dir, "conf.d"),
+                            journal_file=self.conf + ".journal", backup_dir=os.path.join(self.dir, "backups"))
+        store.load()
+        return store
+
+    def rename(self, store):
+        records = []
+        for old, new in (("r", "r2"), ("shared", "shared2")):
+            records += store.put(new, store.data[old], old)
+        store.commit(records)
+
+    def check(self, data):
+        self.assertEqual(sorted(data), ["a", "r2", "shared2"])
+        self.assertEqual(data["shared2"]["local_port"], 7)
+
+    def test_reload_from_journal(self):
+        store = self.store()
+        self.rename(store)
+        self.check(store.data)
+        self.assertEqual(store.apply(store.read()), ([], [], [], set()))
+        self.check(store.data)
+        store.flush()
+
+    def test_reload_after_compaction(self):
+        store = self.store()
+        self.rename(store)
+        store.flush()
+        self.assertFalse(os.path.exists(self.conf + ".journal"))
+        self.check(self.store().data)
+
+    def test_journal_appended_off_thread(self):
+        store = self.store()
+        self.rename(store)
+        # The append lands on the writer thread; compaction waits far longer
+        while store.writer.queued():
+            time.sleep(0.01)
+        self.check(self.store().data)
+        store.flush()
+
+    def test_rename_back(self):
+        store = self.store()
+        self.rename(store)
+        store.commit(store.put("r", store.data["r2"], "r2"))
+        store.flush()
+        self.assertEqual(sorted(self.store().data), ["a", "r", "shared2"])
+
+    def test_failed_compaction_keeps_journal(self):
+        store = self.store()
+        self.rename(store)
+        with mock.patch.object(configio, "write_atomic", side_effect=OSError(28, "No space left on device")):
+            self.assertFalse(store.writer.flush())
+            store.compacted()
+        self.assertTrue(os.path.exists(self.conf + ".journal"))
+        self.check(self.store().data)
+        # The retry folds the edit in and only then drops the journal
+        store.flush()
+        self.assertFalse(os.path.exists(self.conf + ".journal"))
+        self.check(self.store().data)
+
+    def test_reload_refreshes_pending_compaction(self):
+        store = self.store()
+        self.rename(store)
+        # An external edit reloaded while the compaction still waits
+        data = configio.load_config(self.conf)
+        data["b"] = {"remote_address": "b:1", "local_port": 2}
+        configio.save_config(self.conf, data)
+        self.assertEqual(store.apply(store.read())[0], ["b"])
+        store.flush()
+        data = self.store().data
+        self.check({key: value for key, value in data.items() if key != "b"})
+        self.assertIn("b", data)
+
+    def test_reload_keeps_newer_disk_edit(self):
+        store = self.store()
+        store.commit(store.put("a", {"remote_address": "a:2", "local_port": 1}))
+        # The same tunnel edited by hand while its record is in the journal
+        data = configio.load_config(self.conf)
+        data["a"] = {"remote_address": "a:3", "local_port": 1}
+        configio.save_config(self.conf, data)
+        self.assertEqual(store.apply(store.read())[2], ["a"])
+        self.assertEqual(store.data["a"]["remote_address"], "a:3")
+        store.flush()
+        self.assertEqual(self.store().data["a"]["remote_address"], "a:3")
+
+    def test_rename_overridden_by_fragment(self):
+        conf_d = os.path.join(self.dir, "conf.d")
+        os.mkdir(conf_d)
+        configio.save_config(os.path.join(conf_d, "team.yml"), {"a": {"remote_address": "team:1", "local_port": 1}})
+        store = self.store()
+        store.commit(store.put("b", store.data["a"], "a"))
+        store.flush()
+        data = self.store().data
+        self.assertNotIn("a", data)
+        self.assertEqual(data["b"]["remote_address"], "team:1")
+
+
+if __name__ == '__main__':
+    unittest.main()
@@ -0,0 +1,24 @@
+import unittest
+
+from core.tunnelspec import TunnelSpec
+
+
+def argv(proxy_host):
+    return TunnelSpec("t", remote_address="db:5432", local_port=5432, proxy_host=proxy_host).ssh_argv()[1:]
+
+
+class SshArgvTest(unittest.TestCase):
+
+    def test_destination(self):
+        self.assertEqual(argv("user@host"), ["-L", "127.0.0.1:5432:db:5432", "user@host"])
+
+    def test_jumps(self):
+        self.assertEqual(argv("a, b,user@host"), ["-J", "a,b", "-L", "127.0.0.1:5432:db:5432", "user@host"])
+
+    def test_options_are_split(self):
+        self.assertEqual(argv("-p 2222 -o 'IdentityFile=~/my key' user@host"),
+                         ["-p", "2222", "-o", "IdentityFile=~/my key", "-L", "127.0.0.1:5432:db:5432", "user@host"])
+
+
+if __name__ == '__main__':
+    unittest.main()
@@ -0,0 +1,84 @@
+from PyQt6.QtCore import QObject, QRunnable, QSize, QThreadPool, Qt, pyqtSignal
+from PyQt6.QtGui import QGuiApplication, QImage, QImageReader, QPixmap, QPixmapCache
+
+from core import tracing
+
+
+class _Decode(QRunnable):
+    def __init__(self, store, path, size):
+        super().__init__()
+        self.store = store
+        self.path = path
+        self.size = size
+
+    def run(self):
+        with tracing.span("decode icon", path=self.path):
+            reader = QImageReader(self.path)
+            original = reader.size()
+            if original.isValid():
+                # Let the decoder scale, so the full-size image is never held
+                reader.setScaledSize(original.scaled(self.size, Qt.AspectRatioMode.KeepAspectRatio))
+            image = reader.read()
+        self.store.decoded.emit(self.path, image)
+
+
+class ThumbnailStore(QObject):
+    """Pre-scaled icon pixmaps, decoded on a worker thread and kept in QPixmapCache.
+
+    request() calls back right away when the thumbnail is cached; otherwise
+    the file is decoded once with QImageReader at the thumbnail size and
+    every caller waiting on it gets the same (implicitly shared) pixmap.
+    Files that fail to decode fall back to `fallback`.
+    """
+
+    decoded = pyqtSignal(str, QImage)
+
+    def __init__(self, index, size, fallback, parent=None):
+        super().__init__(parent)
+        self.index = index
+        self.fallback = fallback
+        self.ratio = QGuiApplication.instance().devicePixelRatio() if QGuiApplication.instance() else 1.0
+        self.size = QSize(round(size * self.ratio), round(size * self.ratio))
+        self._waiting = {}
+        self._pool = QThreadPool.globalInstance()
+        self.decoded.connect(self._on_decoded)
+
+    def _cache_key(self, path):
+        return f"thumb:{self.size.width()}:{path}"
+
+    def forget(self, paths):
+        """Drop the cached thumbnails of files that changed on disk."""
+        for path in paths:
+            QPixmapCache.remove(self._cache_key(path))
+
+    def request(self, icon_name, callback):
+        """Call callback(pixmap) with the thumbnail for icon_name."""
+        path = self.index.resolve(icon_name) or self.fallback
+        pixmap = QPixmapCache.find(self._cache_key(path))
+        if pixmap is not None and not pixmap.isNull():
+            callback(pixmap)
+            return
+        waiting = self._waiting.get(path)
+        if waiting is not None:
+            waiting.append(callback)
+            return
+        self._waiting[path] = [callback]
+        self._pool.start(_Decode(self, path, self.size))
+
+    def _on_decoded(self, path, image):
+        callbacks = self._waiting.pop(path, [])
+        if image.isNull():
+            if path != self.fallback:
+                print(f"Error loading icon {path}")
+                for callback in callbacks:
+                    self.request(None, callback)
+            return
+        pixmap = QPixmap.fromImage(image)
+        pixmap.setDevicePixelRatio(self.ratio)
+        QPixmapCache.insert(self._cache_key(path), pixmap)
+        for callback in callbacks:
+            try:
+                callback(pixmap)
+            except RuntimeError:
+                # The row was deleted while its icon was decoding
+                pass
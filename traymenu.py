@@ -0,0 +1,123 @@
+from PyQt6.QtCore import pyqtSignal
+from PyQt6.QtGui import QAction, QIcon
+from PyQt6.QtWidgets import QMenu
+
+from vars import ICONS, LANG, TRAY_PAGE_SIZE
+
+
+def _by_name(model, keys):
+    return sorted(keys, key=lambda key: model.spec(key).display_name.lower())
+
+
+class _TunnelMenu(QMenu):
+    """A submenu of tunnel toggles, filled the first time it opens after a change."""
+
+    def __init__(self, tray, title, keys, group=None, ordered=False):
+        super().__init__(title, tray)
+        self.tray = tray
+        self.keys = keys
+        self.group = group
+        self.ordered = ordered
+        self.version = None
+        self.aboutToShow.connect(self.fill)
+
+    def fill(self):
+        if self.version == self.tray.version:
+            self.tray.update_checks(self)
+            return
+        self.version = self.tray.version
+        for menu in self.findChildren(_TunnelMenu):
+            menu.deleteLater()
+        self.clear()
+        if self.group is not None:
+            self.addAction(QIcon(ICONS.START), LANG.START_GROUP, lambda: self.tray.group_started.emit(self.group))
+            self.addAction(QIcon(ICONS.STOP), LANG.STOP_GROUP, lambda: self.tray.group_stopped.emit(self.group))
+            self.addSeparator()
+        keys = self.keys if self.ordered else _by_name(self.tray.model, self.keys)
+        if len(keys) <= TRAY_PAGE_SIZE:
+            for key in keys:
+                self.addAction(self.tray.tunnel_action(key, self))
+            return
+        # Long lists open as pages, each filled only when it opens
+        for first in range(0, len(keys), TRAY_PAGE_SIZE):
+            page = keys[first:first + TRAY_PAGE_SIZE]
+            title = f"{self.tray.name(page[0])} – {self.tray.name(page[-1])}"
+            self.addMenu(_TunnelMenu(self.tray, title, page, ordered=True))
+
+
+class TrayMenu(QMenu):
+    """The tray menu: recently used tunnels on top, then a submenu per group.
+
+    Nothing tunnel-related is built until the menu opens, and what is built
+    is kept until the tunnels or the recent list change; reopening only
+    updates the check marks. Group submenus are filled when they open, and
+    lists longer than TRAY_PAGE_SIZE are split into pages, so opening the
+    menu costs about the same with ten tunnels or thousands. The tunnel
+    entries go above the separator added by add_tunnel_sections().
+    """
+
+    tunnel_toggled = pyqtSignal(str)
+    group_started = pyqtSignal(str)
+    group_stopped = pyqtSignal(str)
+
+    def __init__(self, model, supervisor, recent, parent=None):
+        super().__init__(parent)
+        self.model = model
+        self.supervisor = supervisor
+        self.recent = recent
+        self.version = 0
+        self._built = None
+        self._entries = []
+        self._end = None
+        model.tunnels_changed.connect(self.invalidate)
+        self.aboutToShow.connect(self.build)
+
+    def add_tunnel_sections(self):
+        self._end = self.addSeparator()
+
+    def invalidate(self):
+        self.version += 1
+
+    def name(self, key):
+        return self.model.spec(key).display_name
+
+    def tunnel_action(self, key, parent):
+        action = QAction(self.name(key), parent)
+        action.setData(key)
+        action.setCheckable(True)
+        action.setChecked(self.supervisor.running(key))
+        action.triggered.connect(lambda checked, key=key: self.tunnel_toggled.emit(key))
+        return action
+
+    def update_checks(self, menu):
+        for action in menu.actions():
+            key = action.data()
+            if key is not None:
+                action.setChecked(self.supervisor.running(key))
+
+    def build(self):
+        recent = [key for key in self.recent.keys() if key in self.model]
+        if self._built == (self.version, recent):
+            self.update_checks(self)
+            return
+        self._built = (self.version, recent)
+        for entry in self._entries:
+            self.removeAction(entry)
+            menu = entry.menu()
+            (menu or entry).deleteLater()
+        self._entries = []
+
+        for key in recent:
+            self._add(self.tunnel_action(key, self))
+        if recent:
+            self._add(QAction(self))
+            self._entries[-1].setSeparator(True)
+        for group in self.model.groups():
+            self._add(_TunnelMenu(self, group, self.model.members(group), group).menuAction())
+        ungrouped = self.model.members(None)
+        if ungrouped:
+            self._add(_TunnelMenu(self, LANG.UNGROUPED, ungrouped).menuAction())
+
+    def _add(self, action):
+        self.insertAction(self._end, action)
+        self._entries.append(action)
@@ -68,6 +68,12 @@ class Ui_TunnelConfig(object):
         self.remote_address.setStyleSheet("")
         self.remote_address.setObjectName("remote_address")
         self.gridLayout.addWidget(self.remote_address, 2, 1, 1, 2)
+        self.label_group = QtWidgets.QLabel(parent=TunnelConfig)
+        self.label_group.setObjectName("label_group")
+        self.gridLayout.addWidget(self.label_group, 6, 0, 1, 1)
+        self.group = QtWidgets.QLineEdit(parent=TunnelConfig)
+        self.group.setObjectName("group")
+        self.gridLayout.addWidget(self.group, 6, 1, 1, 2)
         self.horizontalLayout = QtWidgets.QHBoxLayout()
         self.horizontalLayout.setObjectName("horizontalLayout")
         spacerItem = QtWidgets.QSpacerItem(188, 20, QtWidgets.QSizePolicy.Policy.Expanding, QtWidgets.QSizePolicy.Policy.Minimum)
@@ -77,7 +83,7 @@ class Ui_TunnelConfig(object):
         self.buttonBox.setStandardButtons(QtWidgets.QDialogButtonBox.StandardButton.Save)
         self.buttonBox.setObjectName("buttonBox")
         self.horizontalLayout.addWidget(self.buttonBox)
-        self.gridLayout.addLayout(self.horizontalLayout, 6, 0, 1, 3)
+        self.gridLayout.addLayout(self.horizontalLayout, 7, 0, 1, 3)
         self.horizontalLayout_2 = QtWidgets.QHBoxLayout()
         self.horizontalLayout_2.setObjectName("horizontalLayout_2")
         self.local_port = QtWidgets.QSpinBox(parent=TunnelConfig)
@@ -106,6 +112,7 @@ class Ui_TunnelConfig(object):
         TunnelConfig.setTabOrder(self.proxy_host, self.browser_open)
         TunnelConfig.setTabOrder(self.browser_open, self.ssh_command)
         TunnelConfig.setTabOrder(self.ssh_command, self.copy)
+        TunnelConfig.setTabOrder(self.copy, self.group)
 
     def retranslateUi(self, TunnelConfig):
         _translate = QtCore.QCoreApplication.translate
@@ -121,4 +128,6 @@ class Ui_TunnelConfig(object):
         self.browser_open.setPlaceholderText(_translate("TunnelConfig", "https://127.0.0.1:8443"))
         self.proxy_host.setPlaceholderText(_translate("TunnelConfig", "user@server or bastion,destination"))
         self.remote_address.setPlaceholderText(_translate("TunnelConfig", "10.10.10.10:443"))
+        self.label_group.setText(_translate("TunnelConfig", "Group"))
+        self.group.setPlaceholderText(_translate("TunnelConfig", "Ungrouped"))
         self.all_interfaces.setText(_translate("TunnelConfig", "All Interfaces (0.0.0.0)"))
@@ -0,0 +1,601 @@
+from bisect import bisect_left
+from functools import partial
+
+from PyQt6.QtCore import QAbstractTableModel, QEvent, QModelIndex, QRect, QSize, Qt, QTimer, pyqtSignal
+from PyQt6.QtGui import QCursor, QFont, QFontMetrics, QIcon
+from PyQt6.QtWidgets import (QAbstractItemView, QFrame, QHeaderView, QStyle, QStyledItemDelegate, QStyleOption,
+                             QStyleOptionButton, QTableView)
+
+from core.search import SearchIndex
+from vars import ICONS, FRAME_MS, ROW_ICON_SIZE, ROW_HEIGHT, ROW_WIDTH, ROW_BUTTON_WIDTH, ROW_FONT_SIZE, VISIBLE_ROWS
+
+# Buttons painted at the end of each row, left to right
+ACTION_TUNNEL = "tunnel"
+ACTION_OPEN = "open"
+ACTION_SETTINGS = "settings"
+BUTTONS = (ACTION_TUNNEL, ACTION_OPEN, ACTION_SETTINGS)
+# and at the end of a group header; a click anywhere else on it toggles
+ACTION_GROUP_START = "start"
+ACTION_GROUP_STOP = "stop"
+ACTION_GROUP_TOGGLE = "toggle"
+GROUP_BUTTONS = (ACTION_GROUP_START, ACTION_GROUP_STOP)
+
+KEY_ROLE = Qt.ItemDataRole.UserRole
+SPEC_ROLE = Qt.ItemDataRole.UserRole + 1
+RUNNING_ROLE = Qt.ItemDataRole.UserRole + 2
+GROUP_ROLE = Qt.ItemDataRole.UserRole + 3
+COUNT_ROLE = Qt.ItemDataRole.UserRole + 4
+COLLAPSED_ROLE = Qt.ItemDataRole.UserRole + 5
+# What a new spec for a row can change
+SPEC_ROLES = (Qt.ItemDataRole.DisplayRole, Qt.ItemDataRole.DecorationRole, Qt.ItemDataRole.ToolTipRole,
+              KEY_ROLE, SPEC_ROLE, RUNNING_ROLE)
+
+BUTTON_ICON_SIZE = 20
+ARROW_SIZE = 12
+MARGIN = 2
+INDENT = 5
+
+
+def _group_order(group):
+    return group.lower(), group
+
+
+class _Sections:
+    """The group names in display order, with the rows each group's section takes.
+
+    The row counts are kept in a Fenwick tree, so finding where a section
+    starts, or resizing one, costs O(log groups) rather than a pass over
+    every group. Adding or removing a group rebuilds the tree.
+    """
+
+    def __init__(self):
+        self.groups = []
+        self._orders = []
+        self._sizes = []
+        self._tree = [0]
+
+    def _index(self, group):
+        order = _group_order(group)
+        i = bisect_left(self._orders, order)
+        return i if i < len(self._orders) and self._orders[i] == order else None
+
+    def _build(self):
+        tree = [0] + self._sizes
+        for i in range(1, len(tree)):
+            parent = i + (i & -i)
+            if parent < len(tree):
+                tree[parent] += tree[i]
+        self._tree = tree
+
+    def add(self, group):
+        order = _group_order(group)
+        i = bisect_left(self._orders, order)
+        self.groups.insert(i, group)
+        self._orders.insert(i, order)
+        self._sizes.insert(i, 0)
+        self._build()
+
+    def discard(self, group):
+        i = self._index(group)
+        if i is not None:
+            del self.groups[i], self._orders[i], self._sizes[i]
+            self._build()
+
+    def reset(self, sizes):
+        """Set every section's size from sizes, by group name."""
+        self._sizes = [sizes.get(group, 0) for group in self.groups]
+        self._build()
+
+    def resize(self, group, size):
+        i = self._index(group)
+        if i is None or size == self._sizes[i]:
+            return
+        delta = size - self._sizes[i]
+        self._sizes[i] = size
+        i += 1
+        while i < len(self._tree):
+            self._tree[i] += delta
+            i += i & -i
+
+    def before(self, group):
+        """The rows taken by the sections ordered before group's."""
+        i = bisect_left(self._orders, _group_order(group))
+        rows = 0
+        while i:
+            rows += self._tree[i]
+            i -= i & -i
+        return rows
+
+
+class TunnelModel(QAbstractTableModel):
+    """The tunnel rows: one TunnelSpec per row, in a single column.
+
+    Ungrouped tunnels come first, in the order they were added, then each
+    group by name under a header row (the group name as a str). A collapsed
+    group is only its header: its tunnels have no rows at all. Running state
+    is asked of the supervisor when a row is painted, and a row's icon is
+    requested from the ThumbnailStore the first time it is shown, so rows
+    that never scroll into view cost one spec each. Every tunnel is kept in
+    a SearchIndex; set_filter() shows only the tunnels matching a query.
+    Repaints asked for with refresh() are collected and applied at most
+    once every FRAME_MS, as one dataChanged over the rows they span.
+    `tunnels_changed` is emitted when a tunnel is added, edited or removed,
+    whether or not it has a row.
+    """
+
+    tunnels_changed = pyqtSignal()
+
+    def __init__(self, supervisor, thumbnails, parent=None):
+        super().__init__(parent)
+        self.supervisor = supervisor
+        self.thumbnails = thumbnails
+        self.search = SearchIndex()
+        self.query = ""
+        # Every tunnel by key, in the order added, and the keys of each
+        # group (None for ungrouped) in the same order
+        self._specs = {}
+        self._members = {}
+        self._sections = _Sections()
+        # Tunnels of each group passing the filter, and the filter result
+        # the rows were last laid out for
+        self._matched = {}
+        self._accepted = None
+        self._collapsed = set()
+        # Row contents, and row by tunnel key or (GROUP_ROLE, name); built
+        # on demand after rows move
+        self._shown = []
+        self._rows = {}
+        self._icons = {}
+        # Roles to repaint by tunnel key or (GROUP_ROLE, name), or for
+        # every row under None, until the next frame
+        self._pending = {}
+        self._frame = QTimer(self)
+        self._frame.setSingleShot(True)
+        self._frame.setInterval(FRAME_MS)
+        self._frame.timeout.connect(self._flush)
+
+    def rowCount(self, parent=QModelIndex()):
+        return 0 if parent.isValid() else len(self._shown)
+
+    def columnCount(self, parent=QModelIndex()):
+        return 0 if parent.isValid() else 1
+
+    def data(self, index, role=Qt.ItemDataRole.DisplayRole):
+        if not index.isValid():
+            return None
+        spec = self._shown[index.row()]
+        if isinstance(spec, str):
+            return self._group_data(spec, role)
+        if role == Qt.ItemDataRole.DisplayRole:
+            return spec.display_name
+        if role == Qt.ItemDataRole.DecorationRole:
+            return self._icon(spec)
+        if role == Qt.ItemDataRole.ToolTipRole:
+            return spec.ssh_command()
+        if role == KEY_ROLE:
+            return spec.key
+        if role == SPEC_ROLE:
+            return spec
+        if role == RUNNING_ROLE:
+            return self.supervisor.running(spec.key)
+        return None
+
+    def _group_data(self, group, role):
+        if role in (Qt.ItemDataRole.DisplayRole, GROUP_ROLE):
+            return group
+        if role == RUNNING_ROLE:
+            # Counted from the running tunnels, which are few, not the members
+            return sum(1 for key in self.supervisor.keys() if key in self._members[group])
+        if role == COUNT_ROLE:
+            return len(self._members[group])
+        if role == COLLAPSED_ROLE:
+            return group in self._collapsed
+        return None
+
+    def _icon(self, spec):
+        if spec.key not in self._icons:
+            # None marks the request as in flight; a cached thumbnail
+            # replaces it before request() returns
+            self._icons[spec.key] = None
+            icon_name = spec.icon or spec.key
+            self.thumbnails.request(icon_name, partial(self._set_icon, spec.key, icon_name))
+        return self._icons[spec.key]
+
+    def _set_icon(self, key, icon_name, pixmap):
+        spec = self._specs.get(key)
+        # A late thumbnail for an icon the row no longer shows is dropped
+        if spec is None or (spec.icon or key) != icon_name:
+            return
+        self._icons[key] = pixmap
+        self.refresh(key, [Qt.ItemDataRole.DecorationRole])
+
+    def reload_icons(self):
+        """Ask for every row's icon again, e.g. after the icon directories changed."""
+        self._icons = {}
+        self.refresh(None, [Qt.ItemDataRole.DecorationRole])
+
+    def __contains__(self, key):
+        return key in self._specs
+
+    def keys(self):
+        return list(self._specs)
+
+    def spec(self, key):
+        return self._specs[key]
+
+    def groups(self):
+        return list(self._sections.groups)
+
+    def members(self, group):
+        return list(self._members.get(group, ()))
+
+    def _accepts(self, key):
+        return not self.query or self.search.matches(key, self.query)
+
+    def _row(self, key):
+        if self._rows is None:
+            self._rows = {(GROUP_ROLE, item) if isinstance(item, str) else item.key: row
+                          for row, item in enumerate(self._shown)}
+        return self._rows.get(key)
+
+    def _section_rows(self, group):
+        matched = self._matched.get(group, 0)
+        if group is None or not matched:
+            return matched
+        return 1 if group in self._collapsed else 1 + matched
+
+    def _section_start(self, group):
+        if group is None:
+            return 0
+        return self._section_rows(None) + self._sections.before(group)
+
+    def _resized(self, group):
+        if group is not None:
+            self._sections.resize(group, self._section_rows(group))
+
+    def _insert(self, row, items):
+        self.beginInsertRows(QModelIndex(), row, row + len(items) - 1)
+        self._shown[row:row] = items
+        self._rows = None
+        self.endInsertRows()
+
+    def _remove(self, row, count):
+        self.beginRemoveRows(QModelIndex(), row, row + count - 1)
+        del self._shown[row:row + count]
+        self._rows = None
+        self.endRemoveRows()
+
+    def append(self, specs):
+        for spec in specs:
+            key, group = spec.key, spec.group
+            self._specs[key] = spec
+            if group is not None and group not in self._members:
+                self._sections.add(group)
+            self._members.setdefault(group, {})[key] = None
+            self.search.add(spec)
+            self._accepted = False
+            if not self._accepts(key):
+                continue
+            start = self._section_start(group)
+            matched = self._matched.get(group, 0)
+            self._matched[group] = matched + 1
+            self._resized(group)
+            if group is None:
+                self._insert(start + matched, [spec])
+            elif not matched:
+                self._insert(start, [group] if group in self._collapsed else [group, spec])
+            elif group not in self._collapsed:
+                self._insert(start + 1 + matched, [spec])
+            if group is not None and matched:
+                self.refresh_group(group, [COUNT_ROLE])
+        if specs:
+            self.tunnels_changed.emit()
+
+    def remove(self, key):
+        spec = self._specs.get(key)
+        if spec is None:
+            return
+        accepted = self._accepts(key)
+        del self._specs[key]
+        group = spec.group
+        del self._members[group][key]
+        if not self._members[group]:
+            del self._members[group]
+            self._collapsed.discard(group)
+            if group is not None:
+                self._sections.discard(group)
+        self.search.remove(key)
+        self._icons.pop(key, None)
+        self._accepted = False
+        self.tunnels_changed.emit()
+        if not accepted:
+            return
+        self._matched[group] -= 1
+        self._resized(group)
+        row = self._row(key)
+        if group is not None and not self._matched[group]:
+            # The group's last row takes its header along
+            header = self._row((GROUP_ROLE, group))
+            self._remove(header, 1 if row is None else 2)
+        elif row is not None:
+            self._remove(row, 1)
+        if group is not None and self._matched[group]:
+            self.refresh_group(group, [COUNT_ROLE])
+
+    def update(self, key, spec):
+        """Replace key's spec with spec, which may carry a new key or group."""
+        old = self._specs.get(key)
+        if old is None:
+            return
+        accepted = self._accepts(key)
+        if old.group != spec.group:
+            self.remove(key)
+            self.append([spec])
+            return
+        if spec.key != key:
+            # Rebuilt so the renamed tunnel keeps its place
+            self._specs = {(spec.key if k == key else k): (spec if k == key else v) for k, v in self._specs.items()}
+            members = self._members[spec.group]
+            self._members[spec.group] = {(spec.key if k == key else k): None for k in members}
+            self._icons.pop(key, None)
+        else:
+            self._specs[key] = spec
+            if spec.icon != old.icon:
+                self._icons.pop(key, None)
+        self.search.update(key, spec)
+        self._accepted = False
+        self.tunnels_changed.emit()
+
+        if accepted != self._accepts(spec.key):
+            # The edit moved it in or out of the filter
+            self._relayout()
+            return
+        row = self._row(key)
+        if row is not None:
+            self._shown[row] = spec
+            if spec.key != key:
+                self._rows = None
+            self.refresh(spec.key, SPEC_ROLES)
+
+    def set_filter(self, query):
+        """Show only the tunnels matching every term of query; all of them when it is blank."""
+        self.query = query.strip()
+        keys = self.search.search(self.query)
+        if keys == self._accepted:
+            # Typing on often leaves the same rows; skip the reset
+            return
+        self._relayout(keys)
+
+    def toggle(self, group):
+        """Collapse or expand group."""
+        if not self._matched.get(group):
+            return
+        header = self._row((GROUP_ROLE, group))
+        if group in self._collapsed:
+            self._collapsed.discard(group)
+            self._insert(header + 1, [self._specs[key] for key in self._members[group] if self._accepts(key)])
+        else:
+            self._collapsed.add(group)
+            self._remove(header + 1, self._matched[group])
+        self._resized(group)
+        self.refresh_group(group, [COLLAPSED_ROLE])
+
+    def _relayout(self, keys=False):
+        if keys is False:
+            keys = self.search.search(self.query)
+        self.beginResetModel()
+        self._shown = []
+        self._matched = {}
+        for group in [None] + self.groups():
+            members = [self._specs[key] for key in self._members.get(group, ()) if keys is None or key in keys]
+            self._matched[group] = len(members)
+            if group is not None and members:
+                self._shown.append(group)
+            if group not in self._collapsed:
+                self._shown += members
+        self._sections.reset({group: self._section_rows(group) for group in self._members})
+        self._rows = None
+        self._accepted = keys
+        self.endResetModel()
+
+    def refresh(self, key=None, roles=(RUNNING_ROLE,)):
+        """Repaint key's row and its group header, or every row shown when key is None, on the next frame."""
+        if key is not None and RUNNING_ROLE in roles:
+            spec = self._specs.get(key)
+            if spec is not None and spec.group is not None:
+                self._queue((GROUP_ROLE, spec.group), [RUNNING_ROLE])
+        self._queue(key, roles)
+
+    def refresh_group(self, group, roles):
+        self._queue((GROUP_ROLE, group), roles)
+
+    def _queue(self, item, roles):
+        self._pending.setdefault(item, set()).update(roles)
+        if not self._frame.isActive():
+            self._frame.start()
+
+    def _flush(self):
+        # Rows are looked up now, so whatever moved since the queueing is
+        # found where it is; items that lost their row are dropped
+        pending, self._pending = self._pending, {}
+        roles = set()
+        if None in pending:
+            first, last = 0, len(self._shown) - 1
+            roles.update(*pending.values())
+        else:
+            rows = []
+            for item, item_roles in pending.items():
+                row = self._row(item)
+                if row is not None:
+                    rows.append(row)
+                    roles.update(item_roles)
+            first, last = (min(rows), max(rows)) if rows else (0, -1)
+        if first <= last:
+            self.dataChanged.emit(self.index(first, 0), self.index(last, 0), list(roles))
+
+
+class TunnelDelegate(QStyledItemDelegate):
+    """Paints a tunnel row: icon, name, and the start/stop, open and settings buttons.
+
+    Group headers get an expand arrow, the group name with its running and
+    total counts, and start all/stop all buttons. The buttons are only
+    painted; a click on one is caught in editorEvent() and reported as
+    `clicked(key, action)` or `group_clicked(group, action)`.
+    """
+
+    clicked = pyqtSignal(str, str)
+    group_clicked = pyqtSignal(str, str)
+
+    def __init__(self, parent=None):
+        super().__init__(parent)
+        self.font = QFont()
+        self.font.setPointSize(ROW_FONT_SIZE)
+        self.metrics = QFontMetrics(self.font)
+        self.group_font = QFont(self.font)
+        self.group_font.setBold(True)
+        self.group_metrics = QFontMetrics(self.group_font)
+        self.button_icons = {
+            (ACTION_TUNNEL, False): QIcon(ICONS.START),
+            (ACTION_TUNNEL, True): QIcon(ICONS.STOP),
+            (ACTION_OPEN, False): QIcon(ICONS.BROWSER),
+            (ACTION_SETTINGS, False): QIcon(ICONS.SETTINGS),
+            (ACTION_GROUP_START, False): QIcon(ICONS.START),
+            (ACTION_GROUP_STOP, False): QIcon(ICONS.STOP),
+        }
+
+    def sizeHint(self, option, index):
+        return QSize(ROW_WIDTH, ROW_HEIGHT)
+
+    def button_rects(self, rect, actions=BUTTONS):
+        right = rect.right() + 1 - MARGIN
+        rects = []
+        for n in range(len(actions), 0, -1):
+            rects.append(QRect(right - n * ROW_BUTTON_WIDTH, rect.top() + MARGIN,
+                               ROW_BUTTON_WIDTH, rect.height() - 2 * MARGIN))
+        return rects
+
+    def button_at(self, rect, pos, actions=BUTTONS):
+        for action, button in zip(actions, self.button_rects(rect, actions)):
+            if button.contains(pos):
+                return action
+        return None
+
+    def paint(self, painter, option, index):
+        view = option.widget
+        style = view.style()
+        rect = option.rect
+        group = index.data(GROUP_ROLE)
+        if group is None:
+            style.drawPrimitive(QStyle.PrimitiveElement.PE_PanelItemViewItem, option, painter, view)
+            icon_rect = QRect(0, 0, ROW_ICON_SIZE, ROW_ICON_SIZE)
+            icon_rect.moveCenter(rect.center())
+            icon_rect.moveLeft(rect.left() + MARGIN)
+            pixmap = index.data(Qt.ItemDataRole.DecorationRole)
+            if pixmap is not None:
+                painter.drawPixmap(icon_rect, pixmap)
+            actions, font, metrics, text = BUTTONS, self.font, self.metrics, index.data()
+        else:
+            painter.fillRect(rect.adjusted(0, 1, 0, -1), option.palette.button())
+            arrow = QStyleOption()
+            arrow.rect = QRect(0, 0, ARROW_SIZE, ARROW_SIZE)
+            arrow.rect.moveCenter(rect.center())
+            arrow.rect.moveLeft(rect.left() + MARGIN + (ROW_ICON_SIZE - ARROW_SIZE) // 2)
+            arrow.palette = option.palette
+            arrow.state = QStyle.StateFlag.State_Enabled
+            collapsed = index.data(COLLAPSED_ROLE)
+            style.drawPrimitive(QStyle.PrimitiveElement.PE_IndicatorArrowRight if collapsed
+                                else QStyle.PrimitiveElement.PE_IndicatorArrowDown, arrow, painter, view)
+            icon_rect = QRect(rect.left() + MARGIN, rect.top(), ROW_ICON_SIZE, rect.height())
+            actions, font, metrics = GROUP_BUTTONS, self.group_font, self.group_metrics
+            text = f"{group}  ({index.data(RUNNING_ROLE)}/{index.data(COUNT_ROLE)})"
+
+        buttons = self.button_rects(rect, actions)
+        text_left = icon_rect.right() + 1 + INDENT
+        text_rect = QRect(text_left, rect.top(), buttons[0].left() - text_left - INDENT, rect.height())
+        painter.save()
+        painter.setFont(font)
+        painter.setPen(option.palette.text().color())
+        text = metrics.elidedText(text, Qt.TextElideMode.ElideRight, text_rect.width())
+        painter.drawText(text_rect, Qt.AlignmentFlag.AlignVCenter | Qt.AlignmentFlag.AlignLeft, text)
+        painter.restore()
+
+        running = group is None and index.data(RUNNING_ROLE)
+        hovered = None
+        if option.state & QStyle.StateFlag.State_MouseOver:
+            hovered = self.button_at(rect, view.viewport().mapFromGlobal(QCursor.pos()), actions)
+        for action, button in zip(actions, buttons):
+            if action == hovered:
+                # Flat buttons only show their panel under the mouse
+                panel = QStyleOptionButton()
+                panel.rect = button
+                panel.palette = option.palette
+                panel.state = QStyle.StateFlag.State_Enabled | QStyle.StateFlag.State_Raised | QStyle.StateFlag.State_MouseOver
+                style.drawPrimitive(QStyle.PrimitiveElement.PE_PanelButtonTool, panel, painter, view)
+            icon = self.button_icons[(action, bool(running) and action == ACTION_TUNNEL)]
+            icon_rect = QRect(0, 0, BUTTON_ICON_SIZE, BUTTON_ICON_SIZE)
+            icon_rect.moveCenter(button.center())
+            icon.paint(painter, icon_rect)
+
+    def editorEvent(self, event, model, option, index):
+        if event.type() != QEvent.Type.MouseButtonRelease or event.button() != Qt.MouseButton.LeftButton:
+            return False
+        pos = event.position().toPoint()
+        group = index.data(GROUP_ROLE)
+        if group is not None:
+            self.group_clicked.emit(group, self.button_at(option.rect, pos, GROUP_BUTTONS) or ACTION_GROUP_TOGGLE)
+            return True
+        action = self.button_at(option.rect, pos)
+        if action is not None:
+            self.clicked.emit(index.data(KEY_ROLE), action)
+            return True
+        return False
+
+
+class TunnelView(QTableView):
+    """The tunnel list; only the rows on screen are ever laid out or painted.
+
+    A one-column table rather than a QListView: with fixed row heights the
+    table never measures rows, while QListView lays out every row again on
+    each dataChanged.
+    """
+
+    def __init__(self, parent=None):
+        super().__init__(parent)
+        self.horizontalHeader().hide()
+        self.horizontalHeader().setSectionResizeMode(QHeaderView.ResizeMode.Stretch)
+        self.verticalHeader().hide()
+        self.verticalHeader().setSectionResizeMode(QHeaderView.ResizeMode.Fixed)
+        self.verticalHeader().setDefaultSectionSize(ROW_HEIGHT)
+        self.setShowGrid(False)
+        self.setWordWrap(False)
+        self.setSelectionMode(QAbstractItemView.SelectionMode.NoSelection)
+        self.setEditTriggers(QAbstractItemView.EditTrigger.NoEditTriggers)
+        self.setVerticalScrollMode(QAbstractItemView.ScrollMode.ScrollPerPixel)
+        self.setHorizontalScrollBarPolicy(Qt.ScrollBarPolicy.ScrollBarAlwaysOff)
+        self.setFocusPolicy(Qt.FocusPolicy.NoFocus)
+        self.setFrameShape(QFrame.Shape.NoFrame)
+        # Rows sit on the window background, as the row widgets used to
+        self.viewport().setAutoFillBackground(False)
+        self.setMouseTracking(True)
+
+    def setModel(self, model):
+        super().setModel(model)
+        model.rowsInserted.connect(self.updateGeometry)
+        model.rowsRemoved.connect(self.updateGeometry)
+
+    def sizeHint(self):
+        # Tall enough for up to VISIBLE_ROWS rows, so small configs need no scrolling
+        rows = min(self.model().rowCount(), VISIBLE_ROWS) if self.model() else 0
+        width = ROW_WIDTH + self.verticalScrollBar().sizeHint().width() + 2 * self.frameWidth()
+        return QSize(width, max(rows, 1) * ROW_HEIGHT + 2 * self.frameWidth())
+
+    def mouseMoveEvent(self, event):
+        super().mouseMoveEvent(event)
+        # Keep the hovered button's panel in step with the pointer
+        index = self.indexAt(event.position().toPoint())
+        if index.isValid():
+            self.viewport().update(self.visualRect(index))
+
+    def leaveEvent(self, event):
+        super().leaveEvent(event)
+        self.viewport().update()
@@ -2,7 +2,28 @@ import os
 
 CONFIG_DIR = os.path.expanduser("~/.ssh-tunnel-manager")
 CONF_FILE = os.path.join(CONFIG_DIR, "config.yml")
+CONF_D_DIR = os.path.join(CONFIG_DIR, "conf.d")
+JOURNAL_FILE = CONF_FILE + ".journal"
 ICONS_DIR = os.path.join(CONFIG_DIR, "icons")
+ICONS_MANIFEST = os.path.join(CONFIG_DIR, "icons.json")
+BACKUP_DIR = os.path.join(CONFIG_DIR, "backups")
+REMOTE_CACHE_DIR = os.path.join(CONFIG_DIR, "remote")
+SSH_IMPORT_CACHE = os.path.join(CONFIG_DIR, "ssh_config.cache")
+RECENT_FILE = os.path.join(CONFIG_DIR, "recent.json")
+REMOTE_CONFIG_URL = os.environ.get("SSH_TUNNEL_MANAGER_REMOTE_URL", "")
+
+# Edits are appended to JOURNAL_FILE right away; the YAML files are rewritten
+# once edits have been quiet for COMPACT_DELAY seconds, after COMPACT_MAX_DELAY
+# at the latest, or as soon as COMPACT_THRESHOLD records have piled up.
+COMPACT_DELAY = 30
+COMPACT_MAX_DELAY = 300
+COMPACT_THRESHOLD = 500
+
+STARTUP_PROBE_ENV = "SSH_TUNNEL_MANAGER_STARTUP_PROBE"
+STARTUP_PROBE_MARKER = "startup-probe: first window shown"
+
+# Set to a file path to record startup spans as Chrome trace-event JSON
+TRACE_ENV = "SSH_TUNNEL_MANAGER_TRACE"
 
 class LANG:
     TITLE = "SSH Tunnel Manager"
@@ -15,6 +36,24 @@ class LANG:
     OOPS = "Oops!"
     CONF_NOT_FOUND = F"Config file not found. Creating default configuration in {CONFIG_DIR}"
     ADD_NEW_TUNNEL = "Add New Tunnel"
+    PORT_CONFLICT = "Port in use by {}"
+    IMPORT = "Import SSH Config"
+    IMPORTED = "Imported {} tunnels from ~/.ssh/config"
+    IMPORT_CONFLICTS = "Skipped because of port conflicts: {}"
+    SAVED = "Saved {} at {}"
+    SEARCH = "Search name, host or port"
+    START_GROUP = "Start All"
+    STOP_GROUP = "Stop All"
+    UNKNOWN_GROUP = "Unknown group: {}"
+    UNGROUPED = "Ungrouped"
+    UNKNOWN_ACTION = "Unknown action: {}"
+    UNKNOWN_TUNNEL = "Unknown tunnel: {}"
+    START_FAILED = "Failed to start: {}"
+    NOT_RUNNING = "Not running: {}"
+    NO_REPLY = "No reply from the running instance"
+    NOT_STARTED = "The running instance has not loaded a config yet"
+    NOT_READY = "Not accepting connections after {}s: {}"
+    HEADLESS = "Tunnels are running without the GUI; stop them with `sshtm quit` first"
 
 class KEYS:
     REMOTE_ADDRESS = "remote_address"
@@ -25,6 +64,30 @@ class KEYS:
     ICON = "icon"
     ALL_INTERFACES = "all_interfaces"
     PROXY_JUMP = "proxy_jump"
+    AUTOSTART = "autostart"
+    GROUP = "group"
+
+# Tunnel rows in the list (tunnelview.py): icon side, row size, the width of
+# each of the three buttons, the name's point size, and how many rows the
+# window shows before it scrolls
+ROW_ICON_SIZE = 24
+ROW_HEIGHT = 36
+ROW_WIDTH = 360
+ROW_BUTTON_WIDTH = 32
+ROW_FONT_SIZE = 11
+VISIBLE_ROWS = 12
+# Tunnel rows are added after the window shows, in event-loop slices of at
+# most POPULATE_SLICE_MS so autostarts don't hold up input
+POPULATE_SLICE_MS = 8
+# Row repaints, e.g. when many tunnels exit at once, are batched per frame
+FRAME_MS = 16
+# The tray menu lists the TRAY_RECENT tunnels used last on top; longer
+# tunnel lists are split into submenus of TRAY_PAGE_SIZE
+TRAY_RECENT = 5
+TRAY_PAGE_SIZE = 40
+# Changes to the recent list are written once they've settled for
+# RECENT_SAVE_MS, so toggling tunnels doesn't wait on the disk
+RECENT_SAVE_MS = 1000
 
 class ICONS:
     TUNNEL = ":icons/tunnel.png"
@@ -32,8 +95,24 @@ class ICONS:
     STOP = ":icons/stop.png"
     KILL_SSH = ":icons/kill.png"
     ADD = ":icons/add.png"
+    BROWSER = ":icons/browser.png"
+    SETTINGS = ":icons/settings.png"
+
+# Actions a later launch can forward to the running instance, e.g.
+# `ssh-tunnel-manager start gitlab`; no action just shows the window.
+class ACTIONS:
+    SHOW = "show"
+    START = "start"
+    STOP = "stop"
+    STATUS = "status"
+    LIST = "list"
+    QUIT = "quit"
 
 class CMDS:    
     SSH = "ssh"
     SSH_KILL_NIX = "killall ssh"
     SSH_KILL_WIN = "taskkill /im ssh.exe /t /f"
+
+# Fields that end up in the ssh command line; changing any of them on disk
+# restarts a running tunnel, anything else is applied in place.
+RESTART_KEYS = (KEYS.REMOTE_ADDRESS, KEYS.PROXY_HOST, KEYS.LOCAL_PORT, KEYS.ALL_INTERFACES)